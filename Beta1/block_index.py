@@ -0,0 +1,204 @@
+import os
+import struct
+import zlib
+
+from codec import escape
+
+MAGIC = b"YTBLOCK1"
+BLOCK_LINES = 256
+BLOOM_BITS = 256
+BLOOM_HASHES = 3
+NO_MIN_DATE = b"9999-99-99"
+NO_MAX_DATE = b"0000-00-00"
+
+# magic, lines per block, file size, file mtime, lines indexed, indexed bytes,
+# checksum of the indexed tail
+HEADER = struct.Struct("<8sIQQQQI")
+# min completion date, max completion date, username Bloom filter, line count
+BLOCK = struct.Struct(f"<10s10s{BLOOM_BITS // 8}sI")
+
+
+def _bloom_positions(username):
+    data = username.encode("utf-8") if isinstance(username, str) else username
+    first = zlib.crc32(data)
+    second = zlib.adler32(data) | 1
+    return [(first + i * second) % BLOOM_BITS for i in range(BLOOM_HASHES)]
+
+
+def _line_keys(raw):
+    """Return (completion date, username) of a raw history line as bytes"""
+    pos = raw.rfind(b" on ")
+    date = raw[pos + 4 : pos + 14] if pos >= 0 else b""
+    username = b""
+    if raw.count(b" | ") == 6:
+        username = raw[raw.rfind(b" | ") + 3 :]
+    return date, username
+
+
+class Block:
+    """Completion date range and username Bloom filter of BLOCK_LINES lines"""
+
+    __slots__ = ("min_date", "max_date", "bloom", "lines")
+
+    def __init__(
+        self, min_date=NO_MIN_DATE, max_date=NO_MAX_DATE, bloom=0, lines=0
+    ):
+        self.min_date = min_date
+        self.max_date = max_date
+        self.bloom = bloom
+        self.lines = lines
+
+    def add(self, raw):
+        date, username = _line_keys(raw)
+        if len(date) == 10:
+            self.min_date = min(self.min_date, date)
+            self.max_date = max(self.max_date, date)
+        for bit in _bloom_positions(username):
+            self.bloom |= 1 << bit
+        self.lines += 1
+
+    def may_contain_user(self, username):
+        return all(self.bloom >> bit & 1 for bit in _bloom_positions(username))
+
+    def overlaps(self, start, end):
+        return self.min_date <= end and self.max_date >= start
+
+    def pack(self):
+        bloom = self.bloom.to_bytes(BLOOM_BITS // 8, "little")
+        return BLOCK.pack(self.min_date, self.max_date, bloom, self.lines)
+
+    @classmethod
+    def unpack(cls, data):
+        min_date, max_date, bloom, lines = BLOCK.unpack(data)
+        return cls(min_date, max_date, int.from_bytes(bloom, "little"), lines)
+
+
+class BlockIndex:
+    """Sidecar block index for a history file (history.txt -> history.txt.blk)
+
+    The file is split into blocks of BLOCK_LINES lines. Each block records
+    the min/max completion date and a Bloom filter of the usernames it
+    contains, so readers can skip blocks that cannot match. The index is
+    checked against the file size and mtime and extended when lines are
+    appended; a rewritten file is indexed again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".blk"
+        self.blocks = []
+        self.file_size = 0
+        self.file_mtime = 0
+        self.lines_indexed = 0
+        self.bytes_indexed = 0
+        self.tail_crc = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, "rb") as file:
+                header = HEADER.unpack(file.read(HEADER.size))
+                data = file.read()
+        except (FileNotFoundError, struct.error):
+            return
+        magic, block_lines = header[:2]
+        if magic != MAGIC or block_lines != BLOCK_LINES:
+            return
+        (
+            self.file_size,
+            self.file_mtime,
+            self.lines_indexed,
+            self.bytes_indexed,
+            self.tail_crc,
+        ) = header[2:]
+        self.blocks = [
+            Block.unpack(data[i : i + BLOCK.size])
+            for i in range(0, len(data) - BLOCK.size + 1, BLOCK.size)
+        ]
+
+    def _save(self, first_changed):
+        header = HEADER.pack(
+            MAGIC,
+            BLOCK_LINES,
+            self.file_size,
+            self.file_mtime,
+            self.lines_indexed,
+            self.bytes_indexed,
+            self.tail_crc,
+        )
+        mode = "r+b" if first_changed and os.path.exists(self.index_path) else "wb"
+        if mode == "wb":
+            first_changed = 0
+        with open(self.index_path, mode) as file:
+            file.write(header)
+            # Blocks before first_changed are unchanged on disk
+            file.seek(HEADER.size + first_changed * BLOCK.size)
+            blocks = self.blocks[first_changed:]
+            file.write(b"".join(block.pack() for block in blocks))
+
+    def _reset(self):
+        self.blocks = []
+        self.lines_indexed = 0
+        self.bytes_indexed = 0
+
+    def refresh(self, reader):
+        """Bring the index up to date; reader must be an open MappedLineReader"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+        if stat.st_size == self.file_size and stat.st_mtime_ns == self.file_mtime:
+            return
+
+        indexed_lines = len(reader.offsets)
+        if (
+            self.lines_indexed > indexed_lines
+            or self.bytes_indexed > reader.indexed_size
+            or reader.tail_checksum(self.bytes_indexed) != self.tail_crc
+            or (
+                self.lines_indexed
+                and self.lines_indexed < indexed_lines
+                and reader.offsets[self.lines_indexed] != self.bytes_indexed
+            )
+        ):
+            self._reset()
+
+        first_changed = max(0, len(self.blocks) - 1)
+        for _, raw in reader.raw_lines(self.lines_indexed, indexed_lines):
+            if not self.blocks or self.blocks[-1].lines == BLOCK_LINES:
+                self.blocks.append(Block())
+            self.blocks[-1].add(raw)
+        self.lines_indexed = indexed_lines
+        self.bytes_indexed = reader.indexed_size
+        self.tail_crc = reader.tail_checksum(self.bytes_indexed)
+        self.file_size = stat.st_size
+        self.file_mtime = stat.st_mtime_ns
+        self._save(first_changed)
+
+    def line_ranges(self, total_lines, start=None, end=None, username=None):
+        """Return (first, stop) line ranges that may hold matching records
+
+        start/end are yyyy-MM-dd strings and username a plain string; lines past
+        the indexed part of the file are always included.
+        """
+        first_date = start.encode() if start is not None else None
+        last_date = end.encode() if end is not None else None
+        user = escape(username).encode("utf-8") if username is not None else None
+
+        ranges = []
+        for number, block in enumerate(self.blocks):
+            if first_date is not None:
+                if not block.overlaps(first_date, last_date):
+                    continue
+            if user is not None and not block.may_contain_user(user):
+                continue
+            first = number * BLOCK_LINES
+            stop = first + block.lines
+            if ranges and ranges[-1][1] == first:
+                ranges[-1] = (ranges[-1][0], stop)  # Merge adjacent blocks
+            else:
+                ranges.append((first, stop))
+        if self.lines_indexed < total_lines:
+            ranges.append((self.lines_indexed, total_lines))
+        return ranges
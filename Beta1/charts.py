@@ -0,0 +1,129 @@
+import importlib
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access
+
+    `requires` is loaded first, so a matplotlib submodule always sees the
+    Qt backend selected. Loading is locked, so the warm-up thread and the
+    GUI thread never run `setup` twice or see a module before it ran.
+    """
+
+    def __init__(self, name, requires=None, setup=None):
+        self._name = name
+        self._requires = requires
+        self._setup = setup
+        self._module = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Import the module now and return it"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    if self._requires is not None:
+                        self._requires.load()
+                    module = importlib.import_module(self._name)
+                    if self._setup is not None:
+                        self._setup(module)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+matplotlib = LazyModule("matplotlib", setup=lambda module: module.use("Qt5Agg"))
+backend_qt5agg = LazyModule("matplotlib.backends.backend_qt5agg", matplotlib)
+backend_pdf = LazyModule("matplotlib.backends.backend_pdf", matplotlib)
+figure = LazyModule("matplotlib.figure", matplotlib)
+dates = LazyModule("matplotlib.dates", matplotlib)
+ticker = LazyModule("matplotlib.ticker", matplotlib)
+mplcursors = LazyModule("mplcursors", matplotlib)
+
+# Imported by the warm-up thread; the Qt backend and mplcursors (which pulls
+# in pyplot) create Qt objects, so they are only imported on the GUI thread
+MODULES = [matplotlib, backend_pdf, figure, dates, ticker]
+GUI_MODULES = [backend_qt5agg, mplcursors]
+
+_template = None  # (Figure, FigureCanvas) built by warm_up()
+_warm_up = None
+
+
+def new_canvas(figsize):
+    """Return a (Figure, FigureCanvas) pair with a tight layout
+
+    The first call takes the canvas prepared by warm_up() if it is ready.
+    """
+    global _template
+    if _template is not None:
+        fig, canvas = _template
+        _template = None
+        fig.set_size_inches(*figsize)
+        return fig, canvas
+    fig = figure.Figure(figsize=figsize, tight_layout=True)
+    return fig, backend_qt5agg.FigureCanvasQTAgg(fig)
+
+
+def _build_template():
+    global _template
+    if _template is not None:
+        return
+    try:
+        for module in GUI_MODULES:
+            module.load()
+        fig = figure.Figure(tight_layout=True)
+        canvas = backend_qt5agg.FigureCanvasQTAgg(fig)
+        # Drawing an axes once loads the fonts and renderer the first chart needs
+        fig.add_subplot(111)
+        canvas.draw()
+        fig.clear()
+    except Exception:
+        return  # new_canvas() builds its own and reports the error
+    _template = fig, canvas
+
+
+class _WarmUpSignals(QObject):
+    imported = pyqtSignal()
+
+
+class _Importer(QRunnable):
+    """Import the chart modules that do not touch Qt on a low-priority pool thread"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _WarmUpSignals()
+
+    def run(self):
+        thread = QThread.currentThread()
+        priority = thread.priority()
+        thread.setPriority(QThread.LowestPriority)
+        try:
+            for module in MODULES:
+                module.load()
+        except Exception:
+            return  # The error is reported when a chart is first opened
+        finally:
+            # Pool threads start as InheritPriority, which setPriority() rejects
+            if priority != QThread.InheritPriority:
+                thread.setPriority(priority)
+        self.signals.imported.emit()
+
+
+def warm_up():
+    """Import matplotlib in the background, then prepare a canvas when idle
+
+    Call once the main window is up. matplotlib and NumPy are imported on a
+    worker thread; the Qt backend, mplcursors and the template canvas (a
+    widget) follow on the GUI thread. Charts opened before this finishes
+    import on demand.
+    """
+    global _warm_up
+    if _warm_up is not None or _template is not None:
+        return
+    _warm_up = _Importer()
+    _warm_up.signals.imported.connect(lambda: QTimer.singleShot(0, _build_template))
+    QThreadPool.globalInstance().start(_warm_up)
@@ -8,12 +8,17 @@ from PyQt5.QtWidgets import (
     QRadioButton,
     QHBoxLayout,
     QLabel,
+    QCheckBox,
     QTimeEdit,
     QMessageBox,
     QDialogButtonBox,
 )
-from PyQt5.QtCore import QTime, QDate, Qt
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import QDateTime, Qt
+from PyQt5.QtGui import QFont
+
+import pixmap_cache
+from reminders import DEFAULT_LEADS, LEAD_CHOICES
+from task import parse_time
 
 
 class BaseDialog(QDialog):
@@ -42,7 +47,7 @@ class ImageDialog(BaseDialog):
 
         # Image label
         self.imageLabel = QLabel(self)
-        pixmap = QPixmap("img.png")
+        pixmap = pixmap_cache.pixmap("img.png")
         if pixmap.isNull():
             self.imageLabel.setText("Gambar tidak ditemukan!")
         else:
@@ -70,6 +75,7 @@ class TaskDialog(BaseDialog):
         self._add_start_time()
         self._add_deadline()
         self._add_priority()
+        self._add_reminders()
         self._add_save_button()
 
     def _add_task_name(self):
@@ -94,35 +100,31 @@ class TaskDialog(BaseDialog):
         """Add start date and time input fields"""
         self.layout.addWidget(QLabel("Starting Date:"))
         self.startCalendar = QCalendarWidget(self)
-        if "start_time" in self.task_data:
-            date_part = self.task_data["start_time"].split(" ")[0]
-            self.startCalendar.setSelectedDate(
-                QDate.fromString(date_part, "yyyy-MM-dd")
-            )
         self.layout.addWidget(self.startCalendar)
 
         self.layout.addWidget(QLabel("Starting Time:"))
         self.startTime = QTimeEdit(self)
-        if "start_time" in self.task_data:
-            time_part = self.task_data["start_time"].split(" ")[1]
-            self.startTime.setTime(QTime.fromString(time_part, "HH:mm"))
         self.layout.addWidget(self.startTime)
+        self._show_time("start_time", self.startCalendar, self.startTime)
 
     def _add_deadline(self):
         """Add deadline date and time input fields"""
         self.layout.addWidget(QLabel("Deadline Date:"))
         self.calendar = QCalendarWidget(self)
-        if "deadline" in self.task_data:
-            date_part = self.task_data["deadline"].split(" ")[0]
-            self.calendar.setSelectedDate(QDate.fromString(date_part, "yyyy-MM-dd"))
         self.layout.addWidget(self.calendar)
 
         self.layout.addWidget(QLabel("Deadline Time:"))
         self.deadlineTime = QTimeEdit(self)
-        if "deadline" in self.task_data:
-            time_part = self.task_data["deadline"].split(" ")[1]
-            self.deadlineTime.setTime(QTime.fromString(time_part, "HH:mm"))
         self.layout.addWidget(self.deadlineTime)
+        self._show_time("deadline", self.calendar, self.deadlineTime)
+
+    def _show_time(self, key, calendar, time_edit):
+        """Fill a date and time pair from a task field, if it can be read"""
+        epoch = parse_time(self.task_data.get(key, ""))
+        if epoch is not None:
+            moment = QDateTime.fromSecsSinceEpoch(epoch)
+            calendar.setSelectedDate(moment.date())
+            time_edit.setTime(moment.time())
 
     def _add_priority(self):
         """Add priority selection radio buttons"""
@@ -145,6 +147,19 @@ class TaskDialog(BaseDialog):
             if self.task_data["priority"] in priority_map:
                 priority_map[self.task_data["priority"]].setChecked(True)
 
+    def _add_reminders(self):
+        """Add a checkbox for each reminder lead time"""
+        reminderLayout = QHBoxLayout()
+        leads = self.task_data.get("reminders", DEFAULT_LEADS)
+        self.reminderChecks = {}
+        for label, lead in LEAD_CHOICES.items():
+            check = QCheckBox(f"{label} before")
+            check.setChecked(lead in leads)
+            self.reminderChecks[lead] = check
+            reminderLayout.addWidget(check)
+        self.layout.addWidget(QLabel("Remind Me:"))
+        self.layout.addLayout(reminderLayout)
+
     def _add_save_button(self):
         """Add save button with validation"""
         self.saveButton = QPushButton("Save", self)
@@ -216,6 +231,9 @@ class TaskDialog(BaseDialog):
             "deadline": f"{self.calendar.selectedDate().toString('yyyy-MM-dd')} {self.deadlineTime.time().toString('HH:mm')}",
             "priority": priority,
             "status": "due",
+            "reminders": [
+                lead for lead, check in self.reminderChecks.items() if check.isChecked()
+            ],
         }
 
 
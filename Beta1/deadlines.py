@@ -0,0 +1,246 @@
+import heapq
+import itertools
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+from task import parse_time
+
+MAX_WAIT_MS = 60 * 60 * 1000  # Re-check at least hourly, e.g. after a clock change
+SWEEP_DELAY_MS = 200  # Overdue tasks wait this long for rows still loading
+
+
+def deadline_epoch(deadline):
+    """Return a "yyyy-MM-dd HH:mm" local deadline as a Unix timestamp, or None"""
+    return parse_time(deadline)
+
+
+class DeadlineHeap:
+    """Min-heap of task deadlines with cancel and reschedule by task id
+
+    Cancelled entries stay in the heap marked dead and are skipped when
+    they reach the top, so every operation is O(log n).
+    """
+
+    def __init__(self):
+        self._heap = []  # [epoch, sequence, task id or None once cancelled]
+        self._entries = {}  # task id -> its live heap entry
+        self._sequence = itertools.count()  # Ties never compare task ids
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, task_id):
+        return task_id in self._entries
+
+    def schedule(self, task_id, epoch):
+        """Expire task_id at epoch, replacing any deadline it had"""
+        self.cancel(task_id)
+        entry = [epoch, next(self._sequence), task_id]
+        self._entries[task_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def cancel(self, task_id):
+        """Forget a task's deadline; unknown ids are ignored"""
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            entry[2] = None
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._compact()
+
+    def reset(self, deadlines):
+        """Replace every deadline with (task id, epoch) pairs in O(n)"""
+        self._entries = {}
+        for task_id, epoch in deadlines:
+            self._entries[task_id] = [epoch, next(self._sequence), task_id]
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if entry[2] is not None]
+        heapq.heapify(self._heap)
+
+    def _drop_cancelled(self):
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+
+    def next_epoch(self):
+        """Return the earliest deadline, or None when nothing is scheduled"""
+        self._drop_cancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Remove and return the ids of tasks whose deadline is at or before now"""
+        due = []
+        heap = self._heap
+        while True:
+            self._drop_cancelled()
+            if not heap or heap[0][0] > now:
+                return due
+            _, _, task_id = heapq.heappop(heap)
+            del self._entries[task_id]
+            due.append(task_id)
+
+
+class DeadlineScheduler(QObject):
+    """Report due tasks of a TaskTableModel the moment their deadline passes
+
+    Deadlines of rows whose status is "due" are kept in a DeadlineHeap that
+    follows the model: rows added, edited, completed or removed schedule,
+    reschedule or cancel their entry as the model reports them. A single
+    timer is armed for the earliest deadline, so nothing is re-parsed or
+    scanned while waiting.
+    """
+
+    # Store ids of the tasks whose deadline has just passed
+    expired = pyqtSignal(list)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.heap = DeadlineHeap()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._expire)
+
+        model.modelReset.connect(self._on_reset)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        self._on_reset()
+
+    def _deadline(self, row):
+        """Epoch a row expires at, or None if it cannot expire"""
+        if self.model.value(row, "status") != "due":
+            return None
+        return deadline_epoch(self.model.value(row, "deadline"))
+
+    def _schedule_row(self, row):
+        task_id = self.model.task_id(row)
+        epoch = self._deadline(row)
+        if epoch is None:
+            self.heap.cancel(task_id)
+        else:
+            self.heap.schedule(task_id, epoch)
+
+    def _on_reset(self):
+        deadlines = []
+        for row in range(self.model.rowCount()):
+            epoch = self._deadline(row)
+            if epoch is not None:
+                deadlines.append((self.model.task_id(row), epoch))
+        self.heap.reset(deadlines)
+        self._arm()
+
+    def _on_rows_inserted(self, parent, first, last):
+        for row in range(first, last + 1):
+            self._schedule_row(row)
+        self._arm()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        for row in range(first, last + 1):
+            self.heap.cancel(self.model.task_id(row))
+        self._arm()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._schedule_row(row)
+        self._arm()
+
+    def _arm(self):
+        """Point the timer at the earliest deadline"""
+        epoch = self.heap.next_epoch()
+        if epoch is None:
+            self._timer.stop()
+            return
+        wait_ms = math.ceil((epoch - time.time()) * 1000)
+        if wait_ms <= 0:
+            # Already overdue, e.g. at startup: rows loaded in the meantime
+            # restart the timer, so the whole backlog expires in one sweep
+            wait_ms = SWEEP_DELAY_MS
+        self._timer.start(min(wait_ms, MAX_WAIT_MS))
+
+    def _expire(self):
+        due = self.heap.pop_due(time.time())
+        self._arm()
+        if due:
+            self.expired.emit(due)
+
+    def check_now(self):
+        """Report tasks already past their deadline without waiting"""
+        self._expire()
+
+
+def _benchmark(task_count, overdue=None):
+    """Time the startup sweep of overdue tasks, one write each vs one write
+
+    The per-task path is what check_past_deadline_tasks did through
+    mark_task_as_failed: a status write and a reload for every task.
+    overdue (a fifth of the tasks by default) is capped at task_count.
+    """
+    from storage import BACKENDS
+
+    now = time.time()
+    past = time.strftime("%Y-%m-%d %H:%M", time.localtime(now - 3 * 86400))
+    future = time.strftime("%Y-%m-%d %H:%M", time.localtime(now + 86400))
+    if overdue is None:
+        overdue = task_count // 5
+    overdue = min(overdue, task_count)
+    overdue_ids = set(random.Random(1).sample(range(task_count), overdue))
+    tasks = [
+        {
+            "name": f"Task {i}",
+            "description": "Something to do",
+            "start_time": "2024-01-01 09:00",
+            "deadline": past if i in overdue_ids else future,
+            "priority": "Medium",
+            "status": "due",
+            "username": "",
+        }
+        for i in range(task_count)
+    ]
+    for backend in ("text", "sqlite", "wal"):
+        with tempfile.TemporaryDirectory() as directory:
+            store = BACKENDS[backend](os.path.join(directory, "tasks.txt"))
+            store.replace_all(tasks)
+            loaded = store.load()
+            expired = [
+                task["id"]
+                for task in loaded
+                if deadline_epoch(task["deadline"]) <= now
+            ]
+
+            started = time.perf_counter()
+            for task_id in expired:
+                store.set_status(task_id, "failed ❌")
+                store.load()
+            one_by_one = time.perf_counter() - started
+
+            store.replace_all(tasks)
+            started = time.perf_counter()
+            heap = DeadlineHeap()
+            heap.reset(
+                (task["id"], deadline_epoch(task["deadline"]))
+                for task in store.load()
+            )
+            due = heap.pop_due(now)
+            store.set_statuses({task_id: "failed ❌" for task_id in due})
+            store.load()
+            swept = time.perf_counter() - started
+            store.close()
+        print(
+            f"{backend:>6}: {len(due)} of {task_count} overdue, "
+            f"one by one {one_by_one:.2f}s, one sweep {swept * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:3]]
+    _benchmark(*(counts or [10_000, 2_000]))
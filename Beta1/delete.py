@@ -1,35 +1,37 @@
 from PyQt5.QtWidgets import QMessageBox
+from read import TodoReader
 
 
 class TodoDeleter:
     """Static class for handling task deletion operations"""
 
     @staticmethod
-    def delete_task(table_widget, save_callback):
+    def delete_task(table_view, save_callback):
         """Delete a single selected task after confirmation"""
-        selected = table_widget.currentRow()
+        selected = TodoReader.get_selected_row(table_view)
         if selected >= 0:
             reply = QMessageBox.question(
-                table_widget.parent(),
+                table_view.parent(),
                 "Delete Task",
                 "Are you sure you want to delete this task?",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No,
             )
             if reply == QMessageBox.Yes:
-                table_widget.removeRow(selected)
+                TodoReader.delete_row(table_view, selected)
                 save_callback()
 
     @staticmethod
-    def clear_all_tasks(table_widget, save_callback):
+    def clear_all_tasks(table_view, save_callback):
         """Clear all tasks after confirmation"""
         reply = QMessageBox.question(
-            table_widget.parent(),
+            table_view.parent(),
             "Clear All Tasks",
             "Are you sure you want to clear all tasks?",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
-            table_widget.setRowCount(0)
+            TodoReader.get_store(table_view).replace_all([])
+            TodoReader.get_model(table_view).set_tasks([])
             save_callback()
@@ -3,26 +3,22 @@ from PyQt5.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QPushButton,
-    QTableWidget,
+    QTableView,
+    QHeaderView,
     QLabel,
     QComboBox,
     QLineEdit,
     QMessageBox,
     QAbstractItemView,
 )
-from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtCore import Qt, QDate, QTimer
 from PyQt5.QtGui import QMovie
-from matplotlib.backends.backend_qt5agg import (
-    FigureCanvasQTAgg as FigureCanvas,
-    NavigationToolbar2QT as NavigationToolbar,
-)
-from matplotlib.figure import Figure
-import matplotlib.ticker as ticker
-import mplcursors
 from datetime import datetime
-import matplotlib
-
-matplotlib.use("Qt5Agg")
+from charts import backend_qt5agg, mplcursors, new_canvas, ticker
+from history_columns import STATUS_DONE, open_columns
+from history_search import open_full_text
+from storage import open_store
+from task_model import TaskTableModel
 
 
 class HistoryDialog(QDialog):
@@ -61,9 +57,8 @@ class HistoryDialog(QDialog):
         self.setLayout(layout)
 
     def _setup_matplotlib(self, layout):
-        self.figure = Figure(figsize=(8, 5), tight_layout=True)
-        self.canvas = FigureCanvas(self.figure)
-        self.toolbar = NavigationToolbar(self.canvas, self)
+        self.figure, self.canvas = new_canvas((8, 5))
+        self.toolbar = backend_qt5agg.NavigationToolbar2QT(self.canvas, self)
         layout.addWidget(self.toolbar)
         layout.addWidget(self.canvas)
 
@@ -98,27 +93,15 @@ class HistoryDialog(QDialog):
             date_strings.append(current_date.toString("yyyy-MM-dd"))
             current_date = current_date.addDays(1)
 
-        completion_counts = {date: 0 for date in date_strings}
+        # Aggregate from the columnar snapshot instead of parsing history lines
+        columns = open_columns("history.txt")
+        columns.sync(open_store("history.txt"))
+        with columns.open() as view:
+            counts = view.daily_counts(
+                start_date.toPyDate(), end_date.toPyDate(), STATUS_DONE
+            )
 
-        try:
-            with open("history.txt", "r", encoding="utf-8") as f:
-                for line in f:
-                    parts = line.strip().split(" | ")
-                    if len(parts) == 6:
-                        status = parts[5]
-                        if "done" in status:
-                            completion_date_str = status.split("Completed on ")[1]
-                            completion_date = QDate.fromString(
-                                completion_date_str, "yyyy-MM-dd"
-                            )
-                            if start_date <= completion_date <= end_date:
-                                date_str = completion_date.toString("yyyy-MM-dd")
-                                completion_counts[date_str] += 1
-        except FileNotFoundError:
-            QMessageBox.warning(self, "No Data", "No completion history found")
-            return [], []
-
-        return date_strings, [completion_counts[d] for d in date_strings]
+        return date_strings, counts
 
     def _plot_data(self, dates, counts):
         self.figure.clear()
@@ -182,6 +165,8 @@ class HistoryDialog(QDialog):
 
 
 class HistoryTodo(QWidget):
+    SEARCH_DELAY_MS = 200  # Wait for typing to pause before searching
+
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
@@ -205,16 +190,24 @@ class HistoryTodo(QWidget):
         self.loadingLabel.hide()
         layout.addWidget(self.loadingLabel, alignment=Qt.AlignCenter)
 
-        self.taskTable = QTableWidget(self)
-        self.taskTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.taskTable.setColumnCount(6)
-        self.taskTable.setHorizontalHeaderLabels(
-            ["Name", "Description", "Start Time", "Deadline", "Priority", "Status"]
-        )
-        # Set column width for status column
-        self.taskTable.setColumnWidth(5, 300)
+        # Search the whole history; results replace the table while searching
+        self.searchInput = QLineEdit(self)
+        self.searchInput.setPlaceholderText("Search history...")
+        self.searchInput.setClearButtonEnabled(True)
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(self.SEARCH_DELAY_MS)
+        self.searchTimer.timeout.connect(self.searchHistory)
+        self.searchInput.textChanged.connect(self.searchTimer.start)
+        layout.addWidget(self.searchInput)
+
+        self.taskTable = self._createTable()
         layout.addWidget(self.taskTable)
 
+        self.searchTable = self._createTable()
+        self.searchTable.hide()
+        layout.addWidget(self.searchTable)
+
         # Add show graph button
         self.showGraphButton = QPushButton("Show Graph Representation", self)
         self.showGraphButton.clicked.connect(self.showGraph)
@@ -225,16 +218,54 @@ class HistoryTodo(QWidget):
         layout.addWidget(self.dashboardButton)
 
         self.refreshButton = QPushButton("Refresh", self)
-        self.refreshButton.clicked.connect(self.loadTasks)
+        self.refreshButton.clicked.connect(self.refreshTasks)
         layout.addWidget(self.refreshButton)
 
         self.setLayout(layout)
 
+    def _createTable(self):
+        table = QTableView(self)
+        table.setModel(TaskTableModel(table))
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Fixed row heights keep scrolling through large histories cheap
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Header clicks sort through TaskTableModel.sort(); no initial sort
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.setSortingEnabled(True)
+        # Set column width for status column
+        table.setColumnWidth(5, 300)
+        return table
+
     def loadTasks(self):
         from read import TodoReader
 
         TodoReader.load_tasks_to_table(self.taskTable, "history.txt")
 
+    def refreshTasks(self):
+        from read import TodoReader
+
+        TodoReader.refresh_table(self.taskTable)
+        self.searchHistory()
+
+    def searchHistory(self):
+        """Show the history records best matching the search text"""
+        query = self.searchInput.text()
+        if not query.strip():
+            self.searchTable.hide()
+            self.taskTable.show()
+            return
+        try:
+            index = open_full_text("history.txt")
+            index.sync(open_store("history.txt"))
+            results = index.search(query)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error searching history: {e}")
+            return
+        self.searchTable.model().set_tasks(results)
+        self.taskTable.hide()
+        self.searchTable.show()
+
     def showGraph(self):
         history_dialog = HistoryDialog(self)
         history_dialog.exec_()
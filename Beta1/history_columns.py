@@ -0,0 +1,254 @@
+import json
+import mmap
+import os
+from array import array
+from datetime import date
+
+from storage import completion_date
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; memoryviews are used without it
+    np = None
+
+DAY_ZERO = date(1970, 1, 1).toordinal()
+NO_DAY = -(2**31)  # Records without a completion date
+
+STATUS_DONE = 1
+STATUS_FAILED = 2
+# Bumped when the encoding changes, so older snapshots are rebuilt
+SNAPSHOT_VERSION = 2  # 2: dated statuses that did not fail count as done
+PRIORITY_CODES = {"Low": 1, "Medium": 2, "High": 3}
+
+# Column name -> array typecode (native byte order)
+COLUMNS = {
+    "day": "i",  # int32 days since 1970-01-01
+    "status": "B",  # uint8 STATUS_* code
+    "priority": "B",  # uint8 PRIORITY_CODES value
+    "user": "I",  # uint32 index into the users list in meta.json
+}
+
+
+def day_number(date_str):
+    """Convert a yyyy-MM-dd string to days since 1970-01-01"""
+    if not date_str:
+        return NO_DAY
+    try:
+        return date.fromisoformat(date_str).toordinal() - DAY_ZERO
+    except ValueError:
+        return NO_DAY
+
+
+def status_code(status):
+    """Map a status string to its STATUS_* code (0 for unfinished)
+
+    Any status stamped with a date that did not fail counts as done, e.g.
+    "Pending on 2024-05-01", matching Beta2's HistoryManager.load_history.
+    """
+    lowered = status.lower()
+    if "failed" in lowered:
+        return STATUS_FAILED
+    if "done" in lowered or completion_date(status):
+        return STATUS_DONE
+    return 0
+
+
+class ColumnView:
+    """Zero-copy views over the column files
+
+    Each column is a memoryview over a read-only mmap, or a NumPy array
+    sharing the same buffer when NumPy is installed.
+    """
+
+    def __init__(self, directory, users):
+        self.users = users
+        self.user_ids = {name: index for index, name in enumerate(users)}
+        self._maps = []
+        self._buffers = []
+        for name, typecode in COLUMNS.items():
+            setattr(self, name, self._map_column(directory, name, typecode))
+        self.rows = min(len(getattr(self, name)) for name in COLUMNS)
+
+    def _map_column(self, directory, name, typecode):
+        with open(os.path.join(directory, name), "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                buffer = memoryview(b"")
+            else:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps.append(mapped)
+                buffer = memoryview(mapped)
+        # Ignore a partially written last value
+        itemsize = array(typecode).itemsize
+        buffer = buffer[: len(buffer) - len(buffer) % itemsize]
+        self._buffers.append(buffer)
+        if np is not None:
+            return np.frombuffer(buffer, dtype=np.dtype(typecode))
+        return buffer.cast(typecode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Drop the views and unmap the files"""
+        for name in COLUMNS:
+            column = getattr(self, name)
+            if isinstance(column, memoryview):
+                column.release()
+            setattr(self, name, None)
+        for buffer in self._buffers:
+            buffer.release()
+        self._buffers = []
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    def daily_counts(self, start, end, status, username=None):
+        """Count records with a status per day between two dates (inclusive)
+
+        start and end are datetime.date objects; returns one count per day.
+        """
+        first = start.toordinal() - DAY_ZERO
+        last = end.toordinal() - DAY_ZERO
+        if last < first:
+            return []
+        user_id = None
+        if username is not None:
+            if username not in self.user_ids:
+                return [0] * (last - first + 1)
+            user_id = self.user_ids[username]
+
+        rows = self.rows
+        if np is not None:
+            days = self.day[:rows]
+            mask = (days >= first) & (days <= last)
+            mask &= self.status[:rows] == status
+            if user_id is not None:
+                mask &= self.user[:rows] == user_id
+            counts = np.bincount(days[mask] - first, minlength=last - first + 1)
+            return counts.tolist()
+
+        counts = [0] * (last - first + 1)
+        day_col, status_col, user_col = self.day, self.status, self.user
+        for row in range(rows):
+            day = day_col[row]
+            if first <= day <= last and status_col[row] == status:
+                if user_id is None or user_col[row] == user_id:
+                    counts[day - first] += 1
+        return counts
+
+
+class HistoryColumns:
+    """Columnar binary snapshot of a history store (history.txt -> history.cols/)
+
+    Only the fields the charts need are kept: completion day, status code,
+    priority code and a dictionary-encoded username. Rows are appended as
+    tasks move to history; the snapshot is rebuilt when the store's stamp
+    (see TaskStore.stamp) no longer matches the one it was built from, so
+    edits and status changes are picked up as well as added records.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.directory = os.path.splitext(path)[0] + ".cols"
+        self.users = []
+        self.rows = -1  # Unknown until the metadata is read
+        self.stamp = None  # Store stamp the snapshot matches
+        self._read_meta()
+
+    def _meta_path(self):
+        return os.path.join(self.directory, "meta.json")
+
+    def _read_meta(self):
+        try:
+            with open(self._meta_path(), "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            if meta.get("version") != SNAPSHOT_VERSION:
+                raise ValueError("snapshot written by an older version")
+            self.rows, self.users = meta["rows"], meta["users"]
+            self.stamp = meta.get("stamp")
+        except (FileNotFoundError, ValueError, KeyError):
+            self.rows, self.users, self.stamp = -1, [], None
+
+    def _write_meta(self):
+        temp_path = self._meta_path() + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            meta = {
+                "version": SNAPSHOT_VERSION,
+                "rows": self.rows,
+                "users": self.users,
+                "stamp": self.stamp,
+            }
+            json.dump(meta, file)
+        os.replace(temp_path, self._meta_path())
+
+    def _encode(self, task, user_ids):
+        username = task.get("username", "")
+        if username not in user_ids:
+            user_ids[username] = len(self.users)
+            self.users.append(username)
+        return {
+            "day": day_number(completion_date(task["status"])),
+            "status": status_code(task["status"]),
+            "priority": PRIORITY_CODES.get(task["priority"], 0),
+            "user": user_ids[username],
+        }
+
+    def rebuild(self, tasks, stamp=None):
+        """Rewrite the whole snapshot from a list of history records
+
+        stamp is the store's stamp() taken before the records were loaded.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.users = []
+        user_ids = {}
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        for task in tasks:
+            for name, value in self._encode(task, user_ids).items():
+                columns[name].append(value)
+        for name, column in columns.items():
+            with open(os.path.join(self.directory, name), "wb") as file:
+                column.tofile(file)
+        self.rows = len(tasks)
+        self.stamp = stamp
+        self._write_meta()
+
+    def append(self, task, before, after):
+        """Append a record just added to the store to every column
+
+        before and after are the store's stamps around the add. Unless the
+        snapshot matched the store before it, nothing is appended and the
+        next sync() rebuilds the snapshot.
+        """
+        if self.rows < 0 or self.stamp != before:
+            return
+        user_ids = {name: index for index, name in enumerate(self.users)}
+        for name, value in self._encode(task, user_ids).items():
+            with open(os.path.join(self.directory, name), "ab") as file:
+                array(COLUMNS[name], [value]).tofile(file)
+        self.rows += 1
+        self.stamp = after
+        self._write_meta()
+
+    def sync(self, store):
+        """Rebuild the snapshot if the store was written since it was built"""
+        stamp = store.stamp()
+        if self.rows < 0 or self.stamp != stamp:
+            self.rebuild(store.load(), stamp)
+
+    def open(self):
+        """Return a ColumnView over the current snapshot"""
+        return ColumnView(self.directory, list(self.users))
+
+
+_open_columns = {}
+
+
+def open_columns(path):
+    """Return the shared columnar snapshot for a history file"""
+    key = os.path.abspath(path)
+    if key not in _open_columns:
+        _open_columns[key] = HistoryColumns(path)
+    return _open_columns[key]
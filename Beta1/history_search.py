@@ -0,0 +1,264 @@
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from itertools import accumulate
+
+from history_columns import STATUS_DONE, STATUS_FAILED, status_code
+from search_index import tokenize
+
+RESULT_LIMIT = 200  # Ranked results returned per search
+PREFIX_LENGTHS = (2, 3)  # Lengths with their own postings; see prefix= below
+FIELD_WEIGHTS = {"name": 4.0, "description": 1.0}  # bm25 weights, column order
+STATUS_CODES = {"done": STATUS_DONE, "failed": STATUS_FAILED}
+INDEX_VERSION = 1  # PRAGMA user_version; older indexes are rebuilt on sync()
+
+
+def match_expression(query):
+    """Turn typed text into an FTS5 query matching every word
+
+    The last word is matched as a prefix since it may still be being typed,
+    as are words short enough to have prefix postings; other words match
+    whole. Words are quoted, so operators and punctuation in the text are
+    matched literally. Returns None when the text has no words.
+    """
+    words = tokenize(query)
+    if not words:
+        return None
+    terms = []
+    for position, word in enumerate(words, 1):
+        term = '"{}"'.format(word.replace('"', '""'))
+        if len(word) in PREFIX_LENGTHS or (
+            position == len(words) and len(word) >= min(PREFIX_LENGTHS)
+        ):
+            term += "*"
+        terms.append(term)
+    return " ".join(terms)
+
+
+class HistoryFullText:
+    """Persistent full-text index of a history store (history.txt -> history.fts.db)
+
+    Names and descriptions go into an SQLite FTS5 table whose on-disk
+    segments SQLite merges as it grows; each row also keeps the record, so
+    results are shown without reading the store. Rows are appended as tasks
+    move to history and replaced as records are edited (see update()); the
+    index is rebuilt when the store's stamp (see TaskStore.stamp) no longer
+    matches the one it was last brought up to date with.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db_path = os.path.splitext(path)[0] + ".fts.db"
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self.conn:
+            self.conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+                    name,
+                    description,
+                    status UNINDEXED,
+                    record UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    rows INTEGER NOT NULL,
+                    stamp TEXT
+                );
+                INSERT OR IGNORE INTO meta (id, rows) VALUES (0, -1);
+            """
+            )
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(meta)")]
+            if "stamp" not in columns:  # Index built before stamps were kept
+                self.conn.execute("ALTER TABLE meta ADD COLUMN stamp TEXT")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_VERSION:
+                # Rows encoded differently (e.g. status codes): rebuild them
+                self.conn.execute("UPDATE meta SET rows = -1")
+                self.conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    @property
+    def rows(self):
+        """Store record count the index matches, -1 before the first build"""
+        return self.conn.execute("SELECT rows FROM meta").fetchone()[0]
+
+    @property
+    def stamp(self):
+        """Store stamp the index matches, as JSON text"""
+        return self.conn.execute("SELECT stamp FROM meta").fetchone()[0]
+
+    @staticmethod
+    def _row(task):
+        return (
+            task.get("name", ""),
+            task.get("description", ""),
+            status_code(task.get("status", "")),
+            json.dumps(task, ensure_ascii=False),
+        )
+
+    def rebuild(self, tasks, stamp=None):
+        """Rewrite the whole index from a list of history records
+
+        stamp is the store's stamp() taken before the records were loaded.
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM entries")
+            self.conn.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?)", map(self._row, tasks)
+            )
+            self.conn.execute(
+                "UPDATE meta SET rows = ?, stamp = ?", (len(tasks), json.dumps(stamp))
+            )
+        # Merge the segments written by the bulk insert into one
+        with self.conn:
+            self.conn.execute("INSERT INTO entries(entries) VALUES ('optimize')")
+
+    def append(self, task, before, after):
+        """Index a record just added to the store
+
+        task["id"] should be its id in the store. before and after are the
+        store's stamps around the add; unless the index matched the store
+        before it, nothing is added and the next sync() rebuilds the index.
+        """
+        with self.conn:
+            if self.rows < 0 or self.stamp != json.dumps(before):
+                return
+            self.conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?)", self._row(task)
+            )
+            self.conn.execute(
+                "UPDATE meta SET rows = rows + 1, stamp = ?", (json.dumps(after),)
+            )
+
+    def update(self, task_id, task, before, after):
+        """Replace the row of a record just updated in the store
+
+        Called from the same code path as TaskStore.update() (see
+        TodoUpdater._update_record), with before and after as in
+        append(). task_id is the record's id before the edit and task["id"]
+        its id after it. An edit that moved the record to a new id may have
+        shifted the ids of other records as well, so the index is then left
+        stale for the next sync() to rebuild.
+        """
+        with self.conn:
+            if self.rows < 0 or self.stamp != json.dumps(before):
+                return
+            if task["id"] != task_id:
+                return  # The stamp is not advanced, so sync() rebuilds
+            # The id only lives in the stored record, so this is a scan of
+            # the rows rather than an index lookup; edits are rare
+            self.conn.execute(
+                "UPDATE entries SET name = ?, description = ?, status = ?, "
+                "record = ? WHERE rowid IN (SELECT rowid FROM entries "
+                "WHERE json_extract(record, '$.id') = ?)",
+                self._row(task) + (task_id,),
+            )
+            self.conn.execute("UPDATE meta SET stamp = ?", (json.dumps(after),))
+
+    def sync(self, store):
+        """Rebuild the index if the store was written since it was built"""
+        stamp = store.stamp()
+        if self.rows < 0 or self.stamp != json.dumps(stamp):
+            self.rebuild(store.load(), stamp)
+
+    def search(self, query, status=None, limit=RESULT_LIMIT):
+        """Return up to limit history records matching every word of query
+
+        Every match is ranked with FTS5's bm25(), name hits weighted over
+        description hits by FIELD_WEIGHTS. Ordering by the rank column lets
+        FTS5 sort the matches by their postings alone, so only the returned
+        rows' records are read. status is "done" or "failed" to keep only
+        those records. An empty list is returned when query has no words.
+        """
+        expression = match_expression(query)
+        if expression is None:
+            return []
+        weights = ", ".join(map(str, FIELD_WEIGHTS.values()))
+        sql = "SELECT record FROM entries WHERE entries MATCH ? AND rank MATCH ?"
+        params = [expression, f"bm25({weights})"]
+        if status in STATUS_CODES:
+            sql += " AND status = ?"
+            params.append(STATUS_CODES[status])
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+
+_open_indexes = {}
+
+
+def open_full_text(path):
+    """Return the shared full-text index for a history file"""
+    key = os.path.abspath(path)
+    if key not in _open_indexes:
+        _open_indexes[key] = HistoryFullText(path)
+    return _open_indexes[key]
+
+
+def _benchmark(sizes):
+    """Time a few searches as the index grows to each size in turn"""
+    rng = random.Random(1)
+    letters = "etaoinshrdlucmfwypvbgkjqxz"
+    common = ["report", "meeting", "budget", "review", "write", "plan", "call"]
+    vocabulary = common + [
+        "".join(rng.choices(letters, weights=range(26, 0, -1), k=rng.randint(3, 9)))
+        for _ in range(20000)
+    ]
+    # Zipf-like word frequencies
+    weights = list(accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def text(count):
+        return " ".join(rng.choices(vocabulary, cum_weights=weights, k=count))
+
+    def record(index):
+        status = rng.choice(["done ✅ - Completed on 2024-05-01", "failed ❌"])
+        return {
+            "id": index,
+            "name": text(3),
+            "description": text(8),
+            "start_time": "2024-04-01",
+            "deadline": "2024-05-01",
+            "priority": "Medium",
+            "status": status,
+            "username": "",
+        }
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench.txt")
+    index = HistoryFullText(path)
+    index.rebuild([])
+    try:
+        size = 0
+        for target in sizes:
+            started = time.perf_counter()
+            while size < target:
+                batch = [record(size + i) for i in range(min(50_000, target - size))]
+                with index.conn:
+                    index.conn.executemany(
+                        "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                        map(index._row, batch),
+                    )
+                size += len(batch)
+            print(f"{size} records, indexed in {time.perf_counter() - started:.1f}s")
+            for query in ["report plan", "budget", "wri", "zq", "meeting rev"]:
+                started = time.perf_counter()
+                results = index.search(query)
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"  {query!r:>14}: {len(results)} results in {elapsed:.1f} ms")
+    finally:
+        index.conn.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(index.db_path + suffix):
+                os.remove(index.db_path + suffix)
+
+
+if __name__ == "__main__":
+    _benchmark([int(size) for size in sys.argv[1:]] or [100_000, 1_000_000])
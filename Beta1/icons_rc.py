@@ -1,7019 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x28\x2a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x77\xbc\x1d\x75\x9d\xff\xf1\xd7\x4d\x42\
-\x80\x90\x00\x01\x42\x93\x2a\x5d\x8a\x80\x60\x01\xb1\x60\x07\x14\
-\x50\x44\xc1\x05\x2c\x4b\xaf\xca\xee\xda\x77\xed\xfa\xc3\x42\x07\
-\x29\x8a\x0a\x62\x41\x11\x50\x34\x80\xb2\x22\xb0\xc8\x4a\x93\x22\
-\x4d\x7a\xef\x24\x81\x90\x9e\xfd\xe3\x7b\xf3\x23\x84\x7b\xef\x99\
-\x39\x67\x66\x3e\x33\x67\x5e\xcf\xc7\xe3\xfb\x30\x0f\x3c\xe5\x3d\
-\xe7\x9e\x73\xe6\x7d\xa6\x7c\x07\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x52\x23\x0d\x44\x07\x50\x25\x36\x02\x36\
-\x05\xd6\x07\x96\x03\x96\x02\xe6\x00\xcf\x02\xf7\x03\xb7\x01\x7f\
-\x03\xa6\x47\x05\x54\x25\x56\x02\xb6\x02\x36\x18\xfc\xf7\xb2\x83\
-\xff\xfd\x59\xe0\x31\xe0\x76\xe0\x9a\xc1\x7f\xab\x7f\x8d\x03\xb6\
-\x06\x36\x04\xd6\x20\xbd\x0f\xc6\x00\xcf\x03\x4f\x03\x77\x00\x37\
-\x01\xb7\x46\x05\x94\xd4\xbd\x01\xe0\xad\xc0\x0f\x80\x47\x81\xf9\
-\x19\xc6\x4c\xe0\xcf\xc0\x81\xc0\xc4\xca\x13\xab\x2c\xeb\x03\x5f\
-\x01\x6e\x21\xdb\xfb\x60\xfe\xe0\x6d\xbf\x32\x78\x5f\xf5\x87\x89\
-\xc0\x01\xa4\xcf\xf8\x4c\xb2\xbd\x0f\x1e\x01\x4e\x27\x7d\x97\xf8\
-\x63\x51\xaa\xb9\x01\x60\x4f\xe0\x46\xb2\x7f\xd9\x0f\x35\xa6\x01\
-\x47\x93\x7e\x25\xaa\x99\xb6\x02\x2e\x00\xe6\xd1\xfd\xfb\x60\x2e\
-\x70\x3e\xf0\x9a\x8a\xb3\xab\x38\x2b\x01\xc7\x90\x3e\xd3\xbd\x7c\
-\x27\xdc\x08\xec\x81\x45\x40\xaa\xa5\x4d\x80\xff\xa1\xb7\x0f\xf9\
-\xa2\xe3\x59\xe0\x50\xfc\xd0\x37\xc9\x32\xa4\x5f\x6d\x73\x29\xee\
-\x7d\x30\x17\x38\x75\xf0\xb1\xd5\x0c\x03\xc0\x61\xa4\xcf\x70\x91\
-\xdf\x09\x57\x02\x1b\x57\xb8\x1c\x92\x3a\x38\x08\x78\x81\x62\x3f\
-\xe8\x0b\x8f\xc9\xc0\xa4\xca\x96\x46\xdd\x7a\x3d\x70\x2f\xe5\xbd\
-\x0f\xee\x06\x5e\x5b\xd5\xc2\xa8\x6b\x93\x80\x8b\x28\xef\x7d\x30\
-\x9d\xb4\x3b\x41\x52\xa0\x51\xc0\xb1\x94\xf7\x41\x5f\x78\xdc\x09\
-\xac\x57\xcd\x62\xa9\x0b\xef\x27\x7d\x31\x97\xfd\x3e\x98\x0e\xec\
-\x5a\xd1\x32\x29\xbf\x75\x49\x9f\xd5\x2a\xbe\x13\x8e\x21\x7d\x07\
-\x49\xaa\xd8\x00\x70\x32\xd5\x7c\xd0\x17\x8c\x47\x49\x47\x90\xab\
-\x5e\xde\x0f\xcc\xa6\xba\xf7\xc1\x1c\xe0\x43\x95\x2c\x99\xf2\x58\
-\x83\x72\xb7\x00\x0d\x35\x7e\x88\xbb\x08\xa5\xca\x7d\x8d\x6a\x3f\
-\xe8\x0b\xc6\x5d\xa4\x53\x09\x55\x0f\x6f\x06\x66\x51\xfd\xfb\x60\
-\x26\xb0\x5d\x05\xcb\xa7\x6c\x96\x23\x7d\x36\x23\xbe\x13\xbe\x5c\
-\xc1\xf2\x49\x1a\xf4\x3e\x7a\x3b\xba\xbb\xd7\xf1\x07\x6c\xfd\x75\
-\xb0\x2a\xd9\x4f\xf3\x2c\x63\x3c\x02\xac\x5c\xfa\x52\xaa\x93\x01\
-\xd2\x67\x32\xea\x7d\x30\x0f\xd8\xa9\xf4\xa5\x94\xc4\xf2\xc4\x7e\
-\xe9\x2f\x18\x1e\x04\x14\xef\x37\xc4\xbf\x0f\x7e\x5b\xfa\x52\xaa\
-\x93\x83\x88\x7f\x1f\x3c\x82\x5b\x06\xa5\xd2\x9d\x4a\xfc\x87\x7d\
-\x3e\xe9\xf4\xa2\x15\x4a\x5e\x56\x0d\x6f\x17\xe2\xdf\x03\x0b\x86\
-\xbf\xfe\xe2\xac\x00\x4c\x21\xfe\x3d\x30\x1f\x38\xa9\xe4\x65\x95\
-\x5a\x6d\x3d\xaa\x3d\xd8\xab\xd3\xf8\x4e\xb9\x8b\xab\x61\x8c\x22\
-\x4d\xd5\x1a\xfd\xf7\x5f\x30\xfe\x8e\x47\x83\x47\xf9\x0e\xf1\x7f\
-\xff\x05\x63\x16\xb0\x4e\xb9\x8b\x2b\xb5\xd7\x89\xc4\x7f\xc8\x17\
-\x1e\xd3\x80\xa5\x4b\x5d\x62\x0d\x65\x47\xe2\xff\xf6\x8b\x8e\x77\
-\x97\xba\xc4\x1a\xca\x04\xea\xf3\xeb\x7f\xc1\x38\xb6\xd4\x25\x96\
-\x5a\x6a\x1c\xf5\xfb\xb0\xcf\xc7\x63\x01\x22\x9c\x4f\xfc\xdf\x7d\
-\xd1\xf1\x9b\x52\x97\x58\x43\x39\x80\xf8\xbf\xfb\xa2\xe3\x19\x60\
-\xc9\x32\x17\x5a\x6a\xa3\x3a\xed\xf3\x5d\x78\x5c\x52\xe6\x42\xeb\
-\x65\xc6\x53\xee\xac\x8f\xdd\x8e\x19\x83\xd9\x54\x9d\x4b\x88\xff\
-\xbb\x0f\x35\x3c\x26\xa4\x21\xdc\x6f\xd7\x1c\x75\xdd\xc4\xfa\x26\
-\xd2\xe5\x85\x55\x8d\xed\x81\x25\xa2\x43\x0c\x61\x71\xe0\x2d\xd1\
-\x21\x5a\x64\x1c\xe9\xb3\x57\x47\x3b\x44\x07\x50\x36\x16\x80\xe6\
-\x78\x5d\x74\x80\x61\x8c\x05\x36\x8f\x0e\xd1\x22\x75\x7d\x1f\x80\
-\xd7\x09\xa8\xd2\x96\xa4\xcf\x5e\x1d\xf9\x3e\x68\x08\x0b\x40\x33\
-\x8c\xa6\xde\x57\xe0\xda\x2c\x3a\x40\x8b\xd4\xf9\xb5\xae\x73\xb6\
-\x7e\xb3\x69\x74\x80\x11\x6c\x82\xeb\x96\x46\xf0\x8f\xd4\x0c\x2b\
-\x02\x8b\x45\x87\x18\xc1\xea\xd1\x01\x5a\x64\xb5\xe8\x00\x23\xf0\
-\x7d\x50\x9d\x3a\xbf\x0f\x16\xc7\xab\x87\x36\xc2\x98\xe8\x00\x01\
-\x96\x03\xd6\x1a\x1c\xaf\x20\xcd\xac\xb7\x3c\x30\x91\x17\x37\xa9\
-\x2d\x4d\xfa\xd5\x5d\x17\x75\xdf\xc7\xbe\x6a\x74\x80\x1e\x2d\x05\
-\x6c\x45\xfa\x05\xbb\x0e\xa9\x70\x2d\x4e\x3d\x4f\x71\xac\xf3\xc5\
-\x98\x36\xc2\x83\x42\xab\xb2\x61\x74\x80\x0e\x7e\x03\x3c\x1f\x1d\
-\x62\x21\x73\x81\xa9\x83\xff\x9e\x45\x3a\x5b\xe1\xa9\xc1\xf1\x10\
-\xe9\x22\x4a\xf7\x02\x4f\x07\x64\x0b\xd3\xef\xf3\xb9\xaf\x05\x6c\
-\x4b\xfa\x72\xdf\x14\x78\x35\xce\x5e\x57\x86\x0b\x69\xde\x91\xbf\
-\x13\x81\x3d\x80\xdd\x48\x17\xb5\x69\x63\x19\x96\xf4\x52\x4f\x00\
-\x37\x0e\x8e\x6b\x81\x2b\x80\xfb\x42\x13\x95\xa8\xdf\x0a\xc0\x0a\
-\xc0\x3b\x81\xf7\x90\x8e\x96\x6e\xfa\x2f\xd3\xa6\xf8\x3d\x69\x72\
-\x9a\x26\x58\x03\xf8\x3c\xf0\x2f\xa4\x23\xa9\x25\x69\x24\x0f\x01\
-\x7f\x02\x26\x03\x17\x93\xb6\x1a\xf4\x85\x7e\x28\x00\xe3\x49\xd7\
-\x43\xdf\x8b\xb4\xd2\xf7\xb8\x86\xea\x35\xa1\x00\x2c\x09\xfc\x27\
-\x70\x04\xf5\x3c\x8d\x4e\x52\xfd\xcd\x05\x2e\x05\xce\x04\xce\xa5\
-\x5e\xbb\x39\x72\x6b\x6a\x01\x18\x45\x5a\xd9\xef\x4d\x5a\xf9\xd7\
-\x7d\x1f\x79\xbf\xab\x7b\x01\xd8\x02\xf8\x39\xb0\x7e\x74\x10\x49\
-\x7d\xe3\x39\x52\x09\x38\x93\x54\x0a\xe6\xc5\xc6\xc9\xaf\x69\xbf\
-\x96\x97\x20\x5d\xfa\xf2\x2e\xd2\xc1\x46\x7b\xe1\xca\x5f\x23\xdb\
-\x03\xb8\x12\x57\xfe\x92\x8a\x35\x9e\xf4\x23\xf4\x12\xd2\x3a\xe9\
-\x40\x1a\xb6\x75\xb1\x29\x05\x60\x3c\xf0\x6f\xc0\x3d\xa4\x0b\xe2\
-\xac\x15\x9a\x46\x4d\x71\x30\x70\x16\xce\x4d\x2e\xa9\x5c\x6b\x91\
-\x2e\x87\x7c\x37\x70\x24\x0d\x99\x16\xbb\xee\x05\x60\x29\xe0\x8b\
-\xa4\xd3\x33\xbe\x0d\xac\x1c\x9a\x46\x4d\xb2\x0f\x70\x3c\xf5\x7f\
-\x8f\x4b\xea\x1f\xab\x90\x2e\xd1\x7c\x0f\xf0\x05\x6a\x7e\xa0\x71\
-\x9d\xbf\x1c\x77\x05\xfe\x01\x7c\x85\x74\x9e\xbe\x94\xd5\x1b\x81\
-\xd3\x68\xee\x31\x2e\x92\x9a\x6d\x05\xe0\xab\xc0\x2d\xc0\xfb\x82\
-\xb3\x0c\xab\x8e\x05\x60\x1d\xd2\x79\xe5\xe7\x92\x4e\xd9\x92\xf2\
-\x98\x08\xfc\x94\x7a\xcf\x9c\x28\xa9\x1d\xd6\x22\x5d\xbe\xfb\xb7\
-\xc0\xda\xb1\x51\x5e\xae\x4e\x05\x60\x0c\xe9\x34\xad\x9b\xf0\x6a\
-\x52\xea\xde\xd7\xb0\x38\x4a\xaa\x97\x9d\x48\x5b\x03\xbe\x40\x8d\
-\x26\x1d\xab\xcb\x26\xd2\x35\x80\x9f\x01\xdb\x44\x07\x51\x57\xea\
-\x72\x1a\xe0\xab\x48\x33\x78\xd5\x69\x1a\x67\x49\x5a\xd8\x15\xa4\
-\xb3\x93\x1e\x8c\x0e\x52\x87\x2d\x00\x3b\x01\xd7\xe1\xca\x5f\xbd\
-\xfb\x0c\xae\xfc\x25\xd5\xdb\x1b\x81\x1b\xa8\xc1\x8f\xa6\xc8\x02\
-\xb0\x18\xe9\x68\xc9\x0b\xf0\x20\x3f\xf5\x6e\x79\xe0\xc3\xd1\x21\
-\x24\x29\x83\xe5\x49\xc7\x05\x1c\x45\xe0\xf1\x4a\x51\x05\x60\x22\
-\x69\x6e\xe5\x23\xa9\xcf\x6e\x08\x35\xdb\x07\xf0\xc0\x3f\x49\xcd\
-\x31\x00\xfc\x3b\xf0\x47\x60\xd9\x88\x00\x11\x05\x60\x15\xe0\xbf\
-\x49\x57\x60\x93\x8a\xe2\x81\xa3\x92\x9a\xe8\x4d\xa4\xe3\x02\x56\
-\xab\xfa\x89\xab\x2e\x00\x1b\x00\x57\x91\x2e\xcb\x2b\x15\xe9\x0d\
-\xd1\x01\x24\xa9\x4b\x1b\x03\x97\x53\xf1\x94\xe5\x55\x16\x80\xad\
-\x48\x0b\xb8\x66\x85\xcf\xa9\x76\x58\x01\x58\x31\x3a\x84\x24\xf5\
-\x60\x2d\xd2\x0f\xe4\xca\x7e\xcc\x54\x55\x00\xb6\x26\x5d\x2d\x69\
-\x52\x45\xcf\xa7\x76\xf1\xbc\x7f\x49\xfd\x60\x39\xe0\x22\xd2\x0f\
-\xe6\xd2\x55\x51\x00\xd6\x25\x1d\xed\x38\xa1\x82\xe7\x52\x3b\x2d\
-\x1d\x1d\x40\x92\x0a\x32\x01\xf8\x03\xb0\x61\xd9\x4f\x54\x76\x01\
-\x58\x95\x74\xa9\xc4\x95\x4a\x7e\x1e\xb5\x5b\x6d\x66\xd6\x92\xa4\
-\x02\xac\x00\x5c\x0c\xac\x5e\xe6\x93\x94\x59\x00\x96\x21\xcd\x10\
-\xb7\x56\x89\xcf\x21\x01\x4c\x8f\x0e\x20\x49\x05\x5b\x9d\xb4\x0e\
-\x9d\x58\xd6\x13\x94\x55\x00\x16\x23\x6d\xf6\xf7\x68\x7f\x55\xe1\
-\xd1\xe8\x00\x92\x54\x82\x4d\x48\x17\xc6\x2b\x65\x2b\x67\x59\x05\
-\xe0\xeb\x78\x9e\xbf\xaa\xf3\x20\x30\x33\x3a\x84\x24\x95\xe0\x2d\
-\xa4\x4b\x0b\x17\xae\x8c\x02\xf0\x1e\xe0\xdf\x4a\x78\x5c\x69\x38\
-\xb3\x80\x9b\xa3\x43\x48\x52\x49\x3e\x0d\xbc\xb7\xe8\x07\x2d\xba\
-\x00\xac\x0e\x9c\x89\xd3\xfb\xaa\x7a\x7f\x89\x0e\x20\x49\x25\x19\
-\x00\x7e\x00\xbc\xa2\xc8\x07\x2d\xb2\x00\x8c\x01\xce\xc6\x0b\xfb\
-\x28\xc6\xf9\xd1\x01\x24\xa9\x44\x93\x80\x9f\x51\xe0\xf1\x00\x45\
-\x16\x80\x4f\x93\x2e\x73\x28\x45\xb8\x02\xb8\x37\x3a\x84\x24\x95\
-\x68\x3b\x0a\xdc\xc5\x5e\x54\x01\x58\x1b\xf8\x7c\x41\x8f\x25\x75\
-\x63\x2e\x70\x72\x74\x08\x49\x2a\xd9\x17\x29\x68\x4a\xfd\xa2\x0a\
-\xc0\xb1\xc0\x92\x05\x3d\x96\xd4\xad\x93\x80\xc7\xa2\x43\x48\x52\
-\x89\xc6\x01\xc7\x14\xf1\x40\x45\x14\x80\x9d\x29\xe1\xe8\x44\xa9\
-\x0b\xcf\x01\x5f\x8e\x0e\x21\x49\x25\xdb\x05\xd8\xb1\xd7\x07\xe9\
-\xb5\x00\x2c\x09\x1c\xdd\x6b\x08\xa9\x40\xa7\x00\x7f\x8e\x0e\x21\
-\x49\x25\x3b\x91\xb4\x35\xa0\x6b\xbd\x16\x80\x4f\x91\xf6\xff\x4b\
-\x75\x31\x0f\xf8\x28\xf0\x44\x70\x0e\x49\x2a\xd3\x9a\xc0\xa1\xbd\
-\x3c\x40\x2f\x05\x60\x29\xe0\x88\x5e\x9e\x5c\x2a\xc9\x7d\xc0\x07\
-\x70\x76\x40\x49\xfd\xed\x53\xf4\xb0\x15\xa0\x97\x02\xb0\x3f\xe9\
-\x8a\x45\x52\x1d\x5d\x4e\xda\x4f\x36\x23\x3a\x88\x24\x95\x64\x45\
-\xe0\x5f\xbb\xbd\x73\xb7\x05\x60\x71\xe0\xc8\x6e\x9f\x54\xaa\xc8\
-\x64\x60\x07\xe0\xa9\xe8\x20\x92\x54\x92\x7f\x07\xc6\x76\x73\xc7\
-\x6e\x0b\xc0\xc7\x80\x55\xbb\xbc\xaf\x54\xa5\xff\x06\xb6\x02\xfe\
-\x1a\x1d\x44\x92\x4a\xb0\x1a\xb0\x4f\x37\x77\xec\xa6\x00\x8c\x22\
-\x35\x0e\xa9\x29\xee\x25\xcd\x52\xf9\x49\xe0\x99\xd8\x28\x92\x54\
-\xb8\xff\xa0\x8b\x6b\xf0\x74\x53\x00\xde\x0c\xbc\xb2\x8b\xfb\x49\
-\x91\xe6\x92\x26\xcf\x78\x25\x69\xae\x80\x87\x63\xe3\x48\x52\x61\
-\xd6\x05\xde\x94\xf7\x4e\xdd\x14\x80\xbd\xba\xb8\x8f\xfa\xdb\xec\
-\xe8\x00\x39\x3c\x0b\x7c\x89\x74\x0a\xcd\x0e\xc0\x09\xc0\x3f\x80\
-\x39\x81\x99\x24\xa9\x57\xb9\xd7\xcd\x79\x37\x19\x8c\x03\x1e\x05\
-\x26\xe4\x7d\xa2\x1a\xbb\x13\xb8\x06\xb8\x1d\x78\x08\x98\x02\x4c\
-\xa3\x5e\x2b\x84\x55\x81\x1f\x47\x87\x18\xc1\xcf\x80\x3d\xa3\x43\
-\xf4\x68\x2c\xa9\x45\x4f\xa4\xde\xd3\x5a\x9f\x41\xda\xe7\x57\x47\
-\x0f\x92\x8e\x0f\x52\xf9\x0e\x02\x76\x8d\x0e\x31\x82\x7d\xa8\xd7\
-\x56\xb6\x31\xa4\xf5\xd6\x32\xa4\x4b\xea\x6e\x48\x3a\x36\x68\xdd\
-\xc8\x50\x05\x9b\x02\xac\x02\xbc\x50\xd6\x13\xec\x09\xcc\xef\x83\
-\xf1\x37\xd2\x04\x0a\x75\xfd\x22\x5d\xd4\xd2\xc4\xbf\x66\x23\x8d\
-\x6f\x97\xb7\xe8\x5a\xc4\xe5\xc4\xff\xbd\x87\x1b\x97\x95\xb8\xdc\
-\x7a\xa9\xcf\x11\xff\xf7\x1e\x69\x8c\x2f\x6f\xd1\x0b\xb5\x3a\x70\
-\x18\xe9\x47\x60\xf4\x6b\x56\xc4\xf8\x50\x9e\x85\xcf\xbb\x0b\xa0\
-\xe9\x9b\xff\x7f\x0f\x6c\x0b\x6c\x0d\x1c\x4f\xfa\xc5\xd2\x04\x53\
-\xa9\xf7\xa9\x6c\xff\x8c\x0e\xd0\x22\xf7\x44\x07\x18\xc1\xdd\xd1\
-\x01\x5a\xa4\xce\xaf\xf5\xe3\xa4\xeb\x72\x34\xc1\x03\xc0\x71\xa4\
-\xad\x01\x6f\x24\x9d\x3a\xdc\x64\x7b\x97\xf5\xc0\x13\x49\xfb\x7a\
-\xa3\x1b\x4e\x37\xe3\x9f\xc0\xbb\x8b\x7f\x49\x2a\x75\x11\xf1\xaf\
-\xe3\x70\xe3\x35\x25\x2e\xb7\x5e\xea\x70\xe2\xff\xde\xc3\x8d\x9e\
-\xa6\x25\x55\x2e\xeb\x11\xff\xf7\x1e\x6e\xfc\xbe\xc4\xe5\xae\xc2\
-\x0e\xc0\x5d\xc4\xbf\x8e\xdd\x8c\x59\xa4\xdd\x1c\x99\xe4\xd9\x02\
-\xf0\x0e\xd2\x7e\x94\xa6\xf9\x29\xb0\x05\xcd\x6f\x76\x7f\x89\x0e\
-\x30\x8c\x67\x80\x1b\xa3\x43\xb4\xc8\xe5\xd1\x01\x46\x50\xd7\xf7\
-\x68\x3f\xfa\x27\xf0\x48\x74\x88\x61\xd4\xf9\x3d\x9a\xc5\xef\x81\
-\xcd\x49\xc7\x36\x35\xcd\x62\xc0\xdb\xcb\x78\xe0\x1f\x12\xdf\x6e\
-\xf2\x8c\x79\xa4\x73\x23\xfb\xc5\x66\xc4\xbf\xa6\x43\x8d\xb3\xca\
-\x5c\x68\xbd\xcc\x00\x69\xb3\x65\xf4\xdf\x7d\xd1\x71\x6f\x89\xcb\
-\xac\xa1\x9d\x4a\xfc\xdf\x7d\xa8\xb1\x71\x99\x0b\x5d\xb1\xcf\x92\
-\xd6\x25\xd1\xaf\x69\x9e\x71\x5a\x19\x2f\xc4\xbd\x35\x58\xb0\xac\
-\x63\x1e\xb0\x5f\x19\x2f\x42\xb0\x1b\x88\x7f\x6d\x17\x1d\xef\x2c\
-\x75\x89\x35\x94\x6f\x12\xff\x77\x5f\x74\x7c\xad\xd4\x25\xd6\x50\
-\xb6\x23\xfe\xef\xbe\xe8\xb8\xae\xd4\x25\x8e\xb1\x3f\xcd\x2a\x01\
-\x77\x15\xfd\x02\xac\x56\x83\x85\xca\x33\x3e\x5d\xf4\x0b\x50\x13\
-\xfb\x13\xff\xda\x2e\x3c\x6e\xa3\x8b\xd9\xa7\xd4\xb3\xb5\x49\xa7\
-\xa9\x46\xff\xfd\x17\x8c\xd9\xa4\x79\x15\x54\xbd\x1b\x89\xff\xfb\
-\x2f\x3c\xba\xbe\x30\x4d\xcd\xd5\xfd\xac\x8b\x45\xc7\x2a\x45\x2e\
-\xfc\xee\x35\x58\xa0\xac\xe3\xec\x22\x17\xbc\x66\x16\xa7\x5e\x5b\
-\x62\xf6\x28\x75\x69\x35\x92\x3a\xed\x92\x3b\xb5\xe4\x65\xd5\xf0\
-\x76\x23\xfe\xef\xbf\x60\xdc\x4d\x97\x17\xa5\x69\x88\x5f\x10\xff\
-\x1a\x67\x1d\xbb\x15\xb9\xe0\x47\xd5\x60\x81\xb2\x8c\xbb\xe8\xaf\
-\x49\x8a\x86\xf2\x11\xe2\x5f\xe7\xf9\xa4\x8b\xeb\xf4\x72\x39\x69\
-\xf5\x66\x75\xd2\x84\x55\xd1\xef\x83\x29\xa4\x89\x55\x14\x63\x00\
-\xb8\x92\xf8\xf7\xc1\x7c\xd2\x0f\xc5\x7e\xb6\x0c\xf5\xfa\x01\x36\
-\xd2\xf8\x56\x91\x0b\x3e\xb9\x06\x0b\x94\x65\xec\x58\xe4\x42\xd7\
-\xd8\x85\xc4\xbe\xce\x33\xe8\xaf\x03\x7d\x9a\xea\x60\xe2\x3f\x73\
-\x07\x94\xbe\x94\xea\x64\x23\xd2\xec\x6f\x91\xef\x83\xf3\x4b\x5f\
-\xca\x7a\xd8\x99\xf8\xcf\x5c\x96\x71\x61\x91\x0b\xfd\x70\x0d\x16\
-\xa8\xd3\x68\xfa\x69\x7e\x79\xac\x08\xdc\x4f\xdc\x6b\xbd\x7f\xf9\
-\x8b\xa8\x0c\x06\x80\x5f\x13\xf7\x3e\x38\x07\x8f\x01\xa9\x8b\x7d\
-\x89\x7b\x1f\xdc\x0b\x4c\x2a\x7d\x09\xeb\xe3\x8f\xc4\xaf\xef\x3a\
-\x8d\xfb\x8b\x5a\xd8\x09\x35\x58\x98\x2c\x63\xbb\xa2\x16\xb8\x21\
-\x5e\x43\xda\xfc\x5a\xf5\xeb\x7c\x5c\x15\x0b\xa7\xcc\x26\x00\xd7\
-\x52\xfd\xfb\xe0\x1a\x9a\x33\xdd\x6b\x5b\x1c\x4b\xf5\xef\x83\x29\
-\xa4\x79\x56\xda\xe4\x2d\xc4\xaf\xef\x3a\x8d\x79\xa4\x6b\xf7\xf4\
-\x6c\xd3\x1a\x2c\x4c\xa7\xd1\x8f\xa7\x9e\x64\xf1\x26\xaa\xdd\x0f\
-\xfc\x43\xdc\xef\x5f\x47\x93\x80\x9b\xa8\xee\x7d\x70\x23\xb0\x42\
-\x25\x4b\xa6\x3c\x06\x80\xd3\xa9\xee\x7d\x30\x8d\xf6\xfd\xf0\x5a\
-\xe0\xef\xc4\xaf\xf7\x3a\x8d\x57\x15\xb1\xa0\xef\xad\xc1\x82\x74\
-\x1a\x47\x14\xb1\xa0\x0d\xb5\x25\xe9\x2a\x86\x65\xbe\xbe\xf3\x80\
-\xaf\xe2\xe6\xde\x3a\x5b\x16\xf8\x13\xe5\x7f\xd6\xfe\x48\x8e\xa9\
-\x46\x55\xb9\x01\xd2\x67\xb5\xec\xf3\xd6\x1f\xa4\x7d\xbf\xfc\x17\
-\x76\x24\xf1\xeb\xbd\x4e\xa3\x90\x63\xe2\x0e\xa8\xc1\x82\x74\x1a\
-\x6b\x15\xb1\xa0\x0d\x36\x09\xf8\x1d\xe5\xbc\xb6\x4f\x00\xef\xab\
-\x6e\x51\xd4\x83\x31\xc0\x97\x28\x67\x8e\x80\x39\xa4\x23\x8b\x17\
-\xab\x6a\x61\xd4\x93\x77\x91\xa6\x0a\x2e\xe3\x3b\xe1\x62\x0a\x3e\
-\xcf\xbc\x81\xd6\x25\x7e\xbd\xd7\x69\xec\x5b\xc4\x82\x7e\xbe\x06\
-\x0b\x32\xd2\xb8\xa7\x88\x85\xec\x03\x03\xa4\x53\x04\x1f\xa4\xb8\
-\x2f\xfc\x53\x68\xd7\xc1\x3d\xfd\x62\x4b\xe0\x0a\x8a\xfb\x8c\xfd\
-\x85\x76\xff\xda\x6b\xaa\x49\xa4\x39\x1a\xe6\x52\xcc\xfb\xe0\x01\
-\xd2\xdc\x1f\x6e\x09\x4c\xee\x23\x7e\xfd\x37\xd2\xf8\x6c\x11\x0b\
-\xf9\xbd\x1a\x2c\xc8\x48\xe3\x9c\x22\x16\xb2\x8f\x2c\x41\xda\x6a\
-\xf3\x0f\xba\x7b\x3d\xa7\x92\x56\xfc\xeb\x55\x1d\x5c\x85\x7b\x07\
-\xe9\x2a\x92\xdd\x6c\x11\x98\x43\x3a\xb3\xa6\x94\x0b\x8b\xa8\x52\
-\xeb\x91\x8a\xc0\x54\xba\xfb\x4e\xb8\x85\x74\xe6\xcf\xe2\x55\x07\
-\xaf\xb9\xc8\x33\x70\xb2\x8c\xef\x14\xb1\x90\x3f\xa8\xc1\x82\x8c\
-\x34\x9c\x83\x7c\x78\x5b\x00\xff\x49\xda\x37\xfc\x24\x43\xbf\x7e\
-\x33\x48\x07\x90\x7d\x9f\x34\x7b\xd4\x92\x21\x49\x55\xa6\x55\x81\
-\x83\x48\x65\xf9\x5e\x86\xde\x3f\x3c\x77\xf0\xff\xfb\x25\x70\x20\
-\x6e\xe2\xed\x47\xe3\x80\x0f\x92\x3e\xeb\x37\x01\x33\x19\xfa\x3b\
-\xe1\x09\xd2\xb1\x1e\x5f\x24\x5d\x15\x4f\x43\xfb\x06\xf1\xeb\xbf\
-\x91\x46\xc7\x8b\x02\x65\xb9\xbc\x6f\xdd\xa7\x76\x7c\x30\x3a\x40\
-\x8d\x5d\x3f\x38\x16\x58\x0e\x98\x48\x3a\x60\xec\x05\xd2\x51\xbc\
-\x0f\x93\xbe\xfc\xd5\xbf\x1e\x06\x4e\x1a\x1c\x90\xb6\x12\xad\xca\
-\x8b\xb3\x66\x2e\x78\x1f\xcc\xa8\x3e\x9a\x2a\x34\x9d\x54\x02\x17\
-\x6c\x35\x1d\xcd\x8b\xef\x83\x25\x81\x67\x49\x97\xf7\x7e\x3a\x24\
-\x5d\xf3\x3c\x10\x1d\xa0\x83\x8e\x5b\x6c\xfa\xa1\x00\x4c\x8b\x0e\
-\xd0\x20\x4f\xe3\x87\x5b\x69\x45\x7f\x77\x74\x08\x85\x9b\x4b\xfd\
-\x57\x62\x75\x56\xf7\x75\x4f\xc7\x75\x77\x96\x73\xba\xb3\x94\x84\
-\x48\x2f\x44\x07\x90\x24\xb5\xce\xf4\xe8\x00\x1d\x74\x3c\x63\xc7\
-\x49\x5d\x24\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\
-\x85\x2c\x00\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\
-\xd4\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\
-\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\
-\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\x42\x16\
-\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\x21\
-\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\x92\x24\xb5\
-\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\x42\x16\x00\x49\x92\
-\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\x21\x0b\x80\x24\
-\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\x92\x24\xb5\x90\x05\x40\
-\x92\xa4\x16\xb2\x00\x48\x92\xd4\x42\x16\x00\x49\x92\x5a\xc8\x02\
-\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\
-\x01\x90\x24\xa9\x85\x2c\x00\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\
-\xb2\x00\x48\x92\xd4\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\
-\x0b\x59\x00\x24\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\
-\xa9\x85\x2c\x00\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\
-\x92\xd4\x42\x63\xa2\x03\x14\x60\x25\xe0\x95\xd1\x21\x24\x49\xad\
-\xb2\x52\x74\x80\x5e\xf5\x43\x01\x38\x29\x3a\x80\x24\x49\x4d\xe3\
-\x2e\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\
-\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\x92\x24\
-\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\x42\x16\x00\x49\
-\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\x21\x0b\x80\
-\x24\x49\xfd\x67\x6e\xa7\x1b\x58\x00\x24\x49\xea\x3f\xcf\x75\xba\
-\x81\x05\x40\x92\xa4\xfe\x33\xb5\xd3\x0d\x2c\x00\x92\x24\xf5\x9f\
-\xc7\x3b\xdd\xc0\x02\x20\x49\x52\xff\xb9\xbd\xd3\x0d\x2c\x00\x92\
-\x24\xf5\x1f\x0b\x80\x24\x49\x2d\x33\x05\xb8\xb5\xd3\x8d\x2c\x00\
-\x92\x24\xf5\x97\xcb\xf0\x34\x40\x49\x92\x5a\xe7\x92\x2c\x37\xb2\
-\x00\x48\x92\xd4\x3f\xe6\x00\xbf\xca\x72\x43\x0b\x80\x24\x49\xfd\
-\xe3\x62\xe0\xd1\x2c\x37\xb4\x00\x48\x92\xd4\x3f\x4e\xcc\x7a\x43\
-\x0b\x80\x24\x49\xfd\xe1\x06\xe0\x0f\x59\x6f\x6c\x01\x90\x24\xa9\
-\x3f\xfc\x17\x30\x3f\xeb\x8d\x2d\x00\x92\x24\x35\xdf\x45\xc0\x05\
-\x79\xee\x60\x01\x90\x24\xa9\xd9\xa6\x03\x07\xe7\xbd\x93\x05\x40\
-\x92\xa4\x66\x3b\x14\xb8\x2b\xef\x9d\x2c\x00\x92\x24\x35\xd7\x99\
-\xc0\x0f\xbb\xb9\xa3\x05\x40\x92\xa4\x66\xba\x0c\xd8\xaf\xdb\x3b\
-\x5b\x00\x24\x49\x6a\x9e\xbf\x03\x3b\x03\x33\xba\x7d\x00\x0b\x80\
-\x24\x49\xcd\x72\x35\xf0\x76\xd2\x55\xff\xba\x66\x01\x90\x24\xa9\
-\x39\x7e\x05\xbc\x15\x78\xb2\xd7\x07\xb2\x00\x48\x92\x54\x7f\xb3\
-\x81\xcf\x00\xbb\x03\x2f\x14\xf1\x80\x63\x8a\x78\x10\x49\x92\x54\
-\x9a\xff\x01\x0e\x22\xed\xf7\x2f\x8c\x5b\x00\x24\x49\xaa\xa7\xfb\
-\x80\x8f\x03\x6f\xa4\xe0\x95\x3f\xb8\x05\x40\x92\xa4\xba\xb9\x11\
-\x38\x06\x38\x8b\xb4\xe9\xbf\x14\x16\x00\x49\x92\x62\xcd\x07\x6e\
-\x01\x26\x93\x56\xfa\x85\xff\xda\x1f\x4a\x3f\x14\x80\xc7\x80\xe7\
-\xa3\x43\x48\x92\xd4\xc1\x4c\xe0\x39\xd2\xe9\x7b\x0f\x01\xb7\x0f\
-\x8e\x2b\x49\xeb\xb2\x4a\xf5\x43\x01\x38\x08\x38\x37\x3a\x84\x24\
-\x49\x4d\xe2\x41\x80\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\
-\x48\x92\xd4\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\
-\x00\x24\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\
-\x2c\x00\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\
-\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\
-\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\x92\
-\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\x42\x16\x00\
-\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\x21\x0b\
-\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\x92\x24\xb5\x90\
-\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\x42\x16\x00\x49\x92\x5a\
-\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\x6a\xa1\x31\xd1\x01\x24\
-\x49\x6a\xb1\xc5\x81\xa5\x81\x09\xc0\x4c\x60\x1a\x30\xb5\x8a\x27\
-\xb6\x00\x48\x92\x54\x9d\xf5\x81\x1d\x80\xb7\x00\x9b\x02\x6b\xf1\
-\xf2\xad\xf1\x4f\x03\xb7\x02\x57\x02\x7f\x02\x2e\x05\xe6\x54\x96\
-\x70\x21\xbf\x06\xe6\xd7\x78\xbc\xbf\xbc\x45\x97\x24\xa9\x67\x63\
-\x80\xbd\x80\xab\xe8\x6e\x3d\xf7\x28\x70\x14\xb0\x6a\xd5\xc1\x2d\
-\x00\x92\x24\x75\x67\x57\xe0\x2e\x8a\x59\xdf\xcd\x00\xbe\x4b\xda\
-\x5d\x50\x09\x0b\x80\x24\x49\xf9\x2c\x0f\x9c\x47\x39\xeb\xbd\x07\
-\x81\xed\x7b\x0d\xe8\x59\x00\x92\x24\x15\x6b\x73\xe0\x7a\x60\xe7\
-\x92\x1e\xff\x15\xc0\xc5\xc0\x67\x7a\x79\x10\x0b\x80\x24\x49\xc5\
-\xd9\x0e\xf8\x33\xb0\x7a\xc9\xcf\x33\x1a\xf8\x26\x70\x2c\x30\xd0\
-\xcd\x03\x58\x00\x24\x49\x2a\xc6\x66\xc0\x05\xc0\x32\x15\x3e\xe7\
-\x61\xc0\x37\xba\xb9\xa3\x05\x40\x92\xa4\xde\xad\x0c\x5c\x04\x2c\
-\x1b\xf0\xdc\x9f\x01\x3e\x9a\xf7\x4e\x16\x00\x49\x92\x7a\x33\x00\
-\x9c\x45\x2a\x01\x51\x4e\x04\x36\xca\x73\x07\x0b\x80\x24\x49\xbd\
-\xf9\x04\xf0\xb6\xe0\x0c\xe3\x80\x53\xc8\x71\x3c\x80\x05\x40\x92\
-\xa4\xee\x8d\x27\x1d\x8c\x57\x07\xdb\x01\xbb\x65\xbd\xb1\x05\x40\
-\x92\xa4\xee\x1d\x08\xac\x10\x1d\x62\x21\xff\x45\xc6\x75\xbb\xd7\
-\x02\x90\x8a\xb7\x2c\x5d\x9e\x96\xa3\x4a\x4d\x05\xe6\x46\x87\x50\
-\xa3\x8d\x02\x0e\x8d\x0e\xb1\x88\x8d\x49\xd7\x19\xb8\xb4\xd3\x0d\
-\x2d\x00\x52\xf7\x46\x01\xdb\x90\xf6\xfd\x6d\x03\x6c\x00\xac\x81\
-\x2b\xff\x26\x99\x06\xdc\x0e\xdc\x40\xba\xf0\xca\x6f\x81\xa7\x42\
-\x13\xa9\x49\xb6\xa7\xfc\xf3\xfd\xbb\xb1\x17\x19\x0a\x40\x16\x4e\
-\x05\x2c\xbd\xd4\x8a\xc0\x57\x81\xfb\x89\x7f\xff\x3b\x8a\x1d\xb3\
-\x81\xc9\xc0\xbb\xb0\xc8\xa9\xb3\xe3\x88\x7f\xcf\x0e\x35\x9e\x24\
-\xc3\x6e\x00\x8f\x01\x90\xb2\x1b\x0f\xfc\x3f\xe0\x5e\xe0\x0b\xd4\
-\xb3\xf9\xab\x37\x63\x48\x2b\xff\xc9\xc0\x75\xa4\x83\xaa\xa4\xe1\
-\xbc\x35\x3a\xc0\x30\x96\x27\x5d\x6a\x78\x44\x16\x00\x29\x9b\xed\
-\x81\x7f\x00\xff\x01\x2c\x19\x9c\x45\xd5\xd8\x1c\xb8\x0c\x38\x1d\
-\x58\x2a\x38\x8b\xea\x67\x71\x72\x9e\x77\x5f\xb1\xcd\x3b\xdd\xc0\
-\x02\x20\x75\xf6\x39\xd2\x85\x37\xfc\xc5\xdf\x3e\x03\xa4\x73\xbc\
-\xaf\x02\xd6\x09\xce\xa2\x7a\x59\x97\x34\x1f\x7f\x5d\x6d\xd0\xe9\
-\x06\x16\x00\x69\x78\x03\xc0\xf1\xc0\xd7\xa9\xf7\x07\x5d\xe5\xdb\
-\x94\x54\x02\x36\x89\x0e\xa2\xda\x58\x31\x3a\x40\x07\x93\x3a\xdd\
-\xc0\x02\x20\x0d\xef\xdb\xc0\x21\xd1\x21\x54\x1b\x93\x80\x3f\x02\
-\x1b\x46\x07\x51\x2d\x8c\x8f\x0e\xd0\xc1\xd2\x9d\x6e\x60\x01\x90\
-\x86\x76\x00\x70\x64\x74\x08\xd5\xce\x4a\xc0\xf9\xc0\x84\xe8\x20\
-\x0a\xb7\x58\x74\x80\x0e\x3a\x9e\xe6\x6f\x01\x90\x5e\x6e\x33\xe0\
-\xe8\xe8\x10\xaa\xad\xf5\x49\x07\x06\x4a\x8d\x66\x01\x90\x5e\x6a\
-\x14\xe9\x82\x1a\x4b\x44\x07\x51\xad\xed\x0e\xbc\x37\x3a\x84\xd4\
-\x0b\x0b\x80\xf4\x52\x7b\x03\xaf\x8f\x0e\xa1\x46\xf8\x2e\x30\x36\
-\x3a\x84\xd4\x2d\x0b\x80\xf4\xa2\xd1\xc0\x67\xa3\x43\xa8\x31\xd6\
-\x03\xf6\x8c\x0e\x21\x75\xcb\x02\x20\xbd\xe8\x3d\xa4\xfd\xbb\x52\
-\x56\x75\xbb\x10\x8c\x94\x99\x05\x40\x7a\xd1\xde\xd1\x01\xd4\x38\
-\x5b\x92\x61\xc6\x35\xa9\x8e\x2c\x00\x52\x32\x06\x78\x77\x74\x08\
-\x35\xd2\x0e\xd1\x01\xa4\x6e\x58\x00\xa4\xe4\xb5\x78\x6e\xb7\xba\
-\xf3\xce\xe8\x00\x52\x37\x2c\x00\x52\xb2\x65\x74\x00\x35\xd6\xab\
-\xa3\x03\x48\xdd\xb0\x00\x48\x89\x07\xff\xa9\x5b\xcb\x02\x2b\x47\
-\x87\x90\xf2\xb2\x00\x48\x49\xdd\x2f\xec\xa1\x7a\xb3\x00\xa8\x71\
-\x2c\x00\x52\x52\xf7\x0b\x7b\xa8\xde\xc6\x45\x07\x90\xf2\xb2\x00\
-\x48\xc9\xbc\xe8\x00\x6a\x34\x2f\x17\xad\xc6\xb1\x00\x48\xc9\x73\
-\xd1\x01\xd4\x68\x4f\x46\x07\x90\xf2\xb2\x00\x48\xc9\x43\xd1\x01\
-\xd4\x68\x8f\x47\x07\x90\xf2\xb2\x00\x48\xc9\xed\xd1\x01\xd4\x58\
-\x8f\x00\x4f\x45\x87\x90\xf2\xb2\x00\x48\xc9\xff\x46\x07\x50\x63\
-\xf9\xde\x51\x23\x59\x00\xa4\xe4\x26\xe0\x89\xe8\x10\x6a\xa4\xcb\
-\xa2\x03\x48\xdd\xb0\x00\x48\xc9\x7c\xe0\x37\xd1\x21\xd4\x38\xf3\
-\x80\x5f\x46\x87\x90\xba\x61\x01\x90\x5e\xf4\xa3\xe8\x00\x6a\x9c\
-\xcb\xf1\x00\x52\x35\x94\x05\x40\x7a\xd1\x55\xc0\x95\xd1\x21\xd4\
-\x28\x27\x44\x07\x90\xba\x65\x01\x90\x5e\xea\x2b\xd1\x01\xd4\x18\
-\xf7\x03\xe7\x45\x87\x90\xba\x65\x01\x90\x5e\xea\x62\xe0\xdc\xe8\
-\x10\x6a\x84\x13\x81\x39\xd1\x21\xa4\x6e\x59\x00\xa4\x97\x3b\x04\
-\x27\x76\xd1\xc8\xa6\x03\xa7\x47\x87\x90\x7a\x61\x01\x90\x5e\xee\
-\x11\xe0\x5f\xf0\xd7\x9d\x86\x77\x26\xf0\x74\x74\x08\xa9\x17\x16\
-\x00\x69\x68\x97\x00\x1f\x23\x9d\x1e\x28\x2d\xea\xc4\xe8\x00\x52\
-\xaf\x2c\x00\xd2\xf0\xce\x02\xf6\x03\xe6\x46\x07\x51\xad\x5c\x42\
-\x9a\x38\x4a\x6a\x34\x0b\x80\x34\xb2\xd3\x81\x5d\x80\x67\xa2\x83\
-\xa8\x36\x8e\x8d\x0e\x20\x15\xc1\x02\x20\x75\xf6\x3b\x60\x0b\xe0\
-\xd2\xe8\x20\x0a\x77\x27\xf0\x87\xe8\x10\x52\x11\x2c\x00\x52\x36\
-\xf7\x01\x6f\x03\xf6\x00\xee\x08\xce\xa2\x38\xc7\x93\xa6\xff\x95\
-\x1a\xcf\x02\x20\xe5\xf3\x73\xe0\x55\xc0\x07\x81\x0b\xf1\x4c\x81\
-\x36\x99\x82\xd3\x45\xab\x8f\x8c\x89\x0e\x20\x35\xd0\x5c\xe0\x57\
-\x83\x63\x59\xe0\xcd\xc0\xb6\xc0\x06\xc0\x9a\xc0\x84\xc1\xff\x3e\
-\x10\x15\xb0\x41\x96\x02\xc6\x46\x87\xc8\xe8\x87\xc0\xb4\xe8\x10\
-\x52\x51\x2c\x00\x52\x6f\x9e\x05\xce\x1f\x1c\xca\x67\x0c\x70\x37\
-\xb0\x7a\x74\x90\x0c\xe6\xe1\xbc\xff\xea\x33\xee\x02\x90\x14\xe5\
-\x83\x34\x63\xe5\x0f\x70\x01\xa9\xac\x48\x7d\xc3\x02\x20\x29\xca\
-\xe1\xd1\x01\x72\xf0\xd4\x3f\xf5\x1d\x0b\x80\xa4\x08\xdb\x00\xaf\
-\x8b\x0e\x91\xd1\xcd\xc0\x65\xd1\x21\xa4\xa2\x59\x00\x24\x45\x68\
-\xd2\xaf\xff\xef\xe1\x94\xd0\xea\x43\x16\x00\x49\x55\x5b\x0d\xd8\
-\x35\x3a\x44\x46\x4f\x00\x3f\x8b\x0e\x21\x95\xc1\x02\x20\xa9\x6a\
-\x87\x01\x8b\x45\x87\xc8\xe8\x14\x60\x46\x74\x08\xa9\x0c\x16\x00\
-\x49\x55\x1a\x07\x7c\x22\x3a\x44\x46\xb3\x49\x05\x40\xea\x4b\x16\
-\x00\x49\x55\xfa\x18\xb0\x5c\x74\x88\x8c\xce\x01\x1e\x8c\x0e\x21\
-\x95\xc5\x02\x20\xa9\x2a\x03\xc0\x21\xd1\x21\x72\x38\x2e\x3a\x80\
-\x54\x26\x0b\x80\xa4\xaa\xec\x00\x6c\x18\x1d\x22\xa3\xab\x80\xab\
-\xa3\x43\x48\x65\xb2\x00\x48\xaa\xca\x11\xd1\x01\x72\x70\xe2\x1f\
-\xf5\x3d\x0b\x80\xa4\x2a\x6c\x4c\xba\x9c\x72\x13\x3c\x0c\x9c\x1b\
-\x1d\x42\x2a\x9b\x05\x40\x52\x15\x8e\xa0\x39\x57\x47\x3c\x81\x74\
-\x06\x80\xd4\xd7\x2c\x00\x92\xca\x36\x09\xf8\x48\x74\x88\x8c\x5e\
-\x00\x4e\x8b\x0e\x21\x55\xc1\x02\x20\xa9\x6c\x07\x00\x4b\x46\x87\
-\xc8\xe8\xa7\xc0\x93\xd1\x21\xa4\x2a\x58\x00\x24\x95\x69\x31\x60\
-\xff\xe8\x10\x39\x1c\x1f\x1d\x40\xaa\x8a\x05\x40\x52\x99\x3e\x0c\
-\xbc\x22\x3a\x44\x46\x7f\x02\x6e\x8c\x0e\x21\x55\xc5\x02\x20\xa9\
-\x4c\x87\x46\x07\xc8\xc1\x53\xff\xd4\x2a\x16\x00\x49\x65\x79\x13\
-\xb0\x75\x74\x88\x8c\xee\x01\x7e\x1f\x1d\x42\xaa\x92\x05\x40\x52\
-\x59\x0e\x8f\x0e\x90\xc3\xb1\xc0\xdc\xe8\x10\x52\x95\x2c\x00\x92\
-\xca\xb0\x26\xb0\x73\x74\x88\x8c\xa6\x01\x3f\x8a\x0e\x21\x55\xcd\
-\x02\x20\xa9\x0c\x87\x03\xa3\xa3\x43\x64\x74\x06\x30\x25\x3a\x84\
-\x54\x35\x0b\x80\xa4\xa2\x4d\x00\x3e\x1e\x1d\x22\xa3\xf9\xc0\x49\
-\xd1\x21\xa4\x08\x16\x00\x49\x45\xfb\x38\xb0\x4c\x74\x88\x8c\x7e\
-\x07\xdc\x1e\x1d\x42\x8a\x60\x01\x90\x54\xa4\x51\x78\xea\x9f\xd4\
-\x08\x16\x00\x49\x45\x7a\x2f\xb0\x4e\x74\x88\x8c\x6e\x01\x2e\x8d\
-\x0e\x21\x45\xb1\x00\x48\x2a\xd2\x11\xd1\x01\x72\x38\x96\x74\x0c\
-\x80\xd4\x4a\x16\x00\x49\x45\xd9\x14\x78\x73\x74\x88\x8c\x9e\x01\
-\xce\x8e\x0e\x21\x45\xb2\x00\x48\x2a\xca\xa7\x80\x81\xe8\x10\x19\
-\x7d\x1f\x78\x3e\x3a\x84\x14\xc9\x02\x20\xa9\x08\x2b\x92\x2e\xfc\
-\xd3\x04\x73\x80\x93\xa3\x43\x48\xd1\x2c\x00\x92\x8a\x70\x10\xb0\
-\x44\x74\x88\x8c\x7e\x0d\x3c\x10\x1d\x42\x8a\x66\x01\x90\xd4\xab\
-\xc5\x81\xfd\xa3\x43\xe4\xe0\xa9\x7f\x12\x16\x00\x49\xbd\xdb\x13\
-\x58\x39\x3a\x44\x46\xd7\x02\x57\x45\x87\x90\xea\xc0\x02\x20\xa9\
-\x57\x87\x45\x07\xc8\xe1\xe8\xe8\x00\x52\x5d\x58\x00\x24\xf5\xe2\
-\xad\xc0\xe6\xd1\x21\x32\x7a\x04\x38\x27\x3a\x84\x54\x17\x16\x00\
-\x49\xbd\x68\xd2\xc4\x3f\x27\x03\xb3\xa2\x43\x48\x75\x61\x01\x90\
-\xd4\xad\xb5\x81\x1d\xa3\x43\x64\x34\x13\x38\x35\x3a\x84\x54\x27\
-\x16\x00\x49\xdd\x3a\x02\x18\x1d\x1d\x22\xa3\xb3\x81\xc7\xa2\x43\
-\x48\x75\x62\x01\x90\xd4\x8d\xa5\x81\x8f\x46\x87\xc8\xe1\xb8\xe8\
-\x00\x52\xdd\x58\x00\x24\x75\x63\x5f\x52\x09\x68\x82\xcb\x80\x1b\
-\xa2\x43\x48\x75\x63\x01\x90\x94\xd7\x68\xd2\xcc\x7f\x4d\xe1\xc4\
-\x3f\xd2\x10\x2c\x00\x92\xf2\xda\x05\x78\x65\x74\x88\x8c\xee\x03\
-\x2e\x88\x0e\x21\xd5\x91\x05\x40\x52\x5e\x4d\x3a\xf5\xef\x38\x60\
-\x6e\x74\x08\xa9\x8e\x2c\x00\x92\xf2\xd8\x12\x78\x63\x74\x88\x8c\
-\xa6\x03\x3f\x8a\x0e\x21\xd5\x95\x05\x40\x52\x1e\x9f\x8c\x0e\x90\
-\xc3\x19\xc0\xd3\xd1\x21\xa4\xba\xb2\x00\x48\xca\x6a\x15\x60\xf7\
-\xe8\x10\x19\xcd\x07\x4e\x88\x0e\x21\xd5\x99\x05\x40\x52\x56\x07\
-\x01\x63\xa3\x43\x64\x34\x19\xb8\x2d\x3a\x84\x54\x67\x16\x00\x49\
-\x59\x2c\x4e\x3a\xf7\xbf\x29\x3c\xf5\x4f\xea\xc0\x02\x20\x29\x8b\
-\xbd\x81\x95\xa2\x43\x64\x74\x07\x70\x71\x74\x08\xa9\xee\x2c\x00\
-\x92\xb2\x38\x24\x3a\x40\x0e\x47\x93\x8e\x01\x90\x34\x02\x0b\x80\
-\xa4\x4e\xde\x01\x6c\x16\x1d\x22\xa3\x67\x81\x33\xa3\x43\x48\x4d\
-\x60\x01\x90\xd4\x49\x93\x26\xfe\x39\x0d\x78\x3e\x3a\x84\xd4\x04\
-\x16\x00\x49\x23\x59\x0f\x78\x77\x74\x88\x8c\xe6\x02\x27\x47\x87\
-\x90\x9a\xc2\x02\x20\x69\x24\x47\xd0\x9c\xef\x89\xf3\x80\x7b\xa2\
-\x43\x48\x4d\xd1\x94\x0f\xb6\xa4\xea\x2d\x4b\x3a\xfa\xbf\x29\x3c\
-\xf5\x4f\xca\xc1\x02\x20\x69\x38\xfb\x01\xe3\xa3\x43\x64\x74\x3d\
-\x70\x79\x74\x08\xa9\x49\x2c\x00\x92\x86\x32\x06\x38\x38\x3a\x44\
-\x0e\xc7\x44\x07\x90\x9a\xc6\x02\x20\x69\x28\x1f\x00\xd6\x88\x0e\
-\x91\xd1\xe3\xc0\x2f\xa3\x43\x48\x4d\x63\x01\x90\x34\x94\xc3\xa3\
-\x03\xe4\x70\x32\x30\x23\x3a\x84\xd4\x34\x16\x00\x49\x8b\xda\x0a\
-\x78\x43\x74\x88\x8c\x66\x01\xdf\x8f\x0e\x21\x35\x91\x05\x40\xd2\
-\xa2\x8e\x8c\x0e\x90\xc3\xcf\x81\x47\xa3\x43\x48\x4d\x64\x01\x90\
-\xb4\xb0\x57\x90\xf6\xff\x37\xc5\x09\xd1\x01\xa4\xa6\xb2\x00\x48\
-\x5a\xd8\x21\xc0\x62\xd1\x21\x32\xba\x02\xf8\x5b\x74\x08\xa9\xa9\
-\x2c\x00\x92\x16\x18\x07\xec\x1b\x1d\x22\x07\x27\xfe\x91\x7a\x60\
-\x01\x90\xb4\xc0\x3e\xc0\xf2\xd1\x21\x32\xba\x9f\x34\xf5\xaf\xa4\
-\x2e\x59\x00\x24\x01\x0c\x00\x87\x46\x87\xc8\xe1\x44\x60\x4e\x74\
-\x08\xa9\xc9\x2c\x00\x92\x20\x5d\xf1\x6f\xa3\xe8\x10\x19\x4d\x07\
-\x7e\x10\x1d\x42\x6a\x3a\x0b\x80\x24\x68\xd6\xc4\x3f\x3f\x01\x9e\
-\x8a\x0e\x21\x35\x9d\x05\x40\xd2\x06\xc0\x3b\xa3\x43\xe4\x70\x52\
-\x74\x00\xa9\x1f\x58\x00\x24\x7d\x8a\x74\x0c\x40\x13\x5c\x0c\xdc\
-\x14\x1d\x42\xea\x07\x16\x00\xa9\xdd\x96\x03\x3e\x12\x1d\x22\x07\
-\x4f\xfd\x93\x0a\x62\x01\x90\xda\xed\x00\x60\xa9\xe8\x10\x19\xdd\
-\x09\x4c\x8e\x0e\x21\xf5\x0b\x0b\x80\xd4\x5e\x8b\x01\x07\x46\x87\
-\xc8\xe1\x38\x60\x5e\x74\x08\xa9\x5f\x58\x00\xa4\xf6\xda\x1d\x58\
-\x2d\x3a\x44\x46\x53\x49\x47\xff\x4b\x2a\x88\x05\x40\x6a\xaf\xc3\
-\xa2\x03\xe4\x70\x3a\xa9\x04\x48\x2a\x88\x05\x40\x6a\xa7\x6d\x81\
-\xd7\x46\x87\xc8\x68\x1e\x69\xe6\x3f\x49\x05\xb2\x00\x48\xed\x74\
-\x44\x74\x80\x1c\x2e\x00\xee\x8e\x0e\x21\xf5\x1b\x0b\x80\xd4\x3e\
-\x6b\x02\xbb\x44\x87\xc8\xc1\x53\xff\xa4\x12\x58\x00\xa4\xf6\x39\
-\x04\x18\x13\x1d\x22\xa3\x9b\x81\xcb\xa2\x43\x48\xfd\xc8\x02\x20\
-\xb5\xcb\x38\xe0\xe3\xd1\x21\x72\x38\x1a\x98\x1f\x1d\x42\xea\x47\
-\x16\x00\xa9\x5d\x3e\x4e\x9a\xfd\xaf\x09\x9e\x00\x7e\x16\x1d\x42\
-\xea\x57\x16\x00\xa9\x3d\x06\x48\x9b\xff\x9b\xe2\x14\xe0\x85\xe8\
-\x10\x52\xbf\xb2\x00\x48\xed\xb1\x13\xe9\xca\x7f\x4d\x30\x9b\x54\
-\x00\x24\x95\xc4\x02\x20\xb5\xc7\xe1\xd1\x01\x72\x38\x07\x78\x30\
-\x3a\x84\xd4\xcf\x2c\x00\x52\x3b\x6c\x02\x6c\x1f\x1d\x22\x87\xe3\
-\xa2\x03\x48\xfd\xce\x02\x20\xb5\xc3\x27\x49\xc7\x00\x34\xc1\x5f\
-\x81\xab\xa3\x43\x48\xfd\xce\x02\x20\xf5\xbf\x49\xc0\x9e\xd1\x21\
-\x72\x70\xe2\x1f\xa9\x02\x16\x00\xa9\xff\x1d\x08\x2c\x11\x1d\x22\
-\xa3\x87\x81\x5f\x47\x87\x90\xda\xc0\x02\x20\xf5\xb7\xb1\xc0\x01\
-\xd1\x21\x72\x38\x81\x74\x06\x80\xa4\x92\x59\x00\xa4\xfe\xf6\x61\
-\x60\x95\xe8\x10\x19\xbd\x00\x9c\x16\x1d\x42\x6a\x0b\x0b\x80\xd4\
-\xdf\x0e\x8d\x0e\x90\xc3\x4f\x81\x27\xa3\x43\x48\x6d\x61\x01\x90\
-\xfa\xd7\x9b\x81\xad\xa2\x43\xe4\x70\x7c\x74\x00\xa9\x4d\x2c\x00\
-\x52\xff\x6a\xd2\xc4\x3f\x97\x02\x37\x46\x87\x90\xda\xc4\x02\x20\
-\xf5\xa7\xb5\x80\xf7\x45\x87\xc8\xc1\x53\xff\xa4\x8a\x59\x00\xa4\
-\xfe\x74\x38\x30\x3a\x3a\x44\x46\xf7\x00\x17\x46\x87\x90\xda\xc6\
-\x02\x20\xf5\x9f\x09\xc0\xc7\xa2\x43\xe4\x70\x2c\x30\x37\x3a\x84\
-\xd4\x36\x16\x00\xa9\xff\x7c\x02\x58\x26\x3a\x44\x46\xd3\x80\x1f\
-\x45\x87\x90\xda\xc8\x02\x20\xf5\x97\x51\xc0\x21\xd1\x21\x72\x38\
-\x03\x98\x12\x1d\x42\x6a\x23\x0b\x80\xd4\x5f\x76\x06\xd6\x89\x0e\
-\x91\xd1\x7c\xe0\xa4\xe8\x10\x52\x5b\x59\x00\xa4\xfe\xd2\xa4\x53\
-\xff\x7e\x07\xdc\x1e\x1d\x42\x6a\x2b\x0b\x80\xd4\x3f\xb6\x20\x4d\
-\xfe\xd3\x14\x9e\xfa\x27\x05\xb2\x00\x48\xfd\xe3\x88\xe8\x00\x39\
-\xdc\x42\x9a\xfc\x47\x52\x10\x0b\x80\xd4\x1f\x56\x04\x76\x8f\x0e\
-\x91\xc3\xb1\xa4\x63\x00\x24\x05\xb1\x00\x48\xfd\xe1\x60\x60\x89\
-\xe8\x10\x19\x3d\x03\x9c\x1d\x1d\x42\x6a\x3b\x0b\x80\xd4\x7c\x8b\
-\x03\xfb\x47\x87\xc8\xe1\x14\xe0\xf9\xe8\x10\x52\xdb\x59\x00\xa4\
-\xe6\xfb\x08\xb0\x52\x74\x88\x8c\xe6\xe0\xa9\x7f\x52\x2d\x58\x00\
-\xa4\xe6\x3b\x2c\x3a\x40\x0e\xbf\x06\x1e\x88\x0e\x21\xc9\x02\x20\
-\x35\xdd\xdb\x80\x57\x47\x87\xc8\xc1\x53\xff\xa4\x9a\xb0\x00\x48\
-\xcd\xd6\xa4\x89\x7f\xae\x05\xae\x8a\x0e\x21\x29\xb1\x00\x48\xcd\
-\xb5\x2e\xb0\x63\x74\x88\x1c\x8e\x8e\x0e\x20\xe9\x45\x16\x00\xa9\
-\xb9\x0e\xa7\x39\x9f\xe1\x47\x80\x73\xa2\x43\x48\x7a\x51\x53\xbe\
-\x3c\x24\xbd\xd4\xd2\xc0\xde\xd1\x21\x72\x38\x19\x98\x15\x1d\x42\
-\xd2\x8b\x2c\x00\x52\x33\xed\x47\x2a\x01\x4d\x30\x13\x38\x35\x3a\
-\x84\xa4\x97\xb2\x00\x48\xcd\x33\x1a\x38\x28\x3a\x44\x0e\x67\x03\
-\x8f\x45\x87\x90\xf4\x52\x16\x00\xa9\x79\x76\x05\xd6\x8e\x0e\x91\
-\xc3\x89\xd1\x01\x24\xbd\x9c\x05\x40\x6a\x9e\x26\x5d\xf5\xef\x32\
-\xd2\xe9\x7f\x92\x6a\xc6\x02\x20\x35\xcb\x6b\x80\x6d\xa3\x43\xe4\
-\xe0\xc4\x3f\x52\x4d\x59\x00\xa4\x66\xf9\x64\x74\x80\x1c\xee\x03\
-\x2e\x88\x0e\x21\x69\x68\x16\x00\xa9\x39\x56\x05\x3e\x18\x1d\x22\
-\x87\xe3\x81\xb9\xd1\x21\x24\x0d\xcd\x02\x20\x35\xc7\xc1\xc0\xd8\
-\xe8\x10\x19\x4d\x07\xce\x88\x0e\x21\x69\x78\x16\x00\xa9\x19\x96\
-\x24\x9d\xfb\xdf\x14\x67\x00\x4f\x47\x87\x90\x34\x3c\x0b\x80\xd4\
-\x0c\x7b\x01\x2b\x44\x87\xc8\x68\x3e\x70\x42\x74\x08\x49\x23\xb3\
-\x00\x48\xcd\x70\x70\x74\x80\x1c\x26\x03\xb7\x45\x87\x90\x34\x32\
-\x0b\x80\x54\x7f\xef\x02\x36\x8b\x0e\x91\x83\xa7\xfe\x49\x0d\x60\
-\x01\x90\xea\xef\xf0\xe8\x00\x39\xdc\x01\x5c\x12\x1d\x42\x52\x67\
-\x16\x00\xa9\xde\xd6\x27\x6d\x01\x68\x8a\x63\x80\x79\xd1\x21\x24\
-\x75\x66\x01\x90\xea\xed\x08\x9a\xf3\x39\x7d\x16\xf8\x49\x74\x08\
-\x49\xd9\x34\xe5\x8b\x45\x6a\xa3\x89\xc0\xde\xd1\x21\x72\x38\x0d\
-\x78\x3e\x3a\x84\xa4\x6c\x2c\x00\x52\x7d\xed\x0f\x2c\x15\x1d\x22\
-\xa3\xb9\xc0\xc9\xd1\x21\x24\x65\x67\x01\x90\xea\x69\x0c\x70\x50\
-\x74\x88\x1c\xce\x03\xee\x89\x0e\x21\x29\x3b\x0b\x80\x54\x4f\xbb\
-\x01\xab\x47\x87\xc8\xc1\x53\xff\xa4\x86\xb1\x00\x48\xf5\xd4\xa4\
-\x53\xff\xae\x07\x2e\x8f\x0e\x21\x29\x1f\x0b\x80\x54\x3f\x6f\x00\
-\x5e\x1f\x1d\x22\x87\x63\xa2\x03\x48\xca\xcf\x02\x20\xd5\x4f\x93\
-\x7e\xfd\x3f\x0e\xfc\x32\x3a\x84\xa4\xfc\x2c\x00\x52\xbd\x2c\x07\
-\xec\x1a\x1d\x22\x87\x93\x81\x19\xd1\x21\x24\xe5\x67\x01\x90\xea\
-\xe5\xc3\xc0\xd8\xe8\x10\x19\xcd\x02\x4e\x89\x0e\x21\xa9\x3b\x16\
-\x00\xa9\x5e\x76\x8a\x0e\x90\xc3\x2f\x80\x47\xa2\x43\x48\xea\x8e\
-\x05\x40\xaa\x8f\xd1\xc0\xb6\xd1\x21\x72\x38\x2e\x3a\x80\xa4\xee\
-\x59\x00\xa4\xfa\x58\x1b\x58\x3a\x3a\x44\x46\x57\x00\xd7\x44\x87\
-\x90\xd4\x3d\x0b\x80\x54\x1f\xeb\x44\x07\xc8\xc1\x5f\xff\x52\xc3\
-\x59\x00\xa4\xfa\x58\x21\x3a\x40\x46\x0f\x91\xa6\xfe\x95\xd4\x60\
-\x16\x00\xa9\x3e\x96\x8c\x0e\x90\xd1\xf1\xc0\xec\xe8\x10\x92\x7a\
-\x63\x01\x90\xea\xa3\x09\x2b\xd5\xe9\xc0\xe9\xd1\x21\x24\xf5\xce\
-\x02\x20\xd5\xc7\xb3\xd1\x01\x32\x38\x0b\x78\x2a\x3a\x84\xa4\xde\
-\x59\x00\xa4\xfa\xb8\x37\x3a\x40\x06\x27\x44\x07\x90\x54\x0c\x0b\
-\x80\x54\x1f\x77\x00\x73\xa2\x43\x8c\xe0\x12\xe0\xa6\xe8\x10\x92\
-\x8a\x61\x01\x90\xea\xe3\x05\xe0\xba\xe8\x10\x23\xf0\xaa\x7f\x52\
-\x1f\xb1\x00\x48\xf5\x72\x49\x74\x80\x61\xdc\x09\x4c\x8e\x0e\x21\
-\xa9\x38\x16\x00\xa9\x5e\xce\x8e\x0e\x30\x8c\xe3\x80\x79\xd1\x21\
-\x24\x15\xc7\x02\x20\xd5\xcb\x3f\x80\xab\xa3\x43\x2c\xe2\x29\xe0\
-\xc7\xd1\x21\x24\x15\xcb\x02\x20\xd5\xcf\x51\xd1\x01\x16\xf1\x1d\
-\x60\x5a\xde\xd5\xb5\x13\x00\x00\x07\xab\x49\x44\x41\x54\x74\x08\
-\x49\xc5\xb2\x00\x48\xf5\x73\x1e\xf5\xd9\x0a\xf0\x04\x9e\xfa\x27\
-\xf5\x25\x0b\x80\x54\x3f\xf3\x80\x43\xa8\xc7\x29\x81\x9f\x02\x9e\
-\x8b\x0e\x21\xa9\x78\x16\x00\xa9\x9e\xae\x01\xbe\x1a\x9c\xe1\x1c\
-\xd2\xcc\x7f\x92\xfa\x90\x05\x40\xaa\xaf\xaf\x03\xbf\x0b\x7a\xee\
-\x5b\x81\x7d\x83\x9e\x5b\x52\x05\x2c\x00\x52\x7d\xcd\x05\x3e\x04\
-\x5c\x55\xf1\xf3\xde\x09\xbc\x1d\x98\x52\xf1\xf3\x4a\xaa\x90\x05\
-\x40\xaa\xb7\xe9\xc0\x3b\xa9\x6e\x82\xa0\xdb\x80\xb7\x01\x0f\x57\
-\xf4\x7c\x92\x82\x58\x00\xa4\xfa\x7b\x0e\xd8\x01\xf8\x32\xe5\x4e\
-\xc6\x73\x1e\xf0\x7a\xe0\x81\x12\x9f\x43\x52\x4d\x58\x00\xa4\x66\
-\x98\x03\x7c\x09\xd8\x11\xb8\xab\xe0\xc7\x7e\x1c\xd8\x0f\xd8\x15\
-\x37\xfb\x4b\xad\x61\x01\x90\x9a\x65\x32\xb0\x09\x70\x24\xf0\x50\
-\x8f\x8f\x35\x15\xf8\x06\xb0\x1e\x70\x5a\x8f\x8f\x25\xa9\x61\x2c\
-\x00\x52\xf3\xcc\x00\xbe\x07\xac\x03\x7c\x90\xb4\xe9\x3e\xeb\xb9\
-\xfa\x33\x81\x4b\x81\x7d\x80\x55\x80\xcf\x93\x8a\x80\xa4\x96\x19\
-\x13\x1d\x40\x52\xd7\x66\x02\xbf\x1a\x1c\x63\x80\xad\x80\x4d\x49\
-\xbf\xe8\x97\x01\x26\x92\xe6\xf1\x7f\x0a\x78\x8c\x34\xb7\xc0\x75\
-\x83\xf7\x93\xd4\x72\x16\x00\xa9\x3f\xcc\x01\xfe\x3a\x38\x24\xa9\
-\x23\x77\x01\x48\x92\xd4\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\
-\x52\x0b\x59\x00\x24\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\
-\x24\xa9\x85\x2c\x00\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\
-\x48\x92\xd4\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\
-\x00\x24\x49\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\
-\x2c\x00\x92\x24\xb5\x90\x05\x40\x92\xa4\x16\xb2\x00\x48\x92\xd4\
-\x42\x16\x00\x49\x92\x5a\xc8\x02\x20\x49\x52\x0b\x59\x00\x24\x49\
-\x6a\x21\x0b\x80\x24\x49\x2d\x64\x01\x90\x24\xa9\x85\x2c\x00\x92\
-\x24\xb5\x90\x05\x40\x92\xa4\x16\xca\x52\x00\x66\x97\x9e\xa2\x37\
-\xe3\xa2\x03\x48\x92\x5a\x67\x7c\x74\x80\x0e\x66\x75\xba\x41\x96\
-\x02\xd0\xf1\x41\x82\x4d\x88\x0e\x20\x49\x6a\x9d\xba\xaf\x7b\x5a\
-\x51\x00\xd6\x8c\x0e\x20\x49\x6a\x9d\xba\xaf\x7b\x66\x76\xba\x41\
-\x96\x02\xf0\x6c\x01\x41\xca\xb4\x41\x74\x00\x49\x52\xeb\xd4\x7d\
-\xdd\xd3\x71\xdd\x9d\xa5\x00\x3c\x55\x40\x90\x32\xbd\x2e\x3a\x80\
-\x24\xa9\x55\x06\x80\xd7\x46\x87\xe8\xe0\xc9\x4e\x37\xc8\x52\x00\
-\x3a\x3e\x48\xb0\x55\x80\x0d\xa3\x43\x48\x92\x5a\x63\x23\x60\xe5\
-\xe8\x10\x1d\x74\xfc\xf1\x9e\xa5\x00\x3c\x5c\x40\x90\xb2\xbd\x3f\
-\x3a\x80\x24\xa9\x35\x3e\x10\x1d\x20\x83\x07\x8b\x78\x90\x57\x01\
-\xf3\x6b\x3e\x6e\x25\x6d\x92\x91\x24\xa9\x4c\x03\xc0\xed\xc4\xaf\
-\xf7\x3a\x8d\x42\x8e\x51\x58\x0a\x98\x57\x83\x85\xe9\x34\xde\x53\
-\xc4\xc2\x4a\x92\x34\x82\x9d\x88\x5f\xdf\x75\x1a\x73\x81\x25\x8a\
-\x5a\xe0\xfb\x6a\xb0\x40\x9d\xc6\x95\x45\x2d\xac\x24\x49\x43\x18\
-\x00\xae\x26\x7e\x7d\xd7\x69\xdc\x95\x65\x61\xb2\x4e\x05\x7c\x63\
-\xc6\xdb\x45\xda\x06\xd8\x33\x3a\x84\x24\xa9\x6f\xed\x4d\xfd\x8f\
-\xfe\x07\xb8\x29\xcb\x8d\xb2\x16\x80\x4c\x0f\x56\x03\xdf\x05\x26\
-\x45\x87\x90\x24\xf5\x9d\x95\x80\xa3\xa2\x43\x64\x54\x68\x01\xf8\
-\x5b\x0f\x41\xaa\xb4\x32\xf0\x13\xbc\xc8\x91\x24\xa9\x38\xa3\x48\
-\xeb\x96\x15\xa3\x83\x64\x54\xe8\x3a\x7b\x05\x9a\x71\x20\xe0\x82\
-\x71\x42\x91\x0b\x2f\x49\x6a\xb5\xef\x11\xbf\x5e\xcb\x3a\xe6\x51\
-\xc2\x96\xf0\x3b\x6a\xb0\x60\x79\xc6\x17\x8b\x7e\x01\x24\x49\xad\
-\xf3\x9f\xc4\xaf\xcf\xf2\x8c\x5b\xcb\x78\x11\x4e\xae\xc1\x82\xe5\
-\x1d\x47\xe3\xee\x00\x49\x52\x7e\xa3\x81\x63\x89\x5f\x8f\xe5\x1d\
-\xa5\x6c\x01\xdf\xb9\x06\x0b\xd6\xcd\xb8\x94\x34\x5d\xb0\x24\x49\
-\x59\xac\x08\x5c\x44\xfc\xfa\xab\x9b\xb1\x63\x09\xaf\x07\xe3\x81\
-\x19\x35\x58\xb8\x6e\xc6\x13\xc0\x27\x70\xb6\x40\x49\xd2\xf0\x46\
-\x01\xfb\x92\xae\x81\x13\xbd\xde\xea\x66\xbc\x40\x9a\xbc\xaf\x14\
-\xe7\xd6\x60\x01\x7b\x19\xd7\x91\xe6\x70\x76\xb7\x80\x24\x69\x81\
-\x51\xc0\x6e\xc0\x0d\xc4\xaf\xa7\x7a\x19\xe7\x14\xfd\xc2\x2c\x6c\
-\xd7\x1a\x2c\x60\x11\xe3\x3e\xe0\xeb\xc0\xd6\xa4\xfd\x3c\x92\xa4\
-\x76\x19\x4d\x9a\xd4\xe7\x1b\xc0\xfd\xc4\xaf\x97\x8a\x18\xef\xcb\
-\xf3\x02\xe4\xdd\x24\x3e\x96\x74\x75\xc0\xe5\x73\xde\xaf\xce\xa6\
-\x00\xd7\x92\xce\x72\xb8\x1f\x98\x0a\xcc\x0e\x4d\x24\x49\x2a\xda\
-\x58\x60\x02\xb0\x06\xe9\x42\x39\x5b\x02\xcb\x84\x26\x2a\xd6\x93\
-\xc0\xaa\xe4\x58\x7f\x75\xb3\x4f\xfc\x44\xe0\xa0\x2e\xee\x27\x49\
-\x92\xca\x71\x3c\x70\x58\x9e\x3b\x74\xb3\x2f\xfc\xcc\x2e\xee\x23\
-\x49\x92\xca\x93\x7b\xdd\xdc\xed\x51\xf1\x37\x03\x1b\x77\x79\x5f\
-\x49\x92\x54\x9c\x9b\x80\xcd\xf2\xde\xa9\xdb\xa3\xe1\xbf\xd5\xe5\
-\xfd\x24\x49\x52\xb1\xbe\xd9\xcd\x9d\xba\xdd\x02\x30\x9a\x34\xdd\
-\xe0\x7a\x5d\xde\x5f\x92\x24\xf5\xee\x2e\x60\x43\x60\x4e\xde\x3b\
-\x76\xbb\x05\x60\x2e\xf0\x9d\x2e\xef\x2b\x49\x92\x8a\xf1\x0d\xba\
-\x58\xf9\x43\x6f\x33\xe3\x2d\x06\xfc\x93\x74\x4a\x85\x24\x49\xaa\
-\xd6\x03\xc0\xba\xc0\xac\x6e\xee\xdc\xcb\x8c\x78\xb3\x71\x2b\x80\
-\x24\x49\x51\xbe\x49\x97\x2b\x7f\xe8\x7d\x6e\xfc\x31\xa4\x49\x74\
-\x72\x1f\x7d\x28\x49\x92\xba\x76\x33\x69\x32\xa3\xae\x27\xae\xeb\
-\x75\x4e\xfc\x39\xc0\x21\xa4\x29\x08\x25\x49\x52\xf9\xe6\x93\xd6\
-\xbd\x3d\xcd\x5a\x5b\xc4\x45\x71\x2e\x07\x7e\x5a\xc0\xe3\x48\x92\
-\xa4\xce\x7e\x0c\x5c\xd6\xeb\x83\x14\x75\x79\xdc\x95\x80\xdb\x80\
-\x65\x0b\x7a\x3c\x49\x92\xf4\x72\xcf\x90\x4e\xfb\x7b\xbc\xd7\x07\
-\x2a\xea\x4a\x78\xcf\x03\xd3\x80\x1d\x0b\x7a\x3c\x49\x92\xf4\x72\
-\x9f\x04\xfe\x52\xc4\x03\x15\xb5\x05\x60\xc1\x63\xfd\x06\xd8\xb9\
-\xc0\xc7\x94\x24\x49\xc9\x85\xc0\x7b\x29\xe8\xb8\xbb\x22\x0b\x00\
-\xc0\x44\xe0\x7a\x60\xcd\x82\x1f\x57\x92\xa4\x36\x7b\x00\xd8\x02\
-\x78\xaa\xa8\x07\x2c\xe2\x20\xc0\x85\x3d\x03\x7c\x88\x1e\x8f\x4c\
-\x94\x24\x49\xff\xdf\x1c\x60\x0f\x0a\x5c\xf9\x43\x71\xc7\x00\x2c\
-\xec\x21\x52\x01\x78\x7b\x09\x8f\x2d\x49\x52\xdb\x7c\x1a\xf8\x45\
-\xd1\x0f\x5a\xf4\x2e\x80\x05\x46\x01\xe7\xe2\xf1\x00\x92\x24\xf5\
-\xe2\x5c\x60\x37\x4a\x98\x6f\xa7\xac\x02\x00\xb0\x24\x70\x11\xb0\
-\x5d\x89\xcf\x21\x49\x52\xbf\xba\x8a\xb4\x35\x7d\x7a\x19\x0f\x5e\
-\x66\x01\x00\x58\x06\xf8\x33\xb0\x79\xc9\xcf\x23\x49\x52\x3f\xb9\
-\x19\x78\x13\xe9\xd8\xba\x52\x94\x5d\x00\x00\x56\x05\xae\x04\xd6\
-\xaa\xe0\xb9\x24\x49\x6a\xba\x07\x80\x6d\x07\xff\xb7\x34\x45\x9f\
-\x05\x30\x94\x87\x81\x77\x53\xc0\xac\x45\x92\x24\xf5\xb9\xc7\x49\
-\x9b\xfd\x4b\x5d\xf9\x43\x35\x05\x00\xe0\x76\xe0\x0d\xc0\x3f\x2b\
-\x7a\x3e\x49\x92\x9a\xe6\x5e\xd2\x66\xff\x3b\xaa\x78\xb2\xaa\x0a\
-\x00\xc0\xdd\xa4\x03\x02\x6f\xa8\xf0\x39\x25\x49\x6a\x82\x5b\x48\
-\xeb\xc8\xdb\xab\x7a\xc2\x2a\x0b\x00\xc0\xa3\xc0\x5b\x29\x68\x1e\
-\x63\x49\x92\xfa\xc0\x65\xa4\x7d\xfe\x0f\x56\xf9\xa4\x55\x17\x00\
-\x80\x67\x49\xc7\x04\x9c\x1b\xf0\xdc\x92\x24\xd5\xc9\xaf\x48\xeb\
-\xc4\x29\x55\x3f\x71\x19\x33\x01\x66\x31\x07\x38\x87\x74\x7a\xc3\
-\xf6\x81\x39\x24\x49\x8a\x30\x07\xf8\x1c\x70\xc4\xe0\xbf\x2b\x57\
-\xc5\x69\x80\x9d\x6c\x45\x9a\xe2\xf0\x95\xd1\x41\x24\x49\xaa\xc0\
-\xfd\xc0\x87\x49\x13\xfd\x84\x89\xd8\x05\xb0\xa8\x6b\x48\x57\x38\
-\x3a\x27\x3a\x88\x24\x49\x25\x3b\x9f\x34\x39\x5e\xe8\xca\x1f\xea\
-\x51\x00\x00\xa6\x92\xae\x22\xf8\xaf\x14\x7c\xb5\x23\x49\x92\x6a\
-\xe0\x49\xe0\x13\xc0\x2e\x94\x38\xbb\x5f\x1e\x75\xdb\xf7\x7e\x3d\
-\x70\x1a\xe9\x3a\x02\x5b\x53\x8f\x5d\x14\x92\x24\x75\x6b\x3e\x70\
-\x16\xe9\xe2\x78\x57\x06\x67\x79\x89\x3a\xaf\x60\x5f\x03\x9c\x04\
-\xbc\x36\x3a\x88\x24\x49\x5d\xb8\x01\x38\x88\x1a\x6c\xee\x1f\x4a\
-\x5d\x76\x01\x0c\xe5\x5a\x60\x1b\xd2\x6e\x81\xbb\x82\xb3\x48\x92\
-\x94\xd5\x9d\xa4\xcd\xfd\x5b\x51\xd3\x95\x3f\xd4\x7b\x0b\xc0\xc2\
-\x46\x01\x3b\x02\x5f\x02\xb6\x8c\x8d\x22\x49\xd2\x90\x6e\x01\x8e\
-\x02\xce\x26\xe8\xd4\xbe\x3c\x9a\x52\x00\x16\x18\x45\x3a\x80\xe2\
-\x33\xa4\x63\x04\x24\x49\x8a\xf6\xbf\xc0\xb7\x80\xf3\x48\xfb\xfc\
-\x1b\xa1\x69\x05\x60\x61\xaf\x02\x76\x07\xf6\xc1\x4b\x0d\x4b\x92\
-\xaa\xf5\x30\x69\x16\xbf\x1f\x91\x0e\x60\x6f\x9c\x26\x17\x80\x05\
-\x46\x93\x66\x13\xdc\x8b\xb4\x75\x60\x42\x6c\x1c\x49\x52\x9f\x9a\
-\x4a\xfa\x95\x7f\x26\x70\x29\x30\x2f\x36\x4e\x6f\xfa\xa1\x00\x2c\
-\x6c\x2c\xe9\x82\x0a\xef\x21\x95\x82\x57\x03\x63\x42\x13\x49\x92\
-\x9a\x6a\x0e\xe9\x48\xfe\x3f\x01\x93\x49\xa7\xf1\xcd\x0e\x4d\x54\
-\xa0\x7e\x2b\x00\x8b\x1a\x0f\xbc\x8e\x74\x24\xe6\xa6\x83\x63\x7d\
-\x60\x89\xc8\x50\x92\xa4\xda\x99\x41\xba\x14\xef\xcd\xc0\x8d\xa4\
-\x59\x6a\xaf\x06\x9e\x8f\x0c\x55\xa6\x7e\x2f\x00\xc3\x59\x05\x58\
-\x1b\x58\x15\x98\x04\x2c\x4f\x2a\x0b\x4b\x91\xb6\x22\x48\x92\xfa\
-\xcf\x2c\xd2\x0a\xfd\x39\xd2\xac\xb3\x4f\x90\xf6\xe5\xdf\x03\x3c\
-\x12\x98\x4b\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x29\xbb\xff\x03\xf9\x32\x41\x62\x6e\x85\x96\xa2\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x37\xcf\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x79\x98\x6d\x45\x79\xef\xf1\x6f\x9f\x81\
-\xf9\x1c\xe0\x30\x83\x4c\x02\xca\x8c\x46\x05\x51\xe2\x8c\x31\x6a\
-\xa2\x38\x45\xe3\x40\x62\x9c\xee\x4d\xd4\x18\x35\x5e\xe3\x35\x92\
-\x44\xe3\x3c\xc6\x98\x18\x13\x13\xcd\x8d\x73\x14\xc1\x59\xd4\x38\
-\x81\xc6\xa0\x20\x82\xa0\x20\xf3\x3c\xcf\x9c\xa9\xf7\xfd\xa3\x4e\
-\x6b\xd3\x76\x9f\xb3\xbb\x7b\xd7\xfe\xd5\xde\xeb\xfb\x79\x9e\xf7\
-\x39\xa0\x40\xad\xb7\xd6\x5a\x55\xb5\x6b\xd5\xaa\x35\x81\xa4\x71\
-\xb4\x1c\x38\x10\xb8\x37\x70\xaf\x0d\x7f\xee\x0f\xac\x00\xb6\x06\
-\xb6\xdf\xf0\x27\xc0\xed\xc0\x8d\xc0\x6d\x1b\xe2\x7c\xe0\xbc\x0d\
-\xf1\x33\xe0\x5c\x60\xed\x10\x8f\x5d\xd2\x10\x4c\xa4\x0f\x40\xd2\
-\x40\x2c\xa5\x74\xf8\x0f\x06\x1e\x05\x3c\x1a\xd8\x76\x40\xff\xed\
-\x3b\x80\x53\x81\x53\x80\xef\x02\xdf\xc7\x01\x81\x24\x49\x51\x87\
-\x00\x6f\x02\xae\x02\x7a\x43\x8a\xeb\x81\xf7\x03\xc7\x0c\x21\x3f\
-\x49\x92\xb4\xc1\x0a\xe0\xcf\x80\x9f\x30\xbc\x4e\x7f\xae\x38\x0b\
-\x78\x19\xb0\x4d\xd5\x8c\x25\x49\xea\xb0\x95\xc0\xab\x28\xbf\xc0\
-\xd3\x1d\xff\xcc\xb8\x99\x32\x13\xb1\xaa\x5a\xf6\x92\x24\x75\xcc\
-\x56\xc0\xeb\x81\x5b\xc8\x77\xf4\xfd\x0c\x04\xfe\x7a\xc3\x31\x4b\
-\x92\xa4\x05\xfa\x1d\xe0\x42\xf2\x1d\xfb\x7c\xe3\x32\xe0\x39\x15\
-\xea\x43\x92\xa4\xb1\xb6\x27\x70\x32\xf9\x8e\x7c\xb1\x71\xd2\x86\
-\x5c\x24\x49\xd2\x26\x3c\x1e\xb8\x8e\x7c\xe7\x3d\xa8\xb8\x0e\x78\
-\xdc\x40\x6b\x48\x92\xa4\x31\xb2\x0c\x38\x01\x58\x4f\xbe\xd3\x1e\
-\x74\x4c\x02\xef\x06\x36\x1b\x54\x65\x49\x92\x34\x0e\x56\x01\xdf\
-\x21\xdf\x51\xd7\x8e\x6f\x51\x76\x21\x94\x24\xa9\xf3\x76\x03\xce\
-\x24\xdf\x39\x0f\x2b\xce\xc6\x75\x01\x92\xa4\x8e\x3b\x10\xb8\x98\
-\x7c\xa7\x3c\xec\xb8\x1c\x38\x6c\x00\xf5\x27\x49\xd2\xc8\x39\x08\
-\xb8\x96\x7c\x67\x9c\x8a\x6b\x29\x03\x20\x49\x92\x3a\x63\x0f\xe0\
-\x22\xf2\x9d\x70\x3a\x2e\x05\xf6\x5a\x5c\x55\x4a\x92\x34\x1a\xb6\
-\xa3\x5b\xcf\xfc\x37\x15\x67\xe3\x16\xc2\x92\xa4\x31\xb7\x9c\x6e\
-\xac\xf6\x9f\x6f\x7c\x6b\x43\xdd\x48\x92\x34\x96\xde\x46\xbe\xb3\
-\x6d\x35\xde\xbc\x88\x7a\x95\x24\xa9\x59\x8f\xa5\x6c\x88\x93\xee\
-\x68\x5b\x8d\x49\xe0\x09\x0b\xae\x5d\x49\x92\x1a\xb4\x27\xe3\xb5\
-\xbd\x6f\xad\xb8\x16\xb8\xc7\x02\xeb\x58\x92\xa4\xe6\x9c\x44\xbe\
-\x73\x1d\x95\x38\x71\x81\x75\x2c\x49\x52\x53\x9e\x48\xbe\x53\x1d\
-\xb5\xf8\x9d\x05\xd5\xb4\x24\x49\x8d\xd8\x0a\xf8\x05\xf9\x0e\x75\
-\xd4\xe2\x62\x60\xeb\x05\xd4\xb7\xa4\x3e\x2d\x4d\x1f\x80\x34\xe6\
-\x5e\x07\xfc\x6e\xfa\x20\x46\xd0\xb6\xc0\x3a\xe0\xbf\xc2\xc7\x21\
-\x8d\xad\x89\xf4\x01\x48\x63\x6c\x15\x65\xb7\xbf\x15\xe1\xe3\x18\
-\x55\xb7\x00\xfb\x00\x37\x86\x8f\x43\x1a\x4b\x4b\xd2\x07\x20\x8d\
-\xb1\x97\x60\xe7\xbf\x18\x2b\x81\x3f\x49\x1f\x84\x34\xae\x9c\x01\
-\x90\xea\xd8\x9a\xf2\xeb\x7f\xc7\xf0\x71\x8c\xba\x1b\x28\xb3\x00\
-\xb7\x86\x8f\x43\x1a\x3b\xce\x00\x48\x75\xbc\x10\x3b\xff\x41\x58\
-\x05\x3c\x2f\x7d\x10\x92\x24\xf5\xeb\xc7\xe4\x57\xd2\x8f\x4b\xfc\
-\x64\x9e\x75\x2f\x49\x52\xc4\xfd\xc8\x77\x9a\xe3\x16\xf7\x99\xd7\
-\x19\x90\xb4\x49\x3e\x02\x90\x06\xef\xd9\xe9\x03\x98\xc5\x7a\xe0\
-\xdb\xc0\x2b\x80\xa3\x81\x5d\x80\xcd\x36\xc4\x2e\x1b\xfe\xb7\x57\
-\x52\xbe\x54\xb8\x3e\x74\x8c\x1b\xf3\x9c\xf4\x01\x48\x92\xb4\x31\
-\x4b\x81\xab\xc9\xff\x62\x9e\x8a\x3b\x28\x5f\xd9\xdb\x79\x1e\x39\
-\xec\x0c\xbc\x05\xb8\xb3\x81\xe3\x9f\x8a\x2b\xf1\x07\x8b\x24\xa9\
-\x61\xf7\x27\xdf\x59\x4e\xc5\x27\x29\x1f\x21\x5a\xa8\xbd\x80\x4f\
-\x37\x90\xc7\x54\xdc\x77\x11\xb9\x48\x92\x54\xd5\xab\xc8\x77\x94\
-\x93\xc0\x09\x0c\xe6\x35\xdf\x89\x0d\x39\xad\x6f\x20\xaf\x97\x0f\
-\x20\x1f\x49\x92\xaa\xf8\x22\xd9\x4e\x72\x3d\xf0\xf4\x0a\x79\xfd\
-\x3e\x65\x60\x91\xcc\xed\xf3\x15\xf2\x92\x24\x69\xd1\x96\x03\xb7\
-\x91\xed\x24\xff\xa2\x62\x7e\xaf\x0d\xe7\x76\x0b\xa5\x8e\x25\x49\
-\x6a\xca\x61\x64\x3b\xc8\x4f\x52\x77\x77\xcf\x09\xf2\x6b\x02\x0e\
-\xa9\x98\x9f\x24\x49\x0b\xf2\x14\x72\x1d\xe3\x9d\x2c\x6e\xc1\x5f\
-\xbf\xf6\xa0\xbc\x59\x90\xca\xf3\xb8\xfa\x29\x4a\xdd\xe0\x6b\x35\
-\xd2\xe0\xdc\x3b\x58\xf6\xbb\x81\x4b\x87\x50\xce\xe5\xc0\xdf\x0f\
-\xa1\x9c\xb9\x24\xeb\x58\x92\xa4\x59\x7d\x88\xcc\xaf\xe2\x75\xcc\
-\xef\x3d\xff\xc5\xda\x85\xdc\x5b\x01\xff\x3a\x84\xfc\xa4\x4e\x70\
-\x06\x40\x1a\x9c\x7b\x86\xca\x3d\x15\xb8\x66\x88\xe5\x5d\x0d\x9c\
-\x36\xc4\xf2\xa6\x4b\xd5\xb1\x34\x76\x1c\x00\x48\x83\xb3\x5d\xa8\
-\xdc\x13\x03\x65\x7e\x36\x50\x26\xc0\xb6\xa1\x72\xa5\xb1\xe3\x00\
-\x40\x1a\x9c\x15\xa1\x72\x4f\xed\x48\x99\x00\x2b\x43\xe5\x4a\x63\
-\xc7\x01\x80\x34\x38\xdb\x84\xca\xbd\x20\x50\xe6\xf9\x81\x32\x21\
-\x37\xc8\x92\xc6\x4e\xcd\x77\x86\xa5\xae\x59\x4d\xf9\xba\xde\xb0\
-\x6d\x0e\xac\x09\x94\x79\xd7\x90\xcb\x84\x52\xc7\x5b\x04\xca\x95\
-\xc6\x8e\x03\x00\x69\x70\x7a\xa1\x72\x53\xf7\x71\xd7\xf2\x95\xc6\
-\x8a\x8f\x00\x24\x49\xea\x20\x07\x00\x92\x24\x75\x90\x03\x00\x49\
-\x92\x3a\xc8\x01\x80\x24\x49\x1d\xe4\x00\x40\x92\xa4\x0e\x5a\x96\
-\x3e\x00\x6d\xd2\xa1\xc0\xbe\xc0\xae\xc0\x2a\xe0\x06\xe0\x2a\xe0\
-\x42\xe0\x27\xc1\xe3\x92\xa4\x09\xca\x67\xb0\xf7\x01\x76\xa3\xec\
-\x86\x79\x23\xa5\x8d\xfa\x05\xb6\x51\xd2\xbc\x3d\x00\x78\x1f\x70\
-\x31\x1b\xff\x30\xca\xc5\xc0\x3f\x00\x47\x66\x0e\x53\x33\xa4\x3e\
-\x91\x9b\xd2\xb5\x7c\xf5\x2b\x0f\x04\xfe\x91\xf2\x05\xca\x4d\xb5\
-\x51\xef\xa3\xb4\x69\x92\x36\xe2\x20\xe0\x13\xc0\x24\xf3\x6f\x14\
-\xbf\x0a\x1c\x31\xfc\x43\xd6\x34\x5d\xeb\x10\xbb\x96\xaf\xe0\x60\
-\x6c\xa3\xa4\x81\x9a\x00\x5e\x0d\xac\x65\x71\x0d\xe3\x5a\xe0\x2f\
-\x70\xa3\x94\x94\xae\x75\x88\x5d\xcb\xb7\xcb\x96\x00\xaf\x65\xf1\
-\x6d\xd4\x1a\xe0\x55\xd8\x46\x49\x00\x2c\x07\xfe\x9d\xc1\x36\x90\
-\xff\xb1\xe1\xbf\xab\xe1\xea\x5a\x87\xd8\xb5\x7c\xbb\x6a\x33\xe0\
-\xa3\x0c\xf6\x1c\x7e\x18\xdb\x28\x75\xdc\x12\xe0\x23\xd4\x69\x24\
-\x3f\x8a\x6f\x79\x0c\x5b\xd7\x3a\xc4\xae\xe5\xdb\x45\x13\xc0\x87\
-\xa8\x73\x1e\xff\x13\x17\xa2\xab\xa3\x26\x80\x7f\xa1\x6e\x43\xf9\
-\x9a\xa1\x65\x23\xe8\x5e\x87\xd8\xb5\x7c\xbb\xe8\x2f\xa9\x7b\x2e\
-\xff\x0d\x7f\xa8\xa8\x83\xde\x43\xfd\x86\x72\x2d\xe5\x35\x42\x0d\
-\x47\xd7\x3a\xc4\xae\xe5\xdb\x35\x87\xb3\xf8\x67\xfe\xfd\xc4\x7b\
-\x86\x95\x90\xd4\x82\xbf\x65\x78\x8d\xe5\x89\x43\xca\x49\xdd\xeb\
-\x10\xbb\x96\x6f\xd7\x9c\xcc\xf0\xce\xe9\x3b\x86\x94\x93\xa6\x71\
-\x25\xe6\xf0\xbd\x06\x78\xfd\x90\xcb\x7c\x20\xf0\xfd\x21\x97\xd9\
-\x45\xa9\xce\xe9\x89\x94\x4d\xa2\x76\xd8\xf0\xe7\x8e\xd3\xfe\x7e\
-\x05\xb0\x12\x58\x4a\x99\x6a\xdd\x76\xc3\xbf\xb3\x19\xb0\xf5\x86\
-\xbf\xbe\x9d\xb2\x3a\x1b\xe0\x66\xca\x2b\x5e\xeb\x81\x5b\x80\x5b\
-\x81\xeb\x29\x1b\x50\x5d\xb7\xe1\xcf\xa9\xbf\x4f\x0d\x2e\x6d\xb7\
-\xea\x3b\x1a\x38\x75\xc8\x65\xbe\x86\xf2\xe3\x48\x1a\x4b\x2f\x26\
-\xf3\x8b\xe9\x1f\x87\x91\x9c\x62\xbf\x88\xbb\x16\xaa\xef\x03\x64\
-\xce\xed\xcb\x87\x91\x9c\x34\x6c\x7f\xc0\xc2\x36\xcf\x18\x44\x5c\
-\x8e\xbf\x9a\x86\x21\xdd\x31\x76\x25\x54\xd7\x04\x70\x19\x99\x73\
-\x3b\x09\xbc\xa0\x7e\x8a\xd2\xf0\x3c\x83\x32\xa5\x9a\x6c\x34\x0f\
-\xab\x9e\xa5\xd2\x1d\x63\x57\x42\x75\x1d\x41\xf6\xfc\xae\x03\x9e\
-\x5e\x3d\x4b\xf9\xfa\xc5\x10\x3c\x8c\x36\x5e\x75\xd9\x2f\x5c\xbe\
-\xa4\xd1\xb0\x7f\xb8\xfc\xa5\x94\x8d\x82\x8e\x0d\x1f\xc7\xd8\x4b\
-\x77\x4a\xe3\xee\x60\xe0\x33\x94\x05\x57\x69\xbb\xa5\x0f\x40\xd2\
-\x48\xd8\x35\x7d\x00\x94\x5d\x02\x3f\x45\x79\x15\x51\x95\x38\x00\
-\xa8\x67\x37\xe0\x8b\x94\xcf\x63\xb6\x60\x55\xfa\x00\xc6\xdc\xc1\
-\xe9\x03\xe8\x10\xeb\xba\xae\x56\xda\xac\x95\xc0\x49\xb4\x31\x20\
-\x19\x4b\x0e\x00\xea\xd8\x92\xf2\xcb\x7f\xaf\xf4\x81\x4c\x73\x7d\
-\xfa\x00\xc6\xd0\x21\xc0\x09\xc0\xd9\x1b\x42\xc3\x71\x36\x70\x01\
-\xf0\x6e\xe0\x18\x5c\xe0\x3a\x68\x37\xa6\x0f\x60\x9a\xbd\x81\xcf\
-\xf1\xab\x57\x56\xa5\xa6\x2d\xa1\x74\xfe\xe9\x85\x52\x33\xe3\x09\
-\x35\x93\xee\x90\xfb\x00\x6f\xa1\x74\x40\xe9\x73\x6a\x94\x38\x1f\
-\x78\x33\x7e\x6a\x76\x50\x9e\x44\xfe\x9c\xce\x8c\xcf\x51\xd6\x06\
-\x48\x4d\x1b\xc6\x16\xbf\x0b\x09\xdf\x02\x58\xb8\x55\x94\x57\x93\
-\x4e\x27\x7f\x1e\x8d\x8d\xc7\xd9\x94\xcf\xcd\xee\x32\xeb\x99\x54\
-\x3f\xd2\x6f\x01\xcc\x15\xef\xaa\x99\xb4\xb4\x58\x7f\x4a\xfe\x26\
-\x99\x2d\xdc\x07\x60\xfe\x96\x03\x4f\xa6\x6c\x87\x3a\x8c\xfd\xd0\
-\x8d\xc1\xc6\x1a\xca\xf3\xe3\x27\xe1\x67\x67\xe7\x2b\xb9\x0f\xc0\
-\xa6\xe2\x25\x15\xf3\x96\x16\xec\x71\x94\xf7\x57\xd3\x37\xc8\x6c\
-\xf1\x0f\x15\xf3\x1e\x37\xbb\x52\x7e\x41\x5e\x42\xfe\xbc\x19\x83\
-\x89\x2b\x81\x37\x01\x7b\xa2\x7e\xfd\x13\xf9\xf3\x36\x5b\xac\xa7\
-\x6c\x7d\x2d\x35\xe3\xbe\xc0\x6d\xe4\x6f\x8e\xb9\xe2\x81\xf5\x52\
-\x1f\x1b\xf7\xa3\xbc\x7b\xbc\x86\xfc\xf9\x32\xea\xc4\x3a\xca\x8c\
-\xce\xa3\x70\x46\x6c\x53\x8e\x26\x7f\xbe\xe6\x8a\xdb\x28\x6b\x71\
-\xa4\xb8\xed\x69\x7b\x41\x98\x5f\x03\x9c\xdb\x72\xe0\x39\xc0\x59\
-\xe4\xcf\x93\x31\xdc\x38\x13\x78\x26\xb0\x0c\xcd\x65\x98\x5f\x03\
-\x9c\x6f\x5c\x44\xf9\xd8\x95\x14\xb3\x84\xf2\xae\x7f\xfa\x66\x98\
-\x2b\xd6\x02\x87\x56\xcb\x7e\x74\x6d\x0d\xbc\x14\xb8\x98\xfc\x39\
-\x32\xb2\x71\x11\xe5\x5a\xf0\x35\xb3\x5f\x77\x38\xed\x3e\xd6\xec\
-\x01\x9f\xc7\x57\xd9\x15\xf4\xd7\xe4\x6f\x82\x8d\xc5\x6b\xea\xa5\
-\x3e\x92\x56\x51\xde\xdb\xbf\x8e\xfc\xb9\x31\xda\x8a\x6b\x81\xbf\
-\xa4\xcc\xe8\xe9\x57\xfe\x92\xfc\xb9\xd9\x58\xbc\xae\x5e\xea\xd2\
-\xdc\x1e\x4f\xfe\x03\x3f\x1b\x8b\x8f\xe1\xe8\x78\xca\x36\x94\x85\
-\x7d\x37\x92\x3f\x2f\x46\xdb\x71\x0b\x65\xc1\xe0\xb6\x08\xca\x5a\
-\x89\x0f\x93\x3f\x2f\x73\xc5\x7a\xe0\xb1\xd5\xb2\x97\x66\xb1\x1f\
-\x70\x03\xf9\x8b\x7f\xae\xf8\x22\x6d\x7c\x7f\x20\x6d\x6a\xaa\xff\
-\x6a\xf2\xe7\xc4\x18\xad\xb8\x8e\x32\x5b\xb4\x12\x6d\x46\xdb\x8f\
-\x3a\xaf\x07\xf6\xad\x96\xbd\x34\xcd\x16\xb4\xbd\x21\xcc\x77\xf0\
-\x79\xe6\x66\x94\x3d\x19\xec\xf8\x8d\xc5\xc6\x55\xc0\x9f\xe0\x5e\
-\x02\x5b\x02\xdf\x20\x7f\x3e\xe6\x8a\x33\x80\xad\xaa\x65\x2f\x6d\
-\xf0\xaf\xe4\x2f\xf6\xb9\xe2\x7b\xc0\x8a\x7a\xa9\x8f\x84\x47\x01\
-\x3f\x21\x7f\x2e\x8c\xf1\x8a\xf3\x80\xa7\xd2\x6d\x5b\x03\xdf\x26\
-\x7f\x2e\xe6\x8a\xff\x57\x2f\x75\x09\xfe\x98\xfc\x45\x3e\x57\x9c\
-\x49\xb7\xbf\xf8\x77\x10\xf0\x05\xf2\xe7\xc1\x18\xef\xf8\x1a\xdd\
-\xfe\xe6\xc0\xb6\xb4\x3d\x03\xfa\xa2\x7a\xa9\xab\xcb\x7e\x03\x58\
-\x4d\xfe\x02\x9f\x2d\xce\x01\x76\xae\x97\x7a\xd3\x76\x04\x3e\x40\
-\xdb\xaf\x2b\x19\xe3\x15\xeb\x80\xf7\xd3\xdd\xf7\xd0\x77\x06\xce\
-\x25\x7f\x1e\x66\x8b\xbb\x70\x93\x20\x0d\xd8\x16\xb4\xbb\x59\xcc\
-\xc5\xb4\xf5\xd9\xe1\x61\x99\xa0\x6c\xe2\x73\x0d\xf9\x73\x60\x74\
-\x33\x6e\xa0\x7c\x24\xaa\x8b\xbb\x0a\xee\x01\xfc\x82\xfc\x39\x98\
-\x2d\xce\xa1\xac\x59\x90\x06\xe2\xef\xc9\x5f\xd4\xb3\xc5\x65\x74\
-\x73\xf5\xeb\xbd\x80\x53\xc8\xd7\xbf\x61\xf4\x80\x6f\x01\x87\xd0\
-\x3d\x7b\xd1\xee\x66\x5a\xef\xae\x98\xb7\x3a\xe4\xb1\xc0\x24\xf9\
-\x0b\x7a\x66\xdc\x40\x79\xee\xdd\x25\x5b\x02\x6f\xc4\xfd\xfa\x8d\
-\xf6\x62\x35\xf0\x7a\xca\x6c\x61\x97\x1c\x42\x9b\xfb\x6b\x4c\x02\
-\x8f\xa9\x98\xb7\x3a\x60\x27\xca\x97\xc4\xd2\x17\xf3\xcc\x58\x03\
-\x3c\xb2\x62\xde\x2d\x3a\x12\xf8\x29\xf9\xba\x37\x8c\x8d\xc5\xd9\
-\xc0\x03\xe8\x96\x87\xd2\xe6\xfa\xa8\xab\x81\x5d\x2a\xe6\xad\x31\
-\xf7\x59\xf2\x17\xf1\xcc\x98\x04\x8e\xaf\x99\x74\x63\x96\x53\x76\
-\xf1\xf3\x57\xbf\x31\x2a\xb1\x96\xb2\x9b\xe0\xe6\x74\xc7\x1f\x92\
-\xaf\xf7\xd9\xc2\x8f\xa1\x69\x41\x5e\x48\xfe\xe2\x9d\x2d\x4e\xa8\
-\x98\x73\x6b\x0e\x03\x7e\x48\xbe\xce\x0d\x63\x21\x71\x16\xe5\x33\
-\xd3\x5d\xf1\x7a\xf2\x75\x3e\x5b\x3c\xaf\x66\xd2\x1a\x3f\xfb\x01\
-\xb7\x92\xbf\x70\x67\xc6\xc7\xe8\xc6\x8a\xe3\x25\xf8\xab\xdf\x18\
-\x8f\x58\x03\xfc\x39\xdd\xb8\x6f\x27\x80\x7f\x27\x5f\xe7\x33\xe3\
-\x36\xca\xc2\x61\x69\x93\x96\x51\x76\xd4\x4b\x5f\xb4\x33\xe3\x5b\
-\x74\x63\x4a\x71\x67\xdc\xd0\xc7\x18\xbf\x38\x05\xd8\x8d\xf1\xb7\
-\x19\xf0\x75\xf2\xf5\x3d\x33\xfe\x07\xb7\x73\xfe\x35\x5d\x18\x95\
-\xce\xd7\x5f\x02\x7f\x95\x3e\x88\x19\xce\x03\x1e\x44\x59\xf9\x3f\
-\xce\x7e\x8b\xf2\xe5\xb1\xae\x6e\x6a\xb4\x10\x6b\x81\x4b\x28\xdf\
-\xb5\xbf\x94\xf2\x61\x94\xeb\x29\x9f\xb7\xbd\x9e\xf2\x51\x9b\xeb\
-\x29\x1b\xa4\x40\x59\xb1\x0d\xe5\x97\xe9\xed\x1b\xfe\x7a\x6b\x7e\
-\xf5\xf1\xa8\xa9\xcf\xe1\x6e\x41\xd9\x64\x69\x87\x0d\xb1\xd3\x86\
-\x3f\x77\x04\xee\x41\x79\xfd\x74\x4f\x6c\x54\xe7\xe3\x2a\xca\xde\
-\x15\x5f\x4d\x1f\x48\x65\x3b\x00\xa7\x01\x07\xa4\x0f\x64\x86\xd7\
-\x52\x1e\x53\x68\x03\x07\x00\x77\x77\x10\xf0\x23\xda\xfa\xa5\x7d\
-\x03\x65\x05\xfc\x05\xe9\x03\xa9\x68\x39\xf0\x06\xe0\x15\x78\x4d\
-\xce\xe5\x62\xca\x33\xe5\xb3\x28\xbb\xb0\x5d\xb4\x21\x2e\xa7\x7c\
-\x12\x35\x61\x29\x65\x43\x98\x7d\x81\x7d\x80\x03\x29\xeb\x36\x0e\
-\xa3\x9b\x9b\x53\xf5\x63\x12\x78\x0b\xa5\x33\x5a\x17\x3e\x96\x9a\
-\x0e\x00\xbe\xcf\xaf\x06\x94\x2d\x98\xda\x25\xf0\xbc\xf4\x81\xa8\
-\x3d\x13\x94\x7d\xbe\xd3\x53\x55\xd3\x63\x3d\xf0\xdb\x35\x93\x6e\
-\xc0\x2e\xc0\x37\xc9\xd7\x75\x4b\xf1\x53\xe0\x83\x94\x6f\x4f\xfc\
-\x26\xb0\xdd\x82\x6b\x37\x67\x3b\xe0\x21\x94\x1c\x3e\x48\xbb\x5b\
-\xc7\xa6\xe2\xeb\x94\x59\x95\x71\x76\x2c\xed\x6d\xd1\xfd\x4d\xfc\
-\x91\xa1\x59\xb4\xb8\xea\xff\xb5\x55\x33\xce\x3b\x92\x32\x6d\x9d\
-\xae\xe7\x64\xdc\x45\xf9\x84\xf3\x9b\x81\xdf\xa5\x4c\xb1\x8f\xab\
-\x9d\x80\x27\x00\x6f\x05\xbe\x4b\x9b\xef\x8e\x0f\x33\x2e\x66\xfc\
-\xdf\x12\x38\x81\x7c\x3d\xcf\x8c\x3f\xaa\x99\xb0\x46\xcf\xae\x94\
-\xa9\xf6\xf4\x85\x39\x3d\x4e\xa6\xac\x86\x1f\x57\xcf\x02\xee\x20\
-\x5f\xcf\x89\xf8\x05\xe5\x63\x32\x4f\x05\x56\x2e\xb6\x22\x47\xd8\
-\x56\x94\xcf\x37\xbf\x89\xee\x6e\xf2\x74\x17\xf0\xdc\xc5\x56\x64\
-\xc3\x96\x00\x9f\x27\x5f\xcf\xd3\xe3\x26\x60\xf7\x9a\x49\x6b\xb4\
-\x7c\x8a\xfc\x45\x39\x3d\x2e\x64\x7c\xbf\x34\xb6\x8c\x76\xbf\xad\
-\x50\x2b\xd6\x51\xa6\x7c\xff\x14\xb8\xf7\xe2\xab\x70\x6c\x1d\x04\
-\xfc\x19\xf0\x0d\xca\xe3\xaf\xf4\x79\x1b\x66\xbc\x9b\xb2\xa6\x62\
-\x1c\x6d\x4f\x59\xc3\x94\xae\xe3\xe9\xf1\xd1\xaa\x19\x6b\x64\x3c\
-\x96\xfc\xc5\x38\x3d\xee\xa4\x7c\x7a\x78\x1c\x6d\x03\x7c\x8e\x7c\
-\x1d\x0f\x23\xd6\x53\xa6\xf6\x5f\x4a\x37\x5e\xff\x1a\xb4\x1d\xf9\
-\xd5\x8a\xf9\xae\x0c\x06\xbe\xcc\xf8\xce\x08\x1d\x41\x79\xeb\x24\
-\x5d\xc7\xd3\xe3\x77\xab\x66\xac\xe6\xad\xa0\xbc\x42\x95\xbe\x10\
-\xa7\xc7\x1f\xd4\x4c\x38\x68\x2f\xda\xfd\xa4\xf2\x20\xe3\x47\x94\
-\x5f\xfa\x7b\x0c\xa6\xda\x44\x79\xdd\xf0\x65\xc0\x19\xe4\xcf\x6f\
-\xed\x38\x83\xf2\x9a\xe5\x38\x7a\x16\xf9\xfa\x9d\x1e\x17\x53\x7e\
-\x94\xa8\xa3\xfe\x8e\xfc\x45\x38\x3d\xde\x5b\x37\xdd\x98\x23\x18\
-\xef\xc5\x7e\xb7\x50\xf6\x2f\x78\xd4\xa0\x2a\x4c\x73\xba\x1f\x65\
-\xfd\xc4\x2d\xe4\xcf\x7b\xad\xb8\x82\xf1\x5d\x1c\xf8\x8f\xe4\xeb\
-\x77\x7a\xbc\xa3\x6e\xba\x6a\xd5\x91\xb4\x35\xb5\xd8\xda\xfe\x03\
-\x83\xf2\x3b\x94\xad\x38\xd3\xf5\x5b\x23\x7e\x00\x3c\x1f\x7f\x45\
-\x24\xac\x00\x5e\x40\xd9\xe1\x2d\x7d\x1d\xd4\x88\x5b\x19\xcf\x57\
-\x80\x37\x07\xce\x24\x5f\xbf\x53\xb1\x8e\xf1\x1d\x6c\x69\x0e\x13\
-\x94\xe7\xb3\xe9\x8b\x6f\x2a\xee\xa2\x6c\x9e\x32\x6e\x7e\x9f\xf1\
-\xdb\xcf\x7f\x3d\xe5\x0d\x0d\x7f\xed\xb7\xe3\x7e\x94\x19\x98\xd6\
-\xde\x39\x5f\x6c\xac\x65\x3c\xbf\xfc\x79\x08\x6d\xbd\x01\x74\x2a\
-\xee\x0d\xd0\x29\xcf\x20\x7f\xd1\x4d\x8f\x17\xd7\x4d\x37\xe2\x7f\
-\xd3\xd6\x0c\xcb\x62\xe3\x2e\x4a\x27\x73\xd0\x20\x2b\x49\x03\xb5\
-\x1f\x65\x35\x7d\x6b\x8b\xcd\x16\x13\x93\x94\x85\xa4\xe3\xe6\x65\
-\xe4\xeb\x76\x7a\x3c\xa5\x6e\xba\x6a\xc5\x16\x94\x2d\x54\xd3\x17\
-\xdc\x54\x7c\x85\xf1\x1b\x7d\xbe\x96\x7c\xbd\x0e\x2a\x6e\x01\xfe\
-\x86\xf1\xde\xa0\x67\xdc\xec\x44\xd9\x5a\xba\xc5\x2f\x7a\x2e\x34\
-\x5e\x3d\xd0\x1a\xca\x9b\xa0\xad\x8f\x7e\xfd\x82\xd2\x37\x68\xcc\
-\xbd\x86\xfc\xc5\x36\x15\xd7\x32\x5e\xaf\x88\x4d\x00\x6f\x27\x5f\
-\xaf\x83\x88\xdb\x29\x7b\xb6\xdb\xf1\x8f\xae\x9d\x80\xb7\xd1\xd6\
-\x74\xf3\x62\xe2\x2d\x83\xad\x9e\xb8\xdd\x29\x1f\xab\x4a\xd7\xeb\
-\x54\xbc\xaa\x6e\xba\x4a\xdb\x05\xb8\x99\xfc\x85\x36\x15\x4f\xad\
-\x9b\xee\xd0\xbd\x99\x7c\x9d\x2e\x36\x56\x53\x56\x99\x8f\xd3\xc0\
-\xac\xeb\x76\xa2\xec\x36\x78\x27\xf9\xeb\x6b\xb1\xf1\xce\x01\xd7\
-\x4d\xda\x71\xe4\xeb\x74\x2a\x6e\xa1\xec\x0a\xab\x31\xf5\x2f\xe4\
-\x2f\xb2\xa9\xf8\x40\xe5\x5c\x87\xed\x9d\xe4\xeb\x74\x31\x31\x09\
-\x7c\x84\xf2\xce\xb9\xc6\xd3\xde\xc0\xc7\xc9\x5f\x6b\x8b\x8d\xb7\
-\x0e\xba\x62\xc2\x3e\x48\xbe\x4e\xa7\xe2\xfd\x95\x73\x55\xc8\x7d\
-\x68\x67\x51\xda\xcf\x19\xaf\x57\xc7\xde\x48\xbe\x4e\x17\x13\xa7\
-\x53\xbe\xba\xa7\x6e\x38\x92\xf2\xbd\xfa\xf4\x75\xb7\x98\x78\xfb\
-\xc0\x6b\x25\x67\x05\xed\x6c\x15\xbc\x0e\x38\xbc\x6e\xba\x4a\xf8\
-\x2a\xf9\x8b\xab\x47\xf9\xa5\xf9\xc8\xca\xb9\x0e\xd3\xdf\x92\xaf\
-\xd3\x85\xc6\x15\x94\x77\xc9\xc7\x75\x0f\x76\xcd\x6d\x82\xb2\xd5\
-\xf0\x95\xe4\xaf\xc3\x85\xc6\xdb\x06\x5e\x2b\x39\x0f\xa5\xb4\x8d\
-\xe9\x3a\xed\x51\x3e\x0b\xaf\x31\xd2\xd2\x73\xa6\x71\x9a\xfa\xff\
-\x2b\xf2\xf5\xb9\x90\x58\x4f\xd9\x05\x72\xc5\xe0\xab\x44\x23\x66\
-\x5b\xe0\x7d\xb4\xd3\xf9\xcc\x37\x5e\x33\xf8\x2a\x89\xf9\x57\xf2\
-\xf5\x39\x15\xbf\x53\x39\x57\x0d\xc9\x52\xda\xf9\xd4\xe8\x95\x94\
-\x2f\x63\x8d\x83\xff\x4d\xbe\x3e\x17\x12\x3f\x03\x1e\x36\xf8\xea\
-\xd0\x88\x7b\x30\x70\x0e\xf9\xeb\x73\x21\xf1\x92\x0a\xf5\x91\xb0\
-\x03\x70\x35\xf9\xfa\xec\x01\x3f\x61\xbc\x3f\xc7\xde\x19\xcf\x24\
-\x7f\x31\x4d\xc5\xd3\x2a\xe7\x3a\x2c\xcf\xa0\x9d\xf5\x14\xfd\xc6\
-\x1a\xca\x4a\xf0\x71\xdc\x6e\x59\x83\xb1\x9c\xf2\x2a\xd8\x6a\xf2\
-\xd7\xeb\x7c\x62\x3d\xf0\x7b\x15\xea\x23\xa1\xa5\xf6\x7a\x5c\xea\
-\xb4\xb3\x5a\xfa\xf5\xff\x85\xca\xb9\x0e\xcb\x63\x18\xbd\xed\x7d\
-\x7f\x08\x1c\x5a\xa3\x32\x34\x96\x0e\x67\xf4\xbe\x3c\xb8\x1a\x38\
-\xb6\x46\x65\x04\x9c\x4c\xbe\x3e\x7b\x94\x19\x21\x67\x01\x46\xd8\
-\xb3\xc9\x5f\x44\x3d\xca\xc7\x70\xf6\xad\x9c\xeb\x30\x1c\xc5\x68\
-\x7d\xd8\x67\x3d\x65\xf3\x94\xcd\x6a\x54\x86\xc6\xda\xe6\x94\x2f\
-\xc5\x8d\xd2\xda\x80\x5b\x81\xfb\xd7\xa8\x8c\x21\xdb\x9b\x76\x76\
-\x71\x7c\x46\xe5\x5c\x55\xc9\x52\xe0\x5c\xf2\x17\x50\x8f\xf1\x78\
-\x46\xb7\x37\x70\x15\xf9\xba\xec\x37\xae\x64\x3c\xbf\xa6\xa6\xe1\
-\x7a\x24\x70\x19\xf9\xeb\xb9\xdf\xb8\x02\xd8\xab\x4a\x4d\x0c\xd7\
-\x2b\xc8\xd7\x65\x8f\xb2\x66\x68\x59\xe5\x5c\x55\xc1\xf1\xe4\x2f\
-\x9e\x1e\xf0\x7d\x46\xff\x35\xb3\x95\xc0\x59\xe4\xeb\xb2\xdf\xf8\
-\x14\xb0\xaa\x4a\x4d\xa8\x8b\x76\x04\x4e\x24\x7f\x5d\xf7\x1b\x67\
-\x30\xfa\x6f\xb8\x2c\xa3\xec\xcf\x91\xae\xcb\x1e\x65\x5d\x82\x46\
-\xc8\x52\xe0\x3c\xf2\x17\xce\x24\x65\xd3\x91\x51\xb6\x94\x76\x9e\
-\xc9\x6d\x2a\xd6\xe2\x7e\xde\xaa\xe7\x05\x8c\xce\xfa\x97\x2f\x30\
-\xfa\xbf\x5c\x1f\x48\x1b\x8f\x60\x9c\x05\x18\x31\x7f\x48\xfe\xa2\
-\xe9\x01\x1f\xaa\x9d\xe8\x10\xbc\x97\x7c\x3d\xf6\x13\xd7\x30\x5e\
-\x1b\x2c\xa9\x4d\x0f\x61\x74\x36\x0f\x7a\x57\xa5\x3a\x18\xa6\x8f\
-\x92\xaf\xc7\x1e\xf0\xac\xda\x89\x6a\x30\x96\x52\x46\x6c\xe9\x0b\
-\xe6\x0e\x46\xff\x59\xdc\x0b\xc9\xd7\x63\x3f\x71\x2a\xb0\x47\xa5\
-\x3a\x90\x66\xda\x93\xf2\x68\x2f\x7d\xdd\xf7\x13\xcf\xab\x54\x07\
-\xc3\x72\x0f\xca\x97\x39\xd3\xf5\xf8\x73\x9c\x05\x18\x09\xcf\x25\
-\x7f\xb1\xf4\x80\x13\x2a\xe7\x59\xdb\x51\xc0\x5d\xe4\xeb\x71\x53\
-\xf1\x7e\x5c\xe5\xaf\xe1\xdb\x9c\xb6\x3e\x2e\x36\x57\xdc\x09\x3c\
-\xa0\x52\x1d\x0c\xcb\x1b\xc8\xd7\x63\x8f\xb2\x75\xb4\x1a\x36\x41\
-\x1b\xbb\x79\x5d\x06\x6c\x5d\x39\xd7\x9a\x76\x00\x2e\x24\x5f\x8f\
-\x1b\x8b\x49\x46\x7f\x90\xa5\xd1\xf7\x52\xda\xdf\x14\xeb\x12\xca\
-\x27\x91\x47\xd5\x36\x94\xb7\x1b\xd2\xf5\xf8\x13\x4a\x1f\xa3\x46\
-\x3d\x8e\xfc\x45\xd2\xa3\xec\x3f\x30\xaa\x96\x02\x5f\x26\x5f\x87\
-\x1b\x8b\xbb\xf0\xfd\x5c\xb5\xe3\x29\x94\x47\x7e\xe9\xfb\x62\x63\
-\xf1\x35\x46\xfb\x6d\xa4\x56\x66\x76\x7f\xab\x76\xa2\x5a\xb8\x53\
-\xc8\x5f\x20\x3f\x64\xb4\x77\x8f\x7a\x33\xf9\x3a\xdc\x58\x5c\x03\
-\x1c\x5d\x2d\x7b\x69\x61\x8e\x01\xae\x23\x7f\x7f\x6c\x2c\xde\x58\
-\x2d\xfb\xfa\x96\x00\xff\x43\xbe\x0e\xbf\x54\x3b\x51\x2d\xcc\xa1\
-\xb4\xf1\xca\xc8\x28\x7f\x57\xfe\xb7\x69\xa3\x0e\xe7\x8a\xf3\x81\
-\xfd\xaa\x65\x2f\x2d\xce\xbd\x68\xfb\xd1\xd9\x24\x65\x2b\xef\x51\
-\xf5\x30\xf2\x75\xd8\xa3\x6c\x15\xad\xc6\x7c\x90\xfc\x85\x71\x62\
-\xf5\x2c\xeb\xd9\x99\xb6\x5f\x6f\xfa\x29\xae\xf4\x57\xfb\x76\xa3\
-\x3c\x2b\x4e\xdf\x2f\x73\xc5\xd5\xc0\xae\xd5\xb2\xaf\xef\x73\xe4\
-\xeb\xf0\x9f\xab\x67\xa9\x79\xd9\x99\xb2\xda\x35\x79\x51\x4c\x32\
-\xba\xfb\x70\x4f\xd0\xc6\x8d\x35\x57\xfc\x88\xd1\x5e\xc4\xa4\x6e\
-\xd9\x99\xb6\x3f\x26\xf4\x25\x46\x77\x31\xdb\x6f\x90\x9f\xa5\xbc\
-\x8b\xd1\x1e\x44\x8d\x9d\xbf\x26\x7f\x53\x7d\xba\x7a\x96\xf5\xbc\
-\x92\x7c\xfd\xcd\x15\x3f\xa0\xbc\x95\x20\x8d\x92\xed\x80\xd3\xc8\
-\xdf\x3f\x73\xc5\x9f\xd5\x4b\xbd\xba\x93\xc8\xd7\xdf\xeb\xaa\x67\
-\xa9\xbe\x6c\x4e\xfe\x23\x35\x93\xc0\x11\xb5\x13\xad\xe4\xfe\xb4\
-\xfb\xfd\xf3\x6f\x32\xfa\x7b\x9a\xab\xbb\x56\x02\xdf\x26\x7f\x1f\
-\xcd\x16\xab\x29\xbf\xa6\x47\x51\x0b\xb3\x00\x57\x03\x5b\xd4\x4e\
-\x54\x9b\xf6\x7c\xf2\x37\xd3\xa7\xaa\x67\x59\xc7\xe6\xb4\xfb\xbc\
-\xf2\x7b\xd8\xf9\x6b\xf4\xad\x04\xfe\x9b\xfc\xfd\x34\x5b\x9c\xc3\
-\xe8\x76\x62\x9f\x25\x5f\x7f\x7f\x54\x3d\x4b\x6d\xd4\x04\xf9\x0e\
-\x6c\x3d\x70\x58\xed\x44\x2b\x69\xf5\x95\xbf\x33\xf1\x6b\x7e\x1a\
-\x1f\xdb\x51\x5e\x0f\x4e\xdf\x57\xb3\xc5\x1b\x2a\xe6\x5d\xd3\x7d\
-\xc9\xcf\x02\x9c\xc5\xe8\xae\xa5\x18\x0b\x0f\x21\x7f\x03\x7d\xa2\
-\x7a\x96\x75\x1c\x05\xac\x23\x5f\x7f\x33\xe3\x3c\x5c\x60\xa3\xf1\
-\xb3\x13\x6d\xec\x52\x3a\x33\xd6\x32\xba\x5b\x05\x7f\x86\x7c\xfd\
-\x1d\x53\x3d\x4b\xcd\xe9\xdf\xc8\x9e\xfc\x49\x46\xf3\x9d\xd0\x56\
-\xa7\xfe\xcf\x07\x76\xaf\x98\xb7\x94\x74\x0f\xe0\x17\xe4\xef\xb3\
-\x99\x31\xaa\x8f\x02\x0e\x25\xbf\x0d\xf3\x07\xab\x67\xa9\x59\xad\
-\x04\x6e\x23\x7b\xf2\x47\xf5\xd7\xff\x1b\xc9\x37\x3a\x33\xe3\x1a\
-\xdc\xe4\x47\xe3\xef\x5e\xb4\xb9\x63\xe0\xeb\x6b\x26\x5d\xd1\xa7\
-\xc9\xd6\xdb\x6d\xb8\x56\x29\xe2\x05\xe4\x6f\x9a\x23\xab\x67\x39\
-\x78\x87\x02\x6b\xc8\xd7\xdd\xf4\xb8\x13\x78\x50\xcd\xa4\xa5\x86\
-\x1c\x43\x7e\xdf\x92\x99\xb1\x96\xd1\x7c\x93\xe9\x68\xf2\x75\xe7\
-\x62\xc0\x80\xf4\xf7\xb8\xbf\x5d\x3f\xc5\x81\x9b\x00\xbe\x4b\xfe\
-\x86\x99\x1e\x93\xc0\xef\xd7\x4c\x5a\x6a\xd0\xd3\xc8\x4f\x5f\xcf\
-\xd6\xa6\x8d\xe2\xa2\xb6\xf4\x7e\x0b\xa7\xd6\x4f\x51\xd3\x1d\x4a\
-\xfe\x66\x79\x52\xf5\x2c\x07\xef\x79\xe4\xeb\x6d\x66\xbc\xa2\x6a\
-\xc6\x52\xbb\xfe\x82\xfc\xfd\x37\x33\x8e\xaf\x9a\x71\x1d\x4f\x23\
-\x5f\x6f\x07\x57\xcf\x52\xbf\xf4\x4e\xb2\x27\xfb\x42\x46\xef\xd3\
-\x9a\x3b\x00\xd7\x92\xbf\x51\xa6\xc7\xfb\xab\x66\x2c\xb5\xaf\x85\
-\x6f\x98\x4c\x8f\xab\x81\xed\xab\x66\x3c\x78\x4b\xc9\x2f\xae\x7c\
-\x6b\xf5\x2c\x05\xc0\x66\x94\x05\x63\xc9\x93\xfd\xd2\xea\x59\x0e\
-\xde\x3f\x93\x6f\x5c\xa6\xc7\x69\x94\xb7\x11\xa4\x2e\xdb\x9c\xf6\
-\x36\x0a\x7a\x5f\xd5\x8c\xeb\x78\x39\xd9\x3a\xbb\x1a\x58\x5e\x3d\
-\x4b\xf1\x54\xb2\x27\xfa\x66\x60\xdb\xea\x59\x0e\xd6\xfd\xc9\x6f\
-\x9a\x31\x3d\xae\xc2\x2f\xfb\x49\x53\xf6\x22\xff\xa3\x66\x7a\xac\
-\xa7\x6c\xb4\x33\x4a\x56\x00\x37\x91\xad\xb7\x27\x56\xcf\x52\x7c\
-\x91\xec\x49\x7e\x5b\xfd\x14\x07\xee\x6b\xe4\x1b\x95\xa9\x58\x0b\
-\x3c\xb4\x6e\xba\xd2\xc8\x79\x38\xe5\xde\x48\xdf\x9f\x53\xf1\x8d\
-\xba\xe9\x56\xf1\x0e\xb2\x75\x76\x52\xfd\x14\xbb\x6d\x17\xb2\xbb\
-\xd7\xad\x05\xf6\xa9\x9d\xe4\x80\x1d\x47\xbe\x31\x99\x1e\xa3\xf8\
-\xf8\x44\x1a\x86\x3f\x27\x7f\x7f\x4e\x8f\xc7\xd7\x4d\x77\xe0\xf6\
-\x25\xdf\x3f\xec\x58\x3d\xcb\x0e\x7b\x11\xd9\x1b\x62\xd4\x3e\xf9\
-\xbb\x9c\xb2\xb5\x6e\xba\x21\x99\x8a\x4f\xd6\x4d\x57\x1a\x69\x13\
-\xb4\xf1\x91\x9b\xa9\x38\x07\x58\x56\x35\xe3\xc1\x4b\x6f\x0f\xfc\
-\xbc\xfa\x29\x76\x57\x7a\x2a\xfb\xb1\xf5\x53\x1c\xa8\x97\x90\x6f\
-\x44\xa6\xe2\x32\xca\x9b\x08\x92\xe6\xb6\x23\x70\x05\xf9\xfb\x75\
-\x2a\xfe\x57\xdd\x74\x07\xee\xf1\x64\xeb\xeb\x4b\xf5\x53\xec\xa6\
-\x1d\xc9\x3e\x23\xbb\x8c\xd1\x7a\xf5\x6f\x25\xed\xbc\xf6\xb7\x1e\
-\x78\x44\xdd\x74\xa5\xb1\xf1\x68\xda\x59\xb4\x7b\x35\xb0\x4d\xdd\
-\x74\x07\x6a\x19\x70\x39\xb9\xfa\x5a\xc3\x08\xfd\xd0\x59\x92\x3e\
-\x80\x79\x78\x12\xd9\xe9\xa8\x7f\xa3\x74\x64\xa3\xe2\x4f\x69\xe7\
-\x79\xd4\xdb\x81\xaf\xa7\x0f\x42\x1a\x11\x5f\x01\xde\x9d\x3e\x88\
-\x0d\x76\x06\x5e\x9c\x3e\x88\x79\x58\x07\x7c\x28\x58\xfe\x72\xe0\
-\x09\xc1\xf2\xc7\xd6\x57\xc8\x8d\xea\x26\x81\xfd\xeb\xa7\x38\x30\
-\xdb\x02\x37\x90\xff\xf5\xd0\xa3\x7c\x07\x7d\xb3\xba\xe9\x4a\x63\
-\x67\x73\xe0\x0c\xf2\xf7\x6f\x8f\xf2\xf1\xa2\x95\x75\xd3\x1d\xa8\
-\x7b\x92\x9d\x41\xf9\x42\xfd\x14\xbb\x65\x07\xb2\xd3\xff\xa3\xf6\
-\xeb\xf5\x04\xf2\x8d\x46\x0f\x58\x4d\xd9\xb6\x59\xd2\xfc\x1d\x4e\
-\x3b\x1f\xee\xfa\xbf\x95\x73\x1d\xb4\x6f\x92\xab\xab\x35\xc0\xaa\
-\xfa\x29\x76\x47\x7a\x0f\xfb\x67\xd5\x4f\x71\x60\xb6\x03\x6e\x24\
-\xdf\x60\xf4\x28\x03\x11\x49\x0b\xf7\x7a\xf2\xf7\x71\x8f\xd2\xa6\
-\x6c\x57\x39\xd7\x41\x3a\x9e\x6c\x7d\x1d\x5f\x3f\xc5\xee\xf8\x12\
-\xb9\x13\x79\x13\xb0\x55\xfd\x14\x07\xa6\x95\x06\xe3\x6c\xdc\xea\
-\x57\x5a\xac\x2d\x80\x73\xc9\xdf\xcf\x3d\xe0\x75\x95\x73\x1d\xa4\
-\x2d\xc9\xfe\x10\x3a\xb9\x7e\x8a\xdd\xb0\x1d\x65\x2a\x39\x75\x22\
-\x47\x69\x5f\xec\x95\xe4\xb7\xc3\xec\x51\x16\x4b\x1e\x53\x39\x57\
-\xa9\x2b\x1e\x42\x1b\x6f\x05\xdc\xc0\x68\xbd\x11\xf0\x7e\x72\x75\
-\xb5\x9a\xd1\xfb\xa8\x52\x93\x9e\x43\xf6\xa2\x3f\xba\x7e\x8a\x03\
-\xf3\x4a\xf2\x8d\x44\x0f\x78\x4f\xed\x44\xa5\x8e\xf9\x47\xf2\xf7\
-\x75\x8f\xd1\xda\xc9\xf3\x18\xb2\x75\xf5\xcc\xfa\x29\x8e\xbf\x8f\
-\x90\x3b\x81\x97\x52\x76\xe7\x1a\x05\xcb\x29\xc7\x9b\x6e\x20\xae\
-\xa0\x7c\x98\x43\xd2\xe0\x6c\x4b\x79\x27\x3f\x7d\x7f\x5f\xc8\xe8\
-\xec\x0e\x38\x01\x5c\x42\xae\xae\x3e\x5c\x3f\xc5\xf1\xb6\x84\xec\
-\x45\xff\x8e\xfa\x29\x0e\xcc\xf1\xe4\x1b\x87\x1e\x2e\x7e\x91\x6a\
-\x79\x3e\xf9\xfb\xbb\x07\x3c\xa3\x76\xa2\x03\xf4\x1e\x72\xf5\x74\
-\x15\xa3\xf3\x03\xb2\x49\xf7\x27\x7b\xa1\x3f\xa8\x7e\x8a\x03\xd3\
-\xc2\x3b\xc3\xa7\x33\x5a\x9b\x4b\x49\xa3\x64\x09\xf0\x03\xf2\xf7\
-\xf9\x19\x8c\x4e\xc7\xf6\x10\xb2\x75\x75\x9f\xfa\x29\x8e\xaf\xd7\
-\x90\x3b\x71\x97\x31\x3a\x9d\xd9\xa3\xc9\x37\x0a\x93\xc0\x83\x6b\
-\x27\x2a\x75\xdc\x43\xc9\xdf\xeb\x3d\x46\x67\x6b\xef\x25\x64\xb7\
-\x06\xfe\xf3\xfa\x29\x8e\xaf\xe4\x66\x0e\xad\x6c\xc5\xd9\x8f\x93\
-\xc8\x37\x08\xff\x51\x3d\x4b\x49\x00\x9f\x20\x7f\xbf\xff\x67\xf5\
-\x2c\x07\xe7\xbd\xe4\xea\xe9\x6b\x43\xc8\x6f\x2c\xad\x20\xbb\x0b\
-\xd6\x6f\xd6\x4f\x71\x20\xf6\x22\xfb\x0d\xec\x1e\x70\xe7\x86\xe3\
-\x90\x54\xdf\x3e\x64\x5f\x8d\xee\x51\x76\x66\xdd\xa3\x72\x9e\x83\
-\xf2\x30\x72\xf5\xb4\x9a\x86\x5f\x9d\x6c\x79\x8a\xfb\x11\x94\x95\
-\xed\x09\x57\x01\xa7\x86\xca\x9e\xaf\x17\x90\xff\x4a\xe1\xfb\x29\
-\xab\x6d\x25\xd5\x77\x11\xf0\xcf\xe1\x63\x58\x46\xd9\xa1\x75\x14\
-\x7c\x0b\xb8\x32\x54\xf6\x66\x94\x75\x08\x9a\xa7\xf7\x91\x1b\xb5\
-\xfd\xdd\x10\xf2\x1b\x84\xe5\x64\x9f\x6f\xf5\x80\x3b\x80\xdd\x6b\
-\x27\x2a\xe9\x6e\x76\xa3\xdc\x7b\xc9\x7b\xff\x0a\x72\x3f\xd2\xe6\
-\x2b\xd9\x9f\x8c\xd2\xe3\xe4\x66\x9c\x4f\xee\x84\x1d\x3b\x84\xfc\
-\x06\xe1\x69\x64\x1b\x80\x1e\xf0\xe6\xea\x59\x4a\x9a\xcd\x3b\xc8\
-\xdf\xff\xc7\x55\xcf\x72\x30\x7e\x8b\x5c\x1d\x9d\x3b\x84\xfc\xc6\
-\xca\xbe\xe4\x4e\xd6\x1d\x94\x7d\xa4\x47\xc1\x57\xc9\xde\xfc\xb7\
-\x00\x3b\x56\xcf\x52\xd2\x6c\x76\x01\x6e\x23\xdb\x06\x7c\xb1\x7a\
-\x96\x83\xb1\x05\xd9\x19\x93\x7d\xeb\xa7\x38\x7f\xad\xae\x01\x78\
-\x64\xb0\xec\xff\xa2\x2c\x6a\x6b\xdd\x1e\xe4\x5f\xc5\x79\x37\xe5\
-\x5b\xe1\x92\x86\xef\x6a\xca\x0a\xf7\xa4\x63\x29\x8f\x23\x5a\x77\
-\x17\xf0\xed\x60\xf9\x4d\xae\x03\x68\x75\x00\x90\xdc\x7f\xff\x2b\
-\xc1\xb2\xe7\xe3\x99\x64\xcf\xdf\x1d\xf8\x6c\x4b\x4a\x7b\x07\xd9\
-\x1f\x2c\x4b\x81\xa7\x07\xcb\x9f\x8f\x64\xdb\x3e\x4a\xdf\x94\x89\
-\x3b\x87\xdc\x54\xcd\x41\x43\xc8\x6f\x10\xce\x24\x3b\xf5\xf7\xf7\
-\xf5\x53\x94\xd4\x87\x7f\x22\xdb\x16\xfc\xb0\x7e\x8a\x03\x71\x28\
-\xb9\x3a\xfa\xf1\x10\xf2\x1b\x0b\xdb\x51\x3e\x27\x9b\x38\x49\x97\
-\x0e\x21\xbf\x41\x38\x82\xec\x0d\xbf\x1e\x38\xb0\x7a\x96\x92\xfa\
-\x71\x6f\x72\x6d\xe6\x54\x1c\x56\x3d\xcb\xc1\x48\x7d\x1c\x68\x3d\
-\xe5\x83\x4e\x4d\x69\xf1\x11\xc0\xd1\xe4\x8e\xeb\x4b\xa1\x72\xe7\
-\xeb\xd9\xe1\xf2\x3f\x8b\x2b\x5b\xa5\x56\x9c\x07\x7c\x3e\x7c\x0c\
-\xcf\x0a\x97\xdf\xaf\x53\x42\xe5\x2e\x01\x8e\x0c\x95\x3d\xa7\x56\
-\x07\x00\x29\xa3\xf0\xfc\x7f\x82\xf2\xfa\x5f\xd2\x28\x7d\x25\x51\
-\xea\x82\xb7\x87\xcb\xff\x3d\x46\xe3\x03\x41\xc9\x36\x7e\x94\x3e\
-\x2e\x17\x73\x0a\x99\x29\x9a\x75\xc0\xaa\x21\xe4\xb7\x58\x47\x92\
-\x9d\xea\xfb\x41\xfd\x14\x25\x2d\xc0\xe9\x64\xdb\x86\xfb\xd5\x4f\
-\x71\xd1\x76\x20\xf7\xb8\xa4\xb9\x19\xe6\xd6\x66\x00\x96\x02\x0f\
-\x08\x95\xfd\x23\xe0\x86\x50\xd9\xf3\xf1\xa4\x70\xf9\xef\x0f\x97\
-\x2f\x69\x76\x1f\x08\x97\x3f\x0a\x9b\x02\x5d\x4f\xf9\x9c\x71\xc2\
-\x51\xb4\xd7\xe7\x36\xe5\x70\x72\xa3\xd7\x77\x0d\x21\xbf\x41\x38\
-\x97\x5c\x1d\xdd\x4a\xf9\x48\x93\xa4\xf6\x6c\x43\xd9\x9c\x2b\xd5\
-\x3e\x9c\x53\x3f\xc5\x81\x78\x0f\xb9\x3a\x3a\x64\x08\xf9\xf5\xad\
-\xb5\xd1\x48\xf2\x19\xc9\x69\xc1\xb2\xfb\x75\x18\x65\xc5\x6f\xca\
-\x47\x28\x83\x00\x49\xed\xb9\x0d\xf8\x64\xb0\xfc\x83\x18\x8d\xb7\
-\x83\x92\x6d\x7d\x53\xfb\x01\xb4\x36\x00\x38\x2a\x58\xf6\xf7\x82\
-\x65\xf7\x2b\x3d\xfd\x9f\x9e\x62\x94\xb4\x71\xe9\x7b\x74\x14\x1e\
-\x03\x38\x00\x68\xd4\x19\x64\xa6\x65\x2e\x1f\x46\x72\x03\xf0\x7d\
-\x72\x53\x57\x67\x0e\x21\x3f\x49\x8b\x97\x6a\x47\x7b\xc0\x77\x86\
-\x90\xdf\x20\x5c\x46\xa6\x7e\xfe\x67\x18\xc9\xf5\xab\xa5\x19\x80\
-\x65\xe4\xa6\x8f\xbe\x1b\x2a\x77\x3e\x76\x20\xbb\xca\xf6\x5f\x83\
-\x65\x4b\xea\xdf\xff\x0b\x96\x7d\x14\x65\x33\xb7\xd6\x7d\x3f\x54\
-\xee\xc1\x94\xc5\xee\x4d\x68\x69\x00\x70\x00\xb0\x79\xa8\xec\x51\
-\x78\xfe\xff\x28\x72\x17\xce\x24\xd9\x67\x8b\x92\xfa\xf7\x71\xca\
-\xaf\xcd\x84\x65\xe4\x3f\x52\xd6\x8f\x54\x9b\xbf\x25\xb0\x5f\xa8\
-\xec\x5f\xd3\xd2\x00\xe0\xd0\x60\xd9\xa3\x30\x00\x38\x36\x58\xf6\
-\x77\x18\x9d\xc7\x24\x52\xd7\x5d\x4a\x76\x4d\x53\xb2\xad\xea\xd7\
-\xa9\xc1\xb2\x93\x7d\xdd\xdd\x38\x00\x80\xd5\x94\x3d\x00\x5a\x97\
-\xbc\xa9\x3e\x1e\x2c\x5b\xd2\xfc\x25\xef\xd9\xc7\x04\xcb\xee\xd7\
-\xe9\x94\xb6\x3f\xc1\x01\xc0\x2c\x52\x95\xf2\x23\x72\x17\x42\xbf\
-\x0e\x02\xf6\x0a\x95\x3d\x09\x7c\x26\x54\xb6\xa4\x85\xf9\x04\xe5\
-\xde\x4d\xd8\x87\xf2\x48\xb7\x65\xab\xc9\x6d\x08\xe4\x00\x60\x16\
-\xa9\x4a\x49\x5d\x04\xf3\xf1\xf0\x60\xd9\xdf\x04\xae\x0c\x96\x2f\
-\x69\xfe\xae\x24\xbb\xb8\x39\xd9\x66\xf5\x2b\xf5\x66\x93\x03\x80\
-\x19\x92\x0b\x23\xce\x0e\x95\x3b\x1f\x0f\x0e\x96\xfd\xd9\x60\xd9\
-\x92\x16\xee\xa4\x60\xd9\xc9\x36\xab\x5f\xa9\xb6\x3f\xb9\xe0\xfd\
-\x6e\x5a\x19\x00\x24\x5f\x8d\x38\x2b\x54\xee\x7c\x1c\x13\x2c\xfb\
-\x8b\xc1\xb2\x25\x2d\x5c\xf2\xde\x1d\x85\x01\xc0\x4f\x42\xe5\x26\
-\x5f\x79\xbf\x9b\x56\x06\x00\xc9\x29\x91\xd6\x67\x00\xf6\x20\xf7\
-\xfc\xff\x42\xe0\x67\xa1\xb2\x25\x2d\xce\xd9\xc0\x25\xa1\xb2\xf7\
-\x03\x76\x0b\x95\xdd\xaf\x1f\x07\xcb\x6e\xe2\x31\x40\x2b\x03\x80\
-\x83\x43\xe5\x5e\x09\x5c\x17\x2a\xbb\x5f\xbf\x19\x2c\xdb\x5f\xff\
-\xd2\x68\xfb\x72\xb0\xec\xd6\xb7\xbd\xbd\x0e\xb8\x3a\x54\x76\x13\
-\x1f\x05\x6a\x65\x00\x90\x7a\xfe\x9f\x9a\x02\x9a\x8f\xe4\x54\x9a\
-\x03\x00\x69\xb4\xf9\x18\x60\xe3\x52\x33\xc0\xf7\x0c\x95\x7b\x37\
-\xad\x0c\x00\xf6\x0e\x95\x3b\x0a\xcf\xff\x8f\x0c\x95\xbb\x1a\xf8\
-\x46\xa8\x6c\x49\x83\x71\x0a\xb0\x36\x54\x76\xf2\xe3\x6e\xfd\x4a\
-\xfd\x08\x4c\xf5\x79\x77\xd3\xca\x00\x60\x9f\x50\xb9\xad\xcf\x00\
-\x2c\x25\xf7\xac\xe8\x07\xc0\xed\xa1\xb2\x25\x0d\xc6\xad\xc0\x0f\
-\x43\x65\x1f\x41\x3b\x7d\xcc\x5c\x52\x7d\xc0\x3e\xa1\x72\xef\xa6\
-\x85\x93\xb3\x15\xb0\x63\xa8\xec\xd6\x07\x00\x07\x52\xea\x27\x61\
-\x14\x3e\x90\x24\x69\xd3\x52\xf7\xf2\x36\x34\xb4\xef\xfd\x1c\x52\
-\x7d\xc0\x2e\x94\xd7\xdf\xa3\x5a\x18\x00\x24\xa7\x42\x5a\x5f\xe1\
-\x7e\x9f\x60\xd9\x0e\x00\xa4\xf1\x90\xbc\x97\xef\x1b\x2c\xbb\x1f\
-\xe7\x85\xca\x9d\x20\xf7\x76\xd7\x2f\xb5\x30\x00\xd8\x27\x54\xee\
-\x8d\xc0\xcd\xa1\xb2\xfb\x75\x44\xa8\xdc\x1e\xd9\x8f\x89\x48\x1a\
-\x9c\xef\x04\xcb\x4e\xfe\x88\xe9\xc7\x0d\x94\xc7\x24\x09\xf1\x75\
-\x00\x2d\x0c\x00\x52\x95\x70\x71\xa8\xdc\xf9\x48\x0d\x00\xce\x03\
-\xae\x0d\x95\x2d\x69\xb0\xae\x01\x7e\x1e\x2a\xbb\xf5\x01\x00\xe4\
-\xfa\x02\x07\x00\x38\x00\xd8\x98\xc3\x42\xe5\x26\x3f\x95\x29\x69\
-\xf0\x52\x8f\x01\x0e\x0f\x95\x3b\x1f\x17\x85\xca\x75\x00\x40\xee\
-\x11\xc0\x45\xa1\x72\xfb\xb5\x82\xdc\x4e\x5a\xa7\x87\xca\x95\x54\
-\x47\xea\x4d\x80\xdd\x29\x8b\x01\x5b\xe6\x0c\x40\x90\x33\x00\xb3\
-\xbb\x57\xb0\xec\xe4\x16\x99\x92\x06\x2f\xb5\xe7\xc9\x04\xed\xbf\
-\x09\x90\xea\x0b\xf6\x09\x95\xfb\x4b\x2d\x0c\x00\x52\x2b\x21\x53\
-\x7b\x64\xf7\x2b\x35\x00\xe8\xd1\xfe\xeb\x91\x92\xe6\x27\x39\xa8\
-\x4f\xfe\x98\xe9\xc7\x45\xa1\x72\x9d\x01\x00\x76\x0a\x95\x7b\x51\
-\xa8\xdc\x7e\x1d\x10\x2a\xf7\x12\xe0\xa6\x50\xd9\x92\xea\xb8\x01\
-\xb8\x3c\x54\x76\xaa\x2d\xeb\x57\x6a\x06\x60\xe7\x50\xb9\xbf\x94\
-\x1e\x00\xac\x00\x36\x0b\x95\x7d\x51\xa8\xdc\x7e\xa5\x6e\x1a\xa7\
-\xff\xa5\xf1\x94\xba\xb7\x1d\x00\xcc\x6e\x73\x72\x1b\xbd\x01\xf9\
-\x01\xc0\xaa\x50\xb9\x77\x00\xd7\x87\xca\xee\xd7\xfe\xa1\x72\x47\
-\xe1\xfb\x08\x92\xe6\xcf\x01\xc0\xec\xae\x01\xee\x0c\x95\xbd\x43\
-\xa8\x5c\x20\x3f\x00\x48\x6d\x01\x7c\x4d\xa8\xdc\xf9\x48\x3d\x1f\
-\x4a\xed\x8c\x25\xa9\xae\xd4\xce\xa7\x7b\x86\xca\xed\x57\x8f\xdc\
-\x67\xe1\x3b\x3d\x00\x48\x25\xdf\xfa\xaf\xff\xa5\xe4\x9e\x0f\x5d\
-\x14\x2a\x57\x52\x5d\x17\x85\xca\xdd\x8d\x7c\x5f\xb3\x29\xa9\x3e\
-\xc1\x01\x40\x40\xeb\x03\x80\x5d\x29\x83\x80\x84\x0b\x43\xe5\x4a\
-\xaa\x2b\x75\x6f\x2f\x27\xb7\xd8\xbb\x5f\x0e\x00\x02\x52\x6b\x00\
-\x6e\x08\x95\xdb\xaf\x3d\x42\xe5\xae\x05\xae\x08\x95\x2d\xa9\xae\
-\x4b\x81\x75\xa1\xb2\x53\x6d\x5a\xbf\x52\x7d\x42\xaa\x0f\x04\xf2\
-\x03\x00\x67\x00\x66\xb7\x7b\xa8\xdc\x4b\x80\xf5\xa1\xb2\x25\xd5\
-\xb5\x0e\xb8\x2c\x54\x76\xaa\x4d\xeb\x97\x33\x00\x01\x0e\x00\x66\
-\x97\x1a\x2d\x3b\xfd\x2f\x8d\xb7\x8b\x42\xe5\xb6\x3e\x03\xe0\x00\
-\x20\x20\x95\x7c\xeb\x8f\x00\x52\x6f\x47\xa4\x7e\x1d\x48\x1a\x8e\
-\xd4\x0e\xa8\xf1\x4d\x6f\x36\x21\xd5\x27\x74\x7a\x00\xb0\x7d\xa8\
-\xdc\xd6\x07\x00\xdb\x85\xca\xf5\x13\xc0\xd2\x78\x4b\xbd\xee\xb6\
-\x6d\xa8\xdc\x7e\xa5\x66\x00\x3a\xbd\x06\x20\xb5\x0b\x52\xea\x26\
-\xe8\x57\x6a\x00\xd0\xfa\xa3\x11\x49\x8b\x93\xba\xc7\x53\x6d\x5a\
-\xbf\x52\xf5\xb2\x65\xa8\x5c\x20\x3f\x00\x48\x6d\x03\x7c\x4b\xa8\
-\xdc\x7e\x39\x00\x90\x54\x83\x03\x80\xd9\xdd\x1c\x2a\x77\xf3\x50\
-\xb9\x40\x77\x07\x00\xab\x43\xe5\xf6\x2b\x75\xb3\xb4\x3e\x33\x22\
-\x69\x71\x52\xf7\x78\xeb\x03\x80\x54\x9f\x90\xea\x03\x81\xee\x0e\
-\x00\xd6\x84\xca\xed\x97\x33\x00\x92\x6a\x70\x06\x60\x76\xa9\x3e\
-\xa1\xd3\x03\x80\xd4\xf4\x47\xeb\x33\x00\x2b\x42\xe5\xb6\xbe\x38\
-\x52\xd2\xe2\xa4\x06\x00\x2b\x43\xe5\xf6\x2b\x35\x00\xf0\x11\x40\
-\x40\xeb\x33\x00\xa9\x8b\x22\xf5\x45\x2c\x49\xc3\x71\x57\xa8\xdc\
-\xe8\x2f\xdd\x3e\xf8\x08\x20\xc0\x01\xc0\xec\x96\x87\xca\x6d\xbd\
-\x5e\x24\x2d\x4e\x27\x3b\xba\x3e\xf8\x08\x20\xc0\x01\xc0\xec\xac\
-\x17\x49\x35\xa4\xee\xf1\xd4\x8f\x9a\x7e\xf9\x08\x20\xc0\x8e\x6e\
-\x76\xa9\x9b\xa5\xf5\xb5\x11\x92\x16\xc7\x19\x80\xd9\x75\xb2\x5e\
-\x1c\x00\xb4\xc9\x47\x00\x92\x6a\x48\x75\x74\xce\x00\xcc\xce\x01\
-\x40\x40\xeb\x1d\x9d\x03\x00\x49\x35\x74\xf2\x97\x6e\x1f\x52\xf5\
-\xd2\xe9\x47\x00\x89\x4f\xcf\xae\x0e\x95\x3b\x1f\xa9\xf3\xd2\x7a\
-\xbd\x48\x5a\x9c\xd4\x3d\xbe\x34\x54\x6e\xbf\xd6\x93\xf9\x01\xb4\
-\x2e\x50\xe6\x2f\xa5\x07\x00\x89\xed\x17\x6f\x0a\x94\x29\x49\x6a\
-\x5b\xe7\xfa\xa3\xf4\x00\xe0\x82\x40\x99\xe7\x07\xca\x94\x24\xb5\
-\xad\x73\xfd\x51\x7a\x00\xf0\xdd\x8e\x94\x29\x49\x6a\x5b\xe7\xfa\
-\xa3\xf4\x00\xe0\xb3\x1d\x29\x53\x92\xd4\xb6\xce\xf5\x47\x13\xc9\
-\xc2\x29\x0b\x43\xae\x00\x76\x1e\x52\x79\x57\x03\xbb\x03\x93\x43\
-\x2a\x6f\xa1\x7a\xa1\x72\xd3\xd7\x83\xa4\xfa\x6c\x5f\x66\xd7\xb9\
-\xfe\x28\x3d\x03\xb0\x1e\x78\xfb\x10\xcb\x7b\x2b\xed\x77\xfe\x92\
-\xa4\xe1\xb3\x3f\x0a\xd8\x02\xb8\x98\x32\x2a\xad\x19\x97\x02\x5b\
-\x0e\x29\xa7\xc5\xaa\x5d\x17\x73\x85\xa4\xf1\x67\xfb\x32\x37\xfb\
-\xa3\x80\xa7\x50\x46\x42\xb5\x2a\x7b\x12\x38\x6e\x68\xd9\x2c\x9e\
-\x37\xa8\xa4\x5a\x6c\x5f\x36\xce\xfe\x28\xe0\x0d\xd4\xab\xf0\xbf\
-\x1e\x62\x1e\x83\xe0\x0d\x2a\xa9\x16\xdb\x97\x4d\xb3\x3f\x1a\xb2\
-\x25\xc0\x43\xa2\xe1\x84\x00\x00\x17\x40\x49\x44\x41\x54\xc7\x18\
-\x7c\x65\x7f\x94\xfc\x5a\x87\xf9\xf2\x06\x95\x54\x8b\xed\xcb\xa6\
-\xd9\x1f\x05\x4c\x00\x27\x30\x98\xe9\x97\x49\xe0\x4d\x8c\x66\x65\
-\x7b\x83\x4a\xaa\xc5\xf6\xa5\x3f\xf6\x47\x21\x4f\x06\x2e\x61\xe1\
-\x95\x7d\x31\xa3\xfd\x8c\xc5\x1b\x54\x52\x2d\xb6\x2f\xf3\xd3\xf5\
-\xfe\x28\x62\x0b\xe0\x95\xc0\x55\xf4\x5f\xd1\x57\x01\xaf\xd8\xf0\
-\xef\x8e\x32\x6f\x50\x49\xb5\xd8\xbe\xcc\xdf\x58\xf6\x47\xad\x6f\
-\xcc\x00\x65\xca\xe4\x41\xc0\x13\x36\xfc\xb9\x1f\xb0\xfd\x86\xff\
-\xef\x46\xca\xfe\xcd\xdf\xa5\xec\xa8\x74\x1a\xe3\xf1\x5e\x65\xea\
-\x66\x19\x85\xeb\x41\xd2\xe2\xd8\xbe\x2c\xdc\x58\xf5\x47\xe3\x70\
-\x42\xc6\x91\x37\xa8\xa4\x5a\x6c\x5f\x04\xb8\x20\x41\x92\xa4\x4e\
-\x72\x00\x20\x49\x52\x07\x39\x00\x90\x24\xa9\x83\x1c\x00\x48\x92\
-\xd4\x41\x0e\x00\x24\x49\xea\x20\x07\x00\x92\x24\x75\x90\x03\x00\
-\x49\x92\x3a\xc8\x01\x80\x24\x49\x1d\xe4\x00\x40\x92\xa4\x0e\x72\
-\x00\x20\x49\x52\x07\x39\x00\x90\x24\xa9\x83\x1c\x00\x48\x92\xd4\
-\x41\x0e\x00\x24\x49\xea\x20\x07\x00\x92\x24\x75\x90\x03\x00\x49\
-\x92\x3a\xc8\x01\x80\x24\x49\x1d\xe4\x00\x40\x92\xa4\x0e\x72\x00\
-\x20\x49\x52\x07\x39\x00\x90\x24\xa9\x83\x1c\x00\x48\x92\xd4\x41\
-\x0e\x00\x24\x49\xea\x20\x07\x00\x92\x24\x75\x90\x03\x00\x49\x92\
-\x3a\xc8\x01\x80\x24\x49\x1d\xe4\x00\x40\x92\xa4\x0e\x72\x00\x20\
-\x49\x52\x07\x39\x00\x90\x24\xa9\x83\x1c\x00\x48\x92\xd4\x41\x0e\
-\x00\x24\x49\xea\x20\x07\x00\x92\x24\x75\x90\x03\x00\x49\x92\x3a\
-\xc8\x01\x80\x24\x49\x1d\xe4\x00\xa0\x3d\xcb\x42\xe5\xae\x0f\x95\
-\x2b\x69\xb8\x26\x43\xe5\x2e\x0d\x95\xab\x39\x38\x00\x68\xcf\xe6\
-\xa1\x72\xd7\x84\xca\x95\x34\x5c\x6b\x43\xe5\x6e\x16\x2a\x57\x73\
-\x70\x00\xd0\x9e\xd4\x4d\x92\x6a\x14\x24\x0d\x97\x03\x00\x01\x0e\
-\x00\x5a\xe4\x00\x40\x52\x4d\xa9\xd9\x3e\x07\x00\x8d\x71\x00\xd0\
-\x9e\xd4\x4d\xe2\x23\x00\xa9\x1b\x9c\x01\x10\xe0\x00\xa0\x45\xce\
-\x00\x48\xaa\xc9\x01\x80\x00\x07\x00\x2d\x4a\x2d\x02\x74\x00\x20\
-\x75\x83\x03\x00\x01\x0e\x00\x5a\xe4\x0c\x80\xa4\x9a\x1c\x00\x08\
-\x70\x00\xd0\x22\xd7\x00\x48\xaa\x29\x35\x00\x48\xcd\x6e\x6a\x0e\
-\x0e\x00\xda\xe3\x0c\x80\xa4\x9a\x9c\x01\x10\xe0\x00\xa0\x45\x0e\
-\x00\x24\xd5\xe4\x6b\x80\x02\x1c\x00\xb4\x68\xcb\x50\xb9\xb7\x86\
-\xca\x95\x34\x5c\xa9\x7b\x3d\xd5\xb6\x69\x0e\x0e\x00\xda\xb3\x2a\
-\x54\xee\x4d\xa1\x72\x25\x0d\xd7\xcd\xa1\x72\xb7\x0f\x95\xab\x39\
-\x38\x00\x68\xcf\x0e\xa1\x72\x1d\x00\x48\xdd\x90\xba\xd7\x53\x6d\
-\x9b\xe6\xe0\x00\xa0\x3d\xa9\x19\x80\xd4\xaf\x02\x49\xc3\x95\xba\
-\xd7\x53\x6d\x9b\xe6\xe0\x00\xa0\x3d\x0e\x00\x24\xd5\xe4\x00\x40\
-\x80\x03\x80\x16\x39\x00\x90\x54\x93\x03\x00\x01\x0e\x00\x5a\xe4\
-\x1a\x00\x49\x35\xb9\x06\x40\x80\x03\x80\x16\x39\x03\x20\xa9\x26\
-\x67\x00\x04\x38\x00\x68\x51\x6a\x94\xec\x00\x40\xea\x86\xd4\xbd\
-\xee\x0c\x40\x63\x1c\x00\xb4\xc7\x7d\x00\x24\xd5\x94\xba\xd7\x9d\
-\x01\x68\x8c\x03\x80\xb6\x2c\x03\x56\x86\xca\x76\x00\x20\x75\xc3\
-\x8d\xa1\x72\xb7\xc3\x3e\xa7\x29\x9e\x8c\xb6\x6c\x0f\x4c\x04\xca\
-\xed\x01\x57\x07\xca\x95\x34\x7c\x57\x85\xca\x5d\x82\xbb\x01\x36\
-\xc5\x01\x40\x5b\xee\x11\x2a\xf7\x7a\xe0\xae\x50\xd9\x92\x86\xeb\
-\x4e\x72\x33\x7e\x7b\x84\xca\xd5\x2c\x1c\x00\xb4\x65\xef\x50\xb9\
-\x57\x86\xca\x95\x94\x71\x45\xa8\xdc\x54\x1b\xa7\x59\x38\x00\x68\
-\x4b\xea\xe6\x48\x35\x06\x92\x32\x52\x83\xfe\xbd\x42\xe5\x6a\x16\
-\x0e\x00\xda\x92\xba\x39\x1c\x00\x48\xdd\xe2\x0c\x80\x1c\x00\x34\
-\xc6\x19\x00\x49\xc3\xe0\x0c\x80\x1c\x00\x34\x26\x75\x73\xb8\x06\
-\x40\xea\x96\xd4\x3d\xef\x0c\x40\x43\x1c\x00\xb4\xc5\x45\x80\x92\
-\x86\xc1\x47\x00\x72\x00\xd0\x90\x2d\x81\x9d\x42\x65\xfb\x08\x40\
-\xea\x96\xd4\x3d\xbf\x2b\xb0\x79\xa8\x6c\xcd\xe0\x00\xa0\x1d\x7b\
-\x91\xd9\x04\x08\x1c\x00\x48\x5d\x93\x9a\xf5\x9b\x20\xb7\xdf\x89\
-\x66\x70\x00\xd0\x8e\xd4\xf3\xff\x75\xf8\x08\x40\xea\x9a\xcb\x81\
-\xc9\x50\xd9\x3e\x06\x68\x84\x03\x80\x76\xa4\x6e\x8a\x4b\x80\xb5\
-\xa1\xb2\x25\x65\xdc\x05\x5c\x16\x2a\xdb\x01\x40\x23\x1c\x00\xb4\
-\xe3\x5e\xa1\x72\x7f\x1e\x2a\x57\x52\xd6\xf9\xa1\x72\x0f\x08\x95\
-\xab\x19\x1c\x00\xb4\xe3\x90\x50\xb9\xa9\x46\x40\x52\x56\xea\xde\
-\x4f\xb5\x75\x9a\xc1\x01\x40\x3b\x52\x37\xc5\x05\xa1\x72\x25\x65\
-\x39\x00\xe8\x38\x07\x00\x6d\xd8\x86\xdc\x22\x40\x67\x00\xa4\x6e\
-\x4a\xdd\xfb\xfb\x02\x5b\x87\xca\xd6\x34\x0e\x00\xda\x70\x30\xb9\
-\x57\x00\x1d\x00\x48\xdd\x94\xba\xf7\x97\x00\xf7\x0e\x95\xad\x69\
-\x1c\x00\xb4\x21\x35\x25\x36\x09\x5c\x18\x2a\x5b\x52\xd6\x05\x40\
-\x2f\x54\xf6\xa1\xa1\x72\x35\x8d\x03\x80\x36\xa4\x06\x00\x97\x52\
-\x5e\x07\x92\xd4\x3d\x77\x90\xdb\x04\xcc\x75\x00\x0d\x70\x00\xd0\
-\x06\xdf\x00\x90\x94\xe0\x42\xc0\x0e\x73\x00\xd0\x86\x83\x43\xe5\
-\xfa\x06\x80\xd4\x6d\xa9\x7d\x40\x1c\x00\x34\xc0\x01\x40\xde\x4a\
-\x60\xcf\x50\xd9\x67\x85\xca\x95\xd4\x86\xb3\x43\xe5\xee\x0d\xac\
-\x08\x95\xad\x0d\x1c\x00\xe4\x25\xdf\x00\xf8\x71\xa8\x5c\x49\x6d\
-\x38\x33\x54\xee\x04\x70\x60\xa8\x6c\x6d\xe0\x00\x20\xef\x3e\xa1\
-\x72\x7b\x38\x03\x20\x75\x5d\xf2\x47\xc0\x7d\x83\x65\x0b\x07\x00\
-\x2d\x38\x3a\x54\xee\x25\xc0\x8d\xa1\xb2\x25\xb5\xe1\x7a\x72\x1f\
-\x05\x7a\x60\xa8\x5c\x6d\xe0\x00\x20\x2f\x75\x13\xa4\xa6\xfe\x24\
-\xb5\x25\x35\x0b\x70\x54\xa8\x5c\x6d\xe0\x00\x20\x6b\x15\xb9\x2f\
-\x63\x39\x00\x90\x04\xb9\xb6\xe0\x20\x60\xfb\x50\xd9\xc2\x01\x40\
-\xda\x03\x71\x01\xa0\xa4\xac\x54\x5b\x30\x01\x3c\x20\x54\xb6\x70\
-\x00\x90\x96\x9c\x02\x73\x06\x40\x12\x64\x7f\x0c\xb8\x0e\x20\xc8\
-\x01\x40\x56\xea\xe2\xbf\x1d\x37\x01\x92\x54\x9c\x07\xdc\x19\x2a\
-\xdb\x75\x00\x41\x0e\x00\x72\x92\xd3\x5f\x67\x51\x3e\x04\x24\x49\
-\xeb\x81\x73\x42\x65\x1f\x45\xee\x31\x68\xe7\x39\x00\xc8\x39\x90\
-\xdc\x02\x98\x1f\x85\xca\x95\xd4\xa6\x1f\x86\xca\xdd\x01\xd8\x3f\
-\x54\x76\xe7\x39\x00\xc8\x49\xbd\xff\x0f\x70\x5a\xb0\x6c\x49\xed\
-\xf9\x5e\xb0\x6c\xd7\x01\x84\x38\x00\xc8\x49\x3e\xfb\x3a\x35\x58\
-\xb6\xa4\xf6\x24\xdb\x04\xd7\x01\xa8\x73\xce\xa6\x6c\xc7\x3b\xec\
-\xb8\x06\x9f\xb9\x49\xba\xbb\x09\xca\xae\x80\x89\x36\xc9\x37\x92\
-\x42\x9c\x01\xc8\xd8\x83\xdc\x27\x80\x4f\xa3\xdc\x74\x92\x34\xa5\
-\x47\xee\x31\xc0\x61\xc0\x6e\xa1\xb2\x3b\xcd\x01\x40\xc6\xb1\xc1\
-\xb2\x7d\xfe\x2f\x69\x36\xa9\xb6\x61\x02\x78\x44\xa8\xec\x4e\x73\
-\x00\x90\xf1\xa8\x60\xd9\x0e\x00\x24\xcd\x26\xd9\x36\x24\xdb\x44\
-\x69\x68\x26\x80\x2b\xc8\x3c\x6b\x5b\x0b\x6c\x5d\x3f\x45\x49\x23\
-\x68\x05\xb0\x8e\x4c\xdb\x94\xfa\x22\xa1\x34\x54\x87\x93\xb9\xc1\
-\x7a\xc0\xff\x0c\x21\x3f\x49\xa3\xeb\x0c\x72\xed\xd3\x41\x43\xc8\
-\x4f\xd3\xf8\x08\x60\xf8\x7c\xfe\x2f\xa9\x55\xc9\x36\x22\xd9\x36\
-\x76\x92\x03\x80\xe1\xf3\xf9\xbf\xa4\x56\x25\xf7\x03\x70\x00\xa0\
-\xb1\xb6\x19\x70\x1b\x99\xe9\xb5\x49\x7c\xd5\x46\xd2\xc6\xed\x41\
-\xee\x11\xc0\x2d\xc0\xf2\xfa\x29\x4a\x19\x0f\x27\x77\x73\x25\x3f\
-\xf9\x29\x69\x74\x9c\x43\xae\x9d\x3a\x66\x08\xf9\x69\x03\x1f\x01\
-\x0c\x57\x72\x8a\xeb\x6b\xc1\xb2\x25\x8d\x8e\x53\x82\x65\x3f\x3a\
-\x58\x76\xe7\x38\x00\x18\xae\xc7\x07\xcb\x4e\xde\xd4\x92\x46\x47\
-\xf2\xc7\xc2\xe3\x82\x65\x4b\xd5\x1c\x40\x6e\x5a\x6d\x0d\xb0\xb2\
-\x7e\x8a\x92\xc6\xc0\x0a\x4a\x9b\x91\x6a\xaf\xee\x59\x3f\x45\x81\
-\x33\x00\xc3\xf4\xe4\x60\xd9\xa7\x51\x16\xd8\x48\xd2\xa6\xdc\x4a\
-\x76\xcf\x90\x27\x06\xcb\xee\x14\x07\x00\xc3\x73\x5c\xb0\x6c\x9f\
-\xff\x4b\x9a\x8f\xe4\x23\xc3\x27\x05\xcb\x96\x06\x6e\x0f\xca\x6b\
-\x78\xa9\x29\xb5\x07\xd5\x4f\x51\xd2\x18\x79\x08\xb9\xf6\x6a\x3d\
-\xb0\x7b\xfd\x14\xe5\x0c\xc0\x70\x3c\x99\xf2\x0d\x80\x84\x5b\x81\
-\x1f\x84\xca\x96\x34\x9a\xbe\x47\xd9\xb3\x24\x61\x09\xf0\x84\x50\
-\xd9\x9d\xe2\x00\x60\x38\x92\xd3\xff\xdf\xa0\x7c\x04\x48\x92\xfa\
-\xb5\x06\xf8\x56\xb0\xfc\x64\x9b\xd9\x19\x0e\x00\xea\xdb\x91\xec\
-\xe6\x16\x9f\x0b\x96\x2d\x69\x74\x7d\x3e\x58\xf6\xc3\x80\x55\xc1\
-\xf2\xa5\x81\x78\x3e\xd9\x67\x69\x6e\xff\x2b\x69\x21\xd2\x6b\x97\
-\x8e\xaf\x9f\x62\xb7\x39\x03\x50\x5f\x72\x2a\xeb\xbf\x81\x2b\x83\
-\xe5\x4b\x1a\x5d\x97\x03\xa7\x07\xcb\xf7\x31\x40\x65\x0e\x00\xea\
-\xda\x0e\x78\x44\xb0\xfc\x93\x82\x65\x4b\x1a\x7d\x9f\x0d\x96\xfd\
-\x68\xca\xa6\x44\xaa\xc4\x01\x40\x5d\x4f\x03\x36\x0f\x96\x7f\x62\
-\xb0\x6c\x49\xa3\x2f\x39\x00\xd8\x12\x78\x4a\xb0\x7c\x69\x51\xbe\
-\x4b\xee\xf9\xd9\xcf\x87\x90\x9f\xa4\xf1\xf7\x33\x72\xed\xd8\x7f\
-\xd5\x4f\xaf\xbb\x9c\x01\xa8\xe7\x00\xe0\xe8\x60\xf9\xfe\xfa\x97\
-\x34\x08\x27\x07\xcb\x7e\x08\xb0\x5f\xb0\xfc\xb1\xe6\x00\xa0\x9e\
-\x3f\x20\xb7\xf9\x0f\x64\xa7\xee\x24\x8d\x8f\x64\x5b\x32\x01\x3c\
-\x3b\x58\xbe\x34\x6f\x4b\x80\x8b\xc9\x4d\x9b\x5d\x03\x2c\xad\x9e\
-\xa5\xa4\x2e\x58\x0a\x5c\x4b\xae\x3d\xbb\x08\x7f\xac\x56\x61\xa5\
-\xd6\xf1\x48\x60\xaf\x60\xf9\x27\x53\xf6\x00\x90\xa4\xc5\x5a\x4f\
-\x76\x43\xb1\xbd\x81\x87\x06\xcb\x1f\x5b\x0e\x00\xea\x48\x6f\x60\
-\xf1\xa9\x70\xf9\x92\xc6\x4b\xba\x4d\x49\xb7\xa9\x52\x5f\x56\x02\
-\xb7\x93\x9d\xfe\x5f\x5e\x3d\x4b\x49\x5d\xb2\x0c\xb8\x9a\x5c\xbb\
-\x76\x1b\xee\x09\x30\x70\xce\x00\x0c\xde\xd3\x80\xad\x82\xe5\x7f\
-\x1c\x3f\xfe\x23\x69\xb0\xd6\x01\xff\x19\x2c\x7f\x6b\xca\x57\x55\
-\xa5\xa6\x7d\x9b\xdc\x28\xb9\x47\xf6\xd5\x43\x49\xe3\xeb\xc1\x64\
-\xdb\xb6\x6f\xd4\x4f\x51\x5a\xb8\x83\xc8\x7e\x3c\xe3\x02\xb2\xaf\
-\x1e\x4a\x1a\x5f\x13\xc0\x85\xe4\xda\xb7\x49\xe0\xde\xd5\xb3\xec\
-\x10\x1f\x01\x0c\xd6\x8b\xc9\x76\xc0\x1f\xa1\xdc\x28\x92\x34\x68\
-\x3d\xe0\xa3\xc1\xf2\x27\x80\x3f\x09\x96\x2f\xcd\x69\x3b\xe0\x56\
-\xb2\x53\x64\x87\x54\xcf\x52\x52\x97\x1d\x44\xb6\x8d\xbb\x15\xd8\
-\xb6\x7a\x96\xd2\x3c\xbd\x82\xec\x8d\x91\xfc\x6c\xa7\xa4\xee\x38\
-\x93\x6c\x5b\xf7\xa7\xf5\x53\x94\xfa\xb7\x84\xf2\xfc\x3d\x79\x53\
-\xbc\xbc\x7a\x96\x92\x04\xaf\x22\xdb\xd6\x9d\x8f\x8f\xaf\xd5\x90\
-\x27\x90\xbd\x21\xd6\x03\x7b\x54\xcf\x52\x92\x60\x4f\x4a\x9b\x93\
-\x6c\xf3\x1e\x5f\x3d\x4b\xa9\x4f\x5f\x27\x7b\x33\x7c\xa1\x7e\x8a\
-\x92\xf4\x4b\x5f\x21\xdb\xe6\x7d\xb9\x7e\x8a\xd2\xa6\x1d\x42\xf6\
-\xd5\xbf\x1e\x70\x5c\xf5\x2c\x25\xe9\x57\x9e\x4a\xb6\xcd\x9b\xa4\
-\x2c\x48\x94\xa2\xfe\x89\xec\x8d\x70\x25\x6e\xfd\x2b\x69\xb8\x96\
-\x03\x57\x90\x6d\xfb\xfe\xbe\x7a\x96\xd2\x46\x6c\x4f\xd9\xa3\x3a\
-\x79\x13\xfc\x4d\xf5\x2c\x25\xe9\xd7\xbd\x91\x6c\xdb\x77\x3b\xb0\
-\xaa\x7a\x96\xd2\x1c\xfe\x0f\xd9\x1b\x60\x3d\xb0\x4f\xed\x24\x25\
-\x69\x16\xfb\x91\x5f\x0c\xf8\x8a\xea\x59\x4a\xb3\xd8\x8a\xec\xd7\
-\xb1\x7a\xb8\xf8\x4f\x52\x56\x7a\x31\xe0\x95\xc0\x96\xd5\xb3\x1c\
-\x53\xbe\x4b\xb9\x70\x2f\x04\x76\x0e\x1f\xc3\x07\xc2\xe5\x4b\xea\
-\xb6\x74\x1b\xb4\x2b\xf0\x47\xe1\x63\x50\xc7\x6c\x0e\x5c\x46\x7e\
-\xe4\xeb\xe2\x3f\x49\x49\x2d\x2c\x06\xbc\x94\xd2\x26\x6b\x9e\x9c\
-\x01\x58\x98\xe7\x91\xdf\x78\xe7\x9f\x81\xb5\xe1\x63\x90\xd4\x6d\
-\x6b\x81\x0f\x85\x8f\xe1\x1e\xc0\xf1\xe1\x63\x50\x47\x6c\x06\x5c\
-\x4c\x76\xc4\xeb\xe2\x3f\x49\xad\xb8\x27\xf9\xc5\x80\xbf\xc0\x19\
-\x51\x0d\xc1\xf3\xc8\x5e\xe8\x3d\xe0\x3f\xab\x67\x29\x49\xfd\xfb\
-\x2c\xf9\x76\xd1\x59\x00\x55\xb5\x14\xf8\x19\xf9\x0b\xfd\xc1\xb5\
-\x13\x95\xa4\x79\x78\x28\xf9\x76\xf1\xe7\xc0\xb2\xda\x89\xaa\xbb\
-\x9e\x43\xfe\x22\xff\x41\xf5\x2c\x25\x69\xfe\xbe\x4f\xbe\x7d\x7c\
-\x46\xf5\x2c\xd5\x49\x4b\x81\x73\xc9\x5f\xe0\x4f\xab\x9d\xa8\x24\
-\x2d\xc0\xef\x93\x6f\x1f\xcf\xc1\xc5\xed\xaa\xe0\x19\xe4\x2f\xee\
-\x8b\x70\x8a\x4b\x52\x9b\x96\x03\x97\x90\x6f\x27\xfd\x91\xa4\x81\
-\xda\x8c\xf2\x7c\x29\x7d\x61\xbf\xac\x76\xa2\x92\xb4\x08\xaf\x24\
-\xdf\x4e\x5e\x40\x69\xb3\xa5\x81\x78\x19\xf9\x8b\xfa\x66\x60\xdb\
-\xda\x89\x4a\xd2\x22\xac\x04\x6e\x22\xdf\x5e\xbe\xb8\x76\xa2\xea\
-\x86\xed\x80\xeb\xc8\x5f\xd0\x6f\xad\x9d\xa8\x24\x0d\xc0\x3b\xc9\
-\xb7\x97\xd7\xe2\x0f\x26\x0d\xc0\x9b\xc9\x5f\xcc\x6b\x81\xbd\x6a\
-\x27\x2a\x49\x03\xb0\x0f\xa5\xcd\x4a\xb7\x9b\x6f\xa8\x9c\xa7\xc6\
-\xdc\x5e\xc0\x9d\xe4\x2f\xe4\x8f\xd4\x4e\x54\x92\x06\xe8\xe3\xe4\
-\xdb\xcd\x3b\x28\xdb\x04\x4b\x0b\xf2\x61\xf2\x17\xf1\x7a\xe0\xb0\
-\xda\x89\x4a\xd2\x00\x1d\x42\x7e\x7b\xe0\x1e\xf0\xc1\xda\x89\x6a\
-\x3c\x1d\x41\x1b\x17\xf0\xc7\x6b\x27\x2a\x49\x15\x7c\x8a\x7c\xfb\
-\xb9\x1e\xb8\x6f\xed\x44\x35\x7e\xbe\x42\xfe\xe2\x9d\x04\x0e\xaf\
-\x9d\xa8\x24\x55\xd0\xca\x2c\xc0\x17\x6b\x27\xaa\xf1\xf2\x18\xf2\
-\x17\x6d\x0f\xf8\x64\xed\x44\x25\xa9\xa2\x4f\x93\x6f\x47\x7b\xc0\
-\xb1\xb5\x13\xd5\x78\x58\x06\xfc\x98\xfc\x05\xeb\xaf\x7f\x49\xa3\
-\xee\x3e\x94\xb6\x2c\xdd\x9e\x9e\x81\xbb\xa8\xaa\x0f\x2f\x27\x7f\
-\xb1\xf6\xf0\x93\xbf\x92\xc6\xc3\x89\xe4\xdb\xd3\x1e\xf0\xd2\xda\
-\x89\x6a\xb4\xdd\x03\xb8\x95\xfc\x85\x3a\x09\xdc\xbf\x72\xae\x92\
-\x34\x0c\xf7\xa5\x8d\x59\x80\x5b\x80\x3d\x2a\xe7\xaa\x11\xd6\xc2\
-\xaa\xd5\x1e\x65\xc4\x2c\x49\xe3\xe2\x24\xf2\xed\x6a\x0f\xf8\x58\
-\xed\x44\x35\x9a\x7e\x9b\xfc\xc5\xd9\xa3\x8c\x94\x7f\xa3\x72\xae\
-\x92\x34\x4c\xf7\xa3\x8d\x59\x80\x1e\xf0\xe8\xca\xb9\x6a\xc4\x6c\
-\x09\x9c\x4f\xfe\xc2\xec\x01\x9f\xa8\x9c\xab\x24\x25\xb4\x32\xc3\
-\xfa\x73\x60\x8b\xca\xb9\x6a\x84\xfc\x0d\xf9\x8b\xb2\x07\xac\x01\
-\x0e\xa8\x9c\xab\x24\x25\xdc\x13\x58\x4d\xbe\x9d\xed\x01\xaf\xab\
-\x9c\xab\x46\xc4\x01\xb4\xb1\xdf\x7f\x0f\x78\x77\xe5\x5c\x25\x29\
-\xe9\xbd\xe4\xdb\xd9\x1e\x70\x17\x70\xef\xca\xb9\x6a\x04\x9c\x42\
-\xfe\x62\xec\x51\x56\xa8\xee\x52\x39\x57\x49\x4a\xda\x09\xb8\x99\
-\x7c\x7b\xdb\xa3\xec\xf6\xaa\x0e\x7b\x06\xf9\x8b\x70\x2a\x5e\x5d\
-\x39\x57\x49\x6a\xc1\x6b\xc9\xb7\xb7\x53\xf1\xd4\xca\xb9\xaa\x51\
-\x3b\x02\x57\x91\xbf\x00\x7b\xc0\x65\xc0\x56\x75\xd3\x95\xa4\x26\
-\x6c\x09\x5c\x42\xbe\xdd\xed\x01\xd7\x00\x3b\xd7\x4d\x57\x2d\xfa\
-\x24\xf9\x8b\x6f\x2a\xfe\xb0\x72\xae\x92\xd4\x92\xe7\x91\x6f\x77\
-\xa7\xe2\x33\x95\x73\x55\x63\x9e\x4d\xfe\xa2\x9b\x8a\x1f\x03\x4b\
-\xeb\xa6\x2b\x49\x4d\x59\x0a\x9c\x45\xbe\xfd\x9d\x8a\xa7\xd7\x4d\
-\x57\xad\xd8\x1d\xb8\x9e\xfc\x05\x37\x15\x8f\xa9\x9b\xae\x24\x35\
-\xe9\xf1\xe4\xdb\xdf\xa9\xb8\x91\xb2\x15\xbc\xc6\xd8\x04\xe5\xdb\
-\xd0\xe9\x8b\x6d\x2a\xbe\x5c\x37\x5d\x49\x6a\x5a\x2b\x6f\x61\xf5\
-\x80\x93\x2b\xe7\xaa\xb0\x17\x91\xbf\xc8\xa6\x62\x35\x70\x60\xdd\
-\x74\x25\xa9\x69\xf7\xa2\xbc\x93\x9f\x6e\x8f\xa7\xe2\x8f\xea\xa6\
-\xab\x94\x7d\x29\xef\xda\xa7\x2f\xb0\xa9\xf8\xdb\xba\xe9\x4a\xd2\
-\x48\x78\x33\xf9\xf6\x78\x2a\x6e\x06\xf6\xae\x9b\xae\x86\x6d\x09\
-\xf0\x5f\xe4\x2f\xae\xa9\xb8\x04\xd8\xa6\x66\xc2\x92\x34\x22\xb6\
-\x02\x2e\x22\xdf\x2e\x4f\xc5\xd7\x28\x8f\x8b\x35\x26\x5e\x4e\xfe\
-\xa2\x9a\x1e\x4f\xae\x9b\xae\x24\x8d\x94\xdf\x23\xdf\x2e\x4f\x8f\
-\x17\xd7\x4d\x57\xc3\x72\x18\x70\x07\xf9\x0b\x6a\x2a\x5c\xf8\x27\
-\x49\xbf\xae\xa5\x05\x81\xb7\x03\x07\xd7\x4d\x57\xb5\x6d\x0d\x9c\
-\x43\xfe\x62\x9a\x0a\x17\xfe\x49\xd2\xec\x5a\x5b\x10\xf8\x13\xdc\
-\xa1\x75\xa4\x7d\x98\xfc\x45\x34\x3d\x5c\xf8\x27\x49\x73\x6b\x69\
-\x41\x60\x0f\xf8\x8f\xba\xe9\xaa\x96\xe7\x93\xbf\x78\xa6\x87\x0b\
-\xff\x24\x69\xe3\x5a\x5b\x10\xd8\x03\xfe\xa0\x62\xbe\xaa\xe0\x70\
-\xda\x7a\xee\xdf\x03\x8e\xab\x9a\xb1\x24\x8d\x87\xa7\x90\x6f\xaf\
-\xa7\xc7\xed\xc0\xa1\x55\x33\xd6\xc0\x6c\x43\x5b\xcf\xfd\x7b\xc0\
-\xc7\xaa\x66\x2c\x49\xe3\xe5\x53\xe4\xdb\xed\xe9\x71\x1e\xb0\xa2\
-\x6a\xc6\x1a\x88\x7f\x27\x7f\xb1\x4c\x8f\xeb\x80\x5d\xaa\x66\x2c\
-\x49\xe3\x65\x27\xca\xa7\x7a\xd3\xed\xf7\xf4\xf8\x68\xd5\x8c\xb5\
-\x68\x2d\x6d\xf5\x3b\x15\xcf\xa8\x9a\xb1\x24\x8d\xa7\x96\xbe\xda\
-\x3a\x15\x6e\x15\xdc\xa8\xd6\xde\xf7\xef\xe1\xc7\x25\x24\x69\x31\
-\x4e\x24\xdf\x8e\x4f\x8f\x3b\x81\xfb\x56\xcd\x58\xf3\xb6\x3d\xf0\
-\x33\xf2\x17\xc7\xf4\xb8\x91\xf2\xe9\x61\x49\xd2\xc2\xdc\x03\xb8\
-\x89\x7c\x7b\x3e\x3d\xce\x03\xb6\xab\x99\xb4\xfa\xb7\x14\xf8\x02\
-\xf9\x8b\x62\x66\xfc\x61\xcd\xa4\x25\xa9\x23\x5a\x7b\xa5\xbb\x07\
-\x7c\x05\x58\x56\x33\x69\xf5\xe7\xbd\xe4\x2f\x86\x99\x71\x0a\x7e\
-\x4c\x42\x92\x06\x61\x82\xb2\x85\x7a\xba\x5d\x9f\x19\xef\xaa\x99\
-\xb4\x36\xed\xb9\xe4\x2f\x82\x99\x71\x1b\x70\xcf\x9a\x49\x4b\x52\
-\xc7\xec\x4d\x5b\x9f\x73\x9f\x8a\x17\xd6\x4c\x5a\x73\x7b\x04\xb0\
-\x86\xfc\x05\x30\x33\x5e\x50\x33\x69\x49\xea\xa8\xff\x45\xbe\x7d\
-\x9f\x19\x6b\x80\x87\xd6\x4c\x5a\xbf\x6e\x5f\xe0\x5a\xf2\x27\x7f\
-\x66\x7c\xa6\x66\xd2\x92\xd4\x71\xad\xbd\x15\xd0\x03\xae\x07\xf6\
-\xaf\x99\xb4\x7e\x65\x05\x70\x16\xf9\x93\x3e\x33\x2e\x07\x76\xac\
-\x98\xb7\x24\x75\xdd\x8e\xc0\x15\xe4\xdb\xfb\x99\x71\x0e\xb0\x6d\
-\xc5\xbc\x45\x59\xf1\x7f\x32\xf9\x93\x3d\x33\xd6\x03\x8f\xaa\x98\
-\xb7\x24\xa9\x38\x96\xd2\xe6\xa6\xdb\xfd\x99\xf1\x25\x4a\x1f\xa5\
-\x4a\xde\x49\xfe\x24\xcf\x16\x6f\xa9\x99\xb4\x24\xe9\x6e\xde\x4e\
-\xbe\xdd\x9f\x2d\xde\x5a\x33\xe9\x2e\xfb\x63\xf2\x27\x77\xb6\x38\
-\x1d\xd8\xac\x62\xde\x92\xa4\xbb\xdb\x1c\xf8\x21\xf9\xf6\x7f\xb6\
-\x78\x51\xc5\xbc\x3b\xe9\x38\x60\x1d\xf9\x13\x3b\x33\x6e\x07\x0e\
-\xac\x98\xb7\x24\x69\x76\xfb\x03\xb7\x92\xef\x07\x66\xc6\x7a\xe0\
-\x69\x15\xf3\xee\x94\x47\x00\x77\x91\x3f\xa9\xb3\xc5\xf3\x2b\xe6\
-\x2d\x49\xda\xb8\x17\x92\xef\x07\x66\x8b\xd5\xc0\x6f\x55\xcc\xbb\
-\x13\xee\x4f\x9b\x9b\x3f\xf4\xf0\x95\x3f\x49\x6a\xc1\xc7\xc9\xf7\
-\x07\xb3\xc5\x2d\xc0\xfd\x2a\xe6\xbd\x68\x2d\x6f\x57\xbb\x3f\xf0\
-\x1d\x60\x97\xf4\x81\x48\x92\xb4\x00\xd7\x01\xbf\x09\x9c\x9b\x3e\
-\x90\xd9\xb4\x3a\x00\xd8\x1d\xf8\x2e\xb0\x4f\xf8\x38\x24\x49\x5a\
-\x8c\x4b\x81\x63\x80\x4b\xd2\x07\x32\xd3\x92\xf4\x01\xcc\x62\x5b\
-\xca\xd7\xfd\xf6\x09\x1f\x87\x24\x49\x8b\xb5\x27\xa5\x4f\x5b\x95\
-\x3e\x90\x99\x5a\x1b\x00\x6c\x09\x7c\x0e\x38\x22\x7d\x20\x92\x24\
-\x0d\xc8\x21\x94\x41\xc0\xd6\xe9\x03\x99\xae\xa5\x01\xc0\x52\xe0\
-\x13\x94\xa9\x12\x49\x92\xc6\xc9\x51\xc0\xc7\x68\x68\xb7\xc0\x66\
-\x0e\x84\xb2\xcb\xdf\x73\xd2\x07\x21\x49\x52\x25\xf7\x02\xb6\x01\
-\xbe\x92\x3e\x10\x68\x67\x00\xf0\x74\xdc\x42\x51\x92\x34\xfe\x8e\
-\xa6\x7c\x3c\xe8\x9c\xf4\x81\xb4\xf0\x16\xc0\x4a\xe0\xa7\x94\x95\
-\xff\x92\x24\x8d\xbb\xab\x28\xbb\xc8\xde\x9c\x3c\x88\x16\xd6\x00\
-\xbc\x1c\x3b\x7f\x49\x52\x77\xec\x0a\xbc\x34\x7d\x10\xe9\x19\x80\
-\xcd\x80\x8b\x29\x95\x21\x49\x52\x57\x5c\x09\xec\x0d\xac\x4d\x1d\
-\x40\x7a\x06\xe0\xd1\xd8\xf9\x4b\x92\xba\x67\x37\xe0\x91\xc9\x03\
-\x48\x0f\x00\x1e\x11\x2e\x5f\x92\xa4\x94\x4e\x0f\x00\x1e\x18\x2e\
-\x5f\x92\xa4\x94\xa3\x93\x85\xa7\x07\x00\x7b\x87\xcb\x97\x24\x29\
-\x65\xcf\x64\xe1\xe9\x45\x80\x6b\x80\xe5\xe1\x63\x90\x24\x29\xe1\
-\x2e\xca\x16\xf8\x11\xe9\x19\x80\xd8\xea\x47\x49\x92\xc2\xa2\x7d\
-\x60\x7a\x00\x70\x6b\xb8\x7c\x49\x92\x52\x6e\x4b\x16\x9e\x1e\x00\
-\x9c\x17\x2e\x5f\x92\xa4\x94\x73\x93\x85\xa7\x07\x00\x67\x84\xcb\
-\x97\x24\x29\x25\xda\x07\xa6\x07\x00\x9f\x0f\x97\x2f\x49\x52\x4a\
-\xb4\x0f\x4c\xbf\x05\xb0\x0c\xb8\x1c\xd8\x39\x7c\x1c\x92\x24\x0d\
-\xd3\x35\xc0\x1e\xc0\xba\xd4\x01\xa4\x67\x00\xd6\x01\x7f\x17\x3e\
-\x06\x49\x92\x86\xed\x5d\x04\x3b\x7f\xc8\xcf\x00\x00\x6c\x03\x5c\
-\x80\xb3\x00\x92\xa4\x6e\xb8\x1a\xd8\x0f\xb8\x3d\x79\x10\xe9\x19\
-\x00\x28\xaf\x41\xbc\x28\x7d\x10\x92\x24\x0d\xc9\x0b\x09\x77\xfe\
-\x00\x4b\xd3\x07\xb0\xc1\xb9\xc0\x4e\xc0\x91\xe9\x03\x91\x24\xa9\
-\xa2\xf7\x50\xa6\xff\xe3\x5a\x19\x00\x00\x7c\x09\xd8\x1f\x38\x3c\
-\x7d\x20\x92\x24\x55\xf0\x09\xe0\x05\x40\x2f\x7d\x20\xd0\xd6\x00\
-\xa0\x07\x9c\x04\x6c\x07\x1c\x15\x3e\x16\x49\x92\x06\xa5\x47\xf9\
-\xd5\xff\x22\x60\x7d\xf8\x58\x7e\xa9\xa5\x01\x00\xc0\x24\x65\x26\
-\xe0\x6c\xe0\x18\x60\x45\xf6\x70\x24\x49\x5a\x94\x2b\x80\xe7\x52\
-\x06\x00\x4d\xfc\xf2\x9f\xd2\xda\x00\x60\xca\x39\xc0\xfb\x81\xd5\
-\xc0\xbd\x71\x20\x20\x49\x1a\x2d\x97\x03\x6f\x05\x9e\x09\x9c\x19\
-\x3e\x96\x59\xb5\xf0\x1a\xe0\xa6\x2c\x05\x8e\x05\x1e\x09\x1c\x0d\
-\xec\x0d\xec\x40\xf0\x13\x8a\x92\x24\x4d\x73\x27\x70\x1d\x70\x09\
-\x70\x2a\xf0\x75\xe0\xab\x34\x34\xdd\x2f\x75\xc9\x73\x28\xd3\x6d\
-\x89\x38\x75\x08\xf9\x75\xcd\x69\xe4\xce\xe7\xb3\x87\x90\x9f\x24\
-\x69\x40\xf6\x24\xd7\x61\xf4\x80\x23\xea\xa7\xd8\x19\x87\x93\x3d\
-\x97\x7b\xd5\x4f\x51\x1a\xbe\x16\x36\x02\x92\x6a\xb8\x14\xb8\x30\
-\x58\xfe\x73\x83\x65\x8f\x9b\x17\x06\xcb\xbe\x80\x32\xad\x2b\x49\
-\x1a\x21\x1f\x24\xf7\xab\xf1\x26\xca\x2b\xad\x5a\x9c\xed\x81\x9b\
-\xc9\x9d\xc7\x7f\xa9\x9f\xa2\x94\xe1\x0c\x80\xc6\xd9\x37\x83\x65\
-\x6f\x0b\xbc\x38\x58\xfe\xb8\x78\x29\xb0\x32\x58\xfe\x37\x82\x65\
-\x4b\x92\x16\x28\xbd\x0e\xe0\x7a\x7c\x85\x75\x31\x56\x02\x37\xe0\
-\xf3\x7f\x49\xd2\x02\x9c\x4b\xb6\x03\x79\x5d\xfd\x14\xc7\xd6\x5f\
-\x91\x3d\x77\xe7\xd4\x4f\x51\x92\x54\x4b\xba\x13\xb9\x03\xd8\xa7\
-\x76\x92\x63\x68\x2f\xca\xd7\xd2\x1c\xbc\x49\x92\x16\xe4\x40\xb2\
-\x9d\x48\x8f\xf2\x01\x10\xcd\xcf\x67\xc8\x9f\xb7\x83\xaa\x67\x29\
-\x49\xaa\xea\x4c\xf2\x9d\xc9\x63\xab\x67\x39\x3e\x7e\x97\xfc\xf9\
-\xfa\x51\xf5\x2c\x25\x49\xd5\xbd\x9a\x7c\x87\x72\x35\xb0\x4b\xed\
-\x44\xc7\xc0\x4e\xc0\x95\xe4\xcf\xd7\x9f\xd7\x4e\x54\x92\x54\xdf\
-\xbe\x94\x2f\x4d\xa6\x3b\x95\x13\x6b\x27\x3a\x06\x3e\x45\xfe\x3c\
-\x4d\xe2\xba\x0d\x49\x1a\x1b\xdf\x21\xdf\xb1\xf4\x80\x97\xd4\x4e\
-\x74\x84\xbd\x8c\xfc\xf9\xe9\x01\xdf\xaa\x9d\xa8\x24\x69\x78\x9e\
-\x4a\xbe\x63\xe9\x01\xeb\x80\xdf\xae\x9c\xeb\x28\x3a\x16\x58\x4b\
-\xfe\xfc\xf4\x80\x27\x55\xce\x55\x92\x34\x44\xcb\x28\xdf\x06\x48\
-\x77\x2e\x3d\xca\x67\x43\xf7\xaf\x9b\xee\x48\xb9\x37\xf9\x0d\x7f\
-\xa6\xe2\x02\xca\x27\xc8\x25\x49\x63\xe4\xcf\xc8\x77\x30\x53\x71\
-\x09\xb0\x77\xdd\x74\x47\xc2\x3d\x68\x67\x60\xd6\xc3\x47\x34\x92\
-\x34\x96\x56\x50\x3e\xd2\x93\xee\x64\xa6\xe2\x67\xc0\xae\x55\x33\
-\x6e\xdb\xce\xc0\x4f\xc9\x9f\x87\xa9\xb8\x99\xec\x77\x07\x24\x49\
-\x15\xbd\x83\x7c\x47\x33\x3d\xce\x02\xf6\xa8\x9a\x71\x9b\xf6\xa4\
-\x6c\xb5\x9b\xae\xff\xe9\xf1\xd6\xaa\x19\x4b\x92\xa2\xf6\x04\xee\
-\x24\xdf\xd9\x4c\x8f\x8b\x29\x3b\x16\x76\xc5\xc1\x94\x47\x20\xe9\
-\x7a\x9f\x1e\xb7\xd3\xcd\x81\x98\x24\x75\xca\x9b\xc8\x77\x38\x33\
-\xe3\x3a\xe0\xa1\x35\x93\x6e\xc4\xc3\x29\x5f\x49\x4c\xd7\xf7\xcc\
-\x78\x43\xcd\xa4\x25\x49\x6d\xd8\x16\xb8\x96\x7c\xa7\x33\x33\xd6\
-\x02\xaf\x02\x26\xea\xa5\x1e\xf5\x02\x60\x0d\xf9\x7a\x9e\x19\xd7\
-\xe0\xb3\x7f\x49\xea\x8c\x97\x92\xef\x78\xe6\x8a\x4f\x02\xab\xea\
-\xa5\x3e\x74\xab\x68\x63\x87\xbf\xb9\xe2\x4f\xea\xa5\x2e\x49\x6a\
-\xcd\x72\xca\x2a\xfc\x74\xe7\x33\x57\x5c\xc5\x78\x6c\x48\xf3\x38\
-\xe0\x32\xf2\xf5\x39\x57\x9c\x47\xb9\x16\x24\x49\x1d\xf2\x14\xf2\
-\x1d\xd0\xa6\xe2\x23\x94\x77\xe5\x47\xcd\x5e\xc0\xc7\xc9\xd7\xdf\
-\xa6\x62\x1c\x06\x59\x92\xa4\x05\xf8\x34\xf9\x4e\x68\x53\x71\x07\
-\x65\xe1\xe2\x28\x3c\xa7\xde\x1a\x38\x81\x72\xcc\xe9\x7a\xdb\x54\
-\x9c\x54\xa7\x0a\x24\x49\xa3\x60\x77\xda\xd9\x86\x76\x53\x71\x35\
-\xf0\x1a\x60\xfb\x2a\x35\xb1\x38\xab\x80\xd7\x52\x16\xd4\xa5\xeb\
-\xa9\x9f\xb8\x1e\xd8\xad\x4a\x4d\x48\x92\x46\xc6\xf1\xe4\x3b\xa4\
-\xf9\xc4\xad\xc0\x3b\x29\xef\xd3\xa7\x1d\x02\xbc\x1b\xb8\x8d\x7c\
-\xbd\xcc\x27\x9e\x59\xa3\x32\x24\x49\xa3\xe7\x73\xe4\x3b\xa5\x85\
-\xc4\xf7\x81\x3f\x66\xb8\x5b\x0a\xef\x4a\x59\x39\xff\xdf\x03\xcc\
-\x63\x98\x71\xe2\xe0\xab\x44\x1a\x3d\xe3\xfa\xbe\xb1\x34\x5f\x7b\
-\x00\x3f\x01\xb6\x4b\x1f\xc8\x02\xf5\x80\x1f\x01\x5f\x02\xbe\x0a\
-\x9c\x4e\x99\x29\x18\x84\x95\xc0\xfd\x80\x47\x51\x3e\x65\x7c\x1f\
-\x46\xb7\xed\xb8\x81\x32\x6b\x71\x55\xfa\x40\xa4\xb4\x51\xbd\x89\
-\xa5\x1a\x9e\x44\x79\x5f\x7d\x1c\xee\x8b\x49\xca\x6b\x8e\xa7\x03\
-\x3f\x07\x2e\xa2\x6c\x39\x7c\x05\x65\xba\xfe\x4e\xe0\x96\x0d\xff\
-\xec\x4a\x60\x4b\x60\x1b\xca\x9a\x88\xbd\x81\x7d\x80\x7b\x51\x3a\
-\xfe\x03\x80\x25\x43\x3b\xf2\x7a\x26\x81\xe3\x70\xf1\x9f\x24\x69\
-\x16\x6f\x20\x3f\x45\x6d\xd4\x89\x13\x90\x24\x69\x0e\x4b\x80\xcf\
-\x93\xef\xac\x8c\xc1\xc6\xc9\x8c\xc7\x2c\x86\x34\x30\xe3\x30\xd5\
-\x29\x0d\xda\xf6\x94\x05\x6e\xfb\xa7\x0f\x44\x03\xf1\x73\xe0\x48\
-\xe0\xa6\xf4\x81\x48\x2d\x71\x44\x2c\xfd\xba\x1b\x29\xeb\x01\x6e\
-\x4f\x1f\x88\x16\xed\x36\xca\x73\x7f\x3b\x7f\x49\x52\xdf\x8e\x05\
-\xee\x22\x3f\x7d\x6d\x2c\x2c\x56\x53\xde\x5a\x90\x24\x69\xde\x8e\
-\xa3\x7c\xa6\x37\xdd\x99\x19\xf3\x8b\x75\xc0\xd3\x66\x39\x9f\x92\
-\x24\xf5\xed\x78\xca\x2b\x64\xe9\x4e\xcd\xe8\x2f\x26\x81\xe7\xcd\
-\x7a\x26\x25\x49\x9a\xa7\x17\x93\xef\xd8\x8c\xfe\xe2\xe5\x73\x9c\
-\x43\x49\x92\x16\xe4\xb5\xe4\x3b\x37\x63\xe3\xf1\xea\x39\xcf\x9e\
-\x24\x49\x8b\xf0\x5c\x5c\x13\xd0\x62\xac\x03\x5e\xb4\x91\xf3\x26\
-\x49\xd2\xa2\x3d\x91\xd1\xf8\xde\x7d\x57\xe2\x2e\xe0\xa9\x1b\x3d\
-\x63\x92\x24\x0d\xc8\x43\x29\xfb\x05\xa4\x3b\xbf\xae\xc7\x8d\xc0\
-\x43\x36\x71\xae\x24\x49\x1a\xa8\xc3\x80\xcb\xc8\x77\x82\x5d\x8d\
-\x4b\x81\x43\x37\x79\x96\x24\x49\xaa\x60\x27\xca\x27\x78\xd3\x9d\
-\x61\xd7\xe2\xeb\xc0\xae\x7d\x9c\x1f\x49\x92\xaa\x99\x00\x5e\x45\
-\x59\x88\x96\xee\x18\xc7\x3d\x26\x81\x37\x01\x4b\xfb\x3a\x33\x92\
-\x24\x0d\xc1\xc3\x81\x2b\xc9\x77\x92\xe3\x1a\xd7\x00\x8f\xee\xfb\
-\x6c\x48\x92\x34\x44\x7b\x50\xa6\xa7\xd3\x9d\xe5\xb8\xc5\x57\x81\
-\xdd\xe6\x71\x1e\x24\x49\x1a\xba\x09\xe0\x39\xc0\xb5\xe4\x3b\xce\
-\x51\x8f\x1b\x81\x17\xe0\xa7\xcb\x25\x49\x23\x64\x17\xe0\xc3\xe4\
-\x3b\xd1\x51\x8d\x4f\x00\x3b\xcf\xbb\xd6\x25\x49\x6a\xc4\x63\x81\
-\x8b\xc8\x77\xa8\xa3\x12\x17\x02\x8f\x59\x48\x45\x4b\x92\xd4\x9a\
-\xad\x80\x97\x02\x57\x93\xef\x60\x5b\x8d\xeb\x28\x6f\x53\x6c\xb5\
-\xc0\x3a\x96\x24\xa9\x59\xdb\x50\x3a\xb9\x9b\xc8\x77\xb8\xad\xc4\
-\xad\x94\x57\xfb\xb6\x5d\x44\xbd\x4a\x92\x34\x12\x76\x04\xde\x46\
-\xb7\xbf\x29\x70\x3b\xf0\x66\x60\x87\x45\xd6\xa5\x24\x49\x23\x67\
-\x3b\xca\xa3\x81\x5f\x90\xef\x90\x87\x15\x17\x50\x66\x41\x76\x1c\
-\x40\xfd\x49\x92\x34\xd2\x96\x00\x8f\xa2\xac\x7c\x1f\xc7\x1d\x05\
-\xd7\x53\xde\xe5\x7f\x2a\xee\xe2\x27\x49\xd2\xac\xf6\x03\x5e\x0f\
-\x9c\x43\xbe\xe3\x5e\x6c\x9c\x0d\xfc\xcd\x86\x9c\x24\x49\x52\x9f\
-\xee\x49\x79\x44\xf0\x1d\xca\x3e\xf8\xe9\x0e\xbd\xdf\x4e\xff\x04\
-\xe0\xe0\xc1\x57\x87\xa4\x41\x71\x77\x2d\x69\x74\xec\x05\x3c\x0e\
-\x78\x30\xf0\x20\x60\xdf\xec\xe1\xfc\xd2\x2f\x80\x53\x81\xef\x02\
-\x9f\xa7\x7c\xa6\x57\x52\xe3\x1c\x00\x48\xa3\x6b\x57\xe0\x68\xca\
-\x60\xe0\x81\xc0\x41\xd4\x5f\x51\x7f\x1d\x70\x2e\xf0\x3d\x4a\x87\
-\xff\x3d\xe0\xaa\xca\x65\x4a\xaa\xc0\x01\x80\x34\x5e\xb6\xa5\x3c\
-\x36\x98\x8a\xfd\x28\x33\x07\xdb\x4f\x8b\xe5\xc0\x16\xc0\x96\x1b\
-\xfe\x9d\x3b\x80\xd5\xc0\x5a\xca\xde\xfb\x53\x71\x31\xe5\xd7\xfd\
-\xf4\xb8\x79\x48\x79\x48\xaa\xec\xff\x03\x5c\x43\x36\x05\x6e\x6e\
-\x3c\x7d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x5a\x72\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x06\x40\x00\x00\x00\xfa\x08\x06\x00\x00\x00\xf9\x8d\x8b\x8e\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\x00\x2e\x23\
-\x01\x78\xa5\x3f\x76\x00\x00\x04\xba\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
-\x69\x6e\x3d\x27\xef\xbb\xbf\x27\x20\x69\x64\x3d\x27\x57\x35\x4d\
-\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
-\x7a\x6b\x63\x39\x64\x27\x3f\x3e\x0a\x3c\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x27\x61\x64\x6f\
-\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x27\x3e\x0a\x3c\x72\
-\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\
-\x3d\x27\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\
-\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x27\x3e\x0a\
-\x0a\x20\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x27\x27\x0a\
-\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x41\x74\x74\x72\x69\x62\x3d\x27\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x74\x74\x72\x69\x62\
-\x75\x74\x69\x6f\x6e\x2e\x63\x6f\x6d\x2f\x61\x64\x73\x2f\x31\x2e\
-\x30\x2f\x27\x3e\x0a\x20\x20\x3c\x41\x74\x74\x72\x69\x62\x3a\x41\
-\x64\x73\x3e\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\x53\x65\x71\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x72\x64\x66\
-\x3a\x70\x61\x72\x73\x65\x54\x79\x70\x65\x3d\x27\x52\x65\x73\x6f\
-\x75\x72\x63\x65\x27\x3e\x0a\x20\x20\x20\x20\x20\x3c\x41\x74\x74\
-\x72\x69\x62\x3a\x43\x72\x65\x61\x74\x65\x64\x3e\x32\x30\x32\x35\
-\x2d\x30\x33\x2d\x31\x35\x3c\x2f\x41\x74\x74\x72\x69\x62\x3a\x43\
-\x72\x65\x61\x74\x65\x64\x3e\x0a\x20\x20\x20\x20\x20\x3c\x41\x74\
-\x74\x72\x69\x62\x3a\x45\x78\x74\x49\x64\x3e\x32\x32\x37\x33\x30\
-\x61\x61\x61\x2d\x34\x64\x36\x39\x2d\x34\x62\x62\x62\x2d\x38\x36\
-\x37\x35\x2d\x65\x39\x39\x61\x35\x30\x64\x65\x36\x34\x35\x66\x3c\
-\x2f\x41\x74\x74\x72\x69\x62\x3a\x45\x78\x74\x49\x64\x3e\x0a\x20\
-\x20\x20\x20\x20\x3c\x41\x74\x74\x72\x69\x62\x3a\x46\x62\x49\x64\
-\x3e\x35\x32\x35\x32\x36\x35\x39\x31\x34\x31\x37\x39\x35\x38\x30\
-\x3c\x2f\x41\x74\x74\x72\x69\x62\x3a\x46\x62\x49\x64\x3e\x0a\x20\
-\x20\x20\x20\x20\x3c\x41\x74\x74\x72\x69\x62\x3a\x54\x6f\x75\x63\
-\x68\x54\x79\x70\x65\x3e\x32\x3c\x2f\x41\x74\x74\x72\x69\x62\x3a\
-\x54\x6f\x75\x63\x68\x54\x79\x70\x65\x3e\x0a\x20\x20\x20\x20\x3c\
-\x2f\x72\x64\x66\x3a\x6c\x69\x3e\x0a\x20\x20\x20\x3c\x2f\x72\x64\
-\x66\x3a\x53\x65\x71\x3e\x0a\x20\x20\x3c\x2f\x41\x74\x74\x72\x69\
-\x62\x3a\x41\x64\x73\x3e\x0a\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x0a\x20\x3c\x72\x64\
-\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\
-\x66\x3a\x61\x62\x6f\x75\x74\x3d\x27\x27\x0a\x20\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x64\x63\x3d\x27\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\
-\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\
-\x74\x73\x2f\x31\x2e\x31\x2f\x27\x3e\x0a\x20\x20\x3c\x64\x63\x3a\
-\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\x41\
-\x6c\x74\x3e\x0a\x20\x20\x20\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\
-\x78\x6d\x6c\x3a\x6c\x61\x6e\x67\x3d\x27\x78\x2d\x64\x65\x66\x61\
-\x75\x6c\x74\x27\x3e\x49\x20\x2d\x20\x31\x3c\x2f\x72\x64\x66\x3a\
-\x6c\x69\x3e\x0a\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x41\x6c\x74\
-\x3e\x0a\x20\x20\x3c\x2f\x64\x63\x3a\x74\x69\x74\x6c\x65\x3e\x0a\
-\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\
-\x6f\x6e\x3e\x0a\x0a\x20\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\
-\x3d\x27\x27\x0a\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x70\x64\x66\x3d\
-\x27\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x70\x64\x66\x2f\x31\x2e\x33\x2f\x27\x3e\x0a\
-\x20\x20\x3c\x70\x64\x66\x3a\x41\x75\x74\x68\x6f\x72\x3e\x4d\x55\
-\x48\x41\x4d\x41\x44\x20\x53\x4f\x50\x49\x41\x4e\x41\x20\x41\x52\
-\x47\x49\x41\x4e\x53\x41\x48\x3c\x2f\x70\x64\x66\x3a\x41\x75\x74\
-\x68\x6f\x72\x3e\x0a\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\
-\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x0a\x20\x3c\x72\x64\x66\x3a\
-\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\
-\x61\x62\x6f\x75\x74\x3d\x27\x27\x0a\x20\x20\x78\x6d\x6c\x6e\x73\
-\x3a\x78\x6d\x70\x3d\x27\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\
-\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\
-\x30\x2f\x27\x3e\x0a\x20\x20\x3c\x78\x6d\x70\x3a\x43\x72\x65\x61\
-\x74\x6f\x72\x54\x6f\x6f\x6c\x3e\x43\x61\x6e\x76\x61\x20\x28\x52\
-\x65\x6e\x64\x65\x72\x65\x72\x29\x20\x64\x6f\x63\x3d\x44\x41\x47\
-\x68\x4a\x58\x59\x70\x4c\x5a\x30\x20\x75\x73\x65\x72\x3d\x55\x41\
-\x46\x52\x31\x76\x54\x6f\x71\x57\x77\x20\x62\x72\x61\x6e\x64\x3d\
-\x42\x41\x46\x4e\x42\x7a\x6b\x43\x6d\x35\x6b\x20\x74\x65\x6d\x70\
-\x6c\x61\x74\x65\x3d\x3c\x2f\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\
-\x6f\x72\x54\x6f\x6f\x6c\x3e\x0a\x20\x3c\x2f\x72\x64\x66\x3a\x44\
-\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x3c\x2f\x72\x64\
-\x66\x3a\x52\x44\x46\x3e\x0a\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\
-\x74\x61\x3e\x0a\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\
-\x64\x3d\x27\x72\x27\x3f\x3e\x9a\xc6\x87\x96\x00\x00\x55\x5e\x49\
-\x44\x41\x54\x78\x9c\xec\xd9\x41\x09\x00\x30\x0c\xc0\xc0\xd6\xbf\
-\xe9\x9a\x18\x0c\xc2\x9d\x82\xfc\xb3\x03\x00\x00\x00\x00\x00\x10\
-\xb3\xbf\x03\x00\x00\x00\x00\x00\x00\x5e\x33\x40\x00\x00\x00\x00\
-\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\
-\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\
-\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\
-\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\
-\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\
-\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\
-\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\
-\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\
-\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\
-\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\x00\
-\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\x00\
-\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\x04\
-\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\x03\
-\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\x1c\
-\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\x80\
-\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\x00\
-\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\x00\
-\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\x00\
-\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\x00\
-\x00\x00\x00\x80\x1c\x03\x04\x00\x00\x00\x00\x00\xc8\x31\x40\x00\
-\x00\x00\x00\x00\x80\x9c\x03\x00\x00\xff\xff\xec\xdd\x7b\x90\xa5\
-\x45\x79\xc7\xf1\x6f\x1b\x92\x08\x88\x02\x02\x5e\xa2\x69\x03\x12\
-\x23\x21\x05\x36\x4a\x81\x8a\x2e\x2a\x22\x8a\x17\xe4\x55\x24\x02\
-\x5e\x88\x5c\x0a\x50\x50\x04\x41\xd1\xc4\x88\x50\x49\x19\x24\x06\
-\x4a\x0d\x5e\xb0\x44\x14\x5e\x13\xb4\x16\x31\x8b\x51\xc0\x14\x10\
-\x4a\x9a\x40\x20\x80\x4a\xb4\xbd\x10\xa3\x82\xb7\x00\x6a\x01\x9d\
-\x3f\xce\x10\x97\xcd\xc2\xce\x39\xf3\xce\xf4\x39\xb3\xdf\x4f\xd5\
-\xa9\xd9\xdd\x79\xfb\x79\x7e\x55\x67\xaa\xb6\xea\x3c\xd3\xdd\x0e\
-\x40\x24\x49\x92\x24\x49\x92\x24\x49\xd2\xb2\xe3\x00\x44\x92\x24\
-\x49\x92\x24\x49\x92\x24\x2d\x3b\x0e\x40\xa4\xf5\x54\x2a\xf5\x77\
-\x80\x0d\xe6\x5e\x01\xb8\x17\xb8\x67\xee\xeb\xbd\xc0\xbd\x39\x86\
-\xbb\xdb\x25\x94\x24\x49\x92\x24\x49\x92\xa4\xc9\x39\x00\x91\x96\
-\x99\x54\xea\xe3\x81\xad\x57\x7b\x6d\x03\x3c\x1e\xd8\x1c\xd8\x0c\
-\xd8\x14\xd8\x70\x8c\x92\xbf\x00\x6e\x04\x6e\x01\xbe\x0e\x7c\x13\
-\xf8\x06\x70\x53\x8e\xe1\x67\xc3\x25\x97\x24\x49\x92\x24\x49\x92\
-\xa4\xe1\x38\x00\x91\x66\x58\x2a\x75\x47\x60\x37\x60\x77\x60\x3b\
-\xe0\x49\x4b\x1c\xe1\x1b\xc0\x97\x81\x4b\x80\x8b\x73\x0c\xb7\x2d\
-\x71\x7f\x49\x92\x24\x49\x92\x24\x49\x5a\x2b\x07\x20\xd2\x0c\x49\
-\xa5\xee\x0a\x3c\x13\x78\x16\xf0\x6c\x60\x93\xb6\x89\xfe\x9f\xeb\
-\x18\x0d\x44\x2e\xce\x31\x7c\xa1\x75\x98\x69\x97\x4a\xdd\x09\xd8\
-\x05\xf8\x62\x8e\xe1\x96\xd6\x79\x24\x49\x92\x24\x49\x92\xa4\xe5\
-\xc4\x01\x88\x34\xe5\x52\xa9\x4f\x04\x0e\x07\x0e\x02\xb6\x68\x1c\
-\x67\x1c\x77\x02\xab\x80\x0b\x80\xcf\xe7\x18\x7e\xd2\x38\xcf\x54\
-\x48\xa5\xee\x02\x1c\x00\xec\x07\xfc\x08\x78\x75\x8e\xe1\x9a\xb6\
-\xa9\x24\x49\x92\x24\x49\x92\xa4\xe5\xc7\x01\x88\x34\xa5\x52\xa9\
-\xfb\x33\x1a\x7c\xec\xd6\x3a\xcb\x40\x2e\x05\x3e\x0f\x7c\x3a\xc7\
-\x70\x6b\xeb\x30\x4b\x29\x95\xba\x15\xf0\xfa\xb9\xd7\xb6\x73\xff\
-\x7c\x5a\x8e\xe1\xcd\xed\x52\x49\x92\x24\x49\x92\x24\x49\xcb\x9b\
-\x03\x10\x69\x8a\xa4\x52\xb7\x05\xde\x08\x1c\x08\x3c\xa2\x71\x9c\
-\xc5\xf4\x69\xe0\xd4\x1c\xc3\xb5\xad\x83\x2c\xa6\x54\xea\x0a\xe0\
-\x08\xa0\x5b\xed\x9f\xbf\x03\x1c\x98\x63\xb8\xac\x49\x28\x49\x92\
-\x24\x49\x5a\x64\xa9\xd4\x04\x3c\xb2\x41\xeb\xab\x73\x0c\xb7\x37\
-\xe8\x2b\x49\x9a\x52\x0e\x40\xa4\x29\x90\x4a\x7d\x2a\xf0\x76\xe0\
-\x65\xad\xb3\x2c\xb1\x4b\x80\xf7\xe5\x18\x56\xb6\x0e\x32\xa4\x54\
-\xea\x01\xc0\x9b\x81\xa7\xac\xf1\xad\x4f\x00\x47\xe5\x18\x7e\xbe\
-\xf4\xa9\x24\x49\x92\x24\x69\x69\xa4\x52\xbf\x04\x3c\xb7\x41\xeb\
-\x17\xe6\x18\x2e\x6a\xd0\x57\x92\x34\xa5\x36\x68\x1d\x40\x5a\x9f\
-\xa5\x52\xf7\x01\xde\x0a\xec\xda\x3a\x4b\x23\x2b\x80\x15\xa9\xd4\
-\x5b\x80\xf7\xe6\x18\x3e\xda\x38\xcf\xc4\x52\xa9\x1b\x02\x87\x31\
-\x7a\x3f\x1f\xb3\xc6\xb7\x6f\x07\x0e\xce\x31\x5c\xb0\xe4\xc1\x24\
-\x49\x92\x24\x49\x92\xa4\xf5\x94\x03\x10\xa9\x81\x54\xea\xc1\xc0\
-\xf1\xfc\xe6\x3e\x88\xf5\xdd\x36\xc0\x47\x52\xa9\xc7\x00\x6f\xc9\
-\x31\xac\x6a\x1d\x68\xbe\x56\x1b\x7c\x9c\x00\x6c\xb9\x96\x47\xae\
-\x06\xf6\xc9\x31\x7c\x77\x49\x83\x49\x92\x24\x49\x92\x24\x49\xeb\
-\x39\x07\x20\xd2\x12\x4a\xa5\x3e\x13\xf8\x30\xf0\xe4\xd6\x59\xa6\
-\xd4\xf6\xc0\x3f\xa5\x52\x2f\x06\xde\x94\x63\xb8\xb1\x75\xa0\x07\
-\x92\x4a\xdd\x18\x38\x92\xd1\x20\x6b\xb3\x07\x78\xec\x8c\x1c\xc3\
-\x91\x4b\x97\x4a\x92\x24\x49\x92\x24\x49\xd2\x7d\x1c\x80\x48\x4b\
-\x20\x95\xba\x25\xf0\x37\xc0\x01\x4b\xd8\xf6\x66\xe0\xa6\xd5\xbe\
-\xfe\x27\x70\xe7\xdc\xeb\xae\xfb\xfe\x7c\xdf\x7d\x14\xa9\xd4\xcd\
-\x81\x8d\x57\x7b\x6d\x04\x3c\x0e\xd8\x7a\xee\xf5\x07\x73\x5f\xe3\
-\x12\x64\xdf\x03\xf8\x8f\x54\xea\x27\x80\xe3\x72\x0c\xff\xbd\x04\
-\x3d\xe7\x25\x95\xba\x29\x70\x34\xa3\xcb\xea\x1f\x68\xf0\xf1\x4b\
-\xe0\x0d\x39\x86\x4f\x2e\x59\x30\x49\x92\x24\x49\x92\x24\x49\xf7\
-\xe3\x00\x44\x5a\x64\xa9\xd4\x23\x80\xf7\x00\x9b\x2e\x62\x9b\xdb\
-\x80\x0b\x81\x55\xc0\xd5\x39\x86\x9b\xc6\x2d\x90\x63\xb8\x9d\xd1\
-\x5d\x15\xeb\x94\x4a\x7d\x16\xb0\x0b\xf0\x0c\xe0\xe9\xc0\x16\xe3\
-\xf6\x9b\xa7\x83\x80\xbd\x53\xa9\x47\xe5\x18\x3e\xb5\x48\x3d\xe6\
-\x25\x95\xfa\x50\xe0\x1d\xc0\x9b\x80\x87\x3d\xc8\xa3\xdf\x06\x5e\
-\x92\x63\xf8\xf7\xa5\xc8\x25\x49\x92\x24\x49\x92\x24\x69\xed\x1c\
-\x80\x48\x8b\x24\x95\xba\x1d\x70\x0e\xb0\xe3\x22\xb5\xb8\x1c\xb8\
-\x08\xf8\x62\x8e\xe1\x6b\x8b\xd4\x63\xad\x72\x0c\x97\x01\x97\xdd\
-\xf7\xf7\x54\xea\x1f\x02\x2f\x00\xf6\x05\x9e\x35\x70\xbb\xcd\x81\
-\x73\x52\xa9\x2f\x03\x0e\x9b\x1b\xd4\x2c\xa9\x54\x6a\xc7\x68\x07\
-\xcf\xe3\xd7\xf1\xe8\x05\xc0\x6b\xee\xdb\x55\x23\x49\x92\x24\x49\
-\x92\x24\xa9\x9d\xd0\x3a\x80\xb4\x1c\xa5\x52\x5f\x09\x7c\x8c\xd1\
-\x31\x52\x43\xfa\x67\xe0\x3c\xe0\xfc\x1c\xc3\x4f\x06\xae\x3d\x88\
-\x54\xea\x16\xc0\x7e\xc0\xcb\x81\xe7\x0c\x5c\xfe\xc7\xc0\xeb\x72\
-\x0c\x2b\x07\xae\xbb\x56\xa9\xd4\x27\x00\x67\x02\x7b\xcd\xe3\xf1\
-\x13\x73\x0c\xa7\x2c\x6e\x22\x49\x92\x24\x49\x9a\x7e\xa9\xd4\x2f\
-\x01\xcf\x6d\xd0\xfa\x85\x39\x86\x8b\x1a\xf4\x95\x24\x4d\x29\x07\
-\x20\xd2\xc0\x52\xa9\xa7\x31\xba\x23\x62\x28\x5f\x01\xce\x07\x3e\
-\xd3\x62\xf7\xc3\x42\xa4\x52\xb7\x02\x5e\x0f\x1c\xc2\xe8\x0e\x91\
-\xa1\x7c\x1c\x38\x3c\xc7\xf0\xcb\x01\x6b\xfe\x9f\x54\xea\xc3\x19\
-\x1d\x77\xf5\xd6\x79\x2e\xe9\x72\x0c\x9f\x5d\x8c\x2c\x93\xea\xba\
-\xee\xb7\x81\x87\x36\x8e\x71\x57\xdf\xf7\x77\x37\xce\xb0\x24\xba\
-\xae\x0b\x3c\xf8\xd1\x68\x4b\xe1\x57\x7d\xdf\xff\xba\x71\x06\x49\
-\xd2\x5a\xa4\x52\x7f\x8b\xf6\xff\x4f\x68\xfe\xee\xce\x31\xdc\xd1\
-\x3a\x84\x34\xcb\x1c\x80\x48\x92\xa6\x85\x47\x60\x49\x03\x49\xa5\
-\x3e\x1a\xf8\x1c\xb0\xf3\x40\x25\x3f\x08\x9c\x92\x63\xf8\xce\x40\
-\xf5\x96\x5c\x8e\xe1\x87\xc0\xa9\xc0\xa9\xa9\xd4\x15\xc0\x9f\x31\
-\x3a\x26\x6b\xa1\x1f\xcc\xbf\x16\xd8\x21\x95\xba\x77\x8e\xe1\xd6\
-\x05\xd6\xba\x9f\x54\xea\xd1\xc0\x49\x8c\x8e\xde\x5a\x97\x9f\x00\
-\x7b\xe5\x18\xfe\x75\xc8\x0c\x03\xd9\x09\xb8\xa2\x71\x86\xf3\x18\
-\xed\x06\x5a\x1f\x1c\x05\x9c\xde\x38\xc3\xb3\x59\xed\x68\x3a\x49\
-\xd2\x54\x79\x0e\xa3\xbb\xda\x34\x1b\xae\x01\x52\xeb\x10\x92\x24\
-\x49\x5a\xb8\x87\xb4\x0e\x20\x2d\x07\xa9\xd4\xdd\x80\x7f\x63\x98\
-\xe1\xc7\xe9\xc0\x63\x73\x0c\x87\xcf\xf2\xf0\x63\x4d\x39\x86\x4b\
-\x72\x0c\x07\x30\xda\x09\xf2\xd1\x01\x4a\x3e\x05\xb8\x26\x95\xba\
-\xcb\x00\xb5\x48\xa5\xee\x99\x4a\xbd\x05\x38\x8d\xf9\x0d\x3f\xbe\
-\x05\xec\x3c\xa5\xc3\x0f\xfa\xbe\xbf\x92\xd1\x9d\x24\x2d\x75\x5d\
-\xd7\xfd\x71\xe3\x0c\x8b\xae\xeb\xba\xdf\x05\x8e\x6f\x1c\x63\x65\
-\xdf\xf7\x0e\x3f\x24\x49\x92\x24\x49\x92\x56\xe3\x00\x44\x5a\xa0\
-\x54\xea\x41\x8c\x7e\xeb\xfa\x51\x0b\x2c\xf5\x3e\x60\xab\x1c\xc3\
-\xd1\x39\x86\xff\x5a\x78\xb2\xe9\x94\x63\xf8\x41\x8e\xe1\x60\x60\
-\x07\xe0\x92\x05\x96\xdb\x0a\xb8\x22\x95\xfa\xda\x49\x0b\xa4\x52\
-\x1f\x95\x4a\x3d\x1f\xf8\x22\xb0\xf5\x3c\x97\x5d\x01\x3c\x35\xc7\
-\xf0\xcd\x49\xfb\x2e\x91\x13\x80\x96\x47\x50\x3d\x04\x78\x57\xc3\
-\xfe\x4b\xe5\x08\xe0\xb1\x0d\xfb\xdf\x03\xbc\xad\x61\x7f\x49\x92\
-\x24\x49\x92\xa4\xa9\xe4\x00\x44\x5a\x80\x54\xea\x89\xc0\xd9\x0b\
-\x2c\x73\x21\x10\x73\x0c\xc7\xe6\x18\x7e\x34\x40\xac\x99\x90\x63\
-\xb8\x2e\xc7\xb0\x3b\xf0\x32\x60\xa1\x83\x84\x8f\xa5\x52\xdf\x31\
-\xee\xa2\x54\xea\xa1\xc0\xcd\x40\x37\xc6\xb2\xf3\x73\x0c\x4f\x9f\
-\x85\xfb\x58\xfa\xbe\xbf\x89\x85\xff\x7c\x2e\xd4\xbe\x5d\xd7\x6d\
-\xdf\x38\xc3\xa2\xe9\xba\x6e\x43\xe0\xb8\xc6\x31\xce\xee\xfb\xfe\
-\x86\xc6\x19\x24\x49\x92\x24\x49\x92\xa6\x8e\x03\x10\x69\x42\xa9\
-\xd4\x0f\x01\x27\x2f\xa0\xc4\xf7\x80\xbd\x73\x0c\x7b\x2f\xa7\xa3\
-\xae\xc6\x95\x63\xf8\x5c\x8e\x61\x5b\xe0\x44\xe0\xae\x09\xcb\xac\
-\x02\xce\x9a\xef\xc3\xa9\xd4\xad\x53\xa9\x97\x31\xba\x67\xe5\x11\
-\x63\xf4\x79\x7f\x8e\xe1\x95\xe3\x86\x6b\xec\x9d\xc0\x9d\x0d\xfb\
-\x3f\x04\xf8\xf3\x86\xfd\x17\xdb\x91\x2c\x7c\xf7\xd7\x42\xdc\xc9\
-\xe8\x3d\x96\x24\x49\x92\x24\x49\xd2\x1a\x1c\x80\x48\x13\x48\xa5\
-\x7e\x01\x38\x64\x01\x25\xde\x0b\x6c\x9b\x63\xb8\x70\xa0\x48\x33\
-\x2f\xc7\x70\x0a\xf0\x44\xe0\x33\x63\x2e\x3d\x3e\xc7\xb0\x67\x8e\
-\xe1\x07\xf3\x79\x38\x95\x7a\x1c\x70\x03\xb0\xdb\x98\x7d\x4e\xca\
-\x31\x1c\x33\xe6\x9a\xe6\xfa\xbe\xbf\x15\xf8\xbb\xc6\x31\x5e\xde\
-\x75\xdd\x9f\x34\xce\x30\xb8\xae\xeb\x36\x06\x8e\x6d\x1c\xe3\x6f\
-\xfb\xbe\xff\x7e\xe3\x0c\x92\x24\x49\x92\x24\x49\x53\x69\x83\xd6\
-\x01\xa4\x59\x92\x4a\x7d\x04\xa3\x23\xab\x9e\x31\x61\x89\x6f\x02\
-\x5d\x8e\xe1\xda\xe1\x52\x2d\x1f\x39\x86\x5b\x81\x57\xcd\xed\xae\
-\xf9\x04\xf0\xb8\x07\x79\xfc\xdb\xc0\x2b\x72\x0c\x5f\x9b\x4f\xed\
-\x54\xea\x1f\xcd\xd5\x7c\xda\x04\xd1\x0e\xcb\x31\x7c\x68\x82\x75\
-\xd3\xe2\x14\xe0\x0d\xc0\x66\x8d\xfa\x07\x46\xbb\x40\xf6\x6d\xd4\
-\x7f\xb1\x1c\xc5\xe8\x1e\x9a\x56\x6e\x03\x4e\x6d\xd8\x5f\x92\x24\
-\x49\x92\x24\x69\xaa\xb9\x03\x44\x9a\xa7\x54\xea\x43\x81\x8b\x98\
-\x7c\xf8\x71\x1e\x90\x1c\x7e\xac\x5b\x8e\xe1\x2b\xc0\x53\x80\x4b\
-\x1f\xe0\x91\xcf\x00\x3b\x8c\x31\xfc\x38\x16\xb8\x91\xc9\x86\x1f\
-\xfb\xcf\xf8\xf0\x83\xbe\xef\x7f\x4a\xfb\x0f\xca\xf7\xe9\xba\x6e\
-\x87\xc6\x19\x06\xd3\x75\xdd\xc3\x80\xb7\x34\x8e\x71\x72\xdf\xf7\
-\x3f\x6b\x9c\x41\x92\x24\x49\x92\x24\x69\x6a\x39\x00\x91\xe6\xef\
-\x1f\x80\x5d\x27\x5c\x7b\x44\x8e\x61\xbf\x1c\xc3\x2f\x86\x0c\xb4\
-\x9c\xe5\x18\x7e\x9c\x63\x58\x01\xbc\x7f\x8d\x6f\x1d\x9a\x63\x78\
-\x55\x8e\xe1\xe7\xeb\xaa\x91\x4a\x8d\x73\x77\x7d\xfc\xf5\x84\x31\
-\x5e\x9a\x63\xf8\xf4\x84\x6b\xa7\xcd\xe9\xc0\x77\x1b\xf6\xbf\x6f\
-\x17\xc8\x72\x71\x34\xb0\x45\xc3\xfe\xdf\x02\xce\x68\xd8\x5f\x92\
-\x24\x49\x92\x24\x69\xea\x39\x00\x91\xe6\x21\x95\x7a\x0e\xb0\xd7\
-\x04\x4b\x0b\xa3\x5d\x1f\x67\x0e\x1c\x69\xbd\x31\x77\xef\xc6\x9f\
-\x02\x57\x01\x4f\xce\x31\x7c\x78\x3e\xeb\x52\xa9\x87\x02\xd7\x33\
-\xfe\x5d\x1f\x00\xff\x03\xac\xc8\x31\x7c\x7e\x82\xb5\x53\xa9\xef\
-\xfb\x5f\x01\x7f\xd1\x38\xc6\x4b\xbb\xae\xdb\xb1\x71\x86\x05\xeb\
-\xba\xee\xe1\x40\xeb\xfb\x60\x4e\xea\xfb\xfe\xd7\x8d\x33\x48\x92\
-\x24\x49\x92\x24\x4d\x35\xef\x00\x91\xd6\x21\x95\x7a\x26\xa3\x0f\
-\xe0\xc7\x75\x1d\xb0\x47\x8e\xe1\x87\x03\x47\x5a\xef\xe4\x18\xce\
-\x05\xce\x9d\xcf\xb3\xa9\xd4\x27\x00\x1f\x05\x76\x9f\xb0\xdd\x1d\
-\xc0\x73\x73\x0c\x57\x4d\xb8\x7e\x9a\x7d\x0c\x78\x33\xb0\x5d\xa3\
-\xfe\x81\xd1\x10\xe6\xa5\x8d\xfa\x0f\xe5\x18\x60\xf3\x86\xfd\xaf\
-\x01\x3e\xd5\xb0\xbf\x24\x49\x92\x24\x49\xd2\x4c\x70\x07\x88\xf4\
-\x20\x52\xa9\xef\x02\x0e\x9f\x60\xe9\x55\xc0\x33\x1d\x7e\x2c\xad\
-\x54\xea\x2b\x81\x1b\x98\x7c\xf8\x71\x27\xf0\xbc\x65\x3a\xfc\xa0\
-\xef\xfb\x7b\x81\xb7\x37\x8e\xf1\xe2\xae\xeb\x52\xe3\x0c\x13\xeb\
-\xba\x6e\x53\x46\xc7\x5f\xb5\x74\x7c\xdf\xf7\xb5\x71\x06\x49\x92\
-\x24\x49\x92\xa4\xa9\xe7\x00\x44\x7a\x00\xa9\xd4\x17\x33\xd9\x9d\
-\x05\xab\x18\x1d\x9f\xe4\x7d\x1f\x4b\x24\x95\xba\x51\x2a\xf5\x6c\
-\x46\x97\xa3\x6f\xb4\x80\x52\x7b\xe5\x18\xae\x1c\x28\xd6\x54\xea\
-\xfb\xfe\x02\xe0\xf2\x86\x11\x66\xfd\x2e\x90\xb7\x00\x9b\x36\xec\
-\x7f\x71\xdf\xf7\x17\x37\xec\x2f\x49\x92\x24\x49\x92\x34\x33\x1c\
-\x80\x48\x6b\x91\x4a\xdd\x16\x38\x67\x82\xa5\x9f\xcc\x31\xec\x99\
-\x63\xb8\x6b\xe8\x4c\x5a\xbb\x54\xea\x8e\xc0\xb5\xc0\x41\x0b\x2c\
-\xb5\x77\x8e\xe1\xb2\x01\x22\xcd\x82\xe3\x1b\xf7\x7f\x71\xd7\x75\
-\x3b\x35\xce\x30\xb6\xae\xeb\x36\x03\xde\xd8\x30\xc2\xbd\xb4\x7f\
-\xef\x24\x49\x92\x24\x49\x92\x66\x86\x03\x10\x69\xed\x3e\x07\x6c\
-\x32\xe6\x9a\x73\x73\x0c\x07\x2e\x46\x18\xad\x5d\x2a\xf5\x48\x46\
-\xf7\x21\x3c\x71\x81\xa5\xf6\xc9\x31\x5c\x38\x40\xa4\x99\xd0\xf7\
-\xfd\xbf\x00\x2b\x1b\xc7\x68\x7d\x21\xfb\x24\xde\x0a\x3c\xbc\x61\
-\xff\x73\xfb\xbe\xbf\xa6\x61\x7f\x49\x92\x24\x49\x92\xa4\x99\xe2\
-\x00\x44\x5a\x43\x2a\xf5\x83\xc0\x93\xc7\x5c\xb6\x32\xc7\x30\xc9\
-\x45\xe9\x9a\x40\x2a\x75\x93\x54\xea\x67\x81\x0f\x0c\x50\xee\x75\
-\x39\x86\x0b\x06\xa8\x33\x6b\x4e\x00\xee\x69\xd8\xff\x45\x5d\xd7\
-\x3d\xad\x61\xff\xb1\x74\x5d\xf7\x48\xe0\xc8\x86\x11\x7e\x45\xfb\
-\xfb\x5b\x24\x49\x92\x24\x49\x92\x66\x8a\x03\x10\x69\x35\xa9\xd4\
-\xfd\x81\x43\xc7\x5c\xf6\x55\xe0\x15\x8b\x10\x47\x6b\x91\x4a\xdd\
-\x9e\xd1\xae\x8f\x97\x0f\x50\xee\xc8\x1c\xc3\xc7\x07\xa8\x33\x73\
-\xfa\xbe\xbf\x1e\xf8\x64\xe3\x18\xb3\xb4\x0b\xe4\x38\xc6\xdf\x15\
-\x36\xa4\x33\xfb\xbe\x2f\x0d\xfb\x4b\x92\x24\x49\x92\x24\xcd\x1c\
-\x07\x20\xd2\x9c\x54\xea\x36\xc0\xdf\x8f\xb9\x2c\x03\x2f\xca\x31\
-\xfc\x72\x11\x22\x69\x0d\xa9\xd4\x3d\x80\x2b\x81\x6d\x06\x28\xf7\
-\xde\x1c\xc3\x19\x03\xd4\x99\x65\x27\x01\x2d\x7f\x76\xf7\xea\xba\
-\x6e\xe7\x86\xfd\xe7\xa5\xeb\xba\x2d\x81\x23\x1a\x46\xf8\x19\xf0\
-\x9e\x86\xfd\x25\x49\x92\x24\x49\x92\x66\x92\x03\x10\xe9\x37\xce\
-\x02\x36\x1e\xe3\xf9\x6f\x01\xcf\xcf\x31\xfc\x62\x91\xf2\x68\x35\
-\xa9\xd4\x83\x80\x55\x8c\xf7\x1e\x3d\x90\x4f\xe5\x18\xd6\xfb\xe3\
-\x84\xfa\xbe\xff\x2e\x70\x66\xe3\x18\xb3\xb0\x0b\xe4\x6d\x0c\xf3\
-\x73\x37\xa9\x53\xfb\xbe\xbf\xbd\x61\x7f\x49\x92\x24\x49\x92\xa4\
-\x99\xe4\x00\x44\x02\x52\xa9\xfb\x01\x2b\xc6\x5c\xb6\x4f\x8e\xe1\
-\xb6\x45\x88\xa3\x35\xa4\x52\xff\x12\x38\x7b\xa0\x72\x5f\xce\x31\
-\xbc\x7a\xa0\x5a\xcb\xc1\xc9\x8c\x76\x18\xb4\xf2\x82\xae\xeb\x76\
-\x69\xd8\xff\x41\x75\x5d\xf7\x28\xe0\xb0\x86\x11\xbe\x07\xbc\xbf\
-\x61\x7f\x49\x92\x24\x49\x92\xa4\x99\xe5\x00\x44\xeb\xbd\x54\xea\
-\x26\x8c\xff\x01\xe3\x1b\x73\x0c\xd7\x2e\x46\x1e\xdd\xdf\xdc\x65\
-\xe7\xef\x18\xa8\xdc\xf5\xc0\x4b\x06\xaa\xb5\x2c\xcc\xed\x2c\xf8\
-\xab\xc6\x31\xa6\x79\x17\xc8\x09\xc0\x46\x0d\xfb\xbf\xab\xef\x7b\
-\x8f\xd8\x93\x24\x49\x92\x24\x49\x9a\x80\x03\x10\x09\xde\x09\x3c\
-\x7a\x8c\xe7\xff\x31\xc7\xf0\x81\xc5\x0a\xa3\x91\x54\xea\xe6\xa9\
-\xd4\xcb\x19\xe6\xb2\x73\x18\xfd\x26\xfd\x1e\x39\x86\x3b\x06\xaa\
-\xb7\x9c\x9c\x06\xdc\xda\xb0\xff\xf3\xbb\xae\xdb\xb5\x61\xff\xb5\
-\xea\xba\xee\x31\xc0\x21\x0d\x23\xdc\x00\x7c\xbc\x61\x7f\x49\x92\
-\x24\x49\x92\xa4\x99\xe6\x00\x44\xeb\xb5\x54\xea\x93\x80\x63\xc7\
-\x58\xf2\x7d\xe0\x35\x8b\x14\x47\x73\x52\xa9\x5b\x01\x5f\x05\x86\
-\xfa\x50\xfc\xa7\xc0\xf3\x72\x0c\x3f\x18\xa8\xde\xb2\xd2\xf7\xfd\
-\x5d\xc0\xbb\x1b\xc7\x98\xc6\x5d\x20\x6f\x07\x36\x6c\xd8\xff\x6d\
-\x7d\xdf\xdf\xdb\xb0\xbf\x24\x49\x92\x24\x49\xd2\x4c\x73\x00\xa2\
-\xf5\xdd\x47\xc6\x7c\x7e\x5f\x2f\x3d\x5f\x5c\xa9\xd4\xdf\x07\xae\
-\x00\xb6\x1b\xb0\xec\x2b\x72\x0c\x37\xaf\xa3\xef\xf6\x03\xf6\x9b\
-\x45\x67\x01\x5f\x6f\xd8\x7f\x8f\xae\xeb\x9e\xde\xb0\xff\xfd\x74\
-\x5d\xf7\x7b\xc0\xc1\x0d\x23\x5c\xda\xf7\xfd\xca\x86\xfd\x25\x49\
-\x92\x24\x49\x92\x66\xde\xff\x02\x00\x00\xff\xff\xec\xdd\x79\xbc\
-\x1d\x45\x95\xc0\xf1\x5f\x1b\x02\x84\x84\x45\x50\x59\x04\x5a\x96\
-\x20\x9b\x08\xc5\x2e\x61\x0f\x08\xc8\x3e\x07\x5c\x00\x07\x10\x75\
-\x1c\x40\x90\x0f\x23\x61\x19\x12\x11\x14\x11\x51\x61\x60\x50\x46\
-\x10\x01\xb7\x14\x1a\x04\x27\x2c\x83\x18\x01\x09\x22\x0d\xb8\x30\
-\x40\x00\xa9\x51\x59\x47\xf6\xb0\xc8\x52\xf3\x47\x75\x86\x47\x78\
-\x4b\xdf\x7b\xbb\xbb\xba\xef\x3d\xdf\xcf\xe7\x7d\xf4\x93\xf4\xad\
-\x73\x78\x2f\xf5\xee\xed\xae\xaa\x73\x74\x01\x44\x0d\x2c\xe3\xfc\
-\xee\xc0\x56\x1d\xbc\xe4\xec\x2c\x4d\x6e\xad\x2a\x1f\x05\xc6\xf9\
-\xc9\x84\xc5\x8f\xd5\x4b\x1c\xf6\xf8\x2c\x4d\xfe\x6b\x8c\xb8\xbb\
-\x03\xb7\x19\xe7\x57\x29\x31\x6e\xab\x58\x6b\x5f\x23\x9c\x78\x88\
-\xa9\x49\xa7\x40\x4e\x02\x16\x8f\x14\xdb\x03\xc7\x45\x8a\xad\x94\
-\x52\x4a\x29\xa5\x94\x52\x4a\x29\xd5\x37\x92\xd8\x09\x28\x15\x8b\
-\x71\xfe\x36\x60\x93\x82\x97\x3f\x02\xac\x95\xa5\xc9\xf3\x15\xa6\
-\x34\xd0\x8c\xf3\x1b\x01\xff\x05\x2c\x5b\xe2\xb0\xb3\xb2\x34\xd9\
-\x67\x8c\xb8\x1b\x02\x37\x13\x1a\x5d\x7f\x27\x4b\x93\xc3\x4a\x8c\
-\xdf\x3a\x22\x72\x2b\xb0\x59\xc4\x14\xb6\xb6\xd6\xde\x14\x31\x3e\
-\x22\xb2\x0a\x30\x0f\x58\x2c\x52\x0a\xd6\x5a\xbb\x5f\xa4\xd8\x4a\
-\x29\xa5\x2a\x60\x9c\x5f\x1a\xd8\x20\x76\x1e\x23\xd8\x1b\x38\x26\
-\x42\xdc\xf9\xc0\xae\x11\xe2\x16\xf1\x6c\x96\x26\x77\xc5\x4e\x42\
-\xa9\x36\x33\xce\x5f\x07\x4c\x8d\x10\x7a\xb7\x2c\x4d\x66\x47\x88\
-\xab\x94\x52\xaa\xa1\x16\x89\x9d\x80\x52\x31\x18\xe7\xa7\x52\x7c\
-\xf1\x03\xe0\xb3\xba\xf8\x51\x1d\xe3\xfc\xc6\xc0\x2f\x80\xa5\x4a\
-\x1c\xf6\x01\xe0\xa0\x31\xe2\xae\x00\xcc\x26\x2c\x7e\x00\x7c\xc2\
-\x38\x7f\x66\x96\x26\xf7\x94\x98\x47\xdb\x4c\x23\xfc\x2c\x62\xf9\
-\x02\xb0\x63\xc4\xf8\x00\xff\x4a\xbc\xc5\x8f\x57\x80\x13\x22\xc5\
-\x56\x4a\x29\x55\x91\x2c\x4d\x9e\x21\xf4\x37\x6b\x1c\xe3\xbc\x89\
-\x14\xfa\xf5\x2c\x4d\x1a\xf9\x3d\x51\x4a\x95\xe2\xd5\xd8\x09\x28\
-\xa5\x94\x52\xa0\x25\xb0\xd4\xe0\x9a\xde\xc1\xb5\xb3\xb3\x34\xb1\
-\x95\x65\x32\xe0\x8c\xf3\xdb\x00\xbf\xa2\xdc\xc5\x8f\xe7\x81\xdd\
-\x47\x5b\xb4\x32\xce\x4f\x04\xae\x01\x56\x58\xe8\xaf\x66\x94\x98\
-\x47\xeb\x58\x6b\x6f\x20\x7c\x5f\x62\xd9\x41\x44\xb6\x89\x15\x5c\
-\x44\x52\xe0\x1f\x63\xc5\x07\x2e\xb0\xd6\xce\x8b\x18\x5f\x29\xa5\
-\x94\x52\x4a\xa9\x32\xfc\x3d\x76\x02\x4a\x29\xa5\x14\xe8\x02\x88\
-\x1a\x40\xc6\xf9\xad\x81\x29\x1d\xbc\xe4\xf0\xaa\x72\x19\x74\xc6\
-\xf9\x9d\x80\xab\x79\xe3\x04\x46\x59\x0e\x2a\x70\x8a\xe3\x32\x86\
-\x2f\x45\xf1\x61\xe3\x7c\x5a\x72\x3e\x6d\x33\x0d\x78\x3d\x62\xfc\
-\x19\x11\x63\x4f\x07\x16\x8d\x14\xfb\x79\x9a\xd5\x07\x45\x29\xa5\
-\x94\x52\x4a\xa9\x6e\xbd\x14\x3b\x01\xa5\x94\x52\x0a\x74\x01\x44\
-\x0d\xa6\x93\x3a\xb8\xf6\xbc\x2c\x4d\xfe\x54\x59\x26\x03\xcc\x38\
-\x3f\x05\xb8\x16\x98\x50\xf2\xd0\x5f\xc9\xd2\x64\xd6\x18\xb1\x4f\
-\x03\xf6\x1a\xe5\x92\x23\xcb\x4d\xa9\x5d\xac\xb5\x77\x02\x3f\x8c\
-\x98\xc2\xf6\x22\xb2\x6d\xdd\x41\x45\x64\x0d\xe0\xc0\xba\xe3\x0e\
-\x71\xa6\xb5\xf6\xf1\x88\xf1\x95\x52\x4a\x29\xa5\x94\x2a\xcb\xcb\
-\xb1\x13\x50\x4a\x29\xa5\x40\x17\x40\xd4\x80\xc9\x1b\x5e\xef\xdc\
-\xc1\x4b\xce\xa8\x2a\x97\x41\x96\xf7\xfc\xb8\xba\x82\xa1\x6f\xcc\
-\xd2\x64\xda\x18\xb1\x3f\xc2\xd8\x3d\x16\x0e\x33\xce\x97\x7d\x2a\
-\xa5\x6d\x4e\x24\xee\x4d\x4b\x8c\x93\x10\x27\x03\xe3\x23\xc4\x05\
-\x78\x14\xf8\x5a\xa4\xd8\x4a\x29\xa5\x94\x52\x4a\x95\x4d\x17\x40\
-\x94\x52\x4a\x35\x82\x36\x41\x57\x83\xe6\xd0\x0e\xae\xfd\x5e\x96\
-\x26\xae\xb2\x4c\x06\x94\x71\x7e\x6d\xc2\xc9\x8f\x89\x25\x0f\xfd\
-\x04\xb0\xdf\x18\xb1\x37\x01\x2e\x2a\x30\xd6\xd2\xc0\xc1\xc0\x79\
-\xbd\xa7\xd5\x4e\xd6\xda\x87\x44\xe4\xdb\xc4\x3b\x0d\xb3\xad\x88\
-\xec\x60\xad\xad\xa5\x21\xbb\x88\x4c\x06\x3e\x56\x47\xac\x11\x9c\
-\x62\xad\x1d\xb1\x67\xcd\xa0\x13\x91\x65\x80\x94\xd0\x2b\x68\x22\
-\xa1\x6c\xde\x12\x84\x13\x64\x4b\x10\x4a\xb6\xbd\x9c\x7f\xbd\x04\
-\x3c\x09\x3c\x06\x3c\x0e\x3c\x61\xad\x7d\x2d\x42\xda\x4a\xa9\x06\
-\x10\x91\x45\x81\xf7\x00\x2b\x13\xfa\x7e\x4d\x24\xfc\xee\x48\x08\
-\x0d\x7a\x5f\x21\x94\x20\x7c\x9a\xf0\xbb\xe3\xcf\xc0\x23\xd6\xda\
-\x98\xa5\x20\x95\xaa\x4d\xbe\xe9\x67\x0d\xe0\x9d\xbc\xf1\x1e\x3b\
-\x61\xc8\xff\x7f\x1b\x6f\xbc\xc7\xbe\x08\x3c\x4b\xd8\xb8\xf1\x28\
-\xf0\x70\x96\x26\x5a\xe6\xa8\x21\x8c\xf3\xcb\x03\x6b\x11\xee\x65\
-\x26\x11\x3e\x37\x2d\x49\xf8\x19\x3e\x47\xf8\xd9\x2d\xf8\xdf\xbf\
-\x00\x0f\x66\x69\xe2\x2b\x4c\xe9\xe9\x0a\xc7\x56\x1d\xd2\xb9\xae\
-\x94\x1a\x64\xba\x00\xa2\x06\x4d\x27\x0f\x38\x4f\xaf\x2c\x8b\x01\
-\x65\x9c\x5f\x03\xb8\x01\x58\xb6\x82\xe1\x25\x4b\x93\xc7\xc6\xb8\
-\x66\x7d\x60\xf1\x82\xe3\x1d\xc2\x00\x2f\x80\xe4\xbe\x48\x58\x08\
-\x5a\x32\x52\xfc\x19\x40\x2d\x0b\x20\x79\xac\x58\xef\x89\xf3\x80\
-\x0b\x22\xc5\x6e\x0c\x11\x59\x0c\x30\xc0\xe6\xc0\xda\xc0\xaa\x43\
-\xbe\x7a\xf9\x37\xf8\xaa\x88\x38\xe0\x7e\xe0\x3e\xe0\x0f\xc0\xad\
-\xc0\x1f\x74\x61\x44\xa9\xfe\x23\x22\x29\x30\x15\xd8\x0e\xd8\x10\
-\x78\x2f\x9d\x9f\xee\x7b\x45\x44\x1e\x04\x7e\x07\x7c\xd8\x5a\x5b\
-\xe5\x03\x42\xa5\x2a\x67\x9c\x4f\x80\xf7\x03\x5b\x11\x3e\x0f\xaf\
-\x42\x58\x14\x5c\x19\x58\xae\x87\xa1\xbd\x71\xfe\x31\xe0\x41\xe0\
-\x01\xe0\x5e\xc2\x7b\xec\x2d\x59\x9a\xcc\xef\x29\x69\x35\x2a\xe3\
-\xfc\xfa\xc0\xae\x84\xdf\x73\x6b\xe6\x5f\x9d\xde\x63\xcd\x37\xce\
-\x3f\x40\xf8\x2c\x7a\x0f\xe1\x3e\x6d\x4e\x96\x26\xaf\x96\x94\xe6\
-\xff\x96\x34\x8e\x2a\x48\xe7\xba\x52\x4a\x0d\x2f\x89\x9d\x80\x52\
-\x75\x31\xce\x7f\x08\xb8\xaa\xe0\xe5\x3f\xc9\xd2\xe4\x1f\xaa\xcc\
-\x67\xd0\x18\xe7\x57\x06\x6e\x21\x7c\xf8\x2a\xdb\x89\x59\x9a\x7c\
-\xa9\x60\x1e\xcf\x10\x76\x43\x15\x31\x39\x4b\x93\xfb\xbb\x4f\xab\
-\xfd\x44\x64\x3a\x71\x9b\x92\x4f\xb5\xd6\x5e\x5f\x65\x00\x11\x59\
-\x9b\xf0\x50\x7c\x5c\x95\x71\x46\x4b\xc1\x5a\x7b\x79\xa4\xd8\xd1\
-\x88\xc8\xb2\xc0\x87\x80\x2d\x81\x4d\x81\x0d\xa8\xb7\x01\xfd\x7c\
-\xe0\x76\xe0\x7a\xe0\x3f\x81\xdb\x07\xe5\x21\xa7\x88\xbc\x0f\xf8\
-\x40\x84\xd0\x37\x5a\x6b\xef\x8e\x10\xb7\x30\x11\x59\x95\xf0\x40\
-\xa9\x6e\x77\x5a\x6b\x6f\x8d\x10\x17\x11\x99\x00\x7c\xbc\xa2\xe1\
-\xef\xb2\xd6\xce\xad\x68\xec\xff\x27\x22\xab\x00\x07\x01\xfb\x13\
-\x1e\xfc\x94\xe5\x39\x6b\x6d\xd1\xcf\x0c\xad\x65\x9c\x3f\x0a\xf8\
-\x46\x84\xd0\xcf\x65\x69\xd2\xf7\xdf\xdf\x18\x8c\xf3\x8b\x03\xbb\
-\x01\x5b\x03\x9b\x10\xe6\x45\x9d\x1b\x5a\x5e\x03\xfe\x1b\xb8\x09\
-\x98\x0d\x5c\x97\xa5\xc9\x8b\x35\xc6\xef\x3b\xc6\xf9\xf1\xc0\xbe\
-\x84\x9f\xeb\xf6\x84\x07\xdb\x55\x78\x06\x98\x03\x5c\x03\x5c\x5e\
-\x60\x83\xd9\x88\x8c\xf3\x87\x00\x17\x96\x95\x58\x07\x76\xcb\xd2\
-\x64\x76\x84\xb8\xb5\xd3\xb9\xae\x94\x52\xc5\xe8\x09\x10\x35\x48\
-\x3a\xb9\xb9\xd7\xde\x1f\x25\x32\xce\xaf\x00\xfc\x8a\x6a\x16\x3f\
-\xae\x2e\xba\xf8\x91\xbb\x08\x38\xaa\xe0\xb5\x07\x12\xf7\xe1\x7f\
-\x13\x7c\x0d\xf8\x0c\xb0\x7c\xa4\xf8\x33\x08\x0f\xa8\xab\x8e\x11\
-\x6b\xf1\x63\xee\x20\x2d\x7e\x88\xc8\xbb\x81\x7d\xf2\xaf\x6d\x88\
-\xfb\x39\x64\x62\x9e\xc3\x36\x84\x9e\x33\x8f\x8b\xc8\x95\xc0\x65\
-\xc0\x2f\xfb\x7c\x31\x64\x67\xe0\xcc\x08\x71\x8f\x00\x1a\xbd\x00\
-\x02\x6c\x04\x9c\x1f\x21\xee\x99\x84\x9d\x94\x31\x2c\x43\x75\xff\
-\xcd\xd7\x02\x1f\xac\x68\x6c\x44\x64\x5b\xe0\x73\xc0\xee\x54\xf3\
-\x7b\x5c\x77\x2f\xab\xd6\x30\xce\x2f\x0d\xec\x4d\x78\x8f\xdd\x91\
-\x50\x02\x29\x96\x71\x84\xdd\xe7\xeb\x03\xff\x04\xbc\x68\x9c\x9f\
-\x03\xfc\x10\x98\x99\xa5\xc9\x0b\x11\x73\x6b\x15\xe3\x7c\x4a\xf8\
-\x2c\xfe\x8f\x84\x32\x7e\x55\x5b\x1a\xd8\x33\xff\x3a\xcb\x38\xff\
-\x13\xe0\x9b\x59\x9a\x74\xf3\x1e\xa5\xbf\x43\x2b\xa0\x73\x5d\x29\
-\xa5\x3a\xa7\x4d\xd0\xd5\x40\x30\xce\x4f\x22\x7c\x88\x2b\xe2\x9e\
-\x2e\x3f\xe0\xa9\x61\xe4\x8b\x1f\x37\x02\xab\x55\x30\xfc\x5f\xe9\
-\xbc\x6f\x43\x27\x65\xad\x0e\xe8\x70\xec\xbe\x93\xf7\xa5\x38\x35\
-\x62\x0a\x53\x44\x64\xa7\xaa\x06\x17\x91\xf5\x18\xa3\x77\x4c\xc5\
-\x3e\x1f\x31\x76\x2d\x44\x64\xbc\x88\x1c\x24\x22\xbf\x26\xd4\xd6\
-\x3f\x07\xd8\x81\xe6\x6d\xc2\x78\x17\xf0\x09\x42\xd9\xb5\x87\x44\
-\xe4\x34\x11\x59\x29\x72\x4e\x4a\xb5\xdd\x16\x22\x52\xfa\xfd\x86\
-\x88\x6c\x25\x22\xbf\x00\x7e\x09\xec\x45\x75\x8b\xd8\xfa\xf0\x4e\
-\x35\x9e\x71\xfe\x83\xc6\xf9\xab\x08\xbd\xaf\xbe\x4b\x98\x13\x31\
-\x1f\x88\x0e\x67\x02\xb0\x0b\x21\xbf\x47\x8d\xf3\x97\x19\xe7\xb7\
-\x88\x9b\x52\xb3\x19\xe7\xdf\x6b\x9c\x9f\x45\x28\x37\x74\x1c\xf5\
-\x2c\x7e\x2c\x6c\x31\xe0\xa3\xc0\x5c\xe3\xfc\x5c\xe3\xfc\xbe\x1d\
-\xbe\xbe\xeb\xd3\x23\xea\xad\x74\xae\x2b\xa5\x54\xf7\x9a\xf6\xf0\
-\x41\xa9\xaa\x08\xc5\x7b\x3f\x7c\xaf\xca\x44\x06\x89\x71\x7e\x29\
-\xe0\x3a\x42\x4d\xda\x2a\x1c\x98\xa5\xc9\x53\x9d\xbc\x20\x4b\x93\
-\xfb\x8c\xf3\x37\x10\x8e\x8e\x8f\x65\x4d\xe3\xfc\x46\x59\x9a\xdc\
-\xd1\x5d\x7a\x7d\xe3\x7c\xc2\xa9\x99\xaa\x7e\x8e\x63\x99\x41\xf8\
-\x77\x54\xd5\xd8\xb1\x36\x03\x5c\x69\xad\xbd\x31\x52\xec\xca\x89\
-\xc8\x72\x84\x9d\x60\xff\x0c\xb4\x6d\x21\x61\x55\xe0\x04\xe0\x5f\
-\x44\xc4\x02\x5f\xb3\xd6\xde\x1e\x39\x27\xa5\xda\x68\x29\x42\x7d\
-\xfa\xac\x8c\xc1\x44\x64\x45\xc2\xc9\xc4\x8f\x96\x31\x5e\x01\x7f\
-\xab\x29\x8e\x52\x1d\x31\xce\x2f\x4a\xe8\x57\x77\x04\x61\xe7\x75\
-\x9b\x2c\x49\xd8\xc0\xf4\x31\xe3\xfc\x2d\xc0\xd9\xc0\x8f\x2a\x6e\
-\xc6\xdd\x1a\xc6\xf9\xb7\x03\xa7\x00\x9f\xa2\xde\xd2\xa0\x63\xd9\
-\x1c\xb8\xdc\x38\x7f\x2d\xf0\xd9\x2c\x4d\xee\x2d\xf0\x9a\xff\xa9\
-\x38\xa7\xbe\xa7\x73\x5d\x29\xa5\xca\xa1\x27\x40\xd4\xa0\xe8\xe4\
-\x94\xc0\x25\x95\x65\x31\x78\x66\x51\xdd\x07\xb5\x73\xb2\x34\xf9\
-\x65\x97\xaf\xed\xa4\xd4\xc7\xee\x5d\xc6\xe8\x1b\xd6\xda\x57\x81\
-\x93\x23\xa6\xf0\x01\x11\x29\xbd\x84\x4a\xde\x07\xa1\xd3\x9d\x6c\
-\x65\x79\x0d\x98\x16\x29\x76\xa5\x44\x64\x39\x11\x39\x87\x70\xd3\
-\x7b\x2a\xed\x5b\xfc\x18\x6a\x3c\xe1\x41\xeb\x6f\x45\xe4\x0a\x11\
-\x69\xdb\x8d\xa7\x52\x4d\xb0\x6d\x19\x83\x88\xc8\x81\x84\xa6\xab\
-\x75\x2d\x7e\x00\x3c\x51\x63\x2c\xa5\xc6\x64\x9c\x1f\x6f\x9c\x3f\
-\x9e\xf0\x1e\x7b\x3e\xed\x7b\x20\xba\xb0\x2d\x81\x1f\x00\xbf\x33\
-\xce\x4b\xec\x64\x62\x33\xce\x1f\x46\x68\x48\x7e\x04\xcd\x5a\xfc\
-\x18\x6a\x67\xe0\x2e\xe3\xfc\x57\x8c\xf3\x13\x46\xbb\x30\x4b\x93\
-\x47\x09\x3d\xd7\x54\x87\x74\xae\x2b\xa5\x54\xb9\x74\x01\x44\xf5\
-\xbd\xbc\x31\x58\xd1\x12\x3a\xbf\xcc\xd2\xe4\x2f\x55\xe6\x33\x28\
-\x8c\xf3\x97\x50\xec\x94\x45\x37\xee\xa7\x87\xd2\x41\x59\x9a\xfc\
-\x98\xe2\xbb\x3a\x07\x7e\x01\x24\xf7\x43\x4a\xda\xc1\xdb\xa5\x19\
-\x15\x8c\x79\x0a\xf1\xde\x07\xbf\xdb\xf4\x66\xd0\x9d\x12\x91\x71\
-\x22\x72\x04\x70\x1f\xe1\xc6\x7d\x89\xc8\x29\x95\x6d\x4f\xe0\x2e\
-\x11\xb9\x44\x44\x62\x94\xa1\x50\xaa\xad\xb6\xee\xe5\xc5\x22\x32\
-\x41\x44\x2e\x24\x6c\x50\xa9\xb3\xb1\x2b\xe8\x02\x88\x6a\x10\xe3\
-\xfc\x9e\xc0\x1f\x81\x2f\x11\xaf\x37\x5b\x55\xd6\x07\x66\x1a\xe7\
-\x6f\x35\xce\x6f\x19\x3b\x99\xba\x19\xe7\x27\xe6\xf7\x4e\x17\x00\
-\xcb\xc5\xce\xa7\x80\xc5\x08\xf7\x62\xbf\x36\xce\xaf\x3e\xc6\xb5\
-\x7f\xad\x21\x9f\xbe\xa2\x73\x5d\x29\xa5\xca\xa7\x0b\x20\x6a\x10\
-\x74\x52\x73\xf2\xe2\xca\xb2\xc8\x19\xe7\xa7\x1a\xe7\xbf\x63\x9c\
-\x7f\xc6\x38\xef\x8d\xf3\xcf\x19\xe7\xff\x60\x9c\x9f\x69\x9c\x3f\
-\x32\x6f\x74\xd7\x6a\xc6\xf9\x19\x84\x06\xe2\x55\xf9\x78\x96\x26\
-\x2f\xf5\x38\xc6\xec\x82\xd7\x6d\x66\x9c\x7f\x57\x8f\xb1\x5a\x2f\
-\x6f\x08\x7d\x7c\xc4\x14\xb6\x10\x91\x5d\xca\x1a\x4c\x44\x36\x24\
-\xd4\xcd\x8d\xe1\x05\xe2\x9e\xa8\x29\x9d\x88\xec\x00\xdc\x49\xe8\
-\xef\xb1\x6c\xe4\x74\xaa\xf4\x36\xc2\xef\xb6\x7b\x44\xe4\xf0\x2a\
-\x7a\x1b\x28\xd5\x87\xb6\xea\xf6\x85\xf9\xa9\xab\xdb\x09\xe5\x3f\
-\x62\xd0\x1e\x20\x2a\x3a\xe3\xfc\x3a\xc6\xf9\xd9\xc0\x15\xc0\xe4\
-\xd8\xf9\x54\x6c\x33\xe0\x46\xe3\xfc\xb7\x8d\xf3\xcb\xc4\x4e\xa6\
-\x0e\xc6\xf9\xf7\x03\xbf\xa5\xda\x7b\xa7\xaa\x6c\x08\xfc\xc6\x38\
-\x3f\xda\x67\xf4\x3f\xd7\x95\x4c\xdb\xe9\x5c\x57\x4a\xa9\xea\xe8\
-\x8d\xbb\x1a\x04\x3b\x76\x70\xed\x4f\xaa\x4a\xc2\x38\xbf\x8f\x71\
-\xfe\x01\x42\x2f\x83\x43\x09\x75\xb1\x21\x34\x2e\x5b\x8f\xd0\xa7\
-\xe4\x6c\xe0\x21\xe3\xfc\x8d\x6d\x3d\x1a\x6a\x9c\x3f\x04\x98\x5e\
-\x61\x88\xd3\xb3\x34\xb9\xa5\x84\x71\xfe\xb3\x83\x6b\x77\x2d\x21\
-\x5e\xeb\x59\x6b\xaf\x05\xae\x8f\x98\xc2\x8c\x12\xc7\x3a\x05\x48\
-\x4a\x1c\xaf\x13\x67\x5b\x6b\x1f\x8e\x14\xbb\x54\x79\x83\xf3\x6f\
-\x10\xfe\x5d\xb4\xfd\x68\x7e\x27\x96\x06\xfe\x0d\xb8\x59\x44\xc6\
-\xda\xf9\xa8\xd4\xa0\x7b\x97\x88\xbc\xb7\xd3\x17\x89\xc8\x5e\xc0\
-\xad\xc0\x3a\xe5\xa7\x54\x98\x9e\x00\x51\x51\x19\xe7\xff\x89\xf0\
-\x70\xbc\xb4\x4d\x20\x2d\x30\x0e\xf8\x24\x70\xb7\x71\xfe\x43\xb1\
-\x93\xa9\x92\x71\x7e\x27\xe0\x26\x60\xed\xd8\xb9\xf4\x60\x39\xe0\
-\x2a\xe3\xfc\xbf\x8c\xf0\xf7\xda\x07\xa4\x00\x9d\xeb\xfd\x3d\xd7\
-\x95\x52\xf1\xe9\x02\x88\x1a\x04\x45\xcb\x30\xfd\x2a\x4b\x93\x67\
-\xcb\x0e\x6e\x9c\x5f\xdc\x38\x7f\x01\x61\x71\xa5\xe8\x83\xb2\x29\
-\x84\xa3\xa1\xd7\x19\xe7\xd7\x2a\x3b\xa7\xaa\xe4\x1f\x5c\x2e\xac\
-\x30\xc4\xdd\x59\x9a\x94\x75\x0a\xe1\x9a\x0e\xae\xdd\xae\xa4\x98\
-\xfd\xe0\x38\x20\x56\xe3\xba\xcd\x45\x64\xb7\x5e\x07\x11\x91\x8d\
-\x89\x57\xda\xec\x6f\xc0\xe9\x91\x62\x97\x4a\x44\xde\x03\xdc\x0c\
-\x1c\x15\x39\x95\x98\xb6\x00\xee\x10\x91\x4e\xfa\x4c\x29\x35\x88\
-\x3a\xea\x03\x22\x22\x1f\x05\x66\x12\xbf\x94\x9e\x9e\x00\x51\x51\
-\xe4\x25\x91\xbe\x0f\xfc\x3b\xf1\xe7\x41\x2c\x2b\x02\x3f\x33\xce\
-\x7f\xdd\x38\x3f\x3e\x76\x32\x65\xcb\xcb\x1c\x5d\x41\xd8\x0c\xd7\
-\x76\xe3\x80\x33\x8c\xf3\xc3\x95\x28\xfe\x53\xdd\xc9\xb4\x89\xce\
-\x75\xa0\xcf\xe7\xba\x52\xaa\x19\x74\x01\x44\xf5\xb5\xbc\xff\x47\
-\xd1\xd2\x0b\x37\x54\x10\x7f\x32\xa1\x74\xc3\x61\x5d\x0e\x31\x15\
-\xb8\xd7\x38\x7f\x5a\xfe\xdf\xd2\x58\xc6\xf9\x8d\x81\x1f\x57\x1c\
-\xa6\xb4\xa3\xe1\x59\x9a\x3c\x09\xcc\x2d\x78\xf9\x94\xb2\xe2\xb6\
-\x9d\xb5\xf6\x76\xc0\x46\x4c\x61\x46\x09\x63\x7c\x91\x78\xa7\x3f\
-\x4e\xb3\xd6\x3e\x13\x29\x76\x69\x44\x64\x6f\xe0\x0e\x60\xd3\xd8\
-\xb9\x34\xc0\x52\xc0\x65\x22\x72\xbe\x88\x2c\x12\x3b\x19\xa5\x1a\
-\xaa\x70\x1f\x10\x11\x39\x0c\xb8\x14\x68\xc2\x43\x90\xc7\x63\x27\
-\xa0\x06\x4f\x5e\x12\xe9\x76\xe0\xa3\xb1\x73\x69\x80\xb7\x01\x47\
-\x03\x37\x1b\xe7\x57\x8a\x9d\x4c\x59\x8c\xf3\x1f\x21\x2c\xf2\x8e\
-\xda\x44\xbc\x85\x4e\x37\xce\x1f\xbd\xd0\x9f\xfd\x77\x94\x4c\x5a\
-\x40\xe7\xfa\x9b\xf4\xe5\x5c\x57\x4a\x35\x87\x2e\x80\xa8\x7e\xb7\
-\x5d\x07\xd7\x96\x5a\xda\xc7\x38\x3f\x05\xf8\x0d\xb0\x6e\x09\xc3\
-\x9d\x00\xdc\x6e\x9c\x5f\xa5\x84\xb1\x4a\x97\x9f\x52\xb9\x86\x6a\
-\x77\xad\x9c\x96\xa5\xc9\x1d\x25\x8f\x59\xb4\x0c\xd6\x9a\xc6\xf9\
-\x7e\x6b\x40\xd7\x8b\x13\x81\x57\x22\xc5\xde\x54\x44\xba\x3e\xbd\
-\x21\x22\x9b\x11\xaf\xa4\xd9\x9f\x80\x73\x23\xc5\x2e\x8d\x88\x1c\
-\x45\x38\xd1\xa6\xf5\x7a\xdf\xec\xd3\xc0\x6c\x11\xd1\xef\x8b\x52\
-\x6f\x55\x68\x33\x8a\x88\x1c\x09\x7c\x9b\xe6\xdc\xa3\xe8\x09\x10\
-\x55\x2b\xe3\xfc\x8e\xc0\x8d\x40\xc7\x65\xe3\xfa\xdc\xa6\xc0\x5c\
-\xe3\xbc\x89\x9d\x48\xaf\x8c\xf3\xbb\x02\x97\x00\x8b\xc6\xce\xa5\
-\x02\x09\x70\x96\x71\xfe\x33\x43\xfe\xec\x77\xb1\x92\x69\x32\x9d\
-\xeb\x23\xea\x9b\xb9\xae\x94\x6a\x96\xa6\xdc\x5c\x28\x55\x95\xa2\
-\xe5\xaf\xc8\xd2\xe4\xc6\xb2\x82\x1a\xe7\xf7\x25\x7c\xa0\x29\xf3\
-\x41\xd8\xba\xc0\x1d\xc6\xf9\x2d\x4b\x1c\xb3\x67\xc6\xf9\x15\x09\
-\x8b\x47\xcb\x55\x18\xe6\xbe\x2c\x4d\x4e\xaa\x60\xdc\xa2\x8d\xd0\
-\xa1\x87\x26\xae\xfd\xc6\x5a\x3b\x0f\xf8\x4e\xc4\x14\x7a\xe9\x31\
-\xf3\xc5\xd2\xb2\xe8\xdc\xbf\x5a\x6b\xff\x1e\x31\x7e\xcf\x44\xe4\
-\x24\xe0\x1b\xc4\x3b\x41\xd3\x74\x53\x81\x5b\x44\xe4\xdd\xb1\x13\
-\x51\xaa\x61\x56\x13\x91\x95\x47\xbb\x20\xef\xf9\xd1\xb4\xdf\x2f\
-\x7a\x02\x44\xd5\xc6\x38\xbf\x07\xf0\x33\x60\xc9\xd8\xb9\x34\xd4\
-\x2a\xc0\x9c\x31\x1a\x6e\x37\x9a\x71\x7e\x5d\xe0\xfb\x40\x3f\x9f\
-\x18\x4d\x80\xb3\x8d\xf3\x0b\xee\xc3\xe7\x01\xf3\x23\xe6\xd3\x38\
-\x3a\xd7\xc7\xd4\xfa\xb9\xae\x94\x6a\x1e\x5d\x00\x51\xfd\xee\xfd\
-\x05\xaf\xbb\xae\xac\x80\xf9\x1b\xf5\xe5\x65\x8d\xb7\x90\xe5\x80\
-\x5f\x1b\xe7\x0f\xa8\x68\xfc\x8e\x18\xe7\x97\x21\x7c\xef\x46\x7d\
-\xa8\x51\x82\x4a\xea\xeb\x67\x69\xf2\x5b\xe0\xb9\x82\x97\x6f\x5e\
-\x45\x0e\x2d\x36\x83\x78\x37\x33\x9b\x88\xc8\x1e\x9d\xbe\x48\x44\
-\x3e\x00\xec\x5c\x41\x3e\x45\xdc\x41\xb8\xe1\x6d\x2d\x11\xf9\x0a\
-\x71\x17\x90\xda\x62\x6d\x60\x8e\x88\x34\xf2\xc4\x9e\x52\x11\x8d\
-\xd8\x07\x44\x44\xd6\x23\xec\x88\x6e\xd2\xbd\xc9\x2b\xd6\xda\xa7\
-\x63\x27\xa1\x06\x43\x5e\x12\xc9\x32\xb8\x3d\x00\x8a\x9a\x04\xfc\
-\xc4\x38\x1f\xab\x97\x5b\xd7\x8c\xf3\xcb\x12\x7a\x7e\x0c\xc2\x49\
-\xd1\x45\x80\x4b\x8d\xf3\x2b\x64\x69\xe2\x81\xfb\x63\x27\xd4\x14\
-\x3a\xd7\x0b\x6b\xed\x5c\x57\x4a\x35\x53\x93\x6e\x32\x94\xaa\xc2\
-\xda\x05\xaf\xfb\x45\x19\xc1\xf2\x3e\x18\x55\x2d\x7e\x0c\x75\xa9\
-\x71\xfe\xe4\x1a\xe2\x8c\x65\x36\xb0\x5e\xc5\x31\xce\xc8\xd2\xe4\
-\xf6\x0a\xc7\x2f\x5a\x97\xb6\xe8\xbf\xa5\x81\x60\xad\x7d\x8c\xb0\
-\x53\x37\x96\x6e\x4e\x81\x7c\xa1\xf4\x2c\x8a\x3b\xce\x5a\x1b\xab\
-\x79\x7c\xcf\x44\xe4\xeb\xc0\x70\x8d\x2d\xd5\xf0\xd6\x20\x2c\x82\
-\xac\x1a\x3b\x11\xa5\x1a\x64\xd8\x3e\x20\x22\xb2\x2c\x30\x8b\xe6\
-\xed\x84\xfd\x5b\xec\x04\xd4\x60\xc8\x37\x36\x5d\x4a\x7f\x96\x44\
-\xaa\xc2\x04\x60\x66\xde\x44\xbc\x15\x8c\xf3\x09\xe1\xa1\xf7\x9a\
-\xb1\x73\xa9\xd1\x4a\xc0\x0f\x8c\xf3\xe3\x80\x7b\x63\x27\xd3\x04\
-\x3a\xd7\x3b\xd6\xba\xb9\xae\x94\x6a\x2e\x5d\x00\x51\xfd\x2e\x2d\
-\x78\xdd\x5d\x25\xc5\xbb\x8c\xfa\x76\x73\x7c\xc1\x38\xff\xd5\x9a\
-\x62\xbd\x85\x71\xfe\x42\x60\x8b\x8a\xc3\x3c\x90\xa5\xc9\x71\x15\
-\xc7\xf8\x63\xc1\xeb\x74\x01\xe4\xad\xce\x20\x5e\x7d\xf4\x8d\xf3\
-\x72\x29\x85\x88\xc8\x14\x42\x79\xa2\x18\xae\xb3\xd6\x96\x76\xca\
-\xac\x6e\x22\x72\x38\xa1\x29\xa1\xea\xcc\x6a\xc0\xd5\xda\x13\x44\
-\xa9\xff\x37\x65\xe1\x3f\x10\x91\x04\xf8\x11\xcd\x7c\x28\xa8\xfd\
-\x3f\x54\xe5\x8c\xf3\x5b\x01\x17\x00\xe3\x62\xe7\xd2\x32\x8b\x03\
-\xdf\x37\xce\x57\x7d\x2f\x52\x96\x63\xe9\xa0\x34\x73\x1f\xd9\x0e\
-\xb8\x08\x58\x3a\x72\x1e\xd1\xe9\x5c\xef\x5a\xdb\xe6\xba\x52\xaa\
-\xa1\x74\x01\x44\xf5\x2d\xe3\xfc\x46\x1d\x5c\xde\xf3\xae\x14\xe3\
-\xfc\xd1\xd4\xdf\xc4\xec\x58\xe3\xfc\x59\x35\xc7\xc4\x38\xff\x29\
-\xe0\x90\x1a\x42\x1d\x58\x43\x8c\xa2\x27\x40\xd6\xaa\x34\x8b\x16\
-\xb2\xd6\x3e\x0b\x7c\x29\x62\x0a\x9d\x9c\x02\x89\x55\xba\xe9\x75\
-\x5a\x7c\x72\x42\x44\x3e\x48\xdc\x93\x3e\x6d\xb7\x0e\xf0\x53\x11\
-\x19\x1f\x3b\x11\xa5\x1a\x60\x5d\x11\x59\xb8\x5f\xd8\x67\x88\xb7\
-\x38\x3d\x16\x5d\x00\x51\x95\x32\xce\xa7\x84\x93\xe3\x13\x62\xe7\
-\xd2\x52\x13\x81\x59\xc6\xf9\x35\x62\x27\x32\x1a\xe3\xfc\x5a\xf4\
-\xd6\xbf\xae\xed\x0e\x02\x3e\x18\x3b\x89\x98\x74\xae\xf7\xac\x15\
-\x73\x5d\x29\xd5\x6c\xba\x00\xa2\xfa\x59\xe1\x1d\xfb\x59\x9a\x3c\
-\x58\x42\xbc\x13\x4a\x18\xa3\x1b\x9f\x33\xce\x7f\xbd\xae\x60\xf9\
-\xee\x8b\x6f\xd5\x10\xea\xdb\x59\x9a\xcc\xad\x21\x4e\xd1\x13\x20\
-\x0b\x1a\x17\xaa\x37\x3b\x17\x78\x28\x52\xec\x8d\x44\x64\xef\xb1\
-\x2e\x12\x91\xed\x09\x3b\xd0\x62\xf8\x81\xb5\xf6\xce\x48\xb1\x7b\
-\x22\x22\xeb\x10\x76\x66\xf7\x73\xa3\xce\x3a\x6c\x07\x9c\x1f\x3b\
-\x09\xa5\x1a\x20\x61\x48\x19\x2c\x11\x59\x91\xb8\x8b\xe8\x63\xd1\
-\x05\x10\x55\x19\xe3\xfc\x24\xe0\x4a\x60\xf9\xd8\xb9\xb4\xdc\xf2\
-\xc0\x95\xc6\xf9\x89\xb1\x13\x19\x4e\x5e\xfa\xea\x42\xc2\x03\x5c\
-\x35\x80\x74\xae\x97\xa6\xd1\x73\x5d\x29\xd5\x7c\xba\x00\xa2\xfa\
-\xd9\x3a\x05\xaf\xeb\xb9\xfc\x55\x5e\x97\xf2\x9d\xbd\x8e\xd3\x83\
-\xa3\x8d\xf3\x67\x57\x1d\xc4\x38\xbf\x2a\x70\x55\xd5\x71\x80\x27\
-\x80\xaa\x4b\x5f\x2d\x50\xf4\x04\x08\xc0\xea\x95\x65\xd1\x52\xd6\
-\xda\xbf\x13\x77\x57\x5b\x91\xd8\x33\xaa\x4e\x62\x04\x2f\x03\x27\
-\x46\x8a\xdd\x13\x11\x99\x48\x68\xd4\x39\xf0\x25\x0b\x4a\x72\xa8\
-\x88\x7c\x3c\x76\x12\x4a\x35\xc0\xd0\x3e\x20\xe7\xd2\xec\xdf\x31\
-\x4f\xc4\x4e\x40\xf5\xb5\x8b\x81\xf7\xc5\x4e\xa2\x4f\xac\x43\x3d\
-\x9b\xb3\xba\x71\x14\xb0\x55\xec\x24\x54\x54\x3a\xd7\xcb\xd3\xe4\
-\xb9\xae\x94\x6a\x38\x5d\x00\x51\xfd\xac\x68\x39\xaa\x7b\x4a\x88\
-\xb5\x47\x09\x63\xf4\xea\x48\xe3\xfc\xb1\x55\x0d\x6e\x9c\x5f\x0a\
-\xf8\x39\xb0\x70\xf9\x8a\x2a\x1c\x9b\xa5\xc9\xd3\x35\xc4\x21\x4b\
-\x93\x3f\x01\x2f\x16\xbc\x5c\x77\xee\x0c\xef\x12\xe0\x77\x91\x62\
-\x6f\x28\x22\xfb\x8e\xf4\x97\x22\xb2\x13\xb0\x4d\x8d\xf9\x0c\x75\
-\x9e\xb5\xd6\x45\x8a\xdd\xab\x33\x80\xc9\xb1\x93\xe8\x33\xe7\xe5\
-\xa7\x6a\x94\x1a\x64\x5b\x03\xe4\x3d\x9c\xf6\x89\x9c\xcb\x58\xf4\
-\x04\x88\xaa\x44\xde\x08\x79\xc4\xcf\x2e\xaa\x2b\x07\xe4\x25\x7a\
-\x1b\x23\xdf\xf9\x1f\xab\x42\x80\x6a\x00\x9d\xeb\x95\x68\xdc\x5c\
-\x57\x4a\xb5\x83\x2e\x80\xa8\x7e\xb6\x62\xc1\xeb\xca\x58\x00\x69\
-\x4a\xf3\xce\xaf\x1a\xe7\xa5\xa2\xb1\x67\x02\xeb\x57\x34\xf6\x50\
-\x37\x65\x69\xf2\xbd\x1a\xe2\x0c\x35\xaf\xe0\x75\x2b\x54\x9a\x45\
-\x4b\x59\x6b\x3d\x71\x6f\xf0\xa6\xe7\x8d\x74\x87\x33\xa3\xce\x44\
-\x86\x78\x06\x38\x35\x52\xec\x9e\x88\xc8\xb6\x84\xba\xfc\xaa\x5c\
-\x13\x81\x4b\x44\x44\x9b\x5f\xaa\x41\xb6\xa9\x88\xbc\x0a\xfc\x34\
-\x76\x22\x05\xe8\x09\x10\x55\x3a\xe3\xfc\xbb\xd0\xde\x5a\x55\xf9\
-\x9a\x71\xbe\x49\xa7\xb5\x8f\x23\x6e\x85\x00\x15\x91\xce\xf5\x4a\
-\x35\x6d\xae\x2b\xa5\x5a\x40\x17\x40\x54\x3f\x2b\x5a\x1f\xf2\xd1\
-\x12\x62\xad\x54\xc2\x18\x65\x99\x69\x9c\x2f\xf5\xa8\xb5\x71\xfe\
-\x1b\xc0\xce\x65\x8e\x39\x8a\x18\x3b\x3a\xfe\x56\xf0\xba\xa2\x8b\
-\x6a\x03\xc7\x5a\xfb\x73\x60\x4e\xa4\xf0\x1b\x00\xff\xb0\xf0\x1f\
-\x8a\xc8\x2e\xc0\x07\xea\x4f\x07\x80\xd3\xad\xb5\x4f\x46\x8a\xdd\
-\xb5\xbc\xf4\xd5\x77\x08\xb5\xfa\x55\xf9\x36\x06\x8e\x89\x9d\x84\
-\x52\x91\x8d\xa3\x1d\xbf\x63\xf4\x04\x88\xaa\xc2\xb7\x80\x77\xc4\
-\x4e\xa2\x4f\x4d\xa2\x21\x3d\xb7\x8c\xf3\xef\x00\x8e\x8c\x9d\x87\
-\x8a\x4a\xe7\x7a\x75\x1a\x33\xd7\x95\x52\xed\xa1\x0b\x20\xaa\x9f\
-\x2d\x5e\xf0\xba\xa2\xe5\x8f\x46\xf3\x58\x09\x63\x94\xe9\x4a\xe3\
-\x7c\x29\xa7\x52\x8c\xf3\x1f\x21\xd4\xaf\xad\xc3\x97\xb3\x34\xe9\
-\xa4\x27\x47\x59\x8a\x96\xdb\xd2\x13\x20\xa3\x9b\x16\x31\xf6\xc9\
-\xc3\x9c\x02\x99\x11\x23\x11\xe0\x2f\xb4\x77\xc7\xd7\xa9\xc0\x1a\
-\xb1\x93\xe8\x73\x33\x44\x44\xbf\xc7\x4a\x35\x9f\x9e\x00\x51\xa5\
-\x32\xce\xef\x0f\xec\x1d\x3b\x8f\x3e\xb7\x93\x71\xfe\xe0\xd8\x49\
-\x10\x7a\xc0\x35\xb9\xc7\x91\xaa\x90\xce\xf5\x5a\x34\x65\xae\x2b\
-\xa5\x5a\x62\x91\xd8\x09\x28\x55\xa1\xa2\x27\x40\x5e\x2a\x21\xd6\
-\x43\xbc\xb9\xb1\x67\x6c\x6f\x07\xae\x35\xce\x6f\x92\xa5\x49\xd7\
-\xbb\xd0\x8d\xf3\xeb\x12\x76\x83\xd7\xe1\x51\xe2\x95\x0c\x2a\xba\
-\x00\xb2\x64\xa5\x59\xb4\x9c\xb5\x76\xae\x88\xfc\x94\x38\x75\xdd\
-\xdf\x07\x08\xa1\x54\x1b\x22\xb2\x3b\xb0\x79\x84\x3c\x00\xa6\x5b\
-\x6b\xcb\xf8\xbd\x52\x2b\x11\x49\x81\x7f\x8e\x9d\x47\x01\x8f\x03\
-\x0f\x02\xcf\x02\xf3\x09\xbf\xc3\x27\x10\x7e\xe7\x2f\x03\xac\x4e\
-\x3d\xbd\x8a\xba\xb5\x04\x70\x16\xb0\x57\xec\x44\x94\x52\xa3\xd2\
-\x05\x10\x55\x1a\xe3\xfc\x38\xda\x51\x1a\xf3\x39\xc2\x7d\xcd\x93\
-\xc0\x0b\xf9\xd7\x78\xc2\x8e\xeb\x49\xc0\xca\x84\x0d\x41\x4d\xde\
-\x48\xf9\x65\xe3\xfc\xcc\x2c\x4d\xe6\xc7\x08\x6e\x9c\x9f\x08\x1c\
-\x1a\x23\x76\x17\x5e\x27\x7c\x9e\x7a\x1e\x78\x99\xf0\x79\x6a\x02\
-\xe1\x9e\x47\x9f\x15\x75\x41\xe7\x7a\xad\xa2\xce\x75\xa5\x54\xbb\
-\xe8\x9b\x9a\xea\x67\x4b\x14\xbc\xae\x8c\x13\x20\xd7\x00\x07\x95\
-\x30\x4e\x99\x56\x03\xae\xa2\xcb\x12\x40\xf9\xd1\xed\x6b\x28\xfe\
-\x7d\xec\xd5\xe7\xb3\x34\x79\xa1\xa6\x58\x0b\x7b\xa6\xe0\x75\x93\
-\x2a\xcd\xa2\x3f\x9c\x00\xec\x41\x9c\xf7\x97\xe9\x22\x62\xf3\x9e\
-\x24\xd3\x23\xc4\x07\xf8\x23\xf0\xdd\x48\xb1\x7b\x35\x03\x58\x34\
-\x76\x12\x0b\xf1\xc0\x4d\xc0\xf5\xc0\x2f\x80\x3b\xad\xb5\xcf\x8d\
-\xf5\x22\x11\x59\x86\x50\x6e\x6a\x47\x60\x2a\xb0\x69\x95\x49\x76\
-\x61\x4f\x11\x99\x62\xad\xbd\x29\x76\x22\x4a\xa9\x11\x3d\x1e\x3b\
-\x01\xd5\x57\x0e\x03\x26\xc7\x4e\x62\x18\xf3\x78\xe3\x3d\xf6\xe6\
-\x2c\x4d\x1e\x1e\xeb\x05\xc6\xf9\x09\xc0\x86\x84\xf7\xd7\x6d\x81\
-\x6d\x08\x0f\x4e\x9b\x62\x05\xc2\xe7\xd1\x13\x23\xc5\xff\x04\xb0\
-\x54\xa4\xd8\x63\x79\x91\x50\xb2\xf6\x6a\xe0\x36\xe0\xce\xe1\xee\
-\xbf\xf2\x87\xf8\xab\x11\xfa\x5c\x6e\x4c\xb8\x9f\xdc\x02\x58\xb6\
-\xbe\x54\x5b\x4b\xe7\x7a\x7d\x62\xcf\x75\xa5\x54\x8b\xe8\x02\x88\
-\xea\x67\x13\x0a\x5e\x57\xc6\x4e\xed\x9f\x95\x30\x46\x15\xb6\x34\
-\xce\x5f\x94\xa5\xc9\x21\x5d\xbc\xf6\xe7\x84\x9d\x1f\x75\xb8\x2d\
-\x4b\x93\x4b\x6a\x8a\x35\x9c\xa2\x27\x40\xea\x5a\x0c\x6a\x2d\x6b\
-\xed\x3d\x22\xf2\x5d\xc2\x87\xff\xba\xad\x07\xec\x2f\x22\x2f\x01\
-\x9b\x44\x88\x0f\x30\xcd\x5a\xfb\x7a\xa4\xd8\x5d\x13\x91\xb5\x80\
-\x03\x63\xe7\x31\xc4\x33\xc0\x79\xc0\x7f\x58\x6b\x1f\xec\xf4\xc5\
-\xd6\xda\xa7\x09\x37\x79\xd7\x03\x27\x88\xc8\xba\x84\xfe\x42\x87\
-\x51\xfc\x74\x60\xd5\xbe\x0a\x6c\x19\x3b\x09\xa5\xd4\xb0\x3c\x7a\
-\x02\x44\x95\xc4\x38\x3f\x1e\x38\x3e\x76\x1e\x43\xbc\x06\x58\xe0\
-\x5b\x59\x9a\xdc\xd0\xe9\x8b\xb3\x34\x79\x11\xb8\x25\xff\xfa\xa2\
-\x71\x7e\x25\xc2\xfb\xeb\xa7\x69\x4e\x5f\xc4\xcf\x1a\xe7\xcf\x2d\
-\xf2\x90\xb7\x02\x31\x3e\x03\x8f\xe5\x61\xe0\xdf\x81\x73\xb2\x34\
-\x19\x73\xe3\x57\x96\x26\xaf\x01\xf7\xe7\x5f\x57\x03\x18\xe7\x17\
-\x01\x76\x07\x0e\x20\x9c\x62\x6d\xd2\x83\xf0\x46\xd0\xb9\x1e\x45\
-\xcc\xb9\xae\x94\x6a\x91\x26\x1f\x67\x53\xaa\x57\x45\x77\xeb\xf7\
-\xbc\x00\x92\xa5\xc9\x73\xc0\xa5\xbd\x8e\x53\x91\x83\x8d\xf3\x47\
-\x77\xf2\x02\xe3\xfc\x8f\x81\xcd\x2a\xca\x67\x38\x87\xd7\x18\x6b\
-\x38\x45\x4f\x80\x34\xe5\xc1\x69\xd3\x4d\x27\x1c\xa3\x8e\xe1\x64\
-\xe2\x9d\xfe\x98\x63\xad\xbd\x2a\x52\xec\x5e\x9d\x42\x33\x36\x45\
-\xbc\x06\x9c\x0b\xac\x69\xad\x3d\xa1\x9b\xc5\x8f\xe1\x58\x6b\xef\
-\xb6\xd6\x1e\x0d\xac\x05\x5c\x4c\x78\xb8\x19\xdb\x16\x79\xa9\x36\
-\xa5\x54\xf3\x3c\x6b\xad\x7d\x35\x76\x12\xaa\x6f\x1c\x0e\xa4\xb1\
-\x93\xc8\xdd\x00\x6c\x96\xa5\xc9\x47\xba\x79\x20\x3a\x9c\x2c\x4d\
-\x1e\xce\xd2\xe4\x14\xc2\xae\xf7\xd3\x88\xf7\x19\x70\xa8\x49\x44\
-\x78\x10\x6d\x9c\xdf\x86\x50\x96\xb5\x29\x5e\x05\xbe\x09\x4c\xce\
-\xd2\xe4\xd4\x22\x8b\x1f\x23\xc9\xd2\xe4\xd5\x2c\x4d\x66\x65\x69\
-\xb2\x1f\x61\xd3\xd1\x0f\x08\x25\xb4\xd4\x1b\x74\xae\xd7\x2f\xca\
-\x5c\x57\x4a\xb5\x4f\x13\x1e\x76\x28\x15\x5b\x59\xb5\xfa\xa7\x01\
-\xfb\xd2\xcc\x53\x02\x5f\x37\xce\xff\x3e\x4b\x93\xeb\xc7\xba\xd0\
-\x38\x7f\x04\xb0\x5f\x0d\x39\x2d\x70\x69\x96\x26\xb7\xd5\x18\x6f\
-\x38\x45\x6f\x06\x9a\xf8\xb3\x6d\x1c\x6b\xed\xc3\x22\x72\x0e\x70\
-\x5c\x84\xf0\xeb\x46\x88\x09\xe1\x81\xfa\xe7\x23\xc5\xee\x89\x88\
-\xac\x49\xbd\x73\x7e\x24\x8f\x01\x07\x58\x6b\xc7\xfc\x3d\xd5\x2d\
-\x6b\xed\xc3\xc0\xc1\x22\x72\x05\x70\x21\xa1\x67\x48\x4c\x9f\x27\
-\x94\x2a\x54\x4a\x95\xeb\x75\xe0\xcf\x84\x5d\xcf\x0f\x03\x8f\x10\
-\x1e\xd4\xbc\xc8\x1b\xa5\x4f\x17\x05\x16\x27\xf4\x0c\x7a\x27\xf0\
-\x1e\x42\xb9\x97\xa5\xd0\xd3\x1f\xaa\x24\xc6\xf9\x04\x38\x26\x76\
-\x1e\xc0\x2b\xc0\xf4\x2c\x4d\xbe\x5c\x55\x80\xbc\x94\xd2\x49\xc6\
-\xf9\x99\xc0\x8f\x80\xf7\x56\x15\xab\xa0\x83\x8d\xf3\x27\x67\x69\
-\xf2\x54\x8d\x31\x3f\x55\x63\xac\xb1\x3c\x0e\xec\x97\xa5\xc9\xaf\
-\xca\x1e\x38\x4b\x93\x79\xc0\xc7\x8c\xf3\xdf\x03\xfe\x03\x78\x77\
-\xd9\x31\xda\x46\xe7\x7a\x54\x31\xe6\xba\x52\xaa\x65\x74\x01\x44\
-\x29\x58\xac\x8c\x41\xb2\x34\xf9\xab\x71\xfe\x48\xea\x6b\x1a\xde\
-\xa9\xcb\x8d\xf3\x1b\x64\x69\xf2\x3f\x23\x5d\x60\x9c\xdf\x18\x38\
-\xa7\xc6\x9c\x5e\xa0\x19\x0f\x8d\x8b\xf6\x3d\x78\xa5\xd2\x2c\xfa\
-\xcb\xe9\x84\x9b\xc0\xb7\xc7\x4e\xa4\x26\x97\x5b\x6b\x7f\x13\x3b\
-\x89\x2e\x7d\x92\xf8\x27\x42\xef\x03\xb6\xcf\x17\x28\x2a\x67\xad\
-\xfd\xa9\x88\xfc\x9e\x50\x07\x79\x95\x3a\x62\x8e\x60\x6b\x11\xd9\
-\xc2\x5a\x3b\x37\x62\x0e\x4a\xf5\x83\x27\x09\x25\xef\xe6\x00\x77\
-\x02\x77\x59\x6b\x9f\xef\x66\x20\x11\x99\x0c\xac\x5e\x62\x6e\x6a\
-\xb0\xed\x45\xdc\xf7\x19\x80\xf9\xc0\xbe\x59\x9a\x5c\x5b\x47\xb0\
-\x2c\x4d\xee\x32\xce\x6f\x42\x28\xa7\xbb\x4d\x1d\x31\x47\x30\x09\
-\x38\x9a\x9a\x4e\x06\xe7\x25\xa2\x76\xad\x23\x56\x01\xf7\x01\xbb\
-\x66\x69\x52\xca\x49\xda\x91\x64\x69\x72\xb5\x71\x7e\x03\x60\x36\
-\xf5\x56\x0f\x68\x22\x9d\xeb\xf1\xd4\x3a\xd7\x95\x52\xed\x14\xfb\
-\x81\x87\x52\x55\x7a\xb6\xe0\x75\x4b\x96\x15\x30\x4b\x93\x0b\x81\
-\x1f\x96\x35\x5e\xc9\x96\x06\xae\xcc\x9b\x99\xbd\x45\xde\xf4\x7c\
-\x56\xbd\x29\x71\x66\x96\x26\x8f\xd4\x1c\x73\x38\x45\xff\x0d\x8c\
-\xd9\x7c\x59\x05\x79\x0f\x86\xd3\x63\xe7\x51\x93\x57\x08\x0d\xf8\
-\x5a\x47\x44\x16\x01\x0e\x8a\x9c\xc6\x3c\x60\xbb\xba\x16\x3f\x16\
-\xb0\xd6\xde\x0f\xec\x00\xfc\xb5\xce\xb8\xc3\x38\x36\x72\x7c\xa5\
-\xda\xea\x29\x42\xaf\xa0\x2d\x81\x77\x5a\x6b\xf7\xb7\xd6\x9e\x6b\
-\xad\xbd\xb9\xdb\xc5\x0f\x00\x6b\xed\x3c\x6b\xed\x35\xa5\x65\xa9\
-\x06\xdd\xa1\x91\xe3\xbf\x00\xec\x53\xd7\x03\xd1\x05\xb2\x34\x79\
-\x1e\xd8\x0d\xb8\xa9\xce\xb8\xc3\xf8\x74\xbe\x30\x51\x87\xa9\x34\
-\xa3\x49\xf8\x9f\x81\x9d\xaa\x5e\xfc\x58\x20\x4b\x93\x27\x09\x9f\
-\xa7\x4a\x29\xb3\xd4\x62\x3a\xd7\xe3\xaa\x73\xae\x2b\xa5\x5a\x48\
-\x17\x40\x54\x3f\x2b\xfa\xb0\xba\xb4\x05\x90\xdc\x27\x81\x07\x4a\
-\x1e\xb3\x2c\x1b\x00\x3f\x1e\xe1\xef\xea\x6c\x7a\x0e\x61\xb7\xe6\
-\x19\x35\xc6\x1b\xcd\x52\x05\xaf\xd3\x05\x90\xce\x7c\x93\x70\x13\
-\xd6\xef\x2e\xb0\xd6\xce\x8b\x9d\x44\x97\xf6\x04\x56\x8c\x18\x7f\
-\x3e\xb0\xb7\xb5\x36\xca\x42\x68\xbe\x08\x22\xc4\x3d\xdd\xb5\x87\
-\x88\xbc\x23\x62\x7c\xa5\xda\x66\x1e\x70\x30\xb0\xa2\xb5\xf6\x70\
-\x6b\xed\x5c\x6b\xad\xd6\xa1\x57\x8d\x63\x9c\x5f\x01\xd8\x25\x72\
-\x1a\xc7\x64\x69\x72\x5d\x8c\xc0\x59\x9a\xcc\x07\xf6\x01\xfe\x12\
-\x23\x7e\x6e\x79\x42\x89\xe2\x3a\xec\x53\x53\x9c\xd1\x3c\x4f\x38\
-\xf9\x31\xe2\x89\xff\x2a\x0c\xf9\x59\xdf\x5b\x67\xdc\xa6\xd0\xb9\
-\x3e\x70\x73\x5d\x29\xd5\x42\xba\x00\xa2\xfa\x59\xd1\xdd\x7f\xa5\
-\x2e\x80\x0c\xd9\x05\x31\xbf\xcc\x71\x4b\xb4\xbb\x71\xfe\x4d\x35\
-\x41\x8d\xf3\x97\x50\xff\xb1\xe5\xe9\xf9\x87\xa5\x26\xd0\x13\x20\
-\x15\xb0\xd6\xbe\x0c\x7c\x21\x76\x1e\x15\x7b\x9e\x76\xff\x37\x1e\
-\x16\x39\xfe\xe1\xd6\xda\xbb\x63\x26\x90\x97\x9f\x8a\x79\x82\x67\
-\x51\xe0\xe3\x11\xe3\x2b\xd5\x16\x8f\x10\x76\xd8\xae\x63\xad\xbd\
-\x38\x7f\x8f\x51\xaa\xc9\x3e\x05\x8c\x8f\x18\xff\xfb\x59\x9a\x7c\
-\x2b\x62\x7c\xb2\x34\xf9\x5f\xe0\x40\xe0\xb5\x88\x69\x1c\x52\x53\
-\x9c\x26\x94\xbf\x3a\x3a\x4b\x93\x3f\xc6\x08\x9c\x37\x58\xdf\x8b\
-\xe6\xde\x03\x57\x49\xe7\xfa\x60\xcd\x75\xa5\x54\x0b\xe9\x02\x88\
-\xea\x67\x45\x3f\x7c\x95\x7d\x02\x84\x2c\x4d\xee\x23\x7c\x00\x68\
-\xaa\x69\xc6\xf9\x4f\x03\xe4\x8b\x21\x75\xe7\xfa\x60\x96\x26\xff\
-\x56\x73\xcc\xd1\xe8\x09\x90\xea\x5c\x04\x44\x7d\xc0\x5d\xb1\x33\
-\xad\xb5\x8f\xc7\x4e\xa2\x1b\xf9\xa9\x83\x9d\x23\xa6\x30\xc7\x5a\
-\x7b\x71\xc4\xf8\x43\x9d\x05\xfc\x3e\x62\x7c\xbd\x61\x53\x6a\x74\
-\x17\x03\xeb\x59\x6b\x2f\xb2\xd6\xc6\x7c\xb8\xa2\x54\x27\xf6\x8f\
-\x18\xfb\x29\x42\x4d\xfc\xe8\xb2\x34\x99\x43\x98\xc3\xb1\x4c\x35\
-\xce\x57\xda\xa4\x3b\xef\xa3\x18\xbb\xff\xc3\x15\x59\x9a\x44\xed\
-\x45\x99\xa5\xc9\xbd\x0c\x4e\x09\xdc\xa1\x74\xae\x33\x18\x73\x5d\
-\x29\xd5\x5e\xba\x00\xa2\xfa\x59\xed\x3d\x40\x86\xca\xd2\x64\x16\
-\xf0\x89\x2a\xc6\x2e\xc9\xf9\xc6\xf9\xaf\x02\xd3\x22\xc4\x8e\x11\
-\x73\x34\x7a\x02\xa4\x22\x79\x59\x92\x13\x63\xe7\x51\x91\x47\x81\
-\x33\x63\x27\xd1\x83\x5d\x80\x71\x91\x62\xbf\x0e\x1c\x15\x29\xf6\
-\x5b\xe4\xff\x4e\x3f\x17\x31\x85\xf5\x45\x64\x9d\x88\xf1\x95\x6a\
-\xaa\xf9\xc0\xfe\xd6\xda\x83\xad\xb5\x4f\xc5\x4e\x46\xa9\xa2\x8c\
-\xf3\x29\xb0\x5e\xc4\x14\xbe\x9c\xa5\xc9\x13\x11\xe3\x2f\xec\x78\
-\xe0\xe9\x48\xb1\x17\x01\x3e\x5c\x71\x8c\xed\x2b\x1e\x7f\x2c\x2f\
-\x00\xc7\x44\xce\x61\x81\xd3\x19\xa0\x52\x58\x3a\xd7\xdf\xa2\xdf\
-\xe7\xba\x52\xaa\xa5\xfe\x0f\x00\x00\xff\xff\xec\xdd\x7b\xd0\x5e\
-\x45\x7d\x07\xf0\xef\x4a\x40\xb0\x89\x5c\x4d\x29\xb7\x85\x60\x11\
-\x41\xac\x1c\x8c\xa0\xdc\x02\x0c\x42\x99\xb6\x4e\xf5\x60\xa7\xb5\
-\xce\x38\xe3\xd4\xe9\xd4\x6a\xa4\x9d\x91\x4b\x50\x2b\x15\xac\xb4\
-\x88\xca\xc5\x42\x33\x22\x1d\xcb\xa5\x2c\x1d\x45\xa7\x15\x8a\x05\
-\x14\x18\x5a\x61\x21\x40\x30\x84\xdb\x7b\x12\x40\x08\x49\x30\x10\
-\x02\x05\xc2\xe9\x1f\xef\x93\x4e\x84\xbc\xef\xb3\x7b\xde\xb3\xcf\
-\xf7\xec\x79\xbe\x9f\xbf\xcf\xd9\xdf\x6f\xe6\xcd\x2f\xe7\x39\xfb\
-\x3b\xbb\xab\x06\x88\xf4\x59\xe8\x16\x58\xc9\xf6\x5e\x1f\x1c\x8a\
-\xde\x95\x1f\xa3\x5b\xc2\x38\x7c\xf7\x4e\x6f\xcd\x35\x84\xb8\xd3\
-\x79\x5b\xe0\x75\x6a\x80\x34\xe0\x9c\xfb\x3e\x80\xdb\xd9\x79\x24\
-\x70\x96\x73\x2e\xe7\x65\xfe\xcc\xad\x1a\xae\x73\xce\x2d\x21\xc6\
-\x7f\x03\xe7\xdc\x4f\xc0\x3d\xc0\xb1\x0b\x7b\x87\x8b\x74\xc9\x4a\
-\x00\x47\x3a\xe7\xba\xf6\x9b\x41\x24\xc4\x1f\x10\x63\xaf\x02\x70\
-\x01\x31\xfe\x1b\x78\x6b\x56\x01\x58\x4c\x4c\xe1\xf7\x12\x8f\x7f\
-\x58\xe2\xf1\x87\xb9\x70\x54\x87\x9e\x0f\xe3\xad\x79\x15\x93\x2b\
-\x6b\xc7\x85\x6a\x7d\x33\x63\x50\xeb\x22\x92\x29\x35\x40\xa4\xcf\
-\xd6\x05\x5e\xf7\xdb\x29\x93\xf0\xd6\x9c\x0f\xe0\x9c\x94\x31\x32\
-\xc3\x68\xba\x0c\xb3\x5f\xe0\x75\xfa\xfa\xb4\xb9\x53\xd9\x09\xb4\
-\x6c\x39\x80\x4b\xd9\x49\x34\x55\x96\xa5\x01\x70\x3c\x31\x85\xf3\
-\x88\xb1\xa7\x73\x3e\x31\xf6\x87\x88\xb1\x45\xba\xe6\x09\x00\xc7\
-\x38\xe7\xee\x66\x27\x22\xd2\x10\x73\x8b\xc9\xc5\xde\x9a\x97\x88\
-\xf1\xa7\xf2\x0d\x00\x2f\x93\x62\x1f\x51\x54\xf5\x8e\x09\xc7\x9f\
-\x9f\x70\xec\x61\x36\xa0\x7b\xbf\xab\x2e\x03\xf7\x40\xec\x51\x52\
-\xad\xbf\x51\x9f\x6b\x5d\x44\x32\xa5\x06\x88\xf4\xd9\x43\x81\xd7\
-\x85\x4e\x7e\x37\xe6\xad\x59\x04\xe0\x7b\xa9\xe3\x64\xe0\xfa\xc1\
-\xde\xa0\x9d\x51\x54\xf5\x6c\x00\xbb\x05\x5e\xfe\x70\xca\x5c\xfa\
-\xcc\x39\x77\x2b\x80\x1f\xb1\xf3\x68\xd1\x19\x99\xef\x43\xff\x5e\
-\x84\xaf\x7c\x6a\xdb\xbd\x83\x7f\x0f\x5d\xf4\x7d\x00\x2b\x48\xb1\
-\xe7\x97\x65\x39\x97\x14\x5b\xa4\x4b\x9e\x01\x70\x9c\x73\xee\x11\
-\x76\x22\x22\x4d\x14\x55\x3d\x0b\xc0\x51\xa4\xf0\x1b\xd1\xb1\x2f\
-\xc2\x37\xf1\xd6\x3c\x01\xe0\x3a\x52\xf8\xad\x01\xfc\x7e\x8a\x81\
-\x8b\xaa\xde\x03\xc0\x5e\x29\xc6\x0e\x74\xe5\xe0\xab\xfb\xce\xf0\
-\xd6\xbc\x02\xe0\x5f\xd8\x79\xa4\xa6\x5a\xdf\xb2\xbe\xd6\xba\x88\
-\xe4\x4d\x0d\x10\xe9\xb3\x65\x81\xd7\xcd\x4b\x9a\xc5\x80\xb7\xe6\
-\xe3\x00\x7e\x3c\x8a\x58\x1d\xd6\xc5\xd5\x1f\xef\x88\xb8\x36\xf4\
-\xdf\x94\x6c\xd9\xe9\x98\xfc\xb1\x9e\xbb\x3b\x9c\x73\xd7\xb2\x93\
-\x98\xa1\x13\x89\xb1\xaf\x26\xc6\x9e\xd6\xe0\x2c\x10\x47\x0a\x6f\
-\x00\x2c\x20\xc5\x16\xe9\x8a\x8d\x00\xfe\xc4\x39\x37\x36\xfb\xc7\
-\x4b\x2f\x1d\x0d\xe0\xad\xa4\xd8\x3f\xf5\xd6\x3c\x45\x8a\x1d\x82\
-\xf9\x1b\xe0\xe8\x44\xe3\xb2\x26\xc0\x37\xf9\x36\x39\xfe\x54\xc6\
-\xe1\xe3\x3f\xd5\xfa\xd4\xfa\x58\xeb\x22\x92\x31\x35\x40\xa4\xcf\
-\x82\x27\xab\x8b\xaa\x3e\x20\x65\x22\x9b\xf9\x43\x00\xff\x33\xa2\
-\x58\x5d\x73\xa5\xb7\xe6\x7e\x76\x12\x5b\x10\xb3\x02\xe8\x17\xc9\
-\xb2\x18\x03\xce\xb9\xfb\xd1\x8f\x97\xa1\xcf\xb3\x13\x68\xc1\xa1\
-\xc4\xd8\x57\x11\x63\x87\x60\xe6\xb7\x80\x18\x5b\xa4\x0b\xbe\xec\
-\x9c\xbb\x91\x9d\x84\xc8\x0c\xbd\x9f\x18\xbb\xeb\x1f\x68\x5c\x07\
-\xde\x01\xc9\x87\x27\x1a\xf7\xe0\x44\xe3\x86\xf8\x85\xb7\xe6\x2e\
-\x62\xfc\x29\x0d\xde\xfb\xba\xf8\xee\xd7\x26\xd5\xfa\xd4\xfa\x58\
-\xeb\x22\x92\x31\x35\x40\xa4\xb7\xbc\x35\x31\x07\xec\x26\xdf\x06\
-\x0b\x00\x06\x7b\x74\x9e\x00\x60\x1c\xbf\x6c\x3c\x83\x9d\xc0\x14\
-\x42\x57\x80\x3c\xee\xad\xc9\xf9\xc0\xeb\xae\xf8\x02\x80\x2e\xee\
-\x55\x1b\xea\x87\xce\xb9\x9f\xb1\x93\x68\xc1\xbb\x49\x71\x97\x39\
-\xe7\x3a\x71\x48\xe7\x54\x9c\x73\x3f\x07\xf0\x34\x29\x3c\xfb\x2b\
-\x52\x11\xa6\x7b\xa1\x33\xd3\xa4\x1f\x58\xcf\x58\x60\x72\x2b\xc7\
-\xce\xf2\xd6\xbc\x0c\x80\xb5\x1d\xee\x7e\x45\x55\xef\x9a\x60\xdc\
-\xa4\xe7\x49\x0e\xf1\x6f\xc4\xd8\x21\x6e\x66\x27\x90\x98\x6a\x7d\
-\x0a\x3d\xad\x75\x11\xc9\x98\x1a\x20\xd2\x77\x55\xe0\x75\x31\xdb\
-\x20\xcd\x88\xb7\xe6\x57\x00\x8e\xc1\xf8\x1c\x0c\x07\x00\x17\x7b\
-\x6b\x26\xd8\x49\x4c\x61\xff\xc0\xeb\xb4\xfd\x55\x0b\x9c\x73\x2b\
-\x01\x5c\xcc\xce\xa3\xa1\x8d\x00\x4e\x63\x27\x31\x53\x65\x59\xee\
-\x0c\x60\x4f\x52\xf8\x9b\x49\x71\x63\xb1\x5e\xd8\xde\x59\x96\xe5\
-\x6c\x52\x6c\x11\xa6\x1a\xc0\xa7\x33\x3f\x5b\x49\x64\x93\x83\x48\
-\x71\x97\x0f\xf6\xde\xef\x3a\xd6\x33\xd6\x20\xcd\x97\xe1\xfb\x26\
-\x18\x33\x54\xd7\xcf\xd7\xbb\x89\x9d\x40\x62\xaa\xf5\xe9\xf5\xad\
-\xd6\x45\x24\x63\x6a\x80\x48\xdf\x85\x4e\x5a\x7f\x20\x69\x16\xaf\
-\xe3\xad\xf9\x25\x80\x63\x01\xac\x1e\x65\x5c\xa2\xb3\xd8\x09\x4c\
-\xe3\x88\xc0\xeb\xd4\x00\x69\xcf\xd9\x00\xd6\xb1\x93\x68\xe0\xbb\
-\xce\xb9\x07\xd8\x49\xb4\xa0\x20\xc6\xce\xe5\x45\xf8\xbf\x48\x71\
-\xdf\x04\xe0\x77\x48\xb1\x45\x98\x7e\xe4\x9c\xbb\x95\x9d\x84\xc8\
-\x4c\x15\x55\xbd\x1d\x80\xb7\x93\xc2\xe7\x52\x43\x37\x10\x63\xa7\
-\xd8\xae\x6a\x9f\x04\x63\x86\x58\x0b\xe0\xbf\x49\xb1\x43\xdd\x88\
-\x7e\x9c\xff\xf7\x06\xaa\xf5\x20\x7d\xab\x75\x11\xc9\x98\x1a\x20\
-\xd2\x77\xa1\x93\xd6\xc7\x24\xcd\x62\x0b\xbc\x35\x0f\x01\x38\x12\
-\xc0\x9a\x51\xc7\x1e\xb1\x73\xbc\x35\xac\xed\x64\xa6\x55\x54\xf5\
-\xbe\x00\x76\x0f\xbc\x5c\xe7\x7f\xb4\xc4\x39\xb7\x16\xc0\xb9\xec\
-\x3c\x22\x6d\x00\xf0\x45\x76\x12\x2d\x61\xbe\x10\x74\xfd\x45\x7d\
-\x13\xe6\x59\x4d\xef\x21\xc6\x16\x61\xf9\x7b\x76\x02\x22\x2d\x29\
-\x00\xcc\x22\xc5\xbe\x93\x14\x37\x8a\xb7\x66\x29\x78\x1f\xc2\xb4\
-\xfa\xc5\x7e\x51\xd5\xfb\x00\xf8\x8d\x36\xc7\x8c\x70\x9b\xb7\xa6\
-\x26\xc5\x0e\xe2\xad\x79\x0e\xc0\x04\x3b\x8f\x44\x54\xeb\x43\xf4\
-\xa9\xd6\x45\x24\x7f\x6a\x80\x48\xdf\xdd\x1e\x78\xdd\x9c\xa2\xaa\
-\x0f\x49\x9a\xc9\x16\x78\x6b\x96\x61\x72\x25\x48\x8e\x5f\xc3\x87\
-\x58\x87\x6e\x4f\x74\xc7\x34\xbe\x6e\x4b\x96\xc5\x78\x3a\x1f\xc0\
-\x93\xec\x24\x22\x7c\xd3\x39\x97\x53\xbe\xd3\x61\xbd\x10\xac\x73\
-\xce\x85\x6e\x4b\xc8\xb6\x14\xc0\x2b\xa4\xd8\x5a\x01\x22\xe3\xe6\
-\xae\x9e\x9c\xad\x24\x02\x70\x9b\xd8\x77\x13\x63\xc7\x62\x7d\x58\
-\x74\x60\xcb\xe3\x1d\xd0\xf2\x78\x31\x3c\x31\x76\x8c\xa5\xec\x04\
-\x12\x51\xad\x87\xe9\x4b\xad\x8b\x48\xe6\xd4\x00\x91\xbe\x8b\xd9\
-\x6e\xe5\xd8\x64\x59\x4c\xc3\x5b\x73\x2f\x80\xe3\x00\x3c\xc7\x88\
-\x9f\xd8\x39\xde\x9a\x2e\x37\x77\x42\xff\xe6\xcf\x7a\x6b\x96\x24\
-\xcd\x64\xcc\x38\xe7\x5e\x44\xb7\xb7\x46\xdb\xdc\x6a\x00\x5f\x63\
-\x27\xd1\x22\xd6\xf9\x1f\xf7\x91\xe2\x46\x73\xce\xbd\x0c\x60\x39\
-\x29\x3c\x6b\x3b\x05\x11\x96\xab\xd8\x09\x88\xb4\x88\xf5\x8c\xdd\
-\x08\xe0\x1e\x52\xec\x26\x58\x93\xe2\xb6\xa8\xea\xad\x5a\x1c\x8f\
-\xf5\xf7\x06\xf2\x99\x04\xbf\x9f\x9d\x40\x22\xaa\xf5\x30\x7d\xa9\
-\x75\x11\xc9\x9c\x1a\x20\xd2\x6b\xde\x9a\x67\x10\xfe\xd0\x1d\xf9\
-\x36\x58\x9b\x78\x6b\xee\x1a\xc4\xef\x72\xb3\x20\xd6\xd3\x00\xbe\
-\xc5\x4e\x62\x88\xe3\x02\xaf\x63\x9d\x07\xd0\x77\x8b\xc1\x9b\x64\
-\x8e\x71\xb6\x73\xae\x4f\xb5\xb9\x1b\x29\x6e\x0e\x7f\xeb\xcd\x3d\
-\x48\x8a\xbb\x37\x29\xae\x08\xcb\x35\xec\x04\x44\x5a\xc4\x7a\xc6\
-\xae\xf0\xd6\xbc\x44\x8a\xdd\x04\xeb\x19\x3b\x0b\xed\x3e\x67\xe7\
-\xb6\x38\x56\xac\x5c\xb6\x15\x7d\x88\x9d\x40\x22\xaa\xf5\x30\x7d\
-\xa9\x75\x11\xc9\x9c\x1a\x20\x32\x0e\x42\x27\xaf\x8f\x4c\x9a\xc5\
-\x10\xde\x1a\x8f\xc9\x15\x09\x6b\x99\x79\xb4\xe8\x8b\x5d\xfe\x71\
-\x56\x54\xf5\xfe\x08\x7f\x69\x51\x03\x24\x01\xe7\xdc\x46\x00\x8b\
-\xd8\x79\x0c\xf1\x18\x80\x8b\xd8\x49\xb4\x8c\xf5\xc2\x96\xcb\xf6\
-\x57\x9b\xb0\xf2\xdd\xb3\x2c\x4b\x7d\xb1\x26\xe3\xe2\xbe\x8c\xb6\
-\xc6\x13\x09\x11\x7a\xb6\x5c\xdb\x1e\x27\xc5\x6d\x6a\x82\x18\xbb\
-\xcd\x95\x96\x6f\x6b\x71\xac\x18\xeb\xbc\x35\x4f\x91\x62\xc7\xea\
-\xeb\xff\xf1\xaa\xf5\x30\x13\xc4\xd8\x5a\x55\x2d\x22\xff\x4f\x0d\
-\x10\x19\x07\xa1\xdb\x60\xcd\x2e\xaa\xfa\x83\x49\x33\x19\x62\xd0\
-\x04\x39\x06\xf9\x37\x41\x56\x78\x6b\x2e\x65\x27\x31\xc4\x87\x22\
-\xae\x8d\xd9\x4a\x4d\x22\x38\xe7\x1c\xb8\x07\x4e\x0f\x73\xa6\x73\
-\x8e\x75\x16\x44\xeb\xca\xb2\xdc\x11\xbc\xc3\x3a\x57\x90\xe2\x36\
-\xc5\x7a\x61\x9f\x05\x60\x0f\x52\x6c\x91\x51\xcb\xe5\x0b\x66\x91\
-\x50\xbb\x92\xe2\xe6\x36\x29\xfa\x18\x31\xf6\xbc\x16\xc7\x62\x35\
-\x40\x56\x92\xe2\x36\xf1\x28\x3b\x81\x44\x54\xeb\x61\xfa\x52\xeb\
-\x22\x92\x39\x35\x40\x64\x1c\xdc\x12\x71\xed\x9f\x26\xcb\x22\xd0\
-\xe0\x4c\x90\xa3\x30\x79\xee\x40\xae\xbe\xca\x4e\x20\xc0\x27\x02\
-\xaf\x5b\xe5\xad\x61\x1d\xde\x36\x2e\x4e\x63\x27\x30\x05\x0f\xe0\
-\x4a\x76\x12\x2d\x63\x4e\xac\xe7\xf4\xb2\x0e\x70\xf3\x65\xbd\x54\
-\x8b\x8c\xda\x1d\xec\x04\x44\x5a\xa6\x49\xd1\x30\xcc\x49\xf1\xdf\
-\x6c\x71\xac\x5d\x5a\x1c\x2b\x46\x4e\x1f\x95\xac\xc0\xe4\xb9\x15\
-\x7d\xa3\x5a\x0f\xd3\x97\x5a\x17\x91\xcc\xa9\x01\x22\xbd\xe7\xad\
-\x59\x8b\xf0\x83\xc2\x4e\x2e\xaa\x7a\xdb\x94\xf9\x84\xf0\xd6\x2c\
-\x05\x70\x04\x26\xcf\xd1\xc8\xcd\x2f\xbd\x35\xff\xc8\x4e\x62\x3a\
-\x45\x55\x17\x00\xf6\x0f\xbc\xfc\xc6\x94\xb9\x08\xe0\x9c\xbb\x09\
-\xc0\xf5\xec\x3c\xb6\xe0\x54\xe7\x5c\xcd\x4e\xa2\x65\xac\xe5\xfa\
-\x40\x7e\x4d\x5d\x66\xbe\xac\x09\x15\x91\x51\x5b\xc2\x4e\x40\xa4\
-\x2d\x45\x55\x6f\x03\x60\x27\x52\xf8\xac\x56\x8f\x0f\xde\xcf\x58\
-\x93\xe2\x6d\xfe\x8d\x76\x6e\x71\xac\x18\x4f\x90\xe2\x46\xf3\xd6\
-\xd4\xe8\xd7\x39\x97\xaa\xf5\x08\x3d\xaa\x75\x11\xc9\x9c\x1a\x20\
-\x32\x2e\xae\x0b\xbc\x6e\x5b\x00\x65\xca\x44\x42\x79\x6b\x1e\x04\
-\xf0\x01\xe4\xd7\x04\xf9\x1a\x3b\x81\x00\x1f\x8f\xb8\xf6\x07\xc9\
-\xb2\x90\xcd\x9d\x0a\xe0\x35\x76\x12\x9b\xb9\xc1\x39\xd7\xc7\xe6\
-\xd7\x6c\x62\xec\xac\x5e\xd8\x00\x3c\x4b\x8c\xcd\x9a\x50\x11\x19\
-\x35\xe6\xd6\x18\x22\x6d\xdb\x9e\x18\x9b\xf9\xcc\x6a\x8a\x35\x29\
-\xde\xe6\xa4\xe8\x9c\x16\xc7\x8a\x91\xdb\x6f\xaa\xe7\xd8\x09\xb4\
-\x4c\xb5\x1e\xa7\x0f\xb5\x2e\x22\x99\x53\x03\x44\xc6\xc5\xe5\x11\
-\xd7\xd2\xb7\xc1\xda\xc4\x5b\xf3\x28\x80\xc3\x00\x3c\xcc\xce\x25\
-\xd0\x6a\x00\x5d\x3f\xfb\x03\x00\x3e\x16\x78\xdd\x0b\x08\x6f\x9e\
-\xc9\x0c\x38\xe7\x96\x00\xb8\x8a\x9d\xc7\xc0\x6b\x98\x6c\xc8\xf4\
-\x11\x73\x85\x5b\x6e\x2f\x6c\xcc\xc9\x05\x35\x40\x64\x1c\xac\x77\
-\xce\xad\x61\x27\x21\xd2\xa2\xed\x88\xb1\x73\x9b\x10\x07\xfa\x31\
-\x29\xba\x4d\x8b\x63\xc5\xc8\xed\x37\x55\xaf\x56\x80\x40\xb5\x1e\
-\xab\x0f\xb5\x2e\x22\x99\x53\x03\x44\xc6\xc2\xa0\x91\x10\x7a\xd0\
-\xf2\x09\x45\x55\xcf\x4d\x99\x4f\x0c\x6f\xcd\x04\x26\x9b\x20\x9e\
-\x9c\x4a\x88\x73\xbd\x35\x2f\xb2\x93\x98\x4e\x51\xd5\x27\x21\xfc\
-\xc0\xc2\xab\xbd\x35\x2f\xa5\xcc\x47\x7e\xcd\x22\x00\xff\xcb\x4e\
-\x02\xc0\x15\xce\xb9\xd0\x6d\xf3\x72\xc3\x7a\x61\xab\x9d\x73\xeb\
-\x49\xb1\x9b\x62\x7e\xad\xc8\x3a\xa8\x5e\x64\x94\x72\x5b\xe1\x2a\
-\x32\x0c\xf3\xff\xee\xe7\x89\xb1\x9b\x62\xfd\x2e\x78\x4b\x8b\x63\
-\xb1\x1a\x20\xb9\x4d\x82\xf7\x6d\x05\x88\x6a\x3d\x4e\x1f\x6a\x5d\
-\x44\x32\xa7\x06\x88\x8c\x93\xef\x45\x5c\xfb\x99\x64\x59\x34\xe0\
-\xad\x59\x83\xc9\x83\xd1\x6f\x62\xe7\x32\x8d\x55\x00\x2e\x60\x27\
-\x11\xe0\xb3\x11\xd7\xc6\xfc\x9b\x91\x19\x72\xce\x4d\x80\xbf\x82\
-\xe8\x25\x00\x67\x92\x73\x48\x89\xb5\x02\xe4\x15\x52\xdc\x99\x78\
-\x99\x18\x9b\x35\xa1\x22\xfa\x6d\x3c\x4a\x9d\xfe\x60\x42\xa4\x01\
-\xe6\x57\xe1\xcc\x67\x56\x53\xac\xdf\x06\x6d\x3e\x63\x59\xcf\xeb\
-\xdc\x26\xc1\x73\xfc\x1d\x38\x1d\xd5\x7a\x9c\x3e\xd4\xba\x88\x64\
-\x4e\x2f\x79\x32\x4e\xae\x8e\xb8\xf6\x73\x45\x55\xef\x90\x2c\x93\
-\x06\xbc\x35\x2f\x78\x6b\x8e\x05\x70\x0d\x3b\x97\x29\x9c\xd9\xf5\
-\xd5\x12\x45\x55\x1f\x06\xe0\x84\xc0\xcb\x9f\xf4\xd6\x74\xb9\xe1\
-\xd4\x57\x67\x81\xfb\x52\x77\xb1\x73\xae\x22\xc6\x4f\x8d\xf5\xc2\
-\x96\xe3\x8b\x2f\xf3\x05\xf3\xcd\xc4\xd8\xe3\x6e\x6b\x76\x02\x63\
-\x64\x03\x3b\x01\x91\x96\x31\x27\x45\x73\x7c\xce\xf6\x61\x52\x94\
-\x35\xc1\x9a\xdb\xdf\x3b\xb7\x7c\x87\x51\xad\xc7\xe9\x43\xad\x8b\
-\x48\xe6\xd4\x00\x91\xb1\xe1\xad\x59\x05\xe0\xdf\x03\x2f\x9f\x0d\
-\xe0\x73\x09\xd3\x69\xcc\x5b\xf3\x51\x00\xdf\x61\xe7\xf1\x3a\xcb\
-\xbd\x35\xff\xc4\x4e\x22\xc0\x97\x22\xae\xfd\xe7\x64\x59\xc8\x94\
-\x9c\x73\xab\x01\x9c\x47\x4c\x21\x87\x55\x4c\x33\xa1\x15\x20\x81\
-\x9c\x73\x35\x80\x8d\xa4\xf0\x7a\x61\xe3\x51\x03\x64\x74\xba\xb0\
-\xe5\xa1\x48\x9b\x98\x93\xa2\x39\xd6\x53\x1f\x26\x45\x59\xcf\xeb\
-\xdc\x56\x01\xe4\x96\xef\x30\xaa\xf5\x38\x7d\xa8\x75\x11\xc9\x9c\
-\x1a\x20\x32\x6e\x62\xb6\x34\x5a\x58\x54\xf5\xec\x64\x99\xcc\x80\
-\xb7\xe6\x93\x00\xce\x65\xe7\xb1\x99\x85\xec\x04\x86\x29\xaa\x7a\
-\x3e\x80\x13\x23\x6e\xb9\x3c\x55\x2e\x32\xd4\x85\xc4\xd8\x39\xbe\
-\x54\xc4\x60\x3d\xf7\x6b\x52\xdc\x99\x7a\x8d\x9d\x80\x8c\x9c\x1a\
-\x20\x22\xd2\x14\xf3\xdd\x3a\xc7\xe7\x6c\x1f\x9e\xb1\xb3\x48\x71\
-\x73\x6b\x28\xbc\xca\x4e\xa0\x65\xaa\xf5\x38\x7d\xa8\x75\x11\xc9\
-\x9c\x1a\x20\x32\x56\xbc\x35\x57\x02\x78\x26\xf0\xf2\x1d\x00\x9c\
-\x92\x30\x9d\x19\xf1\xd6\x9c\x0a\xe0\xaf\xd9\x79\x00\xb8\xc2\x5b\
-\xf3\x63\x76\x12\x01\xfe\x26\xe2\xda\x9b\xbc\x35\xcb\x52\x25\x22\
-\x43\xe5\xf6\x52\x97\x13\x7d\x81\x15\x87\x35\x19\xae\xb3\x11\x78\
-\xd4\x00\x11\x91\xa6\x98\xab\x1d\x73\x7c\xce\xb2\x72\x6e\xf3\x19\
-\xcb\x9a\xd8\x37\xa4\xb8\x4d\xe5\x38\x69\x3f\x1d\xd5\x7a\x9c\x3e\
-\xd4\xba\x88\x64\x4e\x0d\x10\x19\x47\x5f\x8d\xb8\xf6\x94\xa2\xaa\
-\x77\x4c\x96\xc9\x0c\x79\x6b\xbe\x0e\xe0\x63\xc4\x14\x9e\x45\x47\
-\xb7\x0a\xdb\x5c\x51\xd5\xef\x03\x70\x52\xc4\x2d\x7f\x9b\x2a\x17\
-\x11\x32\x56\x73\x89\xf5\x85\x64\x63\x65\x59\x32\x27\xc2\xf5\xc2\
-\xc6\x33\x87\x9d\x80\x88\x64\x8b\xb9\x8a\x34\xc7\x49\x51\xd6\x6f\
-\x83\x36\xcf\x2c\x64\xfd\xae\xca\xf1\xef\xdd\x27\xaa\xf5\x38\x7d\
-\xa8\x75\x11\xc9\x9c\x1a\x20\x32\x8e\x2e\x01\xb0\x26\xf0\xda\x1d\
-\x11\xb7\x72\x60\xe4\xbc\x35\x57\x60\xf2\x60\xef\x17\x08\xe1\xff\
-\xcc\x5b\x13\xba\xa2\x86\xe9\xa2\x88\x6b\x6f\xd7\xe1\xe7\xd2\x63\
-\xac\x17\xf5\x1c\xbf\xaa\x67\xbe\x60\xaa\x01\xc2\xb3\x3d\x3b\x01\
-\x11\xc9\x16\x73\x05\x6b\x8e\xcf\x59\x56\xce\x6a\x80\xc8\x4c\xa9\
-\xd6\xe3\xf4\xa1\xd6\x45\x24\x73\x6a\x80\xc8\xd8\xf1\xd6\x6c\x00\
-\xf0\xf5\x88\x5b\x3e\x5b\x54\xf5\x01\xa9\xf2\x69\x83\xb7\xe6\x06\
-\x00\x47\x20\x7c\x7b\xaf\x36\x2c\xf6\xd6\x5c\x3b\xc2\x78\x8d\x14\
-\x55\xfd\x49\x00\xef\x8d\xb8\xe5\xac\x54\xb9\x88\x74\x00\x6b\x62\
-\xfd\x4d\x65\x59\xb2\x0e\x60\x6f\xea\x2d\xc4\xd8\x7a\x61\xe3\xd9\
-\x81\x9d\x80\x88\x64\x6b\x03\x31\x76\x27\xcf\x2d\x1c\x82\x75\x90\
-\xb4\x1a\x20\xa3\xf7\x66\x76\x02\x2d\x53\xad\xc7\xe9\x43\xad\x8b\
-\x48\xe6\xd4\x00\x91\x71\x75\x01\x80\xe7\x23\xae\xff\x76\xaa\x44\
-\xda\xe2\xad\xb9\x07\xc0\x7c\x00\x8f\x8c\x20\xdc\x43\x00\x3e\x33\
-\x82\x38\x33\x52\x54\xf5\x1c\x00\xff\x10\x71\xcb\xdd\xde\x9a\xeb\
-\x53\xe5\x23\xd2\x01\x6b\x89\xb1\x77\x22\xc6\x6e\x82\x99\xaf\x56\
-\x80\xf0\x68\x05\x88\x88\x34\xc5\x5c\x15\x9d\xdb\x33\x16\xe0\xfd\
-\x7f\xdb\x87\x06\x48\x6e\xcf\xaa\x1c\x27\xed\xa7\xa3\x5a\x8f\xd3\
-\x87\x5a\x17\x91\xcc\xa9\x01\x22\x63\xc9\x5b\xf3\x3c\x80\x6f\x44\
-\xdc\x72\x54\x51\xd5\x1f\x4d\x95\x4f\x5b\xbc\x35\x15\x80\x43\x01\
-\xdc\x92\x30\xcc\x5a\x00\x27\x79\x6b\x72\xf8\x41\x71\x36\xe2\xbe\
-\xe6\xfd\x52\xaa\x44\x44\x3a\x22\x74\xfb\xbf\x14\x76\x26\xc6\x6e\
-\x82\x79\xfe\x13\xf3\xcb\xc2\x71\xb7\x0b\x3b\x01\x11\xc9\xd6\x6a\
-\x00\x1b\x49\xb1\x35\x29\x1a\xae\xcd\x8f\x0c\x58\x0d\x90\xdc\xfe\
-\xde\x7d\x6b\x80\xa8\xd6\xe3\xf4\xa1\xd6\x45\x24\x73\x6a\x80\xc8\
-\x38\xfb\x26\x80\xf5\x11\xd7\x9f\x57\x54\x35\x73\x4b\x94\x20\xde\
-\x9a\x35\xde\x9a\x05\x88\x6b\xf0\x84\x5a\x0f\xe0\x38\x6f\xcd\xc3\
-\x09\xc6\x6e\x55\x51\xd5\x07\x21\x6e\x95\xca\x3d\xde\x9a\x1f\xa6\
-\xca\x47\xa4\x23\x56\x13\x63\xe7\xf6\xc2\xc6\xcc\xf7\x29\x62\xec\
-\x71\xb7\x07\x3b\x01\x11\xc9\x93\xb7\xa6\x06\xb0\x8e\x14\x9e\xd9\
-\xb4\x8f\x56\x54\xf5\x76\x00\x58\x5b\x63\xb6\xf9\x8c\x7d\xae\xc5\
-\xb1\x62\xe4\xf6\x9b\xaa\x57\x0d\x10\xd5\x7a\xb8\x1e\xd5\xba\x88\
-\x64\x4e\x0d\x10\x19\x5b\xde\x9a\x35\x00\x16\x45\xdc\xb2\x07\x80\
-\xf3\x12\xa5\xd3\x3a\x6f\xcd\x29\x00\xfe\x08\x71\x5b\x7d\x4d\x67\
-\x3d\x80\xe3\x07\x5b\x6d\xe5\xe0\xf2\xc8\xeb\x3f\x95\x24\x0b\x91\
-\x6e\x59\x45\x8c\x9d\xdb\xc4\xf2\xee\xc4\xd8\x2b\x89\xb1\xc7\x1d\
-\xf3\xef\x2e\x22\xf9\x63\x6d\x35\xb9\x1b\x29\x6e\x53\x7b\x13\x63\
-\x3f\xd1\xe2\x58\xac\x95\xb5\xb9\xad\x56\xcc\x2d\xdf\x10\xaa\xf5\
-\x30\x7b\x13\x63\xb7\x59\xeb\x22\x92\x39\x35\x40\x64\xac\x79\x6b\
-\xbe\x05\x60\x49\xc4\x2d\x7f\x5e\x54\x75\x99\x2a\x9f\xb6\x79\x6b\
-\xfe\x15\xc0\x81\x98\xf9\x96\x58\xcf\x00\x78\xbf\xb7\xe6\x8e\x99\
-\x67\x95\x5e\x51\xd5\x17\x02\x38\x38\xe2\x96\xc5\xde\x9a\x9f\xa7\
-\xca\x47\xa4\x2b\x9c\x73\x4f\x83\xb7\x1c\x7c\x2f\x52\xdc\xa6\x2c\
-\x31\xf6\xe3\xc4\xd8\x63\xab\x2c\xcb\x6d\x90\xdf\x56\x6d\x22\xd2\
-\x2d\xac\x06\xf6\x9e\xa4\xb8\x4d\xcd\x23\xc6\x6e\xf3\x19\xcb\x3a\
-\x0b\x22\x9b\xbf\x77\x51\xd5\x5b\x23\xb3\x55\x0b\x81\x54\xeb\x61\
-\xfa\x52\xeb\x22\x92\x39\x35\x40\x44\x80\xbf\x88\xbc\xfe\x3b\x45\
-\x55\xef\x93\x24\x93\x04\xbc\x35\x2b\x07\x5b\x62\x9d\x0c\xe0\xd1\
-\x06\x43\xdc\x0a\xe0\x7d\xde\x9a\xfb\x5b\x4d\x2c\x91\xa2\xaa\x3f\
-\x0c\xe0\xd3\x11\xb7\xfc\x0a\xc0\xe9\x89\xd2\x11\xe9\x22\xd6\x0b\
-\x1b\xb3\xa1\xd0\x04\xab\x61\xb3\xc6\x39\x97\xc3\x19\x4b\x4d\x6c\
-\xcd\x4e\x60\x88\xb7\x03\x30\xec\x24\x44\x24\x6b\xac\x67\x6c\x6e\
-\xab\x2c\x99\xbf\x09\x56\xb4\x38\x16\xab\x01\x92\xd3\x47\x25\x7b\
-\xa0\x9f\xf3\x4e\xaa\xf5\x30\x7d\xa9\x75\x11\xc9\x5c\x1f\x1f\x44\
-\x22\x51\xbc\x35\xb7\x23\x6e\xbb\xa4\x39\x00\xae\x4d\x94\x4e\x32\
-\xde\x1a\xe7\xad\xd9\x17\xc0\x5f\x02\x78\x2c\xe0\x96\x67\x00\x2c\
-\xf4\xd6\x1c\xe9\xad\x99\x48\x9a\x5c\x4b\x8a\xaa\xde\x1b\xc0\x65\
-\x91\xb7\x9d\xe6\xad\x61\x9e\x8b\x20\x32\x6a\x13\xa4\xb8\xfb\x92\
-\xe2\x36\xc5\x6a\x74\x3f\x49\x8a\x3b\x0a\x5d\x6f\x80\xbc\x8b\x9d\
-\x80\x88\x64\x6f\x82\x14\x77\xcf\xa2\xaa\x67\x91\x62\x37\xc1\xfc\
-\x98\xac\x6a\x71\x2c\xd6\x3b\xc4\xee\x45\x55\xe7\xd2\xb0\xcf\xed\
-\x03\x98\x50\x13\xa4\xb8\xaa\xf5\x70\x6d\xd6\xba\x88\x64\x4e\x0d\
-\x10\x91\x49\x9f\x47\xdc\x59\x19\x07\x17\x55\x9d\xe2\x90\xf1\xe4\
-\xbc\x35\x17\x79\x6b\xe6\x01\xd8\x1f\xc0\x5f\x01\xf8\x0f\x4c\x6e\
-\x91\x75\x03\x80\xef\x02\xf8\x32\x80\xc3\xbd\x35\x73\x07\x5b\x84\
-\xe5\xc4\x01\x78\x6b\xc4\xf5\x77\x7a\x6b\x2e\x49\x95\x8c\x48\x47\
-\x3d\x42\x8a\xfb\x6e\x52\xdc\xa6\x58\x93\xe1\x7d\x5e\xae\xcf\x3a\
-\x04\x33\xd4\x81\xec\x04\x44\x24\x7b\x0f\x93\xe2\x6e\x8b\xbc\xfe\
-\x0f\x63\x3d\x63\x5f\x68\xf9\xc3\x27\xd6\xd9\x6a\xdb\x02\x78\x27\
-\x29\x76\xac\x5c\xf2\x8c\xa5\x5a\x0f\xd3\x97\x5a\x17\x91\xcc\xe5\
-\xd4\x39\x16\x49\xc6\x5b\xb3\xaa\xa8\xea\x45\x00\x62\x26\xfc\x17\
-\x16\x55\xfd\x80\xb7\xe6\xd2\x54\x79\xa5\xe4\xad\x79\x10\xc0\x83\
-\x00\xce\x67\xe7\xd2\x86\xa2\xaa\xaf\x00\x70\x48\xe4\x6d\xb1\xdb\
-\x9f\x89\xf4\xc1\xbd\xa4\xb8\x73\xcb\xb2\xdc\xd5\x39\xf7\x14\x29\
-\x7e\xb0\xb2\x2c\xf7\x02\xb0\x03\x29\xfc\x52\x52\xdc\x51\xd8\x89\
-\x9d\xc0\x10\x39\x4d\x28\x88\x48\x37\xdd\x4d\x8c\x5d\x20\xee\x6c\
-\x43\xa6\x03\x48\x71\x97\xb7\x3c\xde\x44\xcb\xe3\xc5\x98\x0f\xe0\
-\x01\x62\xfc\x50\xef\x60\x27\x90\x88\x6a\x3d\x4c\x5f\x6a\x5d\x44\
-\x32\xa7\x15\x20\x22\x03\xde\x9a\x0b\x00\xdc\x14\x79\xdb\x25\x45\
-\x55\x7f\x24\x45\x3e\x12\xae\xa8\xea\xcb\x00\xfc\x71\xe4\x6d\x5f\
-\xd0\xc1\xe7\x32\xa6\xee\x21\xc6\x9e\x4f\x8c\x1d\xa3\x20\xc6\x66\
-\xbe\x50\xa7\xd6\xf5\x03\xc6\x0f\x65\x27\x20\x22\xd9\x5b\x0a\x60\
-\x03\x29\x76\xec\x87\x40\x14\x45\x55\xef\x08\xde\x41\xce\xf7\xb5\
-\x3c\x1e\xb3\x01\xc1\xfc\xad\x12\x63\x3f\x76\x02\x89\xa8\xd6\x87\
-\xe8\x59\xad\x8b\x48\xe6\xd4\x00\x11\xf9\x75\x27\x03\x78\x3a\xf2\
-\x1e\x57\x54\xf5\x07\x53\x24\x23\xc3\x15\x55\xfd\x15\x00\x9f\x88\
-\xbc\xed\x66\x6f\xcd\x57\x12\xa4\x23\x92\x83\x25\x00\x36\x92\x62\
-\x1f\x4d\x8a\x1b\x8b\x99\xa7\x27\xc6\x4e\xed\xb7\xd8\x09\x4c\xa5\
-\x2c\xcb\xbd\x91\xdf\xc1\xa2\x22\xd2\x31\xde\x9a\x1a\xc0\x32\x52\
-\xf8\xc3\x49\x71\x63\x1d\x0f\x80\x75\x7e\x45\xab\x1f\x81\x78\x6b\
-\x56\x02\x58\xdf\xe6\x98\x11\x72\x69\xda\x1f\xcc\x4e\x20\x05\xd5\
-\x7a\x90\xde\xd4\xba\x88\xe4\x4f\x0d\x10\x91\xcd\x78\x6b\xd6\x00\
-\x68\xb2\xa2\xe3\x07\x45\x55\xe7\xf2\x65\x73\x6f\x14\x55\xbd\x10\
-\xc0\xa2\xc8\xdb\x9e\x06\x50\x26\x48\x47\x24\x0b\xce\xb9\x17\x31\
-\xb9\xfd\x1d\xc3\x02\x52\xdc\x58\xac\x06\xc8\x0b\xe8\xf7\x92\x7d\
-\xe6\x41\x98\xc3\xe4\xd2\x9c\x13\x91\xee\x63\x4d\xbc\x1d\x34\xf8\
-\xe2\xba\xeb\x16\x10\x63\xdf\x95\x60\xcc\x47\x13\x8c\x19\xe2\x90\
-\xa2\xaa\xb7\x27\xc5\x0e\x52\x54\xf5\x3c\x00\xbb\xb2\xf3\x48\x48\
-\xb5\x3e\xbd\x05\xc4\xd8\x29\x6a\x5d\x44\x32\xa6\x06\x88\xc8\xeb\
-\x78\x6b\x6e\x03\x70\x7a\xe4\x6d\xdb\x02\xf8\xcf\xa2\xaa\x7b\xf9\
-\x85\x4b\x17\x15\x55\xfd\x29\x00\x4d\x0e\xa2\x2f\x07\x8d\x2e\x91\
-\x71\xf6\x33\x52\xdc\xf7\x94\x65\xb9\x0b\x29\x76\x90\xb2\x2c\x77\
-\x06\xef\xc0\xf6\xfb\x9c\x73\xaf\x8d\x20\xce\xab\x23\x88\xb1\x25\
-\x7b\x95\x65\xd9\xd5\xf3\xe7\x4e\x64\x27\x20\x22\xbd\xf1\x53\x52\
-\xdc\xad\x00\xfc\x2e\x29\x76\x8c\xa3\x48\x71\x37\x02\xb8\x33\xc1\
-\xb8\x8f\x24\x18\x33\xc4\x2c\x00\x5d\xdf\x85\x80\xf5\xb7\x1e\x15\
-\xd5\xfa\xf4\xfa\x56\xeb\x22\x92\x31\x35\x40\x44\xb6\xc0\x5b\xf3\
-\x77\x88\x3f\x0f\x64\x7b\x00\xb7\x14\x55\x9d\xcb\x92\xd4\x6c\x15\
-\x55\x7d\x3a\x80\x4b\x1a\xdc\x7a\x86\xb7\xe6\xd6\xb6\xf3\x11\xc9\
-\xd0\x2d\xa4\xb8\x5b\x61\x72\xab\xc1\x2e\xfb\x08\x26\xf3\x64\x18\
-\xd5\xd7\x6a\x2f\x8e\x28\xce\xeb\x6d\x0d\xe0\x5d\xa4\xd8\x53\x2a\
-\xcb\x72\x1b\x00\x27\xb1\xf3\x10\x91\xde\xf8\x09\x31\x76\xa7\x9f\
-\xb1\x45\x55\x1f\x00\xe0\x40\x52\xf8\xe5\xde\x9a\x14\x67\x36\xb0\
-\x56\xd5\x02\xc0\x87\x89\xb1\x43\xe4\x30\x49\x3f\x13\xaa\xf5\x29\
-\xf4\xb4\xd6\x45\x24\x63\xff\x07\x00\x00\xff\xff\xec\xdd\x7b\xfc\
-\xe5\x53\xbd\xc7\xf1\xd7\x22\xc2\x8c\xa9\xd0\x85\x68\xc9\x25\xa2\
-\xd4\xf9\x56\x46\xa5\xa1\xdc\x75\x43\xab\xcb\x21\x72\xa9\x74\xce\
-\x1c\x91\x92\x1c\xea\x38\x87\x83\x93\x54\x8e\x83\x23\xca\xbd\xc8\
-\x07\x99\x18\xe4\x7e\x6d\x84\x55\x23\xf7\xfb\x97\xce\x28\x69\x30\
-\x17\xb7\xc1\xf7\xfc\xb1\xf6\x30\xcd\xf5\x37\x7b\x7f\xf7\x5e\xdf\
-\xbd\xf7\xfb\xf9\x78\xec\xc7\xcf\x8c\xd9\xdf\xcf\x7b\x66\x3f\xd6\
-\x6f\xff\xf6\x77\x5d\x3e\x9a\x00\x11\x59\xb0\xcf\x02\x0f\x2d\xe6\
-\x73\x96\x07\xae\x2f\xca\xea\x13\x5d\xc8\x23\x40\x51\x56\x47\x01\
-\x87\xb5\xf1\xd4\x89\xd1\xbb\xc3\xeb\xce\x23\xd2\xa7\xae\xce\x58\
-\xfb\x73\x19\x6b\x8f\x44\xce\x0f\x94\xbf\xe9\x51\x9d\xe7\x7a\x54\
-\x67\x7e\x9a\x78\x5c\xe4\x56\xc0\x98\xdc\x21\x44\x64\x30\x44\xef\
-\xfe\x44\xbe\x5d\x01\x5b\x14\x65\x35\x2a\x53\xed\x91\xd8\x31\x63\
-\xed\xc5\x5d\xdc\x36\x52\x39\x8f\xda\xf9\x64\x53\x5f\xef\xa2\xac\
-\x96\x04\x36\xcf\x9d\xa3\x9b\x34\xd6\x17\x6a\x10\xc7\xba\x88\xf4\
-\x31\x4d\x80\x88\x2c\x40\xeb\x98\xa4\x2d\x58\xfc\xa6\xe8\x00\xbf\
-\x2e\xca\xea\x0b\x35\x47\x1a\x7a\x45\x59\x9d\x02\xec\xdb\xc6\x53\
-\x6f\xa4\xbd\xde\x2e\x22\x03\xc9\xcc\x1e\x03\xfe\x98\xa9\xfc\xb8\
-\x10\xc2\xda\x99\x6a\x2f\x54\x08\xe1\x6d\xe4\x3b\xaf\xf8\x79\x7a\
-\xb7\x92\x30\xe7\x04\x48\x13\x7b\x6d\xec\x91\x3b\x80\x88\x0c\x9c\
-\x2b\x33\xd5\x1d\x05\xec\x9a\xa9\xf6\x42\x15\x65\xe5\x80\x9c\x9f\
-\x8f\x2e\xee\xd2\x75\xaf\x05\xaa\x2e\x5d\x7b\x51\x46\x01\x3b\x65\
-\xaa\xbd\x28\x5b\x03\x2b\xe4\x0e\xd1\x03\x1a\xeb\x73\x19\xe0\xb1\
-\x2e\x22\x7d\x4c\x13\x20\x22\x0b\x11\xbd\x7b\x80\x74\xb6\xea\xb4\
-\x36\x9e\xfe\x8b\xa2\xac\xda\xb9\x59\x2f\xf3\x51\x94\xd5\xb9\xc0\
-\x97\xda\x78\xea\x1f\x81\x6d\xa3\x77\x39\x6f\xf8\x89\x34\xd1\x05\
-\x99\xea\x2e\x01\xec\x9d\xa9\xf6\xa2\xec\x45\x3a\x53\x3b\x87\xeb\
-\xcc\x6c\x66\x8f\x6a\xe5\x3c\x16\x60\xf3\x10\x82\xcb\x58\xff\xef\
-\x84\x10\x56\x07\xb4\x6b\x53\x44\xea\x76\x7e\xc6\xda\xe3\x33\xd6\
-\x5e\x98\xed\x81\x35\x33\xd5\x9e\x09\x5c\xde\x8d\x0b\x47\xef\x1e\
-\x27\x5f\x23\x74\x80\xaf\x67\xac\xbd\x30\x5f\xc9\x1d\xa0\x47\x34\
-\xd6\xe7\x35\x90\x63\x5d\x44\xfa\x9b\x26\x40\x44\x16\x21\x7a\x77\
-\x1b\xf0\xf1\x36\x9f\x7e\x54\x51\x56\xe7\x34\x7c\x7b\x6a\xa3\x15\
-\x65\xb5\x66\x51\x56\xb7\xd3\xde\x19\xb7\x0f\x02\x9b\x47\xef\x9e\
-\xae\x39\x96\xc8\x20\xf8\x55\xc6\xda\xbb\x86\x10\xde\x98\xb1\xfe\
-\x3c\x42\x08\x63\xc8\xbb\x13\xe0\x92\x1e\xd6\x6a\x67\x67\x63\x5d\
-\xde\x0c\x6c\x9c\xb1\xfe\xdc\xbe\x41\xbe\x9e\x2f\x22\x32\xb8\x2e\
-\x03\x9e\xcc\x54\xfb\x9d\x45\x59\x6d\x9f\xa9\xf6\xc2\xe4\x5c\xfc\
-\x70\x7d\x97\x17\x43\xdd\xdc\xc5\x6b\x2f\xca\xfa\x45\x59\x35\xaa\
-\x17\x48\x51\x56\x6f\x65\xf0\xfb\x7f\xcc\xa6\xb1\x3e\xaf\x41\x1e\
-\xeb\x22\xd2\xa7\x34\x01\x22\x32\x02\xad\xc6\xd9\x9f\x6e\xf3\xe9\
-\x01\xf8\x7d\x51\x56\xef\xac\x31\xd2\x50\x28\xca\x6a\x3b\xe0\x36\
-\xda\x6b\xa0\xf6\x38\xb0\x69\x6b\x55\x96\x88\xcc\xc5\xcc\x6e\x05\
-\x1e\xce\x54\x7e\x14\x70\x48\xa6\xda\x0b\x72\x20\xf0\x86\x8c\xf5\
-\x27\xf6\xb0\xd6\x9f\x7a\x58\x6b\x7e\x76\xcb\x5c\x1f\x80\xd6\x51\
-\x6c\x7b\xe6\xce\x21\x22\x83\x27\x7a\xf7\x22\xbd\xeb\xeb\x34\x3f\
-\x87\x15\x65\x95\x6b\x47\xe3\x3c\x8a\xb2\xfa\x34\x30\x2e\x63\x84\
-\x6e\xbf\x16\x93\xba\x7c\xfd\x45\x39\xa4\x49\xaf\x37\x70\x30\xb0\
-\x74\xee\x10\xbd\xa0\xb1\xfe\xf7\x86\x60\xac\x8b\x48\x9f\xd2\x04\
-\x88\xc8\x08\x45\xef\x26\x00\xbb\xb4\xf9\xf4\xb5\x81\x58\x94\x95\
-\xce\x19\x1f\xa1\xa2\xac\x8e\x27\x6d\x29\x5e\xae\x8d\xa7\x3f\x49\
-\xda\xf9\xf1\x68\xbd\xa9\x44\x06\xce\x19\x19\x6b\x7f\x39\x84\xf0\
-\x9e\x8c\xf5\x5f\xd1\x3a\x06\x29\xe7\x11\x12\x93\xcd\xec\xae\x1e\
-\xd6\xfb\x0b\xf0\x62\x0f\xeb\xcd\xed\xf3\x21\x84\x37\x65\xac\x3f\
-\xdb\x0f\x81\xd7\xe6\x0e\x21\x22\x03\xeb\xd4\x8c\xb5\xd7\x05\xf6\
-\xc9\x58\xff\x15\x45\x59\x2d\x05\x1c\x91\x31\xc2\x2c\xe0\xac\x2e\
-\xd7\xc8\x7d\xd3\x75\x3d\x60\xff\xcc\x19\x00\x28\xca\xea\x1d\xb4\
-\x77\x6c\x71\x3f\xd3\x58\x67\x68\xc6\xba\x88\xf4\x29\x4d\x80\x88\
-\x2c\x86\xe8\xdd\xe9\xc0\xce\x6d\x3e\x7d\x19\xe0\xa4\xa2\xac\xce\
-\x28\xca\xea\xf5\x35\xc6\x1a\x28\x45\x59\x6d\x50\x94\xd5\x1f\x80\
-\xaf\xb5\x79\x89\xbf\x02\xe3\xa2\x77\xb9\x1a\x3c\x8b\xf4\x93\x9f\
-\x92\xaf\x71\xe7\x92\xc0\x99\x21\x84\x65\x32\xd5\x07\x20\x84\xb0\
-\x24\x69\x22\x28\x67\x8e\x93\x7a\x59\xcc\xcc\x5e\x26\xef\x31\x58\
-\xcb\x01\xfb\x65\xac\x4f\x08\x61\x4f\xd4\xfb\x43\x44\xba\xeb\x12\
-\xe0\x91\x8c\xf5\xff\xbd\x28\xab\x0d\x32\xd6\x9f\xed\x48\xd2\x4d\
-\xda\x5c\x2e\x8e\xde\x4d\xe9\x66\x81\xe8\xdd\x5d\xc0\xbd\xdd\xac\
-\x31\x02\x07\x14\x65\xf5\xde\x9c\x01\x5a\xcd\xaf\x4f\x06\x96\xca\
-\x99\x23\x03\x8d\xf5\x64\xe0\xc7\xba\x88\xf4\x2f\x4d\x80\x88\x2c\
-\xa6\xe8\xdd\x19\xc0\x76\x1d\x5c\x62\x27\xe0\xbe\xa2\xac\x1a\x71\
-\x04\x48\x53\x14\x65\x35\xba\x28\xab\xa3\x81\xc9\x40\xbb\xab\xc2\
-\x1f\x05\x36\x8c\xde\xdd\x5e\x5f\x32\x91\xc1\x65\x66\x0f\x03\x57\
-\x67\x8c\xb0\x3e\x70\x7c\xc6\xfa\x00\x87\x02\x1f\xce\x58\xff\x19\
-\xf2\xec\xc4\x79\x20\x43\xcd\x39\xed\x15\x42\xc8\x72\x34\x64\x08\
-\xe1\xfd\xc0\x8f\x73\xd4\x16\x91\xe1\x11\xbd\xab\x80\x9f\x67\x8c\
-\xb0\x1c\xf0\x8b\xa2\xac\x5e\x97\x2b\x40\xeb\x38\xdb\xbd\x72\xd5\
-\x6f\xf9\x59\x8f\xea\xf4\xf2\x28\xcb\xf9\x19\x05\x9c\x93\xf3\xf5\
-\x06\xfe\x03\xf8\x50\xc6\xfa\x59\x68\xac\x0f\xdd\x58\x17\x91\x3e\
-\xa4\x09\x10\x91\x36\x44\xef\x2e\x00\x36\x07\x9e\x6d\xf3\x12\x2b\
-\x01\x3f\x2b\xca\xea\xa6\xa2\xac\xd6\xab\x2f\x59\x7f\x2a\xca\x6a\
-\x47\xd2\xaa\xa9\x4e\x8e\xa0\xb9\x1f\x18\x1b\xbd\x7b\xb8\x96\x50\
-\x22\xc3\xe3\xd8\xcc\xf5\x77\x0d\x21\xfc\x30\x47\xe1\x10\xc2\xbe\
-\xc0\x77\x72\xd4\x9e\xc3\x79\x66\xf6\x54\x86\xba\xb7\x65\xa8\x39\
-\xa7\xd7\x02\xa7\x84\x10\x7a\x7a\x46\x78\x08\xe1\xbd\xa4\x95\x9a\
-\x59\x77\x1e\x89\xc8\xd0\x38\x16\x78\x21\x63\xfd\xf5\x80\x4b\x8b\
-\xb2\x1a\xdd\xeb\xc2\x45\x59\x6d\x06\x9c\x49\xde\x7b\x0e\x8f\x02\
-\x13\x7a\x54\xeb\xfc\x1e\xd5\x59\x98\xb5\x80\x0b\x8b\xb2\x6a\xe7\
-\x08\xe1\x8e\x14\x65\xb5\x27\xa9\x9f\xda\xb0\xd2\x58\x1f\x9e\xb1\
-\x2e\x22\x7d\x48\x13\x20\x22\x6d\x8a\xde\x5d\x01\x6c\x0a\x74\x72\
-\xe3\x6a\x43\xe0\x8e\xa2\xac\x7e\x34\x8c\xc7\x62\x15\x65\xf5\xce\
-\xa2\xac\xae\x24\xfd\xc0\xb4\x72\x07\x97\xfa\x03\xb0\x51\xf4\xee\
-\xb1\x7a\x92\x89\x0c\x95\xf3\x80\xfb\x32\x67\xf8\x46\x08\xe1\xf8\
-\x10\x42\xcf\x8e\x4c\x08\x21\x1c\x08\x1c\xd5\xab\x7a\x0b\xf1\x93\
-\x4c\x75\x27\x67\xaa\x3b\xa7\x0d\x81\x13\x43\x08\xae\x17\xc5\x42\
-\x08\x1f\x01\xae\x00\x56\xec\x45\x3d\x11\x91\xe8\xdd\x9f\x80\x5f\
-\x66\x8e\x31\x16\xb8\xa2\x28\xab\x55\x7b\x55\xb0\x28\xab\xed\x81\
-\x5f\xd1\x5e\x2f\xbf\x3a\x9d\xd1\x5a\x9d\xdf\x0b\xd7\x91\xf7\x78\
-\xc9\xd9\x36\x06\x26\xf6\x72\x37\x40\x51\x56\xfb\x92\x26\x00\x7a\
-\xf2\x7e\xde\x44\x1a\xeb\x43\x35\xd6\x45\xa4\x0f\x69\x02\x44\xa4\
-\x03\xd1\xbb\xdf\x01\xe3\xe8\xfc\x87\xdd\x7d\x80\x47\x8b\xb2\xfa\
-\x41\x51\x56\x2b\x75\x9e\xac\xd9\x5a\x7d\x3e\x0c\xb8\x13\xf8\x68\
-\x87\x97\xbb\x0e\xd8\x24\x7a\xf7\xb7\xce\x93\x89\x0c\x1f\x33\xab\
-\x48\xcd\xa0\x73\xfb\x1a\x70\x5d\x08\x61\x8d\x6e\x16\x09\x21\xac\
-\x18\x42\x98\x40\x3a\xfa\x2a\xb7\x49\x66\x76\x5d\xa6\xda\xbf\xcf\
-\x54\x77\x6e\xbb\x00\xa7\x85\x10\x5e\xd3\xad\x02\x21\x84\x25\x42\
-\x08\x07\x01\x57\x02\x2b\x74\xab\x8e\x88\xc8\x02\x7c\x1f\x78\x39\
-\x73\x86\x0d\x81\x5b\x8a\xb2\xda\xa6\x9b\x45\x8a\xb2\x5a\xaa\x28\
-\xab\x23\x00\x03\x7a\xbe\x12\x7d\x2e\x33\x81\xa3\x7b\x55\xac\x75\
-\xf3\xf5\x57\xbd\xaa\xb7\x08\x9b\x00\x37\x17\x65\xf5\xee\x6e\x16\
-\x29\xca\xea\x75\x45\x59\x9d\x4a\x5a\x50\xb2\x64\x37\x6b\xf5\x09\
-\x8d\xf5\x3c\x7a\x3a\xd6\x45\xa4\x3f\x69\x02\x44\xa4\x43\xad\x66\
-\xdb\xef\x02\xae\xea\xf0\x52\xa3\x81\x6f\x02\x0f\xb7\x26\x42\xde\
-\xdc\x71\xb8\x86\x29\xca\xea\x1f\x8a\xb2\x9a\x40\x5a\x79\xfc\x99\
-\x1a\x2e\x79\x44\xf4\x6e\x5c\xf4\x6e\x5a\x0d\xd7\x12\x19\x66\x27\
-\x93\xb6\x8e\xe7\x36\x16\xb8\x23\x84\xf0\x5f\x21\x84\x5a\x57\x2e\
-\x86\x10\x96\x0a\x21\x7c\x83\xb4\xdb\xe5\x93\x75\x5e\xbb\x03\xdf\
-\xcd\x58\xfb\x36\xd2\x07\xc6\x26\xf8\x22\xf0\xdb\x10\x42\xed\x8d\
-\x33\x43\x08\xdb\x92\x76\x09\x1e\x02\x74\x6d\x92\x45\x44\x64\x41\
-\x5a\x9f\x15\x2e\xcc\x9d\x03\x78\x33\x69\x67\xc0\x84\xa2\xac\x6a\
-\xef\xc1\x54\x94\xd5\x67\x48\x8b\x9b\xf6\xa7\x19\xf7\x19\x8e\x8f\
-\xde\xf5\x7a\x47\xc6\x71\x3d\xae\xb7\x30\x6b\x03\x93\x8a\xb2\x3a\
-\xb4\x28\xab\x65\xeb\xbc\x70\x51\x56\x4b\x16\x65\xb5\x2b\xe9\xf5\
-\xde\xa5\xce\x6b\xf7\x33\x8d\xf5\x6c\x72\x8c\x75\x11\xe9\x33\x43\
-\xbb\x45\x51\xa4\x1b\x8a\xb2\xfa\x0e\x70\x78\x8d\x97\x3c\x96\xb4\
-\x9d\x73\x52\x8d\xd7\xec\xb9\xa2\xac\x76\x00\x76\x07\x3e\x5e\xd3\
-\x25\x1f\x07\x76\x6c\x1d\x43\x26\x03\x26\x84\xb0\x3c\x90\x6b\x52\
-\x6b\x15\x33\x1b\xca\xa3\xd4\x42\x08\xbb\xd1\xac\xe6\x81\x33\x80\
-\xb3\x81\x93\x80\x9b\x5a\x3b\x55\x16\x5b\xeb\xa6\xfa\xae\xad\x47\
-\x93\x26\x96\xaf\x32\xb3\x8f\xe5\x0c\x10\x42\xb8\x18\xd8\x3a\x67\
-\x86\xb9\xcc\x22\x4d\xc6\xfd\xc0\xcc\xda\x3e\x96\x2d\x84\x30\x06\
-\xd8\x91\xf4\xbe\xf3\x81\x9a\xb2\x75\xdb\x0f\xcc\x6c\xbf\x1c\x85\
-\x43\x08\x2b\x03\x53\x32\x94\xbe\xce\xcc\xc6\x65\xa8\x2b\x73\x29\
-\xca\x6a\x6f\xe0\xc7\x19\x4a\x4f\x8f\xde\x8d\xc9\x50\xb7\xe7\x5a\
-\x3d\xff\x26\xd3\x9c\x89\xd8\x97\x48\xbb\xe2\x4e\x02\x7e\x1d\xbd\
-\x6b\xab\xaf\x61\x51\x56\xab\x00\x3b\x93\xde\x63\x6b\x9f\xc4\xee\
-\xc0\x53\xc0\x9a\xd1\xbb\xa9\xbd\x2e\x5c\x94\xd5\x0d\x34\xaf\x11\
-\xf8\xa3\xc0\x09\xa4\x1b\xc5\x6d\xff\x9b\x14\x65\xb5\x1a\xe9\xfd\
-\xf5\xab\x40\x57\x77\xec\x76\x68\xdb\xe8\xdd\xc5\x39\x0a\x6b\xac\
-\xf7\x5c\xb6\xb1\x2e\x22\xfd\xa5\x29\xdf\x94\x45\x06\x42\xf4\xee\
-\x88\xa2\xac\x2e\x23\x35\xc1\x5b\xad\x86\x4b\x8e\x07\xc6\x17\x65\
-\x55\x02\xe7\x00\x67\x47\xef\x6e\xa9\xe1\xba\x5d\x57\x94\xd5\x76\
-\xc0\x67\x49\x2b\xad\x97\xaf\xf1\xd2\x57\x01\x9f\x8b\xde\x3d\x51\
-\xe3\x35\x45\x04\x4e\x05\xf6\x25\xed\x68\x6b\x82\xd1\xc0\x1e\xad\
-\xc7\xd4\x10\xc2\x35\xc0\x2d\xc0\xbd\xa4\x5d\x1c\x7f\x23\xed\x60\
-\x98\x49\x6a\x68\x3d\x1a\x78\x1d\xb0\x26\x69\xd5\xe3\x7b\x49\x7d\
-\x9a\xde\xd6\xeb\xe0\x23\x74\x50\xee\x00\xa4\x66\xe0\x4d\x9a\x00\
-\x59\x8a\x74\x53\xe5\xab\x21\x84\x1b\x49\xf9\xae\x05\xee\x30\xb3\
-\xf9\x7e\xcf\x6f\xf5\x8d\x79\x3b\xe9\x35\x1f\x4b\x3a\xf6\x63\x2c\
-\xa9\xc9\xba\x88\x48\x23\x44\xef\xee\x2c\xca\xea\x34\xd2\xc4\x6c\
-\x13\x2c\x09\x6c\xd1\x7a\x3c\x5f\x94\xd5\xcd\xc0\x24\xd2\xfb\xeb\
-\xdd\xa4\x49\xd1\xe9\xad\xc7\x12\xa4\xf7\xd7\x31\xc0\xea\xc0\x3a\
-\xc0\x3b\x81\x0f\x93\x1a\x2f\x37\x71\x51\xe5\x31\x19\x6f\x88\x9e\
-\x48\xf3\x26\x40\x56\x23\x1d\xfd\x79\x60\x51\x56\x37\x02\x97\x91\
-\x5e\xef\xdb\xa2\x77\x4f\xce\xef\x09\xad\x46\xea\x6b\x02\xef\x26\
-\xbd\xaf\x6e\x04\xbc\x9f\x66\xac\xf8\x6f\x2c\x8d\xf5\x9e\xcb\x39\
-\xd6\x45\xa4\x8f\x68\x02\x44\xa4\x66\xd1\xbb\x5b\x5b\xe7\xad\x9e\
-\x0c\x6c\x5f\xd3\x65\x3d\xf0\x2d\xe0\x5b\x45\x59\x3d\x0a\xfc\x02\
-\x98\x18\xbd\xbb\xa6\xa6\xeb\x77\xac\xd5\x68\x6f\x2b\x60\x5b\x20\
-\x00\xa3\xba\x50\xe6\x80\xe8\xdd\x11\x5d\xb8\xae\xc8\xd0\x33\xb3\
-\x97\x43\x08\xdf\x04\x2e\xcd\x9d\x65\x3e\x56\x20\x7d\x3f\xad\xeb\
-\x7b\x6a\x6e\x17\x9a\xd9\x8d\xb9\x43\x90\x26\x18\x9a\xea\x43\xcc\
-\x71\x03\x29\x84\x30\x1d\x98\x0a\x3c\x0b\x54\xa4\x66\x9b\xa3\x80\
-\x37\xa0\x73\xc7\x45\xa4\x3f\x7c\x97\x74\x04\x6c\xcf\x9a\x53\x8f\
-\xd0\x6b\x49\x8d\xb3\x37\xce\x1d\xa4\x26\x8f\x93\x7a\x31\xe4\xf2\
-\xf3\x56\xfd\x37\x66\xcc\xb0\x20\xcb\x02\x9b\xb5\x1e\x00\x14\x65\
-\xf5\x14\x69\xd7\xed\x4c\xd2\xfb\xe9\xb2\xad\x87\x7a\x66\xb5\x4f\
-\x63\xbd\x37\x72\x8f\x75\x11\xe9\x23\x9a\xbd\x17\xe9\x82\xe8\xdd\
-\xd3\xd1\xbb\x1d\x80\x2f\x50\xff\xb1\x12\xab\x01\xdf\x06\xae\x2e\
-\xca\xea\xe9\xa2\xac\xce\x2d\xca\xea\x2b\x45\x59\xbd\xb5\xe6\x3a\
-\x8b\x54\x94\xd5\xfb\x8b\xb2\xfa\x6e\x6b\xab\xf7\x53\xa4\xe3\x6a\
-\xbe\x44\xfd\x93\x1f\x37\x02\xeb\x6b\xf2\x43\xa4\xbb\xcc\xec\x37\
-\xa4\x0f\xee\xd2\x3d\xd3\x49\xbb\xfb\xb2\x33\xb3\x7b\x80\xdb\x73\
-\xe7\x18\xa1\xe5\x49\x8b\x01\xd6\x25\xad\x46\xf4\xc0\x4a\x68\xf2\
-\x43\x44\xfa\x44\xf4\x6e\x0a\x79\x7b\x3f\x0d\x8b\xbd\xa3\x77\x33\
-\x72\x15\x8f\xde\xbd\x40\x7f\x35\x64\x7e\x3d\xb0\x2a\x69\xb5\xff\
-\x5a\xc0\x5b\xd1\xe4\x47\x47\x34\xd6\x7b\x26\xeb\x58\x17\x91\xfe\
-\xa2\x1d\x20\x22\x5d\x14\xbd\x3b\xbb\x28\xab\x89\xa4\xe6\xab\x7b\
-\x77\xa1\xc4\x18\x60\x87\xd6\x83\xa2\xac\xee\x04\x7e\x0f\xdc\x05\
-\xdc\x03\xdc\x1d\xbd\xeb\xf8\xe6\x56\x51\x56\x63\x48\xc7\xe2\xac\
-\x4b\x3a\x66\xe4\xdd\xa4\x6d\xd0\x2b\x76\x7a\xed\x45\x98\x0a\x7c\
-\x33\x7a\x77\x4a\x97\xeb\x88\xc8\xab\xf6\x06\xb6\x24\xdd\x5c\x96\
-\xfa\xed\x67\x66\x8f\xe4\x0e\x31\x87\x53\x80\x1f\xe4\x0e\x21\x22\
-\x32\x0c\xa2\x77\xc7\x14\x65\xf5\x79\xd2\x91\x32\x52\xbf\xf3\xa2\
-\x77\x67\xe5\x0e\x01\xfc\x10\xf8\x67\x60\x95\xdc\x41\x24\x0f\x8d\
-\xf5\xae\x6b\xca\x58\x17\x91\x3e\xa1\x09\x10\x91\x2e\x8b\xde\x4d\
-\x07\xf6\x29\xca\xea\x24\xe0\x7f\xe9\xee\x0f\x41\xeb\xb5\x1e\xaf\
-\x28\xca\x0a\xe0\x41\xa0\x04\x9e\x21\x1d\x1f\x32\xe7\xd7\xd9\xdb\
-\x9d\x97\x9b\xe3\xb1\x6c\xeb\xeb\xf2\xc0\x3b\xc8\xb3\x85\xfb\x38\
-\xe0\xa0\x05\x9d\x4b\x2b\x22\xdd\x61\x66\x4f\x84\x10\xf6\x22\x1d\
-\xb5\x27\xf5\xba\xdc\xcc\x4e\xc8\x1d\x62\x2e\xa7\x02\x87\x01\x4b\
-\xe7\x0e\x22\x22\x32\x24\xbe\x02\xdc\x4c\x77\x8e\x8b\x1d\x66\x7f\
-\x05\xfe\x29\x77\x08\x80\xe8\xdd\xb3\x45\x59\x1d\x09\xfc\x28\x77\
-\x16\xc9\x4a\x63\xbd\x3b\x1a\x33\xd6\x45\xa4\x7f\x68\x02\x44\xa4\
-\x47\x5a\x3b\x31\x36\x2e\xca\x6a\x67\xd2\x59\x95\x6f\xe9\x61\xf9\
-\x35\x5a\x8f\x7e\x70\x13\x30\x3e\x7a\x77\x6b\xee\x20\x22\xc3\xca\
-\xcc\xce\x0a\x21\x6c\x06\x7c\x39\x77\x96\x01\x32\x83\x06\xfe\x7b\
-\xb6\x26\xbc\x26\x90\x7a\x37\x89\x88\x48\x97\x45\xef\xee\x2a\xca\
-\x6a\x6f\xe0\xa4\xdc\x59\x06\xcc\x3e\xd1\xbb\xc7\x73\x87\x98\xc3\
-\xb1\xa4\x5d\xb5\xab\x67\xce\x21\x99\x68\xac\x77\x4d\xd3\xc6\xba\
-\x88\xf4\x01\xf5\x00\x11\xe9\xb1\xe8\xdd\xe9\xd1\xbb\x95\x81\x3d\
-\x48\x47\x55\x49\x72\x11\xb0\x69\xf4\x6e\x23\x4d\x7e\x88\x34\xc2\
-\x5e\xf4\x4f\x7f\x88\xa6\xab\x80\x5d\xcd\xac\xcc\x1d\x64\x01\x0e\
-\x25\x65\x14\x11\x91\x1e\x88\xde\xfd\x14\x38\x23\x77\x8e\x01\x72\
-\x42\xf4\xae\x51\x3d\xcc\xa2\x77\xb3\x80\xfd\x72\xe7\x90\xbc\x34\
-\xd6\x6b\xd7\xb8\xb1\x2e\x22\xfd\x41\x13\x20\x22\x99\x44\xef\x7e\
-\x16\xbd\x5b\x0f\xf8\x24\x70\x5d\xee\x3c\x19\x9d\x0c\xac\x1b\xbd\
-\xfb\x44\xf4\xee\x9a\xdc\x61\x44\x24\x31\xb3\xe7\x48\xfd\x85\xfe\
-\x96\x3b\xcb\x00\x38\xc8\xcc\xce\xcd\x1d\x62\x41\xcc\x6c\x32\x70\
-\x5e\xee\x1c\x22\x22\x43\x66\x4f\x40\x8b\x7e\x3a\x77\x05\x30\x3e\
-\x77\x88\xf9\x89\xde\x19\x60\xb9\x73\x48\x76\x1a\xeb\xf5\x68\xec\
-\x58\x17\x91\xe6\xd3\x04\x88\x48\x66\xd1\xbb\x0b\xa3\x77\xe3\x80\
-\xb1\xc0\x05\xb9\xf3\xf4\xc8\x93\xc0\x51\xc0\x2a\xd1\xbb\xdd\xa3\
-\x77\xf7\xe4\x0e\x24\x22\xf3\x32\xb3\xfb\x80\x4f\x03\xcf\xe5\xce\
-\xd2\xc7\xce\x34\xb3\xc3\x72\x87\x18\x81\x7f\x03\x5e\xce\x1d\x42\
-\x44\x64\x58\x44\xef\x9e\x01\x3e\x41\xea\xd3\x27\xed\xb9\x07\x08\
-\xd1\xbb\x97\x72\x07\x59\x88\xf1\xa4\x9e\x05\xc3\xe8\x21\x60\x4a\
-\xee\x10\xb9\x69\xac\xd7\xa2\x1f\xc6\xba\x88\x34\x98\x26\x40\x44\
-\x1a\x22\x7a\xf7\xbb\xe8\xdd\x76\xc0\x8a\xc0\xbf\x90\x7a\x61\x0c\
-\x92\xe7\x80\x73\x80\x4f\x47\xef\x56\x88\xde\x7d\x2b\x7a\xf7\x58\
-\xee\x50\x22\xb2\x70\x66\x76\x03\xf0\x25\x40\x1f\x38\x16\xdf\x6f\
-\x81\xdd\x73\x87\x18\x09\x33\xbb\x03\x38\x26\x77\x8e\x86\xb8\x18\
-\x58\x0a\xd8\x2c\x77\x10\x11\x19\x6c\xd1\xbb\x3f\x93\x76\x83\x4f\
-\xcd\x9d\xa5\x0f\x4d\x05\x3e\x15\xbd\x7b\x2a\x77\x90\x85\x69\xf5\
-\x2a\xd8\x37\x77\x8e\x0c\xfe\x00\xac\x03\x6c\x85\x8e\xd9\xd4\x58\
-\xef\x4c\x5f\x8c\x75\x11\x69\x36\x4d\x80\x88\x34\x4c\xf4\x6e\x6a\
-\xf4\xee\xd8\xe8\xdd\x46\xc0\xda\xc0\x21\xa4\xd5\x33\xfd\xea\x5a\
-\xe0\x2b\xc0\x9b\xa2\x77\x9f\x8b\xde\x4d\xc8\x1d\x48\x44\x16\x8f\
-\x99\xfd\x12\xd8\x0d\x4d\x82\x2c\x8e\x49\xc0\xb6\x66\xf6\x42\xee\
-\x20\x8b\xe1\x00\xe0\xfe\xdc\x21\x32\x9b\x02\xec\x62\x66\x2f\x02\
-\xd7\x00\x4f\x67\xce\x23\x22\x03\x2e\x7a\xf7\x47\xd2\x4d\x62\xdd\
-\x18\x1d\xb9\xbf\x02\x5b\x45\xef\xee\xcd\x1d\x64\x24\xa2\x77\x67\
-\x90\x8e\xfd\x1d\x16\x33\x81\x9d\xa2\x77\xb3\xa2\x77\xb7\x03\x37\
-\xe6\x0e\xd4\x04\x1a\xeb\x6d\xe9\xab\xb1\x2e\x22\xcd\xa5\x09\x10\
-\x91\x06\x8b\xde\xdd\x1f\xbd\xfb\x5e\xf4\x6e\x0d\xe0\x23\xc0\x61\
-\x40\xcc\x1c\x6b\x51\x9e\x01\x26\x02\xfb\x00\x3e\x7a\xb7\x49\xf4\
-\xee\xa4\xe8\xdd\xf4\xcc\xb9\x44\xa4\x03\x66\x76\x3a\xb0\x2b\x9a\
-\x04\x19\x89\xab\x80\x2d\xcc\xac\xaf\x56\xaa\x99\xd9\xb3\xc0\x1e\
-\x0c\xef\x51\x58\x2f\x01\x5f\x34\xb3\x27\x00\xcc\xec\x25\xd2\x79\
-\xd3\x22\x22\x5d\x15\xbd\xbb\x05\xd8\x12\xf5\xdd\x1a\x89\x29\xc0\
-\xc7\x5a\xff\x66\xfd\x64\x4f\xe0\x86\xdc\x21\x7a\x64\xbf\xe8\xdd\
-\x9d\x73\xfc\xfa\xc4\x6c\x49\x1a\x46\x63\x7d\xb1\xf4\xeb\x58\x17\
-\x91\x06\xd2\x04\x88\x48\x9f\x88\xde\x5d\x1f\xbd\x3b\x30\x7a\xf7\
-\x3e\xd2\x31\x59\x5f\x04\x4e\x07\xfe\x92\x37\x19\x00\xb7\x01\x47\
-\x02\x9b\x45\xef\x46\x45\xef\x3e\x1e\xbd\x3b\x3a\x7a\xf7\x48\xee\
-\x60\x22\x52\x1f\x33\x3b\x03\xf8\x0c\x69\x65\x9f\xcc\xdf\x25\xa4\
-\x9d\x1f\x33\x72\x07\x69\x87\x99\x5d\x0b\x1c\x94\x3b\x47\x26\x07\
-\x9b\xd9\x55\x73\xfd\xde\xc4\x2c\x49\x44\x64\xe8\x44\xef\x6e\x05\
-\x36\xa5\xbf\x77\x7e\x77\x5b\x09\x6c\xda\xda\x55\xd0\x57\xa2\x77\
-\xb3\x80\x1d\x80\x41\xff\x7c\x74\x6e\xf4\xee\xf8\xb9\x7e\xef\x17\
-\x0c\x6f\x1f\x94\x79\x68\xac\x8f\x48\xdf\x8e\x75\x11\x69\x26\x4d\
-\x80\x88\xf4\xa1\xd6\x31\x59\x67\x46\xef\x76\x89\xde\xbd\x05\x78\
-\x1f\xb0\x33\xa9\x89\xed\x69\xc0\xf5\x40\x37\xfa\x6b\xdc\x4b\xba\
-\xb9\x77\x2c\xf0\x2d\x52\x73\xe4\x37\x47\xef\xde\x13\xbd\xfb\x76\
-\xf4\xee\xca\x2e\xd4\x14\x91\x06\x31\xb3\x0b\x80\x71\xc0\xff\xe5\
-\xce\xd2\x40\xa7\x01\x9f\x32\xb3\xbe\x6e\x1a\x6f\x66\x87\x93\xfe\
-\x2e\xc3\xe4\xfb\x66\x76\xe8\x7c\x7e\x7f\x22\x3a\xbb\x5c\x44\x7a\
-\xa4\x75\xb3\x6f\x23\x06\xaf\x17\x60\x1d\x26\x03\xe3\xa2\x77\xf7\
-\xe5\x0e\xd2\xae\x56\x3f\x90\xed\x81\x27\x73\x67\xe9\x92\x6b\x48\
-\x8b\xf4\xfe\x4e\xf4\xee\x05\xe0\xcc\xde\xc7\x69\x2e\x8d\xf5\x85\
-\xea\xfb\xb1\x2e\x22\xcd\xf3\x9a\xdc\x01\x44\xa4\x73\xd1\xbb\xc8\
-\x7c\x8e\xc6\x2a\xca\x6a\x69\x60\x65\xe0\x8d\xc0\xf2\xc0\xe8\xd6\
-\xd7\x51\xc0\x98\xd6\xaf\x47\x93\x8e\x3b\x99\x0e\xcc\x00\xa6\xb5\
-\xbe\xce\xfe\xf5\xd3\xc0\x9f\x5b\x3f\xb0\x8b\x88\x60\x66\x31\x84\
-\xb0\x21\x69\x45\xdf\xb8\xdc\x79\x1a\xe0\x59\x60\x1f\x33\xfb\x49\
-\xee\x20\x35\xfa\x32\xb0\x1a\xf0\xd1\xdc\x41\x7a\xe0\x48\x33\xdb\
-\x7f\x7e\xff\xc3\xcc\x1e\x0b\x21\x4c\x06\xde\xdb\xe3\x4c\x22\x32\
-\xa4\xa2\x77\x8f\x17\x65\xb5\x29\x69\xc1\xd1\xee\x99\xe3\x34\xc5\
-\xcf\x80\xf1\xd1\xbb\xbe\x5e\x60\x00\xe9\x73\x5b\x51\x56\x5b\x02\
-\x17\x03\x2b\xe5\xce\x53\xa3\x5b\x49\x8d\xaa\x17\xf4\x1a\x1d\x07\
-\x7c\x1d\x2d\xc2\x7d\x85\xc6\xfa\x7c\x0d\xcc\x58\x17\x91\x66\xd1\
-\x04\x88\xc8\x00\x6b\xad\xb6\x29\x5b\x0f\x11\x91\xda\x98\xd9\x94\
-\x10\xc2\x47\x81\xef\x91\x8e\x4c\x5a\x32\x73\xa4\x5c\xee\x03\x3e\
-\x6b\x66\x93\x73\x07\xa9\x93\x99\xcd\x0a\x21\x6c\x0b\x9c\x07\x6c\
-\x93\x3b\x4f\x17\x7d\x7f\x41\x93\x1f\x73\xb8\x04\x4d\x80\x88\x48\
-\x0f\xb5\x6e\xfe\xed\x51\x94\xd5\x65\xc0\xf1\xc0\xeb\x33\x47\xca\
-\x65\x06\xe9\x66\xe8\x40\xed\x4a\x8c\xde\xdd\x52\x94\xd5\x66\xc0\
-\xa5\xc0\x5b\x72\xe7\xa9\xc1\xdd\xc0\x36\xd1\xbb\x69\x0b\xfa\x03\
-\xd1\xbb\xfb\x8a\xb2\xba\x1a\xf8\x58\xcf\x52\xf5\x01\x8d\xf5\x57\
-\x0c\xe4\x58\x17\x91\xe6\xd0\xec\xbb\x88\x88\x88\xb4\xc5\xcc\x5e\
-\x36\xb3\x83\x49\xbb\x40\xee\x5c\xc4\x1f\x1f\x34\x15\x70\x0a\xf0\
-\xbe\x41\x9b\xfc\x98\xad\x75\x94\xd7\xa7\x80\xb3\x73\x67\xe9\x82\
-\x19\xa4\x86\xe7\x8b\x9a\xfc\x00\xb8\xa8\xdb\x61\x44\x44\xe6\x27\
-\x7a\x77\x16\x50\x90\x6e\x94\x0f\x9b\xdf\x01\x1b\x0d\xea\x0d\xd1\
-\xe8\xdd\x6d\xc0\x66\xc0\x03\xb9\xb3\x74\xe8\x6a\xe0\x23\xd1\xbb\
-\x91\xf4\xf8\x18\xa4\x9d\xb2\xb5\xd2\x58\x1f\xdc\xb1\x2e\x22\xcd\
-\xa0\x09\x10\x11\x11\x11\xe9\x88\x99\xdd\x48\x5a\x21\x7f\x10\xe9\
-\x38\xa8\x41\x77\x2b\xf0\x21\x33\xdb\xcd\xcc\xa6\xe7\x0e\xd3\x4d\
-\x66\xf6\x22\xf0\x8f\xc0\x81\xc0\xac\xcc\x71\xea\x32\x99\x34\x71\
-\x35\xd2\xf3\xc8\x7f\xcb\xe0\x9e\xd7\x2e\x22\x0d\x17\xbd\x7b\x28\
-\x7a\xb7\x35\xb0\x13\xdd\xe9\xf1\xd7\x34\x7f\x01\xf6\x8c\xde\x8d\
-\x8d\xde\xdd\x91\x3b\x4c\x37\x45\xef\xee\x24\xf5\x72\xbc\x20\x77\
-\x96\x36\x9d\x00\x6c\x11\xbd\x7b\x62\x84\x7f\xde\x80\x29\x5d\xcc\
-\xd3\xd7\x34\xd6\x45\x44\xba\x47\x13\x20\x22\x22\x22\xd2\x31\x33\
-\x9b\x65\x66\xff\x09\xac\x4b\x6a\xa0\xfd\x52\xe6\x48\xdd\xf0\x04\
-\xb0\x27\xf0\x01\x33\x9b\x94\x3b\x4c\xaf\x98\x59\x65\x66\x87\x01\
-\x1f\x01\x1e\xcc\x9d\xa7\x03\x2f\x00\x3f\x06\xc6\x9a\xd9\xbd\x23\
-\x7d\x92\x99\xbd\x04\x5c\xde\xb5\x54\x22\x22\x23\x10\xbd\xfb\x39\
-\xe9\x3d\xf6\x08\x52\xaf\xbe\x41\x33\x0b\xf8\x1f\x60\x9d\xe8\xdd\
-\xd0\xec\x14\x88\xde\x3d\x1d\xbd\xdb\x0e\xf8\x36\xe9\x7d\xaa\x1f\
-\xcc\x24\x1d\x57\xf4\xb5\xe8\xdd\x8b\x23\x7d\x52\xf4\xee\x25\xd2\
-\xcf\x88\xb2\x10\x1a\xeb\x22\x22\xf5\xd3\x04\x88\x88\x88\x88\xd4\
-\xc6\xcc\x1e\x31\xb3\x2f\x01\x1b\x00\xe7\x32\x18\x13\x21\x8f\x02\
-\xfb\x03\x6b\x99\xd9\x4f\xcc\xac\xca\x1d\x28\x07\x33\xbb\x89\xb4\
-\xd3\xe7\xfb\x40\xbf\x35\xa7\x3c\x1f\x78\x97\x99\x7d\xc3\xcc\x9e\
-\x6f\xe3\xf9\x17\xd7\x1d\x48\x44\x64\x71\x45\xef\xa6\x45\xef\x0e\
-\x00\xd6\x22\xdd\x40\x9c\x99\x39\x52\x1d\x66\x02\x27\x02\xef\x8a\
-\xde\xed\x15\xbd\x7b\x3a\x77\xa0\x1c\xa2\x77\x47\x02\x1f\x04\xae\
-\xcd\x9d\x65\x11\x2e\x02\xde\x1d\xbd\x3b\xae\xcd\xe7\x1f\xcf\x60\
-\xfc\x6c\xd8\x55\x1a\xeb\x22\x22\xf5\x52\x13\x74\x11\x11\x11\xa9\
-\x9d\x99\xdd\x09\x84\x10\xc2\x1a\xc0\xd7\x81\xdd\x80\x31\x79\x53\
-\x2d\xb6\x5b\x81\x1f\x01\x67\xb7\x8e\x82\x1a\x7a\xad\x23\xbf\xf6\
-\x0f\x21\x1c\x4b\x5a\x99\xf8\x79\x9a\xbd\xa0\xe6\x06\xe0\xdb\xad\
-\x63\xda\x3a\x71\x11\xa9\xef\x8b\xeb\x3c\x92\x88\x48\x67\xa2\x77\
-\x8f\x03\x7b\x15\x65\xf5\x3d\x60\x3c\xf0\x55\x60\xb5\xbc\xa9\x16\
-\xdb\x14\xd2\xcd\xd0\xff\x8e\xde\x4d\xcd\x1d\xa6\x09\xa2\x77\x11\
-\xd8\xa4\x28\xab\xcf\x03\x87\x03\x6f\xcf\x1c\x69\x4e\x25\xb0\x6f\
-\xf4\xee\xbc\x4e\x2e\x12\xbd\x7b\xa4\x28\xab\x4b\x81\x6d\xeb\x89\
-\x35\xd8\x34\xd6\x45\x44\xea\xd1\xe4\x0f\xac\x22\x22\x22\xd2\xe7\
-\xcc\xec\x41\x33\xdb\x07\x58\x15\xd8\x1d\xb8\x82\x66\xaf\xfc\x2b\
-\x81\xa3\x49\x3d\x3e\xde\x6f\x66\x67\x6a\xf2\x63\x5e\xad\x9d\x3e\
-\x3b\x02\xeb\x90\x26\x89\x9a\xf4\x81\xf6\x79\xe0\x97\xc0\x07\xcd\
-\x6c\xe3\x1a\x26\x3f\x30\xb3\xc7\x81\xdf\x77\x9c\x4c\x44\xa4\x46\
-\xd1\xbb\x27\xa3\x77\x87\x92\x6e\x94\xef\x40\xda\x79\xd9\xe4\x95\
-\xe2\xd3\x80\x73\x48\xbd\xa5\x56\x8f\xde\x1d\xac\x1b\xa2\xf3\x8a\
-\xde\x9d\x0d\xac\x47\x5a\x40\x72\x7b\xee\x38\xa4\x9f\xdf\xd6\xee\
-\x74\xf2\x63\x0e\x3a\xf6\x68\x31\x69\xac\x8b\x88\x74\x46\x3b\x40\
-\x44\x44\x44\xa4\xeb\x5a\x3b\x07\x4e\x06\x4e\x0e\x21\xac\x4c\xfa\
-\xf0\xb6\x35\xf0\x51\x60\x54\xc6\x68\x15\x70\x0f\x30\x01\x30\x33\
-\xbb\x39\x63\x96\xbe\x63\x66\xf7\x03\xfb\x86\x10\xfe\x15\xf8\x1c\
-\xb0\x3d\xb0\x39\x30\xba\xc7\x51\x66\x01\xd7\x93\x3e\x6c\x9f\x65\
-\x66\xdd\x68\x5a\x7e\x31\x50\x74\xe1\xba\x22\x22\x1d\x69\xf5\x56\
-\x38\x1f\x38\xbf\x28\xab\xd1\xc0\x67\x48\xef\xb1\x1f\x03\xde\x94\
-\x33\x1b\xa9\xd1\xf1\xe5\xc0\x79\xc0\x85\xd1\xbb\x7e\xe9\x73\x91\
-\x55\xf4\xee\x39\xe0\x18\xe0\x98\xa2\xac\x36\x23\xad\xfe\xdf\x06\
-\x58\xa6\x07\xe5\xa7\x01\xbf\x01\x8e\x89\xde\x75\xe3\x48\xae\x09\
-\xc0\x43\x34\x6b\x87\x4b\x5f\xd0\x58\x17\x11\x69\x8f\xb6\xf1\x8b\
-\x88\x88\x48\x36\x21\x84\xa5\x80\x8d\x49\xe7\x5e\x6f\x08\x7c\x00\
-\x58\xa5\x8b\x25\xa7\x02\xb7\x00\x37\x01\x93\x80\x49\x66\xa6\x15\
-\x69\x35\x0a\x21\x2c\x4d\xfa\x20\xbe\x25\xf0\x3e\x52\xdf\x90\xba\
-\x8f\x3f\x7b\x11\xb8\x83\x74\xc4\xd5\x35\xc0\xa5\x66\xa6\xb3\xa4\
-\x45\x44\xe6\x52\x94\xd5\x86\xc0\x38\xd2\xfb\x6b\x01\xac\x49\xf7\
-\xee\x03\x3c\x07\xfc\x91\x74\x84\xe4\x24\xe0\x86\xe8\xdd\xfd\x5d\
-\xaa\x35\x74\x8a\xb2\x5a\x8e\xf4\xde\x3a\xfb\x86\xf7\xda\x35\x5d\
-\xba\x02\xee\x22\xdd\xbc\xbe\x08\xb8\x72\x71\x9a\x9b\x4b\x33\x68\
-\xac\x8b\x88\x2c\x98\x26\x40\x44\x44\x44\xa4\x51\x42\x08\x2b\x90\
-\x8e\x56\x5a\x87\xd4\xfc\x71\x15\xd2\xaa\xb6\x37\x02\x6f\x20\xad\
-\x7e\x7c\x6d\xeb\xb1\x04\xf0\x2c\xf0\x4c\xeb\xeb\xec\xff\x9e\x06\
-\x3c\x42\x3a\xd2\xea\xe1\xd6\xe3\x21\x33\xfb\x4b\xef\xfe\x26\x02\
-\x10\x42\x70\xa4\x9b\x34\x1b\x00\x9e\x74\x1c\xda\xaa\xc0\x5b\x49\
-\x13\x23\xcb\xb4\x1e\xcb\x02\x4b\x93\x26\x37\x5e\x20\xbd\x8e\x4f\
-\x02\x7f\x03\x1e\x23\xbd\x86\x0f\x92\x3e\x70\xdf\xde\x66\x33\x73\
-\x11\x91\xa1\x56\x94\xd5\x28\x60\x7d\x60\x5d\xe0\x1d\xa4\xef\xc5\
-\x2b\x91\xde\x63\x57\xe0\xd5\xef\xc5\x4b\x93\x4e\x8c\x78\x81\x74\
-\xb3\x73\xce\xf7\xd8\x99\xa4\xef\xcb\xb3\xdf\x67\x1f\x02\x1e\x00\
-\x1e\xd6\x8d\xf3\xde\x29\xca\xea\x4d\xa4\xf7\xd6\xf5\x79\xf5\x67\
-\xa6\xd7\x93\x76\x61\x8e\x26\xed\xb0\x5d\x8a\xf4\x9a\xcd\x20\xbd\
-\x6e\x33\x49\xef\xab\xf7\x01\x77\x93\x8e\xd8\xba\x2d\x7a\x37\xa3\
-\xd7\xf9\xa5\xbb\x34\xd6\x45\x44\x5e\xa5\x09\x10\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x11\x19\x38\x9a\x00\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x91\x81\xa3\x09\x10\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x11\x19\x38\x9a\x00\x11\x11\x11\x11\x11\x11\
-\x11\x11\x11\x11\x11\x91\x81\xf3\xff\x00\x00\x00\xff\xff\xed\xd9\
-\x81\x0c\x00\x00\x00\xc0\x20\x7f\xeb\x7b\x7c\xa5\x91\x00\x01\x00\
-\x00\x00\x00\x00\x76\x04\x08\x00\x00\x00\x00\x00\xb0\x23\x40\x00\
-\x00\x00\x00\x00\x80\x1d\x01\x02\x00\x00\x00\x00\x00\xec\x08\x10\
-\x00\x00\x00\x00\x00\x60\x47\x80\x00\x00\x00\x00\x00\x00\x3b\x02\
-\x04\x00\x00\x00\x00\x00\xd8\x11\x20\x00\x00\x00\x00\x00\xc0\x8e\
-\x00\x01\x00\x00\x00\x00\x00\x76\x04\x08\x00\x00\x00\x00\x00\xb0\
-\x23\x40\x00\x00\x00\x00\x00\x80\x1d\x01\x02\x00\x00\x00\x00\x00\
-\xec\x08\x10\x00\x00\x00\x00\x00\x60\x47\x80\x00\x00\x00\x00\x00\
-\x00\x3b\x02\x04\x00\x00\x00\x00\x00\xd8\x11\x20\x00\x00\x00\x00\
-\x00\xc0\x8e\x00\x01\x00\x00\x00\x00\x00\x76\x04\x08\x00\x00\x00\
-\x00\x00\xb0\x23\x40\x00\x00\x00\x00\x00\x80\x1d\x01\x02\x00\x00\
-\x00\x00\x00\xec\x08\x10\x00\x00\x00\x00\x00\x60\x47\x80\x00\x00\
-\x00\x00\x00\x00\x3b\x02\x04\x00\x00\x00\x00\x00\xd8\x11\x20\x00\
-\x00\x00\x00\x00\xc0\x8e\x00\x01\x00\x00\x00\x00\x00\x76\x04\x08\
-\x00\x00\x00\x00\x00\xb0\x23\x40\x00\x00\x00\x00\x00\x80\x1d\x01\
-\x02\x00\x00\x00\x00\x00\xec\x08\x10\x00\x00\x00\x00\x00\x60\x47\
-\x80\x00\x00\x00\x00\x00\x00\x3b\x02\x04\x00\x00\x00\x00\x00\xd8\
-\x11\x20\x00\x00\x00\x00\x00\xc0\x8e\x00\x01\x00\x00\x00\x00\x00\
-\x76\x04\x08\x00\x00\x00\x00\x00\xb0\x23\x40\x00\x00\x00\x00\x00\
-\x80\x1d\x01\x02\x00\x00\x00\x00\x00\xec\x08\x10\x00\x00\x00\x00\
-\x00\x60\x47\x80\x00\x00\x00\x00\x00\x00\x3b\x02\x04\x00\x00\x00\
-\x00\x00\xd8\x11\x20\x00\x00\x00\x00\x00\xc0\x8e\x00\x01\x00\x00\
-\x00\x00\x00\x76\x04\x08\x00\x00\x00\x00\x00\xb0\x13\x44\x5b\x2d\
-\xfd\x20\x73\x8c\x9c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x3c\x2a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x77\xb8\x1d\x55\xb9\xc7\xf1\xef\x49\x07\
-\x12\x42\x97\x1a\x08\x20\x48\x11\xe9\x4d\xc4\x86\xe5\xda\x41\x40\
-\xec\xa2\xc0\xb5\xeb\xb5\x77\xd1\xeb\x55\x51\x2c\x28\x8a\xa0\xe8\
-\xf5\xda\x41\x45\xa5\x88\x14\x01\xa5\x4a\x47\xa4\x4a\x00\xe9\x21\
-\xb4\x84\x24\xa4\xdf\x3f\xd6\x89\x04\x72\xce\xc9\xec\xbd\xd7\xcc\
-\x3b\x33\xfb\xfb\x79\x9e\xdf\x93\x00\x9a\xac\x79\xcf\x9a\xd9\x6b\
-\xcf\xac\x59\x0b\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x6a\x89\x81\xe8\x06\x48\xaa\xad\x01\x60\x0d\x60\xf5\xc1\
-\x2c\xfd\xfd\xaa\x83\x19\x3d\x98\x55\x07\xff\xf7\x2b\x01\x13\x06\
-\x7f\x3f\x19\x18\x35\xf8\xfb\xb9\xc0\x63\xcb\xfc\xb9\xb3\x80\x05\
-\xc0\xc3\x83\xff\x6d\xee\x32\xbf\x7f\x08\x78\x70\xf0\xd7\x87\x80\
-\x79\xf9\x0f\x4b\x12\x38\x00\x90\xfa\xd1\x64\x60\x43\x60\x23\x60\
-\x83\x65\x7e\xbf\x3e\xb0\x36\xe9\x83\x7e\x0d\x60\xb5\xa8\x06\x2e\
-\x63\x36\x69\x20\x70\x37\x70\x1f\x70\x0f\x70\xef\xe0\xef\xef\x04\
-\x6e\x05\xa6\x0d\xfe\xef\x24\x75\xc0\x01\x80\xd4\x3e\xa3\x81\x4d\
-\x80\x2d\x80\xad\x06\x7f\xdd\x94\xf4\x61\x3f\x05\x98\x18\xd6\xb2\
-\xf2\x4c\x27\x0d\x04\xa6\xf1\xf8\xa0\x60\xe9\xef\xef\x04\x16\xc5\
-\x35\x4d\xaa\x27\x07\x00\x52\x73\xad\x04\x3c\x1d\x78\xda\x60\xb6\
-\x00\xb6\x04\x9e\x0a\x8c\x0f\x6c\x57\xdd\xcc\x07\x6e\x07\x6e\x00\
-\xae\x1e\xcc\x55\xa4\x01\xc2\xe2\xc0\x76\x49\xa1\x1c\x00\x48\xcd\
-\x30\x09\x78\x06\xb0\x13\xb0\x35\xb0\x0d\xb0\x0b\x30\x2e\xb2\x51\
-\x0d\x37\x1f\xf8\x27\x70\xf9\x32\xb9\x0a\x78\x34\xb2\x51\x52\x55\
-\x1c\x00\x48\xf5\x33\x01\xd8\x15\xd8\x0d\xd8\x71\x30\x9b\xf3\xf8\
-\xa4\x3a\x95\x67\x31\x70\x0b\x70\x05\x70\x21\xf0\x57\xe0\x1a\x7c\
-\x84\xa0\x16\x72\x00\x20\xc5\x9b\x08\xec\x0e\xec\x05\x3c\x73\xf0\
-\xd7\x09\x23\xfe\x3f\x54\xa5\x47\x49\x8f\x0d\xce\x07\xce\x02\x2e\
-\x20\xbd\xb1\x20\x35\x9a\x03\x00\xa9\x7a\xeb\x90\x3e\xe4\xf7\x06\
-\x9e\x45\xba\xb5\x3f\x3a\xb4\x45\xea\xc4\x7c\xe0\x32\xd2\x80\xe0\
-\x7c\xd2\x80\xe0\xc1\xd0\x16\x49\x5d\x70\x00\x20\x95\x6f\x34\xb0\
-\x3d\xb0\x0f\xf0\x72\x60\x0f\xbc\x9d\xdf\x36\xd7\x01\x27\x03\xa7\
-\x90\x1e\x1d\x38\xb9\x50\xb5\xe7\x00\x40\x2a\xc7\x3a\xc0\xb3\x49\
-\x1f\xf8\x2f\x23\x2d\xa0\xa3\xfe\x30\x03\x38\x87\x34\x18\x38\x99\
-\xb4\x8e\x81\x54\x3b\x0e\x00\xa4\x3c\x06\x80\x9d\x81\xfd\x80\xff\
-\x00\xb6\xc3\xf3\x4b\xb0\x10\xb8\x08\x38\x0d\xf8\x23\x69\x2e\x81\
-\x54\x0b\x5e\xa0\xa4\xee\x0d\x90\x66\xea\xef\x3f\x98\x8d\x63\x9b\
-\xa3\x06\xb8\x13\xf8\x2d\xf0\x4b\xe0\x62\x60\x49\x6c\x73\xd4\xcf\
-\x1c\x00\x48\x9d\x19\x05\xec\x40\xba\xb5\xff\x06\x60\xb3\xd8\xe6\
-\xa8\xc1\xee\x00\x4e\x02\x4e\x24\x4d\x26\x94\x2a\xe5\x00\x40\x2a\
-\x66\x17\xe0\x8d\xa4\x5b\xfc\x1b\x04\xb7\x45\xed\x73\x23\xe9\xae\
-\xc0\x2f\x49\x2b\x16\x4a\xa5\x73\x00\x20\x0d\x6f\x3d\xd2\xb7\xfc\
-\xb7\x90\x56\xdf\x93\xaa\x70\x35\x8f\x0f\x06\x6e\x8b\x6d\x8a\x24\
-\xf5\x8f\xf1\xa4\xdb\xfb\x27\x90\xde\xf7\x5e\x62\x4c\x60\x2e\x03\
-\x0e\xc3\x85\xa1\x54\x02\xef\x00\x48\xc9\xae\xa4\x6f\xfa\x07\xe1\
-\x2b\x7b\xaa\x9f\xfb\x80\xff\x05\xbe\x4f\x5a\xaa\x58\x92\xd4\x83\
-\xf1\xc0\x01\xa4\x95\xdc\xa2\xbf\xe9\x19\x53\x24\x8b\x81\x33\x49\
-\xfd\xd6\x8d\xa0\xd4\x13\xef\x00\xa8\x1f\xad\x4f\xba\xad\xfa\x4e\
-\x60\xed\xe0\xb6\x48\xdd\xf2\xae\x80\x24\x15\x30\x00\x3c\x9f\xf4\
-\xda\xd5\x42\xe2\xbf\xc9\x19\x93\x2b\x8b\x48\x8b\x0c\x3d\x0f\x49\
-\xd2\xbf\x4d\x00\xde\x4e\x5a\xab\x3d\xfa\x42\x6d\x4c\xd9\xb9\x8c\
-\x34\x8f\x65\x0c\x92\xd4\xa7\x26\x01\xef\x03\xee\x22\xfe\xa2\x6c\
-\x4c\xd5\xb9\x15\xf8\x28\x30\x19\x69\x18\xce\x01\x50\xdb\xac\x0d\
-\xbc\x0b\x78\x2f\xce\xe6\x97\x66\x92\xe6\x09\x1c\x01\xdc\x1d\xdb\
-\x14\x49\x2a\xc7\x54\xe0\xbb\xc0\x5c\xe2\xbf\x7d\x19\x53\xb7\xcc\
-\x05\xbe\x07\x3c\x15\x49\x6a\x89\xad\x80\x9f\x02\x0b\x88\xbf\xc8\
-\x1a\x53\xf7\x2c\x24\xdd\x11\x98\x8a\x24\x35\xd4\x14\xe0\x58\xfc\
-\xe0\x37\xa6\x9b\xcc\x27\x9d\x3f\xee\x6b\x21\xa9\x31\xd6\x06\xbe\
-\x8c\xb7\xfa\x8d\xc9\x91\x79\xa4\x81\xc0\xba\xa8\xef\x38\x09\x50\
-\x4d\xb1\x06\x69\x62\xdf\x07\x48\x33\xfc\x25\xe5\x33\x1b\x38\x9a\
-\x34\xb8\x7e\x38\xb8\x2d\xaa\x88\x03\x00\xd5\xdd\x44\xe0\xbf\x80\
-\x0f\xe2\x2b\x4d\x52\xd9\x1e\x02\xbe\x0a\x7c\x8b\x34\x28\x90\xa4\
-\xca\x8d\x02\xde\x0a\xdc\x43\xfc\x6d\x52\x63\xfa\x2d\xf7\x00\x07\
-\x93\xce\x43\xb5\x94\x77\x00\x54\x47\xbb\x01\xdf\x04\x76\x8f\x6e\
-\x88\xd4\xe7\xae\x20\x2d\xa8\x75\x7e\x74\x43\x94\x9f\xa3\x3b\xd5\
-\xc9\x86\xc0\xff\x01\x17\xe1\x87\xbf\x54\x07\x3b\x02\x7f\x01\x4e\
-\x20\xbd\x79\xa3\x16\x19\x1d\xdd\x00\x09\x58\x19\xf8\x24\xf0\x4b\
-\x60\x27\xbc\x33\x25\xd5\xc9\x00\xb0\x0d\xf0\x9f\xa4\x2d\x88\x2f\
-\x26\xad\x27\xa0\x86\xf3\x42\xab\x48\x03\xc0\x1b\x48\x33\x8f\xd7\
-\x0f\x6e\x8b\xa4\x62\x6e\x01\x3e\x04\xfc\x2e\xba\x21\xea\x8d\x03\
-\x00\x45\xd9\x9c\xb4\x34\xe9\xf3\xa3\x1b\x22\xa9\x2b\x67\x92\xe6\
-\x07\x5c\x1f\xdd\x10\x75\xc7\x47\x00\xaa\xda\x58\xe0\x3d\xc0\x89\
-\xc0\x96\xc1\x6d\x91\xd4\xbd\xcd\x80\xc3\x80\x55\x80\xbf\x02\x8b\
-\x62\x9b\xa3\x4e\x79\x07\x40\x55\xda\x93\xb4\xea\xd8\xb6\xd1\x0d\
-\x91\x94\xd5\xb5\xc0\xdb\x80\xbf\x45\x37\x44\xc5\xf9\x16\x80\xaa\
-\x30\x19\x38\x8a\x34\x9b\xd8\x0f\x7f\xa9\x7d\xb6\x25\xbd\xbd\x73\
-\x2c\x69\xf1\x2e\x35\x80\x77\x00\x54\xb6\xfd\x48\x4b\x8c\xae\x17\
-\xdd\x10\x49\x95\xb8\x05\x38\x14\x38\x27\xba\x21\x1a\x99\x77\x00\
-\x54\x96\xc9\xa4\x6f\x03\xbf\xc1\x0f\x7f\xa9\x9f\x6c\x06\x9c\x4d\
-\x5a\xd3\x63\x8d\xe0\xb6\x68\x04\xde\x01\x50\x19\x5e\x00\xfc\x90\
-\xb4\xb0\x8f\xa4\xfe\x75\x17\xf0\x4e\xe0\x0f\xd1\x0d\xd1\xf2\xbc\
-\x03\xa0\x9c\x56\x22\xbd\xd3\x7f\x3a\x7e\xf8\x4b\x82\x0d\x80\xdf\
-\x93\xee\x06\x38\x37\xa0\x66\xbc\x03\xa0\x5c\x76\x25\x9d\xe4\xbe\
-\xda\x27\x69\x28\xb7\x02\xaf\x27\x4d\x16\x54\x0d\xb8\x0e\x80\x7a\
-\x35\x06\xf8\x30\xf0\x53\x60\x9d\xe0\xb6\x48\xaa\xaf\xd5\x81\x37\
-\x93\x3e\x77\xfe\x42\xda\x75\x50\x81\xbc\x03\xa0\x5e\x4c\x21\xad\
-\xdf\xbf\x47\x74\x43\x24\x35\xca\x9f\x81\x37\x91\xe6\x08\x28\x88\
-\x73\x00\xd4\xad\x57\x02\x57\xe1\x87\xbf\xa4\xce\x3d\x8f\x74\xfd\
-\x78\x45\x74\x43\xfa\x99\x77\x00\xd4\xa9\x71\xc0\x57\x49\xcb\xf9\
-\xda\x7f\x04\xb0\x00\x78\x74\x99\x7f\x9e\x0f\xcc\x1e\xfc\xfd\x00\
-\xb0\xda\x32\xff\x6d\x0c\x30\xa9\xa2\x76\xa9\xfe\x96\x00\xc7\x90\
-\x36\x17\x9a\x1b\xdc\x96\xbe\xe3\x05\x5c\x9d\x98\x0a\xfc\x0a\xd8\
-\x25\xba\x21\xca\x6e\x09\x70\x1f\x70\x3f\x70\xef\x32\xbf\x9f\x3e\
-\xf8\xcf\x0f\x03\xb3\x96\xf9\x75\x16\xe9\x43\x7f\x56\x97\x7f\xdf\
-\x68\x60\x55\xd2\xe0\x60\x22\x69\x50\x30\x69\xf0\x9f\xd7\x1e\xcc\
-\x3a\xc0\xba\xcb\xfc\xf3\x86\xa4\xad\xa3\xd5\x3e\xff\x00\xf6\x07\
-\x6e\x88\x6e\x48\x3f\x71\x00\xa0\xa2\xf6\x25\xbd\xdb\xbf\xda\x8a\
-\xfe\x87\xaa\xad\x07\x81\x1b\x49\x2b\xb5\xdd\x0e\xdc\x36\xf8\xeb\
-\xd2\xcc\x0b\x6b\x59\x71\x6b\x01\x1b\x03\x9b\x0c\xfe\xba\x31\x69\
-\x60\xba\x05\xb0\x29\x69\xb3\x29\x35\xd3\x4c\xe0\x2d\xc0\x49\xc1\
-\xed\xe8\x1b\x0e\x00\xb4\x22\x63\x81\x23\xf1\x96\x7f\x93\xdc\x0b\
-\xfc\x9d\xb4\x4d\xeb\xf5\xa4\x6f\x55\xd7\x91\xbe\xcd\xb7\xd9\x58\
-\xd2\x36\xd3\x5b\x91\x5e\x47\xdd\x0a\xd8\x86\xb4\x4e\xfd\xb8\xc0\
-\x76\xa9\xb8\x25\xc0\x17\x81\xcf\x00\x8b\x83\xdb\xd2\x7a\x5e\xd0\
-\x35\x92\xb5\x80\x13\x80\xe7\x46\x37\x44\xc3\xba\x07\xb8\x7c\x30\
-\xff\x20\x7d\xd0\xff\x23\xb4\x45\xf5\x33\x86\x34\x20\xd8\x69\x99\
-\x6c\x4f\xda\xc6\x56\xf5\x74\x3a\x69\xcd\x80\x07\xa3\x1b\xd2\x66\
-\x0e\x00\x34\x9c\x1d\x48\xb7\xe2\x36\x8e\x6e\x88\xfe\x6d\x01\xe9\
-\x83\xfe\x02\xe0\x7c\xd2\x82\x2a\xf7\x85\xb6\xa8\xb9\xc6\x00\xdb\
-\x01\xcf\x24\x6d\x53\xbd\x17\xae\x5e\x59\x37\xb7\x90\x36\x13\xbb\
-\x26\xba\x21\x6d\xe5\x00\x40\x43\x39\x08\x38\x1e\x27\x5c\x45\x9b\
-\x43\x5a\x30\xe5\xaf\xa4\x0f\xfc\x4b\x71\xa6\x74\x99\xa6\x90\x06\
-\x02\x7b\x03\xfb\x90\x36\xb5\x51\xac\xd9\xc0\x21\xa4\xf5\x46\x24\
-\x95\x68\x00\x38\x9c\xf4\xec\x6d\x89\x09\xc9\x2d\xc0\x51\xa4\x0f\
-\xa0\x09\x23\xfe\xb4\x54\xb6\xf5\x80\x03\x48\xbb\x5a\xde\x45\x7c\
-\xdf\xe8\xe7\x1c\x8b\x13\x3c\xa5\xd2\x4c\x06\x4e\x21\xfe\x44\xef\
-\xb7\x3c\x48\x5a\x46\xf9\x20\xd2\xab\x6e\xaa\xa7\x51\xc0\xce\xc0\
-\xe7\x80\x2b\x88\xef\x37\xfd\x98\xb3\x48\xcb\x09\x4b\xca\xe8\xa9\
-\xa4\xd9\xe2\xd1\x27\x78\xbf\xe4\x36\xe0\x5b\xc0\xf3\xf1\x5b\x4d\
-\x53\x6d\x44\xda\xe6\xf6\x4f\xc0\x63\xc4\xf7\xa9\x7e\xc9\x3f\x70\
-\x5e\x92\x94\xcd\xee\xa4\x05\x5f\xa2\x4f\xec\xb6\xe7\x66\xe0\xf3\
-\xa4\xc9\x95\x6a\x97\x55\x81\x37\x92\xee\xa0\xcd\x23\xbe\xaf\xb5\
-\x3d\x77\x93\xde\xe4\x90\xd4\x83\x57\x92\x26\xd9\x44\x9f\xd0\x6d\
-\xcd\x0c\xd2\xb3\xcb\xbd\x70\xc2\x6d\xbf\x58\x8d\xb4\xc9\xcd\xc9\
-\xa4\x25\x91\xa3\xfb\x60\x5b\xf3\x28\xf0\xb2\x82\x3f\x13\x49\x4f\
-\xf2\x2e\x60\x21\xf1\x27\x72\xdb\x32\x93\xf4\x06\xc5\xf3\x70\xbb\
-\xed\x7e\xb7\x0e\xf0\x7e\xe0\x6a\xe2\xfb\x65\x1b\xb3\x00\xf8\xcf\
-\xc2\x3f\x0d\x49\xff\x9e\xe9\x1f\x7d\xf2\xb6\x2d\x97\x01\x87\x91\
-\xd6\xb5\x97\x9e\x6c\x1b\xe0\xcb\xf8\xb8\xad\x8c\x1c\x85\x3b\xdb\
-\x4a\x2b\x34\x0e\xf8\x19\xf1\x27\x6c\x5b\x72\x1f\x69\x99\xe4\xad\
-\x3a\xf9\x21\xa8\xaf\x4d\x00\x5e\x03\x9c\x8d\xaf\xdb\xe6\xcc\xcf\
-\x81\xf1\x1d\xfc\x1c\xa4\xbe\x32\x19\xf8\x33\xf1\x27\x6a\x1b\x72\
-\x31\xf0\x3a\x5c\x5f\x5e\xbd\xd9\x1a\xf8\x0e\xe9\xb1\x51\x74\x9f\
-\x6e\x43\xce\xc5\xd7\x04\xa5\xe5\xac\x0e\x5c\x42\xfc\x09\xda\xe4\
-\xcc\x23\xed\x8b\xf0\xcc\x0e\x6b\x2f\xad\xc8\x24\xd2\xe3\xa3\xbf\
-\x13\xdf\xcf\x9b\x9e\x2b\x71\x3d\x0d\xe9\xdf\xd6\x03\xae\x25\xfe\
-\xc4\x6c\x6a\xee\x27\xbd\xbe\xb7\x5e\xa7\x85\x97\x3a\x34\x00\xbc\
-\x18\xef\xd4\xf5\x9a\x7f\xe0\xf9\x2a\x31\x05\xb8\x89\xf8\x13\xb2\
-\x89\xb9\x07\xf8\x28\xee\x18\xa7\x18\xdb\x03\xff\x47\x9a\xe9\x1e\
-\x7d\x2e\x34\x31\xd3\x80\xa9\x1d\x57\x5d\x6a\x89\xcd\x49\x2b\xce\
-\x45\x9f\x88\x4d\xcb\x0d\xc0\xc1\xf8\x7c\x5f\xf5\xb0\x39\x70\x0c\
-\x69\x13\xa8\xe8\x73\xa3\x69\xb9\x15\xd8\xb4\xf3\x92\x4b\xcd\xb6\
-\x35\x69\xb5\xac\xe8\x13\xb0\x49\xb9\x1a\x78\x35\xbe\x4e\xa4\x7a\
-\xda\x00\x38\x1a\x97\x1d\xee\x34\x77\x02\x5b\x76\x51\x6f\xa9\x91\
-\x76\x00\xa6\x13\x7f\xe2\x35\x25\xd7\x93\x56\x6e\x73\xd1\x1e\x35\
-\xc1\x46\xa4\xf7\xde\xbd\x23\x50\x3c\xf7\x01\xdb\x75\x53\x6c\xa9\
-\x49\x76\x06\x1e\x22\xfe\x84\x6b\x42\xa6\x01\x6f\xc6\x0f\x7e\x35\
-\xd3\xc6\xc0\xf7\x71\x8e\x40\xd1\xcc\xc0\xfd\x03\xd4\x62\xdb\x01\
-\x0f\x10\x7f\xa2\xd5\x3d\xf7\x00\xef\xc0\x67\xfc\x6a\x87\xa7\x01\
-\x27\x11\x7f\x5e\x35\x21\x0f\x03\xbb\x75\x57\x66\xa9\xbe\xb6\x20\
-\x7d\xb0\x45\x9f\x60\x75\xce\x1c\xd2\x52\xac\xab\x76\x59\x63\xa9\
-\xce\x76\x03\xfe\x42\xfc\x79\x56\xf7\x3c\x0c\xec\xd8\x65\x8d\xa5\
-\xda\xd9\x8c\x34\xd1\x25\xfa\xc4\xaa\x6b\x16\x91\x5e\xa7\xda\xa8\
-\xdb\x02\x4b\x0d\x31\x00\xec\x4f\xda\x7a\x3a\xfa\xbc\xab\x73\xee\
-\x25\x7d\x69\x92\x1a\x6d\x0a\xbe\xea\x37\x52\xce\xc3\xe7\x7e\xea\
-\x3f\xe3\x80\x8f\x91\xb6\xcc\x8d\x3e\x07\xeb\x9a\x7f\x91\xe6\x51\
-\x48\x8d\xb4\x0e\x69\x06\x7b\xf4\x89\x54\xc7\xdc\x43\x9a\xd9\x3f\
-\xd0\x75\x75\xa5\xe6\x5b\x9f\x74\xf7\xcb\x4d\x87\x86\xce\xcd\xb8\
-\x62\xa0\x1a\x68\x6d\x5c\xde\x77\xa8\x2c\xbd\xdd\xbf\x66\xf7\xa5\
-\x95\x5a\xe7\xd9\xb8\xcf\xc0\x70\xf9\x3b\x5e\x2f\xd4\x20\x93\x80\
-\xcb\x89\x3f\x71\xea\x96\x8b\x48\x6b\x20\x48\x5a\xde\x58\xe0\xc3\
-\xc0\x6c\xe2\xcf\xd5\xba\xe5\x12\xd2\x75\x55\xaa\xb5\xb1\xc0\x9f\
-\x88\x3f\x61\xea\x94\x99\xa4\xd7\xfa\x5c\xc1\x4f\x5a\xb1\xcd\x80\
-\xb3\x89\x3f\x6f\xeb\x96\x73\x81\x95\xba\x2f\xab\x54\xae\x01\xe0\
-\xc7\xc4\x9f\x28\x75\xca\x1f\x49\x13\x21\x25\x15\x37\x00\xbc\x0d\
-\x78\x90\xf8\x73\xb8\x4e\x39\x95\xf4\x25\x4b\xaa\x9d\x2f\x12\x7f\
-\x82\xd4\x25\x0f\x02\x6f\xe9\xa9\x9a\x92\xd6\x03\x7e\x4d\xfc\xf9\
-\x5c\xa7\x7c\xbf\xa7\x8a\x4a\x25\x78\x27\xf1\x27\x46\x5d\xf2\x3b\
-\x9c\xb9\x2b\xe5\xf4\x5a\xbc\x1b\xb0\x6c\x3e\xda\x5b\x39\xa5\x7c\
-\x5e\x0e\x2c\x24\xfe\xa4\x88\xce\x6c\xe0\x7d\x3d\xd6\x52\xd2\xd0\
-\xd6\x25\xdd\x02\x8f\x3e\xcf\xeb\x90\xc5\xc0\xeb\x7a\x2b\xa7\xd4\
-\xbb\x5d\x71\x31\x8f\x25\xa4\x59\xba\x4f\xed\xb1\x96\x92\x46\x36\
-\x00\x1c\x86\xd7\x9c\x25\xa4\xdd\x16\xf7\xe8\xad\x9c\x52\xf7\x36\
-\x23\xed\x60\x15\x7d\x22\x44\x66\x01\xf0\x39\x60\x4c\x8f\xb5\x94\
-\x54\xdc\x56\xf8\xaa\xf1\x12\xd2\x36\xc2\x53\x7b\xac\xa5\xd4\xb1\
-\x49\xb8\xd0\xcf\xad\xc0\x9e\xbd\x16\x52\x52\x57\xc6\x03\x47\x13\
-\x7f\x1d\x88\xce\x75\xc0\x6a\x3d\xd6\x52\x2a\x6c\x14\xf0\x7b\xe2\
-\x3b\x7e\x64\x4e\x06\xd6\xe8\xb5\x90\x92\x7a\xf6\x2a\x9c\x20\x78\
-\x2e\x6e\x1f\xae\x8a\xfc\x0f\xf1\x1d\x3e\x2a\x0b\x80\xc3\x71\x51\
-\x1f\xa9\x4e\xa6\x00\x17\x12\x7f\x7d\x88\xcc\x0f\x7b\xae\xa2\xb4\
-\x02\x07\xd2\xbf\x1b\x77\xdc\x09\xec\xd5\x7b\x09\x25\x95\x60\x1c\
-\x70\x14\xf1\xd7\x89\xc8\x7c\xa8\xe7\x2a\x4a\xc3\xd8\x81\xfe\x5d\
-\xa7\xfb\x4c\xd2\x06\x47\x92\xea\xed\x8d\xc0\x1c\xe2\xaf\x19\x11\
-\x59\x00\x3c\xa7\xe7\x0a\x4a\x4f\xf2\x14\xd2\xfe\xd4\xd1\x1d\x3c\
-\x22\xc7\xe2\xf2\x9b\x52\x93\x6c\x4f\x9a\xa4\x1b\x7d\xed\x88\xc8\
-\x7d\xc0\x06\xbd\x97\x50\x4a\xc6\x02\x7f\x25\xbe\x63\x57\x9d\xc7\
-\x80\x83\x33\xd4\x4f\x52\xf5\xd6\x26\x4d\x8e\x8b\xbe\x8e\x44\xe4\
-\x02\xfc\xd2\xa2\x4c\x8e\x24\xbe\x43\x57\x9d\xbb\x71\x91\x0d\xa9\
-\xe9\xc6\x00\xdf\x22\xfe\x7a\x12\x91\xa3\x32\xd4\x4f\x7d\xee\x15\
-\xf4\xdf\xa4\xbf\x4b\xf1\x16\x9a\xd4\x26\xef\xa2\x3f\x97\x2b\x7f\
-\x6d\x8e\xe2\xa9\x3f\x6d\x44\xff\xad\xf4\x77\x3a\x69\x91\x23\x49\
-\xed\xf2\x42\xe0\x11\xe2\xaf\x31\x55\xe6\x51\x60\xdb\x1c\xc5\x53\
-\x7f\x19\x4b\x7a\x8e\x14\xdd\x81\xab\xcc\xf7\x71\x49\x5f\xa9\xcd\
-\x9e\x0e\xdc\x4e\xfc\xb5\xa6\xca\xdc\x04\x4c\xce\x51\x3c\xf5\x8f\
-\xaf\x13\xdf\x71\xab\xca\x62\xd2\xe2\x3e\x92\xda\x6f\x7d\xfa\x6f\
-\x1f\x81\xdf\x93\x36\x52\x92\x56\xe8\x95\xf4\xcf\x73\xff\xb9\xa4\
-\xc5\x8d\x24\xf5\x8f\x49\xc0\x9f\x89\xbf\xfe\x54\x99\xf7\x66\xa9\
-\x9c\x5a\x6d\x13\xfa\x67\x5d\xed\x99\xb8\x68\x86\xd4\xaf\xc6\x03\
-\xbf\x25\xfe\x3a\x54\x55\xe6\x02\xdb\x64\xa9\x9c\x5a\x69\x0c\x70\
-\x11\xf1\x1d\xb5\x8a\xcc\x00\x76\xc9\x53\x36\x49\x0d\x35\x1a\x38\
-\x9e\xf8\xeb\x51\x55\xb9\x8a\x34\xf0\x91\x96\xf3\x69\xe2\x3b\x68\
-\x15\xb9\x07\xd8\x2e\x53\xcd\x24\x35\xdb\x00\x70\x04\xf1\xd7\xa5\
-\xaa\xf2\xd5\x3c\x65\x53\x9b\xec\x00\xcc\x23\xbe\x73\x96\x9d\x69\
-\xc0\x66\x99\x6a\x26\xa9\x3d\x3e\x46\xfc\xf5\xa9\x8a\x2c\x02\x9e\
-\x97\xa9\x66\x6a\x81\x09\xc0\xb5\xc4\x77\xcc\xb2\x73\x3d\x2e\xf0\
-\x23\x69\x78\x1f\x20\xfe\x3a\x55\x45\xee\x00\x56\xcf\x54\x33\x35\
-\xdc\xd7\x88\xef\x90\x65\xe7\x46\xd2\xeb\x3f\x92\x34\x92\xb7\xd3\
-\x1f\x6f\x41\xfd\x3a\x57\xc1\xd4\x5c\x7b\xd1\xfe\x25\x32\xfd\xf0\
-\x97\xd4\x89\xff\xa4\x3f\x06\x01\x6f\xcc\x55\x30\x35\xcf\x44\xe0\
-\x9f\xc4\x77\x42\x3f\xfc\x25\xd5\xcd\x61\xb4\x7f\x10\x30\x0b\xd8\
-\x3c\x57\xc1\xd4\x2c\x6d\x7f\xfd\xc5\x0f\x7f\x49\xbd\x78\x0f\xf1\
-\xd7\xb1\xb2\x73\x2e\xae\x12\xd8\x77\x5e\x44\x7c\xc7\x2b\x33\xd3\
-\x70\xc2\x9f\x86\x36\x8e\x34\x01\xca\x8b\x9e\x8a\xf8\x14\xf1\xd7\
-\xb3\xb2\x73\x68\xb6\x6a\xa9\xf6\x56\x06\x6e\x21\xbe\xd3\x95\x95\
-\xfb\x80\x2d\xb3\x55\x4b\x4d\x35\x16\x78\x36\x69\x9f\x87\x53\x49\
-\x8f\xbb\x16\xf0\xc4\xbe\xf2\x28\x70\x05\xf0\x33\xd2\xe4\xaf\xa7\
-\x46\x34\x54\xb5\xd7\xf6\x75\x02\x1e\xc6\xbb\xa5\x7d\xe3\x2b\xc4\
-\x77\xb8\x32\x3b\xf2\x0e\xf9\x4a\xa5\x06\xda\x12\x38\x0a\x98\x4e\
-\x77\x7d\xe8\x32\xd2\xad\xdf\x55\xaa\x6e\xb8\x6a\x6b\x00\x38\x96\
-\xf8\xeb\x5b\x99\xf9\x65\xb6\x6a\xa9\xb6\xb6\x03\xe6\x13\xdf\xd9\
-\xca\xc8\x1c\xe0\x59\xf9\x4a\xa5\x86\xd9\x14\xf8\x15\x69\xa1\x93\
-\x1c\xfd\x69\x06\xf0\x71\x5c\x3a\x55\xc9\x28\xe0\x17\xc4\x5f\xe7\
-\xca\xcc\x2b\xb2\x55\x4b\xb5\x33\x1a\xb8\x94\xf8\x4e\x56\x46\xe6\
-\x01\x2f\xce\x57\x2a\x35\xc8\x68\xe0\x13\xa4\x01\x60\x19\x7d\xeb\
-\x26\xd2\xa3\x04\x69\x2c\xf0\x27\xe2\xaf\x77\x65\xe5\x76\xd2\xdb\
-\x61\x6a\xa1\xf7\x13\xdf\xc1\xca\xc8\x62\xe0\x4d\x19\xeb\xa4\xe6\
-\x58\x97\x6a\xb6\x75\x5d\x08\x7c\x16\x27\x0e\x2a\x6d\x25\x7c\x25\
-\xf1\xd7\xbd\xb2\xf2\xcd\x7c\xa5\x52\x5d\x4c\x21\x6d\x7f\x1b\xdd\
-\xb9\xca\xc8\x67\x32\xd6\x49\xcd\x31\x15\xb8\x99\x6a\xfb\xda\xcf\
-\x48\xdf\x02\xd5\xdf\xd6\x27\x7d\x5b\x8e\xbe\xf6\x95\x91\x45\xc0\
-\x1e\xf9\x4a\xa5\x3a\xf8\x3d\xf1\x1d\xab\x8c\xfc\x1c\xbf\x95\xf5\
-\xa3\xcd\x48\xbb\x3a\x46\xf4\xb9\x93\x48\x8f\x1d\xd4\xdf\xb6\x01\
-\x1e\x22\xfe\x1a\x58\x46\xae\xc1\x81\x6e\x6b\xbc\x92\xf8\x0e\x55\
-\x46\xce\xc2\x4e\xda\x8f\xd6\x21\xfe\x35\xd6\xef\x97\x7e\x94\x6a\
-\x82\x7d\x68\xef\xa4\xea\x8f\x66\xac\x93\x82\x8c\xa7\xfa\xdb\xa4\
-\x55\xe4\x5a\x60\x72\xc6\x3a\xa9\x19\x46\x01\x67\x10\xdf\xff\x96\
-\x00\x87\x94\x7c\xac\x6a\x86\x83\x89\xef\x8b\x65\x64\x16\xae\x0d\
-\xd0\x78\x1f\x21\xbe\x23\xe5\xce\x03\xa4\x5b\xc0\xea\x3f\x1f\x26\
-\xbe\xff\x2d\xcd\x6c\x60\x8b\x72\x0f\x57\x0d\xf1\x4d\xe2\xfb\x63\
-\x19\xf9\x51\xce\x22\xa9\x5a\xeb\x90\x16\xc6\x89\xee\x44\x39\xb3\
-\x10\x5f\xf7\xeb\x57\x1b\x91\xbe\x95\x44\xf7\xc1\x65\x73\x46\xa9\
-\x47\xac\xa6\x18\x0d\x9c\x46\x7c\x7f\xcc\x9d\x45\xc0\x2e\x19\xeb\
-\xa4\x0a\xfd\x80\xf8\x0e\x94\x3b\xef\xcf\x5a\x21\x35\xc9\x8f\x89\
-\xef\x7f\x43\xc5\x01\xa9\x00\xd6\xa0\x9d\x8f\x5b\x2f\xc4\x89\xd6\
-\x8d\xb3\x3d\xe9\xdb\x72\x74\xe7\xc9\x99\x9f\x64\xad\x90\x9a\x64\
-\x13\xea\x3b\xd9\xea\xbc\xf2\x0e\x5b\x0d\xb3\x15\xf0\x08\xf1\x7d\
-\x32\x77\x0e\xcc\x59\x24\x95\xef\x3c\xe2\x3b\x4d\xce\x5c\x0a\xac\
-\x94\xb5\x42\x6a\x92\x2f\x11\xdf\x07\x47\xca\x33\xca\x3b\x74\x35\
-\xcc\x7e\xa4\xc5\xc9\xa2\xfb\x64\xce\xdc\x0a\x4c\xc8\x59\x24\x95\
-\x67\x7f\xe2\x3b\x4c\xce\x3c\x40\x5a\xc8\x48\xfd\x69\x14\xf0\x2f\
-\xe2\xfb\xe1\x48\xf9\x4a\x69\x47\xaf\x26\x3a\x92\xf8\x3e\x99\x3b\
-\x1f\xcf\x5a\x21\x95\x62\x1c\x30\x8d\xf8\xce\x92\x2b\x8b\x81\x97\
-\x65\xad\x90\x9a\x66\x47\xe2\xfb\xe1\x8a\x72\x53\x69\x47\xaf\x26\
-\x1a\x4b\x7a\x76\x1e\xdd\x2f\x73\x66\x26\x69\xe9\x6d\xd5\xd8\x7b\
-\x88\xef\x28\x39\x73\x44\xde\xf2\xa8\x81\x3e\x48\x7c\x3f\x2c\x92\
-\x0d\xca\x2a\x80\x1a\x69\x43\xe0\x7e\xe2\xfb\x65\xce\xfc\x20\x6b\
-\x85\x94\xd5\xca\xc0\xdd\xc4\x77\x92\x5c\x39\x1f\x18\x93\xb5\x42\
-\x6a\xa2\x9f\x13\xdf\x17\x8b\x64\xdf\xb2\x0a\xa0\xc6\x7a\x09\xf9\
-\xb6\xa7\xae\x43\x16\x91\x26\x98\x57\x66\x54\x95\x7f\x59\xc3\xbd\
-\x07\x58\x2f\xba\x11\x99\x3c\x08\xbc\x9e\xf4\x26\x83\xfa\xdb\xd3\
-\xa2\x1b\x50\x90\x8b\x02\xe9\xc9\x4e\xa3\x5d\xf3\x43\x46\x01\x9f\
-\x8b\x6e\x84\x96\x37\x99\x34\x59\x2e\x7a\x84\x98\x23\x8b\x81\x97\
-\xe6\x2d\x8f\x1a\xec\x3e\xe2\xfb\x64\x91\x1c\x5d\x56\x01\xd4\x68\
-\x63\x80\x8b\x88\xef\x9f\x39\xaf\xcf\x3b\x67\xad\xd0\x08\xbc\x03\
-\x50\xcc\x07\x49\x0b\x51\xb4\xc1\x31\xc0\xa9\xd1\x8d\x50\x6d\x4c\
-\x8a\x6e\x40\x41\x13\xa3\x1b\xa0\x5a\x5a\x48\xba\x9b\x39\x2b\xba\
-\x21\x99\x0c\x00\x87\x47\x37\x42\x8f\x5b\x8b\xf6\x2c\x3e\x71\x33\
-\x5e\x48\xf5\x44\xd1\x7d\xb2\x68\x4e\x28\xab\x00\x6a\x85\x43\x89\
-\xef\xa3\x39\xb3\x7b\xde\xf2\x0c\xcd\x3b\x00\x2b\xf6\x71\x60\xd5\
-\xe8\x46\x64\xb0\x10\x78\x03\xf0\x68\x74\x43\x24\x29\xb3\xef\x03\
-\xbf\x8e\x6e\x44\x46\x87\x47\x37\x40\x69\xbb\xc6\xd9\xc4\x8f\x06\
-\x73\xe4\x53\x99\x6b\xa3\x76\x88\xee\x97\x45\xe3\x1d\x00\xad\xc8\
-\x5a\xc0\x3d\xc4\xf7\xd5\x5c\xd9\x3b\x6f\x79\xd4\xa9\xb6\x6c\x43\
-\x79\x21\xbe\xf2\xa7\xa1\x45\xf7\xcd\xa2\x71\x00\xa0\x22\x5e\x4a\
-\x7c\x5f\xcd\x95\xb3\x33\xd7\x46\x1d\x58\x93\xfa\x6d\x8f\xda\x4d\
-\x1e\x03\xb6\xce\x5c\x1b\xb5\x47\x74\xff\x2c\x1a\x07\x00\x2a\xaa\
-\xae\x3b\x5b\x76\x93\x67\x67\xae\xcd\x13\x38\x07\x60\x78\xef\xa5\
-\x1d\x13\xe6\x3e\x0f\x5c\x17\xdd\x08\x49\xaa\xc8\x7f\x91\x5e\x6f\
-\x6d\x83\x2f\x44\x37\xa0\x1f\x4d\x04\x66\x10\x3f\xfa\xeb\x35\x57\
-\x92\xd6\xcd\x96\x86\x13\xdd\x47\x8b\xc6\x3b\x00\xea\xc4\x01\xc4\
-\xf7\xd9\x5c\x79\x5e\xe6\xda\xfc\x9b\x77\x00\x86\x76\x28\xe9\x11\
-\x40\x93\x2d\x04\x0e\x01\x16\x44\x37\x44\x92\x2a\x76\x22\xf0\xdb\
-\xe8\x46\x64\xf2\xe1\xe8\x06\xf4\x93\xb1\xc0\xed\xc4\x8f\xfa\x7a\
-\xcd\x97\x72\x17\x46\xad\x14\xdd\x4f\x8b\xc6\x3b\x00\xea\xd4\xba\
-\xa4\x65\xcf\xa3\xfb\x6e\x8e\x6c\x97\xb9\x36\x80\x77\x00\x86\xf2\
-\x7a\x60\x4a\x74\x23\x7a\x74\x0b\xe9\xd9\xbf\x24\xf5\xab\x7b\x81\
-\x8f\x45\x37\x22\x93\xf7\x46\x37\xa0\x1f\x0c\x00\xd7\x12\x3f\xda\
-\xeb\x35\x2f\xcb\x5d\x18\xb5\x56\x74\x5f\x2d\x1a\xef\x00\xa8\x1b\
-\xa3\x80\x8b\x89\xef\xbf\xbd\xe6\x31\xd2\x1d\x8d\xac\xbc\x03\xf0\
-\x44\xaf\x00\xb6\x89\x6e\x44\x8f\x4e\x06\x4e\x89\x6e\x84\x24\xd5\
-\xc0\x62\xe0\xdd\x83\xbf\x36\xd9\x78\xe0\x1d\xd1\x8d\x68\xbb\x73\
-\x88\x1f\xe9\xf5\x92\x39\xc0\xa6\xd9\xab\xa2\x36\x8b\xee\xb3\x45\
-\xe3\x1d\x00\xf5\xe2\x7b\xc4\xf7\xe1\x5e\xf3\x00\xb0\x72\xce\xa2\
-\x78\x07\xe0\x71\x5b\x53\xf2\xa2\x0b\x15\x38\x02\x98\x16\xdd\x08\
-\x49\xaa\x99\x4f\x00\xf7\x47\x37\xa2\x47\x6b\x90\xf6\x73\xa9\xa5\
-\xf5\x80\x9d\x06\xb3\x1b\xb0\x25\xb0\x5a\x68\x8b\x3a\xf3\x1d\xe2\
-\x47\x78\xbd\xe4\x16\x60\x42\xf6\xaa\xa8\xed\xa2\xfb\x6d\xd1\x78\
-\x07\x40\xbd\x3a\x84\xf8\x7e\xdc\x6b\xae\x27\xcd\x55\x0b\x35\x06\
-\x78\x21\xf0\x75\xd2\x04\x8b\xb9\x0c\xdf\xe0\x3b\x49\xfb\xcf\x7f\
-\x00\x78\x5a\x44\x63\x0b\x58\x15\x98\x49\xfc\x0f\xb7\x97\xbc\x3a\
-\x7b\x55\xd4\x0f\xa2\xfb\x6d\xd1\x38\x00\x50\xaf\x46\x01\x57\x10\
-\xdf\x97\x7b\xcd\x4b\x73\x17\xa6\xa8\x0d\x80\xaf\x00\xd3\x57\xd0\
-\xc0\x91\x72\x09\xf0\x56\x60\x5c\xc5\x6d\x1f\xc9\xbb\x89\xff\xa1\
-\xf6\x92\xf3\xf3\x97\x44\x7d\x22\xba\xef\x16\x8d\x03\x00\xe5\xf0\
-\x7c\xe2\xfb\x72\xaf\xa9\x7c\x93\xa0\xd5\x80\xa3\x80\x79\x3d\x36\
-\x7c\xd9\x4c\x23\x3d\xcf\x88\xbe\x9d\x31\x40\x5a\x2b\x3f\xfa\x87\
-\xda\x6d\x16\x93\x1e\xb9\x48\xdd\x88\xee\xbf\x45\xe3\x00\x40\xb9\
-\x9c\x4a\x7c\x7f\xee\x35\x95\x6d\xf0\xf6\x0a\xd2\xc6\x0a\x65\x1d\
-\xc8\x9f\x88\x5d\x78\xa7\xe9\x23\xc2\x5f\xe6\x2f\x89\xfa\x48\x74\
-\xff\x2d\x1a\x07\x00\xca\x65\x1b\xd2\x52\xe9\xd1\x7d\xba\x97\x7c\
-\x2d\x7b\x55\x9e\x64\x34\xf0\x4d\xd2\x37\xcc\xb2\x0f\x66\x06\xe9\
-\x83\x38\xc2\x6f\x0b\xb6\xb1\x8e\x79\x0c\x98\x9a\xbf\x24\xea\x23\
-\xd1\x7d\xb8\x68\x1c\x00\x28\xa7\xe3\x88\xef\xd3\xbd\x64\x3a\x25\
-\x3e\x46\x5f\x09\x38\xa9\xe2\x03\x5a\x00\xbc\xb1\xac\x03\x1a\xc6\
-\x46\x34\x7b\x24\x78\x64\xfe\x92\xa8\xcf\x44\xf7\xe1\xa2\x71\x00\
-\xa0\x9c\xd6\x03\x66\x11\xdf\xaf\x7b\xc9\xfe\xd9\xab\x42\xda\x0c\
-\x27\xea\x19\xc9\x42\xaa\x1d\x04\x7c\xb2\xa4\xe3\xa8\x22\x33\x81\
-\xb5\xf2\x97\x44\x7d\x26\xba\x1f\x17\x8d\x03\x00\xe5\xf6\x45\xe2\
-\xfb\x75\x2f\x39\x3d\x7f\x49\xe0\x87\xc1\x07\x35\x1f\xd8\xbb\x8c\
-\x03\x7b\x92\x01\xe0\xc6\x80\xe3\xcb\x95\x2f\xe4\x2f\x89\xfa\x50\
-\x74\x3f\x2e\x1a\x07\x00\xca\x6d\x4d\xe0\x11\xe2\xfb\x76\xb7\x59\
-\x44\xe6\xf9\x73\x07\xd7\xe0\xa0\x96\x90\x9e\x6f\x64\xdf\xf8\xe0\
-\x49\xf6\xa8\xc1\x71\x76\x9b\x87\x49\xab\x42\x49\xbd\x8a\xee\xcb\
-\x45\xe3\x00\x40\x65\xf8\x3c\xf1\x7d\xbb\x97\x7c\x36\x57\x21\x36\
-\x01\x1e\xad\xc1\x01\x2d\xcd\xef\x73\x1d\xd8\x30\x9a\xbc\x36\xf4\
-\xe1\xf9\xcb\xa1\x3e\x15\xdd\x97\x8b\xc6\x01\x80\xca\xb0\x1a\xf0\
-\x10\xf1\xfd\xbb\xdb\xdc\x46\xa6\x25\xfd\xab\x9e\xf4\x57\x24\x65\
-\xcd\x07\x98\x00\x3c\x58\x83\xe3\xeb\x26\x0f\x02\x93\xf3\x97\x44\
-\x7d\x2a\xba\x3f\x17\x8d\x03\x00\x95\xe5\x33\xc4\xf7\xef\x5e\xf2\
-\xa2\x5e\x0b\xb0\x57\x0d\x0e\x62\xa8\x3c\x40\x39\x8f\x02\x0e\xac\
-\xc1\xb1\x75\x9b\x4f\x95\x50\x0f\xf5\xaf\xe8\xfe\x5c\x34\x0e\x00\
-\x54\x96\x55\x49\x9f\x35\xd1\x7d\x3c\xec\xdc\xf8\x7d\x0d\x0e\x62\
-\xb8\x9c\xd4\xeb\xc1\x0d\xa1\xa9\x2b\x41\xcd\xa4\x59\x1b\x2c\xa9\
-\xfe\xa2\xfb\x74\x65\x17\x39\x69\x04\x9f\x23\xbe\x8f\x77\x9b\x79\
-\xf4\xf0\x46\xd8\x14\xd2\x6c\xc2\xe8\x83\x18\x29\x07\x75\x7b\x70\
-\x43\x58\x97\xb4\xe6\x40\xf4\x31\x75\x93\xaf\x66\xac\x83\x04\xf1\
-\x7d\xba\x68\x1c\x00\xa8\x4c\x6b\x03\xb3\x89\xef\xe7\xdd\xe6\xd0\
-\x6e\x0e\x7a\x14\xf0\x1a\x32\x4d\x22\x28\xd1\xb7\x81\x75\x32\xfd\
-\x59\xaf\x23\xed\x66\xd8\x34\xf3\x48\x2b\x33\x4a\x92\xf2\xba\x9f\
-\xf4\x0a\x7c\x53\x1d\xd8\xcd\xff\x69\x14\xf0\xf2\xcc\x0d\x29\xc3\
-\x5a\xc0\x77\x32\xfd\x59\xaf\xc9\xf4\xe7\x54\xed\x27\xc0\x5d\xd1\
-\x8d\x90\xa4\x96\xfa\x1a\x69\x31\xba\x26\x7a\x0e\xe9\x2e\x46\xc7\
-\xe6\x12\x7f\xfb\xa2\x68\x7a\x5d\xfa\x70\x0a\xd5\xec\x6d\x90\x3b\
-\x8b\x80\x2d\x7b\x3c\x76\x69\x28\xd1\x7d\xbb\x68\x7c\x04\xa0\x2a\
-\xfc\x8c\xf8\xbe\xde\x6d\x0e\xeb\xf4\x60\x47\x91\x5e\x89\x6b\x8a\
-\xef\xd0\xdb\xf2\xb7\xfb\x12\xbf\xfd\x70\x37\x7e\x47\x5a\xb5\x50\
-\x92\x54\x9e\xaf\x90\x3e\x4c\x9b\xe8\x80\x4e\xff\x0f\x75\x7f\xf6\
-\xff\x64\xeb\x00\xdf\xea\xe1\xff\x5f\xca\xe6\x09\x15\x38\x2a\xba\
-\x01\x92\xd4\x07\xae\x06\xce\x8d\x6e\x44\x97\x9e\x4b\x87\x73\xe5\
-\x9a\x36\x00\x00\x78\x2d\xf0\xaa\x2e\xfe\x7f\xeb\x02\x7b\x66\x6e\
-\x4b\x15\xfe\x0e\xfc\x25\xba\x11\x92\xd4\x27\x8e\x8e\x6e\x40\x97\
-\x46\x93\xee\x72\x17\xd6\xc4\x01\x00\xc0\x31\x74\xbe\x16\xfe\xbe\
-\x34\xf3\x78\x9b\xda\x19\x25\xa9\x89\x7e\x4f\x5a\x62\xb7\x89\x3a\
-\x7a\x0c\xd0\xc4\x0f\x44\x48\xdf\xe6\x3b\x7d\x25\x6e\xbf\x32\x1a\
-\x52\xb2\x87\x49\x93\x52\x24\x49\xd5\x58\x04\x1c\x17\xdd\x88\x2e\
-\x3d\x87\x0e\x1e\x03\x34\x75\x00\x00\x69\x9f\x80\xa2\x8f\x02\xd6\
-\x24\x15\xa6\x69\x8e\x27\x2d\x4e\x21\x49\xaa\xce\xf7\x81\xc7\xa2\
-\x1b\xd1\x85\xd1\x74\xf0\x65\xb7\xc9\x03\x00\x48\x6f\x05\x14\x59\
-\x1a\xf7\x15\x34\x6f\xf1\x9f\xc5\xa4\x1d\x0b\xeb\x60\x32\x30\x15\
-\xd8\x94\x74\xf7\x65\x6c\x6c\x73\x24\xa9\x54\x33\x80\x5f\x45\x37\
-\xa2\x4b\xaf\xee\xe4\x7f\x1c\xfd\xee\x62\xaf\x29\xb2\x7a\xd3\xef\
-\x6a\xd0\xce\x4e\x73\x56\x81\xe3\x2a\xc3\x1a\xa4\xc5\x92\xbe\x0f\
-\x5c\xc6\xd0\xeb\x44\x2c\x00\x6e\x25\x3d\x2b\xfb\x08\xb0\x7d\x48\
-\x4b\x95\x43\x74\x3f\x2f\x1a\xd7\x01\x50\xd5\xf6\x24\xbe\xdf\x77\
-\x93\x79\xc0\xc4\xa2\x07\x59\xf7\x7d\x00\x8a\xe4\xc5\x23\x1c\xdf\
-\x58\xd2\x26\x3a\xd1\x6d\xec\x34\xaf\x1b\xe1\x98\xca\xf0\x02\xe0\
-\xd7\xc0\xfc\x2e\xdb\x7b\x03\x69\x30\xe0\x56\xc5\xcd\x12\xdd\xcf\
-\x8b\xc6\x01\x80\x22\x5c\x4f\x7c\xdf\xef\x26\x85\x57\xf8\xbd\xac\
-\x06\x8d\xed\x35\xff\x22\x6d\xe9\x38\x94\x67\xd7\xa0\x7d\x9d\xe6\
-\x21\x60\xa5\x61\x8e\x27\xb7\xbd\x81\x0b\x32\xb6\xfd\x11\xe0\xd3\
-\x34\x6b\x81\xa9\x7e\x16\xdd\xd7\x8b\xc6\x01\x80\x22\x7c\x84\xf8\
-\xbe\xdf\x4d\x0a\xbf\x3d\xf6\x3f\x35\x68\x6c\x8e\x0c\x37\x6b\xb3\
-\x89\xc7\x97\x6b\xdf\x83\x91\x4c\x26\xd5\xac\xac\xa5\x91\xa7\x91\
-\x06\x17\xaa\xb7\xe8\xbe\x5e\x34\x0e\x00\x14\xa1\xa9\xbb\xc7\xde\
-\x5c\xf4\x00\xb7\xad\x41\x63\x73\x64\x31\xb0\xcf\x10\xc7\xd7\xc4\
-\x3b\x1c\x3b\x0d\x71\x1c\x39\xbd\x90\x74\xd7\xa4\xec\xe3\x58\x08\
-\x7c\x86\x66\x2e\xbf\xdc\x2f\xa2\xfb\x7a\xd1\x38\x00\x50\x94\x3f\
-\x10\xdf\xff\xbb\xc9\xe6\x45\x0f\xf0\xc2\x1a\x34\x36\x47\x6e\x03\
-\x26\x2d\x73\x5c\x6b\xd3\xbc\x39\x0e\x57\x0d\xf7\x43\xca\x60\x12\
-\xe9\xcd\x82\xaa\x37\x44\xfa\x5f\x7c\x73\xa0\xae\xa2\xfb\x7b\xd1\
-\x38\x00\x50\x94\x57\x11\xdf\xff\xbb\xc9\xbb\x8a\x1e\xe0\x2b\x6a\
-\xd0\xd8\x5c\xf9\xee\x32\xc7\xf5\xba\x1a\xb4\xa7\xd3\x7c\x70\xd8\
-\x9f\x52\x6f\x9e\x4b\x9a\xb9\x1f\x75\x5c\xbf\xa4\xf9\xaf\x9d\xb6\
-\x51\x74\x7f\x2f\x1a\x07\x00\x8a\x32\x96\xf4\x5a\x60\xf4\x39\xd0\
-\x69\xfe\x50\xf4\x00\x07\x80\x8b\x6b\xd0\xe0\x1c\x59\x4c\xfa\xb0\
-\x03\xf8\x71\x0d\xda\xd3\x69\xdb\x37\x1a\xe9\x07\xd5\x85\x55\x80\
-\x6f\x53\x8f\x6d\x90\xdd\xd4\xa8\x7e\xa2\xfb\x44\xd1\x38\x00\x50\
-\xa4\xe3\x88\x3f\x07\x3a\xcd\x2c\x60\x5c\xd1\x03\x7c\x06\xdd\xbf\
-\x02\x56\xb7\xdc\x4a\xba\xdd\x7d\x77\x0d\xda\xd2\x49\xfe\xba\xc2\
-\x9f\x52\x67\xf6\x20\x6d\x23\x1c\x7d\x5c\xcb\xe6\xf5\x99\x8f\x51\
-\xbd\x89\xee\x0f\x45\xe3\x00\x40\x91\x9e\x4f\xfc\x39\xd0\x4d\x96\
-\x7e\x19\x1e\xd2\xb2\xb7\x64\xaf\x06\xbe\xd6\x69\x55\x6a\x6a\x13\
-\xe0\x37\xc0\x7a\xc1\xed\xe8\x54\xae\x8b\xdc\x4a\xa4\x9f\xe5\xf9\
-\xc0\x16\x99\xfe\xcc\x5c\xbe\x0b\x6c\x18\xdd\x08\x49\xea\xc0\xb9\
-\xc0\xbd\xd1\x8d\xe8\xc2\x48\x6b\xe4\x2c\x67\x02\x70\x1d\xf1\xa3\
-\x96\x7e\xcc\x42\xd2\x2b\x27\xbd\xda\x8d\xfa\x2f\x5e\xf1\xcb\x0c\
-\xc7\xa9\x3c\xa2\xfb\x42\xd1\x78\x07\x40\xd1\xbe\x45\xfc\x79\xd0\
-\x69\xae\xec\xf4\x20\x77\x27\x7d\x18\x45\x37\xbc\xdf\x72\x76\x91\
-\x1f\xce\x08\xc6\x03\x5f\xa2\x39\x3f\xbb\x5d\x7b\x3c\x5e\xe5\x11\
-\xdd\x0f\x8a\xc6\x01\x80\xa2\x35\x71\x69\xe0\x45\x8c\xb0\x3a\xeb\
-\x50\xb3\xb2\x2f\xa6\xf3\xad\x76\xd5\xbb\x5e\x2e\x70\x3b\x91\xd6\
-\x3b\xf8\x18\x69\x37\xa8\x26\xf8\x58\x74\x03\x24\xa9\x03\x17\x01\
-\x77\x46\x37\xa2\x43\xa3\x48\x5f\xea\x87\xfd\x8f\x43\xf9\x34\x1d\
-\xac\x24\xa4\x9e\x2d\x01\x4e\xee\xe2\xff\x37\x16\xf8\x1c\x69\xd0\
-\xb6\x6d\xd6\x16\x95\xef\x95\xe4\x7f\xe3\x41\x92\xca\xd2\xed\x75\
-\x3a\xda\x9e\xc3\xfd\x87\xe1\x06\x00\x73\x81\x37\x93\x6e\x1f\xa8\
-\x7c\x97\x91\xde\x58\xe8\xc4\xb6\xa4\x0f\xfe\xcf\xd0\xbc\xad\x8e\
-\x21\xf5\xbd\x83\xa2\x1b\x21\x49\x1d\x68\xe2\x00\x60\x8f\xe1\xfe\
-\xc3\x48\x0b\xb3\x5c\x44\x35\x6b\xd2\xab\xb3\x4e\x35\x06\xf8\x14\
-\x70\x39\xb0\x63\x39\xcd\xa9\xcc\x2b\xa3\x1b\x20\x49\x1d\xf8\x33\
-\xf0\x68\x74\x23\x3a\xb4\x3b\x5d\x3e\x1a\x5e\x99\xf4\x28\x20\x7a\
-\x22\x43\xdb\xf3\x8c\x82\x3f\x8f\xad\x81\xbf\xd5\xa0\xbd\xb9\x32\
-\x8f\xd4\xc7\x14\x27\xba\x0f\x14\x8d\x93\x00\x55\x17\xbf\x26\xfe\
-\x7c\xe8\x34\xdb\x0f\x75\x20\x2b\x5a\x9a\x75\x0e\x70\xd8\xe0\x1f\
-\xa0\x72\xfc\x0b\xb8\x66\x05\xff\x9b\xd1\xa4\x6d\x29\x2f\x07\x76\
-\x29\xbd\x45\xd5\x19\x07\x6c\x17\xdd\x08\x49\xea\x40\xe1\x25\x76\
-\x6b\x64\xc8\x79\x00\x45\xd6\x66\x3f\x07\x38\x36\x6f\x5b\xb4\x8c\
-\x93\x19\x79\x80\xb5\x05\x69\x85\xc0\x23\x48\xeb\x34\xb4\x4d\xe1\
-\x1d\xab\x24\xa9\x06\x4e\x23\x2d\xad\xde\x24\x43\xce\x03\x28\xba\
-\x39\xcb\x47\x80\xdb\xf3\xb5\x45\xcb\x38\x7d\x98\x7f\x3f\x0a\x78\
-\x3f\x69\x77\xc0\x61\x27\x71\xb4\x80\x6f\x02\x48\x6a\x92\x19\xc0\
-\x15\xd1\x8d\xe8\x50\xd7\x77\x00\x20\x6d\x2a\xf0\x56\x7c\x14\x90\
-\xdb\x42\xe0\x2f\x43\xfc\xfb\xa9\xc0\x59\xc0\x37\x48\xcb\xfa\xb6\
-\x99\x73\x00\x24\x35\xcd\x59\xd1\x0d\xe8\xd0\xa6\x0c\xb1\x34\x7e\
-\x27\xdb\xb3\xfe\x19\xf8\x61\xb6\xe6\x08\xd2\x84\xbe\x99\xcb\xfc\
-\xf3\x00\xf0\x4e\xe0\xef\xac\x60\x13\x87\x16\x19\x1f\xdd\x00\x49\
-\xea\xd0\x99\xd1\x0d\xe8\xc2\x72\x77\x92\x3b\xdd\x9f\xfd\x03\xc0\
-\x1d\x79\xda\x22\x9e\xd8\x89\x36\x1e\xfc\xe7\xef\x90\xb6\xf0\xed\
-\x17\x8f\x44\x37\x40\x92\x3a\x74\x3e\x30\x3b\xba\x11\x1d\x5a\xee\
-\xb5\xf1\x4e\x07\x00\x33\x81\xb7\xe7\x69\x8b\x48\x77\x55\x06\x80\
-\x43\x49\x6f\x02\x3c\x3f\xb6\x39\x21\x1e\x8a\x6e\x80\x24\x75\x68\
-\x3e\x69\x10\xd0\x24\x4f\x7f\xf2\xbf\xe8\x74\x00\x00\x69\x06\xe4\
-\xff\xf5\xde\x96\xbe\x37\x9b\xb4\xae\xf4\x69\xc0\x71\xc0\xaa\xb1\
-\xcd\x09\xe3\x92\xd3\x92\x9a\xa8\x69\xf3\x00\x96\x5b\x2e\xbe\x9b\
-\x01\x00\xa4\xd9\xe9\xf7\xf4\xd6\x96\xbe\x37\x97\xf4\x5e\x7f\x47\
-\xfb\x35\xb7\xd0\x75\xd1\x0d\x90\xa4\x2e\x9c\x17\xdd\x80\x0e\x4d\
-\x05\x26\x2e\xfb\x2f\xba\x1d\x00\x3c\x44\x5a\x20\x48\xdd\x5b\x0b\
-\x58\x2d\xba\x11\xc1\xfe\x09\xdc\x15\xdd\x08\x49\xea\xc2\x95\x34\
-\x6b\x59\xe0\x01\x60\x9b\x65\xff\x45\xb7\x03\x00\x80\x53\x80\x5f\
-\xf4\xd4\x1c\xf5\xbb\x33\xa2\x1b\x20\x49\x5d\x5a\x08\x5c\x1a\xdd\
-\x88\x0e\x3d\x61\x1e\x40\x2f\x03\x00\x80\xf7\x00\xf7\xf5\xf8\x67\
-\xa8\x7f\xfd\x3c\xba\x01\x92\xd4\x83\x0b\xa2\x1b\xd0\xa1\x27\xcc\
-\x03\xe8\x75\x00\xf0\x00\x69\x10\x20\x75\xea\x26\xe0\xc2\xe8\x46\
-\x48\x52\x0f\x9a\x36\x00\xc8\x7a\x07\x00\xe0\x44\xd2\xee\x48\x52\
-\x27\xbe\x82\x2b\x4b\x4a\x6a\xb6\x0b\x81\x45\xd1\x8d\xe8\xc0\x13\
-\x36\x5f\xcb\x31\x00\x00\x78\x37\x69\x7d\x64\xa9\x88\x7f\xe2\xab\
-\xa4\x92\x9a\x6f\x26\x70\x43\x74\x23\x3a\xb0\x16\xf0\x94\xa5\xff\
-\x90\x6b\x00\x70\x1f\xf0\xbe\x4c\x7f\x96\xda\xef\xfd\xc0\x82\xe8\
-\x46\x48\x52\x06\x97\x47\x37\xa0\x43\xff\x9e\x07\x90\x6b\x00\x00\
-\x69\x42\x57\x13\xf7\x49\x56\xb5\xfe\x17\x38\x35\xba\x11\x92\x94\
-\xc9\x95\xd1\x0d\xe8\xd0\xbf\x5f\x05\xcc\x39\x00\x80\xb4\x4c\xf0\
-\x83\x99\xff\x4c\xb5\xc7\x35\xc0\xbb\xa2\x1b\x21\x49\x19\x35\x6d\
-\x6b\xe0\x4d\x96\xfe\x26\xf7\x00\xe0\x1e\xd2\x86\x41\xd2\x93\xdd\
-\x01\xbc\x02\x98\x13\xdd\x10\x49\xca\xe8\x2a\x60\x71\x74\x23\x3a\
-\xb0\xc9\xd2\xdf\xe4\x1e\x00\x00\xfc\x98\xb4\xbe\xbd\xb4\xd4\xdd\
-\xc0\x0b\x80\xdb\xa3\x1b\x22\x49\x99\xcd\x24\x4d\x6c\x6e\x8a\x4d\
-\x96\xfe\xa6\x8c\x01\x00\xc0\x7f\xe2\x36\xaf\x4a\xae\x06\x76\x03\
-\x6e\x8c\x6e\x88\x24\x95\xa4\x49\xf3\x00\x36\x59\xfa\x9b\xb2\x06\
-\x00\x77\x02\x1f\x2a\xe9\xcf\x56\x73\x1c\x07\x3c\x93\xd4\x1f\x24\
-\xa9\xad\xae\x8d\x6e\x40\x07\x56\x67\x70\xf7\xd9\xb2\x06\x00\x00\
-\xc7\x03\x67\x96\xf8\xe7\xab\xbe\xee\x01\x5e\x4e\xba\x13\x34\x3b\
-\xb8\x2d\x92\x54\xb6\xeb\xa3\x1b\xd0\xa1\x4d\xa0\xdc\x01\xc0\x12\
-\xe0\x50\x60\x56\x89\x7f\x87\xea\xe7\x44\xd2\x72\x93\xa7\x44\x37\
-\x44\x92\x2a\xd2\xa4\xc5\x80\x00\x36\x86\x72\x07\x00\x90\x26\x7d\
-\x7d\xb4\xe4\xbf\x43\xf5\x30\x1d\xd8\x1f\x38\x90\xb4\x47\x84\x24\
-\xf5\x8b\x9b\x49\xbb\x03\x36\xc5\x26\x50\xfe\x00\x00\xe0\x7b\xf8\
-\x28\xa0\xed\x4e\x24\xad\x2e\xf5\x9b\xe8\x86\x48\x52\x80\xf9\xc0\
-\xb4\xe8\x46\x74\xa0\x92\x3b\x00\x90\x1e\x05\x1c\x06\x3c\x5a\xc1\
-\xdf\xa5\x6a\x3d\x4c\x7a\xce\x7f\x20\x70\x7f\x70\x5b\x24\x29\x52\
-\x93\xe6\x01\x54\x36\x00\x00\xb8\x0d\xf8\x54\x45\x7f\x97\xaa\xf1\
-\x7b\xe0\x69\xa4\x99\xfe\x92\xd4\xef\x9a\xf4\xaa\xf3\x54\xa8\x6e\
-\x00\x00\xf0\x6d\xe0\xfc\x0a\xff\x3e\x95\xe3\x21\xe0\x4d\xc0\xab\
-\x48\x9b\x40\x49\x92\xd2\x17\xdd\xa6\xd8\x00\xaa\x1d\x00\x2c\x06\
-\xde\x06\xcc\xad\xf0\xef\x54\x5e\x7f\x22\xed\x27\xfd\x93\xe8\x86\
-\x48\x52\xcd\x34\x69\xa5\xd3\xb5\x81\x51\x55\x0e\x00\x00\x6e\x02\
-\x3e\x53\xf1\xdf\xa9\xde\xcd\x24\x3d\xeb\xff\x0f\x5c\xd4\x47\x92\
-\x86\x72\x5b\x74\x03\x3a\x30\x1a\x58\xa3\xea\x01\x00\xc0\xd7\x81\
-\x0b\x02\xfe\x5e\x75\xe7\x4c\xd2\x7b\xfd\xc7\x91\x26\x74\x4a\x92\
-\x96\x77\x1b\xcd\xba\x46\xae\x1d\x31\x00\x58\x0c\x1c\x02\x3c\x16\
-\xf0\x77\xab\xb8\x39\xc0\xfb\x81\x17\x01\xff\x0a\x6e\x8b\x24\xd5\
-\xdd\x1c\x9a\xf5\x36\xd4\x3a\x11\x03\x00\x48\xab\x26\x7d\x3e\xe8\
-\xef\xd6\x8a\x9d\x43\x7a\xaf\xff\x28\x9a\x35\xa2\x95\xa4\x48\xb7\
-\x45\x37\xa0\x03\x21\x77\x00\x96\xfa\x2a\x70\x69\xe0\xdf\xaf\xe5\
-\xcd\x05\x3e\x06\xec\x03\xdc\x1a\xdc\x16\x49\x6a\x9a\x7b\xa2\x1b\
-\xd0\x81\x35\x23\x07\x00\x0b\x81\x37\x03\xf3\x02\xdb\xa0\xc7\x5d\
-\x04\x6c\x0f\x1c\x41\x7a\x4c\x23\x49\xea\xcc\xf4\xe8\x06\x74\x60\
-\xb5\xc8\x01\x00\xa4\x95\x93\xbe\x18\xdc\x86\x7e\xf7\x18\xe9\x5b\
-\xff\xb3\x48\x6f\x69\x48\x92\xba\xd3\xa4\xb5\x51\x26\x47\x0f\x00\
-\x20\x0d\x00\x2e\x8f\x6e\x44\x9f\xba\x04\xd8\x81\xf4\xad\x7f\x51\
-\x70\x5b\x24\xa9\xe9\x1c\x00\x74\x68\x21\x69\x81\xa0\x05\xd1\x0d\
-\xe9\x23\x0b\x80\xcf\x01\xcf\xa4\x79\xdb\x58\x4a\x52\x5d\x35\xe9\
-\x11\x40\x2d\x06\x00\x00\x57\x93\xbe\x85\xaa\x7c\xd7\x00\xbb\x02\
-\x87\xe3\xb7\x7e\x49\xca\xa9\x49\x77\x00\xc2\xe7\x00\x2c\xeb\x0b\
-\xc0\xb5\xd1\x8d\x68\xb1\xf9\xa4\x55\x18\x77\x02\xae\x0a\x6e\x8b\
-\x24\xb5\xd1\x8c\xe8\x06\x74\x60\x62\x9d\x06\x00\xf3\x48\x9b\xcc\
-\xf8\x28\x20\xbf\x6b\x81\x3d\x80\xff\x26\x3d\x72\x91\x24\xe5\x37\
-\x33\xba\x01\x1d\x98\x50\xa7\x01\x00\xc0\x95\xc0\x37\xa2\x1b\xd1\
-\x22\x0b\x49\x8f\x56\x76\x02\xae\x08\x6e\x8b\x24\xb5\x5d\x93\x06\
-\x00\x2b\x45\x37\x60\x28\xe3\x81\x7f\x90\x56\xa0\x33\xdd\xe7\x5a\
-\x60\xe7\x0e\x6b\xaf\xfe\x13\xdd\x4f\x8b\xe6\x16\x60\xdd\x92\x6a\
-\x20\xe5\x32\x8a\xb4\x8e\x4a\xf4\xf9\x52\x24\x37\x96\x54\x83\x9e\
-\xed\x4e\xfa\xf6\x1a\x5d\xa0\x26\x66\x21\xf0\x65\xd2\x40\x4a\x5a\
-\x91\xe8\xfe\xda\x49\x6e\x00\xd6\x2b\xa7\x0c\x52\x36\x33\x89\x3f\
-\x57\x8a\xa4\xd6\x7b\xbc\x7c\x9d\xf8\x02\x35\x2d\xff\x24\x2d\xe8\
-\x23\x15\x15\xdd\x67\x3b\xcd\xf5\x78\x27\x40\xf5\x76\x27\xf1\xe7\
-\x49\x91\xd4\x7a\xe3\xa2\x95\x81\x9b\x89\x2f\x52\x13\xb2\x08\xf8\
-\x1a\x35\x7d\xa6\xa3\x5a\x8b\xee\xbb\xdd\xc4\x41\x80\xea\xec\x3a\
-\xe2\xcf\x91\x22\x79\xb8\xac\x02\xe4\xb2\x27\xe9\xc3\x2d\xba\x50\
-\x75\xce\x34\xe0\x39\x5d\xd6\x57\x8a\xee\xbf\xdd\xe6\x6a\x60\xad\
-\x12\xea\x21\xf5\xea\x4a\xe2\xcf\x8f\x22\x99\x55\x56\x01\x72\xfa\
-\x36\xf1\x85\xaa\x63\x16\x03\xc7\x02\x13\xbb\x2f\xad\x14\xde\x8f\
-\x7b\xc9\x53\xe0\x0b\x99\x00\x00\x1b\x9b\x49\x44\x41\x54\x55\x38\
-\x08\x50\xfd\xfc\x8d\xf8\x73\xa3\x48\xe6\x94\x55\x80\x9c\x56\x26\
-\x3d\xdb\x8e\x2e\x56\x9d\x72\x2b\xf0\xbc\x5e\x8a\x2a\x0d\x8a\xee\
-\xcb\xbd\xe6\x2a\x60\xcd\xec\x55\x91\xba\x77\x3e\xf1\xe7\x45\x91\
-\x3c\x56\xb7\x75\x00\x86\x32\x07\x38\x94\xd4\xe0\x7e\xb7\x04\x38\
-\x0e\xd8\x0e\xf8\x73\x70\x5b\xa4\x3a\x78\x06\x70\x16\x0e\x02\x54\
-\x1f\x4d\x59\xcc\x6e\x74\x74\x03\x3a\xf1\x3d\xe2\x47\x4c\x91\xb9\
-\x1b\x78\x59\xcf\x55\x94\x9e\x28\xba\x5f\xe7\xca\x15\xc0\x1a\x99\
-\x6b\x23\x75\xe3\x0c\xe2\xcf\x87\x22\x59\x5c\x56\x01\xca\xb0\x2a\
-\x70\x3b\xf1\x45\x8b\xc8\x09\xc0\xea\xbd\x97\x50\x5a\xce\x5c\xe2\
-\xfb\x77\xae\x38\x08\x50\x1d\x9c\x4a\xfc\xb9\x50\x24\x8b\x9b\xf0\
-\x08\x60\xa9\x99\xc0\x61\xa4\x86\xf7\x8b\xbb\x81\x97\x02\x07\x02\
-\x0f\x05\xb7\x45\xed\xf4\x48\x74\x03\x32\xda\x01\x38\x13\x07\xcb\
-\x8a\xd5\x94\xfd\x56\x16\x35\x69\x00\x00\xf0\x27\xe0\x47\xd1\x8d\
-\xa8\xc8\x89\xa4\x67\xfd\xa7\x45\x37\x44\xad\x76\x77\x74\x03\x32\
-\xdb\x91\x74\xce\xac\x1a\xdd\x10\xf5\xad\x31\xd1\x0d\x28\xa8\x71\
-\x03\x00\x80\x0f\x90\x56\x5a\x6a\xab\xe9\xc0\x7e\xa4\x6f\xfd\x0f\
-\x04\xb7\x45\xed\x77\x43\x74\x03\x4a\xb0\x3b\x70\x3a\x30\x29\xba\
-\x21\xea\x4b\x4d\x99\x5c\xd7\xa8\x47\x00\x4b\x3d\x02\xbc\x3d\xba\
-\x11\x25\x39\x11\xd8\x06\x38\x29\xba\x21\xea\x1b\x6d\xdd\x25\x72\
-\x0f\xe0\x8f\xb8\x4e\x86\xaa\xd7\x98\x3b\x00\xd1\x0d\xe8\xc5\x4f\
-\x88\x9f\x44\x91\x2b\xd3\x81\xfd\xf3\x96\x47\x2a\x64\x67\xe2\xfb\
-\x7f\x99\x39\x1f\xef\x04\xa8\x5a\xe7\x10\xdf\xef\x8b\xa4\xf6\x4b\
-\x01\x8f\x64\x35\x9a\xb3\xe9\xc2\x48\x39\x05\x58\x3f\x73\x6d\xa4\
-\xa2\x46\x03\x77\x11\x7f\x1e\x94\x99\x73\x81\x55\x32\xd5\x4b\x5a\
-\x91\xbf\x12\xdf\xe7\x8b\xe4\xc1\x26\x3e\x02\x58\xea\x61\xe0\x3d\
-\xd1\x8d\xe8\xc1\x83\xc0\xeb\x49\xef\xf6\xb7\x6d\x22\x96\x9a\x63\
-\x11\xf0\x8b\xe8\x46\x94\xec\xd9\xa4\x39\x01\x3e\x0e\x50\x15\x9a\
-\x32\x07\xa0\xd1\x8f\x00\x96\xfa\x25\xf1\x23\xa9\x4e\x73\x1a\xb0\
-\x41\x19\xc5\x90\xba\xb0\x25\xfd\xb1\xe9\xd6\xd9\xa4\xa5\xc5\xa5\
-\x32\x35\x65\x33\xa0\x7b\xcb\x2a\x40\x95\xd6\x26\x3d\x43\x8f\x2e\
-\x66\x91\x3c\x04\xbc\xb9\x9c\x32\x48\x3d\xf9\x35\xf1\xe7\x47\x15\
-\x39\x0f\x1f\x07\xa8\x5c\x4d\xd9\xc6\xfe\xae\xb2\x0a\x50\xb5\x03\
-\x89\x2f\xe6\x8a\xf2\x27\x60\xa3\xb2\x0a\x20\xf5\x68\x2b\x60\x3e\
-\xf1\xe7\x49\x15\x39\x03\x58\x29\x4f\xd9\xa4\xe5\xdc\x4b\x7c\x1f\
-\x2f\x92\x1b\xcb\x2a\x40\x84\xba\x7e\x83\x79\x04\x38\x04\x18\x28\
-\xef\xd0\xa5\x2c\xbe\x46\xfc\xf9\x52\x55\x4e\x07\x26\xe4\x29\x9b\
-\xf4\x04\xb3\x88\xef\xdf\x45\x72\x79\x59\x05\x88\x30\x09\xb8\x9e\
-\xf8\xa2\x2e\x9b\xbf\x02\x9b\x97\x79\xd0\x52\x46\x13\x80\xab\x89\
-\x3f\x6f\xaa\x8a\x83\x00\xe5\x36\x8a\xb4\xc9\x4e\x74\xdf\x2e\x92\
-\x73\xcb\x29\x41\x9c\x6d\x49\xb3\xeb\xa3\x0b\x3b\x0b\x78\x27\x7e\
-\xeb\x57\xf3\x6c\x4b\xda\x77\x23\xfa\x1c\xaa\x2a\xa7\x00\xe3\xb3\
-\x54\x4e\x4a\x5f\x44\xa3\xfb\x74\xd1\x9c\x5c\x52\x0d\x42\xed\x41\
-\xec\x2d\x98\xf3\x80\x4d\x4b\x3f\x4a\xa9\x3c\xcf\x03\xe6\x11\x7f\
-\x81\xaa\x2a\x7f\xc4\x41\x80\xf2\xd8\x80\xf8\xfe\x5c\x34\xad\x7d\
-\xfd\x77\x67\xaa\x9f\x88\x31\x07\xf8\x28\xe9\x16\x90\xd4\x74\xaf\
-\x25\xed\x6a\x16\x7d\x91\xaa\x2a\xbf\x03\xc6\x65\xa9\x9c\xfa\xd9\
-\xf6\xc4\xf7\xe5\xa2\x39\xb6\xa4\x1a\xd4\xc2\x54\xe0\x52\xaa\x29\
-\xe4\x05\xc0\x16\xd5\x1c\x96\x54\x99\x03\x81\x05\xc4\x5f\xa8\xaa\
-\xca\xa9\x78\x27\x40\xbd\xd9\x87\xf8\x7e\x5c\x34\x5f\x2b\xa9\x06\
-\xb5\x31\x0e\xf8\x0a\xe5\xbd\xde\xf4\x28\xf0\x21\x9a\xb3\xf2\x93\
-\xd4\xa9\xd7\xd0\x5f\x83\x80\xdf\x00\x63\xb3\x54\x4e\xfd\xe8\x75\
-\xc4\xf7\xe1\xa2\x39\xbc\x9c\x12\xd4\xcf\xb6\xa4\x19\xbf\xb9\x0a\
-\xb7\x90\xb4\x19\xd1\x86\x55\x1e\x84\x14\xe4\x20\xfa\xeb\x71\xc0\
-\xaf\x71\x10\xa0\xee\xbc\x8f\xf8\xfe\x5b\x34\x1f\x2a\xa9\x06\xb5\
-\xb5\x1b\x69\xe2\xc3\x5c\xba\x2b\xd8\x0c\xe0\x68\x60\xb3\xaa\x1b\
-\x2e\x05\x7b\x0b\xfd\xb1\x5c\xf0\xd2\x9c\x48\x73\xb6\x75\x55\x7d\
-\x7c\x81\xf8\xbe\x5b\x34\x07\x97\x54\x83\xda\x5b\x9d\xb4\x24\xef\
-\x2f\x81\x5b\x19\xfe\xc2\xf6\x08\x70\x31\x70\x24\xf0\x62\xfc\x56\
-\xa0\xfe\x76\x30\x0e\x02\xa4\x91\x1c\x4b\x7c\xbf\x2d\x9a\x97\x94\
-\x54\x83\xc6\x19\x4f\x9a\x34\xb8\x1d\xb0\x13\x69\x42\xdf\x3a\xa1\
-\x2d\x92\xea\xe9\xad\xf4\xd7\x20\xe0\x57\x38\x08\x50\x71\x7f\x20\
-\xbe\xcf\x16\xcd\x4e\x25\xd5\x40\x52\x8b\xbd\x0d\x07\x01\xd2\x50\
-\x9a\xb4\x92\xe6\xfa\x25\xd5\x40\x52\xcb\x1d\x42\x73\x96\x3c\xcd\
-\x91\x5f\xe0\xdb\x3e\x5a\xb1\x87\x89\xef\xab\x45\xb2\x18\x1f\x69\
-\x4b\xea\xc1\xa1\xf4\xd7\x20\xe0\x47\xb8\xd0\x97\x86\xb7\x2a\xf1\
-\x7d\xb4\x68\x66\x94\x54\x03\x49\x7d\xe4\x30\xfa\x6b\x10\xf0\x43\
-\x1c\x04\x68\x68\x4f\x27\xbe\x7f\x16\xcd\xb5\x25\xd5\x40\x52\x9f\
-\x69\xd2\xbb\xcf\x39\x72\x3c\x0e\x02\xb4\xbc\x97\x11\xdf\x37\x8b\
-\xe6\x6c\xb0\x13\x4b\xea\xdd\x51\xc0\x7f\x45\x37\xa2\x42\x6f\x05\
-\x8e\xc3\xeb\xa7\x9e\x68\x4a\x74\x03\x3a\x30\x1d\xec\xc0\x92\xf2\
-\xf8\x26\xf0\x81\xe8\x46\x54\xe8\x6d\xa4\x77\xbe\xdd\xf2\x5b\x4b\
-\x35\x69\x3f\x98\xbb\xa3\x1b\x20\xa9\x7d\x3e\x40\xfc\xed\xcd\x2a\
-\x73\x1c\x0e\x02\x94\xfc\x91\xf8\xfe\x58\x34\xef\x2e\xa9\x06\x92\
-\xfa\xdc\x07\x89\xbf\xc0\x55\x19\xef\x04\x08\xd2\xaa\xb2\xd1\x7d\
-\xb1\x68\x5c\x05\x50\x52\x69\x3e\x44\xfc\x45\xae\xca\x7c\x33\x4f\
-\xd9\xd4\x50\x13\x68\xd6\x86\x59\x5b\x95\x53\x06\x49\x4a\x3e\x4c\
-\xfc\x85\xae\xca\x7c\x23\x4f\xd9\xd4\x40\x4d\x7a\x05\x70\x31\xb0\
-\x52\x39\x65\x90\xa4\xc7\x1d\x4e\xfc\x05\xaf\xca\x7c\x3d\x4b\xd5\
-\xd4\x34\x07\x10\xdf\xf7\x8a\xe6\xae\x92\x6a\x20\x49\xcb\xf9\x1c\
-\xf1\x17\xbd\x2a\xf3\xb5\x3c\x65\x53\x83\x7c\x96\xf8\x7e\x57\x34\
-\xe7\x97\x54\x03\x49\x1a\xd2\xe7\x89\xbf\xf0\x55\x99\x23\xf3\x94\
-\x4d\x0d\xf1\x3b\xe2\xfb\x5c\xd1\xfc\x5f\x49\x35\x90\xa4\x61\xfd\
-\x37\xf1\x17\xbf\x2a\xf3\xd5\x3c\x65\x53\x03\xdc\x4e\x7c\x7f\x2b\
-\x9a\xc3\xcb\x29\x81\x24\x8d\xec\x0b\xc4\x5f\x00\xab\xcc\x11\x79\
-\xca\xa6\x1a\x5b\x83\xf8\x7e\xd6\x49\xde\x54\x4e\x19\x24\x69\xc5\
-\xfe\x87\xf8\x8b\x60\x95\x39\x3c\x4b\xd5\x54\x57\xcf\x27\xbe\x8f\
-\x75\x92\x9d\xcb\x29\x83\x24\x15\xf3\x25\xe2\x2f\x84\x55\xe6\x33\
-\x79\xca\xa6\x1a\x6a\xd2\x9a\x17\x8b\x80\x55\xca\x29\x83\x24\x15\
-\xf7\x65\xe2\x2f\x88\x55\xe6\xd3\x79\xca\xa6\x9a\xf9\x29\xf1\x7d\
-\xab\x68\x6e\x2a\xa9\x06\x92\xd4\xb1\x23\x88\xbf\x28\x56\x99\x4f\
-\xe5\x29\x9b\x6a\xe4\x16\xe2\xfb\x55\xd1\xfc\xb6\xa4\x1a\x48\x52\
-\xc7\x06\x80\x6f\x11\x7f\x61\xac\x32\x9f\xc8\x52\x39\xd5\xc1\x3a\
-\xc4\xf7\xa7\x4e\xf2\xb9\x72\xca\x20\x49\xdd\x19\x00\xbe\x4d\xfc\
-\xc5\xb1\xca\x7c\x3c\x4b\xe5\x14\x6d\x5f\xe2\xfb\x52\x27\x39\xa0\
-\x9c\x32\x48\x52\xf7\x06\x80\xa3\x89\xbf\x40\x56\x99\x8f\x65\xa9\
-\x9c\x22\x7d\x85\xf8\x7e\xd4\x49\xdc\x04\x48\x52\x2d\x0d\x00\xdf\
-\x21\xfe\x22\x59\x65\x3e\x9a\xa5\x72\x8a\x72\x3e\xf1\x7d\xa8\x68\
-\x1e\x03\xc6\x94\x53\x06\x49\xea\xdd\x00\xf0\x5d\xe2\x2f\x96\x55\
-\x65\x31\xf0\xde\x2c\x95\x53\xd5\xc6\x01\x73\x89\xef\x43\x45\x73\
-\x65\x39\x65\x90\xa4\x7c\x06\x80\x63\x88\xbf\x60\x56\x39\x08\x78\
-\x77\x96\xca\xa9\x4a\x7b\x11\xdf\x77\x3a\xc9\x0f\xca\x29\x83\x24\
-\xe5\x35\x00\x7c\x8f\xf8\x8b\x66\x95\x83\x80\x77\x65\xa9\x9c\xaa\
-\xf2\x59\xe2\xfb\x4d\x27\x39\xa4\x9c\x32\x48\x52\x7e\xa3\x80\x1f\
-\x13\x7f\xe1\xac\x72\x10\x70\x68\x96\xca\xa9\x0a\x7f\x21\xbe\xcf\
-\x74\x92\xa7\x97\x53\x06\x49\x2a\xc7\x68\xd2\xf6\xa5\xd1\x17\xcf\
-\xaa\xb2\x08\x78\x75\x96\xca\xa9\x4c\xab\x00\xf3\x88\xef\x2f\x45\
-\xf3\x28\x4e\x00\x94\xd4\x40\xa3\x81\x9f\x11\x7f\x11\xad\x2a\x73\
-\x80\x1d\xb2\x54\x4e\x65\x79\x09\xf1\xfd\xa4\x93\x9c\x33\xd4\x41\
-\x8c\xca\x51\x09\x49\x2a\xd1\x22\xd2\x16\xa6\x3f\x8d\x6e\x48\x45\
-\x56\x02\x4e\x00\x26\x45\x37\x44\xc3\x7a\x7e\x74\x03\x3a\x74\x49\
-\x74\x03\x24\xa9\x17\xfd\x76\x27\xe0\xc8\x3c\x65\x53\x09\xae\x26\
-\xbe\x7f\x74\x92\xfd\xca\x29\x83\x24\x55\x67\x0c\x70\x22\xf1\x17\
-\xd4\x2a\x32\x0f\xd8\x32\x4f\xd9\x94\xd1\x14\xd2\x84\xcd\xe8\xfe\
-\xd1\x49\x36\x28\xa5\x12\x92\x54\xb1\xd1\xc0\x2f\x88\xbf\xa8\x56\
-\x91\x1f\x67\xaa\x99\xf2\x79\x27\xf1\xfd\xa2\x93\xdc\x59\x4e\x19\
-\x24\x29\xc6\x58\xd2\xd6\xa6\xd1\x17\xd7\xb2\x33\x1f\xd8\x30\x53\
-\xcd\x94\xc7\xe9\xc4\xf7\x8b\x4e\xf2\xb3\xe1\x0e\xc4\x49\x80\x92\
-\x9a\x68\x01\xf0\x1a\xe0\x77\xd1\x0d\x29\xd9\x58\xe0\x75\xd1\x8d\
-\xd0\xbf\x4d\x04\x9e\x1d\xdd\x88\x0e\x9d\x13\xdd\x00\x49\x2a\xc3\
-\x38\xe0\x0f\xc4\x7f\xcb\x2a\x33\x97\x65\xab\x96\x7a\xb5\x1f\xf1\
-\xfd\xa1\xd3\x6c\x56\x4a\x25\x24\xa9\x06\xc6\x01\xbf\x27\xfe\x42\
-\x5b\x56\x16\x03\x6b\x64\xab\x96\x7a\x71\x3c\xf1\xfd\xa1\x93\xdc\
-\x3e\xd2\xc1\xf8\x08\x40\x52\xd3\xcd\x07\x0e\x04\x4e\x8b\x6e\x48\
-\x49\x06\x80\x3d\xa3\x1b\x21\xc6\x00\x2f\x8f\x6e\x44\x87\xce\x1e\
-\xe9\x3f\x3a\x00\x90\xd4\x06\xf3\x80\x7d\x81\x53\xa2\x1b\x52\x92\
-\xad\xa2\x1b\x20\xf6\x01\xd6\x8e\x6e\x44\x87\xce\x19\xe9\x3f\x3a\
-\x00\x90\xd4\x16\xf3\x81\x03\x80\x33\xa2\x1b\x52\x02\x9f\xe3\xc6\
-\x7b\x4d\x74\x03\xba\x30\xe2\x00\x40\x92\xda\x66\x3c\x70\x2a\xf1\
-\xcf\x5f\x73\xe6\x57\x59\x2b\xa4\x4e\x8d\x03\x1e\x20\xbe\x1f\x74\
-\x92\x1b\x57\x74\x50\xde\x01\x90\xd4\x36\xf3\x80\xfd\x59\xc1\xf3\
-\xcf\x86\x99\x18\xdd\x80\x3e\xf7\x22\x9a\x37\x11\x73\x85\xdf\xfe\
-\x1d\x00\x48\x6a\xa3\xb9\xc0\x2b\x80\x3f\x47\x37\x24\x93\xc7\xa2\
-\x1b\xd0\xe7\x0e\x8a\x6e\x40\x17\xda\x3a\x29\x56\x92\x0a\x59\x99\
-\xf4\x4d\x28\xfa\x76\x6c\xaf\xf9\x51\xee\xc2\xa8\xb0\x55\x80\x99\
-\xc4\xf7\x81\x4e\x32\x77\xb0\xdd\x23\xf2\x0e\x80\xa4\x36\x9b\x03\
-\xbc\x94\xe6\x4f\x86\x1a\xf1\x7d\x6e\x95\x6a\x7f\x9a\xb7\x35\xf3\
-\xd9\xc0\xec\x15\xfd\x8f\x1c\x00\x48\x6a\xbb\x39\xa4\xc7\x01\xe7\
-\x47\x37\xa4\x07\x37\x47\x37\xa0\x8f\x1d\x1c\xdd\x80\x2e\xb4\xf5\
-\x75\x58\x49\xea\xca\x2a\xc0\xb9\xc4\xdf\x9e\xed\x26\x9b\xe7\x2f\
-\x87\x0a\x98\x4a\xf3\xb6\xfe\x5d\x02\x6c\x5c\x46\x31\x24\xa9\xc9\
-\x26\x01\x17\x12\x7f\x81\xee\x24\x77\x94\x52\x09\x15\xf1\x79\xe2\
-\x7f\xfe\x9d\xe6\xca\xa2\x07\xe7\x23\x00\x49\xfd\x64\x16\xf0\x62\
-\xe0\xe2\xe8\x86\x74\xe0\xb7\xd1\x0d\xe8\x53\xa3\x80\x37\x45\x37\
-\xa2\x0b\x27\x47\x37\x40\x92\xea\x6c\x32\x70\x09\xf1\xdf\xd6\x8a\
-\x64\xb7\x92\x6a\xa0\x91\xbd\x80\xf8\x9f\xbd\xfd\x45\x92\x4a\xd0\
-\x84\x41\x40\x93\xee\x54\xb4\xcd\x49\xc4\xff\xfc\x3b\xcd\x3d\x78\
-\x67\x5f\x92\x0a\x59\x1d\xb8\x8c\xf8\x0b\xf7\x70\x79\x59\x79\x87\
-\xae\x11\x4c\x01\x16\x12\xff\xf3\xef\x34\xdf\x2a\xa3\x18\x92\xd4\
-\x56\xab\x01\x7f\x23\xfe\xe2\xfd\xe4\x9c\x55\xe6\x41\x6b\x44\x5f\
-\x22\xfe\xe7\xdf\x4d\xdc\x36\x5a\x92\x3a\xb4\x06\x69\xf6\x74\xf4\
-\x05\x7c\x69\x66\x03\x4f\x2b\xf5\x88\x35\x9c\xf1\xc0\x7d\xc4\xf7\
-\x81\x4e\xf3\x2f\x60\xa0\x84\x7a\x48\x52\xeb\xad\x46\x7d\x1e\x07\
-\xbc\xad\xe4\x63\xd5\xf0\xde\x42\xfc\xcf\xbf\x9b\x1c\x51\x42\x2d\
-\x24\xa9\x6f\xac\x05\x5c\x4d\xec\x85\xfc\x98\xd2\x8f\x52\x23\xa9\
-\xe3\xe3\xa0\x22\xd9\xb1\x8c\x62\x48\x52\x3f\x59\x9b\xb8\x41\xc0\
-\x6f\x80\xd1\xe5\x1f\xa2\x86\xb1\x37\xf1\x1f\xe4\xdd\xc4\xa5\xa2\
-\x25\x29\x93\x89\xc0\x9f\xa8\xf6\x22\x7e\x3c\x30\xb6\x8a\x83\xd3\
-\xb0\x4e\x25\xfe\xc3\xbc\x9b\x1c\x5e\x42\x2d\x24\xa9\x6f\x8d\x07\
-\xbe\x41\xf9\x6b\xc1\xcf\x01\xde\x5d\xd1\x31\x69\x78\x5b\xd1\xcc\
-\x75\xff\x97\x00\x5b\x97\x50\x0f\x49\xea\x7b\x2f\x22\xdd\x62\x2d\
-\xe3\xc2\x7d\x01\xb0\x6d\x75\x87\xa2\x11\xfc\x98\xf8\x0f\xf2\x6e\
-\x72\x45\x19\xc5\x90\x24\x25\xe3\x81\x0f\x00\x77\x91\xe7\xa2\xfd\
-\x77\xe0\x20\x7c\x6d\xab\x2e\x36\x04\xe6\x11\xff\x61\xde\x4d\xde\
-\x55\x42\x3d\x24\x49\x4f\x32\x0e\x78\x03\xe9\x59\xf1\x7c\x3a\xbb\
-\x50\x3f\x02\xfc\x84\x74\x47\xc1\x0f\xfe\x7a\xf9\x06\xf1\x1f\xe4\
-\xdd\x64\x2e\x69\x35\xcb\xae\xd8\x09\x25\xa9\x3b\x13\x81\x67\x92\
-\x36\x5f\xd9\x92\xb4\x07\xfb\xc4\xc1\x3c\x4c\xda\x79\xf0\x16\xe0\
-\x46\xd2\xad\xfe\xcb\x48\x83\x06\xd5\xcb\x5a\xc0\x34\xd2\x56\xd1\
-\x4d\xf3\x33\xd2\x80\x54\x92\x24\x75\xe8\x6b\xc4\x7f\x93\xef\x36\
-\xcf\x2d\xa1\x1e\x92\x24\xb5\xde\x7a\xa4\x65\x97\xa3\x3f\xc8\xbb\
-\xc9\x34\x7a\xbc\x8b\xef\xb6\x81\x92\xa4\x7e\xf5\x71\x60\xe5\xe8\
-\x46\x74\xe9\x07\xa4\x81\x80\x24\x49\xea\xc0\xfa\xa4\x35\x18\xa2\
-\xbf\xc9\x77\x93\x05\x83\xed\x97\x24\x49\x1d\x3a\x86\xf8\x0f\xf2\
-\x6e\x73\x72\x09\xf5\x90\x24\xa9\xf5\x36\xa7\xb9\xef\xfd\x2f\x01\
-\x5e\x9c\xbf\x24\x92\x24\xb5\xdf\x6f\x88\xff\x10\xef\x36\x37\xe2\
-\x2b\xfc\x92\x24\x75\x6c\x77\x9a\xbb\xe6\xff\x12\xe0\xed\xf9\x4b\
-\x22\x49\x52\xbb\x0d\x00\xe7\x13\xff\x21\xde\x6d\x1e\x04\x56\xc9\
-\x5e\x15\x49\x92\x5a\xee\x40\xe2\x3f\xc4\x7b\xc9\x11\xf9\x4b\x22\
-\x49\x52\xbb\x8d\xa3\xbc\x5d\x1d\xab\xc8\x42\x60\x6a\xf6\xaa\x48\
-\x92\xd4\x72\x1f\x23\xfe\x43\xbc\x97\x9c\x90\xbf\x24\x92\x24\xb5\
-\xdb\x86\xa4\xcd\x99\xa2\x3f\xc4\x7b\xc9\x33\xb3\x57\x45\x92\xa4\
-\x96\x3b\x91\xf8\x0f\xf0\x5e\x72\x71\xfe\x92\xc0\x98\x32\xfe\x50\
-\x65\xb3\x0a\xb0\x2e\xb0\xda\xe0\x3f\xcf\x03\x66\x00\xf7\x86\xb5\
-\x48\x92\x9a\xe5\x05\xc0\xfe\xd1\x8d\xe8\xd1\x17\xa3\x1b\xa0\xf2\
-\x6d\x02\xbc\x93\xb4\x48\xc5\xad\x0c\xff\xae\xea\x2c\xe0\x12\xe0\
-\x48\xd2\x8a\x50\x63\x03\xda\x2a\x49\x75\x37\x0e\xb8\x81\xf8\x6f\
-\xf0\xbd\xe4\x6a\x5c\xf8\xa7\xb5\x46\x01\x07\x00\x7f\x06\x16\xd1\
-\x5d\x07\xb9\x1f\xf8\x06\x30\xa5\xe2\xb6\x4b\x52\x9d\x7d\x9c\xf8\
-\x0f\xf0\x5e\xf3\x9a\xec\x55\x51\x2d\xbc\x0c\xf8\x07\xf9\x3a\xca\
-\x7c\xe0\x7b\xc0\x9a\x55\x1e\x84\x24\xd5\xd0\x16\x34\x77\xb7\xbf\
-\xa5\xb9\x01\x18\x9d\xbb\x30\x8a\xb5\x16\xe5\x4e\x4a\x99\x01\xbc\
-\xb6\xb2\xa3\x91\xa4\x7a\x19\x05\x9c\x47\xfc\x07\x78\xaf\x79\x4b\
-\xe6\xba\x28\xd8\x6e\xc0\xed\x54\xd3\x79\x8e\x23\x3d\x03\x93\xa4\
-\x7e\xf2\x0e\xe2\x3f\xbc\x7b\xcd\xad\x38\xbf\xab\x55\xfe\x83\xea\
-\x6f\x49\x9d\x0d\x4c\xaa\xe2\xe0\x24\xa9\x06\x36\x00\x1e\x26\xfe\
-\x03\xbc\xd7\xbc\x23\x77\x61\x14\xe7\xa5\xc4\xed\x3f\x7d\x2e\x30\
-\xa1\xf4\x23\x94\xa4\x78\xa7\x12\xff\xe1\xdd\x6b\xee\xc0\x6b\x76\
-\x6b\xec\x48\xfc\x2a\x54\x27\xe0\xab\x24\x92\xda\xed\xcd\xc4\x7f\
-\x78\xe7\xc8\xa1\xb9\x0b\xa3\x18\x93\x49\xcf\x72\xa2\x3b\xd4\x12\
-\xe0\x7d\x25\x1f\xab\x24\x45\x99\x0a\x3c\x42\xfc\x75\xb6\xd7\xdc\
-\x88\x8b\xf4\xb5\xc6\x8f\x88\xef\x50\x4b\xf3\x18\xb0\x7d\xb9\x87\
-\x2b\x49\x95\x1b\x0d\xfc\x85\xf8\x6b\x6c\x8e\x34\x7d\xd5\x42\x0d\
-\xda\x83\xe1\x57\xf3\x8b\xca\x75\xc0\xca\x65\x1e\xb4\x24\x55\xec\
-\x93\xc4\x5f\x5b\x73\xe4\x52\x7c\x54\xdb\x1a\x17\x12\xdf\xa1\x86\
-\xca\xf7\xca\x3c\x68\x49\xaa\xd0\xce\xa4\x45\xd0\xa2\xaf\xab\x39\
-\xb2\x4f\xe6\xda\x28\xc8\x5e\xc4\x77\xa6\x91\xf2\xaa\xf2\x0e\x5d\
-\x92\x2a\xb1\x32\xcd\x5f\xeb\x7f\x69\xce\xcc\x5c\x1b\x05\xfa\x15\
-\xf1\x1d\x6a\xa4\xcc\x20\xbd\x2f\x2b\x49\x4d\xf5\x23\xe2\xaf\xa5\
-\x39\xb2\x18\xd8\x25\x73\x6d\x14\x64\x15\x60\x36\xf1\x9d\x6a\x45\
-\x39\x07\xd7\x99\x96\xd4\x4c\x07\x13\x7f\x0d\xcd\x95\x5f\x65\xae\
-\x8d\x02\xed\x4b\x7c\x87\x2a\x1a\xf7\x99\x96\xd4\x34\xdb\xd2\x8c\
-\x2f\x59\x45\x32\x07\xd8\x38\x6f\x79\x14\xe9\x48\xe2\x3b\x55\xd1\
-\x2c\xc6\xf9\x00\x92\x9a\x63\x15\xf2\xee\xa2\x1a\x9d\xcf\xe6\x2d\
-\x8f\xa2\x9d\x4b\x7c\xa7\xea\x24\x0f\x00\x9b\x94\x50\x07\x49\xca\
-\xed\xa7\xc4\x5f\x33\x73\xe5\x76\x7c\x2d\xbb\x75\xee\x20\xbe\x63\
-\x75\x9a\xbf\x01\xe3\xcb\x28\x86\x24\x65\xf2\x2e\xe2\xaf\x95\x39\
-\x73\x60\xde\xf2\x28\xda\x18\x60\x21\xf1\x1d\xab\x9b\x1c\x5f\x42\
-\x3d\x24\x29\x87\xe7\xd0\x9e\xf7\xfd\x97\x90\xee\x14\xab\x65\x26\
-\x12\xdf\xb1\x7a\xc9\x7b\xf3\x97\x44\x92\x7a\xb2\x31\x30\x9d\xf8\
-\xeb\x63\xae\x2c\x04\x9e\x91\xb5\x42\xaa\x85\x55\x89\xef\x5c\xbd\
-\x64\x01\xf0\xbc\xec\x55\x91\xa4\xee\xac\x02\x5c\x49\xfc\xb5\x31\
-\x67\xbe\x9b\xb5\x42\xaa\x8d\x31\xc0\x22\xe2\x3b\x58\x2f\x99\x01\
-\x6c\x9a\xbb\x30\x92\xd4\xa1\x01\xea\xbf\xa8\x5a\xa7\x99\x0e\xac\
-\x99\xb3\x48\xaa\x97\xfb\x89\xef\x64\xbd\xe6\xef\xa4\xad\x8c\x25\
-\x29\xca\xa7\x89\xbf\x16\xe6\xce\x1b\xb2\x56\x48\xb5\x73\x09\xf1\
-\x9d\x2c\x47\xce\x00\xc6\x66\xae\x8d\x24\x15\xf1\x06\xea\xb7\x9b\
-\x6a\xaf\x39\x3d\x6b\x85\x54\x4b\xc7\x10\xdf\xd1\x72\xc5\x37\x03\
-\x24\x55\x6d\x6f\xe0\x31\xe2\xaf\x7f\x39\x33\x1b\x1f\xad\xf6\x85\
-\x37\x12\xdf\xd9\x72\xe6\x93\x79\xcb\x23\x49\xc3\xda\x0a\x78\x90\
-\xf8\xeb\x5e\xee\x7c\x20\x67\x91\x54\x5f\x6b\xd1\xdc\xb5\x00\x86\
-\xca\x62\xe0\xf5\x59\x2b\x24\x49\xcb\x5b\x17\xb8\x95\xf8\x6b\x5e\
-\xee\x5c\x86\x1b\xaf\xf5\x95\xb3\x88\xef\x74\x39\x33\x1f\x78\x71\
-\xd6\x0a\x49\xd2\xe3\x56\x25\x7d\x50\x46\x5f\xeb\x72\x67\x01\xb0\
-\x43\xc6\x3a\xa9\x01\x5e\x4d\x7c\xc7\xcb\x9d\x39\xc0\x5e\x39\x8b\
-\x24\x49\xc0\x4a\xa4\xed\xc9\xa3\xaf\x71\x65\xe4\x88\x8c\x75\x52\
-\x43\x8c\x05\x6e\x22\xbe\xf3\xe5\xce\x03\xc0\x36\x19\xeb\x24\xa9\
-\xbf\x8d\x05\x4e\x21\xfe\xda\x56\x46\xae\x23\x0d\x6e\xd4\x87\x0e\
-\x22\xbe\x03\x96\x91\x3b\x71\xf7\x40\x49\xbd\x1b\x05\xfc\x82\xf8\
-\x6b\x5a\x19\x99\x0f\xec\x94\xaf\x54\x6a\x9a\x01\xe0\xcf\xc4\x77\
-\xc4\x32\x72\x0b\xb0\x51\xbe\x52\x49\xea\x33\x03\xc0\xb1\xc4\x5f\
-\xcb\xca\xca\xa7\xf3\x95\x4a\x4d\x35\x15\x98\x45\x7c\x67\x2c\x23\
-\x37\x01\xeb\xe7\x2b\x95\xa4\x3e\x31\x00\x7c\x83\xf8\x6b\x58\x59\
-\xb9\x98\xb4\x2c\xbc\xc4\x5b\x88\xef\x90\x65\xe5\x46\x60\xbd\x6c\
-\x95\x92\xd4\x76\x03\xc0\x37\x89\xbf\x76\x95\x95\xd9\xc0\x16\xd9\
-\xaa\xa5\x56\xf8\x39\xf1\x1d\xb3\xac\x5c\x0b\xac\x9d\xaf\x54\x92\
-\x5a\xaa\xed\x1f\xfe\x4b\x80\x77\x66\xab\x96\x5a\x63\x32\x30\x8d\
-\xf8\xce\x59\x56\xae\xc7\xc7\x01\x92\x86\xd7\x0f\x1f\xfe\x67\x0c\
-\x1e\xa7\xb4\x9c\x3d\x48\x8b\x42\x44\x77\xd2\xb2\x72\x23\xb0\x61\
-\xb6\x6a\x49\x6a\x8b\x01\xe0\x28\xe2\xaf\x51\x65\x66\x3a\x7e\x09\
-\xd2\x0a\x7c\x8a\xf8\x8e\x5a\x66\x6e\x03\x36\xcb\x55\x2c\x49\x8d\
-\x37\x1a\x38\x8e\xf8\x6b\x53\x99\x59\x84\x2b\xa5\xaa\x80\x51\xb4\
-\x77\xc5\xab\xa5\xf9\x17\x4e\x82\x91\x04\xe3\x81\x5f\x13\x7f\x4d\
-\x2a\x3b\xff\x93\xab\x60\x6a\xbf\x0d\x80\x19\xc4\x77\xda\x32\x33\
-\x03\xd8\x3d\x57\xc1\x24\x35\xce\x2a\xc0\xe9\xc4\x5f\x8b\xca\xce\
-\xb9\xf8\xca\x9f\x3a\xf4\x4a\xd2\x2e\x7b\xd1\x9d\xb7\xcc\xcc\x04\
-\xf6\xc9\x55\x30\x49\x8d\xb1\x06\xe9\x5d\xf8\xe8\x6b\x50\xd9\xb9\
-\x17\x9f\xfb\xab\x4b\x5f\x24\xbe\x03\x97\x9d\x79\xa4\x25\x91\x25\
-\xf5\x87\x29\xa4\x57\x83\xa3\xaf\x3d\x65\x67\x11\x7e\xc1\x51\x0f\
-\x46\x93\x5e\x1b\x89\xee\xc8\x55\x9c\x28\xef\xcd\x54\x33\x49\xf5\
-\xb5\x23\x70\x37\xf1\xd7\x9c\x2a\x72\x78\x9e\x92\xa9\x9f\xad\x09\
-\xdc\x4a\x7c\x67\xae\x22\x47\x91\x06\x3d\x92\xda\xe7\x25\xb4\x77\
-\xd9\xf3\x27\xe7\x2c\xbc\x96\x29\x93\x67\x90\x96\x8f\x8c\xee\xd4\
-\x55\xe4\x74\x60\xd5\x3c\x65\x93\x54\x13\x6f\xa3\xdd\x6b\x9c\x2c\
-\x9b\x5b\x71\xe5\x53\x65\xf6\x66\xe2\x3b\x76\x55\xb9\x12\x17\x0c\
-\x92\xda\x60\x14\xf0\x15\xe2\xaf\x29\x55\x65\x16\xb0\x5d\x96\xca\
-\x49\x4f\xf2\x1d\xe2\x3b\x78\x55\xb9\x0b\xd8\x35\x4f\xd9\x24\x05\
-\x58\x0d\x38\x95\xf8\x6b\x49\x55\x59\x0c\xec\x97\xa5\x72\xd2\x10\
-\xc6\x02\x7f\x21\xbe\xa3\x57\x95\xc7\x48\xb7\x0e\x25\x35\xcb\x16\
-\xc0\x75\xc4\x5f\x43\xaa\xcc\x67\xb3\x54\x4e\x1a\xc1\xba\xa4\xe5\
-\x74\xa3\x3b\x7b\x95\x39\x96\x34\xf8\x91\x54\x7f\x2f\x01\x1e\x22\
-\xfe\xba\x51\x65\x4e\x22\x3d\xee\x90\x4a\xb7\x2d\xf0\x08\xf1\x9d\
-\xbe\xca\x9c\x0b\xac\x93\xa1\x76\x92\xca\x31\x40\xda\xcb\x64\x11\
-\xf1\xd7\x8b\x2a\x73\x0d\x30\x31\x43\xfd\xa4\xc2\x5e\x44\xff\xcc\
-\xaa\x5d\x9a\x3b\x81\xbd\x72\x14\x4f\x52\x56\x6b\x01\xa7\x11\x7f\
-\x8d\xa8\x3a\xf7\x03\x53\x33\xd4\x4f\xea\xd8\xdb\x88\x3f\x01\xaa\
-\xce\x02\xd2\x02\x1b\xde\x6e\x93\xea\x61\x17\xfa\x67\xad\x92\x65\
-\x33\x07\x78\x66\x86\xfa\x49\x5d\x3b\x92\xf8\x13\x21\x22\x67\x02\
-\x4f\xc9\x50\x3f\x49\xdd\x19\x00\xde\x47\x5a\xce\x3b\xfa\x7a\x50\
-\x75\x16\xe1\x8c\x7f\xd5\xc0\x28\xe0\xb7\xc4\x9f\x10\x11\xb9\x1d\
-\xd8\xbb\xf7\x12\x4a\xea\xd0\x5a\xc0\x1f\x88\xbf\x06\x44\xe5\xdd\
-\xbd\x97\x50\xca\x63\x25\xfa\x63\x67\xad\xa1\xb2\x98\xb4\x84\xf0\
-\xb8\x9e\xab\x28\xa9\x88\x17\x90\xe6\xe3\x44\x9f\xfb\x51\x39\xa2\
-\xf7\x12\x4a\x79\xad\x0b\xdc\x4c\xfc\xc9\x11\x95\x4b\x80\xa7\xf6\
-\x5c\x45\x49\xc3\x59\x09\x38\x9a\xf6\x6f\x53\x3e\x52\x7e\x4e\x7a\
-\xf4\x21\xd5\xce\x54\xfa\x7b\x64\x3e\x0b\x38\x14\x4f\x50\x29\xb7\
-\x9d\xe8\xbf\x85\x7d\x9e\x9c\x73\x80\xf1\xbd\x16\x52\x2a\xd3\x36\
-\xc0\x0c\xe2\x4f\x96\xc8\x9c\x0e\x6c\xd4\x6b\x21\x25\x31\x96\xf4\
-\x6e\xff\x7c\xe2\xcf\xeb\xc8\x5c\x43\x5a\xda\x58\xaa\xbd\x5d\x80\
-\x99\xc4\x9f\x34\x91\x79\x04\x38\x0c\xef\x06\x48\xdd\xda\x0e\xb8\
-\x8c\xf8\x73\x39\x3a\x37\x03\xeb\xf5\x58\x4b\xa9\x52\xfb\x90\xd6\
-\xd2\x8f\x3e\x79\xa2\x73\x3a\xb0\x71\x8f\xb5\x94\xfa\xc9\x04\xe0\
-\x8b\xf4\xdf\x42\x63\x43\xe5\x56\xbc\x9b\xa8\x86\x7a\x25\x9e\xc4\
-\x4b\x80\xd9\xa4\xc5\x83\x7c\x53\x40\x1a\xd9\x1e\xf8\xac\x7f\x69\
-\xee\x05\xb6\xec\xad\x9c\x52\xac\x37\xd2\xdf\xb3\x76\x97\xcd\xd5\
-\xc0\xee\xbd\x95\x53\x6a\xa5\xd5\x49\xaf\xd3\x2e\x24\xfe\x3c\xad\
-\x43\xee\x07\xb6\xee\xa9\xa2\x52\x4d\xbc\x13\x07\x01\x4b\xb3\x08\
-\xf8\x36\x30\xb9\xa7\x8a\x4a\xed\x30\x8a\x34\x57\xa6\xdf\x27\x0e\
-\x2f\x9b\x87\x80\x1d\x7a\x29\xaa\x54\x37\x87\xd0\x7f\xbb\x74\x8d\
-\x94\x19\xa4\x65\x4c\x47\xf7\x52\x54\xa9\xc1\x76\x00\x2e\x24\xfe\
-\x5c\xac\x53\x66\x03\xcf\xea\xa5\xa8\x52\x5d\x1d\x86\x77\x02\x9e\
-\x9c\xcb\x80\x3d\x7b\x29\xaa\xd4\x30\x4f\x01\x8e\xc5\x2f\x04\x4f\
-\xce\x4c\x5c\x5a\x5c\x2d\x77\x28\x9e\xf8\x4f\xce\x62\xe0\xa7\xc0\
-\x94\x1e\xea\x2a\xd5\xdd\xca\xc0\x27\xf1\x15\xe1\xa1\xf2\x10\xce\
-\x0f\x52\x9f\x78\x2b\x0e\x02\x86\xca\x3c\xd2\x37\xa3\xb5\xbb\x2f\
-\xad\x54\x3b\x03\xc0\x01\xf4\xe7\x96\xbd\x45\xf2\x20\xb0\x6b\xd7\
-\xd5\x95\x1a\xc8\x41\xc0\xf0\x79\x00\xf8\x20\x2e\xfb\xa9\xe6\x7b\
-\x01\x70\x39\xf1\xe7\x54\x5d\x73\x2f\xf0\xf4\xae\xab\x2b\x35\xd8\
-\x9b\xf1\xb5\x9f\x91\x72\x1b\xf0\x36\xd2\x72\xa8\x52\x93\xec\x0d\
-\x9c\x47\xfc\x39\x54\xe7\xdc\x05\x3c\xad\xdb\x02\x4b\x6d\xf0\x72\
-\x60\x0e\xf1\x27\x63\x9d\x73\x1b\x69\x02\xe5\x98\xee\x4a\x2c\x55\
-\x66\x77\xe0\x64\xe2\xcf\x99\xba\xe7\x76\x60\xf3\x2e\x6b\x2c\xb5\
-\xca\xb3\x81\x87\x89\x3f\x29\xeb\x9e\x9b\x48\x0b\x2b\x39\x10\x50\
-\xdd\xec\x06\x9c\x42\xfc\x39\xd2\x84\xdc\x84\xcb\x83\x4b\x4f\xb0\
-\x2d\xfd\xbd\x95\x70\x27\xb9\x95\xb4\x86\xc0\xca\x5d\x55\x5a\xca\
-\x67\x2f\xfc\xc6\xdf\x49\xfe\x06\xac\xd3\x55\xa5\xa5\x96\x9b\x4a\
-\x1a\x1d\x47\x9f\xa4\x4d\xc9\x74\xd2\x1e\x03\xab\x77\x51\x6b\xa9\
-\x5b\xa3\x48\x8f\xee\x2e\x21\xfe\x1c\x68\x52\xce\x00\x26\x75\x51\
-\x6f\xa9\x6f\xac\x07\x5c\x45\xfc\xc9\xda\xa4\x3c\x02\x7c\x1d\xd8\
-\xb4\x8b\x7a\x4b\x45\x4d\x02\xde\x85\x83\xf4\x6e\xf2\x43\x7c\x74\
-\x27\x15\xb2\x1a\xce\x20\xee\x26\x8b\x80\x93\x80\xe7\x76\x5e\x72\
-\x69\x58\x4f\x05\xbe\x89\xf3\x74\xba\xcd\x7f\x93\xd6\x42\x90\x54\
-\xd0\x78\xe0\x27\xc4\x9f\xbc\x4d\xcd\xd5\xa4\x37\x07\xbc\xe5\xa8\
-\x6e\x0c\x00\x2f\x02\x4e\xc5\xf5\x3a\xba\xcd\x42\xe0\x1d\x9d\x16\
-\x5e\x52\x32\x00\x7c\x0a\xf7\x0f\xe8\x25\xb3\x80\xe3\x80\x5d\x3a\
-\xac\xbd\xfa\xd3\x86\xa4\x73\xee\x16\xe2\xfb\x6e\x93\x33\x1b\xd8\
-\xb7\xc3\xda\x4b\x1a\xc2\x81\xb8\x56\x40\x8e\x5c\x41\xda\x9a\x79\
-\x8d\xce\xca\xaf\x96\x1b\x0b\xec\x47\xfa\xb6\xef\xc2\x5c\xbd\xe7\
-\x5f\xc0\x8e\x1d\xfd\x04\x24\x8d\x68\x37\xe0\x1e\xe2\x4f\xee\x36\
-\x64\x1e\x69\xae\xc0\x7e\xb8\xdc\x70\x3f\xdb\x8d\xf4\x6c\xff\x3e\
-\xe2\xfb\x64\x5b\x72\x21\xb0\x6e\x27\x3f\x04\x49\xc5\x4c\x21\x3d\
-\xdb\x8e\x3e\xc9\xdb\x94\x07\x81\xef\x91\x26\x0e\x8e\x2e\xfe\xa3\
-\x50\x43\x6d\x03\x7c\x01\xf8\x27\xf1\x7d\xaf\x6d\xf9\x31\x0e\xa8\
-\xa5\x52\x4d\xc2\x85\x47\xca\xca\x7d\xc0\x31\xc0\xf3\x71\x30\xd0\
-\x26\xdb\x00\x9f\x00\xae\x21\xbe\x8f\xb5\x31\x0b\x81\x0f\x17\xfe\
-\x69\x48\xea\xc9\x28\xe0\xb3\x38\x3b\xb9\xcc\x4c\x07\x7e\x40\x9a\
-\xc8\x34\xb1\xd8\x8f\x45\x35\x31\x8a\xb4\x42\xdf\x57\x81\x9b\x89\
-\xef\x4b\x6d\xce\x23\xc0\x4b\x8b\xfd\x58\x24\xe5\xf4\x1f\xa4\xad\
-\x73\xa3\x2f\x02\x6d\xcf\x63\xc0\xe9\xc0\xbb\x49\xab\x35\xaa\x7e\
-\xd6\x04\x0e\x20\x0d\xda\x7c\xa6\x5f\x4d\x6e\x00\xb6\x2e\xf2\xc3\
-\x91\x54\x8e\x8d\x70\x49\xd2\xaa\x73\x0b\x70\x2c\xe9\x03\xc7\x37\
-\x0a\x62\x8c\x01\x76\x02\x3e\x0a\x9c\x09\xcc\x27\xbe\x5f\xf4\x53\
-\x7e\x0b\x4c\x5e\xe1\x4f\x49\x3d\x71\xf5\x24\x15\x31\x01\xf8\x0e\
-\xf0\xd6\xe8\x86\xf4\xa1\x45\xa4\xd7\x0b\xcf\x03\xce\x07\x2e\x00\
-\x66\x84\xb6\xa8\x9d\x56\x06\x76\x05\x9e\x05\x3c\x93\x74\x8b\x7f\
-\x95\xd0\x16\xf5\xa7\xf9\xc0\x07\x81\xa3\xa3\x1b\xd2\x0f\x1c\x00\
-\xa8\x13\x87\x02\xdf\x22\x0d\x08\x14\x63\x09\x70\x23\x69\x20\x70\
-\x01\x70\x29\x70\x3d\x69\xa0\xa0\xe2\x36\x22\x7d\xc3\xdf\x8b\xf4\
-\x81\xbf\x13\xe9\x7d\x7d\xc5\xb9\x9d\xb4\x26\xc9\xdf\xa2\x1b\xd2\
-\x2f\x1c\x00\xa8\x53\x3b\x03\xbf\x00\x36\x8f\x6e\x88\xfe\x6d\x36\
-\x69\x83\xa7\xcb\x80\xcb\x81\x2b\x49\x83\x84\x05\x91\x8d\xaa\x91\
-\x8d\x49\x1f\xf0\x3b\x2e\xf3\xab\x5b\xc6\xd6\xcb\xa9\xc0\x9b\x48\
-\xaf\xcd\xaa\x22\x0e\x00\xd4\x8d\x49\xc0\xb7\x81\x37\x47\x37\x44\
-\xc3\x5a\x40\xda\x55\xee\x1f\xc0\xdf\x81\xeb\x48\x83\x82\x5b\x48\
-\x93\x0e\xdb\x66\x14\xe9\x83\x7e\x2b\xd2\xc4\xb1\x65\x7f\xf5\x59\
-\x72\x7d\x2d\x02\x3e\x0d\x7c\x99\x74\x77\x4b\x15\x72\x00\xa0\x5e\
-\x1c\x44\x5a\xe4\xc6\x0b\x6c\x73\x2c\x01\xee\x20\x2d\x54\xf3\x4f\
-\x60\x1a\x70\x27\x69\x79\xd5\xbb\x07\x7f\x3f\x2f\xac\x75\xc3\x1b\
-\x0d\xac\x4d\x5a\xac\x6a\x93\xc1\x6c\xbc\xcc\xef\xa7\x02\x2b\x85\
-\xb4\x4c\xdd\x9a\x46\xfa\xd6\x7f\x41\x74\x43\xfa\x95\x03\x00\xf5\
-\x6a\x63\xe0\x67\xa4\xe7\xa8\x6a\x87\xe9\xa4\x57\xdd\x66\x2c\xf3\
-\xeb\x03\x83\xbf\x3e\x4c\x7a\xe4\x30\x8b\xf4\x8e\xf6\x6c\xd2\x1d\
-\x85\x99\x3c\x3e\x0f\x61\x01\xf0\xe8\x32\x7f\xde\x64\xd2\x37\x74\
-\x48\x93\xed\xc6\x93\x3e\xd0\x57\x25\x6d\x4d\xbd\x2a\xe9\xae\xd2\
-\xd2\xac\x4d\xba\x45\xff\x14\xd2\xb2\xaf\xeb\x0c\xfe\xbb\x51\xa8\
-\x2d\x7e\x08\xbc\x9f\xd4\x8f\x14\xc4\x01\x80\x72\x18\x0d\x7c\x88\
-\xb4\x2f\xb7\x13\xa9\x24\x0d\xe7\x61\xd2\x86\x59\xbf\x88\x6e\x88\
-\x1c\x00\x28\xaf\x3d\x81\x9f\xe2\x62\x36\x92\x96\xf7\x47\xd2\xab\
-\xc4\xf7\x46\x37\x44\x89\xeb\x91\x2b\xa7\x3b\x80\xef\x93\x16\x51\
-\xd9\x13\x07\x98\x92\x60\x2e\x69\x2d\xff\xf7\xf1\xc4\x47\x43\x0a\
-\xe6\x05\x5a\x65\xd9\x1b\x38\x1e\x5f\x17\x94\xfa\xd9\xf9\xc0\x21\
-\xa4\x37\x50\x54\x33\xde\x01\x50\x59\x6e\x27\xad\x9b\x3e\x06\xd8\
-\x03\x27\x70\x49\xfd\x64\x0e\xe9\xf5\xbe\x43\x71\xe5\xca\xda\xf2\
-\x0e\x80\xaa\xb0\x3b\x69\xd6\xef\x56\xd1\x0d\x91\x54\xba\xd3\x80\
-\x77\x90\x5e\x2d\x55\x8d\xf9\xad\x4c\x55\xb8\x98\xb4\xfa\xda\x11\
-\xa4\xbd\xbd\x25\xb5\xcf\x74\xe0\xb5\xa4\xed\x7b\xfd\xf0\x6f\x00\
-\xef\x00\xa8\x6a\x5b\x92\x36\xfa\xd8\x27\xba\x21\x92\xb2\x39\x91\
-\xf4\x7a\x9f\xb7\xfb\x1b\xc4\x3b\x00\xaa\xda\x8d\xc0\x0b\x49\x2b\
-\x80\xdd\x17\xdc\x16\x49\xbd\xb9\x01\x78\x01\x69\x13\x1f\x3f\xfc\
-\x1b\xc6\x49\x80\x8a\x72\x0d\xe9\x95\xc1\x95\x49\x1b\xb4\x38\x18\
-\x95\x9a\x63\x36\xf0\x25\xe0\x0d\xc0\xcd\xc1\x6d\x51\x97\x7c\x04\
-\xa0\x3a\x78\x06\xf0\x1d\x5c\x4e\x58\xaa\xbb\x25\xa4\xc5\xbe\x3e\
-\x82\x0b\xfa\x34\x9e\xdf\xba\x54\x07\x57\x03\xcf\x22\xad\x12\x76\
-\x4f\x70\x5b\x24\x0d\xed\x6f\xa4\x37\x7a\xde\x84\x1f\xfe\xad\xe0\
-\x23\x00\xd5\xc9\x55\xc0\x31\xa4\x0d\x42\x76\x25\x6d\x1a\x23\x29\
-\xd6\x03\xc0\x27\x80\xc3\x48\xbb\x45\xaa\x25\x1c\x00\xa8\x6e\x16\
-\x90\xb6\x07\xfd\x01\x30\x01\xe7\x07\x48\x51\x66\x03\xdf\x00\x0e\
-\x00\xce\x23\xdd\xfe\x97\xa4\xca\x3c\x0d\x38\x81\x74\xf1\x31\xc6\
-\x94\x9f\xf9\xc0\xb1\xa4\xad\x98\x25\x29\xdc\xf3\x80\xcb\x89\xbf\
-\x38\x1a\xd3\xd6\x2c\x02\x7e\x06\x6c\x8a\x24\xd5\xcc\x00\xf0\x72\
-\x1c\x08\x18\x93\x3b\x67\x92\x56\xeb\x94\xa4\x5a\x1b\x00\x5e\x4d\
-\x7a\x7b\x20\xfa\xc2\x69\x4c\x93\x73\x0e\xf0\x1c\x24\xa9\x61\xbc\
-\x23\x60\x4c\x77\x39\x9f\xf4\x58\x4d\x92\x1a\xcd\x81\x80\x31\x2b\
-\xce\x62\xe0\x64\xd2\x2b\xb6\x92\xd4\x2a\x03\xa4\x4d\x86\x4e\x26\
-\xfe\x62\x6b\x4c\x5d\xb2\x88\x74\x4e\xf8\x8c\x5f\x52\x5f\xd8\x05\
-\xf8\x15\x69\xfb\xe1\xe8\x0b\xb0\x31\x11\x99\x43\x7a\x9d\xef\xa9\
-\x48\x43\x70\x2f\x00\xb5\xdd\x26\xc0\xdb\x07\x33\x39\xb6\x29\x52\
-\x25\xee\x25\x7d\xf0\x1f\x8d\x3b\xf4\x49\x12\xab\x03\x1f\x07\xee\
-\x22\xfe\x9b\x99\x31\x65\xe4\x22\xe0\x35\xc0\x58\x24\x49\xcb\x19\
-\x45\x9a\x27\x70\x02\x3e\x1e\x30\xcd\xcf\x7c\x52\x5f\x76\x27\x4d\
-\x75\xcc\x47\x00\xea\x67\x9b\x93\x36\x38\x39\x18\x58\x2b\xb8\x2d\
-\x52\x27\xa6\x01\x3f\x02\x7e\x08\xdc\x1d\xdc\x16\x49\x6a\xac\x71\
-\xa4\x0d\x4f\xce\x24\xbd\x2a\x15\xfd\xad\xce\x98\xa1\xf2\x18\xe9\
-\xdb\xfe\x3e\xf8\xe5\x4d\x19\xd8\x89\xa4\x27\xda\x86\xb4\xdf\xf9\
-\xeb\x80\x0d\x83\xdb\x22\x41\xda\x26\xfb\x78\xd2\x3a\xfd\x0f\x05\
-\xb7\x45\x2d\xe2\x00\x40\x1a\xda\x28\xe0\xb9\xc0\x1b\x81\xfd\x80\
-\x49\xb1\xcd\x51\x9f\xb9\x9f\xf4\x6d\xff\x47\xa4\x05\xae\xa4\xec\
-\x1c\x00\x48\x2b\x36\x01\x78\x01\x69\x30\xf0\x2a\x9c\x65\xad\x72\
-\x3c\x4c\x5a\xb0\xe7\x44\xe0\x74\x60\x41\x6c\x73\xd4\x76\x0e\x00\
-\xa4\xce\x3c\x05\xd8\x1f\xd8\x17\x78\x36\x30\x26\xb6\x39\x6a\xb8\
-\x59\xc0\x1f\x48\x8b\x56\xfd\x89\x34\xab\x5f\xaa\x84\x03\x00\xa9\
-\x7b\x6b\x92\xf6\x20\xd8\x97\x74\x87\x60\xa5\xd8\xe6\xa8\x21\x66\
-\x92\x3e\xec\x7f\x05\x9c\x06\xcc\x8d\x6d\x8e\xfa\x95\x03\x00\x29\
-\x8f\x95\x48\xb3\xb3\x0f\x20\x0d\x0a\x56\x8b\x6d\x8e\x6a\x66\x1a\
-\x70\x16\x70\x0a\x70\x06\x30\x2f\xb6\x39\x92\x03\x00\xa9\x0c\xe3\
-\x48\x0b\xb3\xbc\x70\x30\x3b\xe0\xb9\xd6\x6f\x16\x00\x7f\x25\x7d\
-\xc3\x3f\x19\xb8\x29\xb6\x39\xd2\xf2\xbc\x28\x49\xe5\x5b\x87\xf4\
-\x88\xe0\x45\x83\xbf\xae\x1b\xdb\x1c\x95\xe4\x26\xe0\x1c\xe0\x6c\
-\xd2\xb7\xfc\x47\x62\x9b\x23\x8d\xcc\x01\x80\x54\xad\x01\x60\x3b\
-\xd2\x9d\x81\x67\x01\x7b\x92\xe6\x12\xa8\x79\x6e\x01\xce\x25\x7d\
-\xe8\x9f\x83\x2b\xf2\xa9\x61\x1c\x00\x48\xb1\x06\x80\xad\x49\x8f\
-\x0c\xf6\x1a\xcc\xd4\xd0\x16\x69\x28\x4b\x48\xdf\xf0\x2f\xe2\xf1\
-\x0f\xfc\x3b\x42\x5b\x24\xf5\xc8\x01\x80\x54\x3f\xeb\x93\x06\x02\
-\x7b\x02\x3b\x02\xdb\xe3\x42\x44\x55\xbb\x1b\xf8\x1b\x70\xe9\xe0\
-\xaf\x97\x91\xde\xd3\x97\x5a\xc3\x01\x80\x54\x7f\xa3\x48\x1b\x17\
-\xed\x30\x98\x1d\x07\x7f\x75\x03\xa3\x3c\xee\x00\xae\x03\xae\xe0\
-\xf1\x0f\xfd\xbb\x42\x5b\x24\x55\xc0\x01\x80\xd4\x5c\x53\x80\x67\
-\x00\x4f\x03\xb6\x00\xb6\x1c\xcc\x3a\x91\x8d\xaa\xb1\xbb\x81\x7f\
-\x0c\xe6\x3a\xe0\xda\xc1\x5f\x9d\xac\xa7\xbe\xe4\x00\x40\x6a\x9f\
-\xd5\x79\xe2\x80\xe0\xa9\xc0\x46\xa4\x01\xc3\xba\xa4\x3b\x0a\x6d\
-\xb4\x00\xf8\x17\x70\xdb\x60\x6e\x1d\xfc\x75\x1a\x70\x03\x6e\xa4\
-\x23\x3d\x81\x03\x00\xa9\xbf\x8c\x05\xd6\x23\x0d\x06\x36\x22\xed\
-\x78\xb8\xd1\x60\xd6\x04\xd6\x58\xe6\xd7\x71\x41\x6d\x7c\xb2\xf9\
-\xa4\xcd\x71\xa6\x03\xf7\x0e\xfe\xfe\xfe\xc1\xdf\x4f\xe7\xf1\x0f\
-\xfc\xbb\x80\x45\x21\x2d\x94\x1a\xc8\x01\x80\xa4\xe1\x4c\xe2\xf1\
-\x01\xc1\x5a\xc0\x64\xd2\x0a\x87\x03\xa4\xbb\x0c\x03\xcb\xfc\xf3\
-\x6a\xa4\x3b\x0b\x93\x87\xf8\x73\x1e\x65\xf9\x8d\x6d\x16\x0c\xfe\
-\xfb\x99\xc0\x9c\xc1\x3c\x4c\x5a\x16\x77\xe9\xef\x1f\x05\xee\xc3\
-\xc9\x77\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x1a\xc9\xff\x03\x14\x8c\xda\x21\x12\x5b\xc4\x9c\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x20\x9e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
-\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
-\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x94\x00\x00\x0b\x94\x01\
-\x77\xed\xb6\xf4\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
-\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\x00\x50\x4c\x54\
-\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x0b\x23\xb7\xe1\x00\x00\x00\xff\x74\x52\x4e\x53\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\
-\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x20\x21\x22\
-\x23\x24\x25\x26\x27\x28\x29\x2a\x2b\x2c\x2d\x2e\x2f\x30\x31\x32\
-\x33\x34\x35\x36\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\x3f\x40\x41\x42\
-\x43\x44\x45\x46\x47\x48\x49\x4a\x4b\x4c\x4d\x4e\x4f\x50\x51\x52\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x5b\x5c\x5d\x5e\x5f\x60\x61\x62\
-\x63\x64\x65\x66\x67\x68\x69\x6a\x6b\x6c\x6d\x6e\x6f\x70\x71\x72\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x7b\x7c\x7d\x7e\x7f\x80\x81\x82\
-\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\
-\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa2\
-\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xaf\xb0\xb1\xb2\
-\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xbe\xbf\xc0\xc1\xc2\
-\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\xcf\xd0\xd1\xd2\
-\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xdb\xdc\xdd\xde\xdf\xe0\xe1\xe2\
-\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xeb\xec\xed\xee\xef\xf0\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\xeb\x08\xd9\x35\
-\x00\x00\x1c\x05\x49\x44\x41\x54\x18\x19\xed\xc1\x09\x80\x8d\xf5\
-\xfe\x3f\xf0\xf7\x39\x33\x63\x8c\x99\xb1\xef\xb2\x55\xb6\x92\x2d\
-\xb4\xd3\x8a\x92\x4a\x97\xd2\x72\x53\x94\x76\xe4\x52\x11\xed\xfb\
-\xf6\xab\x6e\x25\x75\x0b\x91\xa2\x52\xb4\x88\x8a\xdc\x6c\xd9\x42\
-\x14\x65\xcb\xce\xd8\x99\x7d\xe6\xbc\xff\xbf\xfb\xbb\xff\xdf\xef\
-\xde\x6e\xf1\xf9\x7e\xcf\x79\x9e\xe7\x9c\xe7\x39\x9f\xd7\x0b\xf0\
-\xbd\x50\xc5\xe3\xda\x5f\x78\xed\x80\x87\x5f\x79\xf7\x8b\x59\xf3\
-\x16\xff\xb0\x66\xe3\xb6\x3d\x87\x8a\x22\x05\x07\x73\xb6\xae\x5f\
-\xbd\x7c\xd1\x9c\x99\x9f\x8f\x7f\xf1\xfe\xdb\x7b\x5d\xd0\xa6\x7e\
-\x16\x54\x90\x64\x35\xbf\xf8\x8e\x67\x3f\x58\xbc\xb3\x84\xa6\x0a\
-\xb7\xcc\x9b\xf0\x78\xbf\x4e\x8d\xcb\x42\xf9\x59\x7a\xab\x3f\x3f\
-\xf5\xc1\xe2\xdd\x8c\x5a\x64\xdb\xbc\x09\x0f\x5f\xd1\x34\x05\xca\
-\x67\x42\x0d\x2e\xb9\xef\xbd\x55\xc5\x74\x46\xc1\xd2\xb1\x83\x3b\
-\xd7\x82\xf2\x87\xba\xbd\x5e\x9a\x77\x90\xce\xdb\x3d\xeb\xa9\x4b\
-\xab\x41\x25\xb2\xd4\xb6\xfd\x27\x6e\xa6\x9b\x7e\x1e\x7d\xd3\x89\
-\x21\xa8\x04\x54\xae\xcb\xa3\xb3\x72\xe9\x85\x7d\x9f\xdf\x77\x56\
-\x2a\x54\x22\x39\x69\xf0\x97\x05\xf4\xd2\x81\x8f\x6e\x69\x08\x95\
-\x10\xaa\xf4\x1a\xbd\x95\xf1\xb0\xe6\xa5\xae\x99\x50\xf1\xd5\xf2\
-\xe1\x85\xa5\x8c\x9f\xc2\xaf\xff\xd2\x00\x2a\x5e\x5a\x3c\xfa\x33\
-\xe3\x6f\xe1\xe0\xfa\x50\xde\x6b\xf1\xc8\x1a\x26\x8a\xef\xfe\x52\
-\x1f\xca\x4b\xcd\x1f\x5e\xcd\xc4\xb2\x60\x50\x5d\x28\x6f\x54\xb8\
-\x75\x31\x13\x50\xe9\xf4\x2b\xd2\xa1\xdc\x16\x3a\x7b\x5c\x1e\x13\
-\xd5\xee\x17\x5b\x40\xb9\xa9\xce\xb0\xb5\x4c\x6c\x8b\x6e\xa9\x00\
-\xe5\x8e\xf0\xa5\x9f\x96\x30\xf1\xe5\xbd\x7d\x06\x94\xf3\x32\xef\
-\x58\x4b\xbf\xf8\xae\x57\x2a\x94\xa3\xea\x3c\xb9\x97\x7e\xf2\xeb\
-\xe0\x0a\x50\x8e\x69\x33\xae\x88\x7e\x73\xe8\x85\x63\xa1\x9c\x10\
-\xea\x36\x8b\xbe\x54\xfa\xe1\x19\x50\xb1\x0a\x5d\xbe\x9c\xfe\x35\
-\xeb\x2c\xa8\x98\x5c\xfa\x3d\xfd\xed\xab\x33\xa0\xa2\x76\xf1\x12\
-\xfa\xdf\xf4\x53\xa1\xa2\x72\xd1\x42\x06\xc3\xb4\xf6\x50\xd6\xce\
-\x59\xc0\xe0\xf8\xf4\x24\x28\x2b\xc7\x4c\x64\xa0\x94\xbc\x58\x01\
-\xca\x58\x99\x7b\x0f\x33\x68\x76\xf4\x0e\x41\x99\xe9\xbc\x86\x41\
-\x34\xb7\x35\x94\x81\xfa\x93\x19\x50\x25\xaf\x54\x82\x12\x94\x1d\
-\x91\xc7\xe0\xca\xe9\x1b\x82\x3a\x9a\x8b\xd7\x31\xd8\xbe\x6b\x0b\
-\x75\x44\xc7\x7d\x4a\xcf\xe4\xed\x5c\xb7\x6c\xce\xb4\xf7\xc7\x7d\
-\x38\x63\xde\x8a\x0d\x39\x05\xf4\x4a\xe9\xa8\x2a\x50\x7f\x28\xe3\
-\x91\x02\xba\xa8\x74\xc3\xf4\xbf\x3e\x30\xa8\xdf\x55\xdd\xce\x6e\
-\xdb\xa4\x4e\xf9\x14\xfc\x56\x6a\xa5\xba\xcd\xda\x9f\x7b\xe9\x35\
-\xb7\x0c\x7e\xe8\xb5\x59\x5b\xe9\xa6\x3d\x37\x87\xa1\x7e\xef\xf2\
-\x8d\x74\xc9\x9e\x79\x63\x86\xfe\xa9\x79\x59\x98\xcb\x6a\x73\xd5\
-\x03\x13\x16\x1f\xa4\x4b\x16\x9f\x02\xf5\x1f\x9a\x4c\xa7\xf3\xf2\
-\x7f\xf8\xf0\xf1\xeb\x4f\xab\x82\x68\xd5\xea\xd8\xef\xd9\x4f\xd6\
-\x14\xd3\x71\x91\x37\xab\x41\xfd\x9b\xd0\x3d\x85\x74\x56\xe9\xd2\
-\xe7\xba\x35\x08\xc3\x09\xa9\x8d\xaf\x18\xb9\x9a\x0e\xdb\xdb\x03\
-\xea\xff\x54\xff\x82\x4e\x8a\xac\x78\xf1\xb2\x4a\x70\x56\xad\xab\
-\xdf\x58\x4b\x47\x8d\x2c\x0b\xf5\x4f\xe7\x6d\xa7\x73\x7e\x7c\xa5\
-\x47\x55\xb8\xa3\xee\x75\xa3\x37\xd2\x39\x2b\x9a\x41\xfd\xb7\x94\
-\x47\x4b\xe9\x90\x9f\x47\xf5\xaa\x09\x77\x35\xec\x33\x6e\x0b\x1d\
-\x92\xdb\x07\x0a\x75\xbf\xa5\x23\x76\xbf\x75\x6d\x1d\x78\xa3\x51\
-\xbf\x89\x87\xe9\x88\x77\xb2\x91\xec\x2e\xd9\x43\x07\xe4\x4f\xba\
-\x24\x0d\x5e\xca\xbc\x76\x7a\x09\x1d\xf0\xcb\xc9\x48\x6a\x65\x5e\
-\x60\xec\x22\xb3\xfa\x54\x80\xf7\x6a\xde\xb5\x84\xb1\x2b\x1c\x88\
-\x24\x76\xfc\x12\xc6\xec\x87\x7b\xea\x22\x5e\x9a\x3d\xb6\x91\x31\
-\x9b\x5a\x05\xc9\xea\xea\x83\x8c\xd1\xd6\x67\x5b\x22\xae\x42\x1d\
-\x5e\xdf\xc7\x18\x6d\xee\x80\xa4\x54\xee\x4d\xc6\xe6\xe0\x98\xf3\
-\xc3\x88\xbf\xf4\xcb\x27\x17\x32\x26\x25\xf7\x87\x91\x7c\x9a\xaf\
-\x62\x4c\xbe\xe8\x95\x81\x44\x51\xe9\xe6\xef\x18\x93\x59\xb5\x91\
-\x6c\xfa\xe5\x31\x06\x25\x13\x5a\x20\xb1\x9c\x3d\x9d\xb1\xd8\x75\
-\x21\x92\x4a\xfa\x04\xc6\xa0\xe0\xb5\x63\x91\x78\x4e\x7e\xbf\x94\
-\xd1\x8b\x3c\x16\x42\xf2\xa8\x38\x9b\xd1\x3b\xf8\x74\x4d\x24\xa6\
-\x26\x6f\x15\x31\x7a\xe3\xd2\x90\x2c\x8e\xf9\x81\x51\xdb\x35\xbc\
-\x22\x12\x57\xdd\x17\x72\x19\xb5\x19\xd9\x48\x0e\x27\x6e\x62\xb4\
-\x7e\xbd\xb3\x1c\x12\x5b\xd5\x47\xf6\x31\x5a\x4b\x6b\x20\x19\x9c\
-\xb5\x97\x51\xfa\xb1\x77\x1a\x12\x5f\xf6\x90\xed\x8c\xd2\xfa\xc6\
-\x08\xbe\xcb\xf3\x19\x9d\x85\xdd\x43\xf0\x87\xf4\x5b\xd6\x31\x3a\
-\x39\xa7\x20\xe8\x6e\x2f\x65\x54\x56\x77\x81\x8f\xa4\xf4\xd9\xc5\
-\xa8\xe4\x76\x45\xb0\x3d\xce\xa8\x1c\xbe\x27\x0d\xfe\x52\xf1\xe5\
-\x12\x46\xa3\xa4\x2f\x02\x2c\x75\x2c\xa3\x32\xf1\x18\xf8\x4f\xab\
-\xb9\x8c\xca\xfd\x08\xac\xac\x2f\x18\x8d\x1f\xcf\x83\x2f\x85\x7a\
-\xef\x64\x34\x46\xa5\x20\x98\xaa\x2f\x66\x14\x0e\x0d\x49\x83\x5f\
-\x55\x78\xa9\x84\x51\x98\x92\x81\x20\x3a\x7e\x2d\xa3\xf0\x5e\x1d\
-\xf8\x59\xcb\x39\x8c\xc2\xbc\x2a\x08\x9e\x76\xbb\x68\x6f\xd5\x39\
-\xf0\xb9\xd0\x75\x3b\x68\xef\xa7\xfa\x08\x9a\x0b\x0f\xd3\xda\xc1\
-\xc1\x69\xf0\xbf\x0a\x2f\x94\xd0\xda\xb6\x96\x08\x96\x8b\x8b\x69\
-\x6d\x42\x6d\x04\x43\x8b\xbf\xd3\xda\xfe\x96\x08\x92\x0e\x79\xb4\
-\xb5\xed\x7c\x04\xc7\x8d\xb9\xb4\xb5\xe3\x78\x04\x47\xab\xfd\xb4\
-\xf5\x79\x35\x04\x49\xb3\x15\xb4\xb5\xa1\x36\x82\xa2\xd1\x4e\x5a\
-\x2a\x1a\x1c\x42\xb0\x94\x1d\x49\x5b\x2b\x2b\x23\x18\xea\x6c\xa4\
-\xa5\x75\xed\x11\x3c\x3d\xf6\xd1\xd2\x82\x4c\x04\x41\xe5\x55\xb4\
-\xf4\x5e\x79\x04\x51\x83\xf9\xb4\x34\xa3\x0c\xfc\x2f\xeb\x3b\xda\
-\xc9\xbb\x09\x01\x95\xfa\x64\x84\x76\x26\x85\xe1\x77\x65\xbe\xa4\
-\x9d\x1f\x4e\x44\x70\x75\xda\x41\x3b\xa3\xe0\x73\xe1\xf7\x69\x67\
-\x54\x06\x82\xac\xc6\x0c\xda\x79\x1c\xfe\xf6\x06\xad\xec\xef\x89\
-\x80\x0b\xdd\x5b\x4c\x2b\x7f\x81\x9f\x3d\x49\x2b\x0b\x1a\x22\xf8\
-\x4e\xdb\x48\x1b\x91\x1b\xe0\x5f\x43\x68\xe5\xf9\x34\x24\x83\x8a\
-\x53\x69\xa3\xa4\x3b\xfc\xaa\x2f\x6d\x94\xf6\x47\x92\x48\x79\x8d\
-\x36\x0a\xce\x81\x3f\x5d\x5e\x42\x0b\x05\x3d\x91\x3c\x46\xd0\xc6\
-\xc1\xb6\xf0\xa3\xf3\x0a\x68\x61\xff\xd9\x48\x26\x7d\x8a\x69\x21\
-\xa7\x29\xfc\xa7\xf1\x41\x5a\xd8\x7a\x12\x92\x4b\xd7\x5c\x5a\xd8\
-\x50\x09\x7e\x93\xb1\x9c\x16\x7e\xac\x87\x64\xd3\x3e\x87\x16\xa6\
-\xc0\x6f\xde\xa4\x85\xb9\x95\x91\x7c\x1a\xad\xa7\x85\xc1\xf0\x97\
-\xde\xb4\xf0\x71\x06\x92\x51\x8d\x25\x34\x57\x7c\x3a\xfc\xa4\x79\
-\x2e\xcd\x8d\x4a\x41\x72\xca\x9a\x41\x73\x9b\xab\xc2\x3f\xb2\x56\
-\xd3\xdc\xfd\x48\x5a\x69\xe3\x68\xee\x8b\x10\x7c\x63\x02\x8d\x95\
-\xdc\x88\x24\x16\x7a\x8a\xe6\xee\x83\x5f\xdc\x4a\x63\x79\xdd\x90\
-\xdc\xfa\x97\xd2\x54\xc9\xd9\xf0\x87\x36\x05\x34\x95\xdf\x11\xc9\
-\xee\xfa\x08\x4d\x6d\xaf\x01\x3f\xa8\xb8\x8e\xa6\x8a\x2f\x81\x1a\
-\x44\x63\x33\x53\xe0\x03\x1f\xd1\x54\xe4\x3a\x28\xe0\x31\x1a\x7b\
-\x04\x89\x6f\x10\x8d\xdd\x05\xf5\x0f\xaf\xd1\x54\x69\x27\x24\xba\
-\xd3\x8a\x68\xea\x51\xa8\xff\x11\x9e\x44\x53\x39\x75\x90\xd8\xaa\
-\x6e\xa6\xa9\x91\x50\xff\x5f\x99\xe9\x34\x35\x27\x15\x89\x2c\x34\
-\x8d\xa6\x26\x86\xa1\xfe\x57\xe6\x02\x9a\x7a\x1a\x89\xec\x3e\x9a\
-\x9a\x5e\x06\xea\x5f\x2a\xaf\xa4\xa1\x48\x37\x24\xae\xb3\x4a\x68\
-\x68\x7e\x26\xd4\xbf\xab\xbd\x81\x86\xf6\x1e\x83\x44\x95\xf1\x33\
-\x0d\xad\xac\x0c\xf5\x5b\x8d\x76\xd2\xd0\xa7\x48\x54\x4f\xd3\xd0\
-\x86\xda\x50\xff\xa9\xd5\x7e\x1a\xba\x16\x89\xa9\x6d\x09\xcd\xec\
-\x38\x1e\xea\xf7\x3a\xe4\xd3\xcc\xee\xea\x48\x44\x69\x2b\x68\x66\
-\x7f\x2b\xa8\x3f\xd2\xad\x98\x66\xde\x47\x22\xba\x9f\x86\x2e\x85\
-\xfa\x63\x77\xd3\xd0\x9f\x90\x78\x4e\x2c\xa4\x99\x67\xa0\x8e\x20\
-\x34\x95\x66\x76\x54\x46\xa2\x09\x2f\xa0\x99\x39\xa9\x50\x47\x52\
-\x69\x03\xcd\xbc\x8d\x44\x33\x88\x66\x76\xd5\x81\x3a\xb2\x76\x85\
-\x34\x73\x11\x12\xcb\x31\x87\x69\xa4\xb4\x13\xd4\xd1\xdc\x4e\x33\
-\x1b\x33\x90\x50\xde\xa5\x99\x87\xa0\x8e\x6e\x22\xcd\x3c\x80\x44\
-\x72\x16\xcd\x7c\x15\x86\x3a\xba\xec\x35\x34\x92\x57\x0f\x89\x23\
-\xfc\x3d\x8d\x6c\xad\x0e\x25\x39\x29\x8f\x46\x26\x21\x71\xdc\x4c\
-\x23\xc5\x67\x41\xc9\x6e\xa0\x99\xb3\x91\x28\x2a\xed\xa6\x91\xbb\
-\xa1\x4c\xbc\x45\x23\x2b\x52\x90\x20\xfe\x4a\x23\x9f\x84\xa0\x4c\
-\x64\xac\xa0\x91\xdb\x91\x18\x9a\x97\xd0\xc4\x86\x4a\x50\x66\x1a\
-\x1f\xa4\x89\x3d\x55\x90\x10\x66\xd2\x44\x61\x3b\x28\x53\x57\xd2\
-\xc8\xab\x48\x04\x17\xd1\x48\x7f\x28\x73\xaf\xd2\x44\x49\x63\xc4\
-\x5f\x68\x29\x4d\xcc\x0b\x41\x99\xcb\xda\x4c\x13\xef\x21\xfe\x7a\
-\xd2\x44\x71\x0b\x28\x1b\x97\xd3\x44\xa4\x25\xe2\x2d\xe5\x27\x9a\
-\x78\x16\xca\xce\xa7\x34\x31\x15\xf1\x76\x3d\x4d\x6c\xca\x82\xb2\
-\xd3\x20\x8f\x26\x4e\x45\x7c\xa5\x6d\xa0\x89\xee\x50\xb6\x86\xd2\
-\xc4\xd7\x88\xaf\xdb\x68\xe2\x13\x28\x6b\x69\xab\x68\xe2\x5c\xc4\
-\x53\xc6\x36\x1a\xc8\x6d\x00\x65\xaf\x03\x4d\xcc\x47\x3c\x0d\xa1\
-\x89\x7b\xa0\xa2\x31\x9a\x26\xba\x21\x7e\x32\x76\xd1\xc0\xca\x34\
-\xa8\x68\x54\xdd\x43\x03\x8b\x10\x3f\xb7\xd0\x40\xe4\x2c\xa8\xe8\
-\xdc\x48\x13\x67\x23\x5e\xc2\xbf\xd0\xc0\x5b\x50\x51\x0a\xcd\xa5\
-\x81\xcf\x11\x2f\x7f\xa2\x81\xdd\x55\xa1\xa2\x75\x52\x31\x0d\x34\
-\x47\x9c\x2c\xa0\x81\xbe\x50\xd1\x7b\x86\x06\xc6\x20\x3e\x3a\xd0\
-\xc0\x9c\x10\x54\xf4\x32\x37\x51\x56\x54\x07\x71\xf1\x09\x65\xa5\
-\x2d\xa0\x62\xd1\x83\x06\x9e\x41\x3c\x9c\x10\xa1\x6c\x12\x54\x4c\
-\x42\xcb\x29\x3b\x50\x01\x71\xf0\x16\x65\x91\x93\xa0\x62\xd3\x93\
-\x06\xee\x86\xf7\x6a\x16\x52\x36\x19\x2a\x46\xe1\x1f\x29\xdb\x9a\
-\x0a\xcf\x0d\xa3\x81\xd6\x50\xb1\xba\x86\x06\xba\xc3\x6b\xe1\x0d\
-\x94\x7d\x02\x15\xb3\x94\x9f\x29\x9b\x06\xaf\x75\xa1\x81\xf6\x50\
-\xb1\xbb\x9e\xb2\xd2\x06\xf0\xd8\x47\x94\x7d\x01\xe5\x80\xd4\xf5\
-\x94\x3d\x0a\x6f\xd5\x2e\xa6\xec\x74\x28\x27\xf4\xa3\x6c\x5b\x2a\
-\x3c\x35\x82\xb2\xaf\xa0\x1c\x51\x66\x13\x65\x97\xc1\x4b\xe1\x5f\
-\x29\xeb\x00\xe5\x8c\x3b\x28\xfb\x1c\x5e\xea\x4a\xd9\x6c\x28\x87\
-\x94\xdd\x46\x51\x69\x7d\x78\x68\x2a\x65\xe7\x41\x39\xe5\x2e\xca\
-\x1e\x81\x77\x6a\x94\x50\x34\x17\xca\x31\xe5\x76\x51\xb4\x29\x04\
-\xcf\xdc\x4e\x59\x17\x28\xe7\xdc\x43\xd9\x99\xf0\xcc\xb7\x14\x2d\
-\x84\x72\x50\xd6\x1e\x8a\x5e\x81\x57\x8e\x89\x50\x74\x25\x94\x93\
-\x9e\xa0\x68\x67\x0a\x3c\x32\x88\xa2\x7d\x65\xa1\x9c\xd4\x84\xb2\
-\x4e\xf0\xc8\x42\x8a\x46\x41\x39\x6b\x01\x45\x6f\xc1\x1b\xc7\x52\
-\x76\x3a\x94\xb3\x6e\xa1\x68\x7f\x3a\x3c\x31\x8c\xa2\x9f\xa1\x1c\
-\x56\xb1\x80\xa2\xcb\xe0\x89\xe5\x14\x0d\x87\x72\xda\x44\x8a\xde\
-\x83\x17\x9a\x51\x14\xa9\x07\xe5\xb4\x8b\x28\xca\xcd\x84\x07\x86\
-\x52\x34\x13\xca\x71\x29\xdb\x28\xea\x0e\x0f\x7c\x4b\x51\x6f\x28\
-\xe7\x3d\x43\xd1\x1b\x70\x5f\xa5\x12\x4a\x0e\x67\x42\x39\xef\x44\
-\x8a\xb6\xc0\x7d\x57\x52\x34\x16\xca\x0d\x8b\x29\x6a\x09\xd7\x8d\
-\xa5\xe8\x1c\x28\x37\xdc\x41\xd1\x50\xb8\x2d\xb4\x93\x92\x5f\x43\
-\x50\x6e\xa8\x52\x48\xc9\xb7\x70\x5b\x3b\x8a\x1e\x81\x72\xc7\x87\
-\x94\x94\x54\x82\xcb\x1e\xa0\xa8\x11\x94\x3b\xba\x51\x74\x25\x5c\
-\xf6\x1d\x25\x73\xa1\x5c\x92\xba\x93\x92\xb1\x70\x57\xb5\x52\x4a\
-\x6e\x81\x72\xcb\x0b\x94\xec\x0c\xc1\x55\x57\x50\x54\x1f\xca\x2d\
-\x9d\x29\x6a\x01\x57\xbd\x44\xc9\x5a\x28\xd7\x64\x16\x51\x72\x1b\
-\x5c\xb5\x94\x92\x51\x50\xee\xf9\x3b\x25\x13\xe0\xa6\xec\x12\x4a\
-\xae\x80\x72\xcf\x83\x94\x6c\x82\x9b\x3a\x51\x12\xa9\x0a\xe5\x9e\
-\xb3\x28\xaa\x07\x17\x3d\x4c\xc9\x32\x28\x17\x95\xc9\xa5\xe4\x6a\
-\xb8\x68\x26\x25\xcf\x41\xb9\xe9\x0b\x4a\x5e\x85\x7b\xd2\x72\x29\
-\xb9\x08\xca\x4d\x43\x28\x59\x01\xf7\xb4\xa7\xa4\x28\x0b\xca\x4d\
-\x27\x53\x12\xa9\x08\xd7\x0c\xa2\x64\x0e\x94\xab\xc2\x7b\x29\xb9\
-\x08\xae\x79\x9f\x92\x87\xa0\xdc\x35\x99\x92\x47\xe0\x9a\x35\x94\
-\x74\x80\x72\xd7\xed\x94\x4c\x81\x5b\xca\x95\x52\x90\x5b\x06\xca\
-\x5d\xcd\x28\xd9\x00\xb7\xb4\xa3\xe4\x0b\x28\xb7\x6d\xa3\xa4\x3c\
-\x5c\xd2\x97\x92\x21\x50\x6e\x1b\x4f\xc9\x19\x70\xc9\x8b\x94\xb4\
-\x81\x72\xdb\x0d\x94\xdc\x0a\x97\xcc\xa2\x60\x4f\x18\xca\x6d\xf5\
-\x29\x19\x09\x97\xec\xa1\x60\x26\x94\xfb\xf6\x50\x30\x17\xee\xa8\
-\x43\xc9\xab\x50\xee\x9b\x4b\xc1\xc1\x10\x5c\x71\x21\x25\x03\xa0\
-\xdc\xf7\x26\x25\x0d\xe1\x8a\xbb\x29\xe9\x0c\xe5\xbe\x21\x94\x5c\
-\x02\x57\xbc\x4e\x49\x7d\x28\xf7\x75\xa3\x64\x10\x5c\xf1\x15\x05\
-\x79\x21\x28\xf7\x35\xa2\xe4\x65\xb8\x62\x1d\x05\xcb\xa0\x3c\x90\
-\x5a\x48\xc1\x67\x70\x43\x4a\x11\x05\x13\xa1\xbc\xb0\x8a\x82\x1f\
-\xe1\x86\xfa\x94\x3c\x04\xe5\x85\x0f\x29\xc8\x83\x1b\xce\xa6\xe4\
-\x6a\x28\x2f\x3c\x4e\x49\x4d\xb8\xe0\x06\x4a\xda\x40\x79\xe1\x3a\
-\x4a\x4e\x83\x0b\x1e\xa6\x24\x0b\xca\x0b\xed\x29\xb9\x1a\x2e\x18\
-\x47\xc1\x66\x28\x4f\x94\xa7\xe4\x3e\xb8\x60\x2e\x05\x5f\x41\x79\
-\x63\x1b\x05\x6f\xc2\x05\x9b\x29\x78\x19\xca\x1b\x33\x29\xf8\x12\
-\x2e\xc8\xa7\xe0\x4e\x28\x6f\xbc\x4a\xc1\xf7\x70\x5e\x26\x25\x17\
-\x40\x79\xa3\x3f\x05\x9b\xe1\xbc\x06\x94\xd4\x87\xf2\x46\x67\x0a\
-\xf2\xe1\xbc\xb6\x94\x64\x41\x79\xa3\x2d\x25\x59\x70\x5c\x17\x0a\
-\x22\x21\x28\x6f\x34\xa1\xa4\x01\x1c\x77\x2d\x05\x07\xa1\x3c\x52\
-\x9b\x92\xb6\x70\xdc\x40\x0a\xb6\x42\x79\x24\x9b\x92\x2e\x70\xdc\
-\xa3\x14\xac\x86\xf2\x48\x28\x42\xc1\xb5\x70\xdc\x6b\x14\x2c\x82\
-\xf2\xca\x21\x0a\x06\xc2\x71\x1f\x50\x30\x13\xca\x2b\xdb\x28\x78\
-\x14\x8e\x9b\x41\xc1\x14\x28\xaf\xac\xa1\xe0\x25\x38\x6e\x36\x05\
-\xe3\xa1\xbc\xb2\x98\x82\x51\x70\xdc\x02\x0a\x46\x42\x79\x65\x16\
-\x05\x63\xe0\xb8\xa5\x14\x3c\x0d\xe5\x95\xa9\x14\x4c\x80\xe3\x56\
-\x51\x30\x02\xca\x2b\xef\x50\xf0\x21\x1c\xf7\x0b\x05\x03\xa0\xbc\
-\x32\x92\x82\x4f\xe0\xb8\x4d\x14\xf4\x81\xf2\xca\xd3\x14\xcc\x80\
-\xe3\x76\x50\xd0\x13\xca\x2b\x23\x28\xf8\x06\x8e\xdb\x47\x41\x17\
-\x28\xaf\x0c\xa4\x60\x3e\x1c\x97\x47\xc1\x19\x50\x5e\xe9\x4b\xc1\
-\x52\x38\xae\x84\x82\x16\x50\x5e\xb9\x82\x82\x95\x70\x5c\x09\x05\
-\x2d\xa0\xbc\x72\x05\x05\xcb\xe1\xb8\x3c\x0a\xce\x80\xf2\x4a\x5f\
-\x0a\xe6\xc2\x71\xfb\x28\xe8\x02\xe5\x95\x81\x14\x4c\x87\xe3\x76\
-\x50\xd0\x13\xca\x2b\x23\x28\xf8\x10\x8e\xdb\x44\x41\x1f\x28\xaf\
-\x3c\x4d\xc1\x18\x38\xee\x17\x0a\x06\x42\x79\xe5\x35\x0a\x5e\x86\
-\xe3\x56\x51\x30\x02\xca\x2b\xef\x50\xf0\x24\x1c\xb7\x94\x82\xa7\
-\xa1\xbc\x32\x95\x82\xe1\x70\xdc\x7c\x0a\x46\x42\x79\x65\x16\x05\
-\x03\xe0\xb8\xd9\x14\x8c\x87\xf2\xca\x62\x0a\xfa\xc2\x71\x33\x28\
-\x98\x02\xe5\x95\x35\x14\x5c\x09\xc7\x7d\x40\xc1\x4c\x28\xaf\x6c\
-\xa3\xa0\x2b\x1c\x37\x92\x82\x45\x50\x5e\x39\x44\x41\x07\x38\xee\
-\x11\x0a\x56\x43\x79\x24\x1c\xa1\xa0\x0d\x1c\x37\x80\x82\x6d\x50\
-\x1e\x29\x4f\x49\x63\x38\xee\x1a\x0a\x0e\x41\x79\xa4\x0e\x25\xb5\
-\xe1\xb8\xce\x14\x44\x42\x50\xde\x68\x4a\x49\x36\x1c\x77\x32\x25\
-\xd9\x50\xde\x68\x47\x49\x18\x8e\xab\x4f\x49\x03\x28\x6f\x74\xa1\
-\x20\x17\xce\xcb\xa4\xa4\x13\x94\x37\x06\x50\xb0\x13\x2e\xc8\xa7\
-\xa0\x3f\x94\x37\x46\x52\xb0\x0a\x2e\xd8\x44\xc1\x2b\x50\xde\x98\
-\x45\xc1\xc7\x70\xc1\x1c\x0a\xbe\x86\xf2\xc6\x76\x0a\x9e\x81\x0b\
-\xde\xa6\x60\x2b\x94\x27\x2a\x50\x72\x13\x5c\xf0\x10\x25\xd9\x50\
-\x5e\x38\x85\x92\x8e\x70\xc1\xf5\x94\xb4\x85\xf2\x42\x6f\x4a\x6a\
-\xc3\x05\x1d\x29\xb9\x06\xca\x0b\x4f\x50\x70\x08\x6e\xa8\x47\xc9\
-\x23\x50\x5e\xf8\x88\x82\xa5\x70\x43\xb8\x88\x82\x49\x50\x5e\xf8\
-\x89\x82\x89\x70\xc5\x5a\x0a\x56\x40\x79\x20\xb5\x88\x82\x47\xe0\
-\x8a\x2f\x29\xc8\x0f\x43\xb9\xaf\x09\x25\x7f\x86\x2b\x46\x51\xd2\
-\x10\xca\x7d\x97\x52\x72\x2a\x5c\x31\x84\x92\x2e\x50\xee\xbb\x87\
-\x92\xca\x70\x45\x67\x4a\x06\x42\xb9\x6f\x34\x05\xbb\xe1\x8e\x5a\
-\x94\x8c\x84\x72\xdf\x7c\x0a\xe6\xc3\x25\x39\x14\xcc\x82\x72\xdf\
-\x5e\x0a\xc6\xc2\x25\x5f\x53\xb0\x37\x0c\xe5\xb6\x86\x94\xdc\x07\
-\x97\xbc\x40\x49\x5b\x28\xb7\xf5\xa5\xe4\x0a\xb8\xa4\x0f\x25\xf7\
-\x40\xb9\x6d\x02\x25\xad\xe0\x92\xb6\x94\xcc\x80\x72\xdb\x76\x4a\
-\x32\xe1\x92\x8c\x12\x0a\xf2\xd2\xa1\xdc\x75\x22\x25\xab\xe1\x9a\
-\xd5\x94\x9c\x0d\xe5\xae\x3b\x29\x19\x05\xd7\x4c\xa4\xe4\x11\x28\
-\x77\x7d\x4c\xc9\xd5\x70\xcd\x5d\x94\xcc\x83\x72\x55\xca\x3e\x4a\
-\xea\xc0\x35\x6d\x29\x29\xce\x86\x72\x53\x3b\x4a\xd6\xc2\x3d\xa9\
-\x87\x29\xb9\x18\xca\x4d\xf7\x52\xf2\x26\x5c\xf4\x15\x25\xff\x05\
-\xe5\xa6\x19\x94\x5c\x07\x17\x3d\x48\xc9\x0a\x28\x17\x95\xc9\xa3\
-\xa4\x3e\x5c\x74\x3e\x25\x91\xea\x50\xee\xe9\x48\xc9\x46\xb8\x29\
-\xab\x84\x92\x5e\x50\xee\x79\x98\x92\xb1\x70\xd5\x62\x4a\xde\x80\
-\x72\xcf\x1c\x4a\xfa\xc2\x55\x2f\x50\xb2\x1e\xca\x35\x59\x45\x94\
-\x1c\x0f\x57\xf5\xa0\xa8\x21\x94\x5b\x2e\xa4\x64\x0b\xdc\x55\xa5\
-\x94\x92\xdb\xa1\xdc\xf2\x57\x4a\x26\xc0\x65\xf3\x28\x59\x00\xe5\
-\x92\xb4\x1c\x4a\x6e\x86\xcb\x86\x53\xd4\x14\xca\x1d\x97\x51\xd4\
-\x14\x2e\x6b\x43\xd1\xe3\x50\xee\xf8\x98\x92\x1d\x70\x5b\x68\x3b\
-\x25\x9b\xc3\x50\x6e\xa8\x56\x44\xc9\x24\xb8\x6e\x34\x45\xe7\x43\
-\xb9\x61\x00\x45\xb7\xc3\x75\x3d\x29\x1a\x07\xe5\x86\xef\x29\x6a\
-\x08\xd7\x55\x28\xa6\x24\x37\x1b\xca\x79\x2d\x28\x9a\x0f\x0f\xcc\
-\xa6\xa8\x0f\x94\xf3\x9e\xa7\xa8\x3f\x3c\x70\x0f\x45\xb3\xa1\x1c\
-\x97\xba\x93\x92\x92\x9a\xf0\x40\x63\x8a\x22\x0d\xa1\x9c\xd6\x8d\
-\xa2\x2f\xe1\x89\xef\x29\x7a\x00\xca\x69\x1f\x50\xd4\x07\x9e\xb8\
-\x87\xa2\x75\x50\x0e\xab\x5c\x48\x49\x61\x45\x78\xa2\x01\x65\x67\
-\x41\x39\xeb\x76\x8a\x3e\x86\x47\xe6\x53\xf4\x37\x28\x67\x2d\xa2\
-\xe8\x0a\x78\x64\x20\x45\x07\x32\xa0\x9c\x74\x02\x45\x87\xca\xc1\
-\x23\xb5\x4b\x29\xba\x1a\xca\x49\x4f\x53\x34\x1e\x9e\xf9\x86\xa2\
-\x25\x50\x0e\x2a\xbf\x8f\xa2\xae\xf0\xcc\x2d\x94\x5d\x0c\xe5\x9c\
-\xfb\x28\xda\x9d\x06\xcf\x54\x2b\xa6\xe8\x3b\x28\xc7\x64\xed\xa6\
-\xe8\x35\x78\xe8\x23\xca\x3a\x43\x39\x65\x08\x65\x1d\xe1\xa1\x2e\
-\x94\xcd\x85\x72\x48\xc6\x4e\x8a\xb6\x84\xe0\xa1\xf0\x06\xca\xce\
-\x85\x72\xc6\x40\xca\x9e\x85\xa7\x86\x51\xf6\x0d\x94\x23\xd2\xb7\
-\x52\x76\x32\x3c\x55\xb3\x88\xb2\x0e\x50\x4e\xb8\x8d\xb2\x55\xf0\
-\xd8\x07\x94\x7d\x05\xe5\x80\xb4\x5f\x29\xeb\x0b\x8f\x5d\x40\x03\
-\xa7\x41\xc5\xee\x46\xca\xb6\xa7\xc3\x63\xa1\xb5\x94\x4d\x83\x8a\
-\x59\xea\x3a\xca\x86\xc2\x73\xf7\xd0\x40\x3b\xa8\x58\xf5\xa6\xec\
-\x50\x45\x78\xae\x5a\x01\x65\x53\xa1\x62\x14\x5e\x43\xd9\x7f\x21\
-\x0e\x5e\xa7\x81\xd6\x50\xb1\xb9\x8a\xb2\xe2\x7a\x88\x83\x26\x11\
-\xca\x26\x43\xc5\x24\xb4\x92\xb2\x77\x10\x17\x1f\x51\x16\x69\x0d\
-\x15\x8b\x5e\x34\xd0\x0a\x71\x71\x3a\x0d\x2c\x08\x43\x45\x2f\x7b\
-\x2b\x65\x5f\x22\x4e\xe6\xd2\xc0\x2d\x50\xd1\x7b\x81\x06\x3a\x21\
-\x4e\x2e\xa5\x81\x7d\xd5\xa1\xa2\xd5\xba\x84\xb2\x65\x88\x97\xd0\
-\x6a\x1a\x18\x07\x15\xa5\xf0\x77\x34\x70\x0d\xe2\xe6\x26\x9a\x38\
-\x17\x2a\x3a\xb7\xd2\xc0\xa6\x54\xc4\x4d\xfa\x76\x1a\x58\x5d\x06\
-\x2a\x1a\x35\xf6\xd1\xc0\x5d\x88\xa3\x81\x34\x31\x1c\x2a\x1a\xe3\
-\x69\x60\x5f\x36\xe2\xa8\xec\x66\x1a\xc8\x3f\x0e\xca\xde\x79\x34\
-\xf1\x04\xe2\xaa\x1f\x4d\x7c\x01\x65\x2d\x7d\x0d\x0d\x14\xd6\x42\
-\x5c\xa5\xae\xa5\x89\x9e\x50\xb6\x46\xd0\xc4\xf3\x88\xb3\x6b\x68\
-\x62\x6b\x79\x28\x3b\xc7\xe5\xd3\x40\x4e\x45\xc4\x59\x78\x25\x4d\
-\xbc\x08\x65\x67\x3a\x4d\xdc\x8a\xb8\xeb\x4e\x13\x25\x6d\xa0\x6c\
-\x5c\x49\x13\x3f\xa4\x20\xfe\x16\xd1\xc4\xc2\x30\x94\xb9\xf2\xdb\
-\x68\xe2\x3c\x24\x80\x4e\x34\x32\x18\xca\xdc\xdf\x68\x62\x0a\x12\
-\xc2\x74\x9a\x28\x3a\x1d\xca\xd4\x9f\x69\xa2\xf0\x78\x24\x84\x66\
-\xc5\x34\xb1\xb9\x2a\x94\x99\x13\x0e\xd3\xc4\x33\x48\x10\xcf\xd3\
-\xc8\x17\x21\x28\x13\x99\x3f\xd2\xc4\xae\x0a\x48\x10\x15\x76\xd2\
-\xc8\x70\x28\x13\xe3\x69\xa4\x1f\x12\x46\x5f\x1a\x29\x3d\x17\x4a\
-\x76\x33\x8d\x2c\x0b\x23\x61\x84\x17\xd1\xc8\x8e\x5a\x50\x92\x36\
-\x05\x34\x72\x0e\x12\xc8\x69\x11\x1a\x99\x9d\x02\x75\x74\x15\xd6\
-\xd1\xc8\x64\x24\x94\xb7\x69\xe6\x09\xa8\xa3\x9b\x4c\x23\x05\xc7\
-\x22\xa1\xd4\x3a\x44\x23\x91\xae\x50\x47\x33\x88\x66\x9e\x44\x82\
-\xb9\x93\x66\xf6\xd4\x87\x3a\xb2\xd3\x8a\x68\x64\x47\x36\x12\x4c\
-\x68\x0e\xcd\x7c\x57\x06\xea\x48\xaa\x6e\xa6\x99\x1b\x90\x70\x9a\
-\x14\xd0\xcc\x8b\x50\x47\x10\x9a\x46\x33\x9f\x23\x01\x0d\xa5\xa1\
-\x1e\x50\x7f\x6c\x38\xcd\xe4\xd4\x44\x02\x4a\x5d\x4a\x33\x87\xda\
-\x42\xfd\x91\x3f\x95\xd2\x4c\x77\x24\xa4\x56\xc5\x34\x93\xd3\x14\
-\xea\xf7\xce\x2b\xa0\x99\xb7\x90\xa0\x1e\xa3\xa1\x4d\xf5\xa0\xfe\
-\x53\xbb\x43\x34\xb3\x3e\x1b\x09\x2a\xfd\x27\x1a\x5a\x5d\x0d\xea\
-\xb7\x9a\xed\xa6\x99\xd2\x33\x91\xb0\x4e\x2d\xa6\xa1\xc5\xd9\x50\
-\xff\xae\xde\x66\x1a\x7a\x02\x09\x6c\x08\x4d\xcd\x4c\x87\xfa\x97\
-\x6a\x6b\x68\x68\x69\x1a\x12\x58\x68\x2a\x4d\x7d\x94\x02\xf5\xbf\
-\xb2\x97\xd0\x50\xfe\x09\x48\x68\x95\x36\xd0\xd4\x5b\x21\xa8\x7f\
-\x2a\x3b\x8b\xa6\x06\x20\xc1\xb5\x2b\xa4\xa9\x67\xa1\xfe\x47\xca\
-\xc7\x34\xf5\x65\x08\x89\xee\x0e\x1a\xbb\x17\xea\xbf\x85\x46\xd3\
-\xd4\xde\x3a\x48\x7c\x13\x69\xec\x26\x28\xe0\x39\x1a\xbb\x12\x3e\
-\x90\xfd\x33\x4d\x95\xf6\x80\x1a\x4a\x63\xe3\xe1\x0b\x2d\xf2\x68\
-\xaa\xf0\x02\x24\xbb\x9b\x69\x6c\x53\x05\xf8\x43\x5f\x1a\x2b\xe8\
-\x81\xe4\x76\x77\x84\xa6\x8a\x3a\xc0\x2f\xc6\xd0\x58\xe9\x1d\x48\
-\x62\xe1\x17\x69\xee\x46\xf8\x46\xb9\x95\x34\xf7\x38\x92\x56\xfa\
-\x24\x9a\x7b\x16\x3e\xd2\xf4\x10\xcd\x8d\x49\x45\x72\xaa\xf0\x0d\
-\xcd\x4d\x0d\xc3\x4f\xae\xa2\x85\x69\x99\x48\x46\x75\x56\xd0\xdc\
-\xb2\x2c\xf8\xcb\x48\x5a\x58\x58\x0d\xc9\xe7\x84\x4d\x34\xb7\xbd\
-\x2e\x7c\x26\x7d\x09\x2d\xfc\x72\x2c\x92\xcd\x99\x7b\x69\x2e\xbf\
-\x3d\x7c\xe7\xd8\x7d\xb4\xb0\xe3\x64\x24\x97\xee\xf9\x34\x17\xb9\
-\x12\x3e\x74\x56\x1e\x2d\x1c\xea\x84\x64\x72\x5b\x29\x2d\xdc\x0f\
-\x5f\xba\xb8\x98\x16\x8a\xae\x45\xf2\x78\x8c\x36\x26\xc0\xa7\xae\
-\x8d\xd0\x42\xe4\x6e\x24\x89\xd4\xd1\xb4\x31\xbf\x2c\xfc\xaa\x3f\
-\xad\xbc\x9a\x8e\x64\x50\x75\x3a\x6d\x6c\xac\x01\xff\x7a\x88\x56\
-\x96\x36\x46\xf0\x75\xdc\x42\x1b\x07\x4f\x82\x9f\xbd\x4c\x2b\x87\
-\xfe\x8c\x80\x4b\x79\xb0\x94\x36\x4a\xbb\xc2\xd7\x42\xef\xd0\xce\
-\xd8\x2c\x04\xd9\x31\xb3\x69\xe7\x2e\xf8\x5c\xda\x67\xb4\xb3\xa6\
-\x15\x82\xab\xdb\x6e\x5a\xba\x1d\x7e\x97\x31\x87\x76\x0a\xee\x44\
-\x40\x95\x79\x81\xf6\xfa\xc3\xef\x2a\x2e\xa3\xa5\x8f\x2b\x23\x88\
-\x1a\x2d\x61\x34\x06\xc1\xef\x6a\xac\xa5\xa5\x4d\x67\x22\x78\xae\
-\x39\xc8\xe8\xdc\x0d\xbf\x6b\xb8\x95\x96\x4a\x86\x87\x11\x2c\x99\
-\xa3\x19\xb5\x61\xf0\xbb\xe6\x7b\x69\xeb\xeb\x5a\x08\x92\x96\xab\
-\x19\x83\xfb\xe1\x77\xa7\x1e\xa6\xad\x5d\x17\x23\x30\x42\x77\x14\
-\x30\x26\x0f\xc3\xef\x3a\x15\xd2\xda\xe4\xfa\x08\x86\xb6\xdf\x31\
-\x56\x8f\xc3\xef\xce\x3b\x40\x6b\x79\xc3\xd3\xe1\x7f\x95\x5f\x2b\
-\x65\xec\x9e\x86\xdf\xb5\xdc\x46\x7b\xbf\x5c\x08\x9f\x0b\xf7\xdb\
-\x4d\x47\x3c\x0f\xbf\x6b\xb0\x9a\x51\xf8\xb8\x01\xfc\xac\xdd\x42\
-\x3a\xe5\x25\xf8\x5d\x95\x79\x8c\x42\xde\x88\x74\xf8\x55\x95\xd7\
-\x4b\xe9\x9c\x57\x42\xf0\xb9\x8c\x29\x8c\xc6\xda\xae\xf0\xa5\xf0\
-\xcd\x7b\xe8\xa8\x51\x21\xf8\x5c\xca\x28\x46\x65\x4a\x43\xf8\xcf\
-\x29\x8b\xe9\xb4\x37\xc3\xf0\xbb\xfb\x19\x95\xfc\x07\xca\xc2\x5f\
-\xaa\xfe\x2d\x42\xe7\x8d\x09\xc3\xef\x6e\x2c\x61\x54\xd6\x5d\x06\
-\x1f\x49\xbb\x6d\x2f\x5d\x31\x3e\x05\x7e\x77\x71\x2e\xa3\xb3\xfc\
-\xaa\x14\xf8\x43\xb9\x81\x9b\xe9\x96\x77\x53\xe1\x77\xa7\xe4\x30\
-\x4a\xeb\x6e\x4e\x47\xe2\xab\x34\x22\x87\x2e\x7a\x3f\x15\x7e\xd7\
-\x78\x3d\xa3\xb5\x7d\x48\x36\x12\x5b\xad\x67\x0e\xd2\x5d\x93\xd3\
-\xe0\x77\x35\x97\x32\x6a\xfb\x1e\xad\x86\xc4\x75\xdc\x6b\x05\x74\
-\xdd\x94\x32\xf0\xbb\xec\x19\x8c\x5e\xee\x4b\xf5\x90\x98\x5a\x4c\
-\x28\xa1\x17\x3e\x4d\x87\xdf\xa5\xbd\xc5\x18\x14\x8d\x69\x86\xc4\
-\x73\xfa\x27\xf4\xca\xb4\xb2\xf0\xbd\xeb\x0e\x33\x06\x91\xc9\xed\
-\x90\x58\xba\xcc\x66\x2c\xb6\xef\xa1\x8d\x19\x19\xf0\xbd\x26\xcb\
-\x18\x93\x6f\xae\x2f\x8f\x44\x51\x63\xc0\x32\xc6\xe4\x8b\xea\xad\
-\x76\xd3\xc6\xd7\xe5\xe0\x7b\xe9\xaf\x30\x36\x79\xef\x5d\x9c\x8a\
-\xf8\x2b\x77\xf5\xe7\x25\x8c\x49\xd1\x90\x10\x70\xd2\x2e\xda\xf8\
-\x26\x13\xfe\x77\xf9\x3e\xc6\x28\xe7\xe5\x53\x10\x57\x29\x9d\xde\
-\x3e\xc4\x18\xad\x3f\x05\xff\x70\xe2\x0e\xda\xf8\x36\x1b\xfe\x57\
-\x7f\x3e\x63\xf6\xcb\x03\xc7\x21\x5e\x5a\x3f\xb7\x8d\x31\x9b\x58\
-\x01\xff\xd4\x6c\x3b\x6d\xcc\x2b\x0f\xff\x4b\x7d\x32\xc2\xd8\xcd\
-\xbf\xad\x2a\xbc\x57\x6f\xe8\x2a\xc6\x2e\xef\x26\xfc\x9f\xc6\x5b\
-\x69\xe3\xbb\x0a\x08\x80\xce\x3b\xe9\x80\xa2\xa9\x57\x94\x85\x97\
-\x2a\xde\x38\x3b\x42\x07\xac\x3c\x11\xff\xe6\xf8\xcd\xb4\xb1\xa8\
-\x12\x02\xa0\xe6\x57\x74\xc4\x81\x09\x37\x1e\x07\x4f\x84\x4e\xea\
-\x3f\xa5\x80\x8e\x18\x95\x81\xdf\x38\xf6\x57\xda\x58\x5a\x19\x01\
-\x10\x1e\x5e\x42\x87\x6c\x1a\x7b\x7d\x7d\xb8\xab\xd9\x6d\xef\xe7\
-\xd0\x21\xfb\x7b\xe2\x3f\x35\xd8\x40\x1b\xcb\xaa\x22\x08\xce\xdc\
-\x44\xe7\xac\x7f\xf3\xda\x3a\x70\x47\xa3\x7e\xef\xee\xa0\x73\x16\
-\x34\xc4\xef\xd5\x5b\x47\x1b\x3f\x54\x47\x10\x54\x9e\x42\x47\xfd\
-\x3c\xaa\x57\x0d\x38\xab\x61\x9f\x71\x5b\xe8\xa4\xc8\x53\x69\xf8\
-\x23\xc7\xfc\x42\x1b\xab\x6a\x20\x10\x06\xe4\xd3\x61\x3f\xbe\xd2\
-\xb3\x69\x19\x38\x21\xa3\xc5\x75\xa3\x37\xd2\x61\x3f\x9d\x8d\x23\
-\xa8\xbd\x9a\x36\x7e\xaa\x85\x40\x68\x38\x85\xce\x2b\xf9\xe5\xb3\
-\xe7\x6f\x39\xa7\x0e\xa2\x14\x6e\xd8\xb9\xff\xcb\x5f\xfe\x1a\xa1\
-\xe3\xf2\x86\x95\xc1\x11\xd5\xfc\x91\x36\x7e\xae\x83\x60\xb8\xe8\
-\x17\xba\xe4\xf0\xd2\xf7\x1e\xba\xa6\x6d\x79\x98\xab\x7a\xfa\x0d\
-\x4f\x4c\x5e\x59\x40\x97\x7c\xd2\x00\x47\x53\x7d\x25\x6d\xac\xad\
-\x8b\x60\x48\xbf\x2f\x97\x6e\xda\x3e\xfb\x8d\x27\x86\xf5\xbf\xa1\
-\x67\x97\x33\x5b\x1e\x57\xbd\x1c\x7e\x23\x94\x55\xab\x51\xeb\x0e\
-\x17\x5d\xd9\x77\xe0\xf0\xa7\xc6\xcc\xdf\x43\x37\x6d\xba\x0c\x82\
-\x6a\xcb\x69\x63\x7d\x7d\x04\x44\xbd\x0f\xe8\x99\xd2\x03\x5b\x57\
-\x2f\x9e\xf5\xc9\xfb\x9f\xfd\x7d\xe9\xcf\xdb\x0f\x45\xe8\x95\xe2\
-\xa7\x33\x21\xaa\xf2\x3d\x6d\x6c\x6c\x88\xa0\x38\xff\x27\x06\xdb\
-\xb7\xcd\x61\xa2\xf2\x62\xda\xd8\x74\x1c\x82\x22\x6d\xc8\x21\x06\
-\x57\xce\x0d\x21\x98\xa9\xb8\x90\x36\xb6\x34\x42\x60\xd4\x9e\xc0\
-\x80\x8a\xbc\x5e\x19\xc6\x2a\xcc\xa7\x8d\x6d\x4d\x11\x1c\x1d\x7f\
-\x60\x10\x2d\x3b\x0d\x36\xb2\xe7\xd0\xc6\x8e\x13\x10\x1c\xa9\x03\
-\x0f\x30\x68\x76\x0e\x48\x81\x9d\xac\xd9\xb4\xb1\xb3\x39\x02\xa4\
-\xc6\xd8\x08\x83\x24\xe7\xee\x4c\x58\xcb\x9c\x45\x1b\x39\x2d\x11\
-\x24\xa7\x7f\xc3\xc0\xd8\x7d\x6f\x16\xa2\x51\xee\x2b\xda\xd8\xd3\
-\x1a\x81\x72\xee\xb7\x0c\x84\xbd\xf7\x65\x23\x4a\x65\xa7\xd3\xc6\
-\xde\xb6\x08\x96\xf3\xe7\xd2\xf7\xf6\x8d\x28\x8f\xe8\xa5\x7f\x4e\
-\x1b\xfb\x4f\x41\xc0\x74\x5e\x40\x5f\xdb\xff\x60\x05\xc4\xa4\xcc\
-\x54\xda\x38\x70\x1a\x82\xe6\xa2\x85\xf4\xad\x03\x0f\x57\x44\xac\
-\xd2\x3e\xa2\x8d\x83\x67\x22\x70\x2e\x98\x16\xa1\x1f\x1d\x7c\xac\
-\x32\x1c\x90\xf6\x01\x6d\x1c\xee\x88\xe0\x39\xe1\x8d\x7c\xfa\x4d\
-\xce\xe3\x55\xe0\x8c\xd4\x89\xb4\x91\x7b\x2e\x02\xa8\xfa\x83\xbb\
-\xe8\x27\xb3\xaf\x4a\x87\x63\x52\xde\xa1\x8d\xbc\x0b\x10\x44\x65\
-\x6f\x5c\x45\x9f\xd8\xfb\x42\x33\x38\x2a\xfc\x36\x6d\xe4\x77\x41\
-\x20\x85\x3a\x7f\x50\xc4\xc4\x37\xaf\x77\x06\x9c\x16\x7e\x8b\x36\
-\x0a\xba\x22\xa0\xaa\x0d\x5a\xc5\x84\x76\xe0\x95\x16\x70\x43\xe8\
-\x0d\xda\x28\xbc\x04\x81\x75\xea\x1b\x07\x99\xa8\x16\xdd\x98\x09\
-\x97\x84\x46\xd2\x46\x51\x77\x04\x57\xe6\x0d\x73\x98\x80\x0e\xbf\
-\x7e\x32\x5c\x14\xfa\x2b\x6d\x14\xf7\x44\x90\x35\x1a\xb6\x8c\x09\
-\xa5\xe0\xf3\x9b\xca\xc3\x65\x2f\xd0\x46\x49\x2f\x04\x5b\xe3\xfb\
-\x96\x33\x41\xec\x1d\xdf\x33\x1b\x1e\x78\x96\x36\x4a\xae\x45\xd0\
-\x35\x19\xbe\x82\x71\xb7\xf1\xa5\x73\x53\xe1\x91\x27\x69\xa3\xb4\
-\x37\x82\xaf\xc9\xb0\x6f\x8b\x19\x3f\x4b\x1f\x68\x05\x2f\x3d\x4a\
-\x1b\xa5\x7d\x91\x0c\x2a\x5c\xfe\xfa\xaf\x8c\x83\xe2\xaf\xee\xac\
-\x07\xaf\x3d\x48\x1b\x91\x7e\x48\x12\x27\xdc\x35\x3d\x9f\x5e\xda\
-\x35\xe9\x9a\x8a\x88\x87\xe1\xb4\x11\xb9\x0d\x49\x23\xa3\xcb\xa3\
-\x5f\x1f\xa2\x07\x8a\x16\xbe\x74\xf5\xb1\x88\x9b\x7b\x69\xa5\x3f\
-\x92\x49\x4a\xeb\xdb\xc6\xaf\xa7\x8b\x36\x4d\x1a\x74\x7a\x59\xc4\
-\xd7\x60\x5a\x19\x84\x64\x53\xb3\xfb\x33\x33\x73\xe8\xb8\xdc\xd9\
-\x4f\x75\xaf\x8d\x44\x30\x90\x56\x86\x20\x19\xd5\xec\xf4\x97\x31\
-\x4b\xf2\xe9\x8c\x3d\x8b\xc6\xde\xda\x3a\x15\x09\xe3\x0e\x5a\x19\
-\x8a\x64\x95\xd2\xb4\xe7\x43\xe3\xe7\x6c\x29\x65\x94\xf2\x7f\xfa\
-\xfc\xe5\xbf\x74\x6f\x55\x1e\x89\xe6\xd6\x08\x6d\x8c\x40\x72\x2b\
-\x73\xfc\xf9\x37\x3e\x3a\x7e\xce\xaf\xb9\x34\x14\xd9\xfc\xf7\x31\
-\x0f\xfc\xf9\xcc\xda\x21\x24\xaa\x9b\x22\xb4\xf1\x10\xd4\x3f\x94\
-\xad\xd3\xe2\x9c\x1e\x37\x0f\x7b\x6e\xf4\xc7\xd3\x66\xce\x59\xb4\
-\x7c\xf5\xfa\xad\x39\x07\x73\x77\xff\xfa\xe3\xa2\x6f\x3e\x9b\x34\
-\xfa\xe5\xa7\xee\x1f\x7c\xeb\x75\x7f\xea\x72\x56\x9b\xe3\xd3\x91\
-\xf0\x6e\x28\xa5\x8d\xc7\xa0\x02\xe6\xba\x52\xda\x78\x0a\x2a\x60\
-\xae\x2e\xa1\x8d\xe7\xa0\x02\xe6\xca\x62\xda\x78\x11\x2a\x60\x7a\
-\x14\xd3\xc6\x2b\x21\xa8\x60\xb9\xac\x88\x36\x46\x85\xa0\x82\xa5\
-\x5b\x21\x6d\xfc\x2d\x0c\x15\x2c\x17\x15\xd0\xc6\x98\x30\x54\xb0\
-\x74\xce\xa7\x8d\x71\x29\x50\xc1\x72\x7e\x1e\x6d\xbc\x9b\x02\x15\
-\x2c\xe7\xe4\xd2\xc6\xa4\x54\xa8\x60\xe9\x70\x88\x36\x3e\x4c\x83\
-\x0a\x96\x33\x0e\xd2\xc6\x94\x32\x50\xc1\x72\xda\x01\xda\xf8\x34\
-\x1d\x2a\x58\xda\xef\xa3\x8d\x69\x65\xa1\x82\xe5\xe4\xbd\xb4\x31\
-\x23\x03\x2a\x58\x5a\xef\xa6\x8d\xaf\xcb\x41\x05\x4b\x8b\x1c\xda\
-\xf8\x26\x13\x2a\x58\x9a\xef\xa4\x8d\x6f\xb3\xa1\x82\xa5\xd9\x76\
-\xda\x98\x57\x1e\x2a\x58\x9a\x6c\xa5\x8d\x05\x15\xa0\x82\xa5\xd1\
-\x16\xda\x58\x54\x09\x2a\x58\x8e\xdb\x44\x1b\x4b\x2a\x43\x05\x4b\
-\xc3\x8d\xb4\xb1\xac\x2a\x54\xb0\xd4\x5f\x4f\x1b\x2b\xaa\x43\x05\
-\x4b\xdd\x5f\x68\x63\x55\x0d\xa8\x60\xa9\xb3\x86\x36\x7e\xaa\x05\
-\x15\x2c\xb5\x7e\xa2\x8d\x35\x75\xa0\x82\xa5\xc6\x2a\xda\x58\x5b\
-\x17\x2a\x58\xaa\xad\xa0\x8d\xf5\xf5\xa1\x82\xa5\xea\x32\xda\xd8\
-\xd8\x10\x2a\x58\x2a\x2f\xa1\x8d\x4d\xc7\x41\x05\x4b\xa5\x45\xb4\
-\xb1\xa5\x11\x54\xb0\x54\x58\x40\x1b\xdb\x9a\x40\x05\x4b\xf9\xb9\
-\xb4\xb1\xfd\x04\xa8\x60\xc9\xfa\x96\x36\x76\x36\x87\x0a\x96\xcc\
-\x6f\x68\x23\xa7\x25\x54\xb0\x94\xfb\x9a\x36\x76\xb7\x86\x0a\x96\
-\x8c\x19\xb4\xb1\xb7\x2d\x54\xb0\x94\x9d\x46\x1b\xfb\xda\x43\x05\
-\x4b\xfa\xa7\xb4\x71\xe0\x34\xa8\x60\x29\x33\x85\x36\x0e\x9e\x09\
-\x15\x2c\x69\x1f\xd2\xc6\xe1\x8e\x50\xc1\x92\x3a\x89\x36\x72\xcf\
-\x85\x0a\x96\x94\x77\x69\x23\xef\x7c\xa8\x60\x49\x19\x47\x1b\xf9\
-\x5d\xa0\x82\x25\x3c\x86\x36\x0a\xba\x42\x05\x4b\xf8\x6f\xb4\x51\
-\x78\x09\x54\xb0\x84\x46\xd1\x46\x51\x77\xa8\x60\x09\xbd\x42\x1b\
-\xc5\x3d\xa0\x02\xe6\x45\xda\x28\xee\x05\x15\x30\xcf\xd1\x46\xc9\
-\x35\x50\x01\xf3\x14\x6d\x94\xf6\x86\x0a\x98\xc7\x68\xa3\xb4\x0f\
-\x54\xc0\x3c\x44\x1b\x91\x7e\x50\x01\x33\x82\x36\x22\xb7\x42\x05\
-\xcc\x50\x5a\xb9\x13\x2a\x60\x86\xd0\xca\x5d\x50\x01\x33\x88\x56\
-\x86\x40\x05\x4c\x7f\x5a\x19\x0a\x15\x30\xb7\x45\x68\x63\x04\x54\
-\xc0\xf4\x8b\xd0\xc6\x40\xa8\x80\xe9\x5b\x4a\x0b\x25\x5d\xa0\x02\
-\xa6\x77\x29\x2d\xec\x6f\x04\x15\x30\xd7\x96\xd0\xc2\x54\xa8\xa0\
-\xe9\x55\x42\x0b\x67\x40\x05\x4d\xcf\x62\x9a\xfb\x1a\x2a\x70\x2e\
-\x2f\xa2\xb1\xd2\xaa\x50\x81\x73\x49\x21\x8d\x5d\x07\x15\x3c\x5d\
-\x0b\x68\x6a\x02\x54\x00\x75\xc9\xa7\xa1\x05\x50\x41\x74\x41\x1e\
-\xcd\xfc\x0a\x15\x48\xe7\xe6\xd2\x48\x01\x54\x30\x75\x3c\x4c\x13\
-\x39\x50\x01\x75\xe6\x21\x1a\x58\x0e\x15\x54\xa7\x1f\xa0\x6c\x1a\
-\x54\x60\x9d\xb2\x9f\xa2\x61\x50\xc1\xd5\x76\x2f\x25\x27\x41\x05\
-\x58\x9b\x3d\x3c\xba\xf5\x50\x81\xd6\x32\x87\x47\x75\x2b\x54\xb0\
-\x9d\xb4\x8b\x47\xf1\x73\x2a\x54\xc0\x9d\xb0\x83\x47\xd6\x1d\x2a\
-\xf0\x9a\x6e\xe3\x91\x3c\x0b\x95\x04\x1a\x6f\xe1\x1f\xfb\x2c\x0c\
-\x95\x0c\x1a\xae\xe0\x1f\xf9\x3c\x1b\x2a\x39\x64\x4e\xe4\xef\x3d\
-\x11\x86\x4a\x1a\x37\x6d\xe5\x6f\xfd\x78\x31\x54\x32\xc9\x18\xbc\
-\x85\xff\xf2\x53\xef\x14\xa8\x64\xd3\x6a\xe8\xa7\xdf\xef\x2c\xdc\
-\xb2\x68\xf2\x9d\xc7\xe3\x5f\xfe\x1f\xc0\x17\x12\x71\xed\xdb\x62\
-\xa9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x29\x40\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0a\xa8\x00\x00\x0a\xa8\
-\x01\xd0\x13\x69\x5e\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x79\xb8\x5d\x55\x7d\xff\xf1\x77\x46\x20\
-\x21\x21\x20\x01\x14\x65\x10\x05\x04\xca\x20\x54\x44\x99\x55\x50\
-\x01\x15\x2a\x28\x52\x51\xb0\x5a\x67\xaa\xd6\xa2\xd5\x56\x50\xb1\
-\x8a\xb5\x6a\xab\x58\x7e\x38\x30\x54\xa5\x0e\x50\x99\x45\x24\x8a\
-\xa2\x22\x28\xce\x28\x20\x18\x20\x4c\x32\x05\xc2\x90\xf1\xfe\xfe\
-\x58\xf7\x62\x8c\x09\xb9\xf7\xdc\xb3\xd6\x77\xed\xb3\xde\xaf\xe7\
-\x59\x8f\x0f\x11\xf6\xfe\xae\x9d\xb3\xce\xfe\x9c\x3d\xac\x05\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x69\x45\
-\x13\xa2\x0b\x50\xa8\x89\xc0\x26\xc0\x96\xc0\x16\xc0\x4c\x60\x5d\
-\x60\xfa\x70\x5b\x0c\x2c\x00\x1e\x1c\x6e\xb7\x03\xd7\x0e\xb7\xbb\
-\x03\xea\x95\xf4\xe7\x46\xc6\xf0\x56\xa4\x31\x3c\x83\x55\x8f\xe1\
-\x05\xfc\xf9\x18\xbe\x27\xa0\x5e\x55\xc4\x00\xd0\x96\x0d\x80\xbd\
-\x81\x7d\x80\xdd\x48\x5f\x1a\x6b\xf6\xb8\xad\xbb\x81\x5f\x03\xdf\
-\x05\xe6\x00\x3f\x04\x1e\x19\x7f\x89\x92\x1e\xc3\x86\xa4\xf1\xbb\
-\x0f\xf0\x4c\x52\x78\xef\x75\x0c\xdf\xc5\x9f\x8f\xe1\x1f\xe1\x18\
-\x96\x06\xca\x53\x80\xe3\x81\x5f\x02\xcb\x80\xa1\x4c\xed\x61\xe0\
-\x12\xe0\x68\x60\x9d\x22\x3d\x93\xda\xb0\x25\xf0\x7e\xe0\x57\xe4\
-\x1b\xbf\x43\xc0\x43\xc0\xc5\xc0\x51\xa4\xab\x81\x92\x3a\x68\x3a\
-\xf0\x7a\xe0\x72\xf2\x7e\x61\x3c\xd6\x17\xc9\x97\x81\xfd\xf1\x2a\
-\x93\xd4\x8b\xb5\x81\x37\x92\xae\xac\x45\x8d\xe1\x2f\x02\xcf\xcb\
-\xdd\x51\x49\xfd\x31\x03\x38\x06\xb8\x8d\x98\x2f\x8d\x95\xb5\x9f\
-\x03\x47\x02\x93\x32\xf6\x5b\x1a\x14\x33\x81\x63\x49\x97\xe7\xa3\
-\xc7\xae\x63\x58\xea\x80\xe9\xc0\x07\x81\xf9\xc4\x7f\x59\xac\xaa\
-\x5d\x03\x1c\x96\xeb\x00\x48\x1d\x37\x03\xf8\x37\xe0\x7e\xe2\xc7\
-\xea\xaa\xda\xaf\x81\x97\xe6\x3a\x00\x92\xc6\xee\x20\xe0\x0f\xc4\
-\x7f\x39\x8c\xb6\xcd\x01\xb6\xcd\x71\x20\xa4\x8e\x3a\x08\x98\x4b\
-\xfc\xd8\x1c\x6d\xbb\x14\xd8\x26\xcb\x91\x90\x34\x2a\x9b\x01\x17\
-\x11\xff\x65\xd0\x4b\x5b\x08\x9c\x00\x4c\xed\xf7\x41\x91\x3a\xe4\
-\xc9\xc0\xb7\x88\x1f\x8f\xbd\xb4\x47\x80\x0f\xe0\x18\x96\x8a\x7b\
-\x31\xe9\x35\xbc\xe8\x2f\x81\xf1\xb6\x9f\x90\xde\x52\x90\x5a\x73\
-\x30\xe9\x3d\xfc\xe8\x31\x38\xde\x76\x25\x69\xfe\x01\x49\x99\xad\
-\x01\x7c\x92\xbc\xaf\xf3\x95\x6e\xf3\x81\xc3\xfb\x79\x90\xa4\x8a\
-\xad\x49\x1a\xc3\xd1\xe3\xae\xdf\x63\xf8\x65\xfd\x3c\x48\x92\xfe\
-\xdc\x7a\xc4\xbd\xd6\x57\xa2\x9d\x80\xaf\x0c\x6a\xb0\xad\x0f\x5c\
-\x41\xfc\x58\xcb\xd5\x8e\xef\xdf\xa1\x92\x34\xe2\x09\xa4\x57\x71\
-\xa2\x07\x78\xee\x76\x1a\x30\xb9\x4f\xc7\x4c\xaa\xc9\xa6\xa4\x37\
-\x61\xa2\xc7\x58\xee\xf6\x05\x1c\xc3\x52\xdf\x3c\x0d\xb8\x89\xf8\
-\x81\x5d\xaa\x7d\x03\x58\xab\x2f\x47\x4e\xaa\xc3\x76\xc0\x2d\xc4\
-\x8f\xad\x52\xed\x2c\x7a\x9f\x9e\x58\xd2\xb0\xcd\x81\x5b\x89\x1f\
-\xd0\xa5\xdb\xb9\xf8\x2b\x42\x83\x61\x0b\xea\x9a\x98\xab\x54\xfb\
-\x06\x8e\x61\xa9\x67\xb3\x81\xdf\x12\x3f\x90\xa3\xda\x19\xf8\x4c\
-\x80\xba\x6d\x03\xd2\xaa\x7b\xd1\x63\x29\xaa\x9d\x86\x63\xb8\x6a\
-\x4e\xed\x58\xa7\x99\xc0\xb7\x49\x97\x0e\x5b\xb5\x3d\xe9\x56\xc0\
-\x25\xd1\x85\x48\x3d\x98\x85\x13\xe6\xec\x00\x4c\x21\x1d\x07\x49\
-\xa3\xf4\x35\xe2\xd3\x7b\x2d\xed\x95\xe3\x3c\x96\x52\x69\x13\x80\
-\xb3\x89\x1f\x3b\xb5\xb4\x23\xc6\x77\x38\xa5\x76\xbc\x95\xf8\x01\
-\x5b\x53\x7b\x80\xf4\x20\xa4\xd4\x15\xef\x20\x7e\xdc\xd4\xd4\x1e\
-\x00\xb6\x1e\xd7\x11\x95\x1a\xb0\x0b\x69\x8a\xcd\xe8\x01\x5b\x5b\
-\xfb\x25\x30\x6d\x1c\xc7\x55\x2a\xe5\x19\xa4\xa9\xae\xa3\xc7\x4c\
-\x6d\xed\x17\xf8\x76\x4f\x75\x7c\x06\xa0\x1e\x6b\x92\xee\x77\x6f\
-\x10\x5d\x48\x85\x36\x20\xad\x78\xf8\xcd\xe8\x42\xa4\xc7\xb0\x16\
-\xe9\x7e\xf7\xfa\xd1\x85\x54\x68\x43\xd2\x4c\xa6\xdf\x8a\x2e\x44\
-\xaa\xd1\x71\xc4\xa7\xf4\x9a\xdb\x12\x60\xa7\x5e\x0f\xae\x54\xc0\
-\x09\xc4\x8f\x93\x9a\xdb\x62\xd2\x83\x81\x92\x96\xf3\x14\xe0\x61\
-\xe2\x07\x68\xed\xed\xc7\xc0\xc4\x1e\x8f\xb1\x94\xd3\x96\x78\xfb\
-\x6e\x34\xed\x7b\xf8\x6a\x60\x35\xbc\x05\x50\x87\x2f\xe1\x43\x32\
-\xa3\xb1\x31\x70\x33\x70\x75\x74\x21\xd2\x0a\xbe\x02\x3c\x35\xba\
-\x88\x0e\xd8\x04\xb8\x91\x34\xb5\xb9\xd4\xbc\xdd\x88\x4f\xe5\x5d\
-\x6a\x37\xe1\x1a\xe4\xaa\xcb\xbe\xc4\x8f\x8b\x2e\xb5\xb9\x38\x86\
-\xab\xe0\xa5\x98\x78\x17\x01\xfb\x07\xd7\xb0\x8c\xf4\x94\xee\x95\
-\xa4\x99\xcb\x6e\x27\xdd\x92\x98\x08\xac\x0d\x6c\x46\xba\x42\xb1\
-\x3b\x69\x61\xa2\x68\xaf\x05\x3e\x1b\x5d\x84\x34\xec\xdb\xa4\x10\
-\x10\xe9\x4e\x60\x0e\x70\x15\x69\x0c\xdf\x0a\x3c\x44\x3a\xd1\x4e\
-\x23\x8d\xe1\x6d\x49\x63\x78\x57\xd2\x03\x79\x91\x8e\x02\x4e\x0d\
-\xae\x41\x0a\xf5\xd7\xc4\x26\xf1\x1f\x02\xaf\x03\x1e\x37\x86\x9a\
-\xb7\x03\x3e\x44\xec\x1a\x05\xbf\xc7\x79\xc6\x55\x87\x67\x11\x37\
-\x0e\x16\x92\xa6\xdb\xdd\x8b\xb1\xfd\x98\x9b\x09\x1c\x4d\x7a\xa6\
-\x26\xaa\xf6\x6b\xf1\x16\xb4\x1a\x17\x35\xe3\xdf\x65\xc0\x9e\xe3\
-\xac\x7d\x0d\xe0\x0d\xa4\xab\x05\x11\x7d\x38\x7c\x9c\xf5\x4b\xfd\
-\xf0\x0d\xca\x7f\xf6\x97\x91\xae\x80\x3d\xa9\x0f\xf5\xef\x47\xdc\
-\x52\xe3\x87\xf6\xa1\x7e\xa9\x93\xd6\xa7\xfc\x84\x21\xf3\x81\x57\
-\xd1\xdf\x5b\x3f\xb3\x80\x93\x0b\xf7\x63\x08\xb8\xb8\x8f\x7d\x90\
-\x7a\xb1\x21\xe9\xd5\xb6\x92\x9f\xfb\x1b\x48\x57\x1d\xfa\x69\x32\
-\xf0\x2e\x60\x51\xe1\xbe\x5c\xd0\xe7\x7e\x48\x9d\xf1\x16\xca\x0e\
-\xb6\x9f\x93\x96\x26\xcd\xe5\x30\xe0\xc1\x82\xfd\x59\x0a\x3c\x31\
-\x63\x7f\xa4\xd5\x79\x3b\x65\xc7\xf0\xf9\xc0\x3a\x19\xfb\xf3\x2c\
-\xe0\x8e\x82\xfd\x59\x0c\x3c\x3e\x63\x7f\xa4\x6a\x5d\x45\xb9\x81\
-\x76\x19\xe9\x97\x7a\x6e\xbb\x01\xf7\x14\xec\xd7\xbb\x0a\xf4\x49\
-\x5a\x95\x92\x97\xce\xcf\xa0\xcc\x73\x2f\x4f\x25\x3d\xa5\x5f\xaa\
-\x5f\xef\x28\xd0\x27\xa9\x2a\x4f\xa5\xdc\x00\xfb\x31\x30\xa3\x4c\
-\xb7\x80\x14\x02\x16\x64\xe8\xc7\xca\x9a\xef\x12\x2b\xca\x36\x94\
-\x1b\xc3\x67\x53\xf6\x81\xb9\xad\x80\x3f\x66\xe8\xc7\xca\xda\x55\
-\x85\xfa\x24\x55\xe3\x8d\x94\x19\x5c\xf3\x48\xf7\x29\x4b\x7b\x69\
-\x8f\xf5\x8e\xb5\x2d\x23\xa6\x7f\xd2\x31\x94\xf9\x8c\x47\x2d\xa2\
-\xb3\x0f\x69\xfa\xed\xdc\xfd\x5b\xca\xd8\xde\x42\x92\x3a\xaf\xc4\
-\xd3\xff\xcb\x80\xbd\x0b\xf5\x67\x65\x4e\x5a\x49\x4d\x39\x9a\x6f\
-\x03\x28\x42\x89\xa7\xff\x1f\x21\x76\x29\xec\x0f\xac\xa2\xae\x7e\
-\xb7\x97\x96\xea\x90\x14\x6d\x22\x65\x2e\xaf\x9d\x52\xaa\x43\xab\
-\x30\x03\xb8\x85\xc1\xef\xa7\xda\x33\x09\xb8\x97\xfc\x9f\xed\xe3\
-\x0a\xf5\x67\x55\xd6\x00\x7e\x47\xfe\x7e\x9e\x54\xaa\x43\x52\xb4\
-\xed\xc9\x3f\xa0\x1e\xa4\x8e\x65\x85\x5f\x43\xfe\xbe\x5e\x5b\xac\
-\x37\x52\xb2\x33\xf9\x3f\xd7\x77\x92\x66\xf0\x8b\xf6\x32\xf2\xf7\
-\xf5\xd7\xc5\x7a\x23\x05\x3b\x9c\xfc\x03\xea\x13\xc5\x7a\xf3\xd8\
-\xa6\x90\xff\x89\xe2\xa5\xc0\x9a\xa5\x3a\x24\x01\x47\x92\x7f\x0c\
-\xbf\xa7\x58\x6f\x1e\xdb\x24\xf2\x5f\x05\x58\x84\x6b\x03\x84\x70\
-\x69\xd5\xf2\x4a\xac\xfa\x77\x72\x81\x7d\x8c\xc6\x62\xe0\xf3\x99\
-\xf7\x31\x91\xb4\x14\xab\x54\x4a\xee\x31\xbc\x8c\x7a\xe6\xc9\x5f\
-\x0a\x7c\x21\xf3\x3e\xa6\x90\x77\x8e\x12\xad\x82\x01\xa0\xbc\xdc\
-\x5f\x1e\x57\x01\xd7\x64\xde\xc7\x58\x7c\xb1\xc0\x3e\x5c\x4a\x59\
-\x25\xe5\xfe\xbc\xcd\x21\xbd\xc1\x53\x8b\x2f\x17\xd8\x87\x63\x38\
-\x80\x01\xa0\xbc\xad\x32\x6f\xbf\xb6\x29\x72\xaf\x27\x2d\xde\x93\
-\x53\xee\x63\x2a\x2d\x2f\xf7\xe7\xed\x92\xcc\xdb\x1f\xab\xb9\xa4\
-\xdb\x00\x39\x39\x86\x03\x18\x00\xca\x9b\x9d\x79\xfb\xdf\xcf\xbc\
-\xfd\x5e\xe4\xae\x69\xfd\xcc\xdb\x97\x96\x97\xfb\xf3\xf6\x83\xcc\
-\xdb\xef\x45\xee\x9a\x1c\xc3\x01\x0c\x00\xe5\xcd\xcc\xbc\xfd\xdf\
-\x64\xde\x7e\x2f\x72\xdf\x92\xc8\x7d\x4c\xa5\xe5\xe5\x9c\x8f\x1f\
-\xea\xba\x85\x37\xe2\xb7\x99\xb7\xef\x18\x0e\x60\x00\x28\x6b\x12\
-\x30\x3d\xe3\xf6\x97\x01\x37\x67\xdc\x7e\xaf\x6e\xcc\xbc\xfd\xdc\
-\x5f\xc8\xd2\x88\x35\x86\x5b\x2e\x0b\x49\xf3\x84\xd4\xe6\xa6\xcc\
-\xdb\x77\x0c\x07\x30\x00\x94\x35\x83\xfe\x2e\xc5\xbb\xa2\x07\x48\
-\x21\xa0\x36\xf3\x33\x6f\xdf\x5f\x0f\x2a\x25\xf7\x67\xed\x81\xcc\
-\xdb\xef\xd5\xfd\x99\xb7\xef\x18\x0e\x60\x00\x28\x2b\xf7\xfb\xea\
-\x0b\x33\x6f\xbf\x57\x0f\x67\xde\x7e\xc4\x5c\xe9\x6a\x53\xab\x63\
-\xf8\x91\xcc\xdb\x77\x0c\x07\x30\x00\x48\x92\xd4\x20\x03\x80\x24\
-\x49\x0d\x32\x00\x48\x92\xd4\x20\x03\x80\x24\x49\x0d\x32\x00\x48\
-\x92\xd4\x20\x03\x80\x24\x49\x0d\x32\x00\x48\x92\xd4\xa0\xc9\xd1\
-\x05\x54\x6c\x0a\xf0\x64\xd2\x52\xb3\xeb\x01\x6b\x0f\xb7\x75\x49\
-\xb3\xf9\xf5\xb2\x7e\xf5\xb4\xbe\x55\xa7\xe5\x6d\x41\x3d\x4b\x20\
-\x6b\xb0\xad\x1d\x5d\xc0\x80\xda\x92\xde\xc7\xf0\x83\xc0\x82\xe1\
-\x76\xdf\xf0\xff\xde\x46\x5a\xc0\xe8\xd6\xbe\x54\x37\xa0\x0c\x00\
-\xc9\x0c\x60\x2f\x60\x77\xe0\x69\xa4\xa5\x29\x37\x27\x85\x00\xd5\
-\x6f\x43\xe0\x75\xd1\x45\x48\xea\xd9\xe3\xc9\x33\x86\xef\x07\xae\
-\x25\x85\x81\x9f\x01\xdf\x01\xae\x06\x96\x66\xd8\x57\xe7\xb4\x1a\
-\x00\x26\x01\x7b\x03\xfb\x0e\xb7\x5d\x68\xf7\x58\x48\xd2\xa0\x9a\
-\x49\xfa\x7e\xdf\x05\x38\x62\xf8\xcf\xee\x05\x2e\x03\x2e\x05\x2e\
-\x04\xae\x8b\x29\x2d\x5e\x6b\x27\xbd\x6d\x80\xc3\x80\x57\x03\x9b\
-\xc6\x96\x22\x49\x0a\xb0\x2e\xf0\xe2\xe1\xf6\x49\xd2\x0a\xaa\xa7\
-\x03\x5f\x00\xee\x0c\xac\xab\xb8\x16\x1e\x02\x9c\x0e\xbc\x95\x74\
-\xf9\xe7\xd7\xc0\xfb\xf0\xe4\x2f\x49\x4a\xb6\x01\x3e\x4c\x5a\x49\
-\xf5\x6c\x60\xbf\xd8\x72\xca\x19\xe4\x00\x30\x03\x38\x06\xb8\x9e\
-\x94\xf2\x76\x88\x2d\x47\x92\x54\xb1\xa9\xc0\x4b\x80\x6f\x92\x7e\
-\x30\x1e\x49\xba\x5d\x3c\xb0\x06\x31\x00\xac\x07\x9c\x40\x4a\x73\
-\x9f\x00\x36\x8a\x2d\x47\x92\xd4\x31\x3b\x00\xa7\x91\x82\xc0\xcb\
-\xc9\xbb\x8c\x7b\x98\x41\x0a\x00\x13\x48\x89\xed\x1a\xe0\x9f\x81\
-\x75\x62\xcb\x91\x24\x75\xdc\x76\xc0\x97\x81\x1f\x93\x1e\x24\x1c\
-\x28\x83\x12\x00\xb6\x07\xbe\x47\x4a\x6c\x1b\x04\xd7\x22\x49\x1a\
-\x2c\xbb\x00\x3f\x24\xdd\x4e\x9e\x19\x5c\x4b\xdf\x74\x3d\x00\x4c\
-\x01\x3e\x02\xfc\x04\x78\x76\x70\x2d\x92\xa4\xc1\x35\x99\xf4\x40\
-\xf9\x35\xc0\x0b\x83\x6b\xe9\x8b\x2e\x07\x80\x27\x91\x26\x75\xf8\
-\x27\xda\x7b\x9d\x51\x92\x14\xe3\x09\xc0\x79\xa4\xab\x01\xbd\xcc\
-\x08\x5b\x8d\xae\x06\x80\x17\x91\x1e\xce\x78\x56\x74\x21\x92\xa4\
-\xe6\x4c\x20\x5d\x0d\xf8\x3e\x69\xd6\xd8\x4e\xea\x5a\x00\x98\x08\
-\x9c\x08\xfc\x1f\xe9\x69\x7f\x49\x92\xa2\xfc\x35\x70\x25\xf0\x9c\
-\xe8\x42\x7a\xd1\xa5\x00\x30\x19\xf8\x2c\xf0\x4e\x06\xf4\x95\x0c\
-\x49\x52\xe7\x3c\x0e\xb8\x80\xf4\xba\x60\xa7\x74\x25\x00\x4c\x07\
-\xce\x01\x8e\x8a\x2e\x44\x92\xa4\x15\x4c\x05\xbe\x04\xbc\x3d\xba\
-\x90\xb1\xe8\x42\x00\x78\x1c\xf0\x6d\xe0\x05\xd1\x85\x48\x92\xb4\
-\x0a\x13\x80\x8f\x01\x1f\x88\x2e\x64\xb4\x6a\x0f\x00\xd3\x80\x73\
-\x81\x5d\xa3\x0b\x91\x24\x69\x14\xde\x0b\xfc\x6b\x74\x11\xa3\x51\
-\x73\x00\x98\x4a\x7a\xd8\x6f\xb7\xe8\x42\x3a\xa4\xd6\x79\xab\x6b\
-\xad\x4b\xaa\x4d\xad\x63\xa5\xd6\xba\x6a\x75\x3c\xf0\xf7\xd1\x45\
-\xac\x4e\xad\x01\x60\x02\x70\x0a\xf0\xbc\xe8\x42\x3a\x66\x46\x74\
-\x01\xab\x30\x2b\xba\x00\xa9\x23\x1c\xc3\x83\xe3\x24\xe0\xd0\xe8\
-\x22\x1e\x4b\xad\x01\xe0\x3f\x48\xf3\xfa\x6b\x6c\xa6\x52\xe7\x1a\
-\x08\xb3\xa3\x0b\x90\x3a\x62\x1a\xe9\xa1\xe7\xda\x38\x86\xc7\x6e\
-\x22\x70\x3a\xb0\x47\x74\x21\xab\x52\x63\x00\x38\x14\xf8\x87\xe8\
-\x22\x3a\x6c\xeb\xe8\x02\x56\xa2\xc6\x9a\xa4\x1a\x4d\x00\xb6\x8a\
-\x2e\x62\x25\x1c\xc3\xbd\x59\x13\xf8\x2a\x95\xae\x4a\x5b\x5b\x00\
-\x78\x0a\xe9\x5d\x7f\xf5\x6e\xe7\xe8\x02\x56\xa2\xc6\x9a\xa4\x5a\
-\xd5\x38\x5e\x6a\xac\xa9\x2b\x36\x24\x2d\x54\x57\xdb\xf9\xb6\xaa\
-\x82\xd6\x00\xfe\x97\x01\x5a\x69\x29\x48\x6d\x33\x52\x4d\x07\x9e\
-\x19\x5d\x84\xd4\x21\xb5\x8d\xe1\x99\xc0\x33\xa2\x8b\xe8\xb8\xfd\
-\x80\x77\x45\x17\xb1\xa2\x9a\x02\xc0\x47\x81\xa7\x47\x17\x31\x00\
-\xf6\x07\xd6\x8e\x2e\x62\x39\x07\xd1\xf1\x05\x33\xa4\xc2\x5e\x40\
-\x7a\x16\xa0\x16\x2f\xc2\x05\xd7\xfa\xe1\x78\x2a\x5b\xb5\xb6\x96\
-\x29\x75\x9f\x09\x5c\x4e\x5d\x81\x64\xc4\x03\xc0\xb5\xc3\xed\xa6\
-\xe1\x7f\x5e\x00\x3c\xdc\xe3\xf6\x9e\x4b\xfe\x27\x43\x5f\x03\x7c\
-\x3e\xf3\x3e\x46\xeb\x22\x52\x28\xc9\xe9\xdd\xc0\x3d\x99\xf7\x21\
-\x8d\xd8\x1f\x38\x24\xf3\x3e\x8e\x04\xce\xc8\xbc\x8f\xd1\xba\x84\
-\xfc\x57\x25\x8e\x05\xee\xeb\xf1\xbf\x5d\x87\xf4\xa3\x67\x06\xf0\
-\x54\xd2\x33\x14\x9b\x53\x67\x68\xf9\x0d\xb0\x23\xb0\x38\xba\x90\
-\x5a\x4c\x02\x7e\x0a\x0c\x55\xd2\x16\x01\xe7\x93\x1e\x44\xdc\x9e\
-\xfe\x87\xa4\xfd\x0b\xf4\xe1\x37\xd4\x11\xa6\x76\x04\x96\x91\xb7\
-\xaf\xf7\x52\x47\x5f\xd5\x8e\x03\xc8\x3f\x86\x7f\x41\x1d\x3f\xd0\
-\x76\x21\x7f\x5f\xef\xa2\xff\x7d\x9d\x46\xba\xec\xfe\x6f\xa4\x63\
-\x19\x7d\x5e\x59\xbe\x1d\xdb\xe7\xbe\x76\xda\x5b\x89\xff\x0b\x19\
-\x02\x7e\x09\xbc\x85\xfc\xaf\xbb\xac\x4b\xfe\x93\xe2\x10\xf0\xca\
-\xcc\xfd\x18\x8d\xf3\xc8\xdf\xcf\x8b\x8b\xf5\x46\x4a\x66\x53\xe6\
-\x3b\xa9\x86\xc5\x65\x2e\x22\x7f\x3f\x2f\x28\xd0\x8f\x1d\x81\x8f\
-\x93\xae\x32\x44\x9e\x67\x86\x48\x57\x90\x37\xc9\xdb\xdd\x6e\x78\
-\x3c\xf1\x7f\x21\x57\x02\x2f\xa1\x6c\xda\xfe\x5d\x86\x7e\xac\xd8\
-\x6e\x27\x85\x8d\x28\x2f\x59\x45\x5d\xfd\x6e\x9d\x99\x77\x5b\x03\
-\xe5\xf7\xe4\xff\x6c\xcf\x23\x76\x5e\x8f\x97\xae\xa2\xae\x7e\xb7\
-\xf7\x95\xea\x10\x69\x42\xa3\xf7\x92\xae\x3a\x44\x9c\x6f\x46\xda\
-\x59\xb9\x3b\xda\x05\x9f\x26\xee\x2f\xe0\x4e\xe0\xd5\xc4\x5c\x66\
-\xfb\xec\x18\x6b\xed\xb5\x7d\x8d\x98\xfe\x3d\x01\xb8\xa3\x87\x7a\
-\x7b\x69\xce\x16\xa9\x08\xa7\x52\xe6\xf3\x7d\x66\xa1\xfe\xac\xe8\
-\x49\xc0\x1f\x47\x59\xe3\x78\xdb\x3e\x85\xfa\xb4\xbc\xf5\x80\xcf\
-\x00\x4b\x7b\xa8\xb7\x5f\xad\xaa\x07\x02\x4b\x7b\x3c\xe9\x41\xba\
-\x88\x03\x7f\x26\xe9\x03\x10\xe5\xa0\x55\xd4\x95\xa3\xbd\xbb\x50\
-\x9f\x46\x4c\x03\x7e\xd0\xa7\xda\x57\xd7\xee\xc3\x37\x0c\x14\xe3\
-\x60\xca\x8d\xe1\x7f\x2c\xd4\xa7\x11\xd3\x81\x2b\xfa\x54\xfb\xea\
-\xda\xdd\xc4\x3e\xac\xb7\x2b\x70\xfd\x4a\xea\x2a\xd1\x4a\xdc\xfa\
-\xa8\xd6\xbf\x53\xfe\x80\x3f\x0c\xbc\xbe\x44\xe7\x56\x63\x2d\xd2\
-\x7d\xa0\x12\x7d\x5e\x06\xbc\xae\x4c\xb7\x58\x83\x32\xf7\xfd\x47\
-\xda\x97\xcb\x74\x4b\xfa\x0b\xd3\x81\x87\x28\x37\x86\x8f\x2e\xd3\
-\x2d\xd6\x04\x2e\x2c\xd0\xa7\x91\x56\xc3\x9b\x0e\xeb\x90\x66\xeb\
-\x2b\xd5\xe7\xe5\xff\x5e\x9b\x7c\xf5\xfd\x71\xa4\xd7\xe9\x4a\x1e\
-\xec\x7b\xa8\xeb\x92\xcb\x59\x94\xfd\xa0\xe5\xbe\x12\x30\x0b\x98\
-\x53\xb0\x4f\x43\xd4\xf1\x90\x94\xda\x75\x0e\x65\xc7\x70\xee\x2b\
-\x01\xeb\x02\x97\x15\xec\xd3\x10\xe9\x39\x83\x1a\x4c\x00\x3e\x48\
-\xd9\xbe\x0f\x01\x5f\x2f\xd1\xb9\xda\x1c\x47\xd9\x83\x3c\x0f\xd8\
-\xae\x44\xc7\xc6\xa0\xd4\x43\x72\xcb\xb7\xaf\x91\x67\x55\xaf\x67\
-\x00\x37\x14\xee\xcb\x3d\xd4\x35\x59\x8a\xda\x53\xea\x21\xb9\xe5\
-\xdb\x99\xe4\x79\x30\xf0\x99\xc0\x8d\x85\xfb\x72\x17\xe9\x6a\x68\
-\x4d\xde\x42\x99\xb7\xb4\x46\xda\x52\xe0\x69\x45\x7a\x56\x89\x89\
-\xc0\x5c\xca\x1d\xe0\xbb\x81\x6d\x8b\xf4\x6c\x6c\x26\x03\x37\x53\
-\xfe\x0b\xe4\x36\xe0\x08\xfa\xf3\x70\xe0\x2c\xe0\x13\xa4\x49\x2d\
-\x4a\xf7\xe3\xe3\x7d\xa8\x5f\x1a\x8f\x29\xa4\x1f\x17\xa5\x3f\xfb\
-\xf3\x48\x57\xbf\xfa\x31\x86\xd7\x05\xfe\x13\x58\x12\xd0\x8f\x7f\
-\xef\x43\xfd\x39\xbc\x9d\xb2\xc7\xe1\xc4\x32\xdd\xaa\xc3\xbe\x94\
-\x3b\xb0\x0f\x02\xbb\x95\xe9\x56\x4f\xfe\x85\xf2\x83\x6e\xa4\xfd\
-\x92\x34\xdb\x58\x2f\xbf\xa2\x37\x21\x5d\x2e\x8b\x7a\x85\x73\x19\
-\x75\xae\x98\xa6\xf6\x1c\x4f\xdc\x18\xfe\x39\xf0\xb7\xf4\xf6\x2b\
-\x7a\x53\xe0\x43\xc0\xfc\xa0\xda\x97\x91\x66\xed\xab\xd5\x89\x94\
-\x3b\x16\xf3\x48\x13\xe2\x35\xe1\x54\xca\x1d\xd8\x57\x95\xe9\x52\
-\xcf\x36\xa2\xdc\x83\x44\xab\x6a\xf7\x93\x16\x61\x7a\x1d\xb0\x13\
-\x2b\x5f\x8b\x7c\x03\xd2\xab\x3a\xff\x02\x7c\x8f\xd8\x57\x67\x86\
-\x48\x93\x93\x48\x35\xd8\x98\xb8\xb7\x99\x46\xda\x7c\xd2\x03\xb1\
-\xaf\x25\x4d\x78\xb3\xb2\x50\xbf\x21\x69\x0c\xff\x2b\xf0\x7d\xca\
-\x5e\xe6\x5e\x59\x3b\x7f\xb4\x07\x38\xc8\x44\xe0\x9b\x94\x3b\x1e\
-\xfb\x95\xe9\x56\xac\xe9\xa4\x13\x4e\x89\x03\x7a\x6a\x99\x2e\x8d\
-\x5b\xc4\xdb\x10\xab\x6b\xf7\x91\x6e\x4f\xdc\x41\xba\x8a\x12\x5d\
-\xcf\x8a\x6d\xd7\x9e\x8e\xb4\x94\xc7\x27\x88\x1f\x13\x2b\xb6\x7b\
-\xf9\xd3\x18\x8e\xfe\x91\xb1\x62\x5b\x46\x9a\x62\xb8\x76\x1b\x50\
-\xee\x16\x4f\x0d\x6f\x43\x64\xf7\x72\xca\x1c\xcc\x9b\x49\x0b\x43\
-\x74\xc1\x6c\xca\x85\xa2\x41\x68\xe7\xf4\x76\x98\xa5\x6c\x36\xa4\
-\xdc\x6b\xbd\x83\xd0\xce\xee\xed\x30\x87\x38\x90\x32\xc7\x64\x01\
-\xe9\x15\xcc\x81\x56\x6a\x06\xbc\xdc\xab\xed\xf5\xdb\xfb\x89\x1f\
-\x94\x5d\x68\x4b\x81\x1d\x7a\x3c\xc6\x52\x4e\x1f\x22\x7e\x7c\x74\
-\xa1\x2d\x01\xfe\xaa\xc7\x63\x1c\xe5\xff\x28\x73\x6c\xf6\x2d\xd5\
-\xa1\x28\x25\x5e\x15\xbb\xb4\x58\x6f\xfa\x67\x1a\x65\xe6\x16\xef\
-\x7a\xfb\xcf\x5e\x0f\xb0\x94\xd9\x74\xe0\x0f\xc4\x8f\x91\xda\x5b\
-\x17\xdf\xde\xd9\x0c\x58\x48\xfe\x63\xf3\xc1\x42\xfd\x09\xb1\x29\
-\x65\x3e\x60\x7b\x17\xea\x4f\xbf\xed\x43\xfc\x83\x39\x35\xb7\xe8\
-\x85\x51\xa4\xd5\x79\x3e\xf1\xe3\xa4\xe6\x36\x17\x58\xbb\xe7\xa3\
-\x1b\xeb\x14\xf2\x1f\x9f\xcb\x8b\xf5\x26\xc0\xd1\x78\x00\x57\xe7\
-\x74\xe2\x07\x69\xad\xed\xa0\x71\x1c\x57\xa9\x94\x2f\x11\x3f\x56\
-\x6a\x6d\x2f\x1c\xc7\x71\x8d\xb6\x05\xf9\xe7\x3b\x59\x44\x77\x9e\
-\x5d\x1b\xb3\x53\xc9\xff\x01\x7b\x45\xa9\xce\x64\x32\x8b\xb8\x85\
-\x29\x6a\x6e\x27\x8d\xe7\xa0\x4a\x05\xad\x4b\xf9\x19\xf5\xba\xd0\
-\xfe\x6b\x3c\x07\xb5\x12\xe7\x92\xff\x38\xed\x5f\xac\x37\x85\x5d\
-\x45\xde\x03\x37\x9f\xc1\x98\x1a\x76\x7b\xea\x7b\x6d\x27\xb2\x5d\
-\x4d\x7d\xd3\x85\x4a\x8f\x65\x07\x1c\xc3\xcb\xb7\x2b\x48\x0b\x85\
-\x75\xdd\xcb\xc8\x7f\xac\xde\x56\xac\x37\x05\x4d\x20\xff\xab\x6e\
-\xa7\x96\xea\x4c\x01\xaf\x25\x7e\xd0\xd6\xd0\xee\x01\x36\x1f\xe7\
-\xb1\x94\x22\xbc\x81\xf8\xf1\x53\x43\xbb\x8b\xf4\xfc\xd7\x20\x58\
-\x93\xfc\xe7\xb1\x93\x8b\xf5\xa6\xa0\x8d\xc9\xff\x41\x3b\xbc\x58\
-\x6f\xca\xf8\x08\xf1\x83\x37\xb2\x3d\x04\xec\x31\xee\xa3\x28\xc5\
-\xa9\x71\x92\xaf\xd2\x63\x78\xf7\x71\x1f\xc5\xba\xe4\x5e\xee\x7c\
-\x4e\xb9\xae\x94\x93\x7b\xfe\xff\x65\xa4\x69\x75\x07\xc9\x04\xca\
-\xcd\x9b\x50\x5b\x5b\x02\x1c\x32\xfe\x43\x28\x85\x9a\x00\x7c\x9e\
-\xf8\xf1\x14\x35\x86\x0f\x1e\xff\x21\xac\x4e\xee\x85\x82\x6e\x2b\
-\xd7\x95\x72\x5e\x4f\xde\x83\x76\x5d\xb9\xae\x14\x35\x99\x34\x6b\
-\x56\xf4\x60\x2e\xfd\xc5\xf1\xea\x3e\x1c\x3b\xa9\x06\x53\x48\xb3\
-\x57\x46\x8f\xab\xd2\x63\xf8\x95\xfd\x38\x78\x15\xfa\x6b\xf2\x1f\
-\xbf\x81\x7b\xdd\x39\xf7\xaa\x77\x83\x3c\x3d\xec\x24\xe0\x73\xc4\
-\x0f\xea\x12\x6d\x21\xe9\x41\x1b\x69\x90\x4c\xa6\x9d\x2b\x01\x0b\
-\x81\xc3\xfa\x73\xd8\xaa\x34\x83\xfc\xf3\xb5\x3c\xb9\x58\x6f\x0a\
-\xc9\xbd\xb4\xe2\xa0\xaf\xa7\x3c\x01\xf8\x28\xf1\x83\x3b\x67\x7b\
-\x90\x34\x91\x8a\x34\x88\x26\x00\x1f\x23\x7e\x9c\xe5\x6c\x0b\x18\
-\xe0\xd7\xd8\x96\x93\x7b\x81\xa0\x1d\xcb\x75\xa5\x8c\x93\xc8\x7b\
-\xc0\xde\x5c\xae\x2b\xa1\xde\x4c\x99\x29\x29\x4b\xb7\x1b\x80\x9d\
-\xfb\x78\x9c\xa4\x5a\x1d\x43\x9a\xf0\x25\x7a\xcc\xf5\xbb\xfd\x9e\
-\xb4\x9c\x78\x0b\x7e\x40\xde\x63\xb9\x67\xa9\x8e\x4c\x2c\xb4\x9f\
-\x99\x99\xb7\x7f\x7f\xe6\xed\xd7\xe2\x53\xc0\xb3\x49\x73\x8e\x0f\
-\x8a\x0b\x48\x4b\x83\xfe\x24\xba\x10\xa9\x80\x4f\x92\xc6\xf0\xdc\
-\xe8\x42\xfa\xe8\x7c\xd2\x18\xbe\x3a\xba\x90\x42\xe6\x67\xde\x7e\
-\xb1\xd9\x00\x4b\x05\x80\xdc\xf3\x3f\x2f\xc8\xbc\xfd\x9a\x5c\x05\
-\x3c\x83\xb4\x42\x55\x97\x3d\x02\x1c\x4b\x9a\xe2\xf7\x9e\xe0\x5a\
-\xa4\x92\xae\x04\x76\x25\xcd\x2c\xd7\x65\x0f\x03\xef\x24\x8d\xe1\
-\x7b\x83\x6b\x29\x29\xf7\x0f\xce\xdc\x3f\x98\x8b\xbb\x88\xbc\x97\
-\x4c\xba\x3c\xc7\xf4\x78\x1c\x0a\xdc\x4e\xfc\xe5\xbf\xb1\xb6\xef\
-\x02\x5b\x66\x38\x1e\x52\xd7\xbc\x1c\xb8\x83\xf8\x31\x39\xd6\x36\
-\x07\x78\x6a\x86\xe3\xd1\x05\xa7\x91\xf7\xd8\x1e\x55\xaa\x23\xa5\
-\xae\x00\x28\x8f\xaf\x02\xdb\x00\x9f\x26\xdd\x57\xac\xdd\xad\xa4\
-\x59\x0e\xf7\x06\xae\x8d\x2d\x45\xaa\xc2\x99\xa4\x31\xfc\x19\xd2\
-\x62\x33\xb5\x9b\x07\xbc\x86\x34\xb7\xcb\xa0\xbe\x7e\xbd\x3a\x43\
-\x99\xb7\x3f\x21\xf3\xf6\x8b\xf3\x0a\x40\x7e\x9b\x90\xa6\x91\x5c\
-\x42\xfc\xaf\x83\x15\xdb\x3d\xa4\xcb\xfd\x83\xb0\x56\x83\x94\xcb\
-\xa6\xd4\x3b\x86\xef\x26\x8d\x61\xd7\xe5\xc8\xbf\xb0\xdd\xd1\xc5\
-\x7a\x52\x88\x01\xa0\x9c\x6d\x48\x6f\x5d\x3c\x40\xfc\x97\xc6\xf5\
-\xa4\x99\xb3\x06\x6e\x62\x0b\x29\xa3\x6d\x81\xff\x26\x3d\xdb\x14\
-\x3d\x86\xaf\x03\xfe\x81\x01\xbc\x2f\x3d\x0e\xa7\x62\x00\x18\x13\
-\x03\x40\x79\xeb\x90\x5e\x39\xba\x92\xfc\x13\x57\x2c\xdf\x1e\x22\
-\xcd\x5e\x78\x00\xde\x62\x92\xc6\x63\x16\x69\x75\xb8\xdc\x2b\xa9\
-\xae\x6c\x0c\x9f\x45\xfa\x5e\x75\x0c\xff\xa5\x53\x31\x00\x8c\x89\
-\x01\x20\xd6\xa6\xa4\x14\x7f\x29\x79\x96\x29\xbd\x0d\xf8\x12\xe9\
-\xa1\xc4\xe9\x85\xfa\x24\xb5\x64\x53\x52\x18\x98\x43\x9e\x31\x7c\
-\x2b\xf0\x45\xe0\xa5\x38\x86\x57\xe7\x54\x06\x24\x00\x4c\x2e\xb5\
-\x23\x85\x9a\x0b\x7c\x62\xb8\x4d\x01\x9e\x0e\xec\x36\xfc\xbf\x5b\
-\x90\xa6\x9e\x1c\xcd\x62\x4a\x8b\x81\x9b\x48\x93\x7e\x5c\x47\x5a\
-\xe7\xfb\x07\xc3\xff\x2c\x29\x9f\xb9\xc0\xc7\x87\xdb\x14\xd2\xc4\
-\x59\xbb\x91\x26\xdf\xd9\x62\xb8\x6d\x38\x8a\xed\x2c\x1e\xde\xd6\
-\x0d\xa4\x31\xfc\x23\xd2\x18\xbe\xa1\xff\x25\xab\x76\x06\x80\xf6\
-\x2c\x26\x9d\xb8\xaf\x58\xe1\xcf\xa7\x93\xbe\x40\xa6\x93\x1e\xf4\
-\x99\x49\xba\x75\x30\x9f\x74\x2f\xf2\x61\xd2\xaf\x84\x25\xc5\x2a\
-\x95\xb4\x32\x8b\x49\x27\xee\x1f\xad\xf0\xe7\xcb\x8f\xe1\x69\xfc\
-\x69\xde\xfa\x91\x31\xfc\x10\xe9\x6a\x9d\x63\x58\x80\x01\x40\x7f\
-\xf2\x20\xfe\x0a\x90\xba\xcc\x31\xac\x31\xf1\x01\x0f\x49\x92\x1a\
-\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\
-\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\
-\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\
-\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\
-\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\
-\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\
-\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\
-\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\
-\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\
-\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\
-\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\
-\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\
-\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\
-\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\
-\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\
-\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\
-\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\
-\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\
-\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\
-\x00\x49\x92\x1a\x34\x39\xba\x80\x3e\x39\x3f\xba\x00\x49\x92\xba\
-\xc4\x2b\x00\x92\x24\x35\xc8\x00\x20\x49\x52\x83\x0c\x00\x92\x24\
-\x35\xc8\x00\x20\x49\x52\x83\x0c\x00\x92\x24\x35\xc8\x00\x20\x49\
-\x52\x83\x0c\x00\x92\x24\x35\xc8\x00\x20\x49\x52\x3d\x66\x97\xda\
-\x91\x01\x40\x92\xa4\x7a\xec\x51\x6a\x47\x06\x00\x49\x92\xea\xf1\
-\x57\xa5\x76\x64\x00\x90\x24\xa9\x1e\x1b\x94\xda\x91\x01\x40\x92\
-\xa4\x7a\x2c\x2b\xb5\x23\x03\x80\x24\x49\xf5\xb8\xab\xd4\x8e\x0c\
-\x00\x92\x24\xd5\xe3\x17\xa5\x76\x64\x00\x90\x24\xa9\x1e\x97\x95\
-\xda\x91\x01\x40\x92\xa4\x7a\xdc\x5d\x6a\x47\x06\x00\x49\x92\x1a\
-\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\
-\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\
-\x1a\x34\x39\xba\x80\x3e\x39\x00\xb8\x20\xba\x08\x49\xd2\xc0\x3b\
-\x15\x78\x55\x74\x11\xfd\xe0\x15\x00\x49\x92\x1a\x64\x00\x90\x24\
-\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\
-\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\
-\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\
-\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\
-\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\
-\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\
-\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\
-\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\
-\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\
-\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\
-\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\
-\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\
-\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\
-\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\
-\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\
-\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\
-\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\
-\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\
-\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\
-\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\
-\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\
-\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\
-\xa9\x41\x06\x00\x49\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\
-\x92\x1a\x64\x00\x90\x24\xa9\x41\x06\x00\x49\x92\x1a\x34\x39\xba\
-\x00\x49\x0a\xb4\x16\xb0\x33\x30\x1b\x58\x0f\xb8\x13\xb8\x05\xf8\
-\x35\xb0\x28\xb0\x2e\x29\x3b\x03\x80\xa4\xd6\x4c\x00\x0e\x04\xde\
-\x04\xec\x49\x0a\x01\x2b\x9a\x0f\x9c\x0f\x9c\x0c\x5c\x56\xae\x34\
-\xa9\x1c\x6f\x01\x48\x6a\xc9\x8e\xc0\x55\xc0\x39\xc0\xfe\xac\xfc\
-\xe4\x0f\xb0\x0e\xf0\x0a\xe0\xbb\xc3\xff\xee\xe6\x45\xaa\x93\x0a\
-\x32\x00\x48\x6a\xc5\x91\xc0\x0f\x80\xa7\x8f\xf1\xbf\x3b\x08\xf8\
-\x31\xb0\x47\xdf\x2b\x92\x02\x19\x00\x24\xb5\xe0\xdd\xc0\x69\xac\
-\xfa\x17\xff\xea\xac\x0f\x5c\x02\xec\xdb\xb7\x8a\xa4\x60\x06\x00\
-\x49\x83\xee\x58\xe0\x43\x7d\xd8\xce\x54\xe0\xab\x78\x3b\x40\x03\
-\xc2\x00\x20\x69\x90\x9d\x00\x7c\xb8\x8f\xdb\x5b\x0f\xf8\x4c\x1f\
-\xb7\x27\x85\x31\x00\x48\x1a\x54\x1f\x04\xfe\x39\xc3\x76\xf7\x27\
-\xbd\x3d\x20\x75\x9a\x01\x40\xd2\xa0\x99\x00\x7c\x12\x78\x4f\xc6\
-\x7d\x1c\x93\x71\xdb\x52\x11\x06\x00\x49\x83\x64\xe4\xe4\xff\xd6\
-\xcc\xfb\x79\x1e\x30\x25\xf3\x3e\xa4\xac\x0c\x00\x92\x06\xc5\x44\
-\xe0\x14\xe0\x2d\x05\xf6\x35\x83\xb1\xbf\x4e\x28\x55\xc5\x99\x00\
-\x25\x0d\x82\x49\xc0\x67\x81\x57\x17\xdc\xe7\xc6\x05\xf7\x25\xf5\
-\x9d\x01\x40\x52\xd7\x4d\x06\x4e\x07\x0e\x2f\xbc\xdf\xf5\x0b\xef\
-\x4f\xea\x2b\x03\x80\xa4\x2e\x9b\x02\x7c\x19\xf8\x9b\x80\x7d\xcf\
-\x0f\xd8\xa7\xd4\x37\x06\x00\x49\x5d\x35\x15\x38\x13\x38\x38\x68\
-\xff\xb7\x04\xed\x57\xea\x0b\x03\x80\xa4\x2e\x1a\x99\x95\xef\x45\
-\x41\xfb\x5f\x04\xfc\x32\x68\xdf\x52\x5f\x18\x00\x24\x75\xcd\x34\
-\xe0\x6c\x60\xbf\xc0\x1a\xe6\x00\xf7\x07\xee\x5f\x1a\x37\x03\x80\
-\xa4\x2e\x99\x0e\x9c\x0b\xec\x13\x5c\xc7\xe9\xc1\xfb\x97\xc6\xcd\
-\x79\x00\x24\x75\x45\x2d\x27\xff\x9f\x93\x9e\x3d\x90\x3a\xcd\x2b\
-\x00\x92\xba\x60\x1d\xe0\x42\x60\xb7\xe0\x3a\x16\x01\x6f\x02\x96\
-\x05\xd7\x21\x8d\x9b\x01\x40\x52\xed\x66\x01\x17\x01\xbb\x46\x17\
-\x42\x9a\x62\xf8\xf2\xe8\x22\xa4\x7e\x30\x00\x48\xaa\xd9\xfa\xc0\
-\xc5\xc0\x4e\xd1\x85\x00\xc7\x01\x27\x47\x17\x21\xf5\x8b\x01\x40\
-\x52\xad\x36\x00\xbe\x05\x6c\x1f\x5d\x08\xf0\x3e\xe0\xfd\xd1\x45\
-\x48\xfd\x64\x00\x90\x54\xa3\x0d\x81\x4b\x80\xed\xa2\x0b\x01\xde\
-\x0b\x9c\x10\x5d\x84\xd4\x6f\x06\x00\x49\xb5\xd9\x08\xf8\x36\xb0\
-\x4d\x70\x1d\x43\xc0\xdb\x48\xcb\x0b\x4b\x03\xc7\x00\x20\xa9\x26\
-\x9b\x90\x4e\xfe\x4f\x09\xae\x63\x88\xf4\xc0\xdf\xa7\x82\xeb\x90\
-\xb2\x31\x00\x48\xaa\xc5\xa6\xc0\xa5\xc0\x93\x83\xeb\x18\x02\xde\
-\x0c\x9c\x14\x5c\x87\x94\x95\x01\x40\x52\x0d\x36\x27\xfd\xf2\xdf\
-\x3c\xb8\x8e\xa5\xc0\x6b\x80\xd3\x82\xeb\x90\xb2\x33\x00\x48\x8a\
-\xb6\x15\xe9\xe4\xbf\x71\x70\x1d\x4b\x81\xa3\x80\x33\x82\xeb\x90\
-\x8a\x30\x00\x48\x8a\xb4\x35\xe9\xe4\xff\x84\xe0\x3a\x16\x03\x87\
-\x03\x5f\x0f\xae\x43\x2a\xc6\xb5\x00\x24\x45\xd9\x01\xb8\x8c\xf8\
-\x93\xff\x22\xe0\x30\x3c\xf9\xab\x31\x06\x00\x49\x11\x76\x22\xbd\
-\xe7\x3f\x3b\xb8\x8e\x85\xc0\xa1\xc0\xff\x05\xd7\x21\x15\xe7\x2d\
-\x00\x49\xa5\xed\x4c\x9a\xde\x77\xbd\xe0\x3a\x1e\x02\x5e\x42\x9a\
-\x6d\x50\x6a\x8e\x57\x00\x24\x95\xf4\x6c\xd2\xab\x7e\x35\x9c\xfc\
-\x5f\x84\x27\x7f\x35\xcc\x00\x20\xa9\x94\x3d\x48\x4b\xfa\xce\x0c\
-\xae\xe3\x41\xe0\x40\xd2\xc3\x87\x52\xb3\xbc\x05\x20\xa9\x84\xbd\
-\x80\xf3\x80\xb5\x83\xeb\x98\x0f\xbc\x00\xf8\x61\x70\x1d\x52\x38\
-\xaf\x00\x48\xca\x6d\x7f\xd2\x2f\xff\xe8\x93\xff\x7d\xc3\xb5\x78\
-\xf2\x97\x30\x00\x48\xca\xeb\x05\xa4\x27\xec\xd7\x0a\xae\xe3\x5e\
-\x60\x3f\xe0\x8a\xe0\x3a\xa4\x6a\x78\x0b\x40\x83\x6e\x26\xb0\x37\
-\xb0\x19\x69\x89\xd9\x85\xc0\x9d\xc0\xcf\x80\x2b\x49\xb3\xbf\x29\
-\x8f\x83\x81\x33\x81\xa9\xc1\x75\xdc\x01\x3c\x0f\xf8\x65\x70\x1d\
-\x52\x55\x0c\x00\x1a\x54\x7b\x03\xc7\x02\xfb\xb2\xea\x13\xd0\x5d\
-\xc0\xff\x02\xff\x06\xcc\x2b\x53\x56\x33\x0e\x03\xfe\x07\x98\x12\
-\x5c\xc7\x6d\xc0\x73\x80\x6b\x82\xeb\x90\x9a\x75\x11\x69\x85\xad\
-\x5c\xed\x85\xe5\xba\xa2\xca\x3d\x9e\x74\xbf\x79\x2c\x9f\x9f\x87\
-\x81\xf7\xe1\x2d\xb1\x7e\x39\x02\x58\x42\xde\x31\x3f\x9a\x76\x33\
-\xb0\x65\xe6\xbe\xaa\x3d\xa7\x92\xf7\x73\x7b\x74\xa9\x8e\xf8\x85\
-\xa7\x41\xb2\x33\xf0\x63\xe0\xf9\x63\xfc\xef\xd6\x04\x8e\x03\xce\
-\x01\xd6\xe9\x73\x4d\xad\x79\x35\x69\x25\xbd\x49\xc1\x75\xcc\x25\
-\x5d\x05\xba\x36\xb8\x0e\xa9\x5a\x06\x00\x0d\x8a\xad\x48\x53\xcb\
-\x3e\x71\x1c\xdb\x38\x00\x98\x03\xac\xdf\x97\x8a\xda\xf3\x77\xc0\
-\xe7\xa8\xe3\xe4\xbf\x2f\xf0\xfb\xe0\x3a\xa4\xaa\x19\x00\x34\x08\
-\x66\x91\x7e\xbd\xcf\xea\xc3\xb6\x6a\x99\xa3\xbe\x6b\xde\x04\xfc\
-\x3f\xe2\xbf\x53\xae\x03\x76\x07\x6e\x08\xae\x43\xaa\x5e\xf4\x60\
-\x95\xfa\xe1\x3d\xf4\xf7\x5e\x6f\x2d\xab\xd4\x75\xc5\x1b\x81\xff\
-\x02\x26\x04\xd7\xf1\x3b\x60\x1f\xe0\x96\xe0\x3a\xa4\x4e\x30\x00\
-\xa8\xeb\x36\x26\xfd\xfa\xec\xb7\x5a\xd6\xa9\xaf\xdd\xb1\xc0\xa7\
-\x89\x3f\xf9\xff\x8a\x34\xdb\xa0\x6f\x73\x48\xa3\x64\x00\x50\xd7\
-\xbd\x92\x7c\x93\xcc\x6c\x0d\x5c\x0e\x6c\x9e\x69\xfb\x5d\x77\x2c\
-\xf0\xe1\xe8\x22\x48\x73\x3a\xec\x4b\x7a\xdf\x5f\xd2\x28\x19\x00\
-\xd4\x75\x07\x66\xde\xfe\x66\xa4\x07\x03\xb7\xc8\xbc\x9f\xae\x39\
-\x8e\x3a\x4e\xfe\x3f\x05\x9e\x0b\xfc\x31\xba\x10\xa9\x6b\x0c\x00\
-\xea\xb2\x89\xc0\x33\x0a\xec\x67\x53\xd2\x12\xb6\x86\x80\xe4\xc3\
-\xa4\x79\x13\xa2\x5d\x41\x9a\xe4\xe7\xee\xe8\x42\xa4\x2e\x32\x00\
-\xa8\xcb\x66\x53\x6e\xa6\xb9\x4d\x80\xef\x03\xdb\x14\xda\x5f\x8d\
-\x26\x00\xff\x41\xba\xf4\x1f\xed\x72\xd2\xdc\xfe\xf7\x45\x17\x22\
-\x75\x95\x01\x40\x5d\xd6\x8f\xd7\xfe\xc6\x62\x23\xd2\x83\x81\x2d\
-\x86\x80\x09\xa4\x27\xfd\xdf\x16\x5d\x08\xf0\x1d\xd2\x64\x4f\xf7\
-\x07\xd7\x21\x75\x9a\x01\x40\x5d\x16\x71\xe9\x77\x23\xd2\x09\x68\
-\xfb\x80\x7d\x47\x19\x39\xf9\xe7\x78\xdb\x62\xac\xbe\x0b\x1c\x04\
-\x2c\x88\x2e\x44\xea\x3a\x03\x80\xba\xec\x6e\xd2\xea\x7e\xa5\xcd\
-\x26\x3d\x13\xb0\x53\xc0\xbe\x4b\x9b\x04\x7c\x9e\x3a\x4e\xfe\x17\
-\x92\x7e\xf9\x7b\xf2\x97\xfa\xc0\x00\xa0\x2e\x1b\x02\xbe\x17\xb4\
-\xef\xc7\x91\x42\xc0\xae\x41\xfb\x2f\x61\xe4\xe4\xff\xea\xe0\x3a\
-\x00\x2e\x00\x0e\x01\x1e\x89\x2e\x44\x1a\x14\x06\x00\x75\xdd\xf9\
-\x81\xfb\x9e\x05\x7c\x13\xd8\x2d\xb0\x86\x5c\xa6\x00\x5f\x02\x8e\
-\x8c\x2e\x04\x38\x0b\x38\x18\x4f\xfe\x52\x5f\x19\x00\xd4\x75\xa7\
-\x11\xfb\x24\xf8\x3a\xc0\xb7\x48\x13\xd1\x0c\x8a\xa9\xc0\x99\xc0\
-\x61\xd1\x85\x00\x5f\x01\x5e\x0e\x2c\x8a\x2e\x44\x1a\x34\x06\x00\
-\x75\xdd\xbd\xc0\x27\x82\x6b\x98\x0e\x9c\x4b\x9a\x90\xa6\xeb\xa6\
-\x92\x4e\xba\x87\x44\x17\x42\x0a\x21\x47\x00\x8b\xa3\x0b\x91\x06\
-\x91\x01\x40\x83\xe0\x23\xc0\x95\xc1\x35\x4c\x03\xce\x23\x3d\xa1\
-\xde\x55\x6b\x00\x5f\x03\x5e\x1c\x5d\x08\xe9\xd9\x83\x23\x80\x25\
-\xd1\x85\x48\x83\xca\x00\xa0\x41\xf0\x08\xf0\x37\xc4\xcf\x05\xbf\
-\x06\xe9\xd7\xf3\x01\xc1\x75\xf4\x62\x1a\xe9\x79\x8a\x1a\x02\xcc\
-\xc9\xc0\x6b\x81\x65\xd1\x85\x48\x83\xcc\x00\xa0\x41\x71\x33\x69\
-\x5a\xd8\xe8\x10\xb0\x26\xe9\xa1\xb5\x1a\x7e\x45\x8f\xd6\xda\xa4\
-\xa7\xec\x9f\x13\x5d\x08\x69\xbe\x81\x37\xe0\xc9\x5f\xca\xce\x00\
-\xa0\x41\xf2\x6b\xea\x58\x12\x76\x2a\xf0\x75\xd2\x25\xec\xda\xad\
-\x4d\x7a\x7e\x61\xaf\xe8\x42\x48\xd3\x0c\x1f\x43\x7a\xbd\x53\x52\
-\x66\x06\x00\x0d\x9a\xdf\x01\xbb\x03\x37\x06\xd7\x31\x89\xf4\x86\
-\x42\x0d\xaf\xd1\xad\xca\x2c\xd2\x1b\x0c\x7b\x07\xd7\x01\x70\x22\
-\xf0\x0e\x3c\xf9\x4b\xc5\x18\x00\x34\x88\xfe\x00\xec\x03\xdc\x10\
-\x5c\x47\x4d\x13\xe9\xac\x68\x5d\xd2\x1c\x06\xcf\x8c\x2e\x84\xf4\
-\x10\x67\x0d\x0b\x0c\x49\x4d\x31\x00\x68\x50\xcd\x25\x85\x80\xeb\
-\x83\xeb\x18\x09\x01\x6f\x0c\xae\x63\x79\xb3\x81\x39\x94\x59\x4a\
-\x79\x75\xde\x07\xbc\x2b\xba\x08\xa9\x45\x06\x00\x0d\xb2\x9b\x80\
-\x3d\x80\xdf\x04\xd7\x31\x01\xf8\x14\xf0\x96\xe0\x3a\x00\x36\x20\
-\xad\x68\xb8\x43\x74\x21\xc0\x7b\x81\xf7\x47\x17\x21\xb5\xca\x00\
-\xa0\x41\x77\x3b\x69\x96\xbe\x5f\x05\xd7\x31\x01\xf8\x24\xf0\x0f\
-\x81\x35\x6c\x44\x5a\xbf\xe0\xaf\x02\x6b\x80\x74\x9f\xff\x6d\xc0\
-\x09\xc1\x75\x48\x4d\x33\x00\xa8\x05\x77\x90\x5e\x71\xfb\x45\x70\
-\x1d\x13\x80\x8f\x93\x7e\xf9\x96\xf6\x24\xd2\xc2\x49\xdb\x06\xec\
-\x7b\x79\x43\xa4\x27\xfd\xa3\x67\x6f\x94\x9a\x67\x00\x50\x2b\xee\
-\x24\x3d\xed\x1e\x3d\x63\x20\xc0\x07\x48\xf7\xbe\x4b\xd9\x84\x74\
-\xcf\xff\x29\x05\xf7\xb9\x32\x43\xc0\x9b\x49\xef\xfa\x4b\x0a\x66\
-\x00\x50\x4b\xee\x05\xf6\x03\xae\x88\x2e\x04\x38\x0e\xf8\x70\x81\
-\xfd\x6c\x06\x7c\x07\xd8\xa2\xc0\xbe\x1e\xcb\x52\xe0\x68\xe0\xa4\
-\xe0\x3a\x24\x0d\x33\x00\xa8\x35\xf7\x01\xfb\x03\x3f\x8c\x2e\x84\
-\xf4\xea\xdb\x89\x19\xb7\xbf\x25\xe9\xb2\xff\xe6\x19\xf7\x31\x1a\
-\x4b\x81\xa3\x80\x53\x83\xeb\x90\xb4\x1c\x03\x80\x5a\x34\x1f\x78\
-\x1e\xe9\xb2\x78\xb4\x77\x02\x1f\x23\x3d\x1f\xd0\x4f\x5b\x93\xfa\
-\xf7\xc4\x3e\x6f\x77\xac\x96\x00\xaf\x02\xce\x08\xae\x43\xd2\x0a\
-\x0c\x00\x6a\xd5\x83\xc0\x81\xa4\x57\xe2\xa2\xbd\x9d\x74\x69\xbc\
-\x5f\xe3\xf1\x69\xa4\xa7\xfd\x9f\xd0\xa7\xed\xf5\x6a\x11\x70\x18\
-\xf0\xc5\xe0\x3a\x24\xad\x84\x01\x40\x2d\x7b\x08\x78\x11\x70\x71\
-\x74\x21\xc0\xeb\x81\xff\x66\xfc\x63\x72\x47\xe0\x32\xe0\xf1\xe3\
-\xae\x68\x7c\x16\x01\x87\x02\x67\x07\xd7\x21\x69\x15\x0c\x00\x6a\
-\xdd\x43\xa4\x25\x70\xcf\x89\x2e\x84\xb4\x04\xee\x19\xa4\xd9\x03\
-\x7b\xf1\x74\xe0\x12\x60\xfd\xbe\x55\xd4\x9b\x87\xa9\xe7\x98\x4a\
-\x5a\x05\x03\x80\x54\xd7\xaf\xd5\x57\x00\xff\x03\x4c\x1e\xe3\x7f\
-\xb7\x0b\x69\x61\x9f\xc7\xf5\xbd\xa2\xb1\xa9\xe9\xaa\x8a\xa4\xc7\
-\x60\x00\x90\x92\x45\xc0\xcb\x48\xcb\xf8\x46\x7b\x39\xe9\xbe\xf9\
-\x94\x51\xfe\xfb\xbb\x93\x9e\x65\x58\x2f\x5b\x45\xa3\x33\xf2\x5c\
-\xc5\x25\xc1\x75\x48\x1a\x05\x03\x80\xf4\x27\x8b\x49\x21\xa0\x86\
-\x27\xd6\x0f\x03\xce\x02\xd6\x58\xcd\xbf\xb7\x27\x70\x01\x30\x33\
-\x7b\x45\x8f\xad\xa6\x37\x2b\x24\x8d\x82\x01\x40\xfa\x73\x23\xef\
-\xac\x9f\x16\x5d\x08\xe9\xd7\xf4\x59\xc0\x9a\xab\xf8\xff\xf7\x03\
-\x2e\x02\x66\x14\xab\x68\xe5\x6a\x9a\x5b\x41\xd2\x28\x19\x00\xa4\
-\xbf\x34\x12\x02\x6a\x98\xb5\xee\x85\xa4\x67\x13\xd6\x5a\xe1\xcf\
-\x5f\x00\x7c\x63\x25\x7f\x5e\x5a\x4d\xb3\x2b\x4a\x1a\x03\x03\x80\
-\xb4\x72\x35\xcd\x5b\xff\x7c\xe0\x42\x60\xed\xe1\x7f\x3e\x80\xc7\
-\xbe\x32\x50\x4a\x4d\xeb\x2b\x48\x1a\x23\x03\x80\xb4\x6a\x23\x2b\
-\xd7\xd5\x10\x02\xf6\x02\xce\x25\xcd\xaa\x77\x36\xf1\x27\xff\xdb\
-\x80\x7d\x88\x5f\x61\x51\x52\x8f\xc6\xfa\xaa\x91\xd4\x9a\x21\xe0\
-\xad\xc0\xfd\xc0\x7b\x82\x6b\xd9\x7b\xb8\x45\xbb\x1d\x78\x2e\xf0\
-\x9b\xe8\x42\x24\xf5\xce\x2b\x00\xd2\xe8\xbc\x17\x78\x7f\x74\x11\
-\x15\xb8\x09\xd8\x03\x4f\xfe\x52\xe7\x19\x00\xa4\xd1\x7b\x1f\xf0\
-\xae\xe8\x22\x02\xcd\x25\x5d\xf6\xbf\x3e\xba\x10\x49\xe3\x67\x00\
-\x90\xc6\xe6\x23\xa4\x65\x7c\x5b\x73\x23\xe9\xe4\x7f\x43\x74\x21\
-\x92\xfa\xc3\x00\x20\x8d\xdd\x89\xc0\x3f\x46\x17\x51\xd0\xef\x48\
-\x97\xfd\x6f\x8c\x2e\x44\x52\xff\x18\x00\xa4\xde\x7c\x0c\x78\x03\
-\xe9\x21\xc1\x41\xf6\x5b\x60\x5f\x60\x5e\x74\x21\x92\xfa\xcb\x00\
-\x20\xf5\xee\xbf\x81\xbf\x07\x96\x45\x17\x92\xc9\xcf\x49\x53\x0d\
-\xdf\x1a\xf5\xeb\x29\x6e\x00\x00\x08\xb1\x49\x44\x41\x54\x5d\x88\
-\xa4\xfe\x33\x00\x48\xe3\x73\x0a\xf0\x3a\x06\x2f\x04\x5c\x4d\x7a\
-\xd5\xef\x8f\xd1\x85\x48\xca\xc3\x00\x20\x8d\xdf\xe7\x80\xbf\x05\
-\x96\x44\x17\xd2\x27\x3f\x21\x9d\xfc\xef\x8a\x2e\x44\x52\x3e\x06\
-\x00\xa9\x3f\xbe\x0c\x1c\x41\xf7\x43\xc0\xe5\xa4\x7b\xfe\xf7\x44\
-\x17\x22\x29\x2f\x03\x80\xd4\x3f\x5f\x01\x0e\x27\x2d\x2b\xdc\x45\
-\xdf\x23\x2d\x32\x74\x7f\x74\x21\x92\xf2\x33\x00\x48\xfd\xf5\x35\
-\xe0\x60\xe0\x91\xe8\x42\xc6\xe8\xbb\xa4\x95\x07\x1f\x88\x2e\x44\
-\x52\x19\x06\x00\xa9\xff\xce\x07\x0e\xa1\x3b\x21\xe0\x22\xd2\x2f\
-\xff\x05\xd1\x85\x48\x2a\xc7\x00\x20\xe5\x71\x21\xdd\x38\xa9\x5e\
-\x40\xba\x62\xf1\x70\x74\x21\x92\xca\x32\x00\x48\xf9\x7c\x07\x38\
-\x80\x7a\x2f\xab\x9f\x47\xb7\xae\x54\x48\xea\x23\x03\x80\x94\xd7\
-\x65\xa4\x7b\xeb\xb5\x3d\x58\xf7\x55\xd2\xc9\x7f\x61\x74\x21\x92\
-\x62\x18\x00\xa4\xfc\xbe\x0f\x3c\x87\x7a\x5e\xad\x3b\x13\x78\x05\
-\xdd\x7d\x5b\x41\x52\x1f\x18\x00\xa4\x32\xae\x02\x9e\x07\xdc\x1d\
-\x5c\xc7\x97\x80\x57\xd2\xfd\xf9\x0a\x24\x8d\x93\x01\x40\x2a\xe7\
-\xa7\xc4\xce\xb0\x77\x0a\x9e\xfc\x25\x0d\x33\x00\x48\x65\xfd\x8c\
-\xb4\xc0\xce\x6d\x85\xf7\x7b\x32\xf0\x7a\x06\x6f\xcd\x02\x49\x3d\
-\x32\x00\x48\xe5\x5d\x43\x9a\x6e\xb7\xd4\x2a\x7b\x27\x91\x96\x2e\
-\xf6\xe4\x2f\xe9\x51\x06\x00\x29\xc6\x6f\x81\x7d\x80\x5b\x32\xef\
-\xe7\xa3\xc0\x9b\x80\xa1\xcc\xfb\x91\xd4\x31\x06\x00\x29\xce\xb5\
-\xc0\x1e\xc0\x8d\x99\xb6\xff\x11\xe0\x9f\x32\x6d\x5b\x52\xc7\x19\
-\x00\xa4\x58\x7f\x00\xf6\x06\x7e\xdf\xe7\xed\x1e\x07\xbc\xab\xcf\
-\xdb\x94\x34\x40\x0c\x00\x52\xbc\x9b\x48\xb7\x03\xae\xef\xd3\xf6\
-\xfe\x05\x38\xbe\x4f\xdb\x92\x34\xa0\x0c\x00\x52\x1d\x6e\x06\xf6\
-\x22\xcd\x17\xd0\xab\x45\xa4\x27\xfd\x3f\xd8\x97\x8a\x24\x0d\x34\
-\x03\x80\x54\x8f\x5b\x49\xcf\x04\x7c\x9e\xb1\x3f\xb4\x77\x0b\xe9\
-\xcd\x82\x93\xfb\x5d\x94\xa4\xc1\x64\x00\x90\xea\xf2\x08\xf0\x1a\
-\x60\x57\xd2\x8a\x82\xab\x7b\x75\xef\x76\xe0\x1d\xc0\x96\xc0\xe5\
-\x79\x4b\x93\x34\x48\x26\x47\x17\x20\x69\xa5\xae\x24\x2d\x22\x34\
-\x1b\x78\x3e\xb0\x13\xb0\x21\x30\x83\x34\x89\xd0\x4d\xc0\xb7\x48\
-\xb7\x0c\x7c\xbf\x5f\xd2\x98\x19\x00\xa4\xba\xfd\x11\x38\x63\xb8\
-\x49\x52\xdf\x78\x0b\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\
-\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\
-\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\
-\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\
-\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\
-\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\
-\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\
-\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\
-\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\
-\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\
-\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\
-\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\
-\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\
-\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\
-\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\
-\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\
-\x90\x01\x40\x92\xa4\x06\x19\x00\x24\x49\x6a\x90\x01\x40\x92\xa4\
-\x06\x19\x00\x24\x49\x6a\x50\xa9\x00\x30\x94\x79\xfb\x13\x32\x6f\
-\x5f\x92\x24\xc8\x7f\xbe\xc9\x7d\xbe\x7c\x54\xa9\x00\xf0\x70\xe6\
-\xed\xaf\x95\x79\xfb\x92\x24\x01\xac\x9d\x79\xfb\x0b\x32\x6f\xff\
-\x51\xa5\x02\xc0\x03\x99\xb7\x3f\x23\xf3\xf6\x25\x49\x02\x98\x99\
-\x79\xfb\xb9\xcf\x97\x8f\x2a\x15\x00\xee\xcf\xbc\xfd\x59\x99\xb7\
-\x2f\x49\x12\xe4\x3f\xdf\x0c\x5c\x00\xc8\x7d\x49\x63\x8b\xcc\xdb\
-\x97\x24\x09\xf2\x9f\x6f\x72\xff\x60\x7e\xd4\xa0\xdc\x02\xd8\x2a\
-\xf3\xf6\x25\x49\xda\x10\x58\x37\xf3\x3e\x06\x2e\x00\xcc\xcb\xbc\
-\xfd\xed\x32\x6f\x5f\x92\xa4\x6d\x33\x6f\x7f\x29\x70\x47\xe6\x7d\
-\x3c\xaa\x54\x00\xf8\x5d\xe6\xed\x6f\x04\x6c\x9d\x79\x1f\x92\xa4\
-\xb6\xed\x9d\x79\xfb\x73\x81\x47\x32\xef\xe3\x51\xa5\x02\xc0\x6f\
-\x0b\xec\x63\x9f\x02\xfb\x90\x24\xb5\x6b\xdf\xcc\xdb\xcf\xfd\x63\
-\xf9\xcf\x94\x0a\x00\xf7\x01\x77\x66\xde\xc7\x81\x99\xb7\x2f\x49\
-\x6a\xd7\x6c\xe0\x19\x99\xf7\x31\x90\x01\x00\xf2\x77\x6c\x3f\xd2\
-\xad\x00\x49\x92\xfa\xed\x70\x60\x4a\xe6\x7d\x94\xb8\x5a\xfe\xa8\
-\x92\x01\xe0\x67\x99\xb7\x3f\x19\x78\x45\xe6\x7d\x48\x92\xda\xf4\
-\xca\x02\xfb\xf8\x45\x81\x7d\x84\x38\x84\x34\xc7\x71\xce\x36\x97\
-\xfc\x09\x4d\x92\xd4\x96\xbd\xc8\x7f\xfe\xba\x9f\x01\x3e\x7f\xad\
-\x47\x7a\xc5\x21\xf7\x41\x3c\xb2\x54\x87\x24\x49\x4d\xb8\x98\xfc\
-\xe7\xae\xf3\x8a\xf5\x26\xc8\x4f\xc8\x7f\x10\xaf\x03\xd6\x28\xd5\
-\x21\x49\xd2\x40\xdb\x93\xfc\xe7\xad\x21\xe0\x1d\xa5\x3a\x14\xe5\
-\xa3\x94\x39\x90\xef\x2d\xd5\x21\x49\xd2\xc0\x9a\x4c\x7a\x7e\xad\
-\xc4\x79\x6b\xc7\x42\x7d\x0a\xb3\x2f\x65\x0e\xe4\x43\xb8\x3e\x80\
-\x24\x69\x7c\xde\x49\x99\x73\xd6\x3c\xca\x3e\x94\x1f\x62\x22\x70\
-\x13\x65\x0e\xe8\x95\x78\x2b\x40\x92\xd4\x9b\x5d\x48\xb3\xf2\x95\
-\x38\x5f\x9d\x58\xa8\x4f\xe1\x3e\x4c\x99\x03\x3a\x04\x7c\xb2\x50\
-\x9f\x24\x49\x83\x63\x16\xf0\x7b\xca\x9d\xab\xb6\x2f\xd3\xad\x78\
-\xdb\x50\xee\xa0\x0e\x01\xc7\x94\xe9\x96\x24\x69\x00\x4c\xa5\xcc\
-\x53\xff\x23\xed\xea\x32\xdd\xaa\xc7\x55\x94\x3b\xb8\x4b\x81\xc3\
-\xca\x74\x4b\x92\xd4\x61\x93\x80\xaf\x50\xf6\x47\xea\xc0\x3f\xfd\
-\xbf\xa2\xd7\x50\xf6\x00\x2f\xa2\xcc\x2c\x4e\x92\xa4\x6e\x5a\x03\
-\xf8\x2a\x65\xcf\x4d\x0b\x48\x6b\x0c\x34\x65\x2a\xe5\x1e\x06\x1c\
-\x69\xcb\x48\x4f\x74\x4a\x92\xb4\xbc\x59\xc0\xa5\x94\x3d\x27\x0d\
-\x01\xff\x51\xa2\x73\x35\x7a\x0b\xe5\x0f\xf6\x10\x70\x16\xe9\x2f\
-\x5b\x92\xa4\xa7\x03\xd7\x53\xfe\x5c\xf4\x08\xb0\x71\x81\xfe\x55\
-\x69\x2d\xe0\x36\x62\x42\xc0\x75\xa4\xb9\x9d\x25\x49\x6d\x9a\x02\
-\x1c\x0b\x2c\x24\xe6\x3c\x74\x52\xfe\x2e\xd6\xed\x1f\x89\x39\xf0\
-\x43\xa4\x5b\x02\xa7\xe3\x12\xc2\x92\xd4\x9a\xbd\x81\x5f\x11\x77\
-\xfe\x59\x08\x6c\x96\xb9\x8f\xd5\x9b\x4a\x5a\xff\x38\xea\x2f\x61\
-\x88\x74\x19\xe6\x64\xe0\x49\x99\xfb\x2a\x49\x8a\xb5\x3b\x70\x2e\
-\xb1\xe7\x9c\x21\xe0\x43\xb9\x3b\xda\x15\xfb\x11\xff\x97\x31\x92\
-\xc8\xbe\x0e\xbc\x98\x14\x4c\x24\x49\xdd\xb7\x11\xf0\x36\xd2\xfb\
-\xf6\xd1\xe7\x99\x21\xe0\x0f\xc0\xb4\x9c\x1d\xee\x9a\xd2\xef\x5d\
-\xae\xae\xdd\x0b\x7c\x83\x34\x89\xd0\x2e\xc0\x8c\x7c\x5d\x97\x24\
-\xf5\xd1\xc6\xa4\x1f\x96\x1f\x02\x7e\x04\x2c\x21\xfe\x9c\xb2\x7c\
-\x7b\x71\xbe\xae\x8f\xcd\x84\xe8\x02\x86\x3d\x11\xf8\x0d\x75\x9f\
-\x68\xe7\x01\xb7\x02\xf3\x87\xdb\xb2\xd8\x72\x24\x49\xc0\x9a\xa4\
-\x73\xc7\x7a\xc0\xe6\xd4\x7d\x1e\x39\x0f\x38\x28\xba\x88\x11\xb5\
-\x04\x00\x80\xbf\x03\x4e\x89\x2e\x42\x92\xa4\x0c\xee\x06\x76\x02\
-\x6e\x8e\x2e\x64\xc4\xa4\xe8\x02\x96\xf3\x53\xd2\x12\xbe\x3b\x44\
-\x17\x22\x49\x52\x1f\x0d\x01\xaf\x00\x7e\x1c\x5d\xc8\xf2\x6a\x5b\
-\x7f\xf8\x8d\xc0\x35\xd1\x45\x48\x92\xd4\x47\x1f\x25\x3d\x57\x56\
-\x95\x9a\x6e\x01\x8c\xd8\x0e\xb8\x02\x9f\x92\x94\x24\x75\xdf\x15\
-\xc0\x9e\xa4\x35\x69\xaa\x52\xd3\x2d\x80\x11\x77\x02\x37\x00\x87\
-\x50\x67\x40\x91\x24\x69\x34\xe6\x02\xfb\x03\xf7\x45\x17\xb2\x32\
-\x35\x06\x00\x48\x33\x34\xdd\x05\x1c\x10\x5d\x88\x24\x49\x3d\xb8\
-\x1b\x78\x0e\xe9\x07\x6d\x95\x6a\x0d\x00\x00\x57\x92\x26\xe4\xd9\
-\x23\xba\x10\x49\x92\xc6\xe0\x21\xe0\x85\xa4\xc9\x87\xaa\x55\x73\
-\x00\x00\x98\x43\x9a\xd4\xe1\xe9\xd1\x85\x48\x92\x34\x0a\x8b\x49\
-\xb7\xb0\xe7\x44\x17\xb2\x3a\xb5\x07\x00\x48\x13\x27\xcc\x00\x76\
-\x8b\x2e\x44\x92\xa4\xc7\xf0\x20\xf0\x37\xc0\x85\xd1\x85\x8c\x46\
-\x17\x02\x00\xc0\xc5\xa4\x45\x7b\x9e\x83\x0f\x06\x4a\x92\xea\x73\
-\x0f\xe9\xb2\xff\xa5\xd1\x85\x8c\x56\x57\x02\x00\xc0\xe5\xa4\x27\
-\x2a\x0f\xa4\xbe\xf9\x0b\x24\x49\xed\x9a\x0b\xec\x4b\xe5\xf7\xfc\
-\x57\xd4\xa5\x00\x00\xf0\x33\xd2\x01\x7e\x3e\xb0\x56\x70\x2d\x92\
-\x24\x5d\x4e\x3a\x27\xdd\x18\x5d\xc8\x58\x75\xf1\x97\xf4\x79\xc0\
-\x8e\xa4\x83\x2e\x49\x52\x84\x21\xe0\x3f\x81\x7d\x48\x0b\xc5\x75\
-\x4e\xd7\xae\x00\x8c\xb8\x1f\x38\x9d\xf4\x17\xb0\x27\x3e\x17\x20\
-\x49\x2a\xe7\x2e\xe0\x30\xe0\xbf\xe8\xf0\xca\xb0\x5d\x0d\x00\x90\
-\x0e\xfa\x77\x48\x8b\x2b\x3c\x1b\x58\x37\xb4\x1a\x49\x52\x0b\xce\
-\x21\x2d\xe9\xfb\xd3\xe8\x42\xc6\xab\x8b\xb7\x00\x56\x74\x11\xb0\
-\x2d\x70\x3c\xb0\x30\xb8\x16\x49\xd2\x60\xba\x05\x38\x14\x78\x31\
-\x30\x2f\xb8\x96\xbe\x18\xb4\x4b\xe7\x4f\x21\x5d\x92\x79\x7e\x74\
-\x21\x92\xa4\x81\xb0\x18\xf8\x0c\xf0\x1e\x60\x41\x70\x2d\x7d\x35\
-\x68\x01\x60\xc4\xee\xc0\xb1\xa4\x57\x06\x25\x49\x1a\xab\x85\xc0\
-\x69\xc0\x07\x81\x9b\x83\x6b\xc9\x62\x50\x03\xc0\x88\x67\x01\xef\
-\x26\x2d\x2a\x34\xe8\x7d\x95\x24\x8d\xdf\x83\xc0\xe7\x80\x8f\xd0\
-\xd1\xa7\xfb\x47\xab\x95\x93\xe2\x0e\xc0\x51\xc0\xe1\xc0\x06\xc1\
-\xb5\x48\x92\xea\xf3\x13\xe0\x0c\xe0\x7f\x48\x2b\xf9\x0d\xbc\x56\
-\x02\xc0\x88\x49\xa4\x77\x36\x8f\x24\x2d\xd6\x30\x3d\xb6\x1c\x49\
-\x52\xa0\x79\xc0\xd7\x81\x2f\x90\x26\x9a\x6b\x4a\x6b\x01\x60\x79\
-\x6b\x01\x3b\x93\x5e\x21\x7c\x2e\x69\x3e\x81\xa9\xa1\x15\x49\x92\
-\x72\x5a\x00\xfc\x08\xb8\x64\xb8\x5d\x4d\x87\xdf\xe3\x1f\xaf\x96\
-\x03\xc0\x8a\xd6\x21\xad\x38\xb8\x0d\xb0\x15\xb0\x25\xb0\x35\xb0\
-\x51\x64\x51\x92\xa4\x31\x5b\x42\x9a\x9a\xf7\xb7\xc3\xed\x5a\xe0\
-\xe7\xa4\x77\xf7\x97\x06\xd6\x55\x15\x03\xc0\xea\x4d\x27\x3d\x37\
-\x30\x03\x58\x7b\xb8\xad\x13\x5a\x91\x24\x69\xc4\x12\xe0\x01\xe0\
-\x3e\xd2\x2f\xfc\x07\x80\x3b\x49\xaf\xef\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x8d\xc7\xff\x07\x31\x15\x0a\xd0\x12\
-\x42\xd0\xba\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x4a\xee\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x77\xd8\x1d\x55\xb9\xff\xff\x77\x9e\x84\
-\x14\x42\x1a\x09\xbd\x04\x90\xde\x7b\x6f\x16\x40\x9a\x88\xf5\xc7\
-\x51\xb1\x20\x16\x50\x40\x44\x50\x8f\x0a\x58\x28\x8a\x22\x60\x43\
-\x40\xfd\x4a\xb1\x1e\x69\x4a\x95\xde\x91\xde\x3b\x01\x04\x02\x21\
-\x40\x0a\xa9\x4f\x92\xdf\x1f\xf7\x13\xa5\x84\xec\x99\xd9\x6b\xcd\
-\xbd\xd6\xcc\xe7\x75\x5d\x9f\xcb\xeb\x68\x4e\x72\xcf\x3d\x6b\xef\
-\x99\x3d\x65\xad\x7e\x88\x48\x59\x4b\x02\x5b\x02\x6b\x01\xab\xf4\
-\x65\x45\x60\x51\x60\x28\x30\x1c\xe8\xef\x56\x5d\x33\xcd\x01\x26\
-\x03\xaf\x01\xd3\x80\xa7\x81\x27\x80\xc7\x81\x87\x80\x9b\x80\x09\
-\x6e\xd5\x89\x64\xa8\x9f\x77\x01\x22\x19\x18\x0a\xec\x0a\xec\x01\
-\x6c\x0d\xac\xe6\x5b\x8e\xbc\x8d\x47\x81\x1b\x81\xbf\x03\x17\x63\
-\x27\x0b\x22\x22\x22\xa5\x0c\x00\x3e\x00\x9c\x8b\xfd\xe2\x9c\xa7\
-\x64\x95\x69\xc0\xdf\x80\xbd\xd1\xd5\x18\x11\x11\x29\x60\x09\xe0\
-\x7f\xb1\x4b\xcc\xde\x07\x31\x25\x4c\x9e\x02\xbe\x01\x8c\x41\x44\
-\x44\xe4\x4d\x16\x03\x8e\x00\x5e\xc5\xff\x80\xa5\xc4\xc9\x54\xe0\
-\x38\x60\x04\x22\x22\xd2\x7a\x3d\xc0\x81\xd8\x03\x64\xde\x07\x28\
-\xa5\x9e\xbc\x08\x7c\xb1\x6f\xdf\x8b\x88\x48\x0b\xad\x0a\x5c\x85\
-\xff\x01\x49\xf1\xc9\x0d\xd8\x9b\x1c\x22\x22\xd2\x12\xfd\x80\xaf\
-\x02\x33\xf0\x3f\x08\x29\xbe\x99\x0e\x1c\x82\x88\x88\x34\xde\x30\
-\xe0\xcf\xf8\x1f\x78\x94\xb4\x72\x1e\x7a\x36\x40\x44\xa4\xb1\xde\
-\x81\x4d\x1a\xe3\x7d\xb0\x51\xd2\xcc\x03\xc0\xca\x88\x88\x48\xa3\
-\xac\x03\xfc\x1b\xff\x83\x8c\x92\x76\x9e\x07\x36\x40\x44\x44\x1a\
-\x61\x1b\xe0\x15\xfc\x0f\x2e\x4a\x1e\x79\x19\x9b\xea\x59\xa4\xd1\
-\x34\x15\xb0\x34\xdd\x7a\xc0\xb5\xc0\x48\xef\x42\x24\x2b\x93\x81\
-\x1d\x80\xbb\xbc\x0b\x11\x89\x45\x27\x00\xd2\x64\xab\x60\xaf\x7a\
-\x2d\xed\x5d\x88\x64\xe9\x39\xec\xea\xd1\x38\xe7\x3a\x44\xa2\xd0\
-\x09\x80\x34\xd5\x48\xe0\x56\xb4\x70\x8f\x74\xe7\x21\x60\x0b\xec\
-\x8a\x80\x48\xa3\x68\x26\x2c\x69\xa2\x7e\xc0\x19\xe8\xe0\x2f\xdd\
-\x5b\x13\xf8\x3d\xfa\xb1\x24\x0d\xa4\x55\xb2\xa4\x89\x0e\x03\x0e\
-\xf6\x2e\x42\x1a\x63\x4d\xec\xc1\xc0\x5b\xbc\x0b\x11\x09\x49\x67\
-\xb5\xd2\x34\xeb\x01\xb7\x03\x8b\x78\x17\x22\x8d\x32\x0b\xd8\x08\
-\x9b\x2b\x40\xa4\x11\x74\x0b\x40\x9a\xa4\x07\xf8\x15\x3a\xf8\x4b\
-\x78\x03\x81\xdf\xa0\xef\x4c\x69\x10\xdd\x02\x90\x26\x39\x00\xf8\
-\xbc\x77\x11\xd2\x58\xcb\x03\xe3\x81\xdb\xbc\x0b\x11\x09\x41\xb7\
-\x00\xa4\x29\x46\x00\x4f\x00\x8b\x7b\x17\x22\x8d\xf6\x2a\x36\x5d\
-\xf0\xab\xde\x85\x88\x74\x4b\x97\xb3\xa4\x29\x0e\x43\x07\x7f\x89\
-\x6f\x24\x5a\x3d\x50\x1a\x42\x57\x00\xa4\x09\xc6\x60\xbf\xfe\x87\
-\x79\x17\x22\xad\x30\x19\xbb\x0a\xf0\xb2\x77\x21\x22\xdd\xd0\x15\
-\x00\x69\x82\x83\xd0\xc1\x5f\xea\x33\x1c\x38\xd0\xbb\x08\x91\x6e\
-\xe9\x0a\x80\xe4\x6e\x00\x36\x55\xeb\x72\xce\x75\x48\xbb\xfc\x1b\
-\xbb\x0a\xd0\xeb\x5d\x88\x48\x55\xba\x02\x20\xb9\xdb\x0b\x1d\xfc\
-\xa5\x7e\xcb\x03\xbb\x7b\x17\x21\xd2\x0d\x9d\x00\x48\xee\xf6\xf3\
-\x2e\x40\x5a\x6b\x7f\xef\x02\x44\xba\xa1\x5b\x00\x92\xb3\x11\xc0\
-\x8b\xd8\x24\x2d\x22\x75\x9b\x09\x2c\x01\x4c\xf1\x2e\x44\xa4\x0a\
-\x5d\x01\x90\x9c\xed\x8a\x0e\xfe\xe2\x67\x10\xb0\x8b\x77\x11\x22\
-\x55\xe9\x04\x40\x72\xb6\xa7\x77\x01\xd2\x7a\xef\xf3\x2e\x40\xa4\
-\x2a\xdd\x02\x90\x9c\x3d\x0b\x2c\xeb\x5d\x84\xb4\xda\x33\xc0\x8a\
-\xde\x45\x88\x54\xa1\x2b\x00\x92\xab\xe5\xd1\xc1\x5f\xfc\xad\x80\
-\xc6\xa1\x64\x4a\x27\x00\x92\xab\xcd\xbd\x0b\x10\xe9\xa3\xb1\x28\
-\x59\xd2\x09\x80\xe4\x6a\x13\xef\x02\x44\xfa\x6c\xe6\x5d\x80\x48\
-\x15\x3a\x01\x90\x5c\xad\xeb\x5d\x80\x48\x9f\x75\xbc\x0b\x10\xa9\
-\x42\x27\x00\x92\xab\xb5\xbd\x0b\x10\xe9\xa3\xb1\x28\x59\xd2\x5b\
-\x00\x92\xa3\xc1\xc0\x54\xa0\xbf\x77\x21\x22\xc0\x1c\x6c\x31\xaa\
-\xe9\xde\x85\x88\x94\xa1\x2b\x00\x92\xa3\xb5\xd0\xc1\x5f\xd2\xd1\
-\x1f\x58\xc3\xbb\x08\x91\xb2\x74\x02\x20\x39\xd2\x3d\x57\x49\x8d\
-\xc6\xa4\x64\x47\x27\x00\x92\x23\xdd\x73\x95\xd4\x68\x4c\x4a\x76\
-\x06\x78\x17\x20\x52\x41\xea\xbf\xb6\x1e\x03\x56\xf3\x2e\xa2\x61\
-\x1e\x05\x56\xf5\x2e\x62\x21\x52\x1f\x93\x22\x6f\xa1\x2b\x00\x92\
-\xa3\xd4\xbf\x6c\xef\xf7\x2e\xa0\x81\x1e\xf0\x2e\xa0\x03\x5d\x01\
-\x90\xec\xe8\x04\x40\x72\x33\x18\x58\xc9\xbb\x88\x0e\x74\x02\x10\
-\x5e\xea\x3d\x5d\x05\x18\xe2\x5d\x84\x48\x19\x3a\x01\x90\xdc\xe4\
-\xf0\x06\x40\xea\xbf\x56\x73\x94\x7a\x4f\xf5\x26\x80\x64\x47\x27\
-\x00\x92\x9b\xd4\x2f\xff\x43\xfa\xbf\x56\x73\x94\x43\x4f\x73\x18\
-\x9b\x22\xff\xa1\x13\x00\xc9\x4d\xea\xf7\x5a\xe7\x02\x0f\x7b\x17\
-\xd1\x40\x0f\x62\x13\xee\xa4\x2c\xf5\xb1\x29\xf2\x06\x3a\x01\x90\
-\xdc\xa4\xfe\x2b\xeb\x09\x34\x23\x5c\x0c\x33\x80\x71\xde\x45\x74\
-\x90\xfa\xd8\x14\x79\x03\x9d\x00\x48\x6e\x52\xff\x92\xcd\xe1\x52\
-\x75\xae\x52\xef\xad\xae\x00\x48\x56\x74\x02\x20\x39\x19\x82\xde\
-\x00\x68\xb3\xd4\x7b\xab\x37\x01\x24\x2b\x3a\x01\x90\x9c\xe8\x0d\
-\x80\x76\x4b\xbd\xb7\x7a\x13\x40\xb2\xa2\x13\x00\xc9\x49\x0e\x97\
-\x58\x53\xff\x95\x9a\xb3\x1c\x7a\x9b\xfa\x2d\x2a\x91\xff\xd0\x09\
-\x80\xe4\x24\xf5\x2f\x57\xbd\x01\x10\x97\xde\x04\x10\x09\x48\x27\
-\x00\x92\x93\xd4\xbf\x5c\xf5\x06\x40\x5c\x7a\x13\x40\x24\x20\x9d\
-\x00\x48\x4e\x52\xff\x72\xcd\xe1\x12\x75\xee\x52\xef\x71\xea\x27\
-\xa9\x22\xff\xa1\x13\x00\xc9\x85\xde\x00\x10\x48\xbf\xc7\x7a\x13\
-\x40\xb2\xa1\x13\x00\xc9\x85\xde\x00\x10\x48\xbf\xc7\x7a\x13\x40\
-\xb2\xa1\x13\x00\xc9\x45\x0e\x97\x56\x53\xff\x75\xda\x04\x39\xf4\
-\x38\xf5\x5b\x55\x22\x80\x4e\x00\x24\x1f\xa9\x7f\xa9\xea\x0d\x80\
-\x7a\xe8\x4d\x00\x91\x40\x74\x02\x20\xb9\x48\xfd\x04\x40\x6f\x00\
-\xd4\x43\x6f\x02\x88\x04\xa2\x13\x00\xc9\x45\xea\xbf\xaa\x72\xb8\
-\x34\xdd\x14\xa9\xf7\x3a\xf5\xb1\x2a\x02\xe8\x04\x40\xf2\xb0\x28\
-\xb0\xb2\x77\x11\x1d\xa4\xfe\x70\x5a\x93\xa4\x7e\x02\xb0\x0a\x36\
-\x66\x45\x92\xa6\x13\x00\xc9\xc1\xe6\xa4\x3f\x56\x53\x3f\x28\x35\
-\x49\xea\x27\x5b\xfd\x81\x4d\xbd\x8b\x10\xe9\x24\xf5\x2f\x55\x11\
-\x80\x6d\xbc\x0b\x28\x40\x27\x00\xf5\xc9\xa1\xd7\x5b\x79\x17\x20\
-\xd2\x89\x4e\x00\x24\x07\x5b\x7b\x17\xd0\x81\xde\x00\xa8\x57\x0e\
-\x6f\x02\xe8\x04\x40\x44\xa4\x4b\x8b\x02\x53\x80\x79\x09\xe7\xd1\
-\x68\x5b\x2f\x6f\xe7\x51\xfc\xf7\xfb\xc2\x32\x09\x18\x1c\x6d\xeb\
-\x45\x02\xd0\x15\x00\x49\xdd\x9e\xc0\x62\xde\x45\x74\x90\xc3\x25\
-\xe9\xa6\x49\xfd\x39\x80\xe1\xc0\xee\xde\x45\x88\x2c\x8c\x4e\x00\
-\x24\x75\xfb\x78\x17\x50\x80\x4e\x00\xea\x97\x43\xcf\x73\x18\xbb\
-\xd2\x62\x3a\x01\x90\x94\x2d\x0b\xbc\xd7\xbb\x88\x02\xee\xf3\x2e\
-\xa0\x85\xee\xf5\x2e\xa0\x80\xdd\x81\xa5\xbd\x8b\x10\x79\x3b\x3a\
-\x01\x90\x94\x7d\x15\x18\xe4\x5d\x44\x01\xb7\x7b\x17\xd0\x42\x77\
-\x7a\x17\x50\xc0\x60\xe0\x2b\xde\x45\x88\x88\xe4\x66\x34\xe9\x3f\
-\xfc\x37\xff\x61\x2f\x9d\x48\xd7\xaf\x07\x98\x8c\xff\xfe\xef\x94\
-\xa9\xc0\x98\x48\x3d\x10\xe9\x8a\xbe\xb8\x24\x55\xff\x4b\xfa\x0f\
-\xff\x01\xdc\x85\xbd\x06\x28\xf5\x9a\x0b\xdc\xed\x5d\x44\x01\x43\
-\x81\xc3\xbd\x8b\x10\x59\x90\x01\xde\x05\x34\xd0\x70\x6c\xda\xda\
-\xb1\xd8\x2b\x6c\xc3\xb1\x4b\x81\xf3\xb0\xc5\x62\x26\x61\xbf\x6c\
-\xc7\x01\x4f\x02\x33\x5d\xaa\x4c\xdb\x46\xc0\x97\xbd\x8b\x28\xe8\
-\x16\xef\x02\x5a\xec\x56\x60\x5b\xef\x22\x0a\xf8\x0a\x70\x36\x79\
-\x9c\xb0\xd4\x6d\x10\xf6\x7d\xb9\x12\x30\x0c\x18\xc1\x7f\xa7\x51\
-\x9e\x81\x5d\xe5\x99\xc6\x7f\xbf\x2f\xa7\xd4\x5e\x61\x83\xe9\x04\
-\xa0\x3b\x63\xb0\x49\x6a\xb6\xc0\x26\xfe\x58\x1f\xbb\x74\x5d\xd4\
-\x5c\xe0\xdf\xc0\x3d\xc0\x4d\xc0\x0d\xc0\xbf\xb0\x01\xdf\x56\xfd\
-\x81\x53\xc9\x67\x6c\x5e\xe5\x5d\x40\x8b\x5d\x05\x1c\xea\x5d\x44\
-\x01\x03\x80\x5f\x63\xdf\x11\x6d\xbe\x5a\x34\x14\xd8\x0c\x9b\xd9\
-\x73\xfe\xf7\xe5\x72\x94\xbb\x12\x3d\x11\x3b\x91\xba\xb9\x2f\x37\
-\xf6\xfd\x77\x22\xb5\x58\x09\x3b\xa3\xbf\x1a\xe8\x25\xfc\x3d\xc3\
-\xe9\xc0\x05\xc0\x27\x81\x51\xb5\x6c\x51\x5a\xbe\x8b\xff\x7d\xdb\
-\xa2\x99\x8d\xfd\x6a\x11\x1f\xc3\xb1\x7d\xe0\x3d\x0e\x8a\xe6\xa8\
-\x28\x5d\x48\xdb\x28\xec\xbb\xec\x42\xec\x17\x7d\xe8\x9e\xf6\x62\
-\x27\x82\x87\x60\xdf\xcd\x22\xc1\x0d\x00\x3e\x00\x5c\x86\x4d\x41\
-\x5a\xd7\x17\xc6\x2c\xe0\xfc\xbe\x7f\x7b\x60\xf4\xad\xf4\xf7\x7e\
-\xec\x17\x92\xf7\x17\x75\xd1\xdc\x18\xa7\x0d\x52\xc2\xcd\xf8\x8f\
-\x83\xa2\x99\x83\x4d\x6c\xd5\x74\x03\xb1\xef\xac\xf3\xb1\xef\xb0\
-\x3a\xfb\x7b\x29\xb0\x37\xf9\x5c\x41\x94\x84\x0d\xc2\xee\x45\xff\
-\x1b\xff\x2f\x8f\x09\xc0\x49\xc0\xc6\x51\xb7\xd8\xcf\x7a\xe4\xf1\
-\x54\xf7\xeb\x73\x64\x94\x4e\x48\x19\x47\xe3\x3f\x0e\xca\xe4\x55\
-\x60\x9d\x28\x9d\xf0\xb7\x31\x70\x32\xf6\x5d\xe5\xdd\xe7\x67\x80\
-\x2f\xd1\x8e\x1f\x4e\x12\x58\x7f\x60\x7f\xe0\x69\xfc\x07\xf2\x82\
-\x72\x0f\x76\x1b\x62\xa9\x58\x0d\xa8\xd9\x3a\xc0\x0b\xf8\xf7\xb5\
-\x6c\xd6\x8f\xd1\x0c\x29\x65\x23\xfc\xc7\x41\xd9\x3c\x0f\xac\x19\
-\xa3\x19\x0e\x96\xc2\x9e\xc3\xb8\x07\xff\xbe\x2e\x28\x4f\x01\x9f\
-\xc5\xbe\xd3\x45\x3a\xda\x08\x7b\x10\xcf\x7b\xe0\x16\xc9\x6c\xec\
-\x79\x81\x9c\x6f\x11\xac\x05\x8c\xc7\xbf\x97\x65\xa3\x05\x80\xd2\
-\xf1\x04\xfe\xe3\xa1\x6c\x9e\x03\xd6\x88\xd1\x8c\x1a\xcc\xbf\xc4\
-\x7f\x01\xf9\x3c\x83\x71\x0b\xb0\x61\x8c\x66\x48\x33\x0c\x02\x4e\
-\x20\x9f\x01\xfd\xe6\xbc\x84\x5d\x7e\xcb\xe9\x16\xc1\x4e\xc0\xcb\
-\xf8\xf7\xae\x4a\x7e\x18\xa1\x1f\x52\xcd\x4f\xf0\x1f\x0f\x55\x3f\
-\xb3\xef\x8e\xd0\x8f\x58\x36\xc1\xbe\x63\x5e\xc2\xbf\x77\x55\x32\
-\x1b\x38\x9e\x7c\x7f\x2c\x49\x24\xab\x00\xb7\xe1\x3f\x40\x43\xe5\
-\x1e\xec\xb2\x5c\xca\xb7\x08\x0e\x25\xce\x5b\x14\x75\x45\xbf\x26\
-\xd2\xb1\x29\xfe\xe3\xa1\x6a\x66\x03\x07\x85\x6f\x49\x30\x4b\x63\
-\x53\x72\xdf\x8b\x7f\xaf\x42\xe5\x56\xf4\xc6\x80\xf4\xd9\x13\x78\
-\x05\xff\x41\x19\xeb\xcb\x25\xb5\x5b\x04\x2b\x02\x17\xe3\xdf\x9b\
-\x6e\x72\x47\xf0\xae\x48\xb7\xee\xc6\x7f\x5c\x74\x93\x7f\x00\x2b\
-\x04\xef\x4a\x35\x83\x80\x0f\x62\xaf\xee\xe5\x7a\x45\xb4\x53\x5e\
-\x06\xf6\x08\xd5\x30\xc9\xd3\x17\xc8\xfb\x57\x68\x99\xcc\xbf\x45\
-\xb0\x49\x90\xce\x95\xb7\x08\x70\x20\xf9\x3d\xe9\xbf\xa0\xe4\x32\
-\x4b\x61\x9b\x1c\x82\xff\xb8\xe8\x36\x93\x80\x03\xb0\xcf\x8a\x87\
-\x4d\x81\x53\xc8\xf7\x12\x7f\xd9\xf4\x02\x9f\x0b\xd2\x39\xc9\xce\
-\x51\xf8\x0f\x40\xaf\xd4\x79\x8b\x60\x00\xf0\x29\xe0\xf1\x9a\xb6\
-\x2d\x76\xa6\x53\x6e\xb6\x47\xa9\xc7\x18\xe2\x4c\x34\xe3\x91\xc7\
-\xb0\xc9\x73\xea\x78\x97\xbd\x89\x97\xf8\xcb\xe6\xdb\x5d\x77\x51\
-\xb2\x72\x2c\xfe\x83\x2e\x85\xcc\xbf\x45\xf0\x41\x60\x48\x57\x1d\
-\x7d\xab\x15\xb0\x0f\x56\x8e\x4f\x68\x2f\x2c\xbf\x0e\xd9\x24\x09\
-\xea\x0c\xfc\xc7\x47\xc8\x3c\x0e\x7c\x8b\xf0\xb7\x06\x86\x00\x1f\
-\xa2\xd9\x97\xf8\xcb\xe6\x7b\x5d\x75\x54\xb2\x71\x18\xfe\x83\x2d\
-\xc5\xbc\x06\xfc\x0d\xfb\xb5\xbe\x5c\x85\xbe\xf6\x60\xb7\x17\xbe\
-\x06\xfc\x93\x7a\x67\x4c\xac\x2b\x73\xb1\xd7\x16\x25\x4d\xeb\x92\
-\xd7\x4c\x92\x45\x33\x07\xfb\x4c\x7d\x0d\x7b\xcb\xa7\xca\x2a\xae\
-\xcb\x03\x9f\x06\xce\xc3\x3e\xeb\xde\xdb\x94\x62\x0e\xa9\xd0\xd7\
-\xac\xf5\xf3\x2e\xa0\x66\x9f\x04\x7e\x4b\xfb\xb6\xbb\x8a\x09\xc0\
-\x9d\xc0\x7d\xd8\x7b\xfa\x13\xfb\x32\x00\x9b\x54\x63\x24\x36\xcf\
-\xf7\xea\xd8\xfb\xcc\xeb\xf4\xfd\x77\x4d\xf6\x0f\xf4\xe0\x50\xea\
-\x2e\x01\x76\xf1\x2e\x22\xb2\x57\x80\x07\x80\x87\x81\x47\xfa\xfe\
-\xef\xc9\xd8\x3d\xed\x39\xd8\x2d\xaa\xd1\xd8\xe5\xfd\x75\xb1\x37\
-\x56\xc6\xb8\x54\x9a\x97\x79\xd8\x31\xe2\x4c\xef\x42\xea\xd2\xa6\
-\x03\xe1\xa6\xc0\xf5\xd8\x13\xae\x22\x55\x6c\x87\x8d\x21\x49\xd7\
-\x3b\x81\x2b\xbd\x8b\x90\x6c\xcd\xc0\x56\x2b\x6c\xc5\x9b\x3e\x6d\
-\x39\x01\x18\x05\xdc\x8e\xad\x3b\x2d\x52\xc5\x25\xc0\xae\xde\x45\
-\x48\x21\x57\x00\xef\xf2\x2e\x42\xb2\xf5\x14\x76\x3b\xb3\xf1\xcb\
-\x0c\x57\xb9\x97\x94\xa3\xdf\xa3\x83\xbf\x54\x37\x0f\x3d\x29\x9c\
-\x93\xff\xf5\x2e\x40\xb2\x36\x16\xf8\x8d\x77\x11\x75\x68\xc3\x09\
-\xc0\xc7\xd0\x7d\x5b\xe9\xce\x79\xd8\x4c\x91\x92\x87\x9b\xb1\x27\
-\xdc\x45\xaa\x7a\x1f\xb0\x8f\x77\x11\xb1\x35\xfd\x16\xc0\x68\xec\
-\x61\x99\x25\xbd\x0b\x91\x6c\xcd\xc4\x96\x2a\xd6\xe2\x3f\x79\x59\
-\x15\x7b\x80\x55\xcf\xfc\x48\x55\x2f\x01\x6b\x63\x0f\x44\x37\x52\
-\xd3\x97\x48\xfc\x39\xb0\xad\x77\x11\x92\xb5\xe3\x80\xbf\x7a\x17\
-\x21\xa5\xbd\x0c\x2c\x86\x3e\xff\x52\xdd\xa2\xd8\xdb\x13\xe7\x7b\
-\x17\x12\x4b\x93\xaf\x00\x6c\x01\xdc\x44\xb3\xb7\x51\xe2\x7a\x1a\
-\x7b\xef\x7f\x9a\x77\x21\x52\xc9\x62\xc0\x43\x54\x9b\xd7\x42\x04\
-\xec\xf9\x9f\xad\xb0\xe5\x84\x1b\xa7\xa9\xcf\x00\xf4\x03\x7e\x8c\
-\x0e\xfe\xd2\x9d\x83\xd0\xc1\x3f\x67\x53\x81\x2f\x7a\x17\x21\x59\
-\xeb\x07\xfc\x94\x86\x1e\x4b\x9a\x7a\x02\xf0\x09\xec\x5d\x4e\x91\
-\xaa\x7e\x4b\x83\x2f\xfd\xb5\xc8\x85\xc0\xd9\xde\x45\x48\xd6\xb6\
-\x04\x3e\xee\x5d\x44\x0c\x4d\x3c\xab\x59\x14\xbb\xec\x97\xca\xd2\
-\x9a\x92\x9f\xe7\xb1\x99\x0d\x5f\xf1\x2e\x44\x82\x18\x89\x3d\x10\
-\xa8\x5b\x01\x52\xd5\xb3\xc0\x9a\xd8\x55\xa5\xc6\x68\xe2\x15\x80\
-\x6f\xa2\x83\xbf\x54\x37\x17\x9b\x0e\x54\x07\xff\xe6\x78\x15\xd8\
-\x1f\xdb\xb7\x22\x55\x2c\x07\x7c\xdd\xbb\x88\xd0\x9a\xf6\x16\xc0\
-\xca\xd8\xe5\xbe\x3a\x96\xd1\x94\x66\xfa\x1e\xb6\xaa\x9c\x34\xcb\
-\x63\xd8\x2a\x78\x7a\x2b\x40\xaa\xda\x02\xf8\x23\xf6\x86\x49\x23\
-\x34\xed\x04\xe0\x74\x60\x7d\xef\x22\x24\x5b\x57\x03\xfb\x61\x4f\
-\xfe\x4a\xf3\x5c\x83\xad\x15\x30\xd6\xbb\x10\xc9\xd2\x00\x60\x59\
-\xe0\x2f\xde\x85\x84\xd2\xa4\x67\x00\x76\x04\xae\xf2\x2e\x42\xb2\
-\xf5\x34\xb0\x39\xf0\x82\x77\x21\x12\xd5\xb2\xc0\xbf\xfa\xfe\x53\
-\xa4\x8a\x77\x62\x3f\x16\xb2\xd7\x94\x13\x80\xfe\xd8\x62\x3f\x1b\
-\x78\x17\x22\x59\x9a\x8a\x5d\x1a\xbe\xdb\xbb\x10\xa9\xc5\x46\xc0\
-\x75\xc0\x50\xef\x42\x24\x4b\xf7\x63\x4b\x2c\xf7\x7a\x17\xd2\xad\
-\xa6\x3c\x04\xb8\x3f\x3a\xf8\x4b\x35\x73\xb1\x57\x7c\x74\xf0\x6f\
-\x8f\x3b\x81\x7d\xd1\x43\x81\x52\xcd\x3a\xd8\xad\x42\x49\xc0\x48\
-\xe0\x45\xec\xbe\xad\xa2\x94\xcd\x01\x48\x5b\x7d\x05\xff\xf1\xa7\
-\xe4\x99\x17\xb1\x63\x4f\xd6\x9a\xf0\x10\xe0\xb1\xc0\xbb\xbd\x8b\
-\x90\x2c\x7d\x13\x38\xd1\xbb\x08\x71\x73\x33\x76\x15\x74\x07\xef\
-\x42\x24\x3b\x43\xb1\x85\xa6\x2e\xf5\x2e\xa4\xcd\xd6\x04\x66\xe1\
-\x7f\x36\xa8\xe4\x97\xe3\x11\x31\x27\xe1\x3f\x1e\x95\xfc\x32\x0b\
-\x3b\x06\x65\x2b\xf7\x2b\x00\xbf\x07\xd6\xf0\x2e\x42\xb2\xf3\x43\
-\xe0\x08\xef\x22\x24\x19\x97\x02\xc3\xb0\x45\x5f\x44\x8a\xea\x8f\
-\x9d\x00\x9c\xe9\x5d\x48\x1b\xed\x8e\xff\x19\xa0\x92\x5f\x8e\x43\
-\x64\xc1\x8e\xc0\x7f\x7c\x2a\xf9\x65\x37\xa4\x56\x8b\x60\xf3\xfd\
-\x7b\xef\x78\x25\x9f\xcc\xc1\x1e\xfa\x12\x59\x98\x23\xb0\xb7\x03\
-\xbc\xc7\xab\x92\x4f\x1e\xc2\x8e\x49\xd9\xc9\xf5\x16\xc0\x57\x80\
-\xff\xf1\x2e\x42\xb2\x31\x03\x7b\xed\xeb\x74\xef\x42\x24\x79\x37\
-\x60\xef\x79\xef\x49\xa6\x5f\xea\x52\xbb\x31\xd8\x7a\x13\x37\x79\
-\x17\x52\x56\x8e\x13\x01\x2d\x01\x3c\x42\x03\x5e\xc1\x90\x5a\xbc\
-\x00\xec\x05\xdc\xe2\x5d\x88\x64\x65\x6b\xe0\x3c\xec\xfb\x46\xa4\
-\x93\x57\x81\xd5\x81\x09\xde\x85\x94\x91\xe3\x44\x40\x3f\x40\x07\
-\x7f\x29\xe6\x36\x6c\x01\x0f\x1d\xfc\xa5\xac\x1b\x81\x8d\xc9\xf0\
-\x57\x9d\xb8\x18\x09\x7c\xdf\xbb\x88\xa6\x9b\x3f\xfd\xa2\xf7\x3d\
-\x9f\xb2\x79\x05\xfb\x42\xf1\xae\xa3\x4d\x39\x09\x5d\xc2\x95\xee\
-\x0d\x04\x7e\x86\xff\x78\x6e\x53\x6e\xc4\xbe\x33\xbd\xeb\x28\x9b\
-\x5e\xec\x18\x25\x91\x5c\x8d\xff\x4e\xae\x92\x83\xfb\xea\x5f\x03\
-\x38\x06\x78\x26\x81\x9a\x9a\x9a\x09\xc0\x07\x10\x09\xeb\xc3\xc0\
-\x4b\xf8\x8f\xef\xa6\xe6\x19\xec\xbb\x71\xfe\x6b\xdd\x07\x27\x50\
-\x53\x95\x5c\x8d\x44\xf1\x11\xfc\x77\x6e\x95\x3c\xc0\x5b\x7f\x89\
-\xf6\x60\x8b\xcf\x9c\x8a\x2d\x44\xe3\x5d\x63\x53\x72\x31\x5a\xe5\
-\x4d\xe2\x59\x0a\x38\x1f\xff\x71\xde\x94\xcc\x00\xfe\x8c\x3d\x70\
-\x39\xe0\x4d\xbd\x1e\x00\xdc\x9b\x40\x8d\x55\xf2\x61\x24\xa8\x21\
-\xc0\x93\xf8\xef\xd8\x2a\x79\x6f\x87\x6d\x1b\x01\x7c\x0e\x7b\xfa\
-\xd8\xbb\xd6\x5c\xf3\x12\xf0\xa9\x0e\x7d\x16\x09\xa1\x1f\xf0\x59\
-\x60\x22\xfe\xe3\x3e\xd7\xdc\x80\x7d\xe7\x8d\xe8\xd0\xeb\xf7\x26\
-\x50\x6b\x95\x3c\x89\x1d\xb3\x24\x90\x6f\xe3\xbf\x53\xab\xe4\x82\
-\x92\xdb\xb9\x3a\x70\x14\xf0\x44\x02\xb5\xe7\x90\xb9\xd8\x6c\x90\
-\x7a\x52\x5b\xea\xb6\x38\x76\x05\x4f\x73\x06\x14\xcb\xb3\xd8\x73\
-\x39\xeb\x97\xec\xf3\x85\x09\xd4\x5e\x25\xdf\x2a\xb9\x9d\xf2\x36\
-\x96\x23\xcf\xcb\xe4\x33\xb1\x03\x7a\x15\x3d\xc0\xce\xc0\xd9\xc0\
-\xb4\x04\xb6\x25\xc5\xdc\x8c\xdd\x46\x11\xf1\xb4\x3d\x70\x2b\xfe\
-\x9f\x87\x14\x33\x0d\xfb\x0e\xdb\x99\xea\x6f\x9c\xad\x8e\x7d\x97\
-\x7a\x6f\x4b\xd9\x4c\xc5\x8e\x5d\xd2\xa5\xb3\xf0\xdf\x99\x55\xf2\
-\xa3\x40\xdb\x3f\x1c\x9b\xc4\xe6\x72\xf4\x6b\x63\x1e\xf0\x30\x76\
-\x8f\x2d\xc7\x39\x2c\xa4\xb9\xf6\xc4\xe6\x27\xf1\xfe\x7c\xa4\x90\
-\xdb\xb0\x87\xf8\x46\x77\xd5\xd1\xff\x3a\x21\x81\x6d\xaa\x12\xad\
-\x11\xd0\xa5\xad\xc8\xf3\xa0\xf7\x02\x9d\xef\x6f\x55\xb1\x3a\x36\
-\x0f\xc2\xd3\x09\x6c\x63\xdd\x79\x00\x3b\x11\x7a\xf3\xc3\x42\x22\
-\xa9\x58\x04\xf8\x0c\xed\x9c\xa6\xfc\x69\xec\xbb\xa9\xea\x55\xcf\
-\x85\x19\x81\x7d\xa7\x7a\x6f\x63\xd9\xcc\x45\x0b\x4c\x55\xd6\x83\
-\x4d\xe0\xe2\xbd\x13\xab\x64\xff\x08\xfd\x78\xbd\x1e\x60\x27\xec\
-\xea\x48\xd3\x6f\x11\xdc\x82\xbd\xd6\x97\xe3\xa4\x55\xd2\x4e\x3d\
-\xc0\x87\x68\xfe\xad\x81\x69\xd8\x77\xd0\x4e\xc4\xff\x7c\x7e\xd6\
-\x79\x5b\xbb\xf9\xfe\xd2\x77\x57\x05\x9f\xc2\x7f\xe7\x55\xc9\x1d\
-\xd4\xbb\xc6\x42\x13\x6f\x11\x4c\xc7\x5e\x0f\xda\x3a\x60\x9f\x44\
-\x3c\x6c\x42\xf3\x5e\xf7\x0d\x7d\x89\xbf\x88\x1e\xe0\x5f\x81\xb7\
-\xa3\xae\x7c\x32\x42\x3f\x1a\x6d\x18\xf0\x1c\xfe\x3b\xae\x6c\xe6\
-\x62\x0f\x05\x79\x59\x0d\x38\x12\xbb\x5c\xee\xdd\x8b\xb2\x99\x03\
-\x5c\x89\x9d\xe9\x6b\xaa\x67\x69\x9a\x51\xd8\xab\x6f\x57\x63\x63\
-\xdd\xfb\xf3\x56\x36\xf7\x03\xdf\xc1\xbe\x63\xbc\x6c\x47\x9e\x3f\
-\x72\x9e\xc3\x8e\x69\x52\xd0\xb1\xf8\xef\xb4\x2a\xf9\x53\x8c\x66\
-\x54\xb4\x3e\x36\x37\xf5\x9d\xa4\xfb\xa1\x99\x01\x5c\x86\xfd\x9a\
-\xd0\x13\xb3\xd2\x16\xcb\x03\x87\x60\x57\xed\x52\x7d\xc2\x7d\x2e\
-\x76\x35\xf3\x7b\xc0\x7a\x71\xda\x50\xc9\x1f\xf1\xef\x4d\x95\x1c\
-\x1b\xa3\x19\x4d\xb4\x0a\x76\x60\xf0\xde\x61\x65\x33\x0d\x18\x1b\
-\xa1\x1f\x21\x2c\x8d\x5d\x86\x3a\x0b\x18\x87\x5f\x8f\x7a\x81\xdb\
-\xb1\xf7\x81\xf7\x02\x86\x46\xdc\x66\x91\x1c\x2c\x06\xec\x0d\x9c\
-\x82\x9d\xac\x7b\xae\x75\xf2\x04\xf6\x1d\xb1\x2f\x36\xeb\x61\x8a\
-\x56\x24\xcf\xe7\x9e\x66\x60\xc7\xb6\xa4\xa4\xf8\x2a\xd5\xdf\xb0\
-\x0f\x44\x6e\xbe\x8b\x5d\x7e\xcf\xc1\xd2\xc0\x96\xc0\xe6\xc0\xda\
-\x7d\x59\x99\xb0\x4f\xd8\xcf\xc2\x6e\x45\xdc\x0b\xdc\x87\xfd\x9a\
-\xb8\x05\x98\x12\xf0\xdf\x10\x69\x9a\xe1\xd8\x93\xe3\x1b\x62\xbf\
-\xbc\xd7\x03\xd6\xc4\x16\x25\x0a\xa5\x17\x3b\xd8\x3f\xd0\x97\x5b\
-\xb1\x79\x35\x5e\x08\xf8\x6f\xc4\x74\x34\x76\x3b\x22\x37\xe7\x92\
-\xd8\x3a\x25\xa9\x9d\x00\xbc\x0b\xb8\xc2\xbb\x88\x0a\xfe\x8d\x7d\
-\x48\x5f\xf3\x2e\xa4\x0b\x03\x81\x77\x60\x97\xe2\x97\xed\xcb\x12\
-\xd8\x2f\x94\x11\xd8\xd4\x96\x8b\xf6\xfd\xd9\x19\xd8\x83\x7a\xbd\
-\xd8\x3a\xd8\xaf\x62\xab\x77\x3d\x87\x5d\x61\x18\x07\x3c\x8f\x5d\
-\x46\x14\x91\xee\xf4\x07\x96\x01\x56\xea\xcb\x32\xd8\x33\x05\xa3\
-\xb0\xe7\x65\xfa\x63\xf7\x98\xe7\x9f\xc0\x4f\xeb\xcb\x64\xec\x84\
-\x7b\x02\xf6\xd9\x9c\x9f\xc7\xb1\x13\xf4\x5c\x2d\x8a\xbd\x6a\xb9\
-\x82\x77\x21\x15\xbc\x1b\x7b\xd6\x49\xde\xa4\x3f\x70\x37\xfe\x97\
-\x6a\xaa\x64\x9f\x08\xfd\x10\x11\x91\x05\xfb\x1f\xfc\xbf\xf7\xab\
-\xe4\x7e\x34\x97\xc9\x02\x1d\x88\xff\xce\xa9\x92\x1b\x49\xef\x4a\
-\x8a\x88\x48\x93\xf5\x03\xae\xc5\xff\xfb\xbf\x4a\x0e\x88\xd0\x8f\
-\xac\x8d\xc2\x2e\x53\x79\xef\x98\xb2\x99\x83\xdd\x47\x17\x11\x91\
-\x7a\x6d\x44\x9e\xaf\x54\x4e\xa4\xde\x39\x14\x92\x77\x32\xfe\x3b\
-\xa5\x4a\xce\x88\xd1\x0c\x11\x11\x29\xe4\x0c\xfc\x8f\x03\x55\x72\
-\x52\x8c\x66\xe4\x68\x2d\xec\x81\x14\xef\x1d\x52\x36\x93\xb1\x87\
-\x71\x44\x44\xc4\xc7\x92\xd8\x43\xc8\xde\xc7\x83\xb2\x99\x0d\xac\
-\x1b\xa1\x1f\xd9\xb9\x18\xff\x9d\x51\x25\x87\xc7\x68\x86\x88\x88\
-\x94\x72\x38\xfe\xc7\x83\x2a\xf9\x67\x8c\x66\xe4\xe4\x7d\xf8\xef\
-\x84\x2a\x79\x1c\x18\x14\xa1\x1f\x22\x22\x52\xce\x40\x6c\x99\x70\
-\xef\xe3\x42\x95\xec\x19\xa1\x1f\x59\xc8\x79\xa7\xed\x15\xa1\x1f\
-\x22\x22\x52\xcd\x5e\xf8\x1f\x17\xaa\xe4\x31\x5a\xfa\x63\x32\xd7\
-\xcb\x36\x39\x4e\x54\x24\x22\xd2\x74\x97\xe0\x7f\x7c\xa8\x92\xaf\
-\xc5\x68\x46\xca\x72\x7d\x70\xa3\x97\xb4\x16\xc6\x10\x11\x11\xa3\
-\x07\xca\x33\x71\x3a\xfe\x4d\xaf\x92\x93\x63\x34\x43\x44\x44\x82\
-\xc8\xf5\x95\xf2\xd3\x62\x34\x23\x45\xb9\x4e\xde\xf0\x32\x9a\xbc\
-\x41\x44\x24\x65\x39\x4f\x2a\xb7\x59\x84\x7e\x24\xe7\x1a\xfc\x9b\
-\x5d\x25\x5f\x8a\xd1\x0c\x11\x11\x09\x2a\xd7\x69\xe5\x6f\xa0\xe1\
-\xd3\xca\xef\x83\x7f\x93\xab\xe4\x7e\x60\x91\x08\xfd\x10\x11\x91\
-\xb0\xfa\x03\xf7\xe0\x7f\xdc\xa8\x92\xff\x2f\x42\x3f\x92\x30\x04\
-\x5b\x26\xd6\xbb\xc1\x55\xb2\x4b\xf8\x76\x88\x88\x48\x24\xef\xc2\
-\xff\xb8\x51\x25\xcf\x00\x43\x23\xf4\xc3\xdd\x51\xf8\x37\xb7\x4a\
-\xce\x8d\xd0\x0b\x11\x11\x89\xeb\x5c\xfc\x8f\x1f\x55\x72\x64\x8c\
-\x66\x78\x5a\x1e\x98\x8a\x7f\x63\xcb\x66\x26\xb0\x5a\x84\x7e\x88\
-\x88\x48\x5c\xab\x00\xd3\xf1\x3f\x8e\x94\xcd\x34\x60\x6c\x84\x7e\
-\xb8\xf9\x03\xfe\x4d\xad\x92\xe3\x62\x34\x43\x44\x44\x6a\x71\x2c\
-\xfe\xc7\x91\x2a\x39\x27\x46\x33\x3c\x6c\x0d\xcc\xc5\xbf\xa1\x65\
-\x33\x1e\x18\x11\xa1\x1f\x22\x22\x52\x8f\xc5\x80\x67\xf1\x3f\x9e\
-\x54\xc9\xf6\x11\xfa\x51\xab\x1e\xe0\x56\xfc\x1b\x59\x25\x9f\x8e\
-\xd0\x0f\x11\x11\xa9\xd7\xa7\xf0\x3f\x9e\x54\xc9\x1d\xd8\x31\x34\
-\x5b\xfb\xe1\xdf\xc4\x2a\xb9\x9d\xcc\x1b\x2f\x22\x22\x80\x7d\x97\
-\xdf\x82\xff\x71\xa5\x4a\x3e\x13\xa1\x1f\xb5\x18\x06\x3c\x87\x7f\
-\x03\xcb\x66\x2e\xb0\x5d\x84\x7e\x88\x88\x88\x8f\xad\xc8\xf3\x56\
-\xf4\x0b\x64\x7a\x2b\xfa\x87\xf8\x37\xaf\x4a\xce\x8e\xd1\x0c\x11\
-\x11\x71\x75\x16\xfe\xc7\x97\x2a\x39\x3e\x46\x33\x62\x7a\x07\x30\
-\x03\xff\xc6\x95\x4d\xe3\x5e\xbf\x10\x11\x11\x00\x96\x23\xdf\xd7\
-\xd1\x57\x8f\xd0\x8f\x68\x2e\xc0\xbf\x69\x55\xf2\x9d\x18\xcd\x10\
-\x11\x91\x24\x7c\x1b\xff\xe3\x4c\x95\x9c\x1f\xa3\x19\x31\xbc\x1b\
-\xff\x66\x55\xc9\xd3\xc0\xa2\x11\xfa\x21\x22\x22\x69\x18\x0c\x3c\
-\x89\xff\xf1\xa6\x4a\x92\x9f\x92\x7e\x00\xf9\x2e\xc2\xf0\x91\x08\
-\xfd\x10\x11\x91\xb4\x7c\x04\xff\xe3\x4d\x95\x3c\x40\xe2\x8b\xd2\
-\x1d\x84\x7f\x93\xaa\xa4\xf1\xcb\x30\x8a\x88\xc8\x7f\x5c\x8d\xff\
-\x71\xa7\x4a\xbe\x1c\xa1\x17\x41\x8c\x02\x5e\xc2\xbf\x41\x65\x33\
-\x07\xd8\x34\x42\x3f\x44\x44\x24\x4d\x1b\x02\xbd\xf8\x1f\x7f\xca\
-\xe6\x65\x60\x4c\x84\x7e\x74\xed\x67\xf8\x37\xa7\x4a\x7e\x1d\xa3\
-\x19\x22\x22\x92\xb4\x53\xf1\x3f\xfe\x54\xc9\x29\x31\x9a\xd1\x8d\
-\xb5\x81\xd9\xf8\x37\xa6\x6c\x26\x03\x4b\x47\xe8\x87\x88\x88\xa4\
-\x6d\x09\xe0\x15\xfc\x8f\x43\x65\xd3\x0b\xac\x17\xa2\x01\x03\x42\
-\xfc\x25\xc0\x49\x01\xff\xae\x3a\x7d\x17\x5b\xf4\x47\xa4\x29\xfa\
-\x01\xcb\x60\xef\x3c\x8f\xee\xcb\x98\xbe\xff\x1c\xcc\x7f\x67\x15\
-\x1b\xc4\x7f\xdf\x7a\x99\x86\xbd\x6b\x0c\x30\x09\x9b\xc3\x63\x22\
-\x76\x4b\x6f\x62\x5f\x9e\x05\x9e\xc7\xbe\x80\x44\x9a\x60\x02\xf0\
-\x3d\xe0\xc7\xde\x85\x94\xd4\x1f\xf8\x09\xb0\x53\xb7\x7f\x51\x88\
-\x07\xdf\xf6\x02\xce\x0b\xf0\xf7\xd4\xed\x51\x60\x5d\x60\x96\x77\
-\x21\x22\x15\x2c\x09\xac\xdf\x97\x35\x80\x95\xfa\x32\x16\x3b\xb8\
-\xc7\x30\x13\x78\x0a\x18\xd7\x97\x87\xb1\xb7\x7e\xee\x01\x5e\x8c\
-\xf4\x6f\x8a\xc4\x34\x10\x1b\xbf\x6b\x78\x17\x52\xc1\xfb\x71\x9e\
-\x1f\x60\x10\xf0\x18\xfe\x97\x44\xaa\x64\x8f\x08\xfd\x10\x89\x61\
-\x24\xb0\x1b\xf6\x6b\xe5\x32\xec\xaa\x95\xf7\xe7\xe7\xcd\x79\xbe\
-\xaf\xb6\xef\x01\xbb\xf6\xd5\x2c\x92\x83\xdd\xf0\xff\xfc\x54\xc9\
-\x63\xc4\x3b\xd9\x2f\xe4\x88\x05\x14\x95\x43\x2e\x89\xd1\x0c\x91\
-\x40\x86\x03\x1f\x00\x7e\x05\xdc\x8b\xbd\xa9\xe2\xfd\x99\x29\x9b\
-\x39\x7d\xb5\xff\x02\xd8\x1b\x5b\x1c\x4c\x24\x55\x17\xe1\xff\x99\
-\xa9\x92\x23\x62\x34\xa3\x88\xa5\xb1\x87\xe8\xbc\x1b\x50\x36\xb3\
-\x80\xb5\x22\xf4\x43\xa4\x1b\xeb\x60\x1f\xe6\xab\xb0\x31\xea\xfd\
-\x39\x89\xf1\xb9\xbb\x12\x38\x1c\x7b\x68\x58\x24\x25\x6b\x92\xe7\
-\xe7\xce\xed\x41\xf6\xdf\x56\x28\x36\x85\x9c\x18\xa3\x19\x22\x15\
-\xac\x0c\x1c\x0c\xdc\x86\xff\xe7\xa2\xee\xdc\x0f\x1c\x85\x7d\xf1\
-\x8a\xa4\xe0\x27\xf8\x7f\x2e\xaa\xe4\x37\x31\x9a\xb1\x30\x9b\x92\
-\xe7\x65\xc9\x09\xd8\x84\x45\x22\x5e\x46\x03\x87\x00\x77\xe1\xff\
-\x79\x48\x25\x77\x62\x27\x42\x8b\x77\xd1\x57\x91\x6e\x8d\xc4\x1e\
-\x66\xf5\xfe\x3c\x94\x4d\xed\x93\xd9\x5d\x17\x61\x23\xea\xc8\x17\
-\x63\x34\x43\xa4\x83\x7e\xc0\x8e\xc0\xd9\xc0\x74\xfc\x3f\x07\xa9\
-\x66\x3a\xb6\x66\xfb\x0e\x68\x6a\x6e\xf1\xf1\x79\xfc\x3f\x07\x55\
-\x72\x5d\x8c\x66\x2c\xc8\xee\x35\x6d\x50\xe8\xdc\x83\xbd\x3f\x29\
-\x52\x97\xc1\xc0\xfe\xc0\x83\xf8\x8f\xff\xdc\xf2\x40\x5f\xef\x06\
-\x97\xee\xba\x48\x75\xfd\xc9\xf7\xea\xdc\x6e\x11\xfa\xf1\x06\xfd\
-\x80\x3b\x12\xd8\xd0\x2a\xe9\x7a\xd2\x04\x91\x82\xc6\x60\x0f\xf4\
-\x3d\x8b\xff\xb8\xcf\x3d\x2f\x62\xcf\x0a\x24\x39\xff\xb9\x34\xd2\
-\xb6\xc0\x5c\xfc\xc7\x7e\xd9\xdc\x4e\xe4\x2b\x67\x1f\x4e\x60\x23\
-\xab\xe4\x6f\x31\x9a\x21\xf2\x26\x4b\x00\x3f\x02\x5e\xc3\x7f\xcc\
-\x37\x2d\xaf\x01\x3f\x44\x27\x02\x52\x8f\xbf\xe0\x3f\xe6\xab\xe4\
-\x03\x31\x9a\x31\xdf\x0d\x09\x6c\x60\xd9\xcc\x04\x56\x8d\xd1\x0c\
-\x91\x3e\xc3\xb0\x5f\xfc\xaf\xe2\x3f\xde\x9b\x9e\xa9\xc0\x71\xe8\
-\x61\x5e\x89\x6b\x05\xf2\x3c\x91\xbf\x26\x46\x33\xc0\x16\x1f\xf0\
-\xde\xb8\x2a\x39\x26\x46\x33\x44\xb0\x59\xb8\x0e\x47\x07\x7e\x8f\
-\xbc\x02\x1c\x86\x4d\xe5\x2a\x12\xc3\xf7\xf1\x1f\xe7\x55\x12\x65\
-\x9e\x8d\x5f\x26\xb0\x61\x65\x33\x1e\x9b\x55\x4d\x24\xb4\xf7\x60\
-\x0f\xaa\x79\x8f\xf1\xb6\xe7\x51\xec\xd6\xa4\x48\x68\x8b\x62\x6b\
-\x5f\x78\x8f\xf1\xb2\x09\xbe\x5c\xf0\x00\x6c\x45\x30\xef\x0d\x2b\
-\x9b\x4f\x86\x6e\x84\xb4\xde\x5a\xc0\xe5\xf8\x8f\x6d\xe5\x8d\xb9\
-\x94\x3c\x17\x74\x91\xb4\x7d\x1c\xff\xb1\x5d\x36\x13\x08\xfc\xc6\
-\xdb\xbb\x12\xd8\xa8\xb2\xb9\x0d\xe8\x09\xd9\x04\x69\xb5\x45\xb0\
-\xfb\xfc\x33\xf0\x1f\xdb\xca\x82\x33\x0b\x7b\x3e\x40\xb7\x05\x24\
-\x94\x7e\xe4\x39\xef\xcd\xf6\x21\x9b\x70\x52\x02\x1b\x54\x26\x73\
-\xb1\x57\x39\x44\x42\xd8\x08\x7b\xc5\xc6\x7b\x5c\x2b\xc5\x72\x2f\
-\xb0\xc5\x02\xf7\xa4\x48\x79\x9b\x90\xdf\xcc\xb7\x3f\x0e\xd9\x80\
-\x47\x12\xd8\xa0\x32\x39\x33\xe4\xc6\x4b\x6b\x0d\x04\x8e\x07\x7a\
-\xf1\x1f\xd3\x4a\xb9\xf4\xa2\xab\x01\x12\xce\xef\xf0\x1f\xd3\x65\
-\xf2\x60\xa8\x0d\x1f\x4d\x5e\x93\x22\xbc\x06\xac\x18\x6a\xe3\xa5\
-\xb5\xd6\x44\xbf\xfa\x9b\x90\x7b\xb0\x37\x98\x44\xba\xb1\x14\x30\
-\x09\xff\xf1\x5c\x34\x73\xb1\x63\xf7\x42\x15\xb9\x47\xbe\x05\x79\
-\xcd\xcb\x7d\x0c\xf0\xb4\x77\x11\x92\xb5\x2f\x60\x07\xff\x8d\xbd\
-\x0b\x91\xae\xad\x07\xdc\x04\x7c\xce\xbb\x10\xc9\xda\x0b\xd8\x15\
-\xa5\x5c\xf4\x03\x36\x0b\xf1\x17\x1d\x85\xff\xd9\x4c\xd1\x3c\x89\
-\xe6\x0e\x97\xea\x16\x03\xfe\x88\xff\x38\x56\xe2\xe4\x1c\x60\x28\
-\x22\xd5\x0c\x06\x1e\xc7\x7f\x1c\x17\xcd\x77\x3a\x6d\x50\x91\x2b\
-\x00\x39\xad\xd7\x7d\x18\xf6\x94\xb6\x48\x59\xab\x02\x37\x02\x1f\
-\xf5\x2e\x44\xa2\xd9\x07\x7b\x3b\x68\x2d\xef\x42\x24\x4b\x33\xb0\
-\x63\x4c\x2e\x56\x0f\xf1\x97\xdc\x84\xff\x99\x4c\x91\x5c\x15\x62\
-\x63\xa5\x95\xf6\x44\xb3\xf9\xb5\x29\xaf\x00\x7b\x20\x52\xcd\x15\
-\xf8\x8f\xe1\x22\xb9\x21\xc4\xc6\x8e\x4f\x60\x43\x3a\xa5\x17\xd8\
-\x20\xc4\xc6\x4a\xeb\x1c\x4c\x7e\xaf\xf8\x28\xdd\x67\x2e\x76\x7b\
-\x53\xa4\xac\xb5\x81\xd9\xf8\x8f\xe1\x4e\xf9\x77\xb7\x1b\xda\x9f\
-\x3c\xde\x00\xf8\x55\xb7\x1b\x2a\xad\xd3\x1f\xf8\x39\xfe\x63\x57\
-\xf1\xcd\xc9\x04\x9e\x35\x4d\x5a\x21\x87\xef\x8e\x39\x74\xf9\x00\
-\xff\x62\x09\x6c\x44\xa7\xbc\x82\x2d\xc3\x2a\x52\xd4\x50\xe0\x02\
-\xfc\xc7\xae\x92\x46\x2e\xc1\x56\x74\x14\x29\x6a\x71\xe0\x25\xfc\
-\xc7\x6e\xa7\x74\xf5\x50\xfc\x92\x09\x6c\x40\xa7\x1c\xd2\xcd\x06\
-\x4a\xeb\x8c\xc4\x1e\xf6\xf3\x1e\xb7\x4a\x5a\xb9\x95\x02\xef\x4d\
-\x8b\xbc\xce\x41\xf8\x8f\xdb\x4e\x59\x7c\x61\x1b\xd0\xe9\x2d\x80\
-\xd4\x5f\xa9\x9b\x03\xfc\xd3\xbb\x08\xc9\xc6\x12\xd8\xc3\xa2\x5b\
-\x79\x17\x22\xc9\xd9\x0c\x5b\xe4\x49\x57\x13\xa5\xa8\x2b\xb1\x63\
-\x50\xca\x86\x2c\xec\x7f\xec\x74\x02\x30\x33\x60\x21\x31\xf4\xc7\
-\x7e\xcd\xed\xe9\x5d\x88\x24\x6f\x69\xec\x03\xbb\xa1\x77\x21\x92\
-\xac\x8d\x80\x6b\x81\xe5\xbc\x0b\x91\xe4\xed\x8c\x2d\x12\x94\xfa\
-\xf3\x23\x5d\xbd\x16\xbf\x28\xfe\x97\x30\x8a\xa4\x17\x38\xb4\x9b\
-\x0d\x95\x46\x5b\x16\x5b\x37\xde\x7b\x9c\x2a\x79\xe4\x51\x6c\xcc\
-\x88\x2c\xc8\xa1\xe4\xb3\x3e\xc8\xa0\x6e\x36\xb4\x5f\x46\x1b\x3a\
-\x0f\x38\x9b\x0e\x97\x3c\xa4\x75\x96\x00\xee\xc7\x7f\x6c\x2a\x79\
-\xe5\x61\x6c\xfe\x77\x91\xf9\x06\x01\x67\xe0\x3f\x36\x8b\x26\xc8\
-\x15\xfc\x1c\xe6\x01\x78\x7d\x6e\x40\x1f\x5c\x31\xa3\x80\x3b\xf1\
-\x1f\x93\x4a\x9e\xb9\x03\x7b\x68\x54\x64\x29\xec\xd8\xe2\x3d\x26\
-\xcb\xa4\xeb\x79\x00\xc8\x70\xa3\xe7\x61\x8b\x01\x6d\x14\x62\xe3\
-\x25\x5b\x8b\x01\x37\xe3\x3f\x16\x95\xbc\x73\x23\x5a\x3f\xa0\xed\
-\x36\xc2\x8e\x29\xde\x63\xb1\x6c\xae\xed\xb4\x61\x45\xd6\x02\x78\
-\xbc\xc0\x9f\x49\xcd\x0a\xd8\x07\xf7\xe3\xde\x85\x88\x8b\xfe\xc0\
-\x59\xd8\x4a\x96\x22\xdd\xd8\x0a\xf8\x13\xe9\x3f\xec\x25\x71\x7c\
-\x08\x7b\xd8\x6f\x05\xef\x42\x2a\xe8\x78\xec\x2e\x72\x02\xf0\x68\
-\x80\x42\x3c\x0c\x06\x7e\x0f\x1c\x4d\x5e\xcb\x19\x4b\xf7\x4e\x06\
-\xf6\xf2\x2e\x42\x1a\x63\x77\xe0\x27\xde\x45\x48\xad\xfa\x61\xc7\
-\x8e\x3f\x93\xef\x15\xa0\xc7\x42\xfc\x25\xbb\xe0\x7f\x29\xa3\xdb\
-\xfc\x1d\x18\x1e\xa2\x19\x92\xbc\xc3\xf0\x1f\x6f\x4a\x33\x73\x30\
-\xd2\x06\x43\x81\xbf\xe2\x3f\xde\xba\xcd\x7b\x42\x34\x63\x04\xcd\
-\x58\x2c\xe5\x2e\x60\x6c\x88\x86\x48\xb2\xf6\xa4\x19\x63\x55\x49\
-\x33\xbd\xc0\x6e\x48\x93\x8d\xc5\x8e\x15\xde\x63\x2d\xc4\x58\x0d\
-\x36\xbd\xf5\xbd\x09\x6c\x50\x88\xbc\x00\x6c\x1b\xaa\x29\x92\x94\
-\xd5\xd0\x92\xbe\x4a\xfc\xbc\x0c\xbc\x03\x69\xa2\x6d\xb1\x63\x84\
-\xf7\x18\x0b\x91\x3b\x8b\x6c\x70\x91\x67\x00\xc0\x16\xcb\x68\x82\
-\x25\xb1\xa9\x60\x0f\xf4\x2e\x44\x82\x1a\x0a\xfc\x0d\xbb\x5a\x25\
-\x12\xd3\x28\x6c\xac\xe5\x7a\x5f\x58\x16\xec\xb3\xc0\x15\xd8\x31\
-\xa2\x09\x82\x1e\xb3\xb7\xc6\xff\x8c\x26\x74\x4e\x05\x16\x09\xd9\
-\x24\x71\xf3\x47\xfc\xc7\x93\xd2\xae\x9c\x83\x34\x41\x7f\xe0\x38\
-\xfc\xc7\x53\xe8\x6c\x5e\x64\xe3\x8b\x3e\x1d\xdf\x83\x4d\x2a\xb0\
-\x4c\xc1\x3f\x9f\x8b\xcb\x81\x8f\x62\x4b\x0a\x4b\x9e\xbe\x00\xfc\
-\xd2\xbb\x88\x44\x4d\x01\xc6\xf5\xe5\x59\x60\x62\x5f\x5e\xc3\x66\
-\x09\x9b\xd6\xf7\xe7\x16\xc5\x66\x39\x1b\x8a\xad\x88\x37\x1a\x9b\
-\x0f\x7f\x65\x60\x25\x6c\x4e\x05\x79\xab\xfd\x81\xd3\xbd\x8b\x90\
-\xca\x46\x61\xaf\x78\xee\xe4\x5d\x48\x60\xcf\x62\xaf\x2d\xce\x0b\
-\xf9\x97\x9e\x88\xff\x59\x4d\x8c\x3c\x02\xac\x19\xb0\x4f\x52\x9f\
-\x35\xb1\x83\x99\xf7\x18\x4a\x21\x93\x80\x0b\x81\x23\x80\x5d\x09\
-\xbb\xa0\xcd\xf2\xd8\xc3\x6f\x5f\xef\xfb\x37\x26\x27\xb0\xbd\x29\
-\x64\x2a\xb0\x7a\x17\x7d\x15\x3f\x6b\x62\xdf\xfd\xde\x63\x28\x46\
-\x4e\x08\xd8\xa7\xff\x58\x95\xe6\x3e\x61\x3d\x19\x78\x5f\xb8\x56\
-\x49\x0d\x16\xc1\xd6\x70\xf7\x1e\x3b\x5e\x99\x06\x5c\x8f\x5d\xbe\
-\x7c\x0f\x30\xb0\xbb\x76\x96\xd2\x1f\xd8\x04\x3b\xd9\xb8\x10\x3b\
-\xf9\xf0\xee\x87\x57\x6e\xa3\xde\xde\x4b\xf7\x76\xc1\xae\xfa\x7a\
-\x8f\x9d\x18\x99\x8b\x3d\x10\x1d\xc5\xa5\x09\x6c\x60\xac\xf4\x02\
-\x5f\x0d\xd7\x2a\x89\xec\x78\xfc\xc7\x8c\xc7\x18\xbd\x14\x9b\xe1\
-\x32\xa5\x87\xd0\x86\x02\x9f\xc0\x6e\xa9\x35\xf5\x47\xc2\xc2\x72\
-\x4c\xf7\x2d\x94\x9a\x7c\x95\xbc\x16\xb8\x2b\x9b\x8b\xc2\xb5\xea\
-\xad\x76\x4d\x60\x03\x63\xe7\x77\x74\xb9\x84\xa2\x44\xb7\x05\xcd\
-\xfe\x10\xbf\x39\xf7\x01\x5f\x23\x8f\x75\xea\x97\xc7\xae\x0c\xb4\
-\x69\x05\xc6\x5e\x60\xb3\x10\xcd\x93\x68\x06\x61\xdf\xed\xde\x63\
-\x25\x76\x76\x0e\xd4\xaf\xb7\x75\x4d\x02\x1b\x19\x3b\x37\x61\xcb\
-\xc8\x4a\x7a\x06\xd0\x9e\x15\xfe\xae\xc7\x26\x37\xca\x75\x2a\xeb\
-\x6d\xb1\xab\x02\xde\x7d\xac\x23\xf7\xa0\xb7\x8a\x52\xb5\x38\xed\
-\x38\x6e\x5d\x17\xaa\x61\x0b\xb3\x9d\xd3\xc6\xd5\x9d\xc7\xd0\x03\
-\x3e\x29\xfa\x0e\xfe\x63\x23\x76\xae\x07\xde\x1d\xaa\x61\x09\xd8\
-\x16\x7b\x56\x60\x2e\xfe\xbd\x8d\x99\x6f\x86\x6a\x98\x04\xb3\x0a\
-\xf0\x20\xfe\x63\xa3\x8e\xec\x10\xa8\x67\x1d\xfd\xbd\xa6\x0d\xf2\
-\xce\x0b\xe8\xd2\x5e\x4a\xd6\x02\x66\xe0\x3f\x2e\x62\xe5\x2a\xec\
-\xe1\xba\xa6\xda\x8c\x66\xff\x12\x9b\x0e\xac\x11\xac\x5b\xd2\xad\
-\xcd\x81\x17\xf1\x1f\x17\x75\xe4\x82\x40\x3d\x2b\x64\x45\xec\x1d\
-\x63\xef\x8d\xae\x23\x53\x80\x1d\x83\x74\x4d\xba\xd5\xd4\x87\x50\
-\x9f\x07\xf6\x25\xdf\x4b\xfd\x65\x7d\x18\x18\x8f\x7f\xdf\x63\xe4\
-\x9f\x01\xfb\x24\xd5\x6d\x43\x7b\xde\x4e\x99\x8a\xcd\xd9\x51\xab\
-\x43\x02\x14\x9e\x4b\xa6\x02\xef\x0a\xd3\x36\xa9\xe8\xfd\xf8\x8f\
-\x83\xd0\x99\x83\x2d\x59\x3d\x3a\x60\x9f\x72\x31\x12\x38\x89\x66\
-\x3e\xcc\xb9\x7b\xc0\x3e\x49\x79\xdb\xd1\xae\xb9\x2a\x5c\xa6\xb6\
-\xef\x0f\x5c\x5b\xa1\xd8\x5c\x33\x15\xd8\x3e\x48\xe7\xa4\xac\x41\
-\xc0\xa3\xf8\x8f\x81\x90\x79\x10\xd8\x38\x64\x93\x32\xb5\x29\xf0\
-\x30\xfe\xfb\x23\x64\x1e\x42\x73\x03\x78\xd9\x81\x76\x4d\x0e\x76\
-\x15\xc5\xd7\xf4\x09\x6e\x29\x6c\xda\x41\xef\x26\xd4\x95\x49\xc0\
-\x46\x41\x3a\x27\x65\x1c\x81\xff\xbe\x0f\x99\x33\xd1\xf4\xba\xaf\
-\x37\x0c\x38\x1b\xff\xfd\x12\x32\x87\x06\xed\x90\x14\xb1\x1e\xcd\
-\x9d\xe0\x67\x41\x19\x0f\x2c\x1b\xa4\x73\x5d\xd8\x1a\x98\x85\x7f\
-\x33\xea\xca\x8b\xe8\xed\x80\x3a\x8d\xc4\x96\x60\xf5\xde\xef\x21\
-\x32\x1d\x38\x38\x6c\x7b\x1a\x65\x5f\x9a\xf3\xeb\xed\x15\x6c\xae\
-\x79\xa9\xc7\x3b\xb0\x67\x69\xbc\xf7\x7b\x5d\x99\x4d\x42\x57\xa4\
-\xbf\x88\x7f\x43\xea\xcc\xa3\xb4\xf3\xbe\xad\x87\x1f\xe0\xbf\xbf\
-\x43\xe4\x21\x60\xdd\xc0\xbd\x69\xa2\xf5\x69\xce\x1c\xed\x47\x07\
-\xee\x8d\x2c\xd8\x18\xe0\x71\xfc\xf7\x77\x9d\xf9\x7c\x90\xce\x05\
-\xf4\x2d\xfc\x9b\x52\x67\xfe\x89\x4d\x4a\x23\xf1\x8c\xa1\x19\x0f\
-\xf3\xdc\x8a\x26\x96\x2a\x63\x71\xe0\x46\xfc\xf7\x5b\xb7\x99\x82\
-\xf6\x7b\x6c\x03\x80\x2b\xf1\xdf\xd7\x75\xe6\x1b\x41\x3a\x17\xc1\
-\x4f\xf0\x6f\x4e\x9d\xf9\x69\x98\xb6\xc9\xdb\xf8\x11\xfe\xfb\xb8\
-\xdb\x5c\x4c\x5a\xf3\xf6\xe7\x62\x31\x9a\xf1\xda\xe7\xb1\xa1\x1b\
-\x23\x6f\x70\x0a\xfe\xfb\xb8\xce\x44\x59\xe9\x2f\x94\x7e\xc0\xf7\
-\xf0\x6f\x52\x9d\xf9\x44\x90\xce\xc9\x9b\x2d\x41\xfe\xf7\x83\xcf\
-\x42\xd3\xc3\x76\x63\x20\x70\x0e\xfe\xfb\xb1\x9b\x4c\xc5\xae\x68\
-\x48\x78\x9f\xc2\x7f\xff\xd6\x99\xef\x06\xe9\x5a\x0d\x0e\xa0\x99\
-\xef\xf7\x2e\x28\x53\xd0\x43\x81\x31\xe4\x3e\xe5\xef\xcf\x68\xcf\
-\xc4\x3e\x31\xf5\x00\xbf\xc0\x7f\x7f\x76\x93\xff\x0d\xde\x15\x59\
-\x03\x3b\xb9\xf2\xde\xb7\x75\x64\x0e\x76\x4c\xcd\xca\xfb\x69\xcf\
-\x6c\x81\x5a\x13\x3c\xac\xc1\xd8\x34\xcc\xde\xfb\xb5\x6a\xce\x42\
-\x07\xff\x90\x7a\xc8\xfb\x4a\xc0\xf3\x68\x85\xd1\x90\x06\x01\x77\
-\xe0\xbf\x5f\xeb\xc8\x54\x60\xef\x30\x6d\xab\xdf\x06\xc0\x38\xfc\
-\x9b\x58\x47\x7e\x18\xa6\x65\x02\xec\x8f\xff\xfe\xac\x9a\x8b\xd1\
-\x65\xff\x18\x06\x92\xf7\x33\x01\xfb\x85\x6f\x49\x6b\xb5\xe5\x59\
-\xb3\x71\xd8\x31\x34\x6b\x4b\xd0\x8e\x19\x03\x7b\xb1\xc5\x27\xa4\
-\x3b\xfd\x80\x07\xf0\xdf\x9f\x55\x72\x33\x7a\xe0\x2f\xa6\xc5\xb0\
-\x37\x2a\xbc\xf7\x73\x95\xdc\x8f\xae\x0a\x85\xb0\x15\x76\x49\xdc\
-\x7b\x7f\xc6\xce\x75\xc0\x92\x81\x7a\xe6\x6e\x20\x70\x1a\xfe\x4d\
-\x8d\x9d\xbb\xd1\xaf\xbf\x6e\xed\x88\xff\x7e\xac\x92\x87\xd0\xdc\
-\x10\x75\x58\x82\x7c\xa7\x85\x4e\x66\xe2\x96\x4c\x0d\x04\xee\xc3\
-\x7f\x3f\xc6\xce\xe9\x34\xf4\x96\xf2\x41\xd8\x0c\x46\xde\x0d\x8e\
-\x19\xad\x09\xde\x9d\x1c\xa7\x84\x7d\x0d\x4d\xf2\x53\xa7\x0d\xb0\
-\x59\x15\xbd\xf7\x7b\xd9\xfc\x3e\x46\x33\x5a\x24\xf7\x07\x83\x3b\
-\x65\x36\x2d\x98\x29\x74\x7b\x9a\xbd\x46\xf3\x34\x6c\xb9\x64\x29\
-\x6f\x34\x79\x7e\xb1\xeb\xfe\x6e\xfd\xbe\x80\xff\x7e\xaf\xf2\xdd\
-\xa0\xe9\x81\xab\x59\x81\xfc\x5f\x0b\x5e\x58\x26\x01\x7b\x04\xeb\
-\x56\xe2\x56\xc5\xee\x89\x79\x37\x3d\x56\xce\x0c\xd7\xaa\x56\xf9\
-\x0a\xfe\xfb\xae\x6c\xfe\x10\xa5\x13\x52\xc4\x99\xf8\xef\xff\xb2\
-\xf9\x52\x94\x4e\x34\xdf\x1f\xf1\xdf\x77\xb1\xf2\x08\xb0\x66\xb8\
-\x56\xe5\x61\x04\x70\x11\xfe\xcd\x8f\x91\xb9\xc0\x66\xe1\x5a\xd5\
-\x1a\x77\xe1\xbf\xef\xca\xe4\x41\xb4\xaa\x9f\xa7\x61\xe4\xb7\x6e\
-\xc0\x6d\x51\x3a\xd1\x6c\x5b\x61\xdf\xa9\xde\xfb\x2e\x46\x2e\xc2\
-\x8e\x85\xad\xd4\x1f\x9b\xda\xd0\x7b\x27\xc4\xc8\x55\x01\xfb\xd4\
-\x06\x6b\xe0\xbf\xcf\xca\xa4\x17\xd8\x38\x4a\x27\xa4\x8c\xcd\xc9\
-\xef\xa9\x07\x2b\xde\x7f\x00\x00\x20\x00\x49\x44\x41\x54\xf0\x55\
-\xa3\x74\xa2\xb9\xae\xc3\x7f\x9f\xc5\xc8\x09\xd8\x31\xb0\xf5\xf6\
-\xc1\xee\x8f\x79\xef\x90\xd0\xd1\x53\xbf\xc5\x1d\x89\xff\xfe\x2a\
-\x93\x93\xe3\xb4\x41\x2a\xf8\x25\xfe\xe3\xa1\x4c\xf4\xa0\x70\x71\
-\xef\xc6\x7f\x7f\x85\xce\x0c\xe0\xd3\x21\x9b\xd4\x04\x5b\xd2\xbc\
-\xf5\x9c\x2f\x0f\xda\xa1\x66\xcb\xe9\x99\x90\xf1\xc0\xc8\x38\x6d\
-\x90\x0a\x46\x91\xd7\xcc\x91\x77\xc7\x69\x43\x23\x5d\x8d\xff\xfe\
-\x0a\x99\x09\xe8\x87\xe1\xdb\x5a\x1e\xb8\x1d\xff\x9d\x14\x32\x5b\
-\x07\xed\x50\x33\xad\x83\xff\x7e\x2a\x93\x8f\xc5\x69\x83\x74\xe1\
-\x53\xf8\x8f\x8b\x32\x59\x23\x4a\x17\x9a\x65\x3b\xfc\xf7\x53\xc8\
-\xdc\x8e\xbd\xcd\x20\x0b\x31\x98\x3c\x9f\xee\x7d\xbb\xfc\x25\x6c\
-\x7b\x1a\xe9\xeb\xf8\xef\xa7\xa2\xb9\x06\xcd\xe8\x96\xa2\x7e\xd8\
-\x73\x37\xde\xe3\xa3\x68\xbe\x1a\xa7\x0d\x8d\x72\x2e\xfe\xfb\x29\
-\x54\xfe\x0c\x2c\x1a\xb6\x3d\xcd\xd5\x0f\xf8\x16\xcd\x78\xf2\x73\
-\x36\x3a\xeb\xeb\xe4\x6a\xfc\xf7\x53\xd1\x6c\x12\xa7\x05\x12\xc0\
-\x16\xf8\x8f\x8f\xa2\xd1\xed\xc1\x85\x5b\x89\x66\xac\x28\x3b\x17\
-\xf8\x36\xfa\xd1\x50\xc9\xee\xd8\x04\x09\xde\x3b\xb1\xdb\xfc\x20\
-\x74\x63\x1a\x64\x38\x30\x0b\xff\x7d\x54\x24\x17\x45\xea\x81\x84\
-\x73\x39\xfe\xe3\xa4\x48\x66\xa2\x57\x48\x17\xe6\x87\xf8\xef\xa3\
-\x6e\x33\x15\xf8\x40\xe8\xc6\xb4\xcd\xfa\xc0\x93\xf8\xef\xcc\x6e\
-\x32\x1e\x18\x10\xba\x31\x0d\xf1\x01\xfc\xf7\x4f\xd1\x6c\x1b\xa9\
-\x07\x12\xce\x8e\xf8\x8f\x93\xa2\xd9\x33\x4e\x0b\xb2\x37\x10\x78\
-\x09\xff\xfd\xd3\x4d\x9e\xc4\x8e\x5d\x12\x40\x13\x56\x14\xdc\x3d\
-\x78\x57\x9a\xe1\x57\xf8\xef\x9b\x22\xb9\x3a\xd2\xf6\x4b\x78\xb9\
-\xbc\x37\x7e\x4a\xac\x06\x64\xee\xfd\xf8\xef\x9b\x6e\x72\x2d\x76\
-\xcc\x92\x80\x72\x5f\x51\xf0\x8f\xe1\x5b\xd2\x08\xf7\xe2\xbf\x6f\
-\x8a\x64\xa7\x58\x0d\x90\xe0\xde\x8b\xff\x78\x29\x92\x3b\x63\x35\
-\x20\x73\x7f\xc5\x7f\xdf\x54\xcd\x69\x34\x74\x25\xbf\x54\x1c\x89\
-\xff\x4e\xae\x92\x69\xd8\xfd\x6e\xf9\xaf\x51\xe4\x31\x8b\xdb\xbd\
-\xb1\x1a\x20\xd1\xe4\x30\xaf\x44\x2f\xfa\x4e\x78\xb3\x91\xd8\x44\
-\x39\xde\xfb\xa6\x4a\x8e\x8c\xd0\x8f\xa8\x7a\xbc\x0b\xa8\xe0\x68\
-\xe0\x40\xec\xe9\xca\x9c\x0c\x01\x76\xf5\x2e\x22\x31\x5b\x91\xc7\
-\x18\xd4\x32\xae\xf9\x39\xcb\xbb\x80\x02\xfa\x63\x13\xa0\xc9\x7f\
-\xed\x01\x0c\xf2\x2e\xa2\xa4\x79\xc0\xa1\xd8\xb1\x49\x6a\xf2\x39\
-\xfc\xcf\xf8\xca\x26\x87\x2f\xa5\x3a\x7d\x1f\xff\x7d\xd2\x29\xbd\
-\xc0\x72\xb1\x1a\x20\xd1\x2c\x4f\x1e\x57\x97\x74\xd0\x78\xa3\x1c\
-\x57\xfd\xdb\x3f\x4a\x27\xa4\xa3\xe3\xf0\xdf\xf9\x65\x32\x11\xbd\
-\x0d\xf0\x7a\x97\xe1\xbf\x4f\x3a\xe5\xd2\x68\x5b\x2f\xb1\xfd\x13\
-\xff\xf1\xd3\x29\x97\x44\xdb\xfa\xfc\x0c\x04\x5e\xc5\x7f\x9f\x94\
-\xc9\x31\x51\x3a\x21\x85\xf4\x60\x33\xed\x79\x0f\x82\x32\xd1\xab\
-\x64\xff\x35\x1e\xff\xfd\xd1\x29\x1f\x8f\xb6\xf5\x12\xdb\xbe\xf8\
-\x8f\x9f\x4e\x79\x36\xda\xd6\xe7\xe7\x9d\xf8\xef\x8f\x32\xf9\x13\
-\x9a\xe0\xc7\xdd\x08\xe0\x29\xfc\x07\x43\xd1\x7c\x2b\x4e\x1b\xb2\
-\xb3\x14\xfe\xfb\xa2\x53\x5e\x03\x86\xc6\x6a\x80\x44\xb7\x18\x30\
-\x1d\xff\x71\xd4\x29\x63\x62\x35\x20\x33\x47\xe3\xbf\x2f\x8a\x66\
-\x1c\x0d\x78\x80\x33\x87\x07\xb0\x3a\x99\x84\x2d\xad\x38\xcf\xbb\
-\x90\x82\xb4\x12\x94\xd9\xc0\xbb\x80\x02\xae\xc7\x4e\x02\x24\x4f\
-\x53\x81\x1b\xbd\x8b\x28\x40\x13\xc6\x98\x1d\xbc\x0b\x28\x68\x2e\
-\x76\xcc\x99\xec\x5d\x48\xb7\x9a\x70\x02\x00\x70\x25\x70\xaa\x77\
-\x11\x05\x6d\x0d\x2c\xe2\x5d\x44\x02\xd6\xf5\x2e\xa0\x80\xab\xbc\
-\x0b\x90\xae\x5d\xe9\x5d\x40\x01\xeb\x79\x17\x90\x80\x41\xc0\xe6\
-\xde\x45\x14\xf4\x2b\x1a\xf2\xdd\xd0\x94\x13\x00\x80\xa3\xb0\x33\
-\xfe\xd4\x0d\x45\x1f\x78\xc8\x63\x39\xd4\x46\x7c\xc8\x5b\x2e\x87\
-\x13\x80\x1c\x3e\x0b\xb1\x6d\x88\xbd\x2a\x9d\xba\x29\x34\xe8\xcd\
-\x8d\x26\x9d\x00\xbc\x00\xfc\xd4\xbb\x88\x82\x36\xf2\x2e\x20\x01\
-\x2b\x7b\x17\xd0\xc1\x14\x6c\xfd\x6e\xc9\xdb\xbf\x48\xff\x52\xed\
-\x4a\xde\x05\x24\x20\x97\xef\xc4\x13\x81\x17\xbd\x8b\x08\xa5\x49\
-\x27\x00\x00\x27\x60\x5f\xdc\xa9\xcb\xe1\xfe\x77\x6c\x2b\x79\x17\
-\xd0\xc1\x35\xd8\x1c\x00\x92\xb7\x5e\xec\x59\x8e\x94\xa5\x7e\x32\
-\x5c\x87\x1c\xbe\x13\x27\x03\x3f\xf6\x2e\x22\xa4\xa6\x9d\x00\x4c\
-\x02\xfe\xe0\x5d\x44\x01\x1b\x7a\x17\xe0\xac\x07\x58\xd1\xbb\x88\
-\x0e\x52\x3f\x68\x48\x71\x37\x78\x17\xd0\xc1\x58\xf4\x3a\x59\x0e\
-\xdf\x89\xe7\x90\xfe\xd5\xa4\x52\x9a\x76\x02\x00\x70\xba\x77\x01\
-\x05\xac\xee\x5d\x80\xb3\x65\x48\x7f\xba\xcf\x7b\xbc\x0b\x90\x60\
-\x52\xdf\x97\x43\x80\xa5\xbd\x8b\x70\x96\xc3\x77\xe2\x69\xde\x05\
-\x84\xd6\xc4\x13\x80\x7f\x01\xf7\x79\x17\xd1\xc1\x52\xd8\x3b\xca\
-\x6d\xb5\x8c\x77\x01\x05\xa4\x7e\xd0\x90\xe2\x72\xd8\x97\x39\x7c\
-\x26\x62\x19\x09\x2c\xee\x5d\x44\x07\x77\x03\x77\x78\x17\x11\x5a\
-\x13\x4f\x00\x00\x2e\xf6\x2e\xa0\x80\x36\xdf\xf7\x4b\x7d\xe2\x93\
-\x29\x68\x86\xb6\x26\x79\x86\xf4\xe7\x73\x48\xfd\x33\x11\xd3\x2a\
-\xde\x05\x14\x90\xc3\x31\xa5\xb4\xa6\x9e\x00\x5c\xee\x5d\x40\x01\
-\x6d\x3e\x01\x18\xed\x5d\x40\x07\xe3\xbc\x0b\x90\xa0\xe6\xcf\xdc\
-\x96\xb2\xd4\x3f\x13\x31\xe5\xf0\x5d\x98\xc3\x31\xa5\xb4\xa6\x9e\
-\x00\x5c\x07\xcc\xf4\x2e\xa2\x83\x25\xbd\x0b\x70\x94\xfa\xaf\x9d\
-\x71\xde\x05\x48\x70\xe3\xbc\x0b\xe8\x20\xf5\xcf\x44\x4c\xa9\x7f\
-\x17\xce\x20\xfd\x07\x49\x2b\x69\xea\x09\xc0\x0c\xe0\x11\xef\x22\
-\x3a\x68\xf3\x07\x3e\xf5\x5f\x3b\xcf\x79\x17\x20\xc1\xa5\xbe\x4f\
-\x53\xff\x4c\xc4\x94\xfa\x77\xe1\x43\xa4\xff\x83\xb2\x92\xa6\x9e\
-\x00\x80\xed\xb4\x94\x2d\xe1\x5d\x80\xa3\xd4\x1f\x80\x9c\xe0\x5d\
-\x80\x04\xf7\x92\x77\x01\x1d\xa4\xfe\x99\x88\x29\xf5\x2b\x00\x0f\
-\x78\x17\x10\x4b\x93\x4f\x00\x1e\xf4\x2e\xa0\x83\x91\xde\x05\x38\
-\x1a\xe8\x5d\x40\x07\x2f\x7b\x17\x20\xc1\x4d\xf4\x2e\xa0\x83\xd4\
-\x5f\x8b\x8d\x69\x84\x77\x01\x1d\xa4\xfe\x63\xb2\xb2\x26\x9f\x00\
-\xa4\x3e\x5d\x63\x9b\x3f\xf0\xa9\x6f\x7b\x0e\xb3\x49\x4a\x39\xa9\
-\xef\xd3\xd4\x4f\x8a\x63\x4a\xfd\xfb\x20\xf5\x63\x49\x65\x4d\x3e\
-\x01\x48\xfd\x03\x3f\xd8\xbb\x00\x47\xa9\x7f\xd9\xcd\xf2\x2e\x40\
-\x82\x4b\xfd\x1e\x6e\xea\x07\xc1\x98\x52\xff\x3e\x48\xfd\x58\x52\
-\x59\x93\x4f\x00\x52\x9f\xb2\x51\x1f\xf8\x74\xe9\x04\xa0\x79\x74\
-\x02\x90\xae\xd4\xbf\x0f\x74\x02\x90\xa1\x79\xde\x05\x88\x88\x48\
-\x47\x6d\x5f\x07\xc1\x4d\x93\x4f\x00\x52\x7f\xb0\x24\xf5\x5f\x24\
-\x31\xa5\xfe\x0b\x3b\xf5\x5f\x24\x52\x5e\xea\xbf\xb0\xdb\xfc\x7d\
-\x90\xfa\xb6\x0f\xf7\x2e\x20\x96\x26\x9f\x00\xa4\xbe\xd3\x52\x1f\
-\xf4\x31\xe9\x04\x40\xea\xa6\x13\x80\x74\xa5\xbe\xed\xc3\xbc\x0b\
-\x88\xa5\xc9\x27\x00\xa9\xbf\x5b\x9a\xfa\xa0\x8f\x29\xf5\x6d\x6f\
-\xec\x07\xbe\xc5\x52\xdf\xa7\xa9\x9f\x14\xc7\x94\xfa\xf7\xc1\x52\
-\xde\x05\xc4\xd2\xe4\x13\x80\xb5\xbc\x0b\xe8\xa0\xcd\xef\x9a\xa7\
-\xfe\x65\xd7\xe6\x59\xd9\x9a\x2a\xf5\xd9\xe6\x52\x3f\x08\xc6\xf4\
-\x8a\x77\x01\x1d\xac\xe9\x5d\x40\x2c\x4d\x3e\x01\x48\x7d\xa7\xa5\
-\x3e\x31\x49\x4c\x53\xbd\x0b\xe8\x20\xf5\x83\x85\x94\x97\xfa\x49\
-\x5d\xea\x9f\x89\x98\x52\x9f\xa5\x31\xf5\x1f\x93\x95\x35\xf5\x04\
-\x60\x08\xb0\xba\x77\x11\x1d\xa4\x3e\xe8\x63\x4a\xfd\xe4\x67\x59\
-\xef\x02\x24\xb8\xd4\xf7\x69\xea\x9f\x89\x98\x52\x9f\x7a\x7b\x0d\
-\xd2\x7f\x86\xa4\x92\xa6\x9e\x00\x6c\x4f\xfa\x0f\x72\x35\x76\x76\
-\xa9\x02\x52\x3f\xf9\x59\xc9\xbb\x00\x09\x2e\xf5\x25\x67\x53\xff\
-\x4c\xc4\x94\xfa\x77\xe1\x60\x60\x5b\xef\x22\x62\x68\xea\x09\xc0\
-\xce\xde\x05\x14\xf0\xa4\x77\x01\x8e\x52\xff\xb5\xb3\x92\x77\x01\
-\x12\x54\x3f\xd2\xdf\xa7\xa9\x7f\x26\x62\x1a\xe7\x5d\x40\x01\x39\
-\x1c\x53\x4a\x6b\xea\x09\xc0\xae\xde\x05\x14\xf0\x84\x77\x01\x8e\
-\x52\xff\xb5\x33\x0c\x58\xde\xbb\x08\x09\x66\x45\x60\x51\xef\x22\
-\x3a\x48\xfd\x33\x11\x53\x0e\xdf\x85\x39\x1c\x53\x4a\x6b\xe2\x09\
-\xc0\x96\xa4\xff\xd0\xc6\x8b\xb4\xfb\xa1\x9f\xe7\xbd\x0b\x28\x60\
-\x7d\xef\x02\x24\x98\xf5\xbc\x0b\x28\x20\x87\xcf\x44\x2c\x93\x48\
-\xff\x0a\xc8\x7a\xc0\xa6\xde\x45\x84\xd6\xc4\x13\x80\xcf\x7a\x17\
-\x50\xc0\xc3\xde\x05\x38\x7b\x9e\xf4\x5f\x7b\xd2\x09\x40\x73\xa4\
-\xbe\x2f\xa7\x03\xe3\xbd\x8b\x70\xf6\x88\x77\x01\x05\xec\xef\x5d\
-\x40\x68\x4d\x3b\x01\x18\x05\x7c\xd4\xbb\x88\x02\xee\xf2\x2e\xc0\
-\xd9\x5c\xe0\x29\xef\x22\x3a\xd8\xc6\xbb\x00\x09\x26\xf5\x7d\xf9\
-\x14\x5a\xbb\x24\x87\xef\xc4\x7d\x48\x7f\x8a\xf9\x52\x9a\x76\x02\
-\x70\x38\xb0\x98\x77\x11\x05\xe4\x30\xd8\x63\x1b\xe7\x5d\x40\x07\
-\x3b\x00\x03\xbc\x8b\x90\xae\x0d\x00\xb6\xf3\x2e\xa2\x83\x36\x3f\
-\x10\x3c\x5f\x0e\xdf\x89\xc3\x80\xaf\x79\x17\x11\x52\x93\x4e\x00\
-\x96\x01\x0e\xf2\x2e\xa2\xa0\x1c\x06\x7b\x6c\xe3\xbc\x0b\xe8\x60\
-\x18\x0d\xbc\xe7\xd7\x42\x9b\x93\xfe\x34\xc0\xe3\xbc\x0b\x48\x40\
-\x2e\xdf\x89\x07\xd3\xa0\xa9\x81\x9b\x74\x02\xf0\x5d\xd2\x7f\xd2\
-\x17\xe0\x35\xe0\x5e\xef\x22\x12\x90\xc3\x73\x10\xef\xf4\x2e\x40\
-\xba\xf6\x2e\xef\x02\x0a\xc8\xe1\xb3\x10\xdb\xdd\xd8\xb3\x10\xa9\
-\x5b\x0c\x38\xda\xbb\x88\x50\x9a\x72\x02\xf0\x1e\x60\x3f\xef\x22\
-\x0a\xba\x11\x98\xed\x5d\x44\x02\xee\xf1\x2e\xa0\x00\x9d\x00\xe4\
-\x2f\x87\x13\x80\xbb\xbd\x0b\x48\xc0\x4c\xe0\x16\xef\x22\x0a\xfa\
-\x1c\xf0\x5e\xef\x22\x42\x68\xc2\x09\xc0\x48\xe0\xb7\xd8\x64\x1f\
-\x39\xb8\xd6\xbb\x80\x44\xe4\x70\x02\xb0\x2d\x30\xd4\xbb\x08\xa9\
-\x6c\x18\xb0\x95\x77\x11\x05\xdc\xe7\x5d\x40\x22\xae\xf1\x2e\xa0\
-\xa0\x7e\xc0\xaf\x69\xc0\x03\x81\xb9\x9f\x00\xf4\x00\xbf\x21\xaf\
-\x49\x5b\xae\xf6\x2e\x20\x11\x2f\x92\xfe\xab\x4f\x43\x80\x0f\x78\
-\x17\x21\x95\x7d\x10\x9b\xc6\x35\x65\xcf\xd1\xee\x49\x80\x5e\xef\
-\x6a\xef\x02\x4a\x58\x01\x38\x83\xfc\x8f\xa1\x59\x3b\x01\x7b\x7d\
-\x26\x97\xbc\x84\x9e\x2c\x7f\xbd\x4b\xf1\xdf\x27\x9d\x72\x79\xb4\
-\xad\x97\xd8\xae\xc0\x7f\xfc\x74\xca\xc5\xd1\xb6\x3e\x3f\x8b\x60\
-\x4b\x03\x7b\xef\x93\x32\x39\x3e\x4a\x27\xa4\xa3\x03\xf0\xdf\xf9\
-\x65\x73\x66\x94\x4e\xe4\xeb\x7b\xf8\xef\x93\x4e\x99\x43\x5e\x57\
-\x98\xc4\xac\x80\xed\x3b\xef\xf1\xd3\x29\x8d\x79\xa0\x2c\x90\x3f\
-\xe0\xbf\x4f\xca\xe6\xf3\x51\x3a\x51\x83\x5c\x2f\x5f\x1c\x08\x9c\
-\xe2\x5d\x44\x05\x17\x78\x17\x90\x98\x1b\xbd\x0b\x28\xa0\x07\xf8\
-\x98\x77\x11\x52\xda\x27\xc8\xe3\xfb\xed\x7a\xef\x02\x12\x73\xa1\
-\x77\x01\x15\xfc\x12\x38\xd4\xbb\x88\xb6\x38\x0a\xff\x33\xbe\x2a\
-\x99\x46\xfa\xef\x23\xd7\x6d\x24\x79\xfc\x4a\xd3\x43\x5a\x79\xe9\
-\x07\x3c\x80\xff\xb8\xe9\x94\x5e\xf4\x9d\xf0\x66\x23\xb1\xd7\x01\
-\xbd\xf7\x4d\x95\x1c\x15\xbe\x1d\x32\xdf\x40\xe0\x34\xfc\x77\x72\
-\xd5\xfc\x21\x7c\x4b\x1a\xe1\x1e\xfc\xf7\x4d\x91\xec\x12\xab\x01\
-\x12\xdc\xae\xf8\x8f\x97\x22\xb9\x23\x56\x03\x32\xf7\x67\xfc\xf7\
-\x4d\xd5\x9c\x86\x1d\xab\x24\xa0\x25\xb0\xd7\xe7\xbc\x77\x6e\x37\
-\xd9\x2d\x78\x57\x9a\xe1\x97\xf8\xef\x9b\x22\xd1\xeb\x9b\xf9\xb8\
-\x01\xff\xf1\x52\x24\x27\xc7\x6a\x40\xe6\xde\x87\xff\xbe\xe9\xf6\
-\xbb\x62\x89\xe0\x5d\x69\xa9\xf5\xb1\xb9\xb2\xbd\x77\x6a\x37\x19\
-\x8f\x9e\xfe\x7f\x3b\x7b\xe3\xbf\x7f\x8a\x66\xfb\x48\x3d\x90\x70\
-\xde\x89\xff\x38\x29\x9a\x3d\x22\xf5\x20\x77\x8b\x60\xaf\x09\x7b\
-\xef\x9f\x6e\xf2\x24\xe9\xaf\x42\x99\xbc\xdd\xb1\xb5\xa2\xbd\x77\
-\x66\xb7\xf9\x5e\xe8\xc6\x34\xc8\x30\x6c\x16\x30\xef\x7d\x54\x24\
-\x97\x44\xea\x81\x84\x93\xc3\xab\x7f\xf3\x80\x19\xe4\xb1\x70\x99\
-\x97\x63\xf1\xdf\x47\xdd\x66\x2a\x9a\x47\xa4\x92\x7e\xc0\xb7\xb1\
-\x65\x63\xbd\x77\x62\xb7\x99\x8d\xbd\x92\x24\x6f\xef\x2a\xfc\xf7\
-\x53\xd1\x6c\x16\xa9\x07\xd2\xbd\xad\xf1\x1f\x1f\x45\x73\x59\xa4\
-\x1e\x34\xc5\x8a\xd8\x77\xa7\xf7\x7e\xea\x36\x73\xb1\x63\x59\x2e\
-\x33\xd5\xba\x1b\x8c\xbd\x2f\xef\xbd\xe3\x42\xe5\xcf\x61\xdb\xd3\
-\x48\x87\xe3\xbf\x9f\x8a\xe6\x3a\xf4\x61\x4e\x51\x3f\xf2\xb9\xf7\
-\x3f\x0f\xf8\x4a\x9c\x36\x34\xca\xff\xe1\xbf\x9f\x42\xe5\xcf\xe4\
-\xb1\x58\x9d\xab\x15\x80\xdb\xf1\xdf\x59\x21\xb3\x4d\xd0\x0e\x35\
-\xd3\xda\xf8\xef\xa7\x32\xd9\x37\x4e\x1b\xa4\x0b\xfb\xe1\x3f\x2e\
-\xca\x64\xf5\x38\x6d\x68\x94\x6d\xf0\xdf\x4f\x21\x73\x3b\xba\x1a\
-\xfc\xb6\xb6\x04\x9e\xc7\x7f\x27\x85\x8c\xa6\x91\x2d\xee\x5e\xfc\
-\xf7\x57\xd1\xbc\x00\x8c\x8a\xd3\x06\xa9\x60\x71\xf2\x7a\x68\x4c\
-\xaf\xff\x15\x77\x25\xfe\xfb\x2b\x64\x26\xa0\x87\x89\xdf\x62\x1f\
-\x6c\xa2\x1c\xef\x9d\x13\x3a\xda\xd1\xc5\x7d\x1b\xff\xfd\x55\x26\
-\x3f\x8b\xd3\x06\xa9\xe0\xd7\xf8\x8f\x87\x32\xf9\x7a\x9c\x36\x34\
-\xd2\x8e\xf8\xef\xaf\xd0\x99\x01\x7c\x3a\x60\x8f\xb2\xd5\x9f\xfc\
-\x16\xf4\x29\x9a\x2b\x03\xf6\xa9\x0d\x56\xc7\x7f\x9f\x95\x49\x2f\
-\xb0\x69\x94\x4e\x48\x19\x5b\x92\xc7\x6c\x92\xaf\xcf\x2a\x51\x3a\
-\xd1\x5c\x57\xe3\xbf\xcf\x62\xe4\x04\xec\x18\xd8\x4a\x23\x80\x8b\
-\xf0\xdf\x09\x31\x32\x07\x1d\x1c\xaa\xb8\x03\xff\x7d\x57\x26\x0f\
-\xa3\xa9\x5c\x3d\x8d\x00\x1e\xc3\x7f\x1c\x94\xc9\xad\x51\x3a\xd1\
-\x6c\x9b\xd3\x8c\x37\xc2\x16\x94\x8b\xb0\x71\xdc\x2a\xab\x02\xf7\
-\xe3\xdf\xfc\x58\xf9\x5d\xb0\x4e\xb5\xcb\x21\xf8\xef\xbb\xb2\xf9\
-\x53\x94\x4e\x48\x11\x67\xe3\xbf\xff\xcb\xe6\xc0\x28\x9d\x68\xbe\
-\xb3\xf0\xdf\x77\xb1\xf2\x08\xb0\x66\xb8\x56\xa5\x6d\x27\xe0\x65\
-\xfc\x9b\x1e\x2b\xd3\xd0\x93\x9e\x55\x2d\x4e\x9e\x0b\x81\xec\x1f\
-\xa3\x19\xb2\x50\x39\x2e\x07\x3e\x0d\x3d\x3c\x5a\xd5\x72\xc0\x6b\
-\xf8\xef\xc3\x58\x99\x44\x0b\x66\x86\x3c\x98\x66\x4c\xee\xb0\xb0\
-\x1c\x11\xac\x5b\xed\x94\xe3\x99\xfe\x34\x34\xed\x67\x9d\x36\x22\
-\xcf\x13\xc5\xdf\xc7\x68\x46\x8b\xfc\x2f\xfe\xfb\x30\x66\x66\x63\
-\xc7\xc8\xc6\x19\x08\x9c\x8e\x7f\x83\x63\xe7\x4e\x34\xe7\x7f\xb7\
-\x76\xc4\x7f\x3f\x56\xc9\x23\x68\x01\x90\x3a\x2c\x09\x3c\x8e\xff\
-\xfe\xae\x92\xed\x22\xf4\xa3\x4d\x16\x01\xee\xc6\x7f\x3f\xc6\xce\
-\xe9\x34\x68\x45\xc1\x25\xb1\xd9\xd3\xbc\x9b\x1a\x3b\xb3\x81\x4d\
-\x02\xf5\xac\xcd\x72\x59\xcb\x7d\x41\xb9\x15\xcd\xef\x1e\xd3\x30\
-\xe0\x36\xfc\xf7\x73\x95\xdc\x87\x66\x90\x0c\x61\x73\xec\x0d\x1c\
-\xef\xfd\x19\x3b\xd7\x61\xc7\xce\xac\x6d\x00\x8c\xc3\xbf\x99\x75\
-\xe4\xd8\x30\x2d\x13\xec\x9e\xba\xf7\xfe\xac\x9a\x4b\x69\xd0\xd9\
-\x7b\x42\x06\x02\xff\xc4\x7f\xff\x56\xcd\x67\xc2\xb7\xa4\xb5\x7e\
-\x84\xff\xfe\xac\x23\xe3\xb0\x63\x68\x96\xf6\xc6\x56\x43\xf2\x6e\
-\x62\x1d\xb9\x15\xbb\x3c\x25\x61\x0c\xc6\x96\x50\xf6\xde\xaf\x55\
-\x73\x0e\xd0\x13\xbc\x2b\xed\xd5\x03\xfc\x11\xff\xfd\x5a\x35\xcf\
-\x01\x83\x82\x77\xa5\xbd\x06\x92\xef\x95\xa0\xb2\x99\x8a\x1d\x4b\
-\xb3\x72\x20\xf9\x4d\xce\x51\x35\x93\xb1\xd7\x1a\x25\xac\xdc\x66\
-\x06\x7c\x73\x7e\x81\x4e\x02\x42\xe8\x01\x7e\x85\xff\xfe\xec\x26\
-\xdf\x0c\xde\x15\x59\x1d\x98\x82\xff\xbe\xad\x23\x73\xc8\xe4\xf5\
-\xd1\x7e\xc0\x31\xf8\x37\xac\xce\x7c\x2c\x48\xe7\xe4\xcd\xc6\x90\
-\xff\x6b\x3f\xe7\xa0\xdb\x01\xdd\x18\x48\xde\xbf\xfc\xe7\x61\x07\
-\xa9\xc5\x43\x37\x46\x00\x5b\x94\xcb\x7b\xff\xd6\x99\xef\x93\xf8\
-\x73\x24\x27\xe1\xdf\xa4\x3a\xf3\xe3\x30\x6d\x93\xb7\xf1\x43\xfc\
-\xf7\x71\xb7\xb9\x14\x3d\x18\x58\xc5\x30\x6c\x31\x2d\xef\xfd\xd7\
-\x6d\x8e\x09\xdd\x18\x79\x83\xb6\x1d\x73\x4e\x0c\xd3\xb6\xf0\x8e\
-\xc2\xbf\x39\x75\xe6\x32\xf4\xca\x5f\x6c\xa3\xb1\x5b\x2c\xde\xfb\
-\xba\xdb\xfc\x8b\x06\x3c\xd1\x5b\xa3\xd1\xc0\x4d\xf8\xef\xb7\x6e\
-\xf3\x2a\xfa\xf5\x1f\x5b\x7f\xe0\x62\xfc\xf7\x75\x9d\xf9\x76\x90\
-\xce\x05\xf4\x25\xfc\x9b\x52\x67\x1e\x42\x33\x7a\xd5\xe5\x7b\xf8\
-\xef\xef\x10\x79\x84\x8c\x9f\xe8\xad\xd1\x46\xe4\x37\xbf\xff\xdb\
-\xe5\xc8\xc0\xbd\x91\x05\x1b\x0d\x3c\x8a\xff\xfe\xae\x33\x07\x04\
-\xe9\x5c\x00\xef\xa4\xf9\xb3\xfb\xbd\x3e\xcf\x02\x2b\x85\x68\x9c\
-\x14\x32\x82\xe6\x4c\x1d\x3d\x9d\x86\xce\xf4\x15\xc8\xbe\xe4\xff\
-\xdc\xc7\xfc\xbc\x02\x8c\x0c\xdb\x1e\x59\x88\x95\xb1\xb7\x2d\xbc\
-\xf7\x7b\x5d\xe9\xc5\xa6\xd5\x77\xb5\x0c\xed\x6a\xfa\xab\xc0\x86\
-\x41\x3a\x27\x65\x1c\x86\xff\xbe\x0f\x99\xff\x43\x07\x87\xd7\x1b\
-\x06\xfc\x01\xff\xfd\x12\x32\x3a\xd1\xab\xdf\xba\x34\xe7\xc7\x42\
-\x91\x8c\xc7\xd6\x48\x70\xd1\x1f\xb8\xa1\x43\x81\x4d\xca\x14\x60\
-\x9b\x20\x9d\x93\xb2\x06\x62\x97\xd0\xbd\xc7\x40\xc8\x3c\x82\xcd\
-\x6a\xd6\x76\x5b\xd2\x9c\x4b\xfe\xf3\xf3\x20\x9a\x17\xc4\xcb\xf6\
-\xb4\x67\xfe\x99\x79\xc0\xb5\x38\xbd\x6e\x7c\x68\x85\x62\x73\xcd\
-\x54\x6c\x8e\x7a\xf1\xb3\x27\xfe\xe3\x20\x74\xe6\x62\x0b\xc4\x8c\
-\x09\xd8\xa7\x5c\x8c\xc2\x9e\xe0\x6e\xe2\xb4\xae\xbb\x06\xec\x93\
-\x94\xb7\x2d\xb6\xba\x9e\xf7\x38\xa8\x2b\x07\x85\x69\x5b\x71\x63\
-\x69\xcf\x24\x0c\xaf\x62\xbf\x52\xc4\x5f\x53\x9f\xf6\x9d\x88\x5d\
-\x32\x6e\xc3\xc4\x41\xfd\xb0\x7b\xfd\x2f\xe0\xdf\xf7\x18\xf9\x7b\
-\xb8\x56\x49\x17\x36\xc5\x3e\x57\xde\xe3\xa1\x8e\x4c\x05\x56\x09\
-\xd3\xb6\x62\xfe\x11\x61\x23\x52\xcc\x78\xb4\xc0\x4f\x4a\xd6\x20\
-\xcf\x65\x60\x8b\xe6\x3a\x60\x8b\x60\xdd\x4a\xcf\xd6\x34\xfb\xb6\
-\xe1\x34\x60\xb5\x60\xdd\x92\x6e\x6d\x4a\x73\x4f\x34\xdf\x9c\x0b\
-\x03\xf5\xac\xa3\xed\x6b\xda\x20\xef\x3c\x8a\x3e\xcc\x29\xfa\x16\
-\xfe\x63\x23\x76\xae\xc7\x6e\x79\x34\xc5\xb6\xd8\x17\x94\x77\x5f\
-\x63\xe7\xeb\xa1\x1a\x26\xc1\xac\x8c\x3d\x93\xe1\x3d\x36\xea\xc8\
-\x8e\x61\x5a\xb6\x70\x37\x3a\x6c\x58\xdd\xb9\x91\x76\xde\x97\xcd\
-\xc1\x00\xe0\x0e\xfc\xc7\x48\x1d\x99\x7f\x22\x90\xf4\xf4\x9f\x0b\
-\xb1\x2d\x70\x05\xfe\x7d\xac\x23\x77\xa3\x07\xff\x52\x35\x0a\xb8\
-\x1a\xff\x31\x52\xc7\xf7\x45\x54\x7b\x24\xb0\x91\xb1\xf3\x3b\xb4\
-\x72\x57\xea\xda\xb2\x26\xf8\xfc\xdc\x8f\xfd\xba\x5c\x3e\x44\xf3\
-\x22\x5b\x01\xf8\x06\xf0\x00\xfe\x7d\xab\x2b\xbd\xd8\xe5\x66\x49\
-\xd7\x20\xec\xbb\xdd\x7b\xac\xc4\xce\x7b\x03\xf5\x6b\x81\x9a\x30\
-\x37\xf7\xc2\x3e\xc4\x5f\x0d\xd7\x2a\x89\xec\x38\xfc\xc7\x4c\xdd\
-\x99\x03\xfc\x13\x7b\x88\x2e\xa5\xf5\x05\x86\x01\x9f\x02\xae\xa4\
-\x3d\xab\x80\xbe\x3e\x3f\xe8\xba\x83\x52\x97\xaf\xd2\xec\x1f\x0f\
-\x17\x87\x6b\xd5\x1b\xad\x85\xbd\xb6\xe4\xbd\x81\x31\x32\x19\x78\
-\x5f\xb8\x56\x49\x0d\x16\x01\x6e\xc1\x7f\xec\x78\x65\x36\xb6\x26\
-\xfa\x71\xc0\x7b\xa8\x77\xd5\xc1\xfe\xd8\xc3\xb1\x47\x60\x3f\x0a\
-\x9a\xfc\x60\x66\xa7\xdc\x86\x56\x7c\xcc\xcd\x2e\xd8\x4c\x8d\xde\
-\x63\x27\x46\xe6\x62\x4b\x25\x07\xd7\xd4\x55\x97\x1e\x01\xd6\x0c\
-\xd8\x27\xa9\xcf\x1a\xb4\x6b\xd2\x8f\x85\x65\x32\xf6\x0a\xda\x37\
-\xb1\x5b\x75\x63\xbb\xe8\xeb\x9b\x8d\xed\xfb\x3b\xbf\x89\xbd\x01\
-\xd4\x96\x57\x80\x3b\x65\x0a\xb0\x6a\x17\x7d\x15\x3f\x6b\xd2\xbc\
-\xc9\xc5\xe6\xa7\xf0\x2a\xb5\x45\x1f\x2e\xea\xc1\xa6\xfc\x5d\xaa\
-\xe8\x5f\x9c\x89\xcb\x81\x8f\x62\x67\x83\x92\xa7\xcf\x01\xa7\x7a\
-\x17\x91\xa8\x69\xc0\x93\x7d\x79\x1e\x98\x80\xbd\x1b\x3d\x15\xbb\
-\x82\x30\xb5\xef\xcf\x2d\x86\x5d\x51\x19\x86\x2d\xac\xb2\x04\x36\
-\xcd\xf7\xca\x7d\x19\x52\x6b\xd5\xf9\xd8\x0f\xf8\x8d\x77\x11\x52\
-\xd9\x28\xe0\x4f\x24\x30\xa7\x7e\x60\xcf\x61\xcf\xe2\xcc\x0d\xf5\
-\x17\x6e\x87\xff\x59\x4d\xe8\x9c\x8a\x9e\xda\x6d\x8a\xdf\xe1\x3f\
-\x9e\x94\x76\xe5\x2c\xa4\x09\xfa\xd3\xcc\xe7\x89\x82\x4e\x5e\xf7\
-\x93\x04\x36\x28\x54\x66\x03\x07\x86\x6c\x8e\xb8\x1b\x42\x7b\x5e\
-\x0d\x54\xfc\x73\x17\xb0\x28\xd2\x24\x9f\x05\x66\xe2\x3f\xb6\x42\
-\xe5\xf8\x90\xcd\xb9\x3f\x81\x0d\x0a\x91\x17\xb0\x77\x93\xa5\x79\
-\x56\xa5\xb9\x0f\xf6\x28\xe9\x64\x22\x76\x5b\x44\x9a\x67\x5b\x9a\
-\x33\x73\xe0\xdd\xa1\x9a\x32\x92\x66\xbc\xda\x73\x17\x61\x1f\x8c\
-\x92\xf4\xec\x41\x33\xc6\xaa\x92\x66\x7a\x89\xfc\x9e\xb5\xb8\x1b\
-\x8b\x1d\x2b\xbc\xc7\x5a\xb7\x99\x03\x0c\x0f\xd1\x90\x5d\x13\xd8\
-\x98\x6e\xf3\xf7\x50\xcd\x90\xe4\xb5\x69\x95\x4a\xa5\xde\xd4\xbe\
-\xea\x9a\xb8\x18\x0a\xfc\x15\xff\xf1\xd6\x6d\x76\x0e\xd1\x8c\xef\
-\x24\xb0\x21\x55\x33\x17\x38\x9a\x7c\xa7\x52\x95\x6a\x4e\xc6\x7f\
-\xec\x29\xcd\xca\x89\x48\x9b\xf4\xc3\x8e\x1d\x39\xcf\x7d\xf3\xad\
-\x10\x8d\x38\x33\x81\x0d\xa9\x92\xe9\xc0\xc7\x43\x34\x40\xb2\xd3\
-\x03\x9c\x8b\xff\x18\x54\x9a\x91\x0b\xb1\xa7\xc5\xa5\x7d\x3e\x44\
-\xbe\x73\x8d\xfc\xbf\x10\x0d\xc8\x71\xf1\x9f\xa7\x81\x8d\x42\x6c\
-\xbc\x64\x6b\x28\x79\x8e\x5d\x25\xad\x5c\x87\x9e\xf8\x6f\xbb\x8d\
-\x80\xa7\xf0\x1f\x8b\x65\x13\x64\x71\xa0\x17\x13\xd8\x90\x32\xb9\
-\x81\xe6\x4d\x58\x24\xd5\x8c\x44\xaf\x07\x2a\xd5\x73\x1b\x30\x02\
-\x11\x3b\xa6\x5c\x8f\xff\x98\x2c\x93\xe7\xba\xdd\xe8\x7e\xe4\xf5\
-\x54\xf5\xd9\x68\xd6\x32\x79\xa3\x31\xc0\x7d\xf8\x8f\x4d\x25\xaf\
-\x3c\x84\x7e\x48\xc8\x1b\x0d\x04\xce\xc0\x7f\x6c\x16\xcd\xac\x6e\
-\x37\x78\xb1\x04\x36\xa2\x48\x7a\xb1\xa7\xbf\x45\x16\x64\x59\xe0\
-\x51\xfc\xc7\xa9\x92\x47\x1e\xc1\xa6\x42\x16\x59\x90\xaf\x90\xcf\
-\x8a\x82\x83\xbb\xd9\xd0\xa5\x13\xd8\x80\x4e\x99\x0c\xec\xd9\xcd\
-\x46\x4a\x2b\x2c\x0d\xdc\x83\xff\x78\x55\xd2\xce\x03\xc0\x72\x88\
-\x2c\xdc\xce\xc0\xcb\xf8\x8f\xd7\x4e\x19\xd3\xcd\x46\x8e\x4d\x60\
-\x03\x16\x96\x5e\x60\xdd\x6e\x36\x50\x5a\x65\x0c\x70\x3b\xfe\xe3\
-\x56\x49\x33\xb7\xd1\xe5\x17\xa6\xb4\xca\xba\xa4\x7f\x25\x60\xf9\
-\x85\x6d\x40\x4f\x87\x0d\x9c\xd1\xb9\x07\xae\xfa\xd3\xbc\x95\x9c\
-\x24\x9e\x97\x80\x77\x61\x6f\x07\x88\xbc\xde\xf5\xc0\xbb\xb1\x31\
-\x22\x52\xc4\x2e\xa4\xff\x7a\xe8\xf4\x6e\xfe\x9f\x87\xe1\x7f\x06\
-\xd3\x29\x93\xb0\xcb\xbb\x22\x45\x0d\x05\xce\xc3\x7f\xec\x2a\x69\
-\xe4\x5c\xf4\xaa\x9f\x94\xb3\x24\x79\xac\x3d\xd2\xd5\x43\xf1\xfd\
-\xc9\x63\x26\xa4\x5f\x75\xb3\x91\xd2\x4a\xfd\x81\x93\xf0\x1f\xbb\
-\x8a\x6f\x4e\xa4\xf3\x95\x50\x91\x37\x3b\x15\xff\xb1\xdb\x29\x73\
-\x08\x30\x0b\xee\xf8\x04\x36\xa4\xc8\x86\x6e\xd2\xed\x86\x4a\x2b\
-\x7d\x0e\x5b\x22\xda\x7b\x0c\x2b\xf5\xa6\x17\xf8\x32\x22\xe5\x6d\
-\x48\xfa\xf7\xfe\xe7\x01\xcf\x86\xd8\xd8\x9b\x13\xd8\x90\x22\xb9\
-\x2a\xc4\xc6\x4a\x2b\xed\x46\x1e\x4f\xf4\x2a\x61\x32\x11\x5b\xe4\
-\x4c\xa4\x8a\xab\xf1\x1f\xc3\x45\x72\x43\xa7\x0d\x29\x72\xe9\x6b\
-\x5c\x81\x3f\x93\x82\x1d\xb1\x79\x9b\x45\xca\xba\x08\x3b\xab\xbf\
-\xcd\xbb\x10\x89\xee\x2e\x60\x33\xe0\x62\xef\x42\x24\x4b\x1f\x01\
-\x76\xf0\x2e\xa2\xa0\x71\x9d\xfe\x40\x91\x13\x80\x87\xbb\xaf\xa3\
-\x36\x3f\xa2\xcb\x89\x0f\xa4\xb5\x9e\xc6\x3e\xd8\x67\x79\x17\x22\
-\xd1\xfc\x1e\xd8\x1a\x78\xc2\xbb\x10\xc9\xd2\x10\xe0\x78\xef\x22\
-\x4a\x78\x24\xc4\x5f\xb2\x1b\xfe\x97\x32\xca\x24\xc8\x12\x88\xd2\
-\x6a\xfb\x02\x53\xf0\x1f\xcb\x4a\x98\x4c\x03\x0e\x46\xa4\x3b\xdf\
-\xc6\x7f\x2c\x97\xc9\x2e\x21\x36\x7a\x34\x79\xbc\x09\x30\x3f\xaf\
-\x01\x2b\x86\xd8\x70\x69\xb5\x95\xb1\x7b\x68\xde\xe3\x59\xe9\x2e\
-\xb7\x02\xab\x21\xd2\x9d\xe5\xc8\x6b\x59\xe0\xb9\xc0\xa8\x50\x1b\
-\xff\x48\x02\x1b\x54\x26\x67\x86\xda\x70\x69\xb5\x45\x80\x63\xc9\
-\xe3\x89\x5f\xe5\x8d\xe9\x05\x7e\xd0\xb7\x0f\x45\xba\x75\x26\xfe\
-\x63\xba\x4c\x1e\x0c\xb9\xf1\x27\x26\xb0\x41\x65\x32\x17\xd8\x36\
-\x64\x03\xa4\xd5\xe6\x3f\x20\xe8\x3d\xae\x95\x62\xb9\x1b\xd8\x7c\
-\x81\x7b\x52\xa4\xbc\xad\xc8\xeb\x2a\xf8\x3c\xe0\x84\x90\x0d\xd8\
-\x31\x81\x0d\x2a\x9b\xdb\xd0\x04\x1f\x12\xce\x00\xec\x3e\x72\x4e\
-\x97\x01\xdb\x96\xe9\xc0\x51\xd8\xb2\xad\x22\x21\xf4\x00\xb7\xe0\
-\x3f\xb6\xcb\x66\xbb\x90\x4d\x18\x80\xcd\x91\xed\xbd\x51\x65\xf3\
-\xc9\x90\x4d\x10\x01\x56\x07\x2e\xc1\x7f\x6c\x2b\x6f\xcc\x3f\xd0\
-\xbd\x7e\x09\xef\x93\xf8\x8f\xed\xb2\x99\x40\x84\x35\x0a\x7e\x9e\
-\xc0\x86\x95\xcd\x78\x60\x78\xe8\x46\x88\x00\xef\x01\xee\xc3\x7f\
-\x8c\xb7\x3d\x0f\x03\x7b\x74\xd8\x57\x22\x55\x2c\x86\xcd\xa6\xe7\
-\x3d\xc6\xcb\xe6\xe4\x18\xcd\x58\x37\x81\x0d\xab\x92\x63\x62\x34\
-\x43\x04\x7b\xc0\xec\x50\x6c\x66\x39\xef\x71\xde\xb6\x4c\x04\x0e\
-\x41\x0f\xf9\x49\x3c\xc7\xe0\x3f\xce\xab\x64\xed\x18\xcd\x00\xb8\
-\x36\x81\x8d\x2b\x9b\x99\xe8\xd2\xa0\xc4\xb5\x18\x70\x04\x79\xac\
-\x0e\x96\x7b\xa6\x00\xc7\x01\x23\x0b\xed\x19\x91\x6a\x56\xc1\x9e\
-\x29\xf1\x1e\xef\x65\x73\x55\x8c\x66\xcc\xf7\xc1\x04\x36\xb0\x4a\
-\xfe\x16\xa3\x19\x22\x6f\x32\x1a\x7b\x6d\x50\x0f\x0a\x86\xcf\x14\
-\xec\x17\xd9\xe2\x85\xf7\x86\x48\x75\x7f\xc3\x7f\xcc\x57\xc9\xde\
-\x31\x9a\x31\x5f\x3f\xe0\x8e\x04\x36\xb2\x4a\x76\x8e\xd0\x0f\x91\
-\x05\x19\x8e\xbd\x31\xf0\x6f\xfc\xc7\x7d\xee\x79\x01\x7b\xb2\x7f\
-\x74\x99\x1d\x20\xd2\x85\x77\xe1\x3f\xee\xab\xe4\x76\x02\x2c\xff\
-\xdb\x49\x6e\x53\x03\xcf\xcf\x3d\x44\x78\x32\x52\x64\x21\x06\x01\
-\xfb\x01\xf7\xe3\x3f\xfe\x73\xcb\x7d\xc0\x67\xfa\x7a\x28\x52\x97\
-\xfe\xd8\xb1\xc2\x7b\xfc\x57\xc9\x6e\x11\xfa\xb1\x40\xd7\xd5\xb4\
-\x41\xa1\xf3\xc5\x18\xcd\x10\xe9\xa0\x1f\xb0\x3d\xb6\x18\xcd\x34\
-\xfc\x3f\x07\xa9\x66\x5a\x5f\x8f\x82\xbe\xc3\x2c\x52\xc2\x01\xf8\
-\x7f\x0e\xaa\xe4\xba\x18\xcd\x78\x3b\x9b\x02\x73\x22\x6c\x44\xec\
-\x4c\x20\xe0\xfc\xc8\x22\x15\x8c\x02\xbe\x8c\x66\x16\x7c\x7d\x6e\
-\x05\x0e\x44\x0f\xf6\x89\xaf\x51\xe4\x39\xdf\xcd\x1c\x6c\x89\xeb\
-\x5a\x9d\x11\xa0\x70\x8f\xfc\x34\x46\x33\x44\x2a\x18\x8b\x3d\x2b\
-\x70\x3d\xfe\x9f\x8b\xba\x73\x3f\x76\x6f\x7f\xf5\x6e\x9b\x28\x12\
-\xc8\xc9\xf8\x7f\x2e\xaa\xe4\x8c\x18\xcd\xe8\x64\x69\x60\x72\x85\
-\x62\xbd\x33\x0b\x58\x2b\x42\x3f\x44\xba\xb1\x06\xf0\x55\xe0\x72\
-\x60\x06\xfe\x9f\x93\xd0\x99\x01\x5c\x86\xcd\x9b\xa0\x83\xbe\xa4\
-\x66\x6d\xec\xd8\xe0\xfd\x39\x29\x9b\xc9\xc0\x32\x11\xfa\x51\xc8\
-\xe1\x05\x0a\x4c\x31\x97\xc4\x68\x86\x48\x20\x43\x81\x3d\x81\x53\
-\x80\x3b\xc9\x73\x35\xc2\x5e\xec\x8d\xa1\x93\xb1\x99\xfa\x86\x06\
-\xed\x90\x48\x58\x97\xe2\xff\x99\xa9\x92\x23\x62\x34\xa3\xa8\x41\
-\xc0\xa3\x0b\x28\x2a\x87\x68\xfa\x50\xc9\xc5\x70\x60\x17\xe0\x68\
-\xec\xe4\x35\xc5\xe9\x49\x9f\xed\xab\xed\x68\xec\x95\xdb\x61\x51\
-\x3a\x21\x12\xde\x9e\xf8\x7f\x7e\xaa\xe4\x31\xba\x7c\x4b\x26\xc4\
-\x3b\x83\x7b\x01\xe7\x05\xf8\x7b\xea\xf6\x28\x36\xbd\xf1\x2c\xef\
-\x42\x44\x2a\x18\x0d\x6c\x00\xac\x87\xdd\x3e\x58\x09\x58\xb9\xef\
-\x3f\x07\x47\xfa\x37\x67\x00\x4f\x02\xe3\xfa\xf2\x30\x70\x2f\xb6\
-\xfc\xee\xc4\x48\xff\xa6\x48\x4c\x03\xb1\x57\x4e\x73\x9c\x2d\x76\
-\x6f\xba\x3c\xf6\x86\x9a\x34\xe0\x72\x6c\x71\x94\xdc\x7c\x8d\xc0\
-\xeb\x26\x8b\x24\x60\x19\xec\x19\x9d\x25\xb1\x13\x85\xf9\x19\x0c\
-\x8c\xc0\x96\x38\x1d\xc8\x7f\x2f\xcb\x4f\x05\x66\x63\x6b\x9e\x4f\
-\xc2\x0e\xf4\x13\xfb\xf2\x12\xf6\xf6\xcc\x78\xe0\xf9\xda\xb6\x40\
-\xa4\x1e\x87\x01\x3f\xf2\x2e\xa2\x82\x2b\x48\xe8\x98\xab\x07\x28\
-\x44\x44\x24\x27\x4b\x02\xaf\xe2\x7f\x1c\x2a\x9b\x5e\xec\xca\x5f\
-\x52\x4e\xc1\xbf\x31\x55\x72\x5a\x8c\x66\x88\x88\x48\xd2\x4e\xc7\
-\xff\xf8\x53\x25\xa7\xc4\x68\x46\xb7\x46\x61\x97\x0a\xbd\x9b\x53\
-\x36\x2e\x93\x28\x88\x88\x88\x9b\x8d\xc8\x73\x32\xbb\x97\x81\x31\
-\x11\xfa\x11\xc4\x97\xf0\x6f\x50\x95\xdc\x40\x0d\x8b\x28\x88\x88\
-\x48\x12\xae\xc1\xff\xb8\x53\x25\x5f\x8a\xd1\x8c\x50\x72\x5e\x48\
-\xe1\xa3\x11\xfa\x21\x22\x22\x69\xd9\x07\xff\xe3\x4d\x95\xdc\x0f\
-\x2c\x12\xa1\x1f\x41\xe5\xba\x94\xe2\x33\x68\xb2\x12\x11\x91\x26\
-\x1b\x82\xbd\xc2\xea\x7d\xbc\xa9\x92\x5d\xc2\xb7\x23\x8e\xf3\xf0\
-\x6f\x56\x95\x1c\x19\xa3\x19\x22\x22\x92\x84\xa3\xf0\x3f\xce\x54\
-\x49\x56\x73\xed\xac\x42\x9e\xf3\x99\x4f\xc3\x16\x68\x11\x11\x91\
-\x66\x59\x1e\x9b\xf3\xc2\xfb\x38\x53\x36\x33\xc9\x70\xfd\x8c\xe3\
-\xf0\x6f\x5c\x95\x9c\x13\xa3\x19\x22\x22\xe2\xea\x0f\xf8\x1f\x5f\
-\xaa\xe4\xb8\x18\xcd\x88\x6d\x18\xf0\x1c\xfe\xcd\xab\x92\xed\x22\
-\xf4\x43\x44\x44\x7c\x6c\x8d\xcd\x74\xe9\x7d\x6c\x29\x9b\xf1\xd8\
-\xec\x9d\x59\xfa\x0c\xfe\x0d\xac\x92\x3b\xb0\xe9\x52\x45\x44\x24\
-\x6f\x3d\xc0\xad\xf8\x1f\x57\xaa\xe4\xd3\x11\xfa\x51\x9b\x1e\xe0\
-\x16\xfc\x9b\x58\x25\x9f\x89\xd0\x0f\x11\x11\xa9\xd7\x7e\xf8\x1f\
-\x4f\xaa\xa4\x11\x3f\x44\xb7\x22\xcf\x4b\x2f\x2f\x90\xf1\xa5\x17\
-\x11\x11\xc9\xf6\x56\xf4\x5c\x1a\x74\x2b\xfa\x1c\xfc\x1b\x5a\x25\
-\xc7\xc7\x68\x86\x88\x88\xd4\xe2\x87\xf8\x1f\x47\xaa\xe4\xec\x18\
-\xcd\xf0\xa2\xd7\x2f\x44\x44\xa4\x4e\xef\x40\xaf\xa3\x27\xe3\x48\
-\xfc\x1b\x5b\x25\x59\x4d\xc0\x20\x22\x22\x00\x5c\x80\xff\xf1\xa3\
-\x4a\xbe\x13\xa3\x19\xde\x86\x00\x4f\xe2\xdf\xdc\x2a\xc9\x66\x0a\
-\x46\x11\x11\xe1\xdd\xf8\x1f\x37\xaa\xa4\xd1\x53\xd2\x7f\x14\xff\
-\x06\x57\xc9\x03\x64\xb0\x08\x83\x88\x88\x30\x00\x2d\x4a\x97\xac\
-\x5c\x97\x61\xfc\x72\x8c\x66\x88\x88\x48\x50\x07\xe1\x7f\xbc\xa8\
-\x92\x56\x2c\x4b\xbf\x11\xd0\x8b\x7f\xb3\xcb\xe6\x65\x60\x4c\x84\
-\x7e\x88\x88\x48\x18\x8b\x03\x2f\xe1\x7f\xbc\x28\x9b\x39\xc0\xa6\
-\x11\xfa\x91\xa4\xd3\xf0\x6f\x78\x95\x9c\x12\xa3\x19\x22\x22\x12\
-\xc4\xcf\xf1\x3f\x4e\x54\xc9\x69\x31\x9a\x91\xaa\x25\x81\x57\xf1\
-\x6f\x7a\xd9\xf4\x02\xeb\x45\xe8\x87\x88\x88\x74\x67\x6d\x60\x36\
-\xfe\xc7\x89\xb2\x99\x0c\x2c\x13\xa1\x1f\x49\x3b\x0c\xff\xc6\x57\
-\xc9\x15\x31\x9a\x21\x22\x22\x5d\xb9\x14\xff\xe3\x43\x95\x1c\x16\
-\xa3\x19\xa9\x1b\x08\x3c\x8c\x7f\xf3\xab\xe4\xfd\x11\xfa\x21\x22\
-\x22\xd5\xec\x8d\xff\x71\xa1\x4a\x1e\x03\x06\x45\xe8\x47\x16\xf6\
-\xc4\x7f\x07\x54\xc9\xe3\xb4\x78\xa7\x89\x88\x24\x64\x20\xf0\x08\
-\xfe\xc7\x85\x2a\xd9\x23\x42\x3f\xb2\x72\x31\xfe\x3b\xa1\x4a\x8e\
-\x88\xd1\x0c\x11\x11\x29\xe5\xeb\xf8\x1f\x0f\xaa\xe4\x9f\x31\x9a\
-\x91\x9b\xb5\x80\x59\xf8\xef\x8c\xb2\x69\xe5\x83\x1b\x22\x22\x09\
-\x59\x0a\x98\x84\xff\xf1\xa0\x6c\x66\x03\xeb\x46\xe8\x47\x96\x7e\
-\x8a\xff\x0e\xa9\x92\xdf\xc4\x68\x86\x88\x88\x14\xf2\x5b\xfc\x8f\
-\x03\x55\xf2\xd3\x18\xcd\xc8\xd5\x28\x60\x02\xfe\x3b\xa5\x6c\xe6\
-\x00\x9b\x47\xe8\x87\x88\x88\x2c\xdc\xc6\xd8\x77\xb0\xf7\x71\xa0\
-\x6c\x26\x02\xa3\x23\xf4\x23\x6b\x07\xe0\xbf\x63\xaa\xe4\x46\x5a\
-\x30\x7d\xa3\x88\x48\x42\xfa\x01\xd7\xe1\xff\xfd\x5f\x25\x5f\x8c\
-\xd0\x8f\xec\xf5\x07\xee\xc6\x7f\xe7\x54\xc9\xff\x44\xe8\x87\x88\
-\x88\x2c\xd8\xc7\xf0\xff\xde\xaf\x92\xfb\xb1\xc5\x8a\x92\x90\xda\
-\x2f\xd7\x77\x91\xe7\x44\x3b\xff\x06\xd6\x04\x5e\xf3\x2e\xa4\x0b\
-\x83\x80\x55\x81\xe5\x81\xa5\x81\x15\xb0\x19\x1b\x87\x00\x23\xb0\
-\x25\x2a\x07\xbe\xee\xcf\xcf\xc5\x66\x73\x7c\xa5\x2f\x2f\x03\xe3\
-\x81\x71\xc0\x53\xc0\x73\xd8\xcc\x89\x22\xd2\x9d\x45\x80\xe5\x80\
-\x15\x81\xb1\xc0\xb2\xd8\x9c\xf7\xa3\xfa\x32\xf2\x4d\x7f\xbe\x17\
-\x98\xd2\x97\xe9\xc0\x0b\xd8\x32\xb3\xcf\x63\xdf\x55\x8f\x01\x33\
-\xeb\x28\x3c\x92\xa1\xc0\x43\xd8\x77\x55\x6e\xde\x43\x42\xc7\xb8\
-\x64\xce\x44\xfa\x5c\x09\x9c\x8b\x4d\xea\x90\x93\xe5\x81\xc3\x81\
-\x23\xbd\x0b\x29\x68\x59\x60\x4b\x60\x0b\x6c\xfa\xcc\xb5\x80\x95\
-\xb0\xab\x30\xa1\xcc\xc6\x26\x7a\xba\x0f\x5b\x9a\xf3\x2e\xec\x76\
-\xc9\xa4\x80\xff\x86\x48\xd3\x2c\x0e\x6c\x05\x6c\xd0\x97\xf5\x80\
-\xd5\x08\xfb\x5d\x3d\x07\x78\x12\x3b\x88\xde\x0f\xdc\x0a\xdc\x8c\
-\x9d\xb4\xe7\xe0\x08\xf2\x3c\xf8\x9f\x4b\x42\x07\xff\x54\xad\x82\
-\x9d\xb5\x7a\x5f\xaa\x29\x9b\x69\xd8\xd9\x79\x8a\x96\x05\x3e\x0d\
-\x9c\x03\x3c\x8d\x5f\x8f\xe6\x60\x27\x03\x3f\x07\x3e\x08\x0c\x8f\
-\xb9\xd1\x22\x19\x18\x09\x7c\x04\xf8\x15\x76\xb2\x3c\x17\xbf\xcf\
-\xe7\x53\xd8\x77\xc4\xa7\x48\xf7\x15\xe7\xb1\xd8\x77\xad\xf7\xf7\
-\x7d\xd9\xcc\xc0\x8e\x6d\x52\xc0\x31\xf8\xef\xb0\x2a\xf9\x53\x8c\
-\x66\x54\xb4\x01\xd6\xc7\x94\x9f\xab\x98\x85\x9d\x11\x1f\x8a\xdd\
-\x72\x10\x69\x83\xb1\xc0\xd7\x80\xab\x48\x77\xf1\x9a\xb9\xd8\x55\
-\xbb\x1f\x60\xdf\x25\xa9\xf8\x13\xfe\xbd\xa9\x92\x63\x63\x34\xa3\
-\xa9\x86\x61\x97\xa3\xbc\x77\x5a\x95\x0f\xcd\xf6\x11\xfa\x51\xd4\
-\x6a\xd8\x6d\x88\x07\xf0\xef\x45\xd9\xcc\x01\xae\xc5\x9e\x90\x5d\
-\x3c\x74\x63\x44\x9c\x2d\x01\x7c\x09\xb8\x1e\xdf\x5f\xf9\x55\xf3\
-\x00\xf6\xdd\xb2\x5a\xe8\xc6\x94\xb0\xfd\x02\xea\xca\x21\xcf\x61\
-\xc7\x34\x29\xe1\x93\xf8\xef\xb8\x2a\xb9\x93\xb0\xf7\xd2\x3b\x19\
-\x0e\xec\x0b\x5c\x4e\x9e\x5f\x2c\x0b\xca\x0c\xe0\xcf\xd8\x03\x33\
-\x22\x39\xdb\x04\x38\x95\x3c\x2f\x5b\xbf\x5d\x6e\x03\x0e\xa6\xde\
-\x77\xd9\x7b\x80\x7f\x05\xde\x8e\xba\xf2\xc9\x08\xfd\x68\xbc\x1e\
-\xe0\x16\xfc\x77\x5e\x95\xec\x1f\xa1\x1f\xaf\xd7\x03\xec\x04\x9c\
-\x45\xb3\xbe\x58\x16\x94\xdb\xb0\x7b\xa4\x3d\x41\x3a\x27\x12\x5f\
-\x7f\x60\x1f\xe0\x0e\xfc\x3f\x3f\x31\x33\x0d\xfb\x0e\xda\x89\xf8\
-\x9f\xcf\xfd\x9d\xb7\xb5\x6a\x6e\x41\xdf\x5d\x95\x6d\x45\x9e\xbf\
-\x6a\x5f\xc0\x5e\x9d\x0b\x6d\x75\xec\x9e\x9c\xe7\x83\x7c\x5e\x79\
-\x18\xd8\x0f\x7b\x25\x4a\x24\x45\x03\xb1\x03\xd5\x63\xf8\x7f\x5e\
-\xea\xce\xd3\xd8\x77\xd3\xea\x5d\x77\xf1\xad\x46\x60\xdf\xa9\xde\
-\xdb\x58\x36\x73\xb1\x63\x98\x74\xe1\x4c\xfc\x77\x64\x95\x9c\x10\
-\x68\xfb\x9b\x78\x89\xbf\x9b\x8c\x03\x3e\x87\xce\xaa\x25\x1d\xfd\
-\x80\x0f\xd3\xce\x03\xff\x82\x12\xfa\x16\xc1\x8f\x13\xd8\xa6\x2a\
-\xf9\x7d\xa0\xed\x6f\xb5\xe5\x80\xa9\xf8\xef\xcc\xb2\x99\x49\xf5\
-\xb3\xe1\x1e\x60\x67\xe0\x6c\x9a\x7f\x89\xbf\x6a\x6e\x05\xb6\xab\
-\xd8\x5f\x91\x50\x76\x20\xdf\x7b\xd3\xb1\x33\x0d\xfb\x0e\xdb\x99\
-\xea\x27\xec\xab\x63\xdf\xa5\xde\xdb\x52\x36\x53\xb1\x63\x97\x04\
-\xf0\x2d\xfc\x77\x68\x95\x5c\x58\x72\x3b\x57\x07\x8e\x02\x9e\x48\
-\xa0\xf6\x5c\xf2\x67\x6c\x49\x50\x91\x3a\x2d\x85\xfd\xc2\xd3\x55\
-\xb9\x62\x79\x16\x38\x09\x58\xbf\x64\x9f\xff\x9e\x40\xed\x55\xf2\
-\xad\x92\xdb\x29\x0b\x31\x04\x9b\xb9\xca\x7b\xa7\x56\xc9\x7b\x3b\
-\x6c\xdb\x08\xec\x92\xf6\x0d\x09\xd4\x9a\x6b\x5e\xee\xeb\x61\x6a\
-\x53\x5b\x4b\xf3\xf4\x03\xbe\x80\x4d\x7f\xed\x3d\xee\x73\xcd\x0d\
-\xd8\xe7\xb5\xd3\x73\x52\xef\x4d\xa0\xd6\x2a\x79\x12\x3b\x66\x49\
-\x40\x1f\xc6\x7f\xc7\x56\xc9\x83\xbc\xf5\xc1\xb5\x1e\x60\x5b\xec\
-\xf5\xa0\x1c\x6f\x6f\xa4\x9a\xcb\xc8\x73\x8a\x50\xc9\xc3\xd2\xe4\
-\xfb\x8b\x34\xc5\xcc\x7f\xdd\x77\x4f\xde\x3a\xd5\xf1\x00\x6c\x66\
-\x44\xef\x1a\xab\xe4\x43\x48\x14\x57\xe3\xbf\x73\xab\xe4\xe0\xbe\
-\xfa\xd7\xc0\x66\xe7\x7b\x26\x81\x9a\x9a\x9a\x89\xc0\x47\x11\x09\
-\x6b\x1f\xec\x4a\x93\xf7\xf8\x6e\x6a\x9e\xc1\xbe\x1b\xd7\xe8\xeb\
-\xf7\xc1\x09\xd4\x54\x25\x57\x23\xd1\x6c\x88\xad\x74\xe5\xbd\x93\
-\xcb\xe6\x15\x6c\x21\x1c\xef\x3a\xda\x94\x9f\x63\x2b\x1c\x8a\x74\
-\x63\x30\x76\xa5\xce\x7b\x3c\xb7\x29\x37\x92\xe7\x2d\x96\x5e\xec\
-\x18\x25\x11\xe9\xc3\xa8\x14\xcd\xed\xc0\xca\x88\x54\xb3\x02\xb6\
-\x4a\x9e\xf7\x38\x56\xf2\xc8\xaf\xc8\x4c\x8e\x0f\x4d\x2d\x01\x3c\
-\xc2\x5b\xd7\xc0\x16\x59\x90\x09\xc0\xfb\xb1\x5f\x15\x22\x45\x6d\
-\x87\x2d\xdf\x5a\xe7\x74\xb7\x92\xaf\x57\xb1\xb7\xb8\x26\x78\x17\
-\x52\x46\x9d\x73\xd6\x87\x32\x0d\x5b\x41\x6b\x17\xef\x42\x24\x0b\
-\x43\x81\x8f\x63\x4f\xe6\xde\xeb\x5c\x8b\xe4\xe1\xc3\xc0\xdf\xd0\
-\x72\xd5\x52\xdc\x37\xb1\x95\x4d\xa5\x06\x8b\x00\x0f\xe1\x7f\xc9\
-\x47\xc9\x27\x73\x81\xc3\x11\x59\xb8\x6f\xa0\x77\xfb\x95\x72\x79\
-\x88\x4c\xa7\x28\xcf\xf1\x0a\x00\xd8\x07\xf4\x61\xe0\x13\xde\x85\
-\x48\x36\xfa\x61\x8b\x96\x0c\x01\xfe\xe9\x5c\x8b\xa4\xe9\x68\xe0\
-\xbb\xe4\x79\x6b\x54\xfc\xec\x8b\x1d\x8f\xa4\x66\x17\xe1\x7f\xf6\
-\xa7\xe4\x97\x9f\xa3\x2f\x79\xf9\xaf\x7e\xc0\x89\xf8\x8f\x4b\x25\
-\xbf\x5c\x86\xb8\x59\x13\x98\x85\xff\x20\x50\xf2\xcb\x89\x88\x98\
-\x9f\xe3\x3f\x1e\x95\xfc\x32\x0b\x3b\x06\x65\x2b\xd7\x5b\x00\xf3\
-\xbd\x04\x8c\x42\x4b\x2e\x4a\x79\x5b\xf6\xfd\xe7\x35\xae\x55\x88\
-\xb7\x1f\x00\x87\x7a\x17\x21\x59\x3a\x09\x38\xc7\xbb\x88\xb6\x1b\
-\x09\xbc\x88\xff\xd9\xa0\x92\x67\x0e\x41\xda\xea\x30\xfc\xc7\x9f\
-\x92\x67\x5e\xa4\x01\xaf\xa2\xe7\x7e\x05\x00\x6c\x3e\xe9\xc9\xc0\
-\x1e\xde\x85\x48\x96\x76\xc1\x9e\xe2\xbd\xdf\xbb\x10\xa9\xd5\x07\
-\x81\xd3\xd0\xb3\x20\x52\xcd\xa1\xd8\xa2\x46\x59\x6b\xca\xe0\xef\
-\xc1\xd6\x87\xdf\xc4\xbb\x10\xc9\xd2\x74\x60\x47\x6c\x0c\x49\xf3\
-\x6d\x0c\x5c\x07\x2c\xea\x5d\x88\x64\xe9\x6e\xec\x58\x33\xc7\xbb\
-\x90\x6e\xf5\x78\x17\x10\xc8\x5c\xec\x72\x9e\x48\x15\x43\xb0\x89\
-\x5f\x96\xf5\x2e\x44\xa2\x5b\x1e\x5b\xd1\x4f\x07\x7f\xa9\xea\x10\
-\x1a\x70\xf0\x87\xe6\x9c\x00\x80\xad\xc2\xf4\x57\xef\x22\x24\x5b\
-\xcb\x01\x7f\xe0\xad\xcb\x92\x4a\x73\x0c\xc0\xf6\xf1\x32\xde\x85\
-\x48\xb6\xfe\x42\x83\x56\xfc\x6b\xc2\x33\x00\xaf\x77\x33\xf0\x79\
-\x32\x9d\x95\x49\xdc\x8d\xc5\x0e\x12\x57\x7a\x17\x22\x51\x1c\x8b\
-\x2d\xeb\x2b\x52\xc5\x0c\x6c\x5d\x91\x57\xbd\x0b\x09\xa5\x69\x27\
-\x00\x93\xb1\x4b\x7b\xdb\x7b\x17\x22\xd9\xda\x06\x7b\x16\xe0\x31\
-\xef\x42\x24\xa8\x5d\xd1\x04\x50\xd2\x9d\xe3\xb1\x5b\x85\x8d\xd1\
-\xc4\x0f\xc3\xa2\xc0\x83\xc0\x8a\xde\x85\x48\xb6\x9e\x07\xd6\x05\
-\x5e\xf6\x2e\x44\x82\x18\x0d\xdc\x07\x2c\xed\x5d\x88\x64\xeb\x59\
-\x6c\xd2\x9f\xa9\xde\x85\x84\xd4\xa4\x67\x00\xe6\x9b\x06\x7c\xcb\
-\xbb\x08\xc9\xda\x32\xd8\x24\x1f\xd2\x0c\x3f\x43\x07\x7f\xe9\xce\
-\xd7\x69\xd8\xc1\x1f\x9a\x79\x05\x00\x6c\xbb\xae\x05\xb6\xf5\x2e\
-\x44\xb2\xf6\x41\x1a\x76\xc9\xaf\x85\xf6\x02\xce\xf3\x2e\x42\xb2\
-\x76\x33\xb0\x35\x36\x01\x50\xa3\x34\xf5\x04\x00\xec\x3d\xcd\x5b\
-\x69\xe6\x55\x0e\xa9\xc7\xbf\x81\xb5\x68\xe0\x99\x7f\x4b\x0c\xc3\
-\x26\x79\xd2\xeb\x9d\x52\xd5\x3c\x6c\xda\xf0\x46\xce\x11\x3c\x60\
-\x09\x03\x00\x00\x0a\x53\x49\x44\x41\x54\xd2\xb4\x87\x00\x5f\xef\
-\x79\x60\x25\x60\x23\xe7\x3a\x24\x5f\xc3\xb1\x93\xe4\x2b\xbc\x0b\
-\x91\x4a\xbe\x0f\xbc\xd7\xbb\x08\xc9\xda\xef\x80\x5f\x78\x17\x11\
-\x4b\x93\xaf\x00\x00\x2c\x8e\x3d\x10\xb8\xa4\x77\x21\x92\xad\x59\
-\xc0\xfa\x68\xbd\xef\xdc\xac\x06\xdc\x0b\x0c\xf2\x2e\x44\xb2\xf5\
-\x12\xb0\x36\x30\xc1\xbb\x90\x58\x9a\x7e\x79\xfc\x65\xe0\x2b\xde\
-\x45\x48\xd6\x06\x02\x3f\xf4\x2e\x42\x4a\x3b\x11\x1d\xfc\xa5\x3b\
-\x5f\xa6\xc1\x07\x7f\x68\xfe\x15\x80\xf9\xce\x07\xde\xe7\x5d\x84\
-\x64\x6d\x4b\xe0\x16\xef\x22\xa4\x90\xad\x69\xc0\x42\x2d\xe2\xea\
-\x3c\x60\x6f\xef\x22\x62\x6b\xcb\x09\xc0\x28\xe0\x36\x60\x15\xef\
-\x42\x24\x5b\x97\x61\x2b\x07\x4a\xfa\xae\x04\xde\xe9\x5d\x84\x64\
-\xeb\x29\xec\x21\xf2\x89\xde\x85\xc4\xd6\xf4\x5b\x00\xf3\xbd\x02\
-\x7c\x18\x9b\xca\x51\xa4\x8a\x9d\xd1\x0c\x93\x39\x78\x37\x3a\xf8\
-\x4b\x75\xd3\xb1\xe9\x7e\x1b\x7f\xf0\x87\xf6\x5c\x01\x98\xef\x13\
-\xc0\xff\xa3\x7d\xdb\x5d\xc5\xf3\xc0\x5d\xd8\x0c\x6a\xe3\xb1\x0f\
-\xc4\xfc\x0f\xc5\x10\xec\x15\xab\xd1\xd8\xc3\x56\xab\x03\xeb\x00\
-\x63\xea\x2f\xb3\x56\x17\x03\xbb\x79\x17\x21\x0b\x75\x19\xb0\x93\
-\x77\x11\x91\xbd\x84\x7d\x2e\x1f\xed\xcb\xcb\xd8\x34\xe8\x33\xb1\
-\xd7\xd6\x46\xf7\x65\x69\x60\x3d\x60\x43\x60\x29\x97\x4a\xf3\x32\
-\x17\x3b\x46\x9c\xe3\x5d\x88\xc4\xf3\x15\xec\x43\xa2\xbc\x31\x53\
-\xb1\xd5\x14\x3f\x41\xb5\x59\xd3\xfa\x61\x4f\xcb\x7f\x05\xb8\x04\
-\xe8\x4d\x60\x9b\x42\x67\x2e\xf6\x54\xb0\xa4\x69\x3d\x6c\x1f\x79\
-\x8f\x93\xd0\xe9\xc5\x3e\x53\x87\x60\x9f\xb1\x2a\x3f\x60\x96\x05\
-\x3e\x89\x4d\x6c\xf5\x5a\x02\xdb\x94\x62\xbe\x5c\xa1\xaf\x92\xa1\
-\xef\xe1\x3f\xd8\x52\xc8\x6c\xe0\x02\x6c\xc6\xbb\x21\x5d\x75\xf4\
-\xad\x96\x03\xbe\x81\xfd\x42\xf1\xde\xce\x90\x39\x3d\x64\x93\x24\
-\xa8\xdf\xe0\x3f\x3e\x42\xe6\x61\xe0\x08\xc2\x4f\x64\x34\x04\xf8\
-\x10\x70\x21\xf6\x1d\xe0\xbd\x9d\x29\xe4\xa8\x6e\x1a\x2a\xf9\xf9\
-\x36\xfe\x83\xce\x2b\xf7\x00\x87\x52\xcf\x65\xc1\xfe\xc0\xbe\x34\
-\xe7\x44\x60\x3a\x76\x79\x55\xd2\xb2\x04\xf6\x8c\x8f\xf7\xf8\x08\
-\x91\x47\x80\x8f\x51\xcf\x33\x5a\x4b\x03\x5f\xc5\xe6\x4c\xf0\xde\
-\x6e\x8f\xcc\x05\xbe\xd9\x75\x17\x25\x4b\xfb\xd3\xcc\x4b\xd5\x0b\
-\xca\x4b\xc0\xc9\xd8\xd3\xad\x1e\x06\x00\x07\x00\x93\x16\x52\x63\
-\x2e\x39\x28\x70\x6f\xa4\x7b\x87\xe0\x3f\x2e\xba\xcd\xab\xc0\x17\
-\xb0\xcf\x8a\x87\x4d\x81\x53\xb0\xef\x0a\xef\x5e\xd4\x91\x5e\x60\
-\xbf\x20\x9d\x93\x6c\xed\x8e\x3d\xdc\xe6\x3d\x18\x63\x64\xfe\x25\
-\xfe\x0f\x60\x13\xda\xa4\x60\x79\xe0\xef\xf8\xf7\xa6\x9b\xdc\x19\
-\xbc\x2b\xd2\xad\x7b\xf0\x1f\x17\xdd\xe4\x7c\xec\xb6\x59\x0a\x06\
-\x61\xb7\x05\x9b\x7c\x8b\x60\x22\x7a\xa0\x57\xfa\x8c\xc5\x26\x79\
-\xf1\x1e\x94\xa1\x72\x0f\xf6\x30\x5e\xca\x4f\xfe\x1e\x44\xde\x5f\
-\x2e\x5a\x63\x22\x1d\x9b\xe1\x3f\x1e\xaa\x66\x16\x76\x65\x2c\x55\
-\x4d\xbc\x45\x70\x33\xf6\x9d\x2f\xf2\x1f\x03\x81\xe3\xc8\xf7\xa0\
-\x34\x01\x5b\xc3\x7e\xe3\xd0\x8d\x89\xe8\x5d\xe4\x7b\xb9\xf1\x47\
-\x11\xfa\x21\xd5\x9c\x88\xff\x78\xa8\x92\x17\x81\x1d\x22\xf4\x23\
-\x96\x4d\xb0\xdb\x88\xb9\x7e\x66\x67\x01\xc7\x90\xce\xd5\x50\x49\
-\xd0\x06\xd8\x19\xa2\xf7\x60\x2d\x3a\xa0\xcf\xc7\xa6\xac\xcc\x75\
-\x50\xaf\x01\x3c\x87\x7f\x2f\xcb\xe6\xb1\x18\xcd\x90\x4a\x9e\xc4\
-\x7f\x3c\x94\xcd\xbf\xb1\x39\x34\x72\x34\x10\xbb\xad\x78\x01\xf9\
-\xfc\x60\xba\x09\x7b\x85\x52\xa4\xa3\x1e\xe0\x33\xc0\x38\xfc\x07\
-\xee\x82\x72\x37\x76\x89\xbf\x29\xab\x1c\xae\x89\x4d\x3c\xe4\xdd\
-\xd7\xb2\xd9\x20\x46\x33\xa4\x94\x8d\xf0\x1f\x07\x65\xf3\x2c\x36\
-\x79\x56\x13\x2c\x85\xbd\x51\x94\xea\x33\x18\x4f\x62\xdf\xe5\x6d\
-\x99\xf5\x56\x02\x1a\x88\xdd\x9f\x7b\x1a\xff\x81\x3c\xff\x12\x7f\
-\x53\xef\x3d\xaf\x8d\x3d\x05\xed\xdd\xe7\x32\x39\x2a\x46\x23\xa4\
-\x94\xef\xe2\x3f\x0e\xca\xe4\x15\xec\x84\xb7\x89\x36\xc6\x6e\x11\
-\x4c\xc0\xbf\xcf\x4f\x01\x5f\x24\xdf\x2b\xa3\x92\x90\xfe\xc0\x5e\
-\xd8\x54\xb0\x73\xa8\x6f\x10\xcf\x24\xff\x4b\xfc\x65\xec\x49\xbd\
-\xfd\xed\x36\x37\xc5\x69\x83\x94\x90\xd3\xc3\xbb\x73\x68\xc7\x93\
-\xe7\xf3\x6f\x11\x9c\x8f\xdd\xa6\xac\xb3\xbf\x17\x63\xdf\xd5\xfd\
-\xa3\x6f\xa5\xb4\xd2\x8a\xd8\x13\xec\x57\x10\xe7\xfe\xd7\x34\xe0\
-\x5c\x6c\x4a\xde\x91\x35\x6d\x53\x4a\x8e\xc2\xff\x8b\xba\x68\x66\
-\x63\x6b\x22\x88\x8f\x11\xe4\x35\x8f\xc7\x77\xe2\xb4\x21\x69\xa3\
-\xb0\x89\xc0\xce\xc3\x26\xd1\x8a\xf1\x19\xbc\x02\xfb\x4e\x1e\x5b\
-\xd3\x36\x35\x86\x16\xc5\xe9\xce\x48\x6c\xed\xf1\x2d\xfa\xb2\x01\
-\xe5\xe6\xd1\xef\xc5\x6e\x2f\xdc\x8b\xad\x5f\x7e\x13\xb6\x6c\x71\
-\x9b\x57\x2d\xec\x0f\xdc\x08\x6c\xee\x5d\x48\x41\xbb\x03\x17\x79\
-\x17\xd1\x52\x7b\x62\x0f\xa2\xe5\xe0\x66\x60\x1b\x6c\xe6\xb9\xb6\
-\x1a\x82\x4d\x36\xb4\x35\xd6\x8b\xf5\x80\x15\x28\xf7\x6b\xfd\x05\
-\xec\x19\xa8\x9b\xb1\xab\x3f\x37\x62\xb7\x0e\xa5\x02\x9d\x00\x84\
-\x37\x04\x58\x19\x58\x09\x18\x8a\xfd\x42\x1c\xd4\xf7\xbf\x4d\xc3\
-\x16\xe2\x98\x08\x3c\x83\xdd\xa7\x9a\x5d\x7f\x89\xc9\xdb\x10\xf8\
-\x17\x7e\x33\xa2\x95\x71\x02\xf0\x35\xef\x22\x5a\xea\x27\xd8\xc3\
-\xb0\xa9\x9b\x8d\x1d\xf8\xee\xf1\x2e\x24\x41\x03\xb1\x5f\xee\x2b\
-\x02\x8b\x63\xdf\x99\x43\xfb\xfe\xb7\x99\xd8\xcc\xa1\xd3\xb0\x87\
-\xf9\x9e\xc4\xae\x22\x88\x48\xc3\x9d\x80\xff\x25\xdb\x22\xb9\x36\
-\x56\x03\xa4\xa3\xeb\xf1\xdf\xff\x45\x72\x7c\xac\x06\x88\x88\x34\
-\xd1\xe2\xd8\x1a\xe7\xde\x5f\xde\x9d\x32\x05\xbd\x62\xe4\xa1\x07\
-\xeb\xbd\xf7\xfe\xef\x94\x49\xd8\x7d\x70\x91\xe4\xe8\x8b\x4b\x52\
-\xf5\x32\x70\xaa\x77\x11\x05\x2c\x46\xbe\x13\xba\xe4\x6c\x0d\xac\
-\xf7\xa9\xfb\x05\xf6\xea\x9f\x88\x88\x94\xb0\x34\x79\x2c\xf1\xba\
-\x4f\xac\x06\xc8\xdb\xda\x07\xff\xfd\xde\x29\xd3\x69\xce\x64\x5d\
-\xd2\x40\xba\x02\x20\x29\x1b\x0f\xfc\xc3\xbb\x88\x02\xd6\xf5\x2e\
-\xa0\x85\xd6\xf3\x2e\xa0\x80\x0b\xb1\xf9\xfe\x45\x92\xa4\x13\x00\
-\x49\xdd\x1f\xbc\x0b\x28\x60\x1d\xef\x02\x5a\x28\x87\x9e\xe7\x30\
-\x76\x45\x44\x92\x35\x04\x7b\x90\xca\xfb\x72\xee\xc2\xf2\x68\xb4\
-\xad\x97\xb7\xf3\x28\xfe\xfb\x7d\x61\x79\x15\x18\x1c\x6d\xeb\x45\
-\x02\xd0\x15\x00\x49\xdd\x74\xe0\x1a\xef\x22\x3a\x58\x05\x3b\x51\
-\x91\x7a\x0c\xc6\xe6\xda\x48\xd9\x55\xb4\x7b\x42\x2f\xc9\x80\x4e\
-\x00\x24\x07\xa9\xcf\xb9\xdf\x83\x3d\x95\x2e\xf5\x58\x8b\xf4\xe7\
-\x7a\x4f\x7d\xcc\x8a\xe8\x04\x40\xb2\x70\xa3\x77\x01\x05\xe4\x70\
-\x4f\xba\x29\x72\xe8\x75\x0e\x63\x56\x5a\x4e\x27\x00\x92\x83\x7f\
-\x91\xfe\x1c\xea\x39\x1c\x94\x9a\x62\x6d\xef\x02\x3a\x98\x03\xdc\
-\xe1\x5d\x84\x48\x27\x3a\x01\x90\x1c\xcc\x9f\x0b\x3c\x65\xa9\x1f\
-\x94\x9a\x24\xf5\x93\xad\x27\xb0\x31\x2b\x92\x34\x9d\x00\x48\x2e\
-\x1e\xf0\x2e\xa0\x83\xd4\x0f\x4a\x4d\x92\x7a\xaf\x53\x1f\xab\x22\
-\x80\x4e\x00\x24\x1f\xf7\x7b\x17\xd0\x81\xde\x04\xa8\xc7\x60\x6c\
-\xa5\xcd\x94\xa5\x3e\x56\x45\x00\x9d\x00\x48\x3e\x52\xff\x55\xa5\
-\x37\x01\xea\x91\xc3\x1b\x00\xa9\x8f\x55\x11\x40\x27\x00\x92\x8f\
-\x1c\x7e\x55\xa5\x7e\x69\xba\x09\x72\xe8\x71\x0e\x63\x55\x44\x27\
-\x00\x92\x8d\x87\x48\xff\x4d\x00\x3d\x08\x18\x5f\xea\x3d\x9e\x03\
-\x3c\xec\x5d\x84\x48\x11\x3a\x01\x90\x5c\xe4\xf0\x26\x40\x0e\xbf\
-\x4e\x73\x97\x7a\x8f\x9f\xc0\x66\xaf\x14\x49\x9e\x4e\x00\x24\x27\
-\xa9\xdf\x5b\x4d\xfd\xe0\xd4\x04\xa9\xf7\x38\xf5\x31\x2a\xf2\x1f\
-\x3a\x01\x90\x9c\xa4\x7e\x6f\x55\x6f\x02\xc4\xa5\x37\x00\x44\x02\
-\xd2\x09\x80\xe4\x24\xf5\x5f\x57\x7a\x13\x20\x2e\xbd\x01\x20\x12\
-\x90\x4e\x00\x24\x27\x39\xfc\xba\x4a\xfd\x12\x75\xce\x72\xe8\x6d\
-\x0e\x63\x54\x04\xd0\x09\x80\xe4\x45\x6f\x02\xb4\x5b\xea\xbd\xd5\
-\x1b\x00\x92\x15\x9d\x00\x48\x4e\xf4\x26\x40\xbb\xa5\xde\x5b\xbd\
-\x01\x20\x59\xd1\x09\x80\xe4\x26\xf5\x7b\xac\xa9\x1f\xa4\x72\x96\
-\x7a\x6f\x53\x1f\x9b\x22\x6f\xa0\x13\x00\xc9\x4d\xea\xf7\x58\xf5\
-\x26\x40\x1c\x7a\x03\x40\x24\x30\x9d\x00\x48\x6e\x52\xff\x95\xa5\
-\x37\x01\xe2\xd0\x1b\x00\x22\x81\xe9\x04\x40\x72\x93\xc3\xaf\xac\
-\xd4\x2f\x55\xe7\x28\x87\x9e\xe6\x30\x36\x45\xfe\x43\x27\x00\x92\
-\x1b\xbd\x09\xd0\x4e\xa9\xf7\x54\x6f\x00\x48\x76\x74\x02\x20\xb9\
-\xd1\x9b\x00\xed\x94\x7a\x4f\xf5\x06\x80\x64\x47\x27\x00\x92\xa3\
-\xd4\xef\xb5\xa6\x7e\xb0\xca\x51\xea\x57\x00\x52\x1f\x93\x22\x6f\
-\x31\xc0\xbb\x00\x91\x0a\xee\x07\xf6\xf4\x2e\x62\x21\x56\x05\xe6\
-\x79\x17\x21\xb5\xd2\xfd\x7f\xc9\x8e\xae\x00\x48\x8e\xf4\x6b\x4b\
-\x52\xa3\x31\x29\xd9\xd1\x09\x80\xe4\x48\xbf\xb6\x24\x35\x1a\x93\
-\x92\x9d\x7e\xde\x05\x88\x54\xb0\x28\x30\x05\x9d\xc0\x4a\x1a\xe6\
-\x00\xc3\xd0\x43\x80\x92\x19\x7d\x81\x4a\x8e\x72\x78\x13\x40\xda\
-\x43\x6f\x00\x48\x96\x74\x02\x20\xb9\xd2\x3d\x57\x49\x85\xc6\xa2\
-\x64\x49\x27\x00\x92\xab\xfb\xbc\x0b\x10\xe9\xa3\xb1\x28\x59\xd2\
-\x09\x80\xe4\xea\x36\xef\x02\x44\xfa\xfc\xcb\xbb\x00\x91\x2a\xf4\
-\x10\xa0\xe4\x6a\x59\xe0\x59\xef\x22\x44\xb0\xb1\xf8\xbc\x77\x11\
-\x22\x65\xe9\x0a\x80\xe4\xea\x39\x74\x02\x20\xfe\x9e\x42\x07\x7f\
-\xc9\x94\x4e\x00\x24\x67\xd7\x78\x17\x20\xad\xa7\x31\x28\xd9\xd2\
-\x09\x80\xe4\xec\x02\xef\x02\xa4\xf5\xce\xf7\x2e\x40\xa4\x2a\x3d\
-\x03\x20\x39\x1b\x06\x4c\x00\x06\x79\x17\x22\xad\x34\x13\x58\x02\
-\x9b\x94\x4a\x24\x3b\xba\x02\x20\x39\x9b\x02\x5c\xe9\x5d\x84\xb4\
-\xd6\x65\xe8\xe0\x2f\x19\xd3\x09\x80\xe4\xee\x0c\xef\x02\xa4\xb5\
-\x4e\xf3\x2e\x40\xa4\x1b\xba\x05\x20\xb9\x1b\x00\x8c\x03\x96\x73\
-\xae\x43\xda\xe5\x19\x60\x65\x6c\x1d\x00\x91\x2c\xe9\x0a\x80\xe4\
-\xae\x17\x5d\x05\x90\xfa\x9d\x8a\x0e\xfe\x92\x39\x5d\x01\x90\x26\
-\x18\x03\x3c\x0e\x0c\xf7\x2e\x44\x5a\x61\x12\xb0\x0a\xf0\xb2\x77\
-\x21\x22\xdd\xd0\x15\x00\x69\x82\x97\x80\x93\xbc\x8b\x90\xd6\xf8\
-\x31\x3a\xf8\x4b\x03\xe8\x0a\x80\x34\xc5\x48\x6c\x59\xd6\x51\xde\
-\x85\x48\xa3\x4d\xc4\x7e\xfd\x4f\xf6\x2e\x44\xa4\x5b\xfd\xbd\x0b\
-\x10\x09\x64\x06\xf6\x4a\xd6\xee\xde\x85\x48\xa3\x1d\x02\xdc\xe4\
-\x5d\x84\x48\x08\xba\x02\x20\x4d\xd2\x03\x5c\x0b\x6c\xe3\x5d\x88\
-\x34\xd2\x75\xc0\x0e\xc0\x3c\xef\x42\x44\x42\xd0\x09\x80\x34\xcd\
-\x3a\xc0\x1d\xc0\x40\xef\x42\xa4\x51\x66\x02\x1b\x02\x0f\x79\x17\
-\x22\x12\x8a\x6e\x01\x48\xd3\x4c\x00\xa6\x02\xef\xf5\x2e\x44\x1a\
-\xe5\x60\xe0\x62\xef\x22\x44\x44\xa4\xb3\xbf\x60\x97\x6a\x15\xa5\
-\xdb\xfc\x09\x91\x06\xd2\x2d\x00\x69\xaa\x11\xc0\x2d\xc0\x1a\xde\
-\x85\x48\xd6\x1e\x00\xb6\x44\x73\xfe\x4b\x03\x69\x1e\x00\x69\xaa\
-\x49\xc0\x4e\xd8\x94\xad\x22\x55\x3c\x0b\xec\x86\x0e\xfe\xd2\x50\
-\x3a\x01\x90\x26\x7b\x06\xfb\x02\x7f\xc5\xbb\x10\xc9\xce\x24\xec\
-\x95\xd2\xa7\xbc\x0b\x11\x89\x45\x27\x00\xd2\x74\xf7\x61\x5f\xe4\
-\x3a\x09\x90\xa2\x26\x02\x3b\x03\x77\x7b\x17\x22\x22\x22\xdd\x5b\
-\x1b\xbb\x22\xe0\xfd\x40\x99\x92\x76\x9e\x03\xd6\x47\x44\x44\x1a\
-\x65\x65\xec\xa1\x2e\xef\x83\x8c\x92\x66\xee\x07\x56\x42\x44\x44\
-\x1a\x69\x31\xe0\x8f\xf8\x1f\x6c\x94\xb4\x72\x2e\xf6\xe6\x88\x88\
-\x88\x34\xdc\x21\xc0\x74\xfc\x0f\x3c\x8a\x6f\xa6\x01\x5f\x46\x44\
-\x44\x5a\xe5\x1d\xc0\x95\xf8\x1f\x84\x14\x9f\x5c\x0f\xac\x89\x88\
-\x88\xb4\x52\x0f\xf0\x05\xe0\x05\xfc\x0f\x48\x4a\x3d\x19\x0f\x7c\
-\x0e\x4d\x84\x26\x22\x22\xc0\x50\xe0\x08\xec\x75\x41\xef\x03\x94\
-\x12\x27\x53\x80\xe3\x80\xe1\x88\x88\x88\xbc\xc9\x68\xec\x44\x60\
-\x1c\xfe\x07\x2c\x25\x4c\x9e\x04\x0e\x07\x16\x47\x44\x44\xa4\x83\
-\xfe\xc0\xfb\x81\xff\x03\x5e\xc3\xff\x20\xa6\x94\xcb\x6b\xc0\x5f\
-\x81\xbd\xd0\xaa\xa7\x22\x0b\xa4\x7b\x60\x22\x9d\x2d\x8a\x2d\x2f\
-\xbc\x3b\xb0\x0d\x5a\x60\x28\x45\xf3\x80\x87\x81\x1b\x81\xbf\x03\
-\x97\x60\x6f\x79\x88\xc8\xdb\xd0\x09\x80\x48\x79\x63\xb0\x15\xe2\
-\xd6\x02\x56\xe9\xcb\x58\x60\x08\x30\xac\x2f\x03\xdc\xaa\x6b\xa6\
-\x5e\xec\x1e\xfe\x14\xec\xd5\xbd\xa7\x81\x27\x80\xc7\x81\x87\x80\
-\x9b\xb0\x29\x7c\x45\xa4\xa0\xff\x1f\xd9\xc3\x3d\xdb\x35\x5d\xde\
-\x18\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x23\x82\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x7b\xb0\x5f\xd5\x75\xd8\xf1\xef\xbd\x42\
-\x80\x00\xf1\x50\x08\xe0\xf0\xb4\xc0\x40\xc0\x34\xc6\x78\x5c\x1e\
-\x4a\x3a\x49\x49\x26\x75\x30\x82\x82\x69\x6c\xd7\x76\x9a\xc4\xc9\
-\x74\x6c\xe3\x07\xcf\x32\x83\x21\x1e\xbb\xc6\xbc\x02\x2e\x76\x27\
-\x89\xe3\x64\x9a\x4e\xe3\xc4\x29\x05\x6c\x42\x3a\xa1\x1d\x3f\x10\
-\x4c\x26\x4d\x6d\x83\xc9\x00\xc6\x18\xf1\x7e\x08\x90\x84\x84\x00\
-\x73\x75\xfb\xc7\xfe\xdd\x72\x73\xad\xfb\xfa\xdd\x73\xf6\x3a\xbf\
-\xb3\xbe\x9f\x99\x3d\x17\x24\xdd\xbb\xf6\x5e\xbf\xad\xdf\x5a\x3a\
-\xbf\xf3\x18\x43\xb3\x59\x06\x9c\x02\xac\x05\x4e\x06\x56\x03\xfb\
-\x0c\x7e\xef\x05\xe0\x21\x60\x1d\x70\x33\x70\x27\x30\x11\x30\xc7\
-\x3e\x30\xcf\x75\x98\xe7\x3a\xcc\x73\x1d\xe6\x59\xad\x58\x01\x5c\
-\x0c\x3c\x03\x4c\x2e\x70\x3c\x0d\x5c\x38\xf8\x5e\x2d\x8c\x79\xae\
-\xc3\x3c\xd7\x61\x9e\xeb\x30\xcf\x6a\xcd\x39\xc0\x63\x2c\x7c\x63\
-\xcd\x1c\x8f\x00\x67\x57\x9f\xf5\xe8\x31\xcf\x75\x98\xe7\x3a\xcc\
-\x73\x1d\xe6\x59\xad\x18\x03\x2e\x07\xb6\x33\xfc\xe6\x9a\x1a\xdb\
-\x81\x2b\x80\xf1\x9a\x0b\x18\x11\xe6\xb9\x0e\xf3\x5c\x87\x79\xae\
-\xc3\x3c\xab\x35\xe3\xc0\x5f\xb0\xf4\x8d\x35\x73\x7c\x05\x37\xd9\
-\x74\xe6\xb9\x0e\xf3\x5c\x87\x79\xae\xc3\x3c\xab\x55\x9f\xa5\xf9\
-\xcd\x35\x35\x3e\x5d\x71\x1d\x5d\x67\x9e\xeb\x30\xcf\x75\x98\xe7\
-\x3a\xcc\xb3\x5a\x73\x0e\xed\x6d\xae\x49\xca\xe1\xa6\xb3\xaa\xad\
-\xa6\xbb\xcc\x73\x1d\xe6\xb9\x0e\xf3\x5c\x87\x79\x56\x6b\x56\x50\
-\x4e\x0a\x69\x73\x83\x4d\x52\x4e\x5a\xd9\xad\xd2\x9a\xba\xc8\x3c\
-\xd7\x61\x9e\xeb\x30\xcf\x75\x98\x67\xb5\xea\x3f\xd0\xfe\xe6\x9a\
-\x1a\x17\x56\x5a\x53\x17\x99\xe7\x3a\xcc\x73\x1d\xe6\xb9\x0e\xf3\
-\xac\xd6\x2c\x63\x71\xd7\x91\x2e\x75\x3c\x35\x88\x99\x8d\x79\xae\
-\xc3\x3c\xd7\x61\x9e\xeb\x30\xcf\x6a\xd5\xbf\xa0\xde\xe6\x9a\x1a\
-\x6b\xaa\xac\xac\x5b\xcc\x73\x1d\xe6\xb9\x0e\xf3\x5c\x87\x79\xae\
-\x24\xeb\x65\x10\x6b\x93\xc4\x8c\x66\x9e\xeb\x30\xcf\x75\x98\xe7\
-\x3a\xcc\x73\x25\x59\x1b\x80\x93\x93\xc4\x8c\x66\x9e\xeb\x30\xcf\
-\x75\x98\xe7\x3a\xcc\x73\x25\x59\x1b\x80\xd5\x01\x31\x0f\x0f\x88\
-\x19\xcd\x3c\xd7\x61\x9e\xeb\x30\xcf\x75\x98\xe7\x4a\xc6\xa2\x27\
-\x10\xe4\x15\x60\xe7\x80\x98\xbb\x56\x8e\x19\xcd\x3c\xd7\x61\x9e\
-\xeb\x30\xcf\x75\x98\xe7\x4a\xb2\x36\x00\x93\x41\x71\xb3\xe5\xdb\
-\x3c\xd7\x61\x9e\xeb\x30\xcf\x75\x98\xe7\x4a\xb2\x7e\x04\x20\x49\
-\x52\x6a\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\
-\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\
-\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\
-\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\
-\x20\x49\x52\x42\x36\x00\x92\x24\x25\xd4\xb5\xc7\x1f\x2e\x07\x8e\
-\x06\x8e\x02\x8e\x1c\x7c\x3d\x02\x58\x09\xec\x0e\xec\x33\xf8\x5a\
-\xfb\x59\xd1\x92\x24\xcd\xe5\x55\x60\x2b\xf0\x02\xb0\x65\x30\x1e\
-\x04\xee\x1f\x8c\x07\x80\xfb\x80\x1f\x47\x4d\x70\xa6\xe8\x06\x60\
-\x19\xa5\xe0\x9f\x02\x9c\x0a\xfc\x0a\xb0\x57\xe8\x8c\x24\x49\x6a\
-\xc7\x4b\xc0\x9d\xc0\xed\xc0\x3a\xe0\xef\x08\x6c\x08\xa2\x1a\x80\
-\x63\x81\xf7\x01\xbf\x01\xec\x1f\x34\x07\x49\x92\x22\x3d\x0f\xfc\
-\x15\xf0\x67\xc0\x1d\xb5\x83\xd7\x6c\x00\x56\x02\x1f\x04\x7e\x93\
-\xd2\x00\x48\x92\xa4\xe2\xfb\xc0\x97\x81\x3f\xa2\x7c\x7c\xd0\xba\
-\x1a\x0d\xc0\x9e\xc0\xbf\x07\x2e\x04\x56\x55\x88\x27\x49\xd2\xa8\
-\xda\x0c\xfc\x67\xe0\x4a\xca\x11\x82\xd6\xb4\xd9\x00\xec\x06\x5c\
-\x02\x9c\x4b\xf9\xd7\xbf\x24\x49\x5a\x98\xcd\xc0\xf5\xc0\x15\x94\
-\x73\x07\x1a\xd7\x56\x03\xf0\x4e\xe0\xf3\xc0\x61\x2d\xfd\x7c\x49\
-\x92\x32\x78\x9c\xf2\x8f\xe9\xff\xd2\xf4\x0f\x6e\xba\x01\x38\x18\
-\xf8\x22\x70\x5a\xc3\x3f\x57\x92\xa4\xcc\xbe\x06\x7c\x08\x78\xb4\
-\xa9\x1f\xd8\x64\x03\x70\x1a\xf0\xa7\xc0\x4f\x35\xf8\x33\x25\x49\
-\x52\xf1\x1c\xf0\x01\xe0\xd6\x26\x7e\xd8\xb2\x06\x7e\xc6\x4e\xc0\
-\x27\x29\x27\x2d\xec\xde\xc0\xcf\x93\x24\x49\x3f\x69\x37\xe0\xdd\
-\x94\x13\xea\xff\x37\x30\xb1\x94\x1f\xb6\xd4\x23\x00\xab\x80\x5b\
-\x28\x37\xf2\x91\x24\x49\x75\x7c\x1b\x58\x4b\xb9\xf3\xe0\x50\x96\
-\xd2\x00\xbc\x01\xf8\x1b\xe0\x9f\x2d\xe1\x67\x48\x92\xa4\xe1\xfc\
-\x23\xf0\xab\x0c\x79\x5e\xc0\xb0\x0d\xc0\xd1\xc0\xff\x04\x0e\x19\
-\xf2\xfb\x25\x49\xd2\xd2\x3d\x41\x69\x02\xee\x59\xec\x37\x0e\xd3\
-\x00\xfc\x2c\xf0\x2d\x60\xdf\x21\xbe\x57\x92\x24\x35\x6b\x03\xf0\
-\xf3\x94\x87\x0d\x2d\xd8\x62\x1b\x80\x03\x29\x0f\x30\x38\x74\x91\
-\xdf\x27\x49\x92\xda\xf3\x18\xe5\x7c\xbc\x47\x16\xfa\x0d\xe3\x8b\
-\xf8\xe1\x7b\x03\x7f\x8d\xc5\x5f\x92\xa4\xae\x39\x08\xb8\x8d\x45\
-\xdc\x72\x7f\xa1\x0d\xc0\x72\xe0\xeb\x78\xc2\x9f\x24\x49\x5d\x75\
-\x0c\x70\x13\xa5\x66\xcf\x6b\xa1\xf7\x01\xb8\x12\xf8\x37\xc3\xce\
-\x48\x92\x24\x55\x71\x28\xb0\x0b\x70\xfb\x7c\x7f\x70\x21\xe7\x00\
-\xbc\x83\xf2\xaf\xff\x9a\x8f\x0e\x96\x24\x49\xc3\x99\x04\xce\x04\
-\x6e\x9e\xeb\x0f\xcd\x57\xd4\x0f\x06\xbe\x83\xb7\xf7\x95\x24\x69\
-\x94\x6c\x00\x8e\xa7\x9c\x1c\xb8\x43\xf3\x9d\x03\xf0\x05\x2c\xfe\
-\x92\x24\x8d\x9a\x7d\x81\x1b\xe6\xfa\x03\x73\x35\x00\x67\x50\x1e\
-\xeb\x2b\x49\x92\x46\xcf\x5a\xe6\xa8\xe3\xb3\x7d\x04\xb0\x1b\xf0\
-\x7d\xe0\x8d\x6d\xcc\x48\x92\x24\x55\xf1\x08\xe5\xea\x80\xad\x33\
-\x7f\x63\xb6\xab\x00\x2e\x03\x4e\x6f\x73\x46\x92\x24\xa9\x75\x7b\
-\x01\xaf\x01\xdf\x98\xf9\x1b\x3b\x3a\x02\xb0\x0a\x78\x18\x58\xd9\
-\xea\x94\x24\x49\x52\x0d\x9b\x81\xc3\x98\xf1\xe4\xc0\x1d\x9d\x03\
-\x70\x2e\x16\x7f\x49\x92\xfa\x62\x4f\xe0\xc3\x33\x7f\x71\xe6\x11\
-\x80\xdd\x29\xff\xfa\xf7\x41\x3f\x92\x24\xf5\xc7\xf3\x94\xa3\x00\
-\x2f\x4e\xfd\xc2\xcc\x23\x00\xbf\x8b\xc5\x5f\x92\xa4\xbe\x59\x05\
-\xfc\xf6\xf4\x5f\x98\x79\x04\xe0\x6e\xe0\xb8\x6a\xd3\x91\x24\x49\
-\xb5\xdc\x0b\xbc\x79\xea\x7f\xa6\x1f\x01\x38\x01\x8b\xbf\x24\x49\
-\x7d\x75\x2c\xf0\x96\xa9\xff\xd9\x69\xda\x6f\xbc\xaf\xfe\x5c\xe6\
-\x35\x01\xdc\x49\xb9\x9f\xf1\x3a\xe0\x21\xca\x59\x8c\x3f\x5e\xe2\
-\xcf\x9d\x5c\xe2\xf7\x0f\x2b\xdb\xf3\x14\xcc\x73\x1d\xe6\xb9\x0e\
-\xf3\x5c\xc7\xa8\xe6\x79\x39\xb0\x0f\xb0\x1a\x58\x43\xb9\x09\xcf\
-\x49\x2c\xfc\xa1\x7b\xb5\xbc\x1f\xf8\xee\xf4\x5f\x58\x06\x3c\x4d\
-\x49\x7c\x17\xc6\x4b\xc0\xe7\x80\xfd\x1a\x5f\x7a\x11\xb5\xae\x6c\
-\xcc\x73\x1d\xe6\xb9\x0e\xf3\x5c\x47\x9f\xf2\xbc\x1f\xe5\x69\xba\
-\xdb\x02\xd7\x35\x73\x3c\xc9\x8c\xf3\xff\xde\xd6\x81\x49\x4d\x8d\
-\xaf\x52\x1e\x42\xd4\xa6\x3e\x6d\xb0\x2e\x33\xcf\x75\x98\xe7\x3a\
-\xcc\x73\x1d\x7d\xcc\xf3\x21\xc0\x8d\x81\x6b\x9b\x39\x8e\x87\xd7\
-\xbb\x80\x7f\xd9\xd2\xa2\x17\x63\x12\xf8\x3d\xe0\x1c\xe0\xd1\xe0\
-\xb9\x48\x92\xd4\x94\x47\x80\xb3\x80\x8b\x81\xed\xc1\x73\x01\xf8\
-\xa5\xe9\xff\x73\x1b\xb1\xdd\xc8\x04\xf0\xeb\x2d\x2d\x74\x47\xfa\
-\xd8\x61\x76\x91\x79\xae\xc3\x3c\xd7\x61\x9e\xeb\xe8\x7b\x9e\xdf\
-\x43\x69\x02\xa2\xd6\x39\x09\xdc\x3a\x35\x99\xe5\xc0\x96\xe0\xc9\
-\x5c\x32\x7c\x2e\x87\xd2\xf7\x0d\xd6\x15\xe6\xb9\x0e\xf3\x5c\x87\
-\x79\xae\x23\x43\x9e\x2f\x6d\x78\xee\x8b\x1d\x9b\x29\xb5\x9f\xe3\
-\x82\x27\xf2\x55\xea\x9f\xe5\x9a\x61\x83\x75\x81\x79\xae\xc3\x3c\
-\xd7\x61\x9e\xeb\xc8\x90\xe7\x31\xe2\xcf\x09\x38\x76\x1c\x38\xaa\
-\xed\x95\xce\xe1\x65\xe0\x13\xe4\xdc\xe4\x92\xa4\x9c\x26\x81\x8f\
-\x50\xae\x0e\x88\x72\x64\x74\x03\x70\x3d\x9e\xf0\x27\x49\xca\xe7\
-\x71\xe0\x0b\x81\xf1\x8f\x1a\x07\x8e\x0c\x0a\x3e\x01\x5c\x1b\x14\
-\x5b\x92\xa4\x68\x57\x13\x77\x55\xc0\x51\xe3\x94\xbb\x16\x45\xb8\
-\x13\x78\x26\x28\xb6\x24\x49\xd1\x9e\x06\xee\x0a\x8a\xbd\x7a\x1c\
-\xd8\x3b\x28\xf8\x4d\x41\x71\x25\x49\xea\x8a\x9b\x83\xe2\xee\x35\
-\x0e\xac\x0c\x0a\x7e\x67\x50\x5c\x49\x92\xba\x22\xaa\x16\xee\x39\
-\x0e\xec\x11\x14\xfc\x87\x41\x71\x25\x49\xea\x8a\x07\x83\xe2\xae\
-\x8c\x3c\x02\xb0\x29\x28\xae\x24\x49\x5d\xb1\x31\x28\xee\xca\x71\
-\x60\xe7\xa0\xe0\xaf\x06\xc5\x8d\x8a\xfd\x4a\x40\xcc\x68\xe6\xb9\
-\x0e\xf3\x5c\x87\x79\xae\x23\x5b\x9e\xa3\x62\xef\x32\x3e\xff\x9f\
-\xe9\xa5\x88\xa3\x0f\x51\x5d\x5e\x24\xf3\x5c\x87\x79\xae\xc3\x3c\
-\xd7\x61\x9e\x2b\xc9\xda\x00\x44\x9c\x7f\x10\xf5\x39\x4f\x24\xf3\
-\x5c\x87\x79\xae\xc3\x3c\xd7\x61\x9e\x2b\xc9\xda\x00\xac\x4b\x12\
-\x33\x9a\x79\xae\xc3\x3c\xd7\x61\x9e\xeb\x30\xcf\x95\x64\x6d\x00\
-\x22\xae\xbb\x8c\xba\xd6\x33\x92\x79\xae\xc3\x3c\xd7\x61\x9e\xeb\
-\x30\xcf\x15\x65\x78\xf2\xd2\x4c\xcb\x28\x77\x60\xaa\xb5\xd6\xa7\
-\xc8\xd9\x6c\x99\xe7\x3a\xcc\x73\x1d\xe6\xb9\x8e\x8c\x79\xae\xb5\
-\xd6\x7f\x32\xa2\x17\x1d\x65\x02\xb8\xa6\x62\xbc\xab\x88\xbb\xdf\
-\x73\x24\xf3\x5c\x87\x79\xae\xc3\x3c\xd7\x61\x9e\x2b\x0a\xe9\x3c\
-\xaa\xac\x6c\x6e\xbb\x02\xeb\x69\x7f\x9d\x8f\x02\x2b\x2a\xad\xa9\
-\x8b\xcc\x73\x1d\xe6\xb9\x0e\xf3\x5c\x47\xb6\x3c\xb7\xbd\xce\xd9\
-\x46\x5c\xe0\x0e\x38\x9b\xd2\xf9\xb5\xb5\xc6\xed\xc0\x99\xd5\x56\
-\xd3\x5d\xe6\xb9\x0e\xf3\x5c\x87\x79\xae\x23\x53\x9e\xdb\x5a\xe3\
-\x7c\x23\x2e\x70\x47\x7c\x86\xf6\xd6\xf8\xa9\x8a\xeb\xe8\x3a\xf3\
-\x5c\x87\x79\xae\xc3\x3c\xd7\x91\x25\xcf\x6d\xad\x71\xbe\x11\x17\
-\xb8\x23\xc6\x81\xaf\xd0\xfc\xfa\xfe\x9c\xf8\x13\x4b\xba\xc4\x3c\
-\xd7\x61\x9e\xeb\x30\xcf\x75\x64\xc9\x73\xed\xfa\x3b\x35\xe2\x02\
-\x77\xc8\x18\x70\x39\xcd\x1c\x6e\xda\x0e\x5c\x41\xb7\x36\x57\x57\
-\x98\xe7\x3a\xcc\x73\x1d\xe6\xb9\x8e\x0c\x79\x0e\xab\xc3\x61\x81\
-\x3b\xe8\x2c\xe0\x11\x86\x5f\xd3\x7a\xba\xf3\x99\x52\x97\x99\xe7\
-\x3a\xcc\x73\x1d\xe6\xb9\x8e\x3e\xe7\x39\xac\x0e\x87\x05\xee\xa8\
-\x5d\x81\x0b\x28\xd7\x86\x2e\x74\x2d\x4f\x01\xe7\x0f\xbe\x57\x0b\
-\x63\x9e\xeb\x30\xcf\x75\x98\xe7\x3a\xfa\x9a\xe7\x90\x3a\x3c\x46\
-\x5c\x31\x1e\x0b\x8a\xbb\x50\xe3\xc0\xc9\xc0\xda\xc1\xd7\xc3\x81\
-\x7d\x06\xbf\xf7\x02\xe5\x7e\xd5\xeb\x28\x77\x90\xba\x8b\xc4\xd7\
-\x91\x2e\x91\x79\xae\xc3\x3c\xd7\x61\x9e\xeb\xe8\x5b\x9e\x43\xea\
-\xb0\x0d\x80\x24\x49\xb1\x42\xea\x70\xd7\x4e\x84\x90\x24\x49\x15\
-\xd8\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\
-\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\
-\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\
-\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\
-\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\
-\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\
-\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\
-\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\
-\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\
-\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\
-\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\
-\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\
-\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\
-\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\
-\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\
-\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\
-\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\
-\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\
-\x48\x92\x94\x90\x0d\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\
-\x80\x24\x49\x09\xd9\x00\x48\x92\x94\x90\x0d\x80\x24\x49\x09\x8d\
-\x01\x93\xd1\x93\x90\x24\x49\x75\x79\x04\x40\x92\xa4\x84\x6c\x00\
-\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\xc8\x06\
-\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\x6c\
-\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\xc8\
-\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\
-\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\
-\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\
-\x84\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\
-\x4a\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\
-\xa4\x84\x6c\x00\x24\x49\x4a\xc8\x06\x40\x92\xa4\x84\x6c\x00\x24\
-\x49\x4a\xc8\x06\x40\x92\xa4\x84\x76\x0a\x8c\x3d\x16\x18\x5b\x92\
-\xa4\xae\x98\x8c\x08\xea\x11\x00\x49\x92\x12\xb2\x01\x90\x24\x29\
-\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\
-\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\
-\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\
-\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\
-\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\
-\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\
-\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\
-\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\
-\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\
-\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\
-\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\
-\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\
-\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\
-\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\
-\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\
-\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\
-\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\
-\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\
-\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\
-\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\
-\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\
-\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\
-\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\
-\x12\xb2\x01\x90\x24\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\
-\x29\x21\x1b\x00\x49\x92\x12\xb2\x01\x90\x24\x29\xa1\x9d\xa2\x27\
-\x20\x49\x0d\x58\x0e\x1c\x0d\x1c\x05\x1c\x39\xf8\x7a\x04\xb0\x12\
-\xd8\x1d\xd8\x67\xf0\x15\x60\x2b\xf0\x02\xb0\x65\x30\x1e\x04\xee\
-\x1f\x8c\x07\x80\xfb\x80\x1f\x57\x9c\xbb\x14\x62\x0c\x98\x0c\x8c\
-\x2d\xd5\x62\x81\xe8\x97\x65\x94\xd7\xf3\x14\xe0\x54\xe0\x57\x80\
-\xbd\x1a\xfa\xd9\x2f\x01\x77\x02\xb7\x03\xeb\x80\xbf\xc3\xd7\x5b\
-\xed\x8a\xaa\xc3\x4c\x06\x0d\xa9\x4d\xcb\x80\x63\x81\xdf\x01\xfe\
-\x12\xd8\x48\x73\x7b\x77\x2b\xf0\xb7\xc0\x45\xc0\x1a\x4a\x73\xa1\
-\x3a\x8e\x05\xae\x00\x9e\xa2\xde\x7b\xd5\x73\xc0\x1f\x50\x5e\x6b\
-\xa9\x0d\x61\x75\xd8\x06\x40\x7d\x62\x81\xe8\x9f\x95\xc0\x27\x80\
-\xef\x13\xf7\x7e\x35\x35\xee\x01\x3e\x0e\xec\xd1\xea\x8a\x95\x8d\
-\x0d\x80\x34\x24\x0b\x44\x3f\xed\x49\x39\xca\xf2\x1c\xf1\xaf\xeb\
-\xcc\xb1\x89\xd2\x68\xae\x6a\x6d\xf5\xca\xc4\x06\x40\x5a\x24\x0b\
-\x44\x3f\xed\x06\x7c\x1a\xd8\x4c\xfc\xeb\xb8\x90\xd7\xf9\x53\x83\
-\x39\x4b\xc3\x0a\xab\xc3\x61\x81\xa5\x21\x59\x20\xfa\xeb\x9d\xc0\
-\x8f\x88\x7f\xdd\x16\x3b\x1e\x03\xde\xdf\x42\x3e\x94\x43\x58\x1d\
-\x0e\x0b\x2c\x0d\xc1\x02\xd1\x4f\x07\x03\x5f\x23\xfe\x75\x5a\xea\
-\xb8\x65\xb0\x16\x69\x31\xc2\xea\x70\x58\x60\x69\x11\x2c\x10\xfd\
-\x75\x1a\xb0\x81\xf8\xd7\xa6\xa9\xb1\x01\xf8\xb5\x46\x33\xa4\xbe\
-\x0b\xab\xc3\x61\x81\xa5\x05\xb2\x40\xf4\xd3\x4e\xc0\xe5\xc0\x04\
-\xf1\xaf\x49\xd3\x63\x3b\x70\x3d\xb0\x73\x53\xc9\x52\xaf\x45\xed\
-\xd3\xb8\xc0\xd2\x3c\x2c\x10\xfd\xb5\x0a\xb8\x83\xf8\xd7\xa1\xed\
-\xf1\x2d\xca\x4d\xa6\xa4\xb9\x44\xed\xcf\xb8\xc0\xd2\x1c\x2c\x10\
-\xfd\xf5\x06\xe0\x7b\xc4\xe7\xbe\xd6\xb8\x17\x3f\xf6\xd1\xdc\xa2\
-\xf6\x66\x5c\x60\x69\x16\x16\x88\xfe\x3a\x1a\x58\x4f\x7c\xce\x6b\
-\x8f\xc7\x81\xe3\x1a\xc8\x9f\xfa\x29\x6a\x5f\xc6\x05\x96\x76\xc0\
-\x02\xd1\x5f\x3f\x0b\x3c\x4b\x7c\xae\xa3\xc6\xb3\x94\xfd\x2d\xcd\
-\x14\xb5\x27\xe3\x02\x4b\x33\x58\x20\xfa\x5b\x20\x0e\x04\x1e\x26\
-\x3e\xc7\xd1\xe3\x51\xe0\x90\xa5\xa5\x52\x3d\x14\xb5\x1f\xe3\x02\
-\x4b\xd3\x58\x20\xfa\x5b\x20\xf6\x26\xd7\x47\x3a\xf3\x8d\x7b\xf1\
-\x0e\x91\xfa\xa7\xa2\xf6\x62\x5c\x60\x69\xc0\x02\xd1\xdf\x02\xb1\
-\x9c\x1c\x27\x73\x2e\x76\x7c\x0b\x9f\x22\xa9\xd7\x45\xed\xc3\xb8\
-\xc0\x12\x16\x88\xbe\x17\x88\xab\x89\xcf\x65\x57\xc7\xe7\x96\x90\
-\x57\xf5\x4b\xd4\x1e\x8c\x0b\x2c\x61\x81\x98\x6b\x8c\x7a\x81\x78\
-\x07\xe5\x7e\x07\xd1\x79\xec\xea\xd8\x0e\xac\x1d\x3a\xbb\xea\x93\
-\xa8\x3d\x18\x17\x58\xe9\x59\x20\xe6\x1e\xa3\x5c\x20\x0e\xa6\x5f\
-\x77\x6f\x6c\x6b\x3c\x0b\x1c\x34\x64\x8e\xd5\x1f\x51\xfb\x2f\x2e\
-\xb0\x52\xb3\x40\x2c\x6c\x8c\x6a\x81\xb8\x85\xf8\xdc\x8d\xca\xb8\
-\x69\xc8\x1c\xab\x3f\xa2\xf6\x5e\x5c\x60\xa5\x66\x81\x58\xf8\x18\
-\xb5\x02\x71\x06\xf1\x39\x1b\xb5\xf1\xce\xa1\x32\xad\xbe\x88\xda\
-\x77\x71\x81\x95\x96\x05\x62\xf1\x63\x54\x0a\xc4\x6e\xc0\x43\xc4\
-\xe7\x6b\xd4\xc6\x7a\x60\xf7\x21\xf2\xad\x7e\x08\xd9\x77\xe3\x55\
-\x96\x26\xbd\x6e\x37\xe0\xda\xe8\x49\x8c\xa0\x1b\x18\x8d\x02\x71\
-\x09\xf0\xc6\xe8\x49\x8c\xa0\x43\x80\x0b\xa3\x27\xa1\x7c\xa2\x3a\
-\x5e\xe5\xf4\x69\xe2\xff\xb5\x35\xaa\xe3\xf7\x86\xc8\x77\x4d\xab\
-\x80\xcd\xc4\xe7\x69\x54\xc7\x26\xf2\x3d\x18\x4a\x45\xc8\x9e\xf3\
-\x08\x80\x6a\x5a\x05\x9c\x1b\x3d\x89\x11\xf6\x31\xba\x5d\x20\xce\
-\x05\x56\x46\x4f\x62\x84\xed\x09\x7c\x38\x7a\x12\xca\xc3\x06\x40\
-\x35\x59\x20\x96\xa6\xcb\x05\x62\x77\xe0\x43\xd1\x93\xe8\x81\x8f\
-\xe1\xdf\x11\x55\x62\x03\xa0\x5a\x2c\x10\xcd\xe8\x6a\x81\xf8\x5d\
-\x60\xdf\xe8\x49\xf4\xc0\x2a\xe0\xb7\xa3\x27\xa1\x1c\x6c\x00\x54\
-\x8b\x05\xa2\x19\x5d\x2d\x10\xbf\x11\x3d\x81\x1e\xf9\xad\xe8\x09\
-\x28\x87\x31\xca\xc9\x00\x51\xb1\x95\xc7\xdd\xf4\xff\x79\xf7\xb5\
-\xdc\x0b\xbc\x39\x7a\x12\xd3\x9c\x00\xfc\x9f\xe8\x49\xf4\xcc\xf1\
-\xc0\x77\xa3\x27\xa1\x6a\x42\xea\xb0\x47\x00\x54\xc3\x09\x58\xfc\
-\x9b\x74\x2c\xf0\x96\xe8\x49\x4c\xf3\xbe\xe8\x09\xec\xc0\x04\xf0\
-\x6d\xe0\x7c\xe0\x24\x60\x7f\x60\xe7\xc1\xd8\x7f\xf0\x6b\x17\x50\
-\x1e\x44\x35\x11\x34\xc7\xb9\xbc\x3f\x7a\x02\xca\x21\xea\x92\x17\
-\xe5\x71\x1d\xf1\x97\x58\xcd\x1c\xaf\x51\x9e\xb8\x77\x1e\x70\x22\
-\xb0\x1f\xe5\xe9\x7b\xcb\x07\xff\x7d\x22\xa5\x78\x7c\x7b\xf0\x67\
-\xa3\xe7\x3b\x73\x74\xe5\x5e\x0a\xcb\x80\xa7\x89\xcf\xc7\xd4\x78\
-\x89\xf2\x10\xa5\xfd\x16\xb1\x86\xfd\x80\x2b\x81\x6d\x1d\x98\xff\
-\xd4\x78\x12\xff\x81\x96\x49\xd4\x3e\x8b\x0b\xac\x14\x2c\x10\xfd\
-\x2e\x10\x6f\x23\x3e\x17\x53\xe3\xab\x94\x67\x4c\x0c\xeb\x10\xe0\
-\xc6\x0e\xac\x63\x6a\x1c\xbf\x84\xb5\x68\xb4\x44\xed\xb1\xb8\xc0\
-\x4a\xc1\x02\xd1\xef\x02\x71\x11\xf1\x79\xd8\x0e\x5c\x4e\x33\xe7\
-\x15\x8d\x0d\xd6\x34\xd1\x81\x75\x9d\xd7\xc0\x7a\x34\x1a\xa2\xf6\
-\x58\x5c\x60\xa5\x60\x81\xe8\x77\x81\xb8\x8d\xd8\x1c\x4c\x00\xbf\
-\xde\xc2\xba\xde\x43\xfc\xa3\xaa\x6f\x6d\x61\x5d\xea\xa6\xa8\x3d\
-\x16\x17\x58\x29\x58\x20\xfa\x5b\x20\x96\x03\x5b\x88\xcd\xc1\x25\
-\x2d\xae\xef\xd2\xe0\xb5\x6d\xa6\xe4\x58\xfd\x17\xb5\xc7\xe2\x02\
-\xab\xf7\x2c\x10\xfd\x2e\x10\xc7\xcd\x32\xaf\x5a\xe3\xab\xb4\x7b\
-\x39\xf1\x18\xf1\x1f\xf9\x1c\xdb\xe2\xfa\xd4\x1d\x51\xfb\x2b\x2e\
-\xb0\x7a\xcf\x02\xd1\xef\x02\x71\xf6\x1c\xf3\x6a\x7b\x6c\x63\x69\
-\xe7\x73\x2c\xd4\x81\x94\x13\x47\xa3\xd6\x79\x66\xfb\x4b\x54\x07\
-\x84\xec\xaf\x2e\x9c\x45\xac\xfe\x3a\x2a\x30\xf6\xcb\xc0\x27\x28\
-\x1b\xbd\x2d\x93\xc0\x47\x28\xc5\x28\xca\x91\x81\xb1\x23\x5f\xdf\
-\xeb\x81\x47\x2b\xc4\x79\x1c\xf8\x42\x85\x38\xb3\x89\xcc\xb1\x7a\
-\xce\x06\x40\x6d\xb2\x40\xb4\x2f\x32\xc7\x51\xcd\xc7\x04\x75\xef\
-\x83\x70\x35\xe5\x7c\x8f\x08\x36\x00\x6a\x8d\x0d\x80\xda\x64\x81\
-\x68\x5f\x64\x81\x58\x1d\x14\xf7\x4e\xe0\x99\x8a\xf1\x9e\x06\xee\
-\xaa\x18\x6f\xba\xa8\x1c\x2b\x01\x1b\x00\xb5\xc9\x02\xd1\xbe\xc8\
-\x02\xb1\x77\x50\xdc\x9b\x02\x62\xde\x1c\x10\x13\x60\xaf\xa0\xb8\
-\x4a\xc0\x06\x40\x6d\xb2\x40\xb4\x2f\xb2\x40\x44\x3d\x96\xf8\xce\
-\x24\x31\x01\xf6\x0c\x8a\xab\x04\x6c\x00\xd4\x26\x0b\x44\xfb\x22\
-\x0b\xc4\x1e\x41\x71\x7f\x18\x10\xf3\xc1\x80\x98\x10\xf7\x77\x48\
-\x09\xd8\x00\xa8\x4d\x16\x88\xf6\x45\x16\x88\xa8\xd8\x9b\x02\x62\
-\x6e\x0c\x88\x09\x36\x00\x6a\xd1\x18\xed\x5e\x26\x35\x5f\x6c\xf5\
-\xdb\x2b\x94\xc7\xaf\xd6\xb6\x0b\xf0\x6a\x40\xcc\x97\x2b\xc7\x84\
-\x92\xe3\x5d\x03\xe2\x42\xbe\xf7\x8e\x6c\xeb\x55\x3d\x21\x7b\xcb\
-\x23\x00\xea\x9b\x57\xa8\x5f\xfc\x23\x59\x1c\x24\x0d\xc5\x06\x40\
-\x6d\xca\x74\xa8\x36\xea\x84\xc7\x2d\x41\x71\x25\x8d\x38\x1b\x00\
-\xb5\x29\xd3\x67\xf1\x47\x04\xc5\x7d\x31\x28\xae\xa4\x11\x67\x03\
-\xa0\x36\xad\x4b\x12\x13\x60\x4d\x50\x5c\x8f\x00\x48\x1a\x8a\x0d\
-\x80\xda\x14\x71\x6d\xfc\x2d\x01\x31\x01\x4e\x0f\x8a\xfb\x7c\x50\
-\x5c\x49\x23\xce\x06\x40\x6d\xca\x72\x47\xbe\x03\x80\x13\x03\xe2\
-\x42\xdc\x47\x1e\x92\x46\x9c\x0d\x80\xda\x34\x01\x5c\x53\x31\xde\
-\x55\xc4\xdc\x93\xff\x02\xe2\xfe\x2e\xd9\x00\x48\x1a\x5a\xd4\x73\
-\xae\x95\xc3\xae\xc0\x7a\xda\xdf\x4f\x8f\x02\x2b\x2a\xad\x69\xba\
-\xc3\x28\xd7\xff\x47\xfd\x3d\x7a\x57\xeb\x2b\x9c\x5d\xb6\xf7\x8e\
-\x6c\xeb\x55\x3d\x21\x7b\xcb\x23\x00\x6a\xdb\xcb\xc0\x79\xb4\xfb\
-\x46\x36\x09\x9c\x0b\x6c\x6b\x31\xc6\x8e\x8c\x01\xd7\x51\x6e\x02\
-\x14\xe5\xbe\xc0\xd8\x92\x46\x9c\x5d\xad\x6a\xf8\x0c\xed\xed\xa5\
-\x4f\x55\x5c\xc7\x74\x97\x2f\x70\x7e\x6d\x8d\x8d\xc0\xb2\xb6\x17\
-\x39\x87\x6c\xef\x1d\xd9\xd6\xab\x7a\xc2\xf6\x96\x9b\x5a\x35\x8c\
-\x03\x5f\xa1\xf9\x7d\xf4\xe7\xc4\x7c\xfe\xfe\x5e\xca\xf9\x06\x51\
-\x7f\x7f\x26\x81\xaf\xb7\xbe\xca\xb9\x65\x7b\xef\xc8\xb6\x5e\xd5\
-\x13\xb6\xb7\xdc\xd4\xaa\x65\x8c\xf2\xaf\xe6\x26\x0a\xe7\x76\xe0\
-\x0a\xea\x17\xff\x31\xe0\x22\xca\x09\x8e\x51\x7f\x77\xa6\xc6\x85\
-\x2d\xaf\x75\x3e\xd9\xde\x3b\xb2\xad\x57\xf5\x84\xed\x2d\x37\xb5\
-\x6a\x3b\x0b\x78\x84\xe1\xf7\xce\x7a\xe0\xcc\xea\xb3\x86\x43\x81\
-\x9b\x86\x98\x6f\x5b\xe3\xed\xed\x2e\x77\x5e\xd9\xde\x3b\xb2\xad\
-\x57\xf5\x84\xed\x2d\x37\xb5\x22\xec\x4a\xb9\x7c\xee\x29\x16\xbe\
-\x67\x9e\x02\xce\xa7\xfe\xd3\xef\x0e\x00\xae\x26\xf6\x6c\xff\x99\
-\xe3\x61\xe2\x1f\x04\x94\xed\xbd\x23\xdb\x7a\x55\x4f\xc8\xde\xf2\
-\x71\xc0\x8a\x36\x0e\x9c\x0c\xac\x1d\x7c\x3d\x1c\xd8\x67\xf0\x7b\
-\x2f\x50\x9e\x27\xb0\x8e\x72\x57\xc1\xbb\x68\xff\x3a\xff\x5d\x28\
-\x0f\xf6\x39\x02\x38\x65\x30\xaf\x13\xe9\xde\x3d\x33\xae\xa6\x34\
-\x50\x91\xb2\xbd\x77\x64\x5b\xaf\xea\x09\xd9\x5b\x36\x00\xca\x6a\
-\x19\xaf\x17\xf8\x93\x81\xd5\x94\xc6\x63\x79\xe4\xa4\x16\xe1\xed\
-\xc0\xdf\x07\xcf\x21\xdb\x7b\x47\xb6\xf5\xaa\x1e\x1b\x00\xa9\x82\
-\x15\xc0\x47\x81\x4f\x00\x3f\x1d\x3c\x97\x61\xdd\x07\x1c\x43\xfc\
-\xe1\xe1\x6c\xef\x1d\xd9\xd6\xab\x7a\x42\xf6\xd6\x4e\x11\x41\xa5\
-\x20\xe7\x00\xd7\x02\x07\x46\x4f\x64\x89\xae\x27\xbe\xf8\x4b\x1a\
-\x71\x1e\x01\x50\x06\x63\xc0\x65\xc0\x27\x19\xfd\x7d\xf7\x3c\x70\
-\x08\xb0\x35\x7a\x22\xe4\x7b\xef\xc8\xb6\x5e\xd5\xe3\x11\x00\xa9\
-\x05\xe3\x94\x9b\x05\x9d\x13\x3d\x91\x86\x7c\x91\x6e\x14\x7f\x49\
-\x23\xce\x23\x00\xea\xbb\xcf\x02\x17\x47\x4f\xa2\x21\x1b\x81\x37\
-\x01\x1b\xa2\x27\x32\x90\xed\xbd\x23\xdb\x7a\x55\x4f\xc8\xde\xea\
-\xda\xa5\x4d\x52\x93\xce\xa1\x3f\xc5\x1f\xe0\x3f\xd2\x9d\xe2\x2f\
-\x69\xc4\x79\x04\x40\x7d\xb5\x02\xb8\x1f\x38\x38\x7a\x22\x0d\x79\
-\x18\x38\x1a\x78\x25\x78\x1e\xd3\x65\x7b\xef\xc8\xb6\x5e\xd5\xe3\
-\x11\x00\xa9\x41\x1f\xa5\x3f\xc5\x1f\xca\x7d\xff\xbb\x54\xfc\x25\
-\x8d\x38\x8f\x00\xa8\x8f\x96\x01\x4f\x32\xba\xd7\xf9\xcf\xf4\x57\
-\xc0\xbb\xa2\x27\xb1\x03\xd9\xde\x3b\xb2\xad\x57\xf5\x78\x04\x40\
-\x6a\xc8\x1a\xfa\x53\xfc\x9f\x05\x3e\x14\x3d\x09\x49\xfd\x63\x03\
-\xa0\x3e\x3a\x3d\x7a\x02\x0d\xfa\x20\xf0\x4c\xf4\x24\x24\xf5\x8f\
-\x0d\x80\xfa\xe8\x94\xe8\x09\x34\xe4\x2a\xca\x43\x90\x24\xa9\x71\
-\x9e\x03\xa0\x3e\x7a\x86\xd1\xff\x08\xe0\x6f\x80\xd3\x80\x89\xe8\
-\x89\xcc\x21\xdb\x7b\x47\xb6\xf5\xaa\x1e\x1f\x06\x24\x35\xe4\x15\
-\x60\xe7\xe8\x49\x2c\xc1\x03\xc0\x3f\xa7\xdc\xf8\xa7\xcb\xb2\xbd\
-\x77\x64\x5b\xaf\xea\xf1\x24\x40\x49\xff\x9f\x6f\xfa\x92\x5a\x65\
-\x03\xa0\x3e\xda\x14\x3d\x81\x25\x3a\x12\xf8\x6f\x94\xcb\x19\x25\
-\xa9\x15\x36\x00\xea\xa3\x1f\x46\x4f\xa0\x01\xbf\x0a\x7c\x2e\x7a\
-\x12\x92\xfa\xcb\x06\x40\x7d\xb4\x2e\x7a\x02\x0d\x39\x0f\x38\x23\
-\x7a\x12\x92\xfa\xc9\x06\x40\x7d\xd4\xa7\x4b\xe7\xfe\x08\xd8\x3f\
-\x7a\x12\x92\xfa\xc7\x06\x40\x7d\x74\x27\xfd\xb9\x79\xce\xbe\xc0\
-\x17\xa3\x27\x21\xa9\x7f\x6c\x00\xd4\x47\x13\xc0\x35\xd1\x93\x68\
-\xd0\xbf\xa6\x3c\xda\x58\x92\x1a\xe3\x7d\x00\xd4\x57\xbb\x52\x1e\
-\x07\x7c\x48\xf4\x44\x1a\xf2\x18\xe5\xea\x80\x6d\xd1\x13\x99\x26\
-\xdb\x7b\x47\xb6\xf5\xaa\x1e\xef\x03\x20\x35\xe8\x65\xca\x49\x74\
-\x51\x6f\xda\x4d\x3b\x08\xf8\x48\xf4\x24\x24\xf5\x87\x47\x00\xd4\
-\x77\x9f\x01\x2e\x89\x9e\x44\x43\x36\x01\x47\x00\x1b\xa2\x27\x32\
-\x90\xed\xbd\x23\xdb\x7a\x55\x8f\x47\x00\xa4\x16\x5c\x0a\xfc\x45\
-\xf4\x24\x1a\xb2\x17\xf0\xd1\xe8\x49\x48\xea\x07\x8f\x00\x28\x83\
-\x31\xe0\x32\xe0\x93\x8c\xfe\xbe\x7b\x9e\x72\x5e\xc3\xd6\xe8\x89\
-\x90\xef\xbd\x23\xdb\x7a\x55\x8f\x47\x00\xa4\x96\x4c\x02\x97\x03\
-\xef\x02\x1e\x8d\x9d\xca\x92\xad\x02\xfe\x6d\xf4\x24\x24\x8d\x3e\
-\x8f\x00\x28\x9b\x5d\x29\x27\xd3\x9d\xc7\xe8\xde\x60\xe7\x3e\xe0\
-\x18\xe2\x4f\x70\xcc\xf6\xde\x91\x6d\xbd\xaa\xc7\xc7\x01\x4b\x15\
-\x8d\x03\x27\x03\x6b\x07\x5f\x0f\x07\xf6\x61\x74\x1e\x23\xfc\x76\
-\xe0\xef\x83\xe7\x90\xed\xbd\x23\xdb\x7a\x55\x8f\x0d\x80\x52\x5a\
-\x06\x9c\xc2\xeb\x85\x78\x35\xa5\x10\x03\xbc\x00\x3c\x44\xb9\xb7\
-\xff\xcd\x94\x3b\xfc\x4d\xb4\x3c\x9f\xe5\x83\xf8\xab\x81\x35\x83\
-\x79\x9d\x44\xf7\x9e\xcc\x77\x35\x70\x41\xf0\x1c\xb2\xbd\x77\x64\
-\x5b\xaf\xea\x09\x3b\x9a\x37\x19\x34\x94\xdb\x0a\xe0\x62\xca\x2d\
-\x7b\x17\xba\x67\x9e\x06\x2e\x1c\x7c\x6f\x4d\xfb\x01\x57\x52\x6e\
-\xc2\x13\xf5\xf7\x65\xe6\x58\x4f\x7c\x61\xc8\xf6\xde\x91\x6d\xbd\
-\xaa\x27\x6c\x6f\xb9\xa9\x55\xdb\x39\x94\x3b\xdb\x0d\xbb\x77\x1e\
-\x01\xce\xae\x3e\xeb\x72\xf6\xfd\x8d\x43\xcc\xb7\xad\xf1\xf6\x76\
-\x97\x3b\xaf\x6c\xef\x1d\xd9\xd6\xab\x7a\xc2\xf6\x96\x9b\x5a\xb5\
-\x8c\x51\xce\xc6\xdf\xce\xd2\xf7\xcf\x76\xe0\x0a\xea\x5f\xc9\x32\
-\x06\x5c\x44\xf9\x28\x22\xea\xef\xce\xd4\xb8\xa8\xe5\xb5\xce\x27\
-\xdb\x7b\x47\xb6\xf5\xaa\x9e\xb0\xbd\xe5\xa6\x56\x0d\xe3\x94\x1b\
-\xf2\x34\xbd\x8f\xbe\x42\xcc\xe5\xac\xef\xa1\x99\x46\x66\x29\xe3\
-\xeb\xad\xaf\x72\x6e\xd9\xde\x3b\xb2\xad\x57\xf5\x84\xed\x2d\x37\
-\xb5\x6a\xf8\x2c\xed\xed\xa5\x4f\x57\x5c\xc7\x74\x9f\x5c\xc4\x1c\
-\xdb\x18\x1b\x89\x3d\x39\x31\xdb\x7b\x47\xb6\xf5\xaa\x9e\xb0\xbd\
-\xe5\xa6\x56\xdb\xce\xa1\xdd\xbd\xb4\x1d\x38\xab\xda\x6a\x5e\x37\
-\x46\xfc\x39\x01\xc7\xb5\xbe\xca\xd9\x65\x7b\xef\xc8\xb6\x5e\xd5\
-\x13\xb6\xb7\xdc\xd4\x6a\xd3\x0a\xca\x49\x7b\x6d\xef\xa7\xc7\x80\
-\xdd\x2a\xad\x69\xba\x03\x81\x97\x86\x98\x6f\x53\xe3\x5d\xed\x2f\
-\x71\x56\xd9\xde\x3b\xb2\xad\x57\xf5\x84\xec\x2d\x6f\x05\xac\xb6\
-\x7d\x0c\x38\xb8\x42\x9c\x03\x81\x0f\x57\x88\x33\xd3\xe3\xc0\x17\
-\x02\xe2\x4e\x79\x53\x60\x6c\x49\x23\xce\xae\x56\x6d\x59\xc6\xe2\
-\xae\xf3\x5f\xea\x78\x8a\x98\xcf\xc4\xf7\x27\xee\xaa\x80\x2f\x57\
-\x58\xdf\x6c\xb2\xbd\x77\x64\x5b\xaf\xea\x09\xd9\x5b\x1e\x01\x50\
-\x9b\x4e\x01\x7e\xba\x62\xbc\xfd\x29\x77\xed\xab\xed\x69\xe0\xae\
-\x80\xb8\x00\x47\x04\xc5\x95\x34\xe2\x6c\x00\xd4\xa6\x33\x02\x62\
-\xae\x0d\x88\x09\xe5\x56\xc5\x11\x56\x05\xc5\x95\x34\xe2\x6c\x00\
-\xd4\xa6\x93\x93\xc4\x84\xf2\x9c\x82\x08\x7b\x04\xc5\x95\x34\xe2\
-\x6c\x00\xd4\xa6\xd5\x01\x31\x0f\x0f\x88\x09\xf0\x60\x50\xdc\x95\
-\x41\x71\x25\x8d\x38\x1b\x00\xb5\x69\xaf\x80\x98\x7b\x07\xc4\x84\
-\x72\x53\x9e\x08\x91\x47\x00\x5e\x0d\x8a\x1b\xf1\xc8\xe6\x5d\x02\
-\x62\x02\xbc\x12\x14\x57\x09\xd8\x00\xa8\x6f\x76\x21\xa6\x40\x44\
-\x89\x3c\x4b\xfc\xc5\xa0\xb8\x11\x4d\x5e\x54\x63\x19\x95\x63\x25\
-\x60\x03\xa0\x36\x59\x20\xda\x17\x59\x20\xb6\x04\xc5\x8d\xf8\x68\
-\x29\xea\x6a\x0b\x1b\x00\xb5\xc6\x06\x40\x6d\xb2\x40\xb4\x2f\xb2\
-\x40\x44\xc5\x5e\x93\x24\x26\xc0\xe6\xa0\xb8\x4a\xc0\x06\x40\x6d\
-\xb2\x40\xb4\x2f\xb2\x40\x44\x9d\xf7\x10\x71\xa9\xe7\xe9\x01\x31\
-\x01\x36\x05\xc5\x55\x02\x36\x00\x6a\x93\x05\xa2\x7d\x91\x05\xe2\
-\xa1\xa0\xb8\x27\x01\xfb\x55\x8c\x77\x00\x70\x62\xc5\x78\xd3\x45\
-\xe5\x58\x09\xd8\x00\xa8\x4d\x16\x88\xf6\x45\x16\x88\x07\x82\xe2\
-\x2e\x03\xce\xaf\x18\xef\x02\xe2\xde\x2b\xef\x0f\x8a\xab\x04\x6c\
-\x00\xd4\x26\x0b\x44\xfb\x22\x0b\x44\x64\xec\x8f\x00\x87\x54\x88\
-\x73\x18\xf0\xa1\x0a\x71\x66\x63\x03\xa0\x56\xf9\x80\x0b\xb5\xe5\
-\x6c\xe2\xf6\xd7\x36\xea\x15\x88\x97\x2b\xaf\x6d\xfa\x38\xb3\xf5\
-\x15\xce\xee\xcd\x73\xcc\xab\xc6\xb8\x11\x18\x6b\x71\x7d\x63\xc0\
-\x4d\xc1\x6b\x3c\xa6\xc5\xf5\xa9\x3b\xa2\xf6\x57\x5c\x60\xf5\x9e\
-\x05\xa2\xdf\x05\x62\x39\xe5\x44\xcf\xc8\xf5\x5f\xda\xe2\xfa\x2e\
-\x0b\x5e\xdb\x66\x4a\x8e\xd5\x7f\x51\x7b\x2c\x2e\xb0\x7a\xcf\x02\
-\xd1\xff\x02\x71\x1b\xb1\x39\xd8\x0e\xbc\xbb\x85\x75\xbd\x77\xf0\
-\xb3\x23\xd7\x76\x6b\x0b\xeb\x52\x37\x45\xed\xb1\xb8\xc0\x4a\xc1\
-\x02\xd1\xef\x02\x71\x21\xb1\x39\x98\x7a\x8d\xaf\xa0\x99\xf3\x30\
-\xc6\x80\x8b\x80\x89\x0e\xac\xeb\xbc\x06\xd6\xa3\xd1\x10\xb5\xc7\
-\xe2\x02\x2b\x05\x0b\x44\xbf\x0b\xc4\x09\xc4\xe7\x61\x6a\xdc\xc8\
-\xd2\xce\xfb\x38\x94\xf8\x8f\x74\xa6\x8f\xe3\x97\xb0\x16\x8d\x96\
-\xa8\x3d\x16\x17\x58\x29\x58\x20\xfa\x5d\x20\x96\x01\x4f\x11\x9f\
-\x8b\xa9\xb1\x0d\xb8\x0a\xd8\x7f\x11\x6b\x38\x00\xb8\x9a\xd8\x93\
-\x39\x67\x8e\x27\xf0\x2a\xad\x4c\xa2\xf6\x59\x5c\x60\xa5\x60\x81\
-\xe8\x7f\x81\xf8\x7d\xe2\xf3\x31\x73\x4c\x00\x77\x50\x2e\xd1\x3c\
-\x99\xf2\x7a\xef\x4c\x79\x58\xd4\xfe\xc0\x29\x94\xa3\x53\xeb\xe8\
-\xc6\xd1\x9c\x99\xe3\x9a\x45\xbd\x02\x1a\x75\x51\xfb\x2c\x2e\xb0\
-\xd2\xb0\x40\x34\x3f\xba\x54\x20\xde\x4a\x7c\x3e\xfa\x36\x7e\x6e\
-\x51\xaf\x80\x46\x5d\xc8\x3e\x1b\x1b\xfc\x47\x84\x36\x2f\xcf\x52\
-\xb7\xbc\x15\xf8\x87\xe8\x49\xf4\xcc\x5b\x80\xef\x45\x4f\x62\x9a\
-\xbb\x81\xe3\xa2\x27\xd1\x13\xf7\x52\x2e\xa1\x55\x1e\x21\x75\xb8\
-\x2b\x87\x10\xd5\x6f\xff\x17\xb8\x27\x7a\x12\x3d\x72\x2f\xdd\x2a\
-\xfe\x00\x7f\x12\x3d\x81\x1e\xf9\x52\xf4\x04\x94\x83\x0d\x80\x6a\
-\xb1\x40\x34\xa7\x8b\x05\xe2\x0f\x81\x0d\xd1\x93\xe8\x81\xe7\x80\
-\x3f\x8e\x9e\x84\x72\xb0\x01\x50\x2d\x16\x88\x66\x74\xb5\x40\x6c\
-\x05\x6e\x88\x9e\x44\x0f\x5c\x47\xdc\x63\xb4\x95\x8c\x0d\x80\x6a\
-\xb1\x40\x34\xa3\xcb\x05\xe2\x3a\x7c\x7e\xfd\x52\x6c\xc6\xbf\x23\
-\xaa\xc8\x06\x40\x35\x59\x20\x96\xa6\xeb\x05\x62\x13\xf0\xf9\xe8\
-\x49\x8c\xb0\x6b\x81\x8d\xd1\x93\x50\x2e\x51\x97\xb9\x28\xa7\x4f\
-\x11\x7f\x89\xd5\xa8\x8e\xcb\x86\xc8\x77\x6d\x2b\x80\x87\x88\xcf\
-\xd5\xa8\x8d\x87\x81\xdd\x16\x9f\x6e\xf5\x44\xd4\xbe\x8b\x0b\xac\
-\x94\x2c\x10\xc3\x8d\x87\x19\x9d\x02\xb1\x96\xf8\x7c\x8d\xda\x38\
-\x6d\xa8\x4c\xab\x2f\xa2\xf6\x5d\x5c\x60\xa5\x65\x81\x58\xfc\x18\
-\xb5\x02\x71\x0b\xf1\x39\x1b\x95\xf1\x3f\x86\xcc\xb1\xfa\x23\x6a\
-\xef\xc5\x05\x56\x6a\x16\x88\x85\x8f\x51\x2c\x10\x07\x53\xae\xfa\
-\x88\xce\x5d\xd7\xc7\xb3\xc0\x41\x43\xe6\x58\xfd\x11\xb5\xff\xe2\
-\x02\x2b\x35\x0b\xc4\xc2\xc6\x28\x17\x88\x77\x10\xff\xc8\xe4\x2e\
-\x8f\xed\xc0\xe9\x43\x67\x57\x7d\x12\xb5\x07\xe3\x02\x2b\x3d\x0b\
-\xc4\xdc\xa3\x0f\x05\xe2\x4a\xe2\xf3\xd8\xd5\xf1\xd9\x25\xe4\x55\
-\xfd\x12\xb5\x07\xe3\x02\x4b\x58\x20\xe6\x1a\x7d\x28\x10\xcb\x81\
-\x6f\x11\x9f\xcb\xae\x8d\x6f\x00\x3b\x0d\x9f\x56\xf5\x4c\xd4\x3e\
-\x8c\x0b\x2c\x61\x81\xc8\x50\x20\xf6\x02\xbe\x4b\x7c\x4e\xbb\x32\
-\xbe\x0f\xac\x5a\x52\x46\xd5\x37\x51\x7b\x31\x2e\xb0\x34\x60\x81\
-\xe8\x7f\x81\xf8\x19\xe0\x47\xc4\xe7\x36\x7a\x3c\x0a\x1c\xb2\xc4\
-\x5c\xaa\x7f\xa2\xf6\x63\x5c\x60\x69\x1a\x0b\x44\xff\x0b\xc4\xd1\
-\x94\x93\x1a\xa3\x73\x1c\x35\x9e\x1d\xe4\x40\x9a\x29\x6a\x4f\xc6\
-\x05\x96\x66\xb0\x40\xf4\xbf\x40\x1c\x0d\xac\x27\x3e\xd7\xb5\xc7\
-\xe3\xc0\x71\x0d\xe4\x4f\xfd\x14\xb5\x2f\xe3\x02\x4b\x3b\x60\x81\
-\xe8\xbf\x37\x00\xdf\x23\x3e\xe7\xb5\xc6\xbd\x94\xcb\x5e\xa5\xd9\
-\x44\xed\xcd\xb8\xc0\xd2\x2c\x2c\x10\xfd\xb7\x8a\x1c\x27\x7f\x7e\
-\x03\xd8\xa7\x99\x94\xa9\xc7\xa2\xf6\x67\x5c\x60\x69\x0e\x16\x88\
-\xfe\xdb\x09\xb8\x1c\x98\x20\xfe\x75\x68\x7a\x6c\x07\xae\xa7\x5c\
-\xe5\x22\xcd\x27\x6a\x9f\xc6\x05\x96\xe6\x61\x81\xc8\xe1\x54\xe0\
-\x29\xe2\x5f\x93\xa6\xc6\xb3\x94\x9b\x5c\x49\x0b\x15\xb5\x57\xe3\
-\x02\x4b\x0b\x64\x81\xe8\xbf\x83\x80\x9b\x89\x7f\x6d\x96\x3a\x6e\
-\x62\x74\x6f\xdd\xac\x38\x61\x75\x38\x2c\xb0\xb4\x08\x16\x88\x1c\
-\x4e\x63\x34\x1f\x17\xfd\x43\xe0\xd7\x5a\xc8\x87\x72\x08\xab\xc3\
-\x61\x81\xa5\x21\x58\x20\xfa\x6f\x05\xe5\xa3\x9f\x4d\xc4\xbf\x6e\
-\xf3\x8d\x8d\xc0\x65\x83\x39\x4b\xc3\x0a\xab\xc3\x61\x81\xa5\x21\
-\x59\x20\x72\x58\x09\x7c\x14\x78\x92\xf8\xd7\x71\xe6\xd8\x40\xd9\
-\x83\x59\x4f\xe0\x54\xb3\xc2\xea\x70\x58\x60\x69\x89\x2c\x10\x39\
-\xec\x01\x7c\x1c\xb8\x9b\xf8\xd7\xf5\x6e\xe0\x63\x83\x39\x49\x4d\
-\xb1\x01\x90\x86\x64\x81\xc8\xe3\x58\xe0\x0a\xea\x36\x7d\x1b\x80\
-\x3f\x00\xd6\x54\x58\x9f\x72\xb2\x01\x90\x1a\x60\x81\xc8\x63\x35\
-\xf0\x3b\xc0\x5f\x02\x2f\xd0\xdc\xeb\xb9\x05\xf8\x5b\xe0\x22\xe0\
-\x04\x60\xbc\xd6\x82\x94\x56\x48\x1d\x1e\x23\xae\x18\x8f\x05\xc5\
-\x55\x1e\xab\x29\x97\x10\x9e\x0a\xfc\x32\xb0\x77\x43\x3f\x77\x2b\
-\x70\x17\x70\xfb\x60\x7c\x87\x72\x5d\xbf\xe2\xec\x04\x1c\x35\x18\
-\x47\x0e\xbe\xbe\x89\x72\x24\x66\x25\xe5\xb5\x9f\x3a\x2a\xb3\x85\
-\x72\x6e\xc6\x8b\x83\xf1\x03\xe0\x81\xc1\xb8\x7f\x30\x5e\xab\x38\
-\x77\x29\xa4\x0e\xdb\x00\x28\x0b\x0b\x84\xa4\xae\xb2\x01\x90\x24\
-\x29\xa1\x90\x3a\xec\x67\x5b\x92\x24\x25\x64\x03\x20\x49\x52\x42\
-\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\
-\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\
-\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\
-\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\
-\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\
-\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\
-\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\
-\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\
-\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\
-\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\
-\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\
-\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\
-\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\
-\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\
-\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\
-\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\
-\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\
-\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\
-\x92\x24\x25\x64\x03\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\
-\x20\x49\x52\x42\x36\x00\x92\x24\x25\x64\x03\x20\x49\x52\x42\xe3\
-\xc0\xab\x41\xb1\x77\x0e\x8a\x2b\x49\x52\x57\xec\x12\x14\xf7\x95\
-\x71\xe0\xc5\xa0\xe0\x7b\x07\xc5\x95\x24\xa9\x2b\xa2\x6a\xe1\x8b\
-\xe3\xc0\x96\xa0\xe0\xab\x83\xe2\x4a\x92\xd4\x15\x47\x04\xc5\x7d\
-\x31\xf2\x08\xc0\x9a\xa0\xb8\x92\x24\x75\x45\x54\x2d\xdc\x3c\x0e\
-\x6c\x0c\x0a\xbe\x36\x28\xae\x24\x49\x5d\x71\x7a\x50\xdc\x4d\xe3\
-\xc0\x43\x41\xc1\x4f\x02\xf6\x0b\x8a\x2d\x49\x52\xb4\x03\x80\x13\
-\x83\x62\x3f\x34\x0e\x3c\x10\x14\x7c\x19\x70\x7e\x50\x6c\x49\x92\
-\xa2\x5d\x40\xdc\xe5\xf8\xf7\x03\x9c\x0d\x4c\x06\x8d\x6d\xc0\x21\
-\x6d\xaf\x52\x92\xa4\x8e\x39\x0c\x78\x99\xb8\xfa\x7b\x26\xc0\x9b\
-\x03\x27\x30\x09\xdc\x08\x8c\x2d\x2d\x8f\x92\x24\x8d\x8c\x31\xe0\
-\x26\x62\x6b\xef\x31\x00\xcb\x29\x57\x02\x44\x4e\xe4\xd2\xa5\xe5\
-\x52\x92\xa4\x91\x71\x19\xb1\x35\x77\x33\xa5\xf6\x03\x70\x5b\xf0\
-\x64\xb6\x03\xef\x1e\x3e\x97\x92\x24\x8d\x84\xf7\x52\x6a\x5e\x64\
-\xcd\xbd\x75\xfa\x84\x2e\x0c\x9e\xcc\x54\x13\x70\x05\x3e\x9f\x40\
-\x92\xd4\x3f\x63\xc0\x45\xc0\x04\xf1\xf5\xf6\xbc\xe9\x13\x3b\xa1\
-\x03\x13\x9a\x1a\x37\xe2\x89\x81\x92\xa4\xfe\x38\x94\xf8\xcf\xfc\
-\xa7\x8f\xe3\xa7\x4f\x6e\x19\xf0\x54\x07\x26\x35\x35\xb6\x01\x57\
-\x01\xfb\x2f\x2e\xc7\x92\x24\x75\xc6\x01\xc0\xd5\xc4\x9e\xed\x3f\
-\x73\x3c\xc1\x0e\x8e\xb4\xff\x7e\x07\x26\x36\x73\x4c\x00\x77\x50\
-\xae\x95\xb0\x77\xd9\x49\x00\x00\x03\x03\x49\x44\x41\x54\x3c\x99\
-\xd2\x10\xf8\x14\x41\x49\x52\xd7\xec\x42\xa9\x51\xa7\x50\x3e\x56\
-\x5f\x47\x37\x0e\xf7\xcf\x1c\xd7\x4c\x4d\x78\xfa\xe5\x77\x6f\x05\
-\xfe\xa1\xa9\x4c\x48\x92\xa4\xce\x79\x0b\xf0\x3d\xf8\xc9\xeb\xef\
-\xef\x06\x8e\xab\x3e\x1d\x49\x92\xd4\xb6\x7b\x29\xf7\xfe\x01\x7e\
-\xf2\x73\x80\x3f\xa9\x3b\x17\x49\x92\x54\xc9\x97\xa6\xff\xcf\xcc\
-\x23\x00\xbb\x03\x0f\x03\xfb\xd6\x9a\x8d\x24\x49\x6a\xdd\x73\xc0\
-\x1b\x29\x37\xfe\x03\x7e\xf2\x08\xc0\x56\xe0\x86\x9a\x33\x92\x24\
-\x49\xad\xbb\x8e\x69\xc5\x1f\x76\x7c\x0f\xfe\xbd\x80\xf5\x83\xaf\
-\x92\x24\x69\xb4\x6d\xa6\xdc\x8b\x60\xe3\xf4\x5f\xdc\xd1\x5d\xf7\
-\x36\x01\x9f\xaf\x31\x23\x49\x92\xd4\xba\x6b\x99\x51\xfc\x61\xf6\
-\xa7\xf0\xad\xa0\x9c\x2d\xf8\xc6\x36\x67\x24\x49\x92\x5a\xb5\x9e\
-\xf2\xe4\xbf\x97\x66\xfe\xc6\x6c\xf7\xdd\xdf\x06\x7c\xbc\xcd\x19\
-\x49\x92\xa4\xd6\x7d\x98\x1d\x14\x7f\x98\xfb\xc1\x3b\x37\x03\x5f\
-\x6b\x65\x3a\x92\x24\xa9\x6d\x37\x01\x5f\x9f\xed\x37\x67\xfb\x08\
-\x60\xca\xc1\xc0\x77\x80\x9f\x6a\x72\x46\x92\x24\xa9\x55\x1b\x28\
-\x0f\xfd\x79\x6c\xb6\x3f\x30\xdf\xa3\x77\x1f\x05\xde\x4f\xb9\x7f\
-\xb0\x24\x49\xea\xbe\x49\xe0\xb7\x98\xa3\xf8\x43\x79\x0a\xe0\x7c\
-\x7e\x40\xb9\x41\xd0\x29\x0d\x4c\x4a\x92\x24\xb5\xeb\x73\xc0\x17\
-\xe7\xfb\x43\xf3\x7d\x04\x30\x65\x39\xf0\xbf\x80\x9f\x5f\xca\x8c\
-\x24\x49\x52\xab\xbe\x09\x9c\x0a\xbc\x36\xdf\x1f\x5c\x68\x03\x00\
-\xe5\xc6\x40\xdf\x04\x7e\x6e\xc8\x49\x49\x92\xa4\xf6\xdc\x0b\xfc\
-\x02\xf0\xfc\x42\xfe\xf0\x62\x1a\x00\x80\x9f\xa1\x3c\xe3\xf8\xb0\
-\x45\x7e\x9f\x24\x49\x6a\xcf\x63\x94\x8f\xea\x1f\x59\xe8\x37\xcc\
-\x77\x12\xe0\x4c\x4f\x00\xff\x8a\x72\x76\xa1\x24\x49\x8a\xb7\x01\
-\xf8\x65\x16\x51\xfc\x61\xf1\x0d\x00\xc0\x7d\x94\x73\x01\x16\x15\
-\x48\x92\x24\x35\xee\x09\xe0\x97\x28\xb5\x79\x51\x86\x69\x00\x18\
-\x04\x3a\x11\xb8\x7b\xc8\xef\x97\x24\x49\x4b\xf3\x8f\x94\x5a\x7c\
-\xcf\x30\xdf\x3c\x6c\x03\x00\xf0\x24\xf0\x8b\xc0\xb7\x97\xf0\x33\
-\x24\x49\xd2\xe2\x7d\x13\x58\x43\xb9\x5f\xcf\x50\x16\x72\x1f\x80\
-\xb9\x6c\x03\xfe\x8c\x72\xd3\x81\x5f\x60\xf1\x27\x15\x4a\x92\xa4\
-\x85\x9b\x04\xfe\x13\xf0\x3e\x60\xeb\x52\x7e\x50\x93\x05\xfb\x54\
-\xe0\xbf\x02\xfb\x37\xf8\x33\x25\x49\x52\xb1\x01\xf8\x00\xf0\xd7\
-\x4d\xfc\xb0\xa5\x7c\x04\x30\xd3\xed\xc0\xdb\x80\x5b\x1a\xfc\x99\
-\x92\x24\xa9\x3c\xa0\xef\x78\x1a\x2a\xfe\xd0\x6c\x03\x00\xe5\x3a\
-\xc4\xb5\xc0\x3b\x81\x1f\x35\xfc\xb3\x25\x49\xca\xe6\x21\xe0\x34\
-\xe0\x0c\xe6\xb9\xb7\xff\x62\x2d\xf5\x1c\x80\xd9\x3c\x00\xfc\x21\
-\xe5\x56\x84\x6f\x05\x76\x69\x29\x8e\x24\x49\x7d\xb4\x09\xb8\x02\
-\x78\x2f\xe5\x6c\xff\xc6\xd5\x38\x69\x6f\x25\xf0\x9b\xc0\xc5\xc0\
-\x01\x15\xe2\x49\x92\x34\xaa\x9e\x03\x6e\x00\xae\x07\x5e\x68\x33\
-\x50\xcd\xb3\xf6\xf7\x00\x3e\x08\xfc\x3b\xe0\xb8\x8a\x71\x25\x49\
-\xea\xba\x7b\x80\x2f\x03\x5f\x02\xb6\xd4\x08\x18\x75\xd9\xde\xb1\
-\x94\x4b\x18\x3e\x80\x47\x05\x24\x49\x39\x3d\x07\xfc\x77\xca\xe5\
-\xf4\x77\xd4\x0e\xde\x85\xeb\xf6\x57\x53\x2e\x21\x3c\x95\x72\x2f\
-\xe3\xbd\x63\xa7\x23\x49\x52\x2b\xb6\x02\x77\x51\xae\x9a\xbb\x1d\
-\xf8\x0e\xb0\x3d\x6a\x32\x5d\x68\x00\xa6\xdb\x09\x38\x6a\x30\x8e\
-\x1c\x7c\x7d\x13\xe5\xe3\x83\x95\x94\xe6\x60\x0f\x60\xe7\xa8\x09\
-\x4a\x92\xb4\x03\xaf\x52\x0e\xdd\x6f\x04\x5e\x1c\x8c\x1f\x50\x4e\
-\x8a\x7f\x00\xb8\x7f\x30\x5e\x8b\x9a\xe0\x4c\xff\x0f\x02\xe4\x83\
-\xeb\x77\xc7\x41\x38\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0a\
-\x02\x37\xe0\xc7\
-\x00\x77\
-\x00\x65\x00\x65\x00\x6b\x00\x6c\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x03\xe3\x3c\xa7\
-\x00\x6e\
-\x00\x6f\x00\x74\x00\x69\x00\x66\x00\x69\x00\x63\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x05\xe2\x59\x27\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x06\x46\x42\x27\
-\x00\x68\
-\x00\x69\x00\x73\x00\x74\x00\x6f\x00\x72\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x08\x94\x60\x47\
-\x00\x73\
-\x00\x65\x00\x61\x00\x72\x00\x63\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0a\x8c\xa1\xe7\
-\x00\x74\
-\x00\x6f\x00\x64\x00\x61\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0b\xdf\x21\x47\
-\x00\x73\
-\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0f\xd4\x9c\x07\
-\x00\x6d\
-\x00\x6f\x00\x6e\x00\x74\x00\x68\x00\x6c\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x03\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x28\x2e\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x60\x01\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\xba\x77\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\xf6\xa5\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x17\x47\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x01\x40\x8b\
-\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x01\x8b\x7d\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x95\xb8\xd6\x38\x3c\
-\x00\x00\x00\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x28\x2e\
-\x00\x00\x01\x95\xb8\xda\x72\xe6\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x60\x01\
-\x00\x00\x01\x95\xb2\x20\x2c\x4d\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\xba\x77\
-\x00\x00\x01\x95\xb8\xd9\xae\x4c\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\xf6\xa5\
-\x00\x00\x01\x95\xb8\xdc\xe2\x29\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x17\x47\
-\x00\x00\x01\x95\xb8\xd5\x53\x63\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x01\x40\x8b\
-\x00\x00\x01\x95\xb8\xda\x0c\x1a\
-\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x01\x8b\x7d\
-\x00\x00\x01\x95\xb8\xd6\xe0\x4e\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,46 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class LoaderSignals(QObject):
+    """Signals of a TaskLoader; they are delivered on the GUI thread"""
+
+    batch = pyqtSignal(list)
+    progress = pyqtSignal(int)  # Percent of the store read so far
+    finished = pyqtSignal(object)  # follow() cursor matching the loaded records
+    failed = pyqtSignal(str)
+
+
+class TaskLoader(QRunnable):
+    """Load a whole store on a worker thread
+
+    Records are parsed by TaskStore.load_batches() off the GUI thread and
+    streamed back in batches, with progress measured in bytes read.
+    """
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self.signals = LoaderSignals()
+        self._cancelled = False
+
+    def start(self):
+        QThreadPool.globalInstance().start(self)
+
+    def cancel(self):
+        """Stop at the next batch; no further signals are emitted"""
+        self._cancelled = True
+
+    def run(self):
+        try:
+            cursor = None
+            for tasks, done, total, cursor in self.store.load_batches():
+                if self._cancelled:
+                    return
+                self.signals.batch.emit(tasks)
+                percent = min(100, done * 100 // total) if total else 100
+                self.signals.progress.emit(percent)
+            if not self._cancelled:
+                self.signals.finished.emit(cursor)
+        except Exception as e:
+            if not self._cancelled:
+                self.signals.failed.emit(str(e))
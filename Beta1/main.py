@@ -1,33 +1,66 @@
 from PyQt5.QtWidgets import (
     QApplication,
+    QSystemTrayIcon,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
     QLabel,
-    QScrollArea,
+    QListView,
     QMessageBox,
     QStackedWidget,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 import sys
+import time
 
+import charts
+import resources
+import theme
 from create import TodoCreator
-from ui_components import HeaderWidget, SidebarWidget, TaskItemWidget
+from deadlines import DeadlineScheduler
+from reminders import NotificationCenter, ReminderEngine, describe
+from storage import open_store
+from task import Status
+from task_collection import TaskCollection
+from task_model import TaskFilterModel, TaskTableModel
+from task_search import TaskSearch
+from ui_components import (
+    HeaderWidget,
+    NotificationPanel,
+    SidebarWidget,
+    TaskItemDelegate,
+)
+from watcher import StoreWatcher
 
 
 class ToDoApp(QWidget):
+    # Milliseconds from construction until the window was first painted
+    firstFrameShown = pyqtSignal(float)
+
+    PREBUILD_SECTIONS = True  # Build hidden sections once the window is idle
+    WARM_UP_CHARTS = True  # Load matplotlib in the background after startup
+    TRAY_REMINDERS = True  # Also pop reminders up from the system tray
+    COUNT_DELAY_MS = 200  # Recount due tasks once a burst of changes settles
+
     def __init__(self):
         super().__init__()
+        self._started = time.perf_counter()
+        self.startup_ms = None
+        self.sections = {}
+        self._section_factories = {}
+        theme.apply()
         self.initUI()
-        self.loadTasks()
+        self._setupTaskWatcher()
+        self._setupReminders()
 
     def initUI(self):
         """Initialize the main user interface"""
         self.setWindowTitle("YourTodo")
         self.setGeometry(100, 100, 1200, 800)
-        self.setStyleSheet("background-color: #F0FBFF;")
+        self.setObjectName("mainWindow")
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
         # Set up main layout structure
         main_layout = QVBoxLayout()
@@ -62,27 +95,37 @@ class ToDoApp(QWidget):
         return content_layout
 
     def _setupStackedWidgets(self):
-        """Set up all section widgets in the stacked widget"""
-        # Create widgets for each section
-        self.today_widget = QWidget()
-        self.weekly_widget = QWidget()
-        self.monthly_widget = QWidget()
-        self.history_widget = QWidget()
+        """Register the sections; only Today is built before the first frame"""
+        self.registerSection("today", self._buildTodaySection)
+        self.registerSection("weekly", lambda: self._buildSimpleSection("Weekly Task"))
+        self.registerSection(
+            "monthly", lambda: self._buildSimpleSection("Monthly Task")
+        )
+        self.registerSection("history", lambda: self._buildSimpleSection("History"))
+        self.showSection("today")
+
+    def registerSection(self, section, factory):
+        """Add a section whose widget is created by factory() on first use"""
+        self._section_factories[section] = factory
+
+    def sectionWidget(self, section):
+        """Return the widget of a section, building it if needed"""
+        widget = self.sections.get(section)
+        if widget is None:
+            widget = self._section_factories[section]()
+            self.sections[section] = widget
+            self.stacked_widget.addWidget(widget)
+        return widget
 
-        # Set up each widget's content
+    def _buildTodaySection(self):
+        self.today_widget = QWidget()
         self.setupTodayWidget()
-        self.setupSimpleWidget(self.weekly_widget, "Weekly Task")
-        self.setupSimpleWidget(self.monthly_widget, "Monthly Task")
-        self.setupSimpleWidget(self.history_widget, "History")
-
-        # Add all widgets to the stacked widget
-        for widget in [
-            self.today_widget,
-            self.weekly_widget,
-            self.monthly_widget,
-            self.history_widget,
-        ]:
-            self.stacked_widget.addWidget(widget)
+        return self.today_widget
+
+    def _buildSimpleSection(self, text):
+        widget = QWidget()
+        self.setupSimpleWidget(widget, text)
+        return widget
 
     def _connectSidebarButtons(self):
         """Connect sidebar buttons to their respective sections"""
@@ -125,55 +168,34 @@ class ToDoApp(QWidget):
 
         # Add task count label
         self.task_count_label = QLabel("0")
-        self.task_count_label.setStyleSheet(
-            """
-            background-color: #E3F8FF;
-            color: #00B4D8;
-            padding: 5px 15px;
-            border-radius: 15px;
-            font-size: 18px;
-            font-weight: bold;
-        """
-        )
+        self.task_count_label.setObjectName("taskCount")
         header.addWidget(self.task_count_label)
         header.addStretch()
 
         # Add task button
         add_btn = QPushButton("Add")
-        add_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #00B4D8;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                padding: 8px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0096B7;
-            }
-        """
-        )
+        add_btn.setObjectName("addButton")
         add_btn.clicked.connect(self.addTask)
         header.addWidget(add_btn)
 
         return header
 
     def _setupTaskList(self):
-        """Create scrollable task list area"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background-color: transparent; }"
-        )
-
-        self.task_list_widget = QWidget()
-        self.task_list_layout = QVBoxLayout(self.task_list_widget)
-        self.task_list_layout.setAlignment(Qt.AlignTop)
-        scroll.setWidget(self.task_list_widget)
-
-        return scroll
+        """Create the task list; cards are painted only for visible rows"""
+        self.task_model = TaskTableModel(self)
+        self.task_filter = TaskFilterModel(self)
+        self.task_filter.setSourceModel(self.task_model)
+        self.task_search = TaskSearch(self.task_filter, self.header.search_bar, self)
+
+        self.task_list_view = QListView()
+        self.task_list_view.setModel(self.task_filter)
+        self.task_list_view.setItemDelegate(TaskItemDelegate(self.task_list_view))
+        self.task_list_view.setUniformItemSizes(True)
+        self.task_list_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.task_list_view.setMouseTracking(True)  # Hover highlight
+        self.task_list_view.setObjectName("taskList")
+
+        return self.task_list_view
 
     def setupSimpleWidget(self, widget, text):
         """Set up a simple widget with centered text"""
@@ -183,36 +205,96 @@ class ToDoApp(QWidget):
         header_label = QLabel(text)
         header_label.setFont(QFont("Arial", 24, QFont.Bold))
         header_label.setAlignment(Qt.AlignCenter)
-        header_label.setStyleSheet("color: #333;")
+        header_label.setObjectName("sectionTitle")
 
         layout.addWidget(header_label)
         layout.addStretch()
 
-    def loadTasks(self):
-        """Load tasks from file and update UI"""
-        # Clear existing tasks
-        for i in reversed(range(self.task_list_layout.count())):
-            self.task_list_layout.itemAt(i).widget().setParent(None)
+    def _setupTaskWatcher(self):
+        """Follow tasks.txt so changes made elsewhere show up in the list"""
+        self.task_watcher = StoreWatcher(open_store("tasks.txt"), self)
+        self.task_watcher.reloaded.connect(self.task_model.set_tasks)
+        self.task_watcher.appended.connect(self.task_model.append_tasks)
+        self.task_model.modelReset.connect(self.updateTaskCount)
+        self.task_model.rowsInserted.connect(self.updateTaskCount)
+        self.task_model.rowsRemoved.connect(self.updateTaskCount)
+        self.task_model.dataChanged.connect(self.updateTaskCount)
+        self.count_timer = QTimer(self)
+        self.count_timer.setSingleShot(True)
+        self.count_timer.setInterval(self.COUNT_DELAY_MS)
+        self.count_timer.timeout.connect(self._updateDueCounts)
+
+        # Fail due tasks the moment their deadline passes
+        self.deadline_scheduler = DeadlineScheduler(self.task_model, self)
+        self.deadline_scheduler.expired.connect(self.markTasksFailed)
+
+    def _setupReminders(self):
+        """Feed upcoming-deadline reminders to the bell, its panel and the tray"""
+        self.notifications = NotificationCenter(self)
+        # A child of the model, so TodoUpdater finds it from the table
+        self.reminders = ReminderEngine(self.task_model, "tasks.txt", self.task_model)
+        self.reminders.reminded.connect(self.notifications.add)
+        self.notifications.changed.connect(
+            lambda: self.header.setUnreadCount(self.notifications.unread)
+        )
+        self.notification_panel = None
+        self.header.notif_btn.clicked.connect(self.showNotifications)
+
+        self.tray = None
+        if self.TRAY_REMINDERS and QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray = QSystemTrayIcon(resources.icon("notification"), self)
+            self.tray.setToolTip("YourTodo")
+            self.tray.show()
+            self.reminders.reminded.connect(self._showTrayReminders)
+
+    def showNotifications(self):
+        """Open the notification panel under the bell and mark everything read"""
+        if self.notification_panel is None:
+            self.notification_panel = NotificationPanel(self)
+            self.notification_panel.clear_btn.clicked.connect(self.clearNotifications)
+        self.notification_panel.setNotifications(
+            [describe(n) for n in self.notifications.notifications]
+        )
+        self.notification_panel.showBelow(self.header.notif_btn)
+        self.notifications.mark_all_read()
+
+    def clearNotifications(self):
+        self.notifications.clear()
+        self.notification_panel.setNotifications([])
+
+    def _showTrayReminders(self, notifications):
+        lines = [describe(n) for n in notifications[:3]]
+        if len(notifications) > 3:
+            lines.append(f"...and {len(notifications) - 3} more")
+        self.tray.showMessage(
+            "Upcoming deadlines", "\n".join(lines), QSystemTrayIcon.Information
+        )
 
-        try:
-            with open("tasks.txt", "r", encoding="utf-8") as file:
-                for line in file:
-                    data = line.strip().split(" | ")
-                    if len(data) == 6:
-                        task_data = {
-                            "name": data[0],
-                            "description": data[1],
-                            "start_time": data[2],
-                            "deadline": data[3],
-                            "priority": data[4],
-                            "status": data[5],
-                        }
-                        task_widget = TaskItemWidget(task_data)
-                        self.task_list_layout.addWidget(task_widget)
-        except FileNotFoundError:
-            open("tasks.txt", "w").close()
-
-        self.updateTaskCount()
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.startup_ms is None:
+            self.startup_ms = (time.perf_counter() - self._started) * 1000
+            QTimer.singleShot(0, self._afterFirstFrame)
+
+    def _afterFirstFrame(self):
+        """Start the work that was kept off the path to the first frame"""
+        self.firstFrameShown.emit(self.startup_ms)
+        self.loadTasks()
+        if self.PREBUILD_SECTIONS:
+            QTimer.singleShot(0, self._prebuildNextSection)
+        if self.WARM_UP_CHARTS:
+            charts.warm_up()
+
+    def _prebuildNextSection(self):
+        # One section per event loop pass so input is never held up for long
+        pending = [s for s in self._section_factories if s not in self.sections]
+        if pending:
+            self.sectionWidget(pending[0])
+            QTimer.singleShot(0, self._prebuildNextSection)
+
+    def loadTasks(self):
+        """Load tasks from the store in the background and keep following it"""
+        self.task_watcher.load_async()
 
     def addTask(self):
         """Open dialog to add a new task"""
@@ -221,35 +303,32 @@ class ToDoApp(QWidget):
     def saveNewTask(self, task_data):
         """Save new task to file and update UI"""
         try:
-            # Save to file
-            with open("tasks.txt", "a", encoding="utf-8") as file:
-                data = [
-                    task_data["name"],
-                    task_data["description"],
-                    task_data["start_time"],
-                    task_data["deadline"],
-                    task_data["priority"],
-                    task_data["status"],
-                ]
-                file.write(" | ".join(data) + "\n")
-
-            # Update UI
-            task_widget = TaskItemWidget(task_data)
-            self.task_list_layout.addWidget(task_widget)
-            self.updateTaskCount()
+            # Save to store; the watcher picks the new task up from there
+            open_store("tasks.txt").add(task_data)
+            if "reminders" in task_data:
+                self.reminders.set_leads(task_data, task_data["reminders"])
+            self.task_watcher.poll()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error saving task: {e}")
 
+    def markTasksFailed(self, task_ids):
+        """Mark tasks whose deadline passed while they were due as failed
+
+        However many tasks expired together (say after the app was closed
+        over a weekend), the store is written once and the list updated once.
+        """
+        try:
+            rows = self.task_model.rows_of(task_ids)
+            status = "failed ❌"
+            open_store("tasks.txt").set_statuses({task_id: status for task_id in rows})
+            self.task_model.set_values("status", {row: status for row in rows.values()})
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error updating tasks: {e}")
+
     def showSection(self, section):
         """Switch to the specified section in the stacked widget"""
-        section_widgets = {
-            "today": self.today_widget,
-            "weekly": self.weekly_widget,
-            "monthly": self.monthly_widget,
-            "history": self.history_widget,
-        }
-        if section in section_widgets:
-            self.stacked_widget.setCurrentWidget(section_widgets[section])
+        if section in self._section_factories:
+            self.stacked_widget.setCurrentWidget(self.sectionWidget(section))
 
     def updateSidebarButtons(self, clicked_button):
         """Update sidebar button states"""
@@ -259,31 +338,35 @@ class ToDoApp(QWidget):
     def saveTasks(self):
         """Save all tasks to file"""
         try:
-            with open("tasks.txt", "w", encoding="utf-8") as file:
-                for i in range(self.task_list_layout.count()):
-                    widget = self.task_list_layout.itemAt(i).widget()
-                    if isinstance(widget, TaskItemWidget):
-                        task_data = widget.task_data
-                        data = [
-                            task_data["name"],
-                            task_data["description"],
-                            task_data["start_time"],
-                            task_data["deadline"],
-                            task_data["priority"],
-                            task_data["status"],
-                        ]
-                        file.write(" | ".join(data) + "\n")
+            tasks = [
+                self.task_model.task(row) for row in range(self.task_model.rowCount())
+            ]
+            open_store("tasks.txt").replace_all(tasks)
             self.loadTasks()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error saving tasks: {e}")
 
     def updateTaskCount(self):
         """Update the task count display"""
-        self.task_count_label.setText(str(self.task_list_layout.count()))
+        self.task_count_label.setText(str(self.task_model.rowCount()))
+        self.count_timer.start()
+
+    def _updateDueCounts(self):
+        """Show how many tasks are due, due this week and overdue"""
+        tasks = TaskCollection.from_model(self.task_model)
+        now = int(time.time())
+        due = tasks.count(status=Status.DUE)
+        this_week = tasks.count(status=Status.DUE, deadline=(now + 1, now + 7 * 86400))
+        overdue = tasks.count(status=Status.DUE, deadline=(None, now))
+        self.task_count_label.setToolTip(
+            f"{due} due, {this_week} due this week, {overdue} overdue"
+        )
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    theme.apply(app)
     window = ToDoApp()
+    window.firstFrameShown.connect(lambda ms: print(f"First frame after {ms:.0f} ms"))
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,180 @@
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+MAGIC = b"YTLINES1"
+HEADER = struct.Struct("<8sQI")  # magic, indexed size, checksum of the indexed tail
+TAIL_CHECK_BYTES = 64
+SAMPLED_OFFSETS = 16
+
+
+class MappedLineReader:
+    """Memory-mapped line reader with a persistent offset index
+
+    The start offset of every complete line is kept in a sidecar file
+    (history.txt -> history.txt.idx). When the file only grew, just the
+    appended bytes are scanned; a rewritten or truncated file is re-indexed.
+    Use it as a context manager: entering refreshes the index and maps the
+    file, leaving unmaps it so the file can be rewritten meanwhile.
+
+    One reader per file saves the index; others (e.g. on a worker thread)
+    pass save_index=False and only read it. Saves never leave a torn index
+    for those readers: a full index replaces the sidecar, and appended
+    offsets are written before the header that covers them.
+    """
+
+    def __init__(self, path, save_index=True):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.save_index = save_index
+        self.offsets = array("Q")
+        self.indexed_size = 0
+        self.size = 0
+        self.tail_crc = 0
+        self._loaded = False
+        self._file = None
+        self._map = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.offsets) + (self.size > self.indexed_size)
+
+    def tail_checksum(self, size):
+        """Checksum of the bytes just before size, used to detect rewrites"""
+        if not size:
+            return 0
+        return zlib.crc32(self._map[max(0, size - TAIL_CHECK_BYTES) : size])
+
+    def _index_matches(self):
+        """Cheaply check that the indexed prefix of the file is unchanged"""
+        if self.tail_checksum(self.indexed_size) != self.tail_crc:
+            return False
+        # Sample a few offsets: each must follow a line break
+        step = max(1, len(self.offsets) // SAMPLED_OFFSETS)
+        for offset in self.offsets[1::step]:
+            if self._map[offset - 1] != ord("\n"):
+                return False
+        return True
+
+    def _load_index(self):
+        self._loaded = True
+        try:
+            with open(self.index_path, "rb") as file:
+                magic, size, crc = HEADER.unpack(file.read(HEADER.size))
+                offsets = array("Q")
+                offsets.frombytes(file.read())
+        except (FileNotFoundError, struct.error, ValueError):
+            return
+        if magic == MAGIC:
+            # Offsets a concurrent save wrote ahead of its header
+            while offsets and offsets[-1] >= size:
+                offsets.pop()
+            self.offsets, self.indexed_size, self.tail_crc = offsets, size, crc
+
+    def _save_index(self, first_new):
+        header = HEADER.pack(MAGIC, self.indexed_size, self.tail_crc)
+        if first_new == 0 or not os.path.exists(self.index_path):
+            temp_path = self.index_path + ".tmp"
+            with open(temp_path, "wb") as file:
+                file.write(header)
+                self.offsets.tofile(file)
+            os.replace(temp_path, self.index_path)
+            return
+        # Only the new offsets and then the header need to be written
+        with open(self.index_path, "r+b") as file:
+            file.seek(HEADER.size + first_new * self.offsets.itemsize)
+            self.offsets[first_new:].tofile(file)
+            file.flush()
+            file.seek(0)
+            file.write(header)
+
+    def open(self):
+        """Refresh the offset index and map the file"""
+        if not self._loaded:
+            self._load_index()
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            self.offsets, self.indexed_size, self.size = array("Q"), 0, 0
+            return
+        size = os.fstat(self._file.fileno()).st_size
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.indexed_size > size or (
+            self.indexed_size and not self._index_matches()
+        ):
+            # File was rewritten or truncated: index it from scratch
+            self.offsets, self.indexed_size = array("Q"), 0
+
+        first_new = len(self.offsets)
+        position = self.indexed_size
+        while position < size:
+            end = self._map.find(b"\n", position)
+            if end < 0:
+                break  # Incomplete last line, picked up once it is finished
+            self.offsets.append(position)
+            position = end + 1
+
+        self.size = size
+        if position != self.indexed_size:
+            self.indexed_size = position
+            self.tail_crc = self.tail_checksum(position)
+            if self.save_index:
+                self._save_index(first_new)
+
+    def close(self):
+        """Unmap the file"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def raw_line(self, index):
+        """Return the bytes of one line, without its line break"""
+        if index < len(self.offsets):
+            start = self.offsets[index]
+        else:
+            start = self.indexed_size  # Unterminated last line
+        if index + 1 < len(self.offsets):
+            end = self.offsets[index + 1]
+        elif index + 1 == len(self.offsets):
+            end = self.indexed_size
+        else:
+            end = self.size
+        return self._map[start:end].rstrip(b"\r\n")
+
+    def raw_lines(self, start=0, stop=None):
+        """Yield (index, bytes) for lines start..stop without decoding them"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(start, stop):
+            yield index, self.raw_line(index)
+
+    def raw_range(self, start=0, stop=None):
+        """Return the bytes of lines start..stop as one block, line breaks included"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return b""
+        line_count = len(self.offsets)
+        begin = self.offsets[start] if start < line_count else self.indexed_size
+        if stop < line_count:
+            end = self.offsets[stop]
+        elif stop == line_count:
+            end = self.indexed_size
+        else:
+            end = self.size
+        return self._map[begin:end]
+
+    def lines(self, start=0, stop=None):
+        """Return decoded lines start..stop"""
+        return [raw.decode("utf-8") for _, raw in self.raw_lines(start, stop)]
@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+import time
+
+
+class MutationLog:
+    """Append-only JSON-lines log with group commit
+
+    Records are written to the OS immediately, while fsync runs on a
+    background thread that waits commit_delay seconds after the first
+    pending record so mutations landing close together share one fsync.
+    """
+
+    def __init__(self, path, commit_delay=0.01):
+        self.path = path
+        self.commit_delay = commit_delay
+        self.file = open(path, "a", encoding="utf-8")
+        self.record_count = 0
+
+        self._cond = threading.Condition()
+        self._written = 0  # sequence number of the last written record
+        self._synced = 0  # sequence number of the last fsynced record
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    @staticmethod
+    def read(path):
+        """Return all complete records of a log file (a torn last line is skipped)"""
+        records = []
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except FileNotFoundError:
+            pass
+        return records
+
+    @staticmethod
+    def write_file(path, records):
+        """Write records to a fresh log file and fsync it"""
+        with open(path, "w", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def append(self, record, wait=False):
+        """Append a record; with wait=True return only once it is on disk"""
+        with self._cond:
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.file.flush()
+            self.record_count += 1
+            self._written += 1
+            seq = self._written
+            self._cond.notify_all()
+            if wait:
+                while self._synced < seq and not self._closed:
+                    self._cond.wait()
+
+    def sync(self):
+        """Block until every appended record has been fsynced"""
+        with self._cond:
+            while self._synced < self._written and not self._closed:
+                self._cond.wait()
+
+    def replace(self, path):
+        """Atomically swap the log for an already written file at path"""
+        with self._cond:
+            self._fsync_locked()
+            self.file.close()
+            os.replace(path, self.path)
+            self.file = open(self.path, "a", encoding="utf-8")
+            self.record_count = len(self.read(self.path))
+
+    def _fsync_locked(self):
+        os.fsync(self.file.fileno())
+        self._synced = self._written
+        self._cond.notify_all()
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while self._synced == self._written and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            # Give concurrent mutations a chance to join this commit
+            time.sleep(self.commit_delay)
+            with self._cond:
+                if self._closed:
+                    return
+                self._fsync_locked()
+
+    def close(self):
+        """Flush outstanding records and stop the commit thread"""
+        with self._cond:
+            if self._closed:
+                return
+            self._fsync_locked()
+            self._closed = True
+            self._cond.notify_all()
+            self.file.close()
+        self._flusher.join()
@@ -0,0 +1,72 @@
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QGuiApplication, QIcon, QPixmap, QPixmapCache
+
+CACHE_LIMIT_KB = 32 * 1024  # Least recently used pixmaps are dropped past this
+
+_limit_set = False
+_icons = {}
+
+
+def _device_pixel_ratio():
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def _key(path, size, aspect_mode, transform, ratio):
+    size = f"{size.width()}x{size.height()}" if size is not None else "source"
+    return f"pixmap_cache|{path}|{size}|{int(aspect_mode)}|{int(transform)}|{ratio}"
+
+
+def pixmap(
+    path,
+    size=None,
+    aspect_mode=Qt.KeepAspectRatio,
+    transform=Qt.SmoothTransformation,
+    ratio=None,
+):
+    """Return the image at path, scaled to size, decoding and scaling it once
+
+    Results are shared through QPixmapCache, keyed by path, size, scaling
+    mode and device pixel ratio; the cache is capped at CACHE_LIMIT_KB and
+    evicts the least recently used pixmaps first. Scaled pixmaps are made
+    at the screen's pixel ratio so they stay sharp on high-DPI displays.
+    A null pixmap is returned when the file cannot be read.
+    """
+    global _limit_set
+    if not _limit_set:
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), CACHE_LIMIT_KB))
+        _limit_set = True
+
+    if ratio is None:
+        ratio = _device_pixel_ratio() if size is not None else 1.0
+    key = _key(path, size, aspect_mode, transform, ratio)
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+
+    result = QPixmap(path)
+    if result.isNull():
+        return result
+    if size is not None:
+        result = result.scaled(
+            QSize(round(size.width() * ratio), round(size.height() * ratio)),
+            aspect_mode,
+            transform,
+        )
+        result.setDevicePixelRatio(ratio)
+    QPixmapCache.insert(key, result)
+    return result
+
+
+def logical_size(pixmap):
+    """Return the size a pixmap from pixmap() takes up on screen"""
+    ratio = pixmap.devicePixelRatio()
+    return QSize(round(pixmap.width() / ratio), round(pixmap.height() / ratio))
+
+
+def icon(path):
+    """Return a QIcon for path, shared by every caller"""
+    cached = _icons.get(path)
+    if cached is None:
+        cached = _icons[path] = QIcon(path)
+    return cached
@@ -1,9 +1,14 @@
 from PyQt5.QtWidgets import (
-    QTableWidgetItem,
     QProgressDialog,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, QTimer, QDate, QTime
+from PyQt5.QtCore import Qt, QTimer
+from deadlines import DeadlineScheduler
+from storage import open_store
+from task_model import TaskTableModel
+from watcher import StoreWatcher
+
+LOADING_DELAY_MS = 300  # Loads finishing sooner show no loading indicator
 
 
 class LoadingManager:
@@ -16,10 +21,9 @@ class LoadingManager:
         self.table = parent_widget.taskTable
 
     def start_loading(self):
-        """Show loading animation and hide table"""
+        """Show loading animation; rows keep streaming into the table"""
         self.loading_label.show()
         self.loading_movie.start()
-        self.table.hide()
 
     def stop_loading(self):
         """Hide loading animation and show table"""
@@ -32,96 +36,160 @@ class TodoReader:
     """Static class for handling task reading operations"""
 
     @staticmethod
-    def load_tasks_to_table(table_widget, file_path, show_loading=True):
-        """Load tasks from file to table with optional loading animation"""
-        if show_loading:
-            # Create loading manager
-            loading_manager = LoadingManager(table_widget.parent())
-            loading_manager.start_loading()
-
-            # Create and show progress dialog
-            progress = QProgressDialog(
-                "Loading tasks...", None, 0, 100, table_widget.parent()
+    def load_tasks_to_table(table_view, file_path, show_loading=True):
+        """Load tasks from file to table with optional loading animation
+
+        With show_loading the file is parsed on a worker thread and rows
+        are added in batches as they arrive; the animation and progress
+        dialog only appear if loading takes longer than LOADING_DELAY_MS.
+        """
+        if not show_loading:
+            TodoReader._load_tasks_data(table_view, file_path)
+            return
+
+        table_view.setProperty("store_path", file_path)
+        watcher = TodoReader._table_watcher(table_view, file_path)
+
+        # Create loading manager
+        loading_manager = LoadingManager(table_view.parent())
+        delay = QTimer(table_view.parent())
+        delay.setSingleShot(True)
+        delay.timeout.connect(loading_manager.start_loading)
+        delay.start(LOADING_DELAY_MS)
+
+        # Progress dialog showing the share of the file read so far
+        progress = QProgressDialog(
+            "Loading tasks...", None, 0, 100, table_view.parent()
+        )
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(LOADING_DELAY_MS)
+        progress.setAutoClose(True)
+        progress.setValue(0)
+
+        def show_error(message):
+            QMessageBox.critical(
+                table_view.parent(), "Error", f"Error loading tasks: {message}"
             )
-            progress.setWindowModality(Qt.WindowModal)
-            progress.setAutoClose(True)
-            progress.setValue(0)
-
-            # Timer to simulate loading and update progress
-            timer = QTimer(table_widget.parent())
-            progress_value = 0
-
-            def update_progress():
-                nonlocal progress_value
-                progress_value += 20
-                progress.setValue(progress_value)
-
-                if progress_value >= 100:
-                    timer.stop()
-                    TodoReader._load_tasks_data(table_widget, file_path)
-                    progress.close()
-                    loading_manager.stop_loading()
-
-            timer.timeout.connect(update_progress)
-            timer.start(200)  # Update every 200ms
-        else:
-            TodoReader._load_tasks_data(table_widget, file_path)
+
+        def finish():
+            watcher.progress.disconnect(progress.setValue)
+            watcher.failed.disconnect(show_error)
+            watcher.loaded.disconnect(finish)
+            delay.stop()
+            delay.deleteLater()
+            progress.close()
+            loading_manager.stop_loading()
+
+        watcher.progress.connect(progress.setValue)
+        watcher.failed.connect(show_error)
+        watcher.loaded.connect(finish)
+        watcher.load_async()
 
     @staticmethod
-    def _load_tasks_data(table_widget, file_path):
-        """Load task data from file into table widget"""
+    def _load_tasks_data(table_view, file_path):
+        """Load task data from file into the table view and follow the file"""
         try:
-            table_widget.setRowCount(0)  # Clear existing rows first
-            with open(file_path, "r", encoding="utf-8") as file:
-                tasks = file.readlines()  # Read all tasks first
-
-                for line in tasks:
-                    data = line.strip().split(" | ")
-                    if len(data) == 6:  # Changed to 6 for start_time
-                        row = table_widget.rowCount()
-                        table_widget.insertRow(row)
-                        for col, value in enumerate(data):
-                            item = QTableWidgetItem(value)
-                            table_widget.setItem(row, col, item)
-
-        except FileNotFoundError:
-            open(file_path, "w").close()
+            table_view.setProperty("store_path", file_path)
+            TodoReader._table_watcher(table_view, file_path).start()
         except Exception as e:
             QMessageBox.critical(
-                table_widget.parent(), "Error", f"Error loading tasks: {e}"
+                table_view.parent(), "Error", f"Error loading tasks: {e}"
             )
 
     @staticmethod
-    def get_selected_task_data(table_widget):
+    def _table_watcher(table_view, file_path):
+        """Get the watcher that keeps a table in sync with its store"""
+        store = open_store(file_path)
+        watcher = table_view.findChild(StoreWatcher)
+        if watcher is not None and watcher.store is store:
+            return watcher
+        if watcher is not None:
+            watcher.setParent(None)
+            watcher.deleteLater()
+
+        watcher = StoreWatcher(store, table_view)
+        model = TodoReader.get_model(table_view)
+        watcher.reloaded.connect(model.set_tasks)
+        watcher.appended.connect(model.append_tasks)
+        return watcher
+
+    @staticmethod
+    def refresh_table(table_view):
+        """Pick up changes to the table's store, reading only appended lines"""
+        watcher = table_view.findChild(StoreWatcher)
+        if watcher is None:
+            TodoReader._load_tasks_data(table_view, table_view.property("store_path"))
+        else:
+            watcher.poll()
+
+    @staticmethod
+    def get_model(table_view):
+        """Get the TaskTableModel of a table view, creating it if needed"""
+        model = table_view.model()
+        if not isinstance(model, TaskTableModel):
+            model = TaskTableModel(table_view)
+            table_view.setModel(model)
+        return model
+
+    @staticmethod
+    def get_store(table_view):
+        """Get the store the table was loaded from"""
+        return open_store(table_view.property("store_path"))
+
+    @staticmethod
+    def delete_row(table_view, row):
+        """Delete the task of a row from the store and the table
+
+        Ids that the delete shifted (see TaskStore.renumbered) are updated
+        in the table at once.
+        """
+        model = TodoReader.get_model(table_view)
+        store = TodoReader.get_store(table_view)
+        task_id = model.task_id(row)
+        store.delete(task_id)
+        model.remove_row(row)
+        model.renumber(lambda other: store.renumbered(task_id, other), task_id)
+
+    @staticmethod
+    def get_task_data(table_view, row):
+        """Get data of the task shown in the given row"""
+        return TodoReader.get_model(table_view).task(row)
+
+    @staticmethod
+    def get_selected_row(table_view):
+        """Get the selected row, or -1 when nothing is selected"""
+        return table_view.currentIndex().row()
+
+    @staticmethod
+    def get_selected_task_data(table_view):
         """Get data of the currently selected task"""
-        selected = table_widget.currentRow()
+        selected = TodoReader.get_selected_row(table_view)
         if selected >= 0:
-            return {
-                "name": table_widget.item(selected, 0).text(),
-                "description": table_widget.item(selected, 1).text(),
-                "start_time": table_widget.item(selected, 2).text(),
-                "deadline": table_widget.item(selected, 3).text(),
-                "priority": table_widget.item(selected, 4).text(),
-                "status": table_widget.item(selected, 5).text(),
-            }
+            return TodoReader.get_task_data(table_view, selected)
         return None
 
     @staticmethod
-    def check_past_deadline_tasks(table_widget, mark_failed_callback):
-        """Check and mark tasks that are past their deadline"""
-        for row in range(table_widget.rowCount()):
-            deadline_str = table_widget.item(
-                row, 3
-            ).text()  # Updated index for deadline
-            deadline_date = QDate.fromString(deadline_str.split()[0], "yyyy-MM-dd")
-            deadline_time = QTime.fromString(deadline_str.split()[1], "HH:mm")
-            current_date = QDate.currentDate()
-            current_time = QTime.currentTime()
-
-            if (deadline_date < current_date) or (
-                deadline_date == current_date and deadline_time < current_time
-            ):
-                if (
-                    table_widget.item(row, 5).text() == "due"
-                ):  # Updated index for status
-                    mark_failed_callback(row)
+    def check_past_deadline_tasks(table_view, mark_failed_callback):
+        """Mark tasks that are past their deadline, now and as deadlines pass
+
+        The first call attaches a DeadlineScheduler to the table's model;
+        mark_failed_callback(rows) is then called with the rows of the due
+        tasks whose deadline has just passed, all of them in one call (see
+        TodoUpdater.mark_tasks_as_failed), without scanning the table again.
+        """
+        model = TodoReader.get_model(table_view)
+        scheduler = model.findChild(DeadlineScheduler)
+        if scheduler is None:
+            scheduler = DeadlineScheduler(model, model)
+            scheduler.expired.connect(
+                lambda task_ids: TodoReader._mark_expired(
+                    model, task_ids, mark_failed_callback
+                )
+            )
+        scheduler.check_now()
+
+    @staticmethod
+    def _mark_expired(model, task_ids, mark_failed_callback):
+        rows = sorted(model.rows_of(task_ids).values())
+        if rows:
+            mark_failed_callback(rows)
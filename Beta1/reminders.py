@@ -0,0 +1,274 @@
+import json
+import math
+import os
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from deadlines import deadline_epoch
+from timer_wheel import TimerWheel
+
+# Lead times offered for each task, in seconds before the deadline
+LEAD_CHOICES = {"1 day": 24 * 3600, "1 hour": 3600, "10 min": 600}
+DEFAULT_LEADS = (24 * 3600, 3600, 600)
+
+
+def leads_path(path):
+    """Sidecar holding per-task lead times (tasks.txt -> tasks.reminders.json)"""
+    return os.path.splitext(path)[0] + ".reminders.json"
+
+
+def lead_key(task):
+    """Key of a task's lead times: its name, start time and deadline
+
+    Store ids do not survive a rewrite (text stores number lines, and
+    SqliteTaskStore.replace_all numbers rows afresh), so lead times follow
+    what the task is instead. Tasks alike in all three share lead times.
+    """
+    return task["name"], task["start_time"], task["deadline"]
+
+
+def lead_text(seconds):
+    """Format a time span to the minute, e.g. 3600 -> "1 hour" """
+    minutes = max(1, round(seconds / 60))
+    for label, lead in LEAD_CHOICES.items():
+        if lead == minutes * 60:
+            return label
+    if minutes < 60:
+        return f"{minutes} min"
+    if minutes < 24 * 60:
+        return f"{minutes // 60} h {minutes % 60:02d} min"
+    return f"{minutes // (24 * 60)} days"
+
+
+def describe(notification):
+    """One line of text for a notification"""
+    left = deadline_epoch(notification["deadline"]) - notification["time"]
+    return (
+        f"{notification['name']} is due in {lead_text(left)} "
+        f"({notification['deadline']})"
+    )
+
+
+class ReminderEngine(QObject):
+    """Remind about due tasks of a TaskTableModel ahead of their deadline
+
+    Each due task gets one timer per lead time (DEFAULT_LEADS unless set
+    with set_leads(), see lead_key()) in a TimerWheel ticking once a second, so hundreds
+    of thousands of pending reminders cost O(1) per tick. Like the
+    DeadlineScheduler the engine follows the model's signals; tasks that
+    are completed, failed or removed lose their reminders. A reminder
+    whose time passed while the app was closed fires once on startup if
+    the deadline is still ahead.
+    """
+
+    # Notification dicts: task_id, name, deadline, lead (seconds), time
+    reminded = pyqtSignal(list)
+
+    TICK_MS = 1000
+
+    def __init__(self, model, path, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.path = leads_path(path)
+        self.leads = self._read_leads()
+        self.wheel = TimerWheel(int(time.time()))
+        self._tasks = {}  # task id -> (name, deadline) of scheduled tasks
+        self._keys = {}  # task id -> its (task id, lead) timer keys
+        self._fired = set()  # Keys already shown this session
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.TICK_MS)
+        self._timer.timeout.connect(self._tick)
+
+        model.modelReset.connect(self._on_reset)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        model.idsRenumbered.connect(self._on_ids_renumbered)
+        self._on_reset()
+
+    def _read_leads(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return {
+                    tuple(key): tuple(leads)
+                    for key, leads in json.load(file)
+                    if isinstance(key, list) and len(key) == 3
+                }
+        except (FileNotFoundError, ValueError, TypeError):
+            return {}
+
+    def _write_leads(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            # Pairs rather than an object since the keys are tuples
+            pairs = [[list(key), list(leads)] for key, leads in self.leads.items()]
+            json.dump(pairs, file)
+        os.replace(temp_path, self.path)
+
+    def _row_key(self, row):
+        value = self.model.value
+        return value(row, "name"), value(row, "start_time"), value(row, "deadline")
+
+    def leads_for(self, task):
+        """Return the lead times of a task dict, in seconds"""
+        return self.leads.get(lead_key(task), DEFAULT_LEADS)
+
+    def set_leads(self, task, leads, previous=None):
+        """Choose when a task is reminded about, e.g. (3600, 600)
+
+        previous is the task as it was before an edit, whose lead times
+        are dropped. A task with an id that has a row is rescheduled.
+        """
+        if previous is not None:
+            self.leads.pop(lead_key(previous), None)
+        self.leads[lead_key(task)] = tuple(sorted(set(leads), reverse=True))
+        self._write_leads()
+        rows = self.model.rows_of([task.get("id")])
+        if task.get("id") in rows:
+            self._schedule_row(rows[task["id"]])
+            self._update_timer()
+
+    def _cancel(self, task_id):
+        for key in self._keys.pop(task_id, ()):
+            self.wheel.cancel(key)
+        self._tasks.pop(task_id, None)
+
+    def _schedule_row(self, row, now=None):
+        task_id = self.model.task_id(row)
+        previous = self._tasks.get(task_id)
+        self._cancel(task_id)
+        if self.model.value(row, "status") != "due":
+            return
+        name = self.model.value(row, "name")
+        deadline = self.model.value(row, "deadline")
+        epoch = deadline_epoch(deadline)
+        if epoch is None:
+            return
+        leads = self.leads.get(self._row_key(row), DEFAULT_LEADS)  # See lead_key()
+        if previous is not None and previous[1] != deadline:
+            # A new deadline gets every reminder again
+            self._fired.difference_update((task_id, lead) for lead in leads)
+        self._tasks[task_id] = (name, deadline)
+
+        now = time.time() if now is None else now
+        if not len(self.wheel):
+            self.wheel.advance(int(now))  # Catch up on the ticks spent idle
+        keys = []
+        missed = None
+        for lead in leads:
+            key = (task_id, lead)
+            if key in self._fired:
+                continue
+            at = epoch - lead
+            if at > now:
+                self.wheel.add(key, math.ceil(at))
+                keys.append(key)
+            elif epoch > now and (missed is None or lead < missed[1]):
+                missed = key
+        if missed is not None:
+            # Only the closest reminder that was missed, on the next tick
+            self.wheel.add(missed, 0)
+            keys.append(missed)
+        if keys:
+            self._keys[task_id] = keys
+
+    def _update_timer(self):
+        if not len(self.wheel):
+            self._timer.stop()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def _on_ids_renumbered(self, changes):
+        """Keep the reminders already shown with their tasks as ids shift"""
+        self._fired = {
+            (changes.get(task_id, task_id), lead)
+            for task_id, lead in self._fired
+            if changes.get(task_id, task_id) is not None
+        }
+
+    def _on_reset(self):
+        self.wheel.clear()
+        self._tasks.clear()
+        self._keys.clear()
+        now = time.time()
+        for row in range(self.model.rowCount()):
+            self._schedule_row(row, now)
+        self._update_timer()
+
+    def _on_rows_inserted(self, parent, first, last):
+        now = time.time()
+        for row in range(first, last + 1):
+            self._schedule_row(row, now)
+        self._update_timer()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        # Rows are only removed when their task is deleted
+        dropped = False
+        for row in range(first, last + 1):
+            self._cancel(self.model.task_id(row))
+            dropped |= self.leads.pop(self._row_key(row), None) is not None
+        if dropped:
+            self._write_leads()
+        self._update_timer()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        now = time.time()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._schedule_row(row, now)
+        self._update_timer()
+
+    def _tick(self):
+        now = time.time()
+        notifications = []
+        for key in self.wheel.advance(int(now)):
+            task_id, lead = key
+            self._fired.add(key)
+            keys = self._keys[task_id]
+            keys.remove(key)
+            if not keys:
+                del self._keys[task_id]
+            name, deadline = self._tasks[task_id]
+            notifications.append(
+                {
+                    "task_id": task_id,
+                    "name": name,
+                    "deadline": deadline,
+                    "lead": lead,
+                    "time": now,
+                }
+            )
+        self._update_timer()
+        if notifications:
+            self.reminded.emit(notifications)
+
+
+class NotificationCenter(QObject):
+    """The latest reminders and how many of them have not been seen"""
+
+    changed = pyqtSignal()
+
+    MAX_NOTIFICATIONS = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.notifications = deque(maxlen=self.MAX_NOTIFICATIONS)  # Newest first
+        self.unread = 0
+
+    def add(self, notifications):
+        for notification in notifications:
+            self.notifications.appendleft(notification)
+        self.unread = min(self.unread + len(notifications), self.MAX_NOTIFICATIONS)
+        self.changed.emit()
+
+    def mark_all_read(self):
+        if self.unread:
+            self.unread = 0
+            self.changed.emit()
+
+    def clear(self):
+        self.notifications.clear()
+        self.unread = 0
+        self.changed.emit()
@@ -0,0 +1,230 @@
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+from PyQt5.QtCore import QResource
+
+import pixmap_cache
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+QRC_PATH = os.path.join(HERE, "icons.qrc")
+RCC_PATH = os.path.join(HERE, "icons.rcc")
+ICON_PREFIX = ":/icons/icons/"  # The tree the old icons_rc.py registered
+
+# Binary layout written by `rcc -binary` (format version 2)
+RCC_MAGIC = b"qres"
+RCC_VERSION = 2
+DIRECTORY_FLAG = 0x02
+LANGUAGE_C = 1
+
+_registered = None
+
+
+def qt_hash(name):
+    """Hash Qt uses to look up resource names (qt_hash in qhash.cpp)"""
+    h = 0
+    for char in name:
+        h = (h << 4) + ord(char)
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+def read_qrc(qrc_path=QRC_PATH):
+    """Return {resource name: file path} for the files listed in a .qrc"""
+    base = os.path.dirname(qrc_path)
+    files = {}
+    for resource in ET.parse(qrc_path).getroot().iter("qresource"):
+        prefix = resource.get("prefix", "/").strip("/")
+        for entry in resource.iter("file"):
+            path = entry.text.strip()
+            alias = entry.get("alias") or path
+            name = "/".join(part for part in (prefix, alias) if part)
+            files[name] = os.path.join(base, path)
+    return files
+
+
+def compile_resources(files):
+    """Return the tree, data and names blobs for {resource name: file path}
+
+    Entries are stored breadth first with the children of a directory next
+    to each other, sorted by qt_hash, which is what Qt's lookup expects.
+    """
+    root = {}
+    for name, path in files.items():
+        node = root
+        *directories, leaf = name.split("/")
+        for directory in directories:
+            node = node.setdefault(directory, {})
+        node[leaf] = path
+
+    order = [("", root)]
+    first_child = {}
+    index = 0
+    while index < len(order):
+        node = order[index][1]
+        if isinstance(node, dict):
+            first_child[index] = len(order)
+            order.extend(sorted(node.items(), key=lambda item: qt_hash(item[0])))
+        index += 1
+
+    tree = bytearray()
+    data = bytearray()
+    names = bytearray()
+    name_offsets = {"": 0}  # Each distinct name is stored once
+    for index, (name, node) in enumerate(order):
+        name_offset = name_offsets.get(name)
+        if name_offset is None:
+            name_offset = name_offsets[name] = len(names)
+            encoded = name.encode("utf-16-be")
+            names += struct.pack(">HI", len(encoded) // 2, qt_hash(name)) + encoded
+        if isinstance(node, dict):
+            tree += struct.pack(
+                ">IHII", name_offset, DIRECTORY_FLAG, len(node), first_child[index]
+            )
+        else:
+            with open(node, "rb") as f:
+                content = f.read()
+            tree += struct.pack(">IHHHI", name_offset, 0, 0, LANGUAGE_C, len(data))
+            data += struct.pack(">I", len(content)) + content
+        tree += struct.pack(">Q", 0)  # Last modified; 0 keeps builds reproducible
+    return bytes(tree), bytes(data), bytes(names)
+
+
+def build(qrc_path=QRC_PATH, rcc_path=RCC_PATH):
+    """Write the binary resource bundle for a .qrc, like `rcc -binary`"""
+    tree, data, names = compile_resources(read_qrc(qrc_path))
+    header_size = len(RCC_MAGIC) + 16
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = RCC_MAGIC + struct.pack(
+        ">IIII", RCC_VERSION, tree_offset, data_offset, names_offset
+    )
+    # Replace rather than overwrite: a running app may have the old file mapped
+    tmp_path = rcc_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header + data + names + tree)
+    os.replace(tmp_path, rcc_path)
+
+
+def _stale(qrc_path=QRC_PATH, rcc_path=RCC_PATH):
+    if not os.path.exists(rcc_path):
+        return True
+    built = os.path.getmtime(rcc_path)
+    sources = [qrc_path, *read_qrc(qrc_path).values()]
+    return any(os.path.getmtime(path) > built for path in sources)
+
+
+def register():
+    """Register the icon bundle with Qt once; returns whether it is available
+
+    Qt maps the .rcc file into memory instead of copying it, so icons cost
+    nothing until they are drawn. The bundle is rebuilt first when the .qrc
+    or one of its files is newer.
+    """
+    global _registered
+    if _registered is None:
+        try:
+            if _stale():
+                build()
+        except OSError:
+            pass  # Read-only install: use the bundle that is there, if any
+        _registered = os.path.exists(RCC_PATH) and QResource.registerResource(
+            RCC_PATH
+        )
+    return _registered
+
+
+def icon_path(name):
+    """Return the path of an icon by name, e.g. "today" or "logo"
+
+    Paths point into the registered bundle, or at the loose files listed in
+    the .qrc if it could not be registered.
+    """
+    if register():
+        return f"{ICON_PREFIX}{name}.png"
+    return read_qrc()[f"{ICON_PREFIX[2:]}{name}.png"]
+
+
+def icon(name):
+    """Return the shared QIcon for an icon name"""
+    return pixmap_cache.icon(icon_path(name))
+
+
+def pixmap(name, size=None):
+    """Return an icon by name as a QPixmap, optionally scaled to fit size"""
+    return pixmap_cache.pixmap(icon_path(name), size)
+
+
+def _python_module(files):
+    """Source of the pyrcc5-style module the bundle replaced, for _compare()"""
+    tree, data, names = compile_resources(files)
+
+    def literal(blob):
+        lines = (
+            "".join(f"\\x{byte:02x}" for byte in blob[start : start + 16])
+            for start in range(0, len(blob), 16)
+        )
+        return 'b"\\\n' + "\\\n".join(lines) + '\\\n"'
+
+    return (
+        "from PyQt5 import QtCore\n\n"
+        f"qt_resource_data = {literal(data)}\n\n"
+        f"qt_resource_name = {literal(names)}\n\n"
+        f"qt_resource_struct = {literal(tree)}\n\n"
+        "QtCore.qRegisterResourceData(\n"
+        f"    {RCC_VERSION}, qt_resource_struct, qt_resource_name, qt_resource_data\n"
+        ")\n"
+    )
+
+
+def _measure(setup):
+    """Run setup in a fresh interpreter; return (seconds, max RSS growth in KiB)"""
+    script = (
+        "import resource, time\n"
+        "from PyQt5.QtCore import QFile, QResource\n"
+        "before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "started = time.perf_counter()\n"
+        f"{setup}\n"
+        f"icon = QFile('{ICON_PREFIX}today.png')\n"
+        "icon.open(QFile.ReadOnly)\n"
+        "icon.readAll()\n"
+        "elapsed = time.perf_counter() - started\n"
+        "after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "print(elapsed, after - before)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def _compare(runs=5):
+    """Compare importing an icons_rc-style module with registering the .rcc"""
+    build()
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "icons_rc.py"), "w") as f:
+            f.write(_python_module(read_qrc()))
+        module = f"import sys; sys.path.insert(0, {directory!r}); import icons_rc"
+        _measure(module)  # Compile it once so the runs below load the .pyc
+        cases = [
+            ("icons_rc.py import", module),
+            (".rcc register", f"QResource.registerResource({RCC_PATH!r})"),
+        ]
+        for label, setup in cases:
+            results = [_measure(setup) for _ in range(runs)]
+            seconds = min(result[0] for result in results)
+            rss = min(result[1] for result in results)
+            print(f"{label:>20}: {seconds * 1000:.1f} ms, +{rss} KiB max RSS")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["compare"]:
+        _compare()
+    else:
+        build()
+        print(f"Wrote {RCC_PATH}")
@@ -0,0 +1,241 @@
+import random
+import re
+import sys
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import accumulate, compress, islice
+
+WORD = re.compile(r"\w+")
+PREFIX_POSTINGS = 2  # Prefixes up to this length keep their own id sets
+FUZZY_MIN_LENGTH = 4  # Shorter query words are only matched by prefix
+FIELDS = ("name", "description")
+
+_EMPTY = frozenset()
+
+
+def tokenize(text):
+    """Split text into lowercase words"""
+    return WORD.findall(text.lower())
+
+
+def trigrams(word):
+    padded = f"${word}"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _within_one_edit(a, b):
+    """Whether one substitution, insertion, deletion or swap turns a into b"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    shortest = min(len(a), len(b))
+    while i < shortest and a[i] == b[i]:
+        i += 1
+    if len(a) > len(b):
+        return a[i + 1 :] == b[i:]
+    if len(a) < len(b):
+        return a[i:] == b[i + 1 :]
+    if a[i + 1 :] == b[i + 1 :]:
+        return True
+    # Neighbouring letters swapped
+    return (
+        a[i + 1 : i + 2] == b[i : i + 1]
+        and a[i] == b[i + 1]
+        and a[i + 2 :] == b[i + 2 :]
+    )
+
+
+class SearchIndex:
+    """In-memory inverted index over task names and descriptions
+
+    Each word maps to the ids of the tasks that contain it; the sorted
+    vocabulary answers prefix queries and a trigram index over it finds
+    words a typo away. Tasks are added, updated and removed one at a time,
+    so the index never has to be rebuilt after the initial load.
+    """
+
+    def __init__(self):
+        self._words = {}  # task id -> set of its words
+        self._postings = {}  # word -> task ids
+        self._prefixes = {}  # prefix of up to PREFIX_POSTINGS letters -> task ids
+        self._vocabulary = []  # Sorted words
+        self._trigrams = {}  # trigram -> words containing it
+        self._cache = {}  # query word -> task ids, until the index changes
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, task_id):
+        return task_id in self._words
+
+    def add(self, task_id, task):
+        """Index a task dict under its id, replacing what it had before"""
+        if task_id in self._words:
+            self.remove(task_id)
+        words = set()
+        for field in FIELDS:
+            words.update(tokenize(task.get(field, "")))
+        self._words[task_id] = words
+        self._cache.clear()
+
+        prefixes = set()
+        for word in words:
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = set()
+                self._add_word(word)
+            ids.add(task_id)
+            prefixes.update(word[:length] for length in range(1, PREFIX_POSTINGS + 1))
+        for prefix in prefixes:
+            self._prefixes.setdefault(prefix, set()).add(task_id)
+
+    def remove(self, task_id):
+        """Drop a task from the index; unknown ids are ignored"""
+        words = self._words.pop(task_id, None)
+        if words is None:
+            return
+        self._cache.clear()
+        for word in words:
+            ids = self._postings[word]
+            ids.discard(task_id)
+            if not ids:
+                del self._postings[word]
+                self._remove_word(word)
+            for length in range(1, PREFIX_POSTINGS + 1):
+                ids = self._prefixes.get(word[:length])
+                if ids is not None:
+                    ids.discard(task_id)
+                    if not ids:
+                        del self._prefixes[word[:length]]
+
+    def clear(self):
+        self.__init__()
+
+    def _add_word(self, word):
+        insort(self._vocabulary, word)
+        for gram in trigrams(word):
+            self._trigrams.setdefault(gram, set()).add(word)
+
+    def _remove_word(self, word):
+        del self._vocabulary[bisect_left(self._vocabulary, word)]
+        for gram in trigrams(word):
+            words = self._trigrams[gram]
+            words.discard(word)
+            if not words:
+                del self._trigrams[gram]
+
+    def search(self, query):
+        """Return the ids of tasks matching every word of query
+
+        None means the query has no words, i.e. nothing is filtered out.
+        The set returned may be shared with the index: read it, don't
+        change it, and search again once the index has changed.
+        """
+        words = set(tokenize(query))
+        if not words:
+            return None
+        result = None
+        # Longest words first: they usually match the fewest tasks
+        for word in sorted(words, key=len, reverse=True):
+            ids = self._match(word)
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def _match(self, word):
+        if len(word) <= PREFIX_POSTINGS:
+            return self._prefixes.get(word, _EMPTY)
+        ids = self._cache.get(word)
+        if ids is None:
+            ids = set()
+            for term in self._prefixed(word):
+                ids |= self._postings[term]
+            if len(word) >= FUZZY_MIN_LENGTH:
+                for term in self._near(word):
+                    ids |= self._postings[term]
+            self._cache[word] = ids
+        return ids
+
+    def _prefixed(self, word):
+        """Words of the vocabulary starting with word"""
+        upper = word[:-1] + chr(ord(word[-1]) + 1)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, word)
+        return vocabulary[start : bisect_left(vocabulary, upper, start)]
+
+    def _near(self, word):
+        """Words whose start is one typo away from word"""
+        grams = trigrams(word)
+        needed = max(1, len(grams) - 3)  # One typo changes up to three trigrams
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._trigrams.get(gram, ()))
+        size = len(word)
+        return [
+            term
+            for term, count in shared.items()
+            if count >= needed
+            and not term.startswith(word)
+            and (
+                _within_one_edit(word, term[:size])
+                or _within_one_edit(word, term[: size + 1])
+                or _within_one_edit(word, term[: size - 1])
+            )
+        ]
+
+
+def _benchmark(task_count, page=50):
+    """Time each keystroke of a few queries typed into a large index
+
+    Each keystroke runs the search and finds the first page of matching
+    rows, which is what TaskFilterModel does before the list repaints.
+    """
+    rng = random.Random(1)
+    letters = "etaoinshrdlucmfwypvbgkjqxz"
+    common = ["report", "meeting", "budget", "review", "write", "plan", "call"]
+    vocabulary = common + [
+        "".join(rng.choices(letters, weights=range(26, 0, -1), k=rng.randint(3, 9)))
+        for _ in range(20000)
+    ]
+    # Zipf-like word frequencies
+    weights = list(accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def text(count):
+        return " ".join(rng.choices(vocabulary, cum_weights=weights, k=count))
+
+    tasks = [{"name": text(3), "description": text(8)} for _ in range(task_count)]
+
+    index = SearchIndex()
+    started = time.perf_counter()
+    for task_id, task in enumerate(tasks):
+        index.add(task_id, task)
+    elapsed = time.perf_counter() - started
+    print(f"{task_count} tasks indexed in {elapsed:.1f}s")
+    ids = list(range(task_count))
+
+    for query in ["report plan", "meeting budget", "wrtie", "reveiw call"]:
+        slowest = 0
+        for end in range(1, len(query) + 1):
+            started = time.perf_counter()
+            matches = index.search(query[:end])
+            if matches is not None:
+                rows = compress(range(len(ids)), map(matches.__contains__, ids))
+                list(islice(rows, page))
+            slowest = max(slowest, time.perf_counter() - started)
+        print(
+            f"{query!r:>16}: {len(matches)} matches, "
+            f"slowest keystroke {slowest * 1000:.1f} ms"
+        )
+
+    started = time.perf_counter()
+    for task_id in range(1000):
+        index.add(task_id, tasks[-1 - task_id])
+    print(f"1000 edits: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
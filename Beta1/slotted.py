@@ -0,0 +1,220 @@
+import os
+import struct
+import sys
+import threading
+
+from codec import decode
+
+# Inline width in bytes of each field, in column order; longer values go to
+# the overflow file
+FIELD_WIDTHS = {
+    "name": 48,
+    "description": 64,
+    "start_time": 16,
+    "deadline": 16,
+    "priority": 12,
+    "status": 48,
+    "username": 32,
+}
+
+MAGIC = b"YTSLOT01"
+HEADER = struct.Struct("<8sIIi")  # magic, slot size, slot count, free list head
+HEADER_SIZE = 64
+SLOT_PREFIX = struct.Struct("<Bi")  # used flag, next free slot
+OVERFLOW_REF = struct.Struct("<QI")  # offset and length in the overflow file
+OVERFLOW_MARK = 255
+
+
+def _build_layout():
+    offsets = {}
+    offset = SLOT_PREFIX.size
+    for key in FIELD_WIDTHS:
+        offsets[key] = offset
+        offset += 1 + FIELD_WIDTHS[key]  # length byte + inline bytes
+    return offsets, offset
+
+
+FIELD_OFFSETS, SLOT_SIZE = _build_layout()
+
+
+class SlottedFile:
+    """Fixed-size slot file with a free list and out-of-line overflow
+
+    Every record occupies one SLOT_SIZE slot, so a single field such as the
+    status can be rewritten in place. Deleted slots are chained into a free
+    list and reused, and values wider than their inline field are appended
+    to a companion ".ovf" file and referenced by offset.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.overflow_path = path + ".ovf"
+        self._lock = threading.Lock()
+        if not os.path.exists(path):
+            with open(path, "wb") as file:
+                header = HEADER.pack(MAGIC, SLOT_SIZE, 0, -1)
+                file.write(header.ljust(HEADER_SIZE, b"\0"))
+        self.file = open(path, "r+b")
+        self.overflow = open(self.overflow_path, "a+b")
+
+        magic, slot_size, self.slot_count, self.free_head = HEADER.unpack(
+            self.file.read(HEADER.size)
+        )
+        if magic != MAGIC or slot_size != SLOT_SIZE:
+            raise ValueError(f"{path} is not a task slot file")
+
+    def _pwrite(self, offset, data):
+        self.file.seek(offset)
+        self.file.write(data)
+
+    def _pread(self, offset, size):
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def _slot_offset(self, slot):
+        return HEADER_SIZE + slot * SLOT_SIZE
+
+    def _write_header(self):
+        header = HEADER.pack(MAGIC, SLOT_SIZE, self.slot_count, self.free_head)
+        self._pwrite(0, header)
+
+    def _encode_field(self, key, value):
+        data = value.encode("utf-8")
+        width = FIELD_WIDTHS[key]
+        if len(data) <= width:
+            return bytes([len(data)]) + data.ljust(width, b"\0")
+        self.overflow.seek(0, os.SEEK_END)
+        ref = OVERFLOW_REF.pack(self.overflow.tell(), len(data))
+        self.overflow.write(data)
+        self.overflow.flush()
+        return bytes([OVERFLOW_MARK]) + ref.ljust(width, b"\0")
+
+    def _decode_field(self, raw):
+        length = raw[0]
+        if length != OVERFLOW_MARK:
+            return raw[1 : 1 + length].decode("utf-8")
+        offset, length = OVERFLOW_REF.unpack_from(raw, 1)
+        self.overflow.seek(offset)
+        return self.overflow.read(length).decode("utf-8")
+
+    def _encode(self, task):
+        fields = b"".join(
+            self._encode_field(key, task.get(key, "")) for key in FIELD_WIDTHS
+        )
+        return SLOT_PREFIX.pack(1, -1) + fields
+
+    def _decode(self, raw):
+        task = {}
+        for key, width in FIELD_WIDTHS.items():
+            start = FIELD_OFFSETS[key]
+            task[key] = self._decode_field(raw[start : start + 1 + width])
+        return task
+
+    def read(self, slot):
+        """Return the task stored in a slot, or None for a free slot"""
+        with self._lock:
+            raw = self._pread(self._slot_offset(slot), SLOT_SIZE)
+            if not raw or raw[0] == 0:
+                return None
+            return self._decode(raw)
+
+    def records(self):
+        """Return (slot, task) pairs for every used slot in slot order"""
+        records = []
+        with self._lock:
+            data = self._pread(HEADER_SIZE, self.slot_count * SLOT_SIZE)
+            for slot in range(self.slot_count):
+                raw = data[slot * SLOT_SIZE : (slot + 1) * SLOT_SIZE]
+                if raw[0]:
+                    records.append((slot, self._decode(raw)))
+        return records
+
+    def append(self, task):
+        """Store a task in a free slot (or a new one) and return the slot"""
+        with self._lock:
+            if self.free_head >= 0:
+                slot = self.free_head
+                prefix = self._pread(self._slot_offset(slot), SLOT_PREFIX.size)
+                self.free_head = SLOT_PREFIX.unpack(prefix)[1]
+            else:
+                slot = self.slot_count
+                self.slot_count += 1
+            self._pwrite(self._slot_offset(slot), self._encode(task))
+            self._write_header()
+            self.file.flush()
+        return slot
+
+    def write(self, slot, task):
+        """Overwrite the task stored in a used slot"""
+        with self._lock:
+            self._pwrite(self._slot_offset(slot), self._encode(task))
+            self.file.flush()
+
+    def write_field(self, slot, key, value):
+        """Rewrite a single field of a slot in place"""
+        with self._lock:
+            offset = self._slot_offset(slot) + FIELD_OFFSETS[key]
+            self._pwrite(offset, self._encode_field(key, value))
+            self.file.flush()
+
+    def free(self, slot):
+        """Release a slot and push it onto the free list
+
+        Freeing a slot that is not in use raises ValueError: pushing it on
+        the free list twice would later hand it to two records.
+        """
+        with self._lock:
+            raw = self._pread(self._slot_offset(slot), SLOT_PREFIX.size)
+            if not 0 <= slot < self.slot_count or not raw or raw[0] == 0:
+                raise ValueError(f"slot {slot} is not in use")
+            prefix = SLOT_PREFIX.pack(0, self.free_head)
+            self._pwrite(self._slot_offset(slot), prefix)
+            self.free_head = slot
+            self._write_header()
+            self.file.flush()
+
+    def clear(self):
+        """Drop every record and the overflow data"""
+        with self._lock:
+            self.slot_count = 0
+            self.free_head = -1
+            self.file.truncate(HEADER_SIZE)
+            self._write_header()
+            self.file.flush()
+            self.overflow.truncate(0)
+
+    def close(self):
+        self.file.close()
+        self.overflow.close()
+
+
+def convert_text_file(text_path, slot_path):
+    """Convert a " | " separated task file into a slot file
+
+    The slot file is built under a temporary name and renamed into place,
+    so an interrupted conversion never leaves a partial file behind that
+    would be taken for a finished one.
+    """
+    temp_path = slot_path + ".tmp"
+    slots = SlottedFile(temp_path)
+    try:
+        slots.clear()
+        with open(text_path, "r", encoding="utf-8") as file:
+            for line in file:
+                task = decode(line)
+                if task is not None:
+                    slots.append(task)
+        os.fsync(slots.file.fileno())
+        os.fsync(slots.overflow.fileno())
+    finally:
+        slots.close()
+    # The slot file appears last: its existence marks a finished conversion
+    os.replace(slots.overflow_path, slot_path + ".ovf")
+    os.replace(temp_path, slot_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python slotted.py <tasks.txt> <tasks.slots>")
+        sys.exit(1)
+    convert_text_file(sys.argv[1], sys.argv[2])
@@ -0,0 +1,1129 @@
+import json
+import os
+import sqlite3
+import threading
+import urllib.parse
+import zlib
+
+from block_index import BlockIndex
+from codec import SEPARATOR, TASK_FIELDS, decode, decode_many, encode, escape
+from mapped_reader import MappedLineReader
+from mutation_log import MutationLog
+from slotted import SlottedFile, convert_text_file
+
+
+# Backends used by open_store() when none is given (see BACKENDS); history
+# files get their own since they are append-mostly and read by date range
+DEFAULT_BACKEND = os.environ.get("YOURTODO_STORE", "sqlite")
+DEFAULT_HISTORY_BACKEND = os.environ.get("YOURTODO_HISTORY_STORE", "segments")
+HISTORY_FILE = "history.txt"
+LOAD_BATCH_SIZE = 2000  # Records per batch handed out by load_batches()
+
+
+def completion_date(status):
+    """Return the yyyy-MM-dd date stamped on a finished status, or an empty string"""
+    if " on " in status:
+        return status.rsplit(" on ", 1)[1].strip()
+    return ""
+
+
+class TaskStore:
+    """Interface shared by all task and history storage backends
+
+    Records are plain task dicts keyed by TASK_FIELDS plus an "id" that
+    identifies the record inside its store.
+    """
+
+    def load(self, username=None):
+        """Return all records, optionally only those belonging to username"""
+        raise NotImplementedError
+
+    def count(self):
+        """Return the number of records"""
+        return len(self.load())
+
+    def load_completed(self, start, end, username=None):
+        """Return records completed between two yyyy-MM-dd dates (inclusive)"""
+        return [
+            task
+            for task in self.load(username)
+            if start <= completion_date(task["status"]) <= end
+        ]
+
+    def add(self, task):
+        """Append a record and return its id"""
+        raise NotImplementedError
+
+    def update(self, task_id, task):
+        """Replace the record with the given id
+
+        Returns the record's new id if the edit moved it (see
+        SegmentedHistoryStore), otherwise None.
+        """
+        raise NotImplementedError
+
+    def set_status(self, task_id, status):
+        """Change only the status of a record"""
+        for task in self.load():
+            if task["id"] == task_id:
+                task["status"] = status
+                self.update(task_id, task)
+                return
+
+    def set_statuses(self, statuses):
+        """Change the status of several records ({id: status}) in one write"""
+        for task_id, status in statuses.items():
+            self.set_status(task_id, status)
+
+    def delete(self, task_id):
+        """Remove the record with the given id"""
+        raise NotImplementedError
+
+    def renumbered(self, deleted_id, task_id):
+        """Return the id a record has once the record deleted_id is deleted
+
+        Ids are stable in most backends; where they are positions in a
+        file, the records after the deleted one move up.
+        """
+        return task_id
+
+    def replace_all(self, tasks):
+        """Replace the whole content of the store"""
+        raise NotImplementedError
+
+    def watch_paths(self):
+        """Return the files (and directories) holding the store on disk"""
+        return [self.path]
+
+    def cursor(self):
+        """Return a position for follow() marking the current end of the store"""
+        return None
+
+    def stamp(self):
+        """Return a JSON-serialisable value that changes with every write
+
+        Snapshots derived from a store (history_columns, history_search)
+        keep the stamp they were built from, so edits that leave the record
+        count unchanged still show them to be stale. By default it is the
+        inode, mtime and size of each file in watch_paths().
+        """
+        stamp = []
+        for path in self.watch_paths():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stamp.append(None)
+            else:
+                stamp.append([stat.st_ino, stat.st_mtime_ns, stat.st_size])
+        return stamp
+
+    def follow(self, cursor=None):
+        """Return (records, cursor, appended) for changes since a cursor
+
+        When appended is true the records are only those added after the
+        cursor; otherwise the store was rewritten (or cannot tell) and the
+        records are the whole store.
+        """
+        return self.load(), self.cursor(), False
+
+    def load_batches(self, batch_size=LOAD_BATCH_SIZE):
+        """Yield (records, done, total, cursor) while loading the whole store
+
+        Meant to run on a worker thread. done/total measure progress (bytes
+        for file backends) and cursor is the follow() position matching the
+        records loaded. At least one, possibly empty, batch is yielded.
+        """
+        cursor = self.cursor()
+        yield self.load(), 1, 1, cursor
+
+    def close(self):
+        """Release any resources held by the store"""
+
+
+class TextTaskStore(TaskStore):
+    """Legacy backend reading and rewriting the " | " separated text file
+
+    Record ids are line numbers, so they shift after a delete (see
+    renumbered()), and every rewrite replaces the file atomically. History
+    files also keep a block index so date and username queries skip blocks
+    that cannot match.
+    """
+
+    def __init__(self, path, block_index=None):
+        self.path = path
+        self.reader = MappedLineReader(path)
+        if block_index is None:
+            block_index = os.path.basename(path) == HISTORY_FILE
+        self.blocks = BlockIndex(path) if block_index else None
+
+    def _read_lines(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return file.readlines()
+        except FileNotFoundError:
+            open(self.path, "w").close()
+            return []
+
+    def _write_tasks(self, tasks):
+        self._write_lines(encode(task) + "\n" for task in tasks)
+
+    def _write_lines(self, lines):
+        """Replace the file so a crash leaves either every change or none"""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+        os.replace(temp_path, self.path)
+
+    def _line_ranges(self, start=None, end=None, username=None):
+        total = len(self.reader)
+        if self.blocks is None:
+            return [(0, total)]
+        self.blocks.refresh(self.reader)
+        return self.blocks.line_ranges(total, start, end, username)
+
+    def _records(self, match=None, start=None, end=None, username=None):
+        """Parse the lines whose raw bytes pass match() via the mapped reader
+
+        start/end/username let the block index skip whole blocks first.
+        """
+        if not os.path.exists(self.path):
+            open(self.path, "w").close()
+        tasks = []
+        with self.reader:
+            for first, stop in self._line_ranges(start, end, username):
+                if match is None:
+                    # Whole ranges are decoded in bulk
+                    rows = decode_many(self.reader.raw_range(first, stop))
+                    items = enumerate(rows, first)
+                else:
+                    items = (
+                        (line_no, decode(raw))
+                        for line_no, raw in self.reader.raw_lines(first, stop)
+                        if match(raw)
+                    )
+                for line_no, task in items:
+                    if task is not None:
+                        task["id"] = line_no
+                        tasks.append(task)
+        return tasks
+
+    def count(self):
+        if not os.path.exists(self.path):
+            return 0
+        with self.reader:
+            return len(self.reader)
+
+    def _cursor(self, stat, reader=None):
+        # inode, mtime and size of the file, then the complete lines seen
+        reader = reader or self.reader
+        size = reader.indexed_size
+        return (
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_size,
+            len(reader.offsets),
+            size,
+            reader.tail_checksum(size),
+        )
+
+    def _only_appended(self, stat, cursor):
+        """Check that the file still starts with what the cursor saw"""
+        inode, _, _, lines, size, crc = cursor
+        offsets = self.reader.offsets
+        if inode != stat.st_ino or lines > len(offsets):
+            return False
+        if lines < len(offsets):
+            next_offset = offsets[lines]
+        else:
+            next_offset = self.reader.indexed_size
+        return next_offset == size and self.reader.tail_checksum(size) == crc
+
+    def cursor(self):
+        if not os.path.exists(self.path):
+            open(self.path, "w").close()
+        stat = os.stat(self.path)
+        with self.reader:
+            return self._cursor(stat)
+
+    def follow(self, cursor=None):
+        if not os.path.exists(self.path):
+            open(self.path, "w").close()
+        stat = os.stat(self.path)
+        if cursor is not None and cursor[:3] == (
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return [], cursor, True
+
+        with self.reader:
+            appended = cursor is not None and self._only_appended(stat, cursor)
+            first = cursor[3] if appended else 0
+            # An unfinished last line is picked up once it is complete
+            stop = len(self.reader.offsets)
+            rows = decode_many(self.reader.raw_range(first, stop))
+            cursor = self._cursor(stat)
+        return self._number(rows, first), cursor, appended
+
+    @staticmethod
+    def _number(rows, first):
+        """Give decoded rows their line number ids, dropping malformed lines"""
+        tasks = []
+        for line_no, task in enumerate(rows, first):
+            if task is not None:
+                task["id"] = line_no
+                tasks.append(task)
+        return tasks
+
+    def load_batches(self, batch_size=LOAD_BATCH_SIZE):
+        if not os.path.exists(self.path):
+            open(self.path, "w").close()
+        stat = os.stat(self.path)
+        # A reader of its own, since self.reader belongs to the GUI thread;
+        # only that one saves the shared index
+        with MappedLineReader(self.path, save_index=False) as reader:
+            cursor = self._cursor(stat, reader)
+            lines = len(reader.offsets)
+            total = reader.indexed_size
+            if not lines:
+                yield [], 0, 0, cursor
+            for first in range(0, lines, batch_size):
+                stop = min(first + batch_size, lines)
+                rows = decode_many(reader.raw_range(first, stop))
+                done = reader.offsets[stop] if stop < lines else total
+                yield self._number(rows, first), done, total, cursor
+
+    def load(self, username=None):
+        if username is None:
+            return self._records()
+
+        # Skip other users' lines before decoding them
+        suffix = (SEPARATOR + escape(username)).encode("utf-8")
+        tasks = self._records(lambda raw: raw.endswith(suffix), username=username)
+        return [task for task in tasks if task["username"] == username]
+
+    def load_completed(self, start, end, username=None):
+        first, last = start.encode(), end.encode()
+
+        def completed_in_range(raw):
+            # Compare the date after " on " without decoding the line
+            pos = raw.rfind(b" on ")
+            return pos >= 0 and first <= raw[pos + 4 : pos + 14] <= last
+
+        return [
+            task
+            for task in self._records(completed_in_range, start, end, username)
+            if start <= completion_date(task["status"]) <= end
+            and (username is None or task["username"] == username)
+        ]
+
+    def add(self, task):
+        if not os.path.exists(self.path):
+            open(self.path, "w").close()
+        with self.reader:
+            line_count = len(self.reader)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(encode(task) + "\n")
+        return line_count
+
+    def update(self, task_id, task):
+        lines = self._read_lines()
+        lines[task_id] = encode(task) + "\n"
+        self._write_lines(lines)
+
+    def set_statuses(self, statuses):
+        lines = self._read_lines()
+        for task_id, status in statuses.items():
+            task = decode(lines[task_id].rstrip("\n"))
+            if task is not None:
+                task["status"] = status
+                lines[task_id] = encode(task) + "\n"
+        self._write_lines(lines)
+
+    def delete(self, task_id):
+        lines = self._read_lines()
+        del lines[task_id]
+        self._write_lines(lines)
+
+    def renumbered(self, deleted_id, task_id):
+        return task_id - 1 if task_id > deleted_id else task_id
+
+    def replace_all(self, tasks):
+        self._write_tasks(tasks)
+
+
+class SqliteTaskStore(TaskStore):
+    """SQLite backend with indexes on username, status, deadline and completion date
+
+    The database lives next to the legacy text file (tasks.txt -> tasks.db) and
+    imports that file the first time it is created.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path):
+        self.path = path
+        self.db_path = os.path.splitext(path)[0] + ".db"
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        with self.conn:
+            if version < 1:
+                self._create_records()
+            if version < 2:
+                self._create_change_counter()
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _create_records(self):
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                description TEXT NOT NULL,
+                start_time TEXT NOT NULL,
+                deadline TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                status TEXT NOT NULL,
+                username TEXT NOT NULL DEFAULT '',
+                completed_on TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_username
+                ON records(username);
+            CREATE INDEX IF NOT EXISTS idx_records_status
+                ON records(status);
+            CREATE INDEX IF NOT EXISTS idx_records_deadline
+                ON records(deadline);
+            CREATE INDEX IF NOT EXISTS idx_records_completed
+                ON records(completed_on, username);
+        """
+        )
+        # Import the legacy text file once so existing data carries over
+        legacy = TextTaskStore(self.path)
+        if os.path.exists(self.path):
+            self._insert_many(legacy.load())
+
+    def _create_change_counter(self):
+        # Counts updates and deletes, so follow() can tell whether rows were
+        # only appended since its cursor
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS changes (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                rewrites INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO changes VALUES (0, 0);
+            CREATE TRIGGER IF NOT EXISTS records_updated
+                AFTER UPDATE ON records
+                BEGIN UPDATE changes SET rewrites = rewrites + 1; END;
+            CREATE TRIGGER IF NOT EXISTS records_deleted
+                AFTER DELETE ON records
+                BEGIN UPDATE changes SET rewrites = rewrites + 1; END;
+        """
+        )
+
+    @staticmethod
+    def _row_values(task):
+        values = [task.get(key, "") for key in TASK_FIELDS]
+        values.append(completion_date(task.get("status", "")))
+        return values
+
+    def _insert_many(self, tasks):
+        self.conn.executemany(
+            "INSERT INTO records (name, description, start_time, deadline,"
+            " priority, status, username, completed_on)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._row_values(task) for task in tasks),
+        )
+
+    SELECT_RECORDS = (
+        "SELECT id, name, description, start_time, deadline, priority,"
+        " status, username FROM records"
+    )
+    SELECT_CURSOR = (
+        "SELECT (SELECT IFNULL(MAX(id), 0) FROM records), rewrites FROM changes"
+    )
+
+    @staticmethod
+    def _tasks(rows):
+        tasks = []
+        for row in rows:
+            task = dict(zip(TASK_FIELDS, row[1:]))
+            task["id"] = row[0]
+            tasks.append(task)
+        return tasks
+
+    def _select(self, where="", params=()):
+        query = f"{self.SELECT_RECORDS} {where} ORDER BY id"
+        return self._tasks(self.conn.execute(query, params))
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def load(self, username=None):
+        if username is None:
+            return self._select()
+        return self._select("WHERE username = ?", (username,))
+
+    def load_completed(self, start, end, username=None):
+        if username is None:
+            return self._select(
+                "WHERE completed_on BETWEEN ? AND ?", (start, end)
+            )
+        return self._select(
+            "WHERE completed_on BETWEEN ? AND ? AND username = ?",
+            (start, end, username),
+        )
+
+    def add(self, task):
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO records (name, description, start_time, deadline,"
+                " priority, status, username, completed_on)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._row_values(task),
+            )
+        return cursor.lastrowid
+
+    def update(self, task_id, task):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE records SET name = ?, description = ?, start_time = ?,"
+                " deadline = ?, priority = ?, status = ?, username = ?,"
+                " completed_on = ? WHERE id = ?",
+                self._row_values(task) + [task_id],
+            )
+
+    def set_status(self, task_id, status):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE records SET status = ?, completed_on = ? WHERE id = ?",
+                (status, completion_date(status), task_id),
+            )
+
+    def set_statuses(self, statuses):
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE records SET status = ?, completed_on = ? WHERE id = ?",
+                [
+                    (status, completion_date(status), task_id)
+                    for task_id, status in statuses.items()
+                ],
+            )
+
+    def delete(self, task_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM records WHERE id = ?", (task_id,))
+
+    def replace_all(self, tasks):
+        with self.conn:
+            self.conn.execute("DELETE FROM records")
+            self._insert_many(tasks)
+
+    def watch_paths(self):
+        return [self.db_path, self.db_path + "-wal"]
+
+    def cursor(self):
+        last_id, rewrites = self.conn.execute(self.SELECT_CURSOR).fetchone()
+        return last_id, rewrites
+
+    def stamp(self):
+        # The WAL file's mtime misses writes once it is checkpointed
+        return list(self.cursor())
+
+    def follow(self, cursor=None):
+        current = self.cursor()
+        if cursor is None or cursor[1] != current[1]:
+            return self._select(), current, False
+        return self._select("WHERE id > ?", (cursor[0],)), current, True
+
+    def load_batches(self, batch_size=LOAD_BATCH_SIZE):
+        # SQLite connections are bound to the thread that opened them
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("BEGIN")  # One read snapshot for the cursor and rows
+            cursor = tuple(conn.execute(self.SELECT_CURSOR).fetchone())
+            total = conn.execute(
+                "SELECT COUNT(*) FROM records WHERE id <= ?", (cursor[0],)
+            ).fetchone()[0]
+            if not total:
+                yield [], 0, 0, cursor
+            rows = conn.execute(
+                f"{self.SELECT_RECORDS} WHERE id <= ? ORDER BY id", (cursor[0],)
+            )
+            done = 0
+            while True:
+                batch = rows.fetchmany(batch_size)
+                if not batch:
+                    break
+                done += len(batch)
+                yield self._tasks(batch), done, total, cursor
+        finally:
+            conn.close()
+
+    def close(self):
+        self.conn.close()
+
+
+class LoggedTaskStore(TaskStore):
+    """Text snapshot plus an append-only mutation log (tasks.txt + tasks.txt.wal)
+
+    Every add, edit or delete costs one small log record instead of a full
+    rewrite. Once the log grows past COMPACT_THRESHOLD records a background
+    thread folds it back into the legacy text snapshot.
+    """
+
+    COMPACT_THRESHOLD = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self.log_path = path + ".wal"
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._tasks = {}
+        self._tail = None  # Records logged while a compaction is running
+        self._recover()
+        self.log = MutationLog(self.log_path)
+
+    def _recover(self):
+        """Rebuild the in-memory state from the snapshot and its log"""
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            data = b""
+        crc = zlib.crc32(data)
+        rows = decode_many(data)
+
+        # A log only applies to the snapshot whose checksum is in its header;
+        # ".next" is a finished compaction whose log swap was interrupted
+        records = None
+        for candidate in (self.log_path, self.log_path + ".next"):
+            log = MutationLog.read(candidate)
+            if log and log[0].get("op") == "base" and log[0]["crc"] == crc:
+                if candidate != self.log_path:
+                    os.replace(candidate, self.log_path)
+                records = log
+                break
+        if records is None:
+            # Plain legacy file (or edited by hand): number its lines in order
+            ids = list(range(len(rows)))
+            records = [{"op": "base", "crc": crc, "ids": ids, "next": len(ids)}]
+            MutationLog.write_file(self.log_path, records)
+
+        ids = records[0]["ids"]
+        for task_id, task in zip(ids, rows):
+            if task is not None:
+                task["id"] = task_id
+                self._tasks[task_id] = task
+        # The high-water id outlives deleted tasks, so no id is handed out twice
+        self._next_id = max(records[0].get("next", 0), max(ids, default=-1) + 1)
+        for record in records[1:]:
+            self._apply(record)
+
+    def watch_paths(self):
+        return [self.path, self.log_path]
+
+    def _apply(self, record):
+        if record["op"] == "batch":
+            for change in record["records"]:
+                self._apply(change)
+            return
+        task_id = record["id"]
+        if record["op"] == "delete":
+            self._tasks.pop(task_id, None)
+        else:
+            task = dict(record["task"], id=task_id)
+            self._tasks[task_id] = task
+            self._next_id = max(self._next_id, task_id + 1)
+
+    def _log(self, record):
+        with self._lock:
+            self._append(record)
+        # Return only once the record is on disk; waiting outside the lock
+        # lets records from other threads share the same group commit
+        self.log.sync()
+
+    def _append(self, record):
+        """Apply a record and write it to the log; self._lock must be held"""
+        self._apply(record)
+        self.log.append(record)
+        if self._tail is not None:
+            self._tail.append(record)
+        if self.log.record_count > self.COMPACT_THRESHOLD:
+            self._start_compaction()
+
+    @staticmethod
+    def _fields(task):
+        return {key: task.get(key, "") for key in TASK_FIELDS}
+
+    def count(self):
+        return len(self._tasks)
+
+    def load(self, username=None):
+        with self._lock:
+            return [
+                dict(task)
+                for task in self._tasks.values()
+                if username is None or task["username"] == username
+            ]
+
+    def add(self, task):
+        with self._lock:
+            task_id = self._next_id
+            self._append({"op": "add", "id": task_id, "task": self._fields(task)})
+        self.log.sync()
+        return task_id
+
+    def update(self, task_id, task):
+        self._log({"op": "update", "id": task_id, "task": self._fields(task)})
+
+    def set_status(self, task_id, status):
+        with self._lock:
+            task = dict(self._fields(self._tasks[task_id]), status=status)
+            self._append({"op": "update", "id": task_id, "task": task})
+        self.log.sync()
+
+    def set_statuses(self, statuses):
+        # One log record, so the changes are replayed all together or not at all
+        with self._lock:
+            changes = [
+                {
+                    "op": "update",
+                    "id": task_id,
+                    "task": dict(self._fields(self._tasks[task_id]), status=status),
+                }
+                for task_id, status in statuses.items()
+            ]
+            self._append({"op": "batch", "records": changes})
+        self.log.sync()
+
+    def delete(self, task_id):
+        self._log({"op": "delete", "id": task_id})
+
+    def replace_all(self, tasks):
+        with self._compact_lock, self._lock:
+            # Tasks keep the ids they carry; others get new ones, in order
+            kept = set()
+            for task in tasks:
+                task_id = task.get("id")
+                if isinstance(task_id, int) and task_id not in kept:
+                    kept.add(task_id)
+                    self._next_id = max(self._next_id, task_id + 1)
+            self._tasks = {}
+            for task in tasks:
+                task_id = task.get("id")
+                if task_id not in kept or task_id in self._tasks:
+                    task_id = self._next_id
+                    self._next_id += 1
+                self._tasks[task_id] = dict(self._fields(task), id=task_id)
+            self._tail = []
+            self._finish_compaction(self._write_snapshot(list(self._tasks.items())))
+
+    def _start_compaction(self):
+        if self._compact_lock.locked():
+            return
+        threading.Thread(target=self.compact, daemon=True).start()
+
+    def compact(self):
+        """Fold the mutation log into the text snapshot"""
+        with self._compact_lock:
+            with self._lock:
+                items = [(task_id, dict(task)) for task_id, task in self._tasks.items()]
+                self._tail = []
+            crc = self._write_snapshot(items)
+            with self._lock:
+                self._finish_compaction(crc, [task_id for task_id, _ in items])
+
+    def _write_snapshot(self, items):
+        """Write items to a temporary snapshot file and return its checksum"""
+        data = "".join(encode(task) + "\n" for _, task in items).encode("utf-8")
+        with open(self.path + ".tmp", "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        return zlib.crc32(data)
+
+    def _finish_compaction(self, crc, ids=None):
+        if ids is None:
+            ids = list(self._tasks)
+        next_log = self.log_path + ".next"
+        header = {"op": "base", "crc": crc, "ids": ids, "next": self._next_id}
+        MutationLog.write_file(next_log, [header] + self._tail)
+        self._tail = None
+        os.replace(self.path + ".tmp", self.path)
+        self.log.replace(next_log)
+
+    def close(self):
+        with self._compact_lock:
+            self.log.close()
+
+
+class SlottedTaskStore(TaskStore):
+    """Fixed-width slot file backend (tasks.txt -> tasks.slots)
+
+    Record ids are slot numbers, so a status change rewrites one field of
+    one slot. The legacy text file is converted the first time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.slot_path = os.path.splitext(path)[0] + ".slots"
+        if not os.path.exists(self.slot_path) and os.path.exists(path):
+            convert_text_file(path, self.slot_path)
+        self.slots = SlottedFile(self.slot_path)
+
+    def load(self, username=None):
+        tasks = []
+        for slot, task in self.slots.records():
+            if username is not None and task["username"] != username:
+                continue
+            task["id"] = slot
+            tasks.append(task)
+        return tasks
+
+    def count(self):
+        return len(self.slots.records())
+
+    def add(self, task):
+        return self.slots.append(task)
+
+    def update(self, task_id, task):
+        self.slots.write(task_id, task)
+
+    def set_status(self, task_id, status):
+        self.slots.write_field(task_id, "status", status)
+
+    def delete(self, task_id):
+        self.slots.free(task_id)
+
+    def replace_all(self, tasks):
+        self.slots.clear()
+        for task in tasks:
+            self.slots.append(task)
+
+    def watch_paths(self):
+        return [self.slot_path]
+
+    def close(self):
+        self.slots.close()
+
+
+class SegmentedHistoryStore(TaskStore):
+    """History split into monthly segment files (history.txt -> history.segments/)
+
+    Records are filed by completion month (2025-03.txt, or undated.txt) in
+    the legacy text format. A manifest keeps each segment's row count and
+    completion date range, so a range query only opens overlapping segments.
+    Record ids are "<segment>:<line>" strings.
+    """
+
+    UNDATED = "undated"
+
+    def __init__(self, path):
+        self.path = path
+        self.directory = os.path.splitext(path)[0] + ".segments"
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+        self._segments = {}
+        if os.path.exists(self.manifest_path):
+            self._read_manifest()
+        else:
+            # First use: file the legacy history into segments
+            os.makedirs(self.directory, exist_ok=True)
+            self.manifest = {}
+            legacy = TextTaskStore(self.path) if os.path.exists(path) else None
+            self.replace_all(legacy.load() if legacy else [])
+
+    def _segment_key(self, task):
+        date = completion_date(task.get("status", ""))
+        return date[:7] if len(date) >= 7 else self.UNDATED
+
+    def _segment(self, key):
+        if key not in self._segments:
+            segment_path = os.path.join(self.directory, key + ".txt")
+            self._segments[key] = TextTaskStore(segment_path, block_index=True)
+        return self._segments[key]
+
+    def _read_manifest(self):
+        with open(self.manifest_path, "r", encoding="utf-8") as file:
+            self.manifest = json.load(file)
+
+    def _save_manifest(self):
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(self.manifest, file, indent=1, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
+
+    def _note_added(self, key, task):
+        entry = self.manifest.setdefault(key, {"rows": 0, "first": "", "last": ""})
+        entry["rows"] += 1
+        date = completion_date(task.get("status", ""))
+        if date:
+            entry["first"] = min(entry["first"] or date, date)
+            entry["last"] = max(entry["last"], date)
+
+    def _split_id(self, task_id):
+        key, line_no = task_id.rsplit(":", 1)
+        return key, int(line_no)
+
+    def _load_segments(self, keys, load):
+        tasks = []
+        for key in keys:
+            for task in load(self._segment(key)):
+                task["id"] = f"{key}:{task['id']}"
+                tasks.append(task)
+        return tasks
+
+    def count(self):
+        return sum(entry["rows"] for entry in self.manifest.values())
+
+    def load(self, username=None):
+        return self._load_segments(
+            sorted(self.manifest), lambda segment: segment.load(username)
+        )
+
+    def load_completed(self, start, end, username=None):
+        keys = [
+            key
+            for key, entry in sorted(self.manifest.items())
+            if key != self.UNDATED
+            and entry["rows"]
+            and entry["first"] <= end
+            and entry["last"] >= start
+        ]
+        return self._load_segments(
+            keys, lambda segment: segment.load_completed(start, end, username)
+        )
+
+    def add(self, task):
+        key = self._segment_key(task)
+        line_no = self._segment(key).add(task)
+        self._note_added(key, task)
+        self._save_manifest()
+        return f"{key}:{line_no}"
+
+    def update(self, task_id, task):
+        key, line_no = self._split_id(task_id)
+        if self._segment_key(task) != key:
+            # Completion month changed: move the record to its new segment
+            self.delete(task_id)
+            return self.add(task)
+        self._segment(key).update(line_no, task)
+        self._note_added(key, task)
+        self.manifest[key]["rows"] -= 1
+        self._save_manifest()
+
+    def delete(self, task_id):
+        key, line_no = self._split_id(task_id)
+        self._segment(key).delete(line_no)
+        self.manifest[key]["rows"] -= 1
+        self._save_manifest()
+
+    def renumbered(self, deleted_id, task_id):
+        # Line numbers within a segment
+        key, line_no = self._split_id(task_id)
+        deleted_key, deleted_line = self._split_id(deleted_id)
+        if key == deleted_key and line_no > deleted_line:
+            return f"{key}:{line_no - 1}"
+        return task_id
+
+    def replace_all(self, tasks):
+        by_segment = {}
+        for task in tasks:
+            by_segment.setdefault(self._segment_key(task), []).append(task)
+        for key in set(self.manifest) - set(by_segment):
+            self._segment(key).replace_all([])
+        self.manifest = {}
+        for key, segment_tasks in by_segment.items():
+            self._segment(key).replace_all(segment_tasks)
+            for task in segment_tasks:
+                self._note_added(key, task)
+        self._save_manifest()
+
+    def watch_paths(self):
+        segment_paths = [
+            os.path.join(self.directory, key + ".txt") for key in sorted(self.manifest)
+        ]
+        return [self.directory, self.manifest_path] + segment_paths
+
+    def cursor(self):
+        self._read_manifest()
+        return {key: self._segment(key).cursor() for key in self.manifest}
+
+    def stamp(self):
+        # Not the directory: loads write index sidecars into it
+        self._read_manifest()  # Pick up segments another process added
+        return {key: self._segment(key).stamp() for key in sorted(self.manifest)}
+
+    def follow(self, cursor=None):
+        # Another process may have added records or segments meanwhile
+        self._read_manifest()
+        if cursor is not None and not set(cursor) <= set(self.manifest):
+            cursor = None  # A segment disappeared
+        tasks = []
+        new_cursor = {}
+        for key in sorted(self.manifest):
+            segment_cursor = cursor.get(key) if cursor is not None else None
+            segment_tasks, new_cursor[key], appended = self._segment(key).follow(
+                segment_cursor
+            )
+            if segment_cursor is not None and not appended:
+                return self.follow()  # Rewritten segment: reload everything
+            for task in segment_tasks:
+                task["id"] = f"{key}:{task['id']}"
+                tasks.append(task)
+        return tasks, new_cursor, cursor is not None
+
+    def load_batches(self, batch_size=LOAD_BATCH_SIZE):
+        self._read_manifest()
+        keys = sorted(self.manifest)
+        segments = [self._segment(key) for key in keys]
+        total = sum(
+            os.path.getsize(segment.path)
+            for segment in segments
+            if os.path.exists(segment.path)
+        )
+        cursor = {}
+        batches = []
+        for key, segment in zip(keys, segments):
+            batches.append((key, segment.load_batches(batch_size)))
+        # Segment cursors are only known once each segment has been opened,
+        # so the shared dict is filled in as the batches go
+        finished = 0
+        yielded = False
+        for key, segment_batches in batches:
+            segment_done = 0
+            for tasks, segment_done, _, segment_cursor in segment_batches:
+                cursor[key] = segment_cursor
+                for task in tasks:
+                    task["id"] = f"{key}:{task['id']}"
+                yielded = True
+                yield tasks, finished + segment_done, total, cursor
+            finished += segment_done
+        if not yielded:
+            yield [], 0, 0, cursor
+
+
+BACKENDS = {
+    "text": TextTaskStore,
+    "sqlite": SqliteTaskStore,
+    "wal": LoggedTaskStore,
+    "slotted": SlottedTaskStore,
+    "segments": SegmentedHistoryStore,
+}
+
+_open_stores = {}
+
+
+def default_backend(path):
+    """Return the default backend for a task or history file"""
+    if os.path.basename(path) == HISTORY_FILE:
+        return DEFAULT_HISTORY_BACKEND
+    return DEFAULT_BACKEND
+
+
+def open_store(path, backend=None):
+    """Return the shared store for a task or history file"""
+    backend = backend or default_backend(path)
+    key = (os.path.abspath(path), backend)
+    if key not in _open_stores:
+        _open_stores[key] = BACKENDS[backend](path)
+    return _open_stores[key]
+
+
+def user_shard_path(path, username):
+    """Return the per-user copy of a shared file
+
+    data/tasks.txt -> data/users/<username>/tasks.txt
+    """
+    directory, filename = os.path.split(path)
+    user_dir = urllib.parse.quote(username, safe="")
+    return os.path.join(directory, "users", user_dir, filename)
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def _write_json(path, value):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(value, file)
+    os.replace(temp_path, path)
+
+
+def split_by_user(path, backend=None):
+    """Move the records of a shared file into per-user shards
+
+    Records without a username (Beta1 files) stay in the shared file, so
+    it can keep receiving records and be split again later. Before any
+    shard is written, a marker file (tasks.txt -> tasks.split.json) records
+    each shard's record count before and after the split; it is removed
+    once the shared file is truncated. A split interrupted in between is
+    finished on the next call without adding a shard's records twice.
+
+    The shared file's stamp() after a split is kept in tasks.split-stamp.json,
+    so later calls, in this process or another, skip the load until the
+    shared file is written again.
+    """
+    shared = open_store(path, backend)
+    base = os.path.splitext(path)[0]
+    marker_path = base + ".split.json"
+    stamp_path = base + ".split-stamp.json"
+    marker = _read_json(marker_path)
+    stamp = json.loads(json.dumps(shared.stamp()))  # Tuples read back as lists
+    if marker is None and _read_json(stamp_path) == stamp:
+        return  # Nothing was written since the last split
+
+    owned = {}
+    unowned = []
+    for task in shared.load():
+        if task["username"]:
+            owned.setdefault(task["username"], []).append(task)
+        else:
+            unowned.append(task)
+    if not owned:
+        if marker is not None:
+            os.remove(marker_path)  # The shared file was already truncated
+        _write_json(stamp_path, stamp)
+        return
+
+    shards = {}
+    for username in owned:
+        shard_path = user_shard_path(path, username)
+        os.makedirs(os.path.dirname(shard_path), exist_ok=True)
+        shards[username] = open_store(shard_path, backend)
+    if marker is None:
+        marker = {}
+        for username, tasks in owned.items():
+            before = shards[username].count()
+            marker[username] = [before, before + len(tasks)]
+        _write_json(marker_path, marker)
+
+    for username, tasks in owned.items():
+        shard = shards[username]
+        if username in marker and shard.count() == marker[username][1]:
+            continue  # Written before the last split was interrupted
+        shard.replace_all(shard.load() + tasks)
+    shared.replace_all(unowned)
+    os.remove(marker_path)
+    _write_json(stamp_path, shared.stamp())
+
+
+def open_user_store(path, username, backend=None):
+    """Return the store holding only username's records of a shared file"""
+    split_by_user(path, backend)
+    shard_path = user_shard_path(path, username)
+    os.makedirs(os.path.dirname(shard_path), exist_ok=True)
+    return open_store(shard_path, backend)
@@ -0,0 +1,289 @@
+import gc
+import random
+import re
+import sys
+import time
+import tracemalloc
+from enum import IntEnum
+from functools import lru_cache
+
+from codec import decode_many, encode
+from storage import completion_date
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"  # start_time and deadline
+DATE_FORMAT = "%Y-%m-%d"  # Completion date in a finished status
+TIME_PATTERN = re.compile(r"\d{4}-\d\d-\d\d \d\d:\d\d\Z")
+
+
+class Status(IntEnum):
+    """Task status; DONE and FAILED match history_columns' status codes"""
+
+    DUE = 0
+    DONE = 1
+    FAILED = 2
+    OTHER = 3  # Anything else, e.g. "Pending"; the text is kept as is
+
+
+def _to_epoch(text, fmt):
+    try:
+        return int(time.mktime(time.strptime(text, fmt)))
+    except (ValueError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _day_start(year, month, day):
+    """Local midnight of a date in Unix seconds, or None on DST change days"""
+    try:
+        start = int(time.mktime((year, month, day, 0, 0, 0, 0, 0, -1)))
+        end = int(time.mktime((year, month, day + 1, 0, 0, 0, 0, 0, -1)))
+    except (OverflowError, ValueError):
+        return None
+    if end - start != 86400 or time.localtime(start)[:3] != (year, month, day):
+        return None
+    return start
+
+
+@lru_cache(maxsize=4096)
+def read_time(text):
+    """Return (parse_time(text), whether format_time() gives text back)
+
+    Callers that keep only the parsed value use the flag to know when the
+    original string must be kept as well.
+    """
+    if TIME_PATTERN.match(text):
+        # Fixed width: slicing and a cached midnight beat strptime and mktime
+        hour = int(text[11:13])
+        minute = int(text[14:16])
+        start = _day_start(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+        if start is not None and hour < 24 and minute < 60:
+            return start + hour * 3600 + minute * 60, True
+    # Out of range fields, a DST change day or another format
+    epoch = _to_epoch(text, TIME_FORMAT)
+    return epoch, epoch is not None and format_time(epoch) == text
+
+
+def parse_time(text):
+    """Return a "yyyy-MM-dd HH:mm" local time as Unix seconds, or None"""
+    return read_time(text)[0]
+
+
+def format_time(epoch):
+    """Inverse of parse_time()"""
+    return time.strftime(TIME_FORMAT, time.localtime(epoch))
+
+
+def parse_status(text):
+    """Return (Status, completion time in Unix seconds or None) for a status"""
+    return read_status(text)[:2]
+
+
+@lru_cache(maxsize=4096)
+def read_status(text):
+    """Return (*parse_status(text), whether format_status() gives text back)"""
+    lowered = text.lower()
+    if lowered == "due":
+        status, completed_at = Status.DUE, None
+    else:
+        if "failed" in lowered:
+            status = Status.FAILED
+        elif "done" in lowered:
+            status = Status.DONE
+        else:
+            status = Status.OTHER  # May still be dated: "Pending on 2024-05-01"
+        date = completion_date(text)
+        completed_at = _to_epoch(date, DATE_FORMAT) if date else None
+    return status, completed_at, format_status(status, completed_at) == text
+
+
+def format_status(status, completed_at):
+    """Status text as the app writes it"""
+    if status == Status.DONE and completed_at is not None:
+        date = time.strftime(DATE_FORMAT, time.localtime(completed_at))
+        return f"done ✅ - Completed on {date}"
+    if status == Status.FAILED and completed_at is None:
+        return "failed ❌"
+    if status == Status.DUE:
+        return "due"
+    return None  # No standard spelling
+
+
+class Task:
+    """One task with its times and status parsed when the Task is built
+
+    start, deadline and completed_at are Unix seconds (None if missing or
+    unreadable), status is a Status, and priority and username are
+    interned, so a large list of tasks holds one copy of each. to_dict()
+    gives back exactly the strings the task was read from: any that the
+    parsed values would not reproduce are kept as written.
+
+    Stores and TaskTableModel still hand out task dicts; TaskCollection
+    parses them with Task.from_dict() and gives its rows back as Tasks.
+    Elsewhere parse_time() and parse_status() cache the parse of each
+    distinct string instead.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "start",
+        "deadline",
+        "priority",
+        "status",
+        "completed_at",
+        "username",
+        "_text",  # {field: original string} where it cannot be rebuilt, or None
+    )
+
+    def __init__(
+        self,
+        name,
+        description,
+        start,
+        deadline,
+        priority,
+        status=Status.DUE,
+        completed_at=None,
+        username="",
+        id=None,
+    ):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.start = start
+        self.deadline = deadline
+        self.priority = sys.intern(priority)
+        self.status = status
+        self.completed_at = completed_at
+        self.username = sys.intern(username)
+        self._text = None
+
+    @classmethod
+    def from_dict(cls, task):
+        """Build a Task from a task dict as stores return them"""
+        start_text = task["start_time"]
+        deadline_text = task["deadline"]
+        status_text = task["status"]
+        start, start_exact = read_time(start_text)
+        deadline, deadline_exact = read_time(deadline_text)
+        status, completed_at, status_exact = read_status(status_text)
+        self = cls(
+            task["name"],
+            task["description"],
+            start,
+            deadline,
+            task["priority"],
+            status,
+            completed_at,
+            task.get("username", ""),
+            task.get("id"),
+        )
+        text = None
+        if not start_exact:
+            text = {"start_time": start_text}
+        if not deadline_exact:
+            text = text or {}
+            text["deadline"] = deadline_text
+        if not status_exact:
+            text = text or {}
+            text["status"] = status_text
+        self._text = text
+        return self
+
+    @property
+    def start_time(self):
+        return self._field("start_time") or format_time(self.start)
+
+    @property
+    def deadline_text(self):
+        return self._field("deadline") or format_time(self.deadline)
+
+    @property
+    def status_text(self):
+        return self._field("status") or format_status(self.status, self.completed_at)
+
+    def _field(self, field):
+        return self._text.get(field) if self._text else None
+
+    def set_status(self, status, completed_at=None):
+        """Change the status; a finished task is stamped with completed_at"""
+        self.status = status
+        self.completed_at = completed_at
+        if self._text:
+            self._text.pop("status", None)
+
+    def is_overdue(self, now):
+        """Whether the task is still due with its deadline at or before now"""
+        if self.status != Status.DUE or self.deadline is None:
+            return False
+        return self.deadline <= now
+
+    def to_dict(self):
+        """Return the task as the dict the stores and models use"""
+        task = {
+            "name": self.name,
+            "description": self.description,
+            "start_time": self.start_time,
+            "deadline": self.deadline_text,
+            "priority": self.priority,
+            "status": self.status_text,
+            "username": self.username,
+        }
+        if self.id is not None:
+            task["id"] = self.id
+        return task
+
+    def __repr__(self):
+        return f"Task({self.to_dict()!r})"
+
+
+def _benchmark(task_count):
+    """Compare the memory held by decoded task dicts and by Task objects"""
+    rng = random.Random(1)
+    now = int(time.time())
+    lines = []
+    for i in range(task_count):
+        start = now - rng.randrange(0, 365 * 86400) // 60 * 60
+        deadline = start + rng.randrange(1, 30 * 86400) // 60 * 60
+        status = rng.choice(
+            ["due", "failed ❌", time.strftime("done ✅ - Completed on %Y-%m-%d")]
+        )
+        task = {
+            "name": f"Task {i}",
+            "description": "Write the weekly report",
+            "start_time": format_time(start),
+            "deadline": format_time(deadline),
+            "priority": rng.choice(["Low", "Medium", "High"]),
+            "status": status,
+            "username": rng.choice(["alice", "bob", "carol"]),
+        }
+        lines.append(encode(task))
+    data = "\n".join(lines).encode("utf-8")
+    del lines
+
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]  # Only what result keeps
+        tracemalloc.stop()
+        return result, size, elapsed
+
+    dicts, dict_size, dict_time = measure(lambda: decode_many(data))
+    print(f"dicts: {dict_size / 2**20:.0f} MiB, loaded in {dict_time:.1f}s")
+    del dicts
+    tasks, task_size, task_time = measure(
+        lambda: [Task.from_dict(task) for task in decode_many(data)]
+    )
+    print(
+        f"Tasks: {task_size / 2**20:.0f} MiB ({task_size / dict_size:.0%}), "
+        f"loaded in {task_time:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
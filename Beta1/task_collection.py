@@ -0,0 +1,391 @@
+import random
+import sys
+import time
+import weakref
+from array import array
+from collections import Counter
+from itertools import compress
+
+from history_columns import PRIORITY_CODES
+from task import DATE_FORMAT, Status, Task, read_status, read_time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array module is used without it
+    np = None
+
+NO_TIME = 2**63 - 1  # Missing or unreadable times: sort last, match no range
+
+# Column name -> array typecode
+COLUMNS = {
+    "start": "q",  # int64 Unix seconds
+    "deadline": "q",
+    "completed_at": "q",
+    "priority": "B",  # uint8 index into priorities
+    "status": "B",  # uint8 Status
+    "user": "I",  # uint32 index into users
+}
+TEXT_KEYS = {"name": "names", "description": "descriptions"}
+
+# EncodedColumn -> its values parsed so far (see _parse_times); value lists
+# only grow, so each distinct value is parsed once per model load
+_parsed_values = weakref.WeakKeyDictionary()
+
+
+class TaskCollection:
+    """Tasks stored column by column for bulk filtering, sorting and counting
+
+    Times are int64 Unix seconds, statuses Status codes and priorities and
+    usernames small integer codes into the priorities and users tables;
+    names, descriptions and ids are plain lists. Filters, sorts and counts
+    run over whole columns at once, with NumPy when it is installed and
+    the array module otherwise. Rows are numbered from 0 in the order the
+    tasks were added; filter() and sort() return row numbers (a NumPy
+    array when NumPy is installed), which task() and tasks() turn back
+    into tasks.
+    """
+
+    def __init__(self):
+        for name, typecode in COLUMNS.items():
+            setattr(self, name, array(typecode))
+        self.ids = []
+        self.names = []
+        self.descriptions = []
+        # Other priorities get codes after "High"
+        self.priorities = ["", *PRIORITY_CODES]
+        self.users = []
+        self._priority_codes = {text: code for code, text in enumerate(self.priorities)}
+        self._user_codes = {}
+        self._text = {}  # row -> Task._text of tasks with irregular strings
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        """Build a collection from Task objects or task dicts"""
+        collection = cls()
+        collection.extend(tasks)
+        return collection
+
+    @classmethod
+    def from_model(cls, model):
+        """Build a collection from a TaskTableModel's columns
+
+        Rows are mapped through the model's value codes, and each distinct
+        start time, deadline and status is parsed only once per model load
+        (see _parse_times), so rebuilding after a change costs about as
+        much as copying the model.
+        """
+        collection = cls()
+        columns = model.columns
+        collection.ids = list(model.ids)
+        collection.names = list(columns["name"])
+        collection.descriptions = list(columns["description"])
+        rows = len(collection.ids)
+
+        for key, name in (("start_time", "start"), ("deadline", "deadline")):
+            column = columns[key]
+            epochs, inexact = _parse_times(column)
+            setattr(collection, name, _decode(column.codes, epochs, "q"))
+            collection._keep_text(column, key, inexact)
+
+        column = columns["status"]
+        statuses, completed, inexact = _parse_statuses(column)
+        collection.status = _decode(column.codes, statuses, "B")
+        collection.completed_at = _decode(column.codes, completed, "q")
+        collection._keep_text(column, "status", inexact)
+
+        column = columns["priority"]
+        table = [collection._priority_code(value) for value in column.values]
+        collection.priority = _decode(column.codes, table, "B")
+
+        collection.users = [""]  # The model has no username column
+        collection._user_codes = {"": 0}
+        collection.user = array("I", bytes(4 * rows))
+        return collection
+
+    def _keep_text(self, column, key, inexact):
+        """Remember the strings of an encoded column its codes cannot rebuild"""
+        if inexact:
+            for row, code in enumerate(column.codes):
+                if code in inexact:
+                    self._text.setdefault(row, {})[key] = column.values[code]
+
+    def _priority_code(self, priority):
+        code = self._priority_codes.get(priority)
+        if code is None:
+            code = self._priority_codes[priority] = len(self.priorities)
+            self.priorities.append(priority)
+        return code
+
+    def _user_code(self, username):
+        code = self._user_codes.get(username)
+        if code is None:
+            code = self._user_codes[username] = len(self.users)
+            self.users.append(username)
+        return code
+
+    def extend(self, tasks):
+        """Add Task objects or task dicts at the end"""
+        for task in tasks:
+            if not isinstance(task, Task):
+                task = Task.from_dict(task)
+            if task._text:
+                self._text[len(self.ids)] = dict(task._text)
+            self.ids.append(task.id)
+            self.names.append(task.name)
+            self.descriptions.append(task.description)
+            self.start.append(NO_TIME if task.start is None else task.start)
+            self.deadline.append(NO_TIME if task.deadline is None else task.deadline)
+            self.completed_at.append(
+                NO_TIME if task.completed_at is None else task.completed_at
+            )
+            self.priority.append(self._priority_code(task.priority))
+            self.status.append(task.status)
+            self.user.append(self._user_code(task.username))
+
+    def task(self, row):
+        """Return one row as a Task"""
+
+        def time_or_none(value):
+            return None if value == NO_TIME else value
+
+        task = Task(
+            self.names[row],
+            self.descriptions[row],
+            time_or_none(self.start[row]),
+            time_or_none(self.deadline[row]),
+            self.priorities[self.priority[row]],
+            Status(self.status[row]),
+            time_or_none(self.completed_at[row]),
+            self.users[self.user[row]],
+            self.ids[row],
+        )
+        if row in self._text:
+            task._text = dict(self._text[row])
+        return task
+
+    def tasks(self, rows):
+        """Return rows as task dicts, in the order given"""
+        return [self.task(row).to_dict() for row in rows]
+
+    def _column(self, name):
+        column = getattr(self, name)
+        if np is not None:
+            return np.frombuffer(column, dtype=np.dtype(COLUMNS[name]))
+        return column
+
+    def _conditions(self, status, priority, username, deadline, completed):
+        """(column name, first, last) ranges a row must fall in, or None"""
+        conditions = []
+        for name, value, codes in (
+            ("priority", priority, self._priority_codes),
+            ("user", username, self._user_codes),
+        ):
+            if value is not None:
+                if value not in codes:
+                    return None  # Nothing can match
+                conditions.append((name, codes[value], codes[value]))
+        if status is not None:
+            conditions.append(("status", int(status), int(status)))
+        for name, bounds in (("deadline", deadline), ("completed_at", completed)):
+            if bounds is not None:
+                first, last = bounds
+                first = -NO_TIME if first is None else first
+                last = NO_TIME - 1 if last is None else min(last, NO_TIME - 1)
+                conditions.append((name, first, last))
+        return conditions
+
+    def _mask(self, conditions):
+        """NumPy bool array of the rows in every range of conditions"""
+        mask = np.ones(len(self), dtype=bool)
+        for name, first, last in conditions:
+            column = self._column(name)
+            if first == last:
+                mask &= column == first
+            else:
+                mask &= (column >= first) & (column <= last)
+        return mask
+
+    def filter(
+        self, status=None, priority=None, username=None, deadline=None, completed=None
+    ):
+        """Return the rows matching every condition given, in row order
+
+        status is a Status, priority and username are strings and deadline
+        and completed are (first, last) Unix seconds, inclusive, where
+        either end may be None. Rows whose time is missing never match a
+        time range.
+        """
+        conditions = self._conditions(status, priority, username, deadline, completed)
+        if np is not None:
+            if conditions is None:
+                return np.zeros(0, dtype=np.intp)
+            return np.flatnonzero(self._mask(conditions))
+
+        if conditions is None:
+            return array("I")
+        matches = range(len(self))
+        for name, first, last in conditions:
+            column = self._column(name)
+            if first == last:
+                selectors = (column[row] == first for row in matches)
+            else:
+                selectors = (first <= column[row] <= last for row in matches)
+            matches = array("I", compress(matches, selectors))
+        return matches if isinstance(matches, array) else array("I", matches)
+
+    def count(
+        self, status=None, priority=None, username=None, deadline=None, completed=None
+    ):
+        """Count the rows filter() would return, e.g. for a badge"""
+        if np is None:
+            return len(self.filter(status, priority, username, deadline, completed))
+        conditions = self._conditions(status, priority, username, deadline, completed)
+        if conditions is None:
+            return 0
+        return int(np.count_nonzero(self._mask(conditions)))
+
+    def overdue(self, now=None):
+        """Rows still due whose deadline is at or before now"""
+        now = time.time() if now is None else now
+        return self.filter(status=Status.DUE, deadline=(None, int(now)))
+
+    def due_between(self, first, last):
+        """Rows still due with a deadline between two Unix times (inclusive)"""
+        return self.filter(status=Status.DUE, deadline=(first, last))
+
+    def sort(self, keys, rows=None):
+        """Return rows (all by default) ordered by column names
+
+        keys are column names from COLUMNS or "name" and "description",
+        each with a "-" prefix for descending order, e.g. ("-priority",
+        "deadline") for the most important and then the most urgent
+        first. Missing times sort last when ascending. The sort is stable.
+        """
+        keys = [(key.lstrip("-"), key.startswith("-")) for key in keys]
+        if np is not None and all(name in COLUMNS for name, _ in keys):
+            rows = np.arange(len(self)) if rows is None else np.asarray(rows)
+            # One stable sort per key from the last; ~ reverses any int order
+            # and keeps the uint8 codes small enough for NumPy's radix sort
+            for name, descending in reversed(keys):
+                column = self._column(name)[rows]
+                if descending:
+                    column = ~column
+                rows = rows[np.argsort(column, kind="stable")]
+            return rows
+
+        rows = list(range(len(self)) if rows is None else rows)
+        for name, descending in reversed(keys):
+            column = getattr(self, TEXT_KEYS.get(name, name))
+            rows.sort(key=column.__getitem__, reverse=descending)
+        return array("I", rows) if np is None else np.array(rows, dtype=np.intp)
+
+    def completion_counts(self, rows=None):
+        """Return {yyyy-MM-dd: number of rows completed that day}"""
+        if np is not None:
+            completed = self._column("completed_at")
+            if rows is not None:
+                completed = completed[np.asarray(rows, dtype=np.intp)]
+            completed = completed[completed != NO_TIME]
+            days, counts = np.unique(completed, return_counts=True)
+            pairs = zip(days.tolist(), counts.tolist())
+        else:
+            column = self.completed_at
+            completed = column if rows is None else (column[row] for row in rows)
+            pairs = Counter(day for day in completed if day != NO_TIME).items()
+        return {
+            time.strftime(DATE_FORMAT, time.localtime(day)): count
+            for day, count in pairs
+        }
+
+
+def _parse_times(column):
+    """(epoch per code, codes format_time() does not rebuild) of an EncodedColumn"""
+    entry = _parsed_values.get(column)
+    if entry is None:
+        entry = _parsed_values[column] = (array("q"), set())
+    epochs, inexact = entry
+    for code in range(len(epochs), len(column.values)):
+        epoch, exact = read_time(column.values[code])
+        epochs.append(NO_TIME if epoch is None else epoch)
+        if not exact:
+            inexact.add(code)
+    return entry
+
+
+def _parse_statuses(column):
+    """(Status per code, completion epoch per code, inexact codes) of a column"""
+    entry = _parsed_values.get(column)
+    if entry is None:
+        entry = _parsed_values[column] = (array("B"), array("q"), set())
+    statuses, completed, inexact = entry
+    for code in range(len(statuses), len(column.values)):
+        status, completed_at, exact = read_status(column.values[code])
+        statuses.append(status)
+        completed.append(NO_TIME if completed_at is None else completed_at)
+        if not exact:
+            inexact.add(code)
+    return entry
+
+
+def _decode(codes, table, typecode):
+    """Map a uint32 code array through a lookup table into an array"""
+    if np is not None and len(codes):
+        lookup = np.asarray(table, dtype=np.dtype(typecode))
+        values = lookup[np.frombuffer(codes, dtype=np.uint32)]
+        return array(typecode, values.tobytes())
+    return array(typecode, map(table.__getitem__, codes))
+
+
+def _benchmark(task_count):
+    """Time the bulk operations the views use over task_count tasks"""
+    rng = random.Random(1)
+    now = int(time.time())
+    statuses = [Status.DUE, Status.DONE, Status.FAILED]
+    tasks = []
+    for i in range(task_count):
+        start = now - rng.randrange(0, 365 * 86400) // 60 * 60
+        status = rng.choice(statuses)
+        completed = start // 86400 * 86400 if status != Status.DUE else None
+        tasks.append(
+            Task(
+                f"Task {i}",
+                "Write the weekly report",
+                start,
+                start + rng.randrange(1, 400 * 86400) // 60 * 60,
+                rng.choice(["Low", "Medium", "High"]),
+                status,
+                completed,
+                rng.choice(["alice", "bob", "carol"]),
+                i,
+            )
+        )
+    started = time.perf_counter()
+    collection = TaskCollection.from_tasks(tasks)
+    elapsed = time.perf_counter() - started
+    del tasks
+    print(f"{task_count} tasks ({'numpy' if np else 'array'}), built in {elapsed:.1f}s")
+
+    week = (now, now + 7 * 86400)
+    operations = {
+        "overdue": lambda: collection.overdue(now),
+        "due this week": lambda: collection.due_between(*week),
+        "count overdue": lambda: collection.count(
+            status=Status.DUE, deadline=(None, now)
+        ),
+        "count High": lambda: collection.count(priority="High"),
+        "sort -priority, deadline": lambda: collection.sort(("-priority", "deadline")),
+        "completions per day": lambda: collection.completion_counts(),
+    }
+    for label, operation in operations.items():
+        started = time.perf_counter()
+        result = operation()
+        elapsed = (time.perf_counter() - started) * 1000
+        size = result if isinstance(result, int) else len(result)
+        print(f"  {label:>24}: {elapsed:7.1f} ms ({size})")
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
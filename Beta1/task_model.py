@@ -0,0 +1,416 @@
+from array import array
+from bisect import bisect_left
+from itertools import compress
+
+from PyQt5.QtCore import (
+    QAbstractProxyModel,
+    QAbstractTableModel,
+    QModelIndex,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+
+from storage import TASK_FIELDS
+from task_collection import TaskCollection
+
+COLUMNS = TASK_FIELDS[:6]
+HEADERS = ["Name", "Description", "Start Time", "Deadline", "Priority", "Status"]
+# Columns with few distinct values, stored as codes into a value list
+ENCODED_COLUMNS = {"start_time", "deadline", "priority", "status"}
+# TaskCollection.sort() keys for each column: priorities and times sort by
+# meaning rather than text, ties going to the earliest deadline
+SORT_KEYS = {
+    "name": ("name",),
+    "description": ("description",),
+    "start_time": ("start",),
+    "deadline": ("deadline",),
+    "priority": ("priority", "deadline"),
+    "status": ("status", "deadline"),
+}
+
+
+class EncodedColumn:
+    """Dictionary-encoded string column: one uint32 code per row"""
+
+    def __init__(self):
+        self.values = []
+        self.codes = array("I")
+        self._lookup = {}
+
+    def _code(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def __setitem__(self, row, value):
+        self.codes[row] = self._code(value)
+
+    def __delitem__(self, row):
+        del self.codes[row]
+
+    def extend(self, values):
+        self.codes.extend(self._code(value) for value in values)
+
+    def reorder(self, rows):
+        """Keep only the given rows, in that order"""
+        self.codes = array("I", map(self.codes.__getitem__, rows))
+
+
+class TaskTableModel(QAbstractTableModel):
+    """Table model over column storage for task and history views
+
+    Each field is kept as its own column (see ENCODED_COLUMNS) instead of a
+    QTableWidgetItem per cell. The store id of each row is available through
+    Qt.UserRole on any column. Once sorted, rows from set_tasks() keep the
+    order and rows from append_tasks() are sorted in shortly after.
+    """
+
+    RESORT_DELAY_MS = 100  # Appends arriving in batches are sorted in once
+
+    # {old store id: new store id, or None for the deleted task} when
+    # deleting a task shifted the ids of others (see renumber())
+    idsRenumbered = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._clear()
+        self.sort_order = None  # (column, Qt.SortOrder) of the active sort
+        self._resort_timer = QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(self.RESORT_DELAY_MS)
+        self._resort_timer.timeout.connect(self._resort)
+
+    def _clear(self):
+        self.columns = {
+            key: EncodedColumn() if key in ENCODED_COLUMNS else [] for key in COLUMNS
+        }
+        self.ids = []
+
+    def _extend(self, tasks):
+        for key, column in self.columns.items():
+            column.extend(task[key] for task in tasks)
+        self.ids.extend(task.get("id") for task in tasks)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.columns[COLUMNS[index.column()]][index.row()]
+        if role == Qt.UserRole:
+            return self.ids[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_tasks(self, tasks):
+        """Replace every row in one model reset"""
+        self.beginResetModel()
+        self._clear()
+        self._extend(tasks)
+        if self.sort_order is not None:
+            self._reorder(self._sorted_rows(*self.sort_order))
+        self.endResetModel()
+
+    def append_tasks(self, tasks):
+        """Add rows at the end"""
+        if not tasks:
+            return
+        first = len(self.ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._extend(tasks)
+        self.endInsertRows()
+        if self.sort_order is not None:
+            self._resort_timer.start()
+
+    def value(self, row, key):
+        """Return one field of a row"""
+        return self.columns[key][row]
+
+    def task_id(self, row):
+        """Return the store id of a row"""
+        return self.ids[row]
+
+    def rows_of(self, task_ids):
+        """Return {store id: row} for the ids of task_ids that have a row"""
+        wanted = set(task_ids)
+        return {
+            task_id: row for row, task_id in enumerate(self.ids) if task_id in wanted
+        }
+
+    def task(self, row):
+        """Return a row as a task dict including its store id"""
+        task = {key: column[row] for key, column in self.columns.items()}
+        task["id"] = self.ids[row]
+        return task
+
+    def update_task(self, row, task):
+        """Overwrite a row, signalling only the cells that changed"""
+        for col, key in enumerate(COLUMNS):
+            column = self.columns[key]
+            if column[row] != task[key]:
+                column[row] = task[key]
+                index = self.index(row, col)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        if "id" in task:
+            self.ids[row] = task["id"]
+
+    def set_values(self, key, values):
+        """Overwrite one field of several rows ({row: value}) in one update"""
+        if not values:
+            return
+        column = self.columns[key]
+        for row, value in values.items():
+            column[row] = value
+        col = COLUMNS.index(key)
+        self.dataChanged.emit(
+            self.index(min(values), col), self.index(max(values), col), [Qt.DisplayRole]
+        )
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Reorder the rows by a column, e.g. on a QTableView header click
+
+        Descending order reverses only the first sort key, so sorting by
+        priority puts High first and then the earliest deadlines. The model
+        is reset, which the views and the objects following it handle. A
+        column of -1 (no sort indicator) keeps the rows as they are and
+        stops sorting the rows added later.
+        """
+        self._resort_timer.stop()
+        if not 0 <= column < len(COLUMNS):
+            self.sort_order = None
+            return
+        self.sort_order = column, order
+        rows = self._sorted_rows(column, order)
+        self.beginResetModel()
+        self._reorder(rows)
+        self.endResetModel()
+
+    def _resort(self):
+        if self.sort_order is not None:
+            self.sort(*self.sort_order)
+
+    def _sorted_rows(self, column, order):
+        keys = list(SORT_KEYS[COLUMNS[column]])
+        if order == Qt.DescendingOrder:
+            keys[0] = "-" + keys[0]
+        return TaskCollection.from_model(self).sort(keys).tolist()
+
+    def _reorder(self, rows):
+        for key, values in self.columns.items():
+            if key in ENCODED_COLUMNS:
+                values.reorder(rows)
+            else:
+                self.columns[key] = list(map(values.__getitem__, rows))
+        self.ids = list(map(self.ids.__getitem__, rows))
+
+    def remove_row(self, row):
+        """Remove one row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in self.columns.values():
+            del column[row]
+        del self.ids[row]
+        self.endRemoveRows()
+
+    def renumber(self, new_id, deleted_id):
+        """Give every row the id new_id(id) after deleted_id was deleted
+
+        Used when the store's ids are positions that a delete shifts, so
+        the next edit reaches the right task without waiting for a reload.
+        Listeners see idsRenumbered and then a model reset.
+        """
+        changes = {}
+        for task_id in self.ids:
+            renumbered = new_id(task_id)
+            if renumbered != task_id:
+                changes[task_id] = renumbered
+        if not changes:
+            return
+        changes[deleted_id] = None
+        self.beginResetModel()
+        self.ids = [changes.get(task_id, task_id) for task_id in self.ids]
+        self.idsRenumbered.emit(changes)
+        self.endResetModel()
+
+
+class TaskFilterModel(QAbstractProxyModel):
+    """Rows of a TaskTableModel whose ids are in a set of matches
+
+    With no matches set every source row is shown and source changes are
+    passed on as they are. While filtering, the matching source rows are
+    found lazily, only as far down as the view has asked for, so changing
+    the filter costs the same however many tasks there are. The matches
+    must be ids of source rows (see TaskSearch); whoever sets them calls
+    set_matches() again after the source rows change.
+    """
+
+    SCAN_CHUNK = 1024  # Source rows checked at a time when looking for matches
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.matches = None
+        self._clear_rows()
+
+    def _clear_rows(self):
+        self._rows = []  # Source rows of the matches found so far, in order
+        self._scanned = 0  # Source rows checked so far
+
+    def setSourceModel(self, model):
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._on_about_to_be_reset)
+        model.modelReset.connect(self._on_reset)
+        model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        self._clear_rows()
+        self.endResetModel()
+
+    def set_matches(self, matches):
+        """Show only rows whose id is in matches; None shows every row"""
+        self.beginResetModel()
+        # A copy: the index may hand out sets it keeps updating
+        self.matches = frozenset(matches) if matches is not None else None
+        self._clear_rows()
+        self.endResetModel()
+
+    def source_row(self, row):
+        """Return the source row shown in a row, or -1"""
+        if self.matches is None:
+            return row
+        rows = self._rows
+        if row >= len(rows):
+            ids = self.sourceModel().ids
+            contains = self.matches.__contains__
+            while row >= len(rows) and self._scanned < len(ids):
+                end = min(self._scanned + self.SCAN_CHUNK, len(ids))
+                found = map(contains, ids[self._scanned : end])
+                rows.extend(compress(range(self._scanned, end), found))
+                self._scanned = end
+        return rows[row] if row < len(rows) else -1
+
+    def _proxy_row(self, source_row):
+        if self.matches is None:
+            return source_row
+        self.source_row(self.rowCount() - 1)  # Scan everything
+        position = bisect_left(self._rows, source_row)
+        if position < len(self._rows) and self._rows[position] == source_row:
+            return position
+        return -1
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        if self.matches is None:
+            return self.sourceModel().rowCount()
+        return len(self.matches)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        row = self.source_row(proxy_index.row())
+        if row < 0:
+            return QModelIndex()
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self._proxy_row(source_index.row())
+        if row < 0:
+            return QModelIndex()
+        return self.createIndex(row, source_index.column())
+
+    def task(self, row):
+        """Return the task dict shown in a row"""
+        return self.sourceModel().task(self.source_row(row))
+
+    def task_id(self, row):
+        """Return the store id of the task shown in a row"""
+        return self.sourceModel().task_id(self.source_row(row))
+
+    def value(self, row, key):
+        """Return one field of the task shown in a row"""
+        return self.sourceModel().value(self.source_row(row), key)
+
+    # Source changes; while filtering the rows are reset until set_matches()
+
+    def _on_about_to_be_reset(self):
+        self.beginResetModel()
+
+    def _on_reset(self):
+        self._clear_rows()
+        self.endResetModel()
+
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        if self.matches is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+        else:
+            self.beginResetModel()
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self.matches is None:
+            self.endInsertRows()
+        else:
+            self._clear_rows()
+            self.endResetModel()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        if self.matches is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+        else:
+            self.beginResetModel()
+
+    def _on_rows_removed(self, parent, first, last):
+        if self.matches is None:
+            self.endRemoveRows()
+        else:
+            self._clear_rows()
+            self.endResetModel()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        if self.matches is None:
+            first, last = top_left.row(), bottom_right.row()
+        else:
+            # Only rows already found can be on screen
+            first = bisect_left(self._rows, top_left.row())
+            last = bisect_left(self._rows, bottom_right.row() + 1) - 1
+            if first > last:
+                return
+        self.dataChanged.emit(
+            self.index(first, top_left.column()),
+            self.index(last, bottom_right.column()),
+            roles or [],
+        )
@@ -0,0 +1,116 @@
+from PyQt5.QtCore import QObject, QTimer
+
+from search_index import FIELDS, SearchIndex, tokenize
+from task_model import COLUMNS
+
+# Columns whose text is indexed
+_INDEXED_COLUMNS = [COLUMNS.index(field) for field in FIELDS]
+
+
+class TaskSearch(QObject):
+    """Filter a TaskFilterModel by what is typed into a search box
+
+    The SearchIndex follows the source TaskTableModel: tasks added, edited,
+    deleted or moved to history are indexed or dropped one at a time as
+    the model reports them. Rows loaded in bulk are indexed a chunk at a
+    time while the app is idle. Keystrokes are debounced, then the query
+    runs against the index and the filter model shows the matches.
+    """
+
+    DEBOUNCE_MS = 120
+    INDEX_CHUNK = 500  # Rows indexed per idle pass
+
+    def __init__(self, filter_model, search_bar, parent=None):
+        super().__init__(parent)
+        self.filter_model = filter_model
+        self.model = filter_model.sourceModel()
+        self.search_bar = search_bar
+        self.index = SearchIndex()
+        self._indexed_rows = 0  # Rows before this one are in the index
+        self._removed_indexed = 0
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.apply)
+
+        self._idle = QTimer(self)
+        self._idle.setInterval(0)
+        self._idle.timeout.connect(self._index_chunk)
+
+        search_bar.textChanged.connect(self._debounce.start)
+        self.model.modelReset.connect(self._on_reset)
+        self.model.rowsInserted.connect(self._on_rows_inserted)
+        self.model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        self.model.rowsRemoved.connect(self._on_rows_removed)
+        self.model.dataChanged.connect(self._on_data_changed)
+        self._on_reset()
+
+    def _index_row(self, row):
+        task = {field: self.model.value(row, field) for field in FIELDS}
+        self.index.add(self.model.task_id(row), task)
+
+    def _index_rows(self, end):
+        for row in range(self._indexed_rows, end):
+            self._index_row(row)
+        self._indexed_rows = max(self._indexed_rows, end)
+
+    def _index_chunk(self):
+        total = self.model.rowCount()
+        self._index_rows(min(total, self._indexed_rows + self.INDEX_CHUNK))
+        if self._indexed_rows >= total:
+            self._idle.stop()
+
+    def _filtering(self):
+        return self.filter_model.matches is not None
+
+    def _changed(self):
+        # The filter's matches refer to rows that just changed
+        if self._filtering():
+            self.apply()
+        if self._indexed_rows < self.model.rowCount():
+            self._idle.start()
+
+    def _on_reset(self):
+        self.index.clear()
+        self._indexed_rows = 0
+        self._changed()
+
+    def _on_rows_inserted(self, parent, first, last):
+        if first < self._indexed_rows:
+            # Inserted among indexed rows: index them now
+            for row in range(first, last + 1):
+                self._index_row(row)
+            self._indexed_rows += last - first + 1
+        self._changed()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        end = min(last + 1, self._indexed_rows)
+        for row in range(first, end):
+            self.index.remove(self.model.task_id(row))
+        self._removed_indexed = max(0, end - first)
+
+    def _on_rows_removed(self, parent, first, last):
+        self._indexed_rows -= self._removed_indexed
+        self._changed()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        columns = range(top_left.column(), bottom_right.column() + 1)
+        if not any(column in columns for column in _INDEXED_COLUMNS):
+            return
+        end = min(bottom_right.row() + 1, self._indexed_rows)
+        for row in range(top_left.row(), end):
+            self._index_row(row)
+        if self._filtering():
+            self._debounce.start()
+
+    def apply(self):
+        """Filter the list by the search box text now"""
+        self._debounce.stop()
+        query = self.search_bar.text()
+        if not tokenize(query):
+            if self._filtering():
+                self.filter_model.set_matches(None)
+            return
+        self._index_rows(self.model.rowCount())  # Matches must cover every row
+        self.filter_model.set_matches(self.index.search(query))
@@ -0,0 +1,113 @@
+from block_index import BLOCK_LINES, BlockIndex
+from codec import encode
+from mapped_reader import MappedLineReader
+from storage import TextTaskStore
+
+
+def make_task(name, date, username="alice"):
+    return {
+        "name": name,
+        "description": f"About {name}",
+        "start_time": "2024-01-01 09:00",
+        "deadline": "2024-01-02 17:00",
+        "priority": "Medium",
+        "status": f"done ✅ - Completed on {date}",
+        "username": username,
+    }
+
+
+def write_history(path, months, username_of=lambda month: "alice"):
+    """Write one block of BLOCK_LINES records per month"""
+    with open(path, "w", encoding="utf-8") as file:
+        for month in months:
+            for line in range(BLOCK_LINES):
+                date = f"2024-{month:02d}-{line % 28 + 1:02d}"
+                task = make_task(f"t{month}-{line}", date, username_of(month))
+                file.write(encode(task) + "\n")
+
+
+def refreshed(path):
+    index = BlockIndex(path)
+    with MappedLineReader(path) as reader:
+        index.refresh(reader)
+    return index
+
+
+def test_blocks_outside_the_date_range_are_skipped(tmp_path):
+    path = str(tmp_path / "history.txt")
+    write_history(path, [1, 2, 3])
+    index = refreshed(path)
+
+    total = 3 * BLOCK_LINES
+    assert index.line_ranges(total, "2024-02-01", "2024-02-29") == [
+        (BLOCK_LINES, 2 * BLOCK_LINES)
+    ]
+    assert index.line_ranges(total, "2024-02-15", "2024-03-05") == [
+        (BLOCK_LINES, total)  # Adjacent blocks are merged
+    ]
+    assert index.line_ranges(total, "2025-01-01", "2025-12-31") == []
+
+
+def test_blocks_without_the_user_are_skipped(tmp_path):
+    path = str(tmp_path / "history.txt")
+    write_history(path, [1, 2, 3], lambda month: "bob" if month == 2 else "alice")
+    index = refreshed(path)
+
+    total = 3 * BLOCK_LINES
+    assert index.line_ranges(total, username="bob") == [
+        (BLOCK_LINES, 2 * BLOCK_LINES)
+    ]
+    assert index.line_ranges(total, username="alice") == [
+        (0, BLOCK_LINES),
+        (2 * BLOCK_LINES, total),
+    ]
+
+
+def test_appended_lines_extend_the_saved_index(tmp_path):
+    path = str(tmp_path / "history.txt")
+    write_history(path, [1])
+    refreshed(path)
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(encode(make_task("late", "2024-06-01")) + "\n")
+
+    # Lines past the indexed part are always scanned
+    stale = BlockIndex(path)
+    assert stale.line_ranges(BLOCK_LINES + 1, "2024-06-01", "2024-06-30") == [
+        (BLOCK_LINES, BLOCK_LINES + 1)
+    ]
+    index = refreshed(path)
+    assert len(index.blocks) == 2
+    assert index.line_ranges(BLOCK_LINES + 1, "2024-06-01", "2024-06-30") == [
+        (BLOCK_LINES, BLOCK_LINES + 1)
+    ]
+
+
+def test_rewritten_file_is_indexed_again(tmp_path):
+    path = str(tmp_path / "history.txt")
+    write_history(path, [1, 2])
+    refreshed(path)
+    write_history(path, [5])
+
+    index = refreshed(path)
+    assert index.lines_indexed == BLOCK_LINES
+    assert index.line_ranges(BLOCK_LINES, "2024-01-01", "2024-02-29") == []
+    assert index.line_ranges(BLOCK_LINES, "2024-05-01", "2024-05-31") == [
+        (0, BLOCK_LINES)
+    ]
+
+
+def test_pruned_queries_match_a_full_scan(tmp_path):
+    path = str(tmp_path / "history.txt")
+    write_history(path, [1, 2, 3], lambda month: ["alice", "bob", "carol"][month - 1])
+    indexed = TextTaskStore(path, block_index=True)
+    plain = TextTaskStore(path, block_index=False)
+
+    for start, end, username in [
+        ("2024-02-10", "2024-03-02", None),
+        ("2024-01-01", "2024-12-31", "carol"),
+        ("2024-02-05", "2024-02-06", "bob"),
+        ("2024-01-05", "2024-01-06", "bob"),  # Pruned to nothing
+    ]:
+        assert indexed.load_completed(start, end, username) == plain.load_completed(
+            start, end, username
+        )
@@ -0,0 +1,66 @@
+from codec import SEPARATOR, decode, decode_many, encode, escape, unescape
+
+AWKWARD = "a | b|c \\ d\\|e\nline two\r\\n"
+
+
+def make_task(**values):
+    task = {
+        "name": "Write report",
+        "description": "Quarterly numbers",
+        "start_time": "2024-05-01 09:00",
+        "deadline": "2024-05-03 17:00",
+        "priority": "High",
+        "status": "due",
+        "username": "alice",
+    }
+    task.update(values)
+    return task
+
+
+def test_separators_and_backslashes_round_trip():
+    task = make_task(name=AWKWARD, description="ends with \\", username="a|b")
+    line = encode(task)
+    assert "\n" not in line
+    assert line.count(SEPARATOR) == 6
+    assert decode(line) == task
+    assert decode(line.encode("utf-8")) == task
+
+
+def test_escaped_values_never_contain_the_separator():
+    assert SEPARATOR not in escape(AWKWARD)
+    assert unescape(escape(AWKWARD)) == AWKWARD
+
+
+def test_legacy_backslashes_are_kept():
+    line = "Paths | C:\\Users\\temp | 09:00 | 17:00 | Low | due"
+    assert decode(line)["description"] == "C:\\Users\\temp"
+
+
+def test_beta1_lines_have_no_username():
+    task = make_task(username="")
+    line = encode(task)
+    assert line.count(SEPARATOR) == 5
+    assert decode(line) == task
+
+
+def test_malformed_lines_decode_to_none():
+    assert decode("only | three | fields") is None
+    assert decode(" | ".join("x" * 8)) is None
+
+
+def test_decode_many_matches_decode():
+    lines = [
+        encode(make_task()),
+        encode(make_task(name=AWKWARD, status="done ✅ - Completed on 2024-05-02")),
+        "not a task",
+        encode(make_task(username="")),
+    ]
+    data = "\n".join(lines) + "\n"
+
+    assert decode_many(data) == [decode(line) for line in lines]
+    assert decode_many(data.encode("utf-8")) == [decode(line) for line in lines]
+    assert decode_many(data, ["name", "username"]) == [
+        (task["name"], task["username"]) if task else None
+        for task in map(decode, lines)
+    ]
+    assert decode_many(data, ["name"])[1] == (AWKWARD,)
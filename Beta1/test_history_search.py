@@ -0,0 +1,67 @@
+import json
+
+from history_search import HistoryFullText
+from storage import SegmentedHistoryStore
+
+
+def make_task(name, description="", date="2024-05-01"):
+    return {
+        "name": name,
+        "description": description,
+        "start_time": "2024-04-01 09:00",
+        "deadline": "2024-05-01 17:00",
+        "priority": "Medium",
+        "status": f"done ✅ - Completed on {date}",
+        "username": "",
+    }
+
+
+def indexed_store(tmp_path, tasks):
+    store = SegmentedHistoryStore(str(tmp_path / "history.txt"))
+    for task in tasks:
+        store.add(task)
+    index = HistoryFullText(store.path)
+    index.sync(store)
+    return store, index
+
+
+def test_every_match_is_ranked(tmp_path):
+    tasks = [make_task("budget review")]
+    tasks += [make_task(f"note {i}", "budget figures and more") for i in range(2500)]
+    _, index = indexed_store(tmp_path, tasks)
+
+    results = index.search("budget", limit=5)
+    assert results[0]["name"] == "budget review"  # The oldest record
+    assert len(results) == 5
+    assert index.search("budget", status="failed") == []
+
+
+def test_edits_in_place_update_the_row(tmp_path):
+    store, index = indexed_store(tmp_path, [make_task("draft"), make_task("other")])
+    task = store.load()[0]
+    before = store.stamp()
+    store.update(task["id"], dict(task, name="final"))
+    index.update(task["id"], dict(task, name="final"), before, store.stamp())
+
+    assert index.stamp == json.dumps(store.stamp())  # No rebuild needed
+    assert [result["id"] for result in index.search("final")] == [task["id"]]
+    assert index.search("draft") == []
+
+
+def test_moved_records_are_reindexed_by_sync(tmp_path):
+    store, index = indexed_store(
+        tmp_path,
+        [make_task("first", date="2024-03-01"), make_task("second", date="2024-03-02")],
+    )
+    first = store.load()[0]
+    moved = make_task("first", date="2024-06-01")
+    before = store.stamp()
+    moved["id"] = store.update(first["id"], moved)
+    index.update(first["id"], moved, before, store.stamp())
+
+    # The move shifted the id of "second" too, which only a rebuild picks up
+    assert index.stamp != json.dumps(store.stamp())
+    index.sync(store)
+    ids = {task["name"]: task["id"] for task in store.load()}
+    assert [result["id"] for result in index.search("first")] == [ids["first"]]
+    assert [result["id"] for result in index.search("second")] == [ids["second"]]
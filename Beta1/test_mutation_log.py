@@ -0,0 +1,118 @@
+import threading
+
+from mutation_log import MutationLog
+from storage import LoggedTaskStore
+
+
+def make_task(name, status="due"):
+    return {
+        "name": name,
+        "description": f"About {name}",
+        "start_time": "2024-05-01 09:00",
+        "deadline": "2024-05-02 17:00",
+        "priority": "Medium",
+        "status": status,
+        "username": "alice",
+    }
+
+
+def names(store):
+    return {task["id"]: (task["name"], task["status"]) for task in store.load()}
+
+
+def test_mutations_survive_reopening(tmp_path):
+    path = str(tmp_path / "tasks.txt")
+    store = LoggedTaskStore(path)
+    first = store.add(make_task("a"))
+    second = store.add(make_task("b"))
+    third = store.add(make_task("c"))
+    store.update(first, make_task("a2"))
+    store.delete(second)
+    store.set_statuses({first: "failed ❌", third: "failed ❌"})
+    expected = names(store)
+    store.close()
+
+    reopened = LoggedTaskStore(path)
+    assert names(reopened) == expected
+    assert expected == {first: ("a2", "failed ❌"), third: ("c", "failed ❌")}
+    reopened.close()
+
+
+def test_torn_last_record_is_skipped(tmp_path):
+    path = str(tmp_path / "log.wal")
+    MutationLog.write_file(path, [{"op": "base"}, {"op": "add", "id": 0}])
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('{"op": "del')  # Crash in the middle of a write
+    assert MutationLog.read(path) == [{"op": "base"}, {"op": "add", "id": 0}]
+
+
+def test_compaction_folds_the_log_into_the_snapshot(tmp_path):
+    path = str(tmp_path / "tasks.txt")
+    store = LoggedTaskStore(path)
+    for index in range(5):
+        store.add(make_task(f"t{index}"))
+    store.delete(1)
+    store.set_status(3, "failed ❌")
+    expected = names(store)
+    store.compact()
+
+    log = MutationLog.read(store.log_path)
+    assert len(log) == 1 and log[0]["op"] == "base"
+    assert log[0]["ids"] == [0, 2, 3, 4]
+    with open(path, encoding="utf-8") as file:
+        assert len(file.readlines()) == 4
+    store.close()
+
+    reopened = LoggedTaskStore(path)
+    assert names(reopened) == expected
+    reopened.close()
+
+
+def test_records_logged_during_compaction_are_kept(tmp_path):
+    path = str(tmp_path / "tasks.txt")
+    store = LoggedTaskStore(path)
+    store.add(make_task("before"))
+    # Stand in for a compaction that has taken its snapshot but not finished
+    store._tail = []
+    store.add(make_task("during"))
+    store._finish_compaction(store._write_snapshot([(0, store.load()[0])]), [0])
+    store.close()
+
+    reopened = LoggedTaskStore(path)
+    assert sorted(name for name, _ in names(reopened).values()) == [
+        "before",
+        "during",
+    ]
+    reopened.close()
+
+
+def test_deleted_ids_are_never_reused(tmp_path):
+    path = str(tmp_path / "tasks.txt")
+    store = LoggedTaskStore(path)
+    store.add(make_task("a"))
+    last = store.add(make_task("b"))
+    store.delete(last)
+    store.compact()
+    store.close()
+
+    reopened = LoggedTaskStore(path)
+    assert reopened.add(make_task("c")) == last + 1
+    reopened.close()
+
+
+def test_concurrent_writers_get_distinct_ids(tmp_path):
+    store = LoggedTaskStore(str(tmp_path / "tasks.txt"))
+    ids = []
+
+    def write(prefix):
+        for index in range(20):
+            ids.append(store.add(make_task(f"{prefix}{index}")))
+
+    threads = [threading.Thread(target=write, args=(name,)) for name in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(ids) == list(range(80))
+    assert store.count() == 80
+    store.close()
@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+import slotted
+from codec import encode
+from slotted import FIELD_WIDTHS, SlottedFile, convert_text_file
+from storage import SlottedTaskStore
+
+
+def make_task(name, status="due"):
+    return {
+        "name": name,
+        "description": f"About {name}",
+        "start_time": "2024-05-01 09:00",
+        "deadline": "2024-05-02 17:00",
+        "priority": "Medium",
+        "status": status,
+        "username": "alice",
+    }
+
+
+def test_status_is_rewritten_in_place(tmp_path):
+    slots = SlottedFile(str(tmp_path / "tasks.slots"))
+    first = slots.append(make_task("a"))
+    second = slots.append(make_task("b"))
+    size = os.path.getsize(slots.path)
+
+    slots.write_field(first, "status", "done ✅ - Completed on 2024-05-02")
+    assert os.path.getsize(slots.path) == size
+    assert slots.read(first) == make_task("a", "done ✅ - Completed on 2024-05-02")
+    assert slots.read(second) == make_task("b")
+    slots.close()
+
+
+def test_wide_values_go_to_the_overflow_file(tmp_path):
+    slots = SlottedFile(str(tmp_path / "tasks.slots"))
+    task = make_task("n" * (FIELD_WIDTHS["name"] + 1))
+    task["description"] = "ü" * FIELD_WIDTHS["description"]  # Two bytes each
+    slot = slots.append(task)
+    slots.close()
+
+    reopened = SlottedFile(str(tmp_path / "tasks.slots"))
+    assert reopened.read(slot) == task
+    assert os.path.getsize(reopened.overflow_path) > 0
+    reopened.close()
+
+
+def test_freed_slots_are_reused(tmp_path):
+    slots = SlottedFile(str(tmp_path / "tasks.slots"))
+    for name in "abc":
+        slots.append(make_task(name))
+    slots.free(0)
+    slots.free(2)
+    assert slots.read(0) is None
+    assert [slot for slot, _ in slots.records()] == [1]
+    assert {slots.append(make_task("d")), slots.append(make_task("e"))} == {0, 2}
+    assert slots.append(make_task("f")) == 3
+    slots.close()
+
+
+def test_double_free_is_rejected(tmp_path):
+    slots = SlottedFile(str(tmp_path / "tasks.slots"))
+    slot = slots.append(make_task("a"))
+    slots.free(slot)
+    with pytest.raises(ValueError):
+        slots.free(slot)
+    with pytest.raises(ValueError):
+        slots.free(5)  # Never allocated
+    assert slots.append(make_task("b")) != slots.append(make_task("c"))
+    slots.close()
+
+
+def test_interrupted_conversion_leaves_no_slot_file(tmp_path, monkeypatch):
+    text_path = tmp_path / "tasks.txt"
+    text_path.write_text(
+        "".join(encode(make_task(name)) + "\n" for name in "abc"), encoding="utf-8"
+    )
+    slot_path = str(tmp_path / "tasks.slots")
+    decode = slotted.decode
+    calls = []
+
+    def failing_decode(line):
+        calls.append(line)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return decode(line)
+
+    monkeypatch.setattr(slotted, "decode", failing_decode)
+    with pytest.raises(OSError):
+        convert_text_file(str(text_path), slot_path)
+    assert not os.path.exists(slot_path)
+
+    monkeypatch.setattr(slotted, "decode", decode)
+    store = SlottedTaskStore(str(text_path))
+    assert [task["name"] for task in store.load()] == ["a", "b", "c"]
+    store.close()
+
+
+def test_store_changes_survive_reopening(tmp_path):
+    path = str(tmp_path / "tasks.txt")
+    store = SlottedTaskStore(path)
+    first = store.add(make_task("a"))
+    second = store.add(make_task("b"))
+    store.set_status(first, "failed ❌")
+    store.delete(second)
+    store.close()
+
+    reopened = SlottedTaskStore(path)
+    assert reopened.load() == [dict(make_task("a", "failed ❌"), id=first)]
+    reopened.close()
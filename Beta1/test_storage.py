@@ -0,0 +1,157 @@
+import os
+
+import pytest
+
+import storage
+from storage import (
+    BACKENDS,
+    SegmentedHistoryStore,
+    TextTaskStore,
+    open_store,
+    open_user_store,
+    split_by_user,
+)
+
+
+def make_task(name, username="alice", status="due"):
+    return {
+        "name": name,
+        "description": f"About {name}",
+        "start_time": "2024-05-01 09:00",
+        "deadline": "2024-05-02 17:00",
+        "priority": "Medium",
+        "status": status,
+        "username": username,
+    }
+
+
+def done_on(name, date):
+    return make_task(name, status=f"done ✅ - Completed on {date}")
+
+
+def names(store):
+    return sorted(task["name"] for task in store.load())
+
+
+@pytest.fixture(params=["text", "sqlite"])
+def backend(request, monkeypatch):
+    monkeypatch.setattr(storage, "_open_stores", {})
+    return request.param
+
+
+def test_split_moves_owned_records_into_shards(tmp_path, backend):
+    path = str(tmp_path / "tasks.txt")
+    shared = open_store(path, backend)
+    for name, username in [("a", "alice"), ("b", "bob"), ("c", ""), ("d", "alice")]:
+        shared.add(make_task(name, username))
+
+    assert names(open_user_store(path, "alice", backend)) == ["a", "d"]
+    assert names(open_user_store(path, "bob", backend)) == ["b"]
+    assert names(shared) == ["c"]
+    assert not os.path.exists(str(tmp_path / "tasks.split.json"))
+
+
+def test_interrupted_split_does_not_duplicate_records(tmp_path, backend):
+    path = str(tmp_path / "tasks.txt")
+    shared = open_store(path, backend)
+    shared.add(make_task("a", "alice"))
+    shared.add(make_task("b", "bob"))
+
+    replace_all = shared.replace_all
+
+    def crash(tasks):
+        raise OSError("killed before the shared file was truncated")
+
+    shared.replace_all = crash
+    with pytest.raises(OSError):
+        split_by_user(path, backend)
+    assert os.path.exists(str(tmp_path / "tasks.split.json"))
+
+    shared.replace_all = replace_all
+    split_by_user(path, backend)
+    assert names(open_user_store(path, "alice", backend)) == ["a"]
+    assert names(open_user_store(path, "bob", backend)) == ["b"]
+    assert names(shared) == []
+
+
+def test_split_is_skipped_until_the_shared_file_changes(
+    tmp_path, backend, monkeypatch
+):
+    path = str(tmp_path / "tasks.txt")
+    open_store(path, backend).add(make_task("a", "alice"))
+    split_by_user(path, backend)
+
+    # A fresh process has no open stores, but must not load the file again
+    monkeypatch.setattr(storage, "_open_stores", {})
+    loads = []
+    load = BACKENDS[backend].load
+
+    def counting_load(self):
+        loads.append(self.path)
+        return load(self)
+
+    monkeypatch.setattr(BACKENDS[backend], "load", counting_load)
+    split_by_user(path, backend)
+    assert loads == []
+
+    open_store(path, backend).add(make_task("b", "alice"))
+    assert names(open_user_store(path, "alice", backend)) == ["a", "b"]
+    assert os.path.abspath(path) in map(os.path.abspath, loads)
+
+
+def test_legacy_history_is_filed_into_monthly_segments(tmp_path):
+    path = str(tmp_path / "history.txt")
+    legacy = TextTaskStore(path)
+    for task in [
+        done_on("a", "2024-03-05"),
+        done_on("b", "2024-03-20"),
+        done_on("c", "2024-04-01"),
+        make_task("d", status="failed ❌"),
+    ]:
+        legacy.add(task)
+
+    history = SegmentedHistoryStore(path)
+    assert history.manifest == {
+        "2024-03": {"rows": 2, "first": "2024-03-05", "last": "2024-03-20"},
+        "2024-04": {"rows": 1, "first": "2024-04-01", "last": "2024-04-01"},
+        "undated": {"rows": 1, "first": "", "last": ""},
+    }
+    assert names(history) == ["a", "b", "c", "d"]
+    assert SegmentedHistoryStore(path).count() == 4
+
+
+def test_range_queries_only_open_overlapping_segments(tmp_path, monkeypatch):
+    history = SegmentedHistoryStore(str(tmp_path / "history.txt"))
+    for name, date in [("a", "2024-01-10"), ("b", "2024-02-10"), ("c", "2024-03-10")]:
+        history.add(done_on(name, date))
+    history.add(make_task("d", status="failed ❌"))
+
+    opened = []
+    segment = history._segment
+
+    def recording_segment(key):
+        opened.append(key)
+        return segment(key)
+
+    monkeypatch.setattr(history, "_segment", recording_segment)
+    tasks = history.load_completed("2024-02-01", "2024-03-01")
+    assert [task["name"] for task in tasks] == ["b"]
+    assert opened == ["2024-02"]
+
+
+def test_moving_a_record_to_another_month_updates_the_manifest(tmp_path):
+    path = str(tmp_path / "history.txt")
+    history = SegmentedHistoryStore(path)
+    first = history.add(done_on("a", "2024-03-05"))
+    history.add(done_on("b", "2024-03-20"))
+    history.update(first, done_on("a", "2024-05-01"))
+
+    reopened = SegmentedHistoryStore(path)
+    assert reopened.manifest["2024-03"]["rows"] == 1
+    assert reopened.manifest["2024-05"] == {
+        "rows": 1,
+        "first": "2024-05-01",
+        "last": "2024-05-01",
+    }
+    moved = reopened.load_completed("2024-05-01", "2024-05-31")
+    assert [task["name"] for task in moved] == ["a"]
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+import task_collection
+from task import Status, parse_status, parse_time
+from task_collection import TaskCollection
+
+
+@pytest.fixture(params=["array", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test with the array module and again with NumPy"""
+    if request.param == "numpy":
+        monkeypatch.setattr(task_collection, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(task_collection, "np", None)
+    return request.param
+
+
+def make_task(name, deadline, status="due", priority="Medium", username="alice"):
+    return {
+        "name": name,
+        "description": f"About {name}",
+        "start_time": "2024-05-01 09:00",
+        "deadline": deadline,
+        "priority": priority,
+        "status": status,
+        "username": username,
+    }
+
+
+TASKS = [
+    make_task("late", "2024-05-02 17:00"),
+    make_task("later", "2024-05-09 17:00", priority="High", username="bob"),
+    make_task("done", "2024-05-03 17:00", "done ✅ - Completed on 2024-05-03"),
+    make_task("failed", "2024-05-03 17:00", "failed ❌", priority="Low"),
+    make_task("pending", "2024-05-03 17:00", "Pending on 2024-05-03"),
+    make_task("undated", "someday"),
+]
+
+
+def test_counts_by_status_priority_and_user(backend):
+    tasks = TaskCollection.from_tasks(TASKS)
+    assert tasks.count() == 6
+    assert tasks.count(status=Status.DUE) == 3
+    assert tasks.count(status=Status.DONE) == 1
+    assert tasks.count(status=Status.OTHER) == 1
+    assert tasks.count(priority="High") == 1
+    assert tasks.count(username="alice", status=Status.DUE) == 2
+    assert tasks.count(username="nobody") == 0
+    assert tasks.count(priority="Urgent") == 0
+
+
+def test_overdue_and_due_between(backend):
+    tasks = TaskCollection.from_tasks(TASKS)
+    now = parse_time("2024-05-05 12:00")
+    # The task without a readable deadline is never overdue
+    assert [task["name"] for task in tasks.tasks(tasks.overdue(now))] == ["late"]
+    week = tasks.due_between(now, parse_time("2024-05-12 00:00"))
+    assert [task["name"] for task in tasks.tasks(week)] == ["later"]
+
+
+def test_completion_counts(backend):
+    tasks = TaskCollection.from_tasks(TASKS)
+    assert tasks.completion_counts() == {"2024-05-03": 2}  # done and pending
+    assert tasks.completion_counts([0, 2]) == {"2024-05-03": 1}
+
+
+def test_counts_match_a_plain_scan(backend):
+    rng = random.Random(1)
+    statuses = ["due", "failed ❌", "done ✅ - Completed on 2024-05-0{}"]
+    records = [
+        make_task(
+            f"t{i}",
+            f"2024-05-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00",
+            rng.choice(statuses).format(rng.randint(1, 9)),
+            rng.choice(["Low", "Medium", "High"]),
+            rng.choice(["alice", "bob", "carol"]),
+        )
+        for i in range(500)
+    ]
+    tasks = TaskCollection.from_tasks(records)
+    first, last = parse_time("2024-05-10 00:00"), parse_time("2024-05-20 00:00")
+    for status in Status:
+        for priority in ["Low", "High"]:
+            expected = [
+                i
+                for i, record in enumerate(records)
+                if parse_status(record["status"])[0] == status
+                and record["priority"] == priority
+                and first <= parse_time(record["deadline"]) <= last
+            ]
+            rows = tasks.filter(status, priority, deadline=(first, last))
+            assert list(rows) == expected
+            assert tasks.count(status, priority, deadline=(first, last)) == len(
+                expected
+            )
+
+
+def test_sort_and_round_trip(backend):
+    tasks = TaskCollection.from_tasks(TASKS)
+    rows = tasks.sort(["-priority", "deadline"])
+    names = [task["name"] for task in tasks.tasks(rows)]
+    assert names == ["later", "late", "done", "pending", "undated", "failed"]
+    # Strings the parsed values cannot rebuild come back as written
+    assert tasks.tasks(range(len(TASKS))) == TASKS
@@ -0,0 +1,53 @@
+import random
+
+from timer_wheel import TimerWheel
+
+
+def test_timers_fire_on_their_tick_across_levels():
+    # Small levels, so timers cascade down and some start in the overflow
+    wheel = TimerWheel(1000, slot_bits=2, levels=3)
+    rng = random.Random(1)
+    due = {}
+    for key in range(500):
+        due[key] = 1000 + rng.randrange(1, 300)
+        wheel.add(key, due[key])
+
+    for tick in range(1001, 1301):
+        fired = wheel.advance(tick)
+        assert sorted(fired) == sorted(key for key, at in due.items() if at == tick)
+    assert len(wheel) == 0
+
+
+def test_advancing_many_ticks_fires_in_tick_order():
+    wheel = TimerWheel(0, slot_bits=3, levels=2)
+    for key, tick in [("c", 90), ("a", 5), ("b", 64), ("d", 1000)]:
+        wheel.add(key, tick)
+    assert wheel.advance(100) == ["a", "b", "c"]
+    assert wheel.advance(1000) == ["d"]
+
+
+def test_cancelled_and_moved_timers():
+    wheel = TimerWheel(0)
+    wheel.add("gone", 10)
+    wheel.add("moved", 10)
+    wheel.cancel("gone")
+    wheel.cancel("never added")
+    wheel.add("moved", 5000)  # Adding again replaces the pending timer
+    assert "gone" not in wheel and len(wheel) == 1
+    assert wheel.advance(4999) == []
+    assert wheel.advance(5000) == ["moved"]
+
+
+def test_past_ticks_fire_on_the_next_tick():
+    wheel = TimerWheel(100)
+    wheel.add("late", 50)
+    assert wheel.advance(100) == []
+    assert wheel.advance(101) == ["late"]
+
+
+def test_idle_ticks_are_skipped():
+    wheel = TimerWheel(0)
+    assert wheel.advance(10**9) == []
+    assert wheel.now == 10**9
+    wheel.add("next", 10**9 + 3)
+    assert wheel.advance(10**9 + 3) == ["next"]
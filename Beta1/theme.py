@@ -0,0 +1,309 @@
+import sys
+import time
+from functools import lru_cache
+
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QApplication
+
+PRIORITY_COLORS = {
+    "High": "#FF4444",
+    "Medium": "#FF8C00",
+    "Low": "#FFD700",
+    "None": "#999",
+}
+DEFAULT_PRIORITY_COLOR = "#999"
+
+# Rules are matched by objectName (#name) and dynamic properties ([name="value"]),
+# so widgets only need setObjectName()/setProperty() instead of their own CSS
+SECTIONS = {
+    "main_window": """
+        QWidget#mainWindow {
+            background-color: #F0FBFF;
+        }
+        QLabel#taskCount {
+            background-color: #E3F8FF;
+            color: #00B4D8;
+            padding: 5px 15px;
+            border-radius: 15px;
+            font-size: 18px;
+            font-weight: bold;
+        }
+        QPushButton#addButton {
+            background-color: #00B4D8;
+            color: white;
+            border: none;
+            border-radius: 15px;
+            padding: 8px 20px;
+            font-weight: bold;
+        }
+        QPushButton#addButton:hover {
+            background-color: #0096B7;
+        }
+        QListView#taskList {
+            border: none;
+            background-color: transparent;
+        }
+        QLabel#sectionTitle {
+            color: #333;
+        }
+    """,
+    "header": """
+        QWidget#header, QWidget#header QWidget {
+            background-color: white;
+        }
+        QWidget#header QLabel#logoText {
+            color: #00B4D8;
+        }
+        QWidget#header QLineEdit#searchBar {
+            border: 1px solid #ccc;
+            border-radius: 15px;
+            padding: 5px 15px;
+            background: white;
+            min-width: 300px;
+            height: 30px;
+        }
+        QWidget#header QPushButton#notificationButton {
+            border: none;
+            background: transparent;
+            padding-right: 20px;
+        }
+        QWidget#header QLabel#notificationBadge {
+            background-color: #FF4444;
+            color: white;
+            border-radius: 8px;
+            padding: 0 4px;
+            min-width: 8px;
+            font-size: 11px;
+            font-weight: bold;
+        }
+        QFrame#notificationPanel {
+            background-color: white;
+            border: 1px solid #ccc;
+            border-radius: 8px;
+        }
+        QListWidget#notificationList {
+            border: none;
+        }
+        QPushButton#notificationClear {
+            border: none;
+            color: #00B4D8;
+        }
+    """,
+    "sidebar": """
+        QWidget#sidebar {
+            background-color: #E3F8FF;
+            border-right: none;
+        }
+        QPushButton#sidebarButton {
+            text-align: left;
+            padding: 12px 20px;
+            border: none;
+            border-radius: 8px;
+            margin: 4px 12px;
+            color: #333;
+            font-size: 15px;
+            font-weight: 500;
+            background-color: transparent;
+        }
+        QPushButton#sidebarButton:hover {
+            background-color: rgba(0, 180, 216, 0.08);
+            color: #00B4D8;
+        }
+        QPushButton#sidebarButton:checked {
+            background-color: rgba(0, 180, 216, 0.15);
+            color: #00B4D8;
+            font-weight: 600;
+        }
+        QPushButton#sidebarButton:checked:hover {
+            background-color: rgba(0, 180, 216, 0.2);
+        }
+    """,
+    "task_card": """
+        QFrame#taskCard {
+            background-color: white;
+            border-radius: 10px;
+            margin: 5px;
+            padding: 10px;
+        }
+        QFrame#taskCard:hover {
+            background-color: #f5f5f5;
+        }
+        QPushButton#taskCheckbox {
+            border: 2px solid #ccc;
+            border-radius: 12px;
+            background-color: white;
+        }
+        QPushButton#taskCheckbox:checked {
+            background-color: #00B4D8;
+            border-color: #00B4D8;
+        }
+        QLabel#taskDescription {
+            color: #666;
+        }
+        QPushButton#priorityPill {
+            background-color: %(default_priority)s;
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 5px;
+        }
+        %(priority_rules)s
+        QPushButton#statusPill {
+            background-color: #eee;
+            border: none;
+            border-radius: 10px;
+            padding: 5px;
+        }
+    """,
+    "auth": """
+        QDialog#authDialog {
+            background: qlineargradient(
+                x1: 0, y1: 0, x2: 1, y2: 1,
+                stop: 0 #E0F7FA,
+                stop: 1 #B2EBF2
+            );
+        }
+        QDialog#authDialog QLabel {
+            color: #333;
+            font-size: 18px;
+        }
+        QDialog#authDialog QLabel#authTitle {
+            font-size: 48px;
+        }
+        QDialog#authDialog QLabel#authHint {
+            color: #666;
+        }
+        QDialog#authDialog QLineEdit {
+            padding: 12px;
+            border: 1px solid #E0E0E0;
+            border-radius: 6px;
+            background: white;
+            font-size: 18px;
+            min-width: 300px;
+        }
+        QDialog#authDialog QPushButton#loginBtn {
+            background-color: #2196F3;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 12px;
+            font-size: 18px;
+            min-width: 300px;
+        }
+        QDialog#authDialog QPushButton#loginBtn:hover {
+            background-color: #1976D2;
+        }
+        QDialog#authDialog QPushButton#registerBtn {
+            background: none;
+            border: none;
+            color: #2196F3;
+            text-decoration: underline;
+            font-size: 18px;
+        }
+        QDialog#authDialog QPushButton#registerBtn:hover {
+            color: #1976D2;
+        }
+        QDialog#authDialog QLabel#errorLabel {
+            color: #F44336;
+            font-size: 14px;
+        }
+    """,
+}
+
+
+def _priority_rules():
+    return "\n".join(
+        f'QPushButton#priorityPill[priority="{priority}"] '
+        f"{{ background-color: {color}; }}"
+        for priority, color in PRIORITY_COLORS.items()
+    )
+
+
+def section(name):
+    """Return one section of the stylesheet with its placeholders filled in"""
+    return SECTIONS[name] % {
+        "default_priority": DEFAULT_PRIORITY_COLOR,
+        "priority_rules": _priority_rules(),
+    }
+
+
+@lru_cache(maxsize=None)
+def stylesheet():
+    """Return the application stylesheet, built once"""
+    return "\n".join(section(name) for name in SECTIONS)
+
+
+def apply(app=None):
+    """Install the stylesheet on the application unless it already has it
+
+    Qt parses the sheet once here; widgets created afterwards are only
+    matched against it.
+    """
+    app = app or QApplication.instance()
+    sheet = stylesheet()
+    if app.styleSheet() != sheet:
+        app.setStyleSheet(sheet)
+
+
+@lru_cache(maxsize=None)
+def color(name):
+    """Return a shared QColor for a colour name such as #FF4444"""
+    return QColor(name)
+
+
+def priority_color(priority):
+    """Return the colour name used for a priority"""
+    return PRIORITY_COLORS.get(priority, DEFAULT_PRIORITY_COLOR)
+
+
+def _benchmark(counts):
+    """Time creating and polishing task cards with per-widget and app-level CSS
+
+    "per-widget" gives every card its own copy of the card rules, which is
+    what the widgets did before this module existed.
+    """
+    from PyQt5.QtWidgets import QVBoxLayout, QWidget
+
+    from ui_components import TaskItemWidget
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    task = {
+        "name": "Write report",
+        "description": "Quarterly numbers for the team",
+        "start_time": "2024-05-01 09:00",
+        "deadline": "2024-05-03 17:00",
+        "priority": "High",
+        "status": "Due",
+    }
+    card_sheet = section("task_card")
+
+    def create(count, per_widget):
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        started = time.perf_counter()
+        for _ in range(count):
+            card = TaskItemWidget(task)
+            if per_widget:
+                card.setStyleSheet(card_sheet)
+            layout.addWidget(card)
+        container.ensurePolished()
+        for card in container.findChildren(TaskItemWidget):
+            card.ensurePolished()
+            for child in card.findChildren(QWidget):
+                child.ensurePolished()
+        elapsed = time.perf_counter() - started
+        container.deleteLater()
+        app.processEvents()
+        return elapsed
+
+    for count in counts:
+        app.setStyleSheet("")
+        before = create(count, per_widget=True)
+        apply(app)
+        after = create(count, per_widget=False)
+        print(f"{count:>6} cards: per-widget {before:.2f}s, app-level {after:.2f}s")
+
+
+if __name__ == "__main__":
+    # Run with QT_QPA_PLATFORM=offscreen when there is no display
+    _benchmark([int(n) for n in sys.argv[1:]] or [1000, 2000, 5000, 10000])
@@ -0,0 +1,123 @@
+import random
+import sys
+import time
+
+SLOT_BITS = 6  # 64 slots per level
+LEVELS = 5  # 64**5 ticks: about 34 years of one-second ticks
+
+
+class TimerWheel:
+    """Hierarchical timing wheel: timers keyed by any hashable, in whole ticks
+
+    Level 0 has one slot per tick; each slot of level n covers 64**n
+    ticks. Timers go into the coarsest level that still tells them apart
+    and move down a level (cascade) when the wheel below wraps around,
+    so adding, cancelling and advancing one tick all cost O(1) however
+    many timers are pending. Ticks are plain integers, e.g. Unix seconds.
+    """
+
+    def __init__(self, now, slot_bits=SLOT_BITS, levels=LEVELS):
+        self.now = now
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = [[{} for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._overflow = {}  # Timers beyond the top level, placed when it wraps
+        self._where = {}  # key -> the slot dict holding it
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, key):
+        return key in self._where
+
+    def add(self, key, tick):
+        """Fire key at tick (or the next tick if that has passed)"""
+        self.cancel(key)
+        self._place(key, max(tick, self.now + 1))
+
+    def cancel(self, key):
+        """Drop a pending timer; unknown keys are ignored"""
+        slot = self._where.pop(key, None)
+        if slot is not None:
+            del slot[key]
+
+    def clear(self):
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+        self._overflow.clear()
+        self._where.clear()
+
+    def _place(self, key, tick):
+        delta = tick - self.now
+        for level, slots in enumerate(self._levels):
+            if delta < 1 << (self._bits * (level + 1)):
+                slot = slots[(tick >> (self._bits * level)) & self._mask]
+                break
+        else:
+            slot = self._overflow
+        slot[key] = tick
+        self._where[key] = slot
+
+    def _cascade(self):
+        """Move the timers of the slots that just came up to finer levels"""
+        for level in range(1, len(self._levels)):
+            if self.now & ((1 << (self._bits * level)) - 1):
+                return
+            slot = self._levels[level][(self.now >> (self._bits * level)) & self._mask]
+            timers = list(slot.items())
+            slot.clear()
+            for key, tick in timers:
+                self._place(key, tick)
+        timers = list(self._overflow.items())
+        self._overflow.clear()
+        for key, tick in timers:
+            self._place(key, tick)
+
+    def advance(self, to):
+        """Move the wheel forward to tick to; return the keys that fired, in order"""
+        fired = []
+        while self.now < to:
+            if not self._where:
+                self.now = to  # Nothing pending: skip the idle ticks
+                break
+            self.now += 1
+            self._cascade()
+            slot = self._levels[0][self.now & self._mask]
+            if slot:
+                for key in slot:
+                    del self._where[key]
+                fired.extend(slot)
+                slot.clear()
+        return fired
+
+
+def _benchmark(timer_count, ticks=100_000):
+    """Time adding timers and advancing the wheel one tick at a time"""
+    rng = random.Random(1)
+    now = int(time.time())
+    wheel = TimerWheel(now)
+    horizon = 30 * 24 * 3600  # Reminders spread over the next month
+
+    started = time.perf_counter()
+    for key in range(timer_count):
+        wheel.add(key, now + rng.randrange(1, horizon))
+    elapsed = time.perf_counter() - started
+    print(f"{timer_count} timers added in {elapsed * 1000:.0f} ms")
+
+    fired = 0
+    slowest = 0
+    started = time.perf_counter()
+    for tick in range(now + 1, now + ticks + 1):
+        tick_started = time.perf_counter()
+        fired += len(wheel.advance(tick))
+        slowest = max(slowest, time.perf_counter() - tick_started)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{ticks} ticks: {elapsed / ticks * 1e6:.1f} us per tick on average, "
+        f"slowest {slowest * 1000:.2f} ms, {fired} fired"
+    )
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
@@ -6,9 +6,16 @@ from PyQt5.QtWidgets import (
     QLabel,
     QLineEdit,
     QFrame,
+    QListWidget,
+    QStyle,
+    QStyledItemDelegate,
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon, QFont, QPixmap
+from PyQt5.QtCore import Qt, QSize, QRect, QRectF, QEvent, pyqtSignal
+from PyQt5.QtGui import QFont, QPainter, QPen
+
+import pixmap_cache
+import resources
+import theme
 
 
 class HeaderWidget(QWidget):
@@ -27,30 +34,27 @@ class HeaderWidget(QWidget):
         layout.addWidget(self._createMainContainer())
 
         self.setLayout(layout)
-        self.setStyleSheet("QWidget { background-color: white; }")
+        self.setObjectName("header")
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
     def _createLogoContainer(self):
         """Create container for the logo"""
         container = QWidget()
         container.setFixedWidth(200)
         container.setFixedHeight(100)
-        container.setStyleSheet("background-color: white;")
 
         layout = QHBoxLayout(container)
         layout.setContentsMargins(10, 10, 10, 10)
 
         logo_label = QLabel()
-        logo_pixmap = QPixmap("logo.png")
+        logo_pixmap = resources.pixmap("logo", QSize(200, 100))
         if not logo_pixmap.isNull():
-            scaled_pixmap = logo_pixmap.scaled(
-                200, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setFixedSize(scaled_pixmap.size())
+            logo_label.setPixmap(logo_pixmap)
+            logo_label.setFixedSize(pixmap_cache.logical_size(logo_pixmap))
         else:
             logo_label.setText("YourTodo")
             logo_label.setFont(QFont("Arial", 24, QFont.Bold))
-            logo_label.setStyleSheet("color: #00B4D8;")
+            logo_label.setObjectName("logoText")
 
         layout.addWidget(logo_label, 0, Qt.AlignCenter)
         return container
@@ -58,16 +62,15 @@ class HeaderWidget(QWidget):
     def _createMainContainer(self):
         """Create container for search bar and notification icon"""
         container = QWidget()
-        container.setStyleSheet("background-color: white;")
         layout = QHBoxLayout(container)
         layout.setContentsMargins(10, 0, 0, 0)
 
-        search_bar = self._createSearchBar()
-        notif_btn = self._createNotificationButton()
+        self.search_bar = self._createSearchBar()
+        self.notif_btn = self._createNotificationButton()
 
-        layout.addWidget(search_bar)
+        layout.addWidget(self.search_bar)
         layout.addStretch()
-        layout.addWidget(notif_btn)
+        layout.addWidget(self.notif_btn)
 
         return container
 
@@ -75,76 +78,82 @@ class HeaderWidget(QWidget):
         """Create search bar widget"""
         search_bar = QLineEdit()
         search_bar.setPlaceholderText("Search tasks...")
-        search_bar.setStyleSheet(
-            """
-            QLineEdit {
-                border: 1px solid #ccc;
-                border-radius: 15px;
-                padding: 5px 15px;
-                background: white;
-                min-width: 300px;
-                height: 30px;
-            }
-        """
-        )
+        search_bar.setObjectName("searchBar")
         return search_bar
 
     def _createNotificationButton(self):
         """Create notification button widget"""
         notif_btn = QPushButton()
-        notif_btn.setIcon(QIcon("icons/notification.png"))
+        notif_btn.setIcon(resources.icon("notification"))
         notif_btn.setIconSize(QSize(24, 24))
-        notif_btn.setStyleSheet(
-            """
-            QPushButton {
-                border: none;
-                background: transparent;
-                padding-right: 20px;
-            }
-        """
-        )
+        notif_btn.setObjectName("notificationButton")
+
+        # Unread count, drawn over the top right corner of the bell
+        self.notif_badge = QLabel(notif_btn)
+        self.notif_badge.setObjectName("notificationBadge")
+        self.notif_badge.setAlignment(Qt.AlignCenter)
+        self.notif_badge.move(16, 0)
+        self.notif_badge.hide()
         return notif_btn
 
+    def setUnreadCount(self, count):
+        """Show the number of unread notifications on the bell (0 hides it)"""
+        self.notif_badge.setText(str(count) if count < 100 else "99+")
+        self.notif_badge.adjustSize()
+        self.notif_badge.setVisible(count > 0)
+
+
+class NotificationPanel(QFrame):
+    """Popup listing the latest notifications, opened from the bell"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Popup)
+        self.setObjectName("notificationPanel")
+        self.setFixedWidth(360)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+
+        title = QLabel("Notifications")
+        title.setFont(QFont("Arial", 14, QFont.Bold))
+        layout.addWidget(title)
+
+        self.list = QListWidget()
+        self.list.setObjectName("notificationList")
+        self.list.setWordWrap(True)
+        layout.addWidget(self.list)
+
+        self.clear_btn = QPushButton("Clear")
+        self.clear_btn.setObjectName("notificationClear")
+        layout.addWidget(self.clear_btn, 0, Qt.AlignRight)
+
+    def setNotifications(self, lines):
+        self.list.clear()
+        if lines:
+            self.list.addItems(lines)
+        else:
+            self.list.addItem("No notifications")
+
+    def showBelow(self, widget):
+        """Open the panel under widget, right edges aligned"""
+        corner = widget.mapToGlobal(widget.rect().bottomRight())
+        self.move(corner.x() - self.width(), corner.y())
+        self.show()
+
 
 class SidebarButton(QPushButton):
     """Custom button for sidebar navigation"""
 
-    def __init__(self, text, icon_path=None, parent=None):
+    def __init__(self, text, icon_name=None, parent=None):
         super().__init__(text, parent)
-        self.initUI(icon_path)
+        self.initUI(icon_name)
 
-    def initUI(self, icon_path):
-        if icon_path:
-            self.setIcon(QIcon(icon_path))
+    def initUI(self, icon_name):
+        if icon_name:
+            self.setIcon(resources.icon(icon_name))
             self.setIconSize(QSize(24, 24))
 
-        self.setStyleSheet(
-            """
-            QPushButton {
-                text-align: left;
-                padding: 12px 20px;
-                border: none;
-                border-radius: 8px;
-                margin: 4px 12px;
-                color: #333;
-                font-size: 15px;
-                font-weight: 500;
-                background-color: transparent;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 180, 216, 0.08);
-                color: #00B4D8;
-            }
-            QPushButton:checked {
-                background-color: rgba(0, 180, 216, 0.15);
-                color: #00B4D8;
-                font-weight: 600;
-            }
-            QPushButton:checked:hover {
-                background-color: rgba(0, 180, 216, 0.2);
-            }
-        """
-        )
+        self.setObjectName("sidebarButton")
         self.setCheckable(True)
         self.setMinimumHeight(48)
 
@@ -162,10 +171,10 @@ class SidebarWidget(QWidget):
         layout.setSpacing(8)
 
         # Create navigation buttons
-        self.today_btn = SidebarButton("Today Task", "icons/today.png")
-        self.weekly_btn = SidebarButton("Weekly Task", "icons/weekly.png")
-        self.monthly_btn = SidebarButton("Monthly Task", "icons/monthly.png")
-        self.history_btn = SidebarButton("History", "icons/history.png")
+        self.today_btn = SidebarButton("Today Task", "today")
+        self.weekly_btn = SidebarButton("Weekly Task", "weekly")
+        self.monthly_btn = SidebarButton("Monthly Task", "monthly")
+        self.history_btn = SidebarButton("History", "history")
 
         # Set default selected button
         self.today_btn.setChecked(True)
@@ -181,19 +190,15 @@ class SidebarWidget(QWidget):
         layout.addStretch()
 
         self.setLayout(layout)
-        self.setStyleSheet("QWidget { background-color: #E3F8FF; border-right: none; }")
+        self.setObjectName("sidebar")
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.setFixedWidth(200)
 
 
 class TaskItemWidget(QFrame):
     """Widget representing a single task item"""
 
-    PRIORITY_COLORS = {
-        "High": "#FF4444",
-        "Medium": "#FF8C00",
-        "Low": "#FFD700",
-        "None": "#999",
-    }
+    PRIORITY_COLORS = theme.PRIORITY_COLORS
 
     def __init__(self, task_data, parent=None):
         super().__init__(parent)
@@ -211,38 +216,14 @@ class TaskItemWidget(QFrame):
         layout.addWidget(self._createStatusButton())
 
         self.setLayout(layout)
-        self.setStyleSheet(
-            """
-            QFrame {
-                background-color: white;
-                border-radius: 10px;
-                margin: 5px;
-                padding: 10px;
-            }
-            QFrame:hover {
-                background-color: #f5f5f5;
-            }
-        """
-        )
+        self.setObjectName("taskCard")
 
     def _createCheckbox(self):
         """Create task completion checkbox"""
         checkbox = QPushButton()
         checkbox.setCheckable(True)
         checkbox.setFixedSize(24, 24)
-        checkbox.setStyleSheet(
-            """
-            QPushButton {
-                border: 2px solid #ccc;
-                border-radius: 12px;
-                background-color: white;
-            }
-            QPushButton:checked {
-                background-color: #00B4D8;
-                border-color: #00B4D8;
-            }
-        """
-        )
+        checkbox.setObjectName("taskCheckbox")
         return checkbox
 
     def _createTaskInfo(self):
@@ -253,7 +234,7 @@ class TaskItemWidget(QFrame):
         name_label.setFont(QFont("Arial", 12, QFont.Bold))
 
         desc_label = QLabel(self.task_data.get("description", ""))
-        desc_label.setStyleSheet("color: #666;")
+        desc_label.setObjectName("taskDescription")
 
         info_layout.addWidget(name_label)
         info_layout.addWidget(desc_label)
@@ -277,17 +258,8 @@ class TaskItemWidget(QFrame):
         priority = self.task_data.get("priority", "None")
         btn = QPushButton(priority)
         btn.setFixedWidth(80)
-        btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {self.PRIORITY_COLORS.get(priority, "#999")};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 5px;
-            }}
-        """
-        )
+        btn.setObjectName("priorityPill")
+        btn.setProperty("priority", priority)  # Colour comes from the theme
         return btn
 
     def _createStatusButton(self):
@@ -295,14 +267,143 @@ class TaskItemWidget(QFrame):
         status = self.task_data.get("status", "Due")
         btn = QPushButton(status)
         btn.setFixedWidth(80)
-        btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #eee;
-                border: none;
-                border-radius: 10px;
-                padding: 5px;
-            }
-        """
-        )
+        btn.setObjectName("statusPill")
         return btn
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """Paints a task card like TaskItemWidget for rows of a TaskTableModel
+
+    Only visible rows are painted and no widgets are created per task.
+    Clicking the round checkbox toggles it and emits checkToggled.
+    """
+
+    checkToggled = pyqtSignal(int, bool)  # row, checked
+
+    CARD_HEIGHT = 90
+    MARGIN = 5
+    PADDING = 10
+    CHECKBOX_SIZE = 24
+    PILL_WIDTH = 80
+    PILL_HEIGHT = 28
+    SPACING = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.checked = set()  # Store ids of checked tasks
+        self.name_font = QFont("Arial", 12, QFont.Bold)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT)
+
+    def _layout(self, rect):
+        """Return the rectangles of the card parts for a row rectangle"""
+        card = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        inner = card.adjusted(
+            self.PADDING, self.PADDING, -self.PADDING, -self.PADDING
+        )
+        middle = inner.center().y()
+
+        checkbox = QRect(
+            inner.left(),
+            middle - self.CHECKBOX_SIZE // 2,
+            self.CHECKBOX_SIZE,
+            self.CHECKBOX_SIZE,
+        )
+        status = QRect(
+            inner.right() - self.PILL_WIDTH + 1,
+            middle - self.PILL_HEIGHT // 2,
+            self.PILL_WIDTH,
+            self.PILL_HEIGHT,
+        )
+        priority = status.translated(-self.PILL_WIDTH - self.SPACING, 0)
+
+        # Name/description and times share the rest 2:1 like the widget did
+        left = checkbox.right() + self.SPACING
+        right = priority.left() - self.SPACING
+        info_width = (right - left) * 2 // 3
+        info = QRect(left, inner.top(), info_width, inner.height())
+        times = QRect(
+            info.right() + self.SPACING,
+            inner.top(),
+            right - info.right() - self.SPACING,
+            inner.height(),
+        )
+        return {
+            "card": card,
+            "checkbox": checkbox,
+            "info": info,
+            "times": times,
+            "priority": priority,
+            "status": status,
+        }
+
+    def _draw_text(self, painter, rect, text, color, font=None, flags=0):
+        painter.setPen(theme.color(color))
+        if font is not None:
+            painter.setFont(font)
+        elided = painter.fontMetrics().elidedText(text, Qt.ElideRight, rect.width())
+        painter.drawText(rect, flags | Qt.AlignVCenter, elided)
+
+    def _draw_pill(self, painter, rect, text, background, color):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(theme.color(background))
+        painter.drawRoundedRect(QRectF(rect), 10, 10)
+        self._draw_text(painter, rect, text, color, flags=Qt.AlignHCenter)
+
+    def paint(self, painter, option, index):
+        task = index.model().task(index.row())
+        parts = self._layout(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background
+        hovered = option.state & QStyle.State_MouseOver
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(theme.color("#f5f5f5" if hovered else "white"))
+        painter.drawRoundedRect(QRectF(parts["card"]), 10, 10)
+
+        # Checkbox
+        checked = task["id"] in self.checked
+        painter.setPen(QPen(theme.color("#00B4D8" if checked else "#ccc"), 2))
+        painter.setBrush(theme.color("#00B4D8" if checked else "white"))
+        painter.drawEllipse(QRectF(parts["checkbox"]).adjusted(1, 1, -1, -1))
+
+        # Name and description
+        info = parts["info"]
+        top = info.adjusted(0, 0, 0, -info.height() // 2)
+        bottom = info.adjusted(0, info.height() // 2, 0, 0)
+        self._draw_text(painter, top, task["name"], "black", self.name_font)
+        self._draw_text(painter, bottom, task["description"], "#666", option.font)
+
+        # Start and deadline times
+        times = parts["times"]
+        top = times.adjusted(0, 0, 0, -times.height() // 2)
+        bottom = times.adjusted(0, times.height() // 2, 0, 0)
+        self._draw_text(painter, top, f"StartLine: {task['start_time']}", "black")
+        self._draw_text(painter, bottom, f"Deadline: {task['deadline']}", "black")
+
+        # Priority and status pills
+        priority = task["priority"] or "None"
+        color = theme.priority_color(priority)
+        self._draw_pill(painter, parts["priority"], priority, color, "white")
+        self._draw_pill(painter, parts["status"], task["status"], "#eee", "black")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return False
+        if not self._layout(option.rect)["checkbox"].contains(event.pos()):
+            return False
+        if event.type() == QEvent.MouseButtonRelease:
+            task_id = model.task_id(index.row())
+            checked = task_id not in self.checked
+            if checked:
+                self.checked.add(task_id)
+            else:
+                self.checked.discard(task_id)
+            if option.widget is not None:
+                option.widget.update(index)
+            self.checkToggled.emit(index.row(), checked)
+        return True  # Keep clicks on the checkbox from changing the selection
@@ -1,98 +1,144 @@
-from PyQt5.QtWidgets import QTableWidgetItem, QMessageBox
+import os
+
+from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtCore import QDate
 from create import TaskDialog
+from history_columns import open_columns
+from history_search import open_full_text
+from reminders import ReminderEngine
+from storage import HISTORY_FILE, open_store
 
 
 class TodoUpdater:
     """Static class for handling task update operations"""
 
     @staticmethod
-    def update_task_table_item(table_widget, row, task_data):
+    def update_task_table_item(table_view, row, task_data):
         """Update a single row in the task table with new data"""
-        for col, key in enumerate(
-            ["name", "description", "start_time", "deadline", "priority", "status"]
-        ):
-            item = QTableWidgetItem(task_data[key])
-            table_widget.setItem(row, col, item)
+        from read import TodoReader
+
+        TodoReader.get_model(table_view).update_task(row, task_data)
 
     @staticmethod
-    def update_task(table_widget, save_callback):
-        """Open dialog to edit selected task"""
+    def update_task(table_view, save_callback):
+        """Open dialog to edit selected task, reminder lead times included"""
         from read import TodoReader
 
-        selected = table_widget.currentRow()
+        selected = TodoReader.get_selected_row(table_view)
         if selected >= 0:
-            task_data = TodoReader.get_selected_task_data(table_widget)
-            dialog = TaskDialog(table_widget.parent(), task_data)
+            task_data = TodoReader.get_selected_task_data(table_view)
+            reminders = TodoReader.get_model(table_view).findChild(ReminderEngine)
+            if reminders is not None:
+                task_data["reminders"] = reminders.leads_for(task_data)
+            dialog = TaskDialog(table_view.parent(), task_data)
             if dialog.exec_():
+                previous = task_data
+                task_id = task_data["id"]
                 task_data = dialog.getTaskData()
-                TodoUpdater.update_task_table_item(table_widget, selected, task_data)
+                task_data["id"] = task_id
+                store = TodoReader.get_store(table_view)
+                TodoUpdater._update_record(store, task_id, task_data)
+                if task_data["id"] != task_id:
+                    # Moving the record shifted the ids after its old place
+                    TodoReader.get_model(table_view).renumber(
+                        lambda other: store.renumbered(task_id, other), task_id
+                    )
+                TodoUpdater.update_task_table_item(table_view, selected, task_data)
+                if reminders is not None:
+                    reminders.set_leads(task_data, task_data["reminders"], previous)
                 save_callback()
 
     @staticmethod
-    def mark_task_as_done(table_widget, save_callback):
+    def _update_record(store, task_id, task_data):
+        """Write an edited record, keeping the history search index in step
+
+        task_data["id"] is set to the record's new id if the edit moved it
+        (see TaskStore.update).
+        """
+        history = os.path.basename(store.path) == HISTORY_FILE
+        before = store.stamp() if history else None
+        new_id = store.update(task_id, task_data)
+        if new_id is not None:
+            task_data["id"] = new_id
+        if history:
+            index = open_full_text(store.path)
+            index.update(task_id, task_data, before, store.stamp())
+
+    @staticmethod
+    def mark_task_as_done(table_view, save_callback):
         """Mark selected task as completed"""
         from read import TodoReader
 
-        selected = table_widget.currentRow()
+        selected = TodoReader.get_selected_row(table_view)
         if selected >= 0:
-            task_data = TodoReader.get_selected_task_data(table_widget)
+            task_data = TodoReader.get_selected_task_data(table_view)
             current_date = QDate.currentDate().toString("yyyy-MM-dd")
             task_data["status"] = f"done ✅ - Completed on {current_date}"
-            TodoUpdater.update_task_table_item(table_widget, selected, task_data)
+            store = TodoReader.get_store(table_view)
+            store.set_status(task_data["id"], task_data["status"])
+            TodoUpdater.update_task_table_item(table_view, selected, task_data)
             save_callback()
 
     @staticmethod
-    def mark_task_as_failed(table_widget, row, save_callback):
+    def mark_task_as_failed(table_view, row, save_callback):
         """Mark specified task as failed"""
         from read import TodoReader
 
-        selected = row if row is not None else table_widget.currentRow()
+        selected = row if row is not None else TodoReader.get_selected_row(table_view)
         if selected >= 0:
-            task_data = TodoReader.get_selected_task_data(table_widget)
+            task_data = TodoReader.get_task_data(table_view, selected)
             task_data["status"] = "failed ❌"
-            TodoUpdater.update_task_table_item(table_widget, selected, task_data)
+            store = TodoReader.get_store(table_view)
+            store.set_status(task_data["id"], task_data["status"])
+            TodoUpdater.update_task_table_item(table_view, selected, task_data)
             save_callback()
 
     @staticmethod
-    def move_task_to_history(table_widget, save_callback):
+    def mark_tasks_as_failed(table_view, rows, save_callback):
+        """Mark several tasks as failed with one store write and one save"""
+        from read import TodoReader
+
+        model = TodoReader.get_model(table_view)
+        status = "failed ❌"
+        TodoReader.get_store(table_view).set_statuses(
+            {model.task_id(row): status for row in rows}
+        )
+        model.set_values("status", {row: status for row in rows})
+        save_callback()
+
+    @staticmethod
+    def move_task_to_history(table_view, save_callback):
         """Move completed or failed task to history"""
         from read import TodoReader
 
-        selected = table_widget.currentRow()
+        selected = TodoReader.get_selected_row(table_view)
         if selected >= 0:
-            task_data = TodoReader.get_selected_task_data(table_widget)
+            task_data = TodoReader.get_selected_task_data(table_view)
             if task_data["status"] == "due":
                 QMessageBox.warning(
-                    table_widget.parent(),
+                    table_view.parent(),
                     "Cannot Move Task",
                     "Task cannot be moved to history while its status is still 'due'",
                 )
                 return
 
             try:
-                with open("history.txt", "a", encoding="utf-8") as file:
-                    data = [
-                        task_data[key]
-                        for key in [
-                            "name",
-                            "description",
-                            "start_time",
-                            "deadline",
-                            "priority",
-                            "status",
-                        ]
-                    ]
-                    file.write(" | ".join(data) + "\n")
-
-                table_widget.removeRow(selected)
+                history = open_store("history.txt")
+                before = history.stamp()
+                history_id = history.add(task_data)
+                after = history.stamp()
+                open_columns("history.txt").append(task_data, before, after)
+                open_full_text("history.txt").append(
+                    dict(task_data, id=history_id), before, after
+                )
+                TodoReader.delete_row(table_view, selected)
                 save_callback()
                 QMessageBox.information(
-                    table_widget.parent(),
+                    table_view.parent(),
                     "Success",
                     "Task has been moved to history successfully!",
                 )
             except Exception as e:
                 QMessageBox.critical(
-                    table_widget.parent(), "Error", f"Error moving task to history: {e}"
+                    table_view.parent(), "Error", f"Error moving task to history: {e}"
                 )
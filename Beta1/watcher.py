@@ -0,0 +1,128 @@
+import os
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from loader import TaskLoader
+
+
+class StoreWatcher(QObject):
+    """Follow a task store on disk and push its changes to a view
+
+    QFileSystemWatcher reports writes to the store's files; each one asks
+    the store for what changed since the last poll (see TaskStore.follow).
+    Views get `appended` with just the new records, or `reloaded` with all
+    records when the store was truncated or rewritten. load_async() streams
+    a full load from a worker thread as one reloaded batch followed by
+    appended batches.
+    """
+
+    appended = pyqtSignal(list)
+    reloaded = pyqtSignal(list)
+    progress = pyqtSignal(int)  # Percent done of an asynchronous load
+    loaded = pyqtSignal()  # An asynchronous load finished (or failed)
+    failed = pyqtSignal(str)
+
+    DEBOUNCE_MS = 50  # Coalesce the bursts of events a single write causes
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.cursor = None
+        self._loader = None
+        self._first_batch = False
+        self._poll_pending = False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._schedule_poll)
+        self._watcher.directoryChanged.connect(self._schedule_poll)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self.poll)
+
+    def start(self, load=True):
+        """Start watching; emits reloaded with every record unless load is False
+
+        With load=False the view is expected to have loaded the store itself
+        and only later changes are reported.
+        """
+        if load:
+            if self._loader is not None:
+                self._loader.cancel()
+                self._loader = None
+            self.cursor = None
+            self.poll()
+        else:
+            self.cursor = self.store.cursor()
+            self._watch_paths()
+
+    def load_async(self):
+        """Reload every record on a worker thread and start watching"""
+        if self._loader is not None:
+            self._loader.cancel()
+        self._loader = TaskLoader(self.store)
+        self._first_batch = True
+        self._loader.signals.batch.connect(self._on_batch)
+        self._loader.signals.progress.connect(self.progress)
+        self._loader.signals.finished.connect(self._on_loaded)
+        self._loader.signals.failed.connect(self._on_failed)
+        self._loader.start()
+
+    def _is_current_load(self):
+        # Signals of a cancelled load may still be queued
+        return self._loader is not None and self.sender() is self._loader.signals
+
+    def _on_batch(self, tasks):
+        if not self._is_current_load():
+            return
+        if self._first_batch:
+            self._first_batch = False
+            self.reloaded.emit(tasks)
+        else:
+            self.appended.emit(tasks)
+
+    def _on_loaded(self, cursor):
+        if not self._is_current_load():
+            return
+        self._loader = None
+        self.cursor = cursor
+        self._watch_paths()
+        self.loaded.emit()
+        if self._poll_pending:
+            self.poll()  # Changes made while loading
+
+    def _on_failed(self, message):
+        if not self._is_current_load():
+            return
+        self._loader = None
+        self.failed.emit(message)
+        self.loaded.emit()
+
+    def _schedule_poll(self, path):
+        self._timer.start()
+
+    def _watch_paths(self):
+        # Files replaced by a rename drop out of the watcher; add them back
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [
+            path
+            for path in self.store.watch_paths()
+            if path not in watched and os.path.exists(path)
+        ]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def poll(self):
+        """Report what changed since the last poll"""
+        self._timer.stop()
+        if self._loader is not None:
+            self._poll_pending = True  # Done once the load has finished
+            return
+        self._poll_pending = False
+        tasks, self.cursor, appended = self.store.follow(self.cursor)
+        self._watch_paths()
+        if not appended:
+            self.reloaded.emit(tasks)
+        elif tasks:
+            self.appended.emit(tasks)
@@ -4,13 +4,19 @@ from PyQt5.QtWidgets import (
     QListWidgetItem, QInputDialog, QMenu, QAction, QCalendarWidget,
     QDateEdit, QTimeEdit, QTextEdit, QRadioButton
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QDate, QTime
-from PyQt5.QtGui import QPixmap, QFont, QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, QDate, QTime, QSize
+from PyQt5.QtGui import QFont, QIcon
 
 import re
 import bcrypt
 import os
 
+import beta1_path  # noqa: F401  Puts Beta1 on sys.path for the imports below
+import pixmap_cache
+import theme
+from codec import decode_fields, encode_fields
+from storage import open_user_store
+
 class User:
     def __init__(self, username, email, password):
         self.username = username
@@ -51,7 +57,7 @@ class ManageAuth:
                 for line in file:
                     line = line.strip()
                     if ' | ' in line:
-                        parts = line.split(' | ')
+                        parts = decode_fields(line)
                         if len(parts) == 3:
                             username, email, password = parts
                             users[email] = User(username, email, password)
@@ -68,7 +74,7 @@ class ManageAuth:
             os.makedirs('data', exist_ok=True)
             with open('data/Users.txt', 'w') as file:
                 for user in self.users.values():
-                    userData = f"{user.username} | {user.email} | {user.password}\n"
+                    userData = encode_fields([user.username, user.email, user.password]) + "\n"
                     file.write(userData)
         except Exception as e:
             print(f"Error saving user data: {e}")
@@ -210,55 +216,8 @@ class LoginDialog(QDialog):
 
     def _setup_styles(self):
         """Configure the styling for the login dialog components."""
-        self.setStyleSheet(
-            """
-            QDialog {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #E0F7FA,
-                    stop: 1 #B2EBF2
-                );
-            }
-            QLabel {
-                color: #333;
-                font-size: 18px;
-            }
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #E0E0E0;
-                border-radius: 6px;
-                background: white;
-                font-size: 18px;
-                min-width: 300px;
-            }
-            QPushButton#loginBtn {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 18px;
-                min-width: 300px;
-            }
-            QPushButton#loginBtn:hover {
-                background-color: #1976D2;
-            }
-            QPushButton#registerBtn {
-                background: none;
-                border: none;
-                color: #2196F3;
-                text-decoration: underline;
-                font-size: 18px;
-            }
-            QPushButton#registerBtn:hover {
-                color: #1976D2;
-            }
-            QLabel#errorLabel {
-                color: #F44336;
-                font-size: 14px;
-            }
-        """
-        )
+        self.setObjectName("authDialog")  # Rules live in the app stylesheet
+        theme.apply()
 
     def initUI(self):
         """Initialize and setup the user interface components."""
@@ -276,7 +235,7 @@ class LoginDialog(QDialog):
 
         title = QLabel("Login")
         title.setFont(QFont("Arial", 48, QFont.Bold))
-        title.setStyleSheet("color: #333; font-size: 48px;")
+        title.setObjectName("authTitle")
 
         self.email = QLineEdit()
         self.email.setPlaceholderText("Enter Your Email...")
@@ -316,7 +275,7 @@ class LoginDialog(QDialog):
         register_layout = QHBoxLayout()
 
         register_label = QLabel("Don't have an account?")
-        register_label.setStyleSheet("color: #666;")
+        register_label.setObjectName("authHint")
 
         register_btn = QPushButton("Sign up")
         register_btn.setObjectName("registerBtn")
@@ -332,11 +291,8 @@ class LoginDialog(QDialog):
     def _create_logo(self):
         """Create and return the logo widget."""
         logo_label = QLabel()
-        logo_pixmap = QPixmap("images/logo.png")
+        logo_pixmap = pixmap_cache.pixmap("images/logo.png", QSize(250, 250))
         if not logo_pixmap.isNull():
-            logo_pixmap = logo_pixmap.scaled(
-                250, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
             logo_label.setPixmap(logo_pixmap)
             logo_label.setAlignment(Qt.AlignCenter)
         return logo_label
@@ -347,11 +303,8 @@ class LoginDialog(QDialog):
         right_layout = QVBoxLayout()
 
         illustration_label = QLabel()
-        illustration_pixmap = QPixmap("images/auth_illustration.png")
+        illustration_pixmap = pixmap_cache.pixmap("images/auth_illustration.png", QSize(500, 500))
         if not illustration_pixmap.isNull():
-            illustration_pixmap = illustration_pixmap.scaled(
-                500, 500, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
             illustration_label.setPixmap(illustration_pixmap)
             illustration_label.setAlignment(Qt.AlignCenter)
 
@@ -400,27 +353,23 @@ class TaskManager:
 
     def load_tasks(self):
         tasks = []
-        if os.path.exists(self.tasks_file):
-            with open(self.tasks_file, 'r') as file:
-                for line in file:
-                    parts = line.strip().split(' | ')
-                    if len(parts) == 7 and parts[6] == self.username:
-                        tasks.append({
-                            'name': parts[0],
-                            'description': parts[1],
-                            'start_date': parts[2],
-                            'deadline': parts[3],
-                            'priority': parts[4],
-                            'status': parts[5],
-                            'username': parts[6]
-                        })
+        for record in open_user_store(self.tasks_file, self.username).load():
+            tasks.append({
+                'name': record['name'],
+                'description': record['description'],
+                'start_date': record['start_time'],
+                'deadline': record['deadline'],
+                'priority': record['priority'],
+                'status': record['status'],
+                'username': record['username'],
+                'id': record['id']
+            })
         return tasks
 
     def save_task(self, task):
         os.makedirs('data', exist_ok=True)
-        with open(self.tasks_file, 'a') as file:
-            task_line = f"{task['name']} | {task['description']} | {task['start_date']} | {task['deadline']} | {task['priority']} | {task['status']} | {task['username']}\n"
-            file.write(task_line)
+        record = dict(task, start_time=task['start_date'])
+        task['id'] = open_user_store(self.tasks_file, self.username).add(record)
         self.tasks.append(task)
 
     def get_tasks(self):
@@ -442,55 +391,8 @@ class RegistrationDialog(QDialog):
 
     def _setup_styles(self):
         """Configure the styling for the registration dialog components."""
-        self.setStyleSheet(
-            """
-            QDialog {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #E0F7FA,
-                    stop: 1 #B2EBF2
-                );
-            }
-            QLabel {
-                color: #333;
-                font-size: 18px;
-            }
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #E0E0E0;
-                border-radius: 6px;
-                background: white;
-                font-size: 18px;
-                min-width: 300px;
-            }
-            QPushButton#loginBtn {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 18px;
-                min-width: 300px;
-            }
-            QPushButton#loginBtn:hover {
-                background-color: #1976D2;
-            }
-            QPushButton#registerBtn {
-                background: none;
-                border: none;
-                color: #2196F3;
-                text-decoration: underline;
-                font-size: 18px;
-            }
-            QPushButton#registerBtn:hover {
-                color: #1976D2;
-            }
-            QLabel#errorLabel {
-                color: #F44336;
-                font-size: 14px;
-            }
-        """
-        )
+        self.setObjectName("authDialog")  # Rules live in the app stylesheet
+        theme.apply()
 
     def initUI(self):
         """Initialize and setup the user interface components."""
@@ -508,7 +410,7 @@ class RegistrationDialog(QDialog):
 
         title = QLabel("Register")
         title.setFont(QFont("Arial", 48, QFont.Bold))
-        title.setStyleSheet("color: #333; font-size: 48px;")
+        title.setObjectName("authTitle")
 
         self.username = QLineEdit()
         self.username.setPlaceholderText("Enter Your Username...")
@@ -559,7 +461,7 @@ class RegistrationDialog(QDialog):
         login_layout = QHBoxLayout()
 
         login_label = QLabel("Already have an account?")
-        login_label.setStyleSheet("color: #666;")
+        login_label.setObjectName("authHint")
 
         login_btn = QPushButton("Login")
         login_btn.setObjectName("registerBtn")
@@ -575,11 +477,8 @@ class RegistrationDialog(QDialog):
     def _create_logo(self):
         """Create and return the logo widget."""
         logo_label = QLabel()
-        logo_pixmap = QPixmap("images/logo.png")
+        logo_pixmap = pixmap_cache.pixmap("images/logo.png", QSize(250, 250))
         if not logo_pixmap.isNull():
-            logo_pixmap = logo_pixmap.scaled(
-                250, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
             logo_label.setPixmap(logo_pixmap)
             logo_label.setAlignment(Qt.AlignCenter)
         return logo_label
@@ -590,11 +489,8 @@ class RegistrationDialog(QDialog):
         right_layout = QVBoxLayout()
 
         illustration_label = QLabel()
-        illustration_pixmap = QPixmap("images/auth_illustration.png")
+        illustration_pixmap = pixmap_cache.pixmap("images/auth_illustration.png", QSize(500, 500))
         if not illustration_pixmap.isNull():
-            illustration_pixmap = illustration_pixmap.scaled(
-                500, 500, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
             illustration_label.setPixmap(illustration_pixmap)
             illustration_label.setAlignment(Qt.AlignCenter)
 
@@ -636,6 +532,7 @@ if __name__ == "__main__":
     from PyQt5.QtWidgets import QApplication
 
     app = QApplication(sys.argv)
+    theme.apply(app)
     
     # Create data directory if it doesn't exist
     os.makedirs('data', exist_ok=True)
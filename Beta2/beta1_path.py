@@ -0,0 +1,17 @@
+"""Make Beta1's modules (storage, charts, watcher, ...) importable from Beta2
+
+Beta2 shares its storage and chart code with Beta1 instead of keeping a
+copy. Import this module before any of them; it appends the Beta1 directory
+to sys.path, so Beta2 runs from its own directory and Beta2's own modules
+(history, auth) still take precedence over Beta1's of the same name.
+"""
+
+import os
+import sys
+
+BETA1_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Beta1"
+)
+
+if BETA1_DIR not in sys.path:
+    sys.path.append(BETA1_DIR)
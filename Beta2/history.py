@@ -1,16 +1,21 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QDateEdit, QPushButton, QListWidget, QFileDialog, 
-    QMessageBox, QStackedWidget, QSizePolicy
+    QMessageBox, QStackedWidget, QSizePolicy, QLineEdit
 )
-from PyQt5.QtCore import QDate
+from PyQt5.QtCore import QDate, QTimer
 from PyQt5.QtGui import QFont
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
-import matplotlib.ticker as ticker
-from datetime import datetime, timedelta
-from matplotlib.backends.backend_pdf import PdfPages
+from datetime import timedelta
+
+import beta1_path  # noqa: F401  Puts Beta1 on sys.path for the imports below
+from charts import backend_pdf, new_canvas, ticker
+from charts import dates as mdates
+from history_columns import STATUS_DONE, STATUS_FAILED, open_columns
+from history_search import open_full_text
+from storage import completion_date, open_user_store, user_shard_path
+from task import Status
+from task_collection import TaskCollection
+from watcher import StoreWatcher
 
 
 
@@ -22,61 +27,58 @@ class HistoryManager:
         failed = {}
         entries = []
         
-        try:
-            with open("history.txt", "r") as f:
-                for line in f:
-                    parts = line.strip().split(" | ")
-                    if len(parts) != 7:
-                        continue
-
-                    # NEW FORMAT PARSING
-                    task, description, start_time, deadline, priority, status, entry_username = parts
-                    
-                    # Filter by username first
-                    if entry_username != username:
-                        continue
-                    
-                    # Extract completion date from status
-                    if "on" in status:
-                        date_part = status.split("on ")[-1].strip()
-                        try:
-                            status_date = datetime.strptime(date_part, "%Y-%m-%d").date()
-                        except ValueError:
-                            # Try alternative date formats if needed
-                            continue
-                    else:
-                        status_date = datetime.strptime(date_part, "%Y-%m-%d").date()
-                    # NEW STATUS DETECTION
-                    status_type = "failed" if "failed" in status.lower() else "done"
-                    if status_filter not in ["all", status_type]:
-                        continue
-
-                    date_str = status_date.strftime("%Y-%m-%d")
-                    if status_type == "failed":
-                        failed[date_str] = failed.get(date_str, 0) + 1
-                    else:
-                        done[date_str] = done.get(date_str, 0) + 1
-                    
-                    entries.append({
-                        'task': task,
-                        'description': description,
-                        'start_time': start_time,
-                        'deadline': deadline,
-                        'priority': priority,
-                        'status': status,
-                        'username': entry_username
-                    })
-        except FileNotFoundError:
-            pass
+        # Only the segments overlapping the requested range are read
+        store = open_user_store("history.txt", username)
+        first = start_time.strftime("%Y-%m-%d")
+        last = deadline.strftime("%Y-%m-%d")
+        records = store.load_completed(first, last)
+
+        # Filter and count column-wise instead of record by record
+        tasks = TaskCollection.from_tasks(records)
+        completed = (None, None)  # Only records with a completion date
+        dated = tasks.filter(completed=completed).tolist()
+        failed_rows = tasks.filter(Status.FAILED, completed=completed).tolist()
+        # Any dated record that did not fail counts as done, e.g. "Pending on ..."
+        failed_set = set(failed_rows)
+        done_rows = [row for row in dated if row not in failed_set]
+        if status_filter in ["all", "done"]:
+            done = tasks.completion_counts(done_rows)
+        if status_filter in ["all", "failed"]:
+            failed = tasks.completion_counts(failed_rows)
+        rows = {"all": dated, "done": done_rows, "failed": failed_rows}
+        if status_filter in rows:
+            entries = [HistoryManager.to_entry(records[row]) for row in rows[status_filter]]
         print(done)
         print(failed)
         return done, failed, entries
+
+    @staticmethod
+    def to_entry(record):
+        return {
+            'task': record['name'],
+            'description': record['description'],
+            'start_time': record['start_time'],
+            'deadline': record['deadline'],
+            'priority': record['priority'],
+            'status': record['status'],
+            'username': record['username']
+        }
     
 class HistoryWidget(QWidget):    
+    SEARCH_DELAY_MS = 200  # Wait for typing to pause before searching
+
     def __init__(self, username):
         super().__init__()
         self.username = username  # NEW: Store username
         self.initUI()
+
+        # Follow the history file so tasks moved to history elsewhere show up
+        self.history_watcher = StoreWatcher(
+            open_user_store("history.txt", username), self
+        )
+        self.history_watcher.appended.connect(self.append_history)
+        self.history_watcher.reloaded.connect(lambda records: self.update_display())
+        self.history_watcher.start(load=False)
     
     def initUI(self):
         main_layout = QVBoxLayout(self)
@@ -108,6 +110,14 @@ class HistoryWidget(QWidget):
         self.start_date = QDateEdit(calendarPopup=True)
         
         self.end_date = QDateEdit(calendarPopup=True)
+
+        # Text View search over the user's whole history, best matches first
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search all history...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
         
         self.export_btn = QPushButton("Export PDF")
 
@@ -123,6 +133,8 @@ class HistoryWidget(QWidget):
         
         controls_layout.addWidget(QLabel("To:"))
         controls_layout.addWidget(self.end_date)
+
+        controls_layout.addWidget(self.search_edit)
         
         controls_layout.addWidget(self.export_btn)
 
@@ -133,8 +145,7 @@ class HistoryWidget(QWidget):
         self.stacked_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # Initialize views
-        self.figure = Figure(figsize=(10, 5), tight_layout=True)
-        self.canvas = FigureCanvas(self.figure)
+        self.figure, self.canvas = new_canvas((10, 5))
         
         # Configure list style
         self.history_list = QListWidget()
@@ -170,7 +181,8 @@ class HistoryWidget(QWidget):
         # Style controls
         control_style = "padding: 5px; border-radius: 5px;"
         for widget in [self.range_combo, self.status_combo, 
-                      self.view_combo, self.start_date, self.end_date]:
+                      self.view_combo, self.start_date, self.end_date,
+                      self.search_edit]:
             widget.setStyleSheet(control_style)
 
         # Export button style
@@ -191,11 +203,14 @@ class HistoryWidget(QWidget):
         self.status_combo.currentIndexChanged.connect(self.update_display)
         self.start_date.dateChanged.connect(self.update_display)
         self.end_date.dateChanged.connect(self.update_display)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        self.search_timer.timeout.connect(self.update_display)
 
     def toggle_view(self):
         """Switch between graph and text views"""
         current_index = 0 if self.view_combo.currentText() == "Graph View" else 1
         self.stacked_widget.setCurrentIndex(current_index)
+        self.search_edit.setVisible(current_index == 1)
         self.adjustSize()
 
     def update_date_range(self):
@@ -222,33 +237,58 @@ class HistoryWidget(QWidget):
         start = self.start_date.date().toPyDate()
         end = self.end_date.date().toPyDate()
         
+        status_filter = self._status_filter()
+
+        # NEW: Pass username to load_history
+        if self.view_combo.currentText() == "Graph View":
+            self.update_graph(start, end, status_filter)
+        else:
+            self.update_text_history(start, end, status_filter)
+
+    def _status_filter(self):
         status_filter = "all" 
         match self.status_combo.currentText():
             case "Done":
                 status_filter = "done"
             case "Failed":
                 status_filter = "failed"
+        return status_filter
 
-        # NEW: Pass username to load_history
+    def append_history(self, records):
+        """Show history records appended since the last display"""
         if self.view_combo.currentText() == "Graph View":
-            self.update_graph(start, end, status_filter)
-        else:
-            self.update_text_history(start, end, status_filter)
+            self.update_display()  # Counts come from the columnar snapshot
+            return
+        if self.search_edit.text().strip():
+            self.update_display()  # New records may rank anywhere
+            return
+
+        start = self.start_date.date().toString("yyyy-MM-dd")
+        end = self.end_date.date().toString("yyyy-MM-dd")
+        status_filter = self._status_filter()
+        for record in records:
+            if not start <= completion_date(record['status']) <= end:
+                continue
+            status_type = "failed" if "failed" in record['status'].lower() else "done"
+            if status_filter not in ["all", status_type]:
+                continue
+            self.history_list.addItem(self._entry_text(HistoryManager.to_entry(record)))
 
     def update_graph(self, start, end, status_filter):
-        # UPDATED: Add username filter
-        done, failed, _ = HistoryManager.load_history(
-            self.username, start, end, status_filter
-        )
-
         dates = []
         current = start
         while current <= end:
             dates.append(current)
             current += timedelta(days=1)
 
-        done_counts = [done.get(d.strftime("%Y-%m-%d"), 0) for d in dates]
-        failed_counts = [failed.get(d.strftime("%Y-%m-%d"), 0) for d in dates]
+        # Aggregate from the columnar snapshot instead of parsing history lines
+        columns = open_columns(user_shard_path("history.txt", self.username))
+        columns.sync(open_user_store("history.txt", self.username))
+        with columns.open() as view:
+            done_counts = view.daily_counts(start, end, STATUS_DONE, self.username)
+            failed_counts = view.daily_counts(
+                start, end, STATUS_FAILED, self.username
+            )
 
         self.figure.clear()
         ax = self.figure.add_subplot(111)
@@ -272,21 +312,35 @@ class HistoryWidget(QWidget):
         self.canvas.draw()
 
     def update_text_history(self, start, end, status_filter):
-        _, _, entries = HistoryManager.load_history(
-            self.username, start, end, status_filter
-        )
+        query = self.search_edit.text()
+        if query.strip():
+            entries = self.search_history(query, status_filter)
+        else:
+            _, _, entries = HistoryManager.load_history(
+                self.username, start, end, status_filter
+            )
         self.history_list.clear()
 
         
         for entry in entries:
-            status = "🔴 Failed" if "failed" in entry['status'].lower() else "🟢 Done"
-            text = (
-                f"Task: {entry['task']}\n"
-                f"Description: {entry['description']}\n"
-                f"Start: {entry['start_time']} | Deadline: {entry['deadline']}\n"
-                f"Priority: {entry['priority']} | Status: {status}"
-            )
-            self.history_list.addItem(text)
+            self.history_list.addItem(self._entry_text(entry))
+
+    def search_history(self, query, status_filter):
+        """Ranked entries of the user's history matching query"""
+        index = open_full_text(user_shard_path("history.txt", self.username))
+        index.sync(open_user_store("history.txt", self.username))
+        return [HistoryManager.to_entry(record)
+                for record in index.search(query, status_filter)]
+
+    @staticmethod
+    def _entry_text(entry):
+        status = "🔴 Failed" if "failed" in entry['status'].lower() else "🟢 Done"
+        return (
+            f"Task: {entry['task']}\n"
+            f"Description: {entry['description']}\n"
+            f"Start: {entry['start_time']} | Deadline: {entry['deadline']}\n"
+            f"Priority: {entry['priority']} | Status: {status}"
+        )
 
     def export_pdf(self):
         options = QFileDialog.Options()
@@ -299,7 +353,7 @@ class HistoryWidget(QWidget):
                 filename += '.pdf'
             
             try:
-                with PdfPages(filename) as pdf:
+                with backend_pdf.PdfPages(filename) as pdf:
                     pdf.savefig(self.figure)
                 QMessageBox.information(self, "Success", "PDF exported successfully!")
             except Exception as e: